@@ -403,3 +403,24 @@ def isCompileTimeConstantValue(value):
         return True
     else:
         return False
+
+
+def isMarshalPreserved(value):
+    """ Determine if "marshal" gives back a value of the same type.
+
+        Marshal turns "bytearray" values into "bytes", also when contained
+        in other values, these need to be stored differently.
+    """
+    value_type = type(value)
+
+    if value_type is bytearray:
+        return False
+    elif value_type in (tuple, list, set, frozenset):
+        return all(isMarshalPreserved(element) for element in value)
+    elif value_type is dict:
+        return all(
+            isMarshalPreserved(key) and isMarshalPreserved(element)
+            for key, element in iterItems(value)
+        )
+    else:
+        return True
@@ -47,6 +47,7 @@ from nuitka.utils import Execution, InstanceCounters, MemoryUsage, Utils
 from nuitka.utils.AppDirs import getCacheDir
 from nuitka.utils.FileOperations import (
     deleteFile,
+    getFileContents,
     hasFilenameExtension,
     listDir,
     makePath,
@@ -57,11 +58,16 @@ from nuitka.utils.Utils import isWin32Windows
 from . import ModuleRegistry, Options, TreeXML
 from .build import SconsInterface
 from .codegen import CodeGeneration, ConstantCodes, Reports
+from .codegen.ModuleCodeCache import (
+    prepareModuleCodeCached,
+    reportModuleCodeCacheStatistics,
+)
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
 from .freezer.Standalone import copyUsedDLLs, detectEarlyImports
 from .optimizations import Optimization
 from .tree import Building
+from .tree.ModuleTreeCache import reportModuleTreeCacheStatistics, storeModuleTreeCached
 
 
 def createNodeTree(filename):
@@ -140,6 +146,13 @@ def createNodeTree(filename):
     # Then optimize the tree and potentially recursed modules.
     Optimization.optimize(main_module.getOutputFilename())
 
+    if Options.shallUseModuleCache():
+        for module in ModuleRegistry.getDoneUserModules():
+            if module.isCompiledPythonModule():
+                storeModuleTreeCached(module)
+
+        reportModuleTreeCacheStatistics()
+
     if Options.isExperimental("check_xml_persistence"):
         for module in ModuleRegistry.getRootModules():
             if module.isMainModule():
@@ -227,6 +240,11 @@ def cleanSourceDirectory(source_dir):
     )
 
     if os.path.isdir(source_dir):
+        # For incremental builds, outdated files are only removed after the
+        # new files are written, see "removeOutdatedSourceFiles".
+        if Options.isIncrementalBuild():
+            return
+
         for path, _filename in listDir(source_dir):
             if hasFilenameExtension(path, extensions):
                 deleteFile(path, must_exist=True)
@@ -234,6 +252,35 @@ def cleanSourceDirectory(source_dir):
         makePath(source_dir)
 
 
+def removeOutdatedSourceFiles(source_dir):
+    """ Remove generated C files of a previous build not written this time.
+
+    For incremental builds, these would be compiled and linked again, e.g.
+    for modules that are no longer included.
+    """
+
+    for path, filename in listDir(source_dir):
+        if not filename.startswith(("module.", "__")):
+            continue
+
+        if not hasFilenameExtension(path, (".c", ".cpp")):
+            continue
+
+        if path in _written_files:
+            continue
+
+        # Created by Scons from the constants blob, it takes care of it, and
+        # removes it if not used in the selected mode.
+        if filename.startswith("__constants_data."):
+            continue
+
+        # Scons renames to C++ files if the compiler has no C11 support.
+        if path.endswith(".cpp") and path[:-2] in _written_files:
+            continue
+
+        deleteFile(path, must_exist=True)
+
+
 def pickSourceFilenames(source_dir, modules):
     collision_filenames = set()
     seen_filenames = set()
@@ -371,11 +418,19 @@ def makeSourceDirectory(main_module):
             c_filename = module_filenames[module]
 
             try:
-                prepared_modules[c_filename] = CodeGeneration.prepareModuleCode(
-                    global_context=global_context,
-                    module=module,
-                    module_name=module.getFullName(),
-                )
+                if Options.shallUseModuleCache():
+                    prepared_modules[c_filename] = prepareModuleCodeCached(
+                        global_context=global_context,
+                        module=module,
+                        module_name=module.getFullName(),
+                        prepare_function=CodeGeneration.prepareModuleCode,
+                    )
+                else:
+                    prepared_modules[c_filename] = CodeGeneration.prepareModuleCode(
+                        global_context=global_context,
+                        module=module,
+                        module_name=module.getFullName(),
+                    )
             except Exception:
                 warning("Problem creating code for module %r." % module)
                 raise
@@ -384,8 +439,16 @@ def makeSourceDirectory(main_module):
             if module is main_module and not Options.shallMakeModule():
                 prepared_modules[c_filename][1].getConstantCode(0)
 
-    # Second pass, generate the actual module code into the files.
-    for module in ModuleRegistry.getDoneModules():
+    if Options.shallUseModuleCache():
+        reportModuleCodeCacheStatistics()
+
+    # Second pass, generate the actual module code into the files. The main
+    # module is done last, because it is the one most often changed, and its
+    # constants would otherwise shift the blob offsets of all other modules,
+    # making incremental builds recompile them too.
+    for module in sorted(
+        ModuleRegistry.getDoneModules(), key=lambda module: module is main_module
+    ):
         if module.isCompiledPythonModule():
             c_filename = module_filenames[module]
 
@@ -423,7 +486,13 @@ def makeSourceDirectory(main_module):
 
     writeSourceCode(
         filename=os.path.join(source_dir, "__constants.c"),
-        source_code=ConstantCodes.getConstantsDefinitionCode(context=global_context),
+        source_code=ConstantCodes.getConstantsDefinitionCode(
+            context=global_context,
+            module_contexts=[
+                module_context
+                for _template_values, module_context in prepared_modules.values()
+            ],
+        ),
     )
 
     helper_decl_code, helper_impl_code = CodeGeneration.generateHelpersCode(
@@ -483,6 +552,12 @@ def runScons(main_module, quiet):
     if Options.isLto():
         options["lto_mode"] = "true"
 
+    if Options.shallUseReadonlyConstants():
+        options["readonly_constants_mode"] = "true"
+
+    if Options.isIncrementalBuild():
+        options["incremental_mode"] = "true"
+
     # For AnaConda default to trying static lib python library, which
     # normally is just not available or if it is even unusable.
     if "Anaconda" in sys.version:
@@ -564,28 +639,59 @@ def runScons(main_module, quiet):
     return SconsInterface.runScons(options, quiet), options
 
 
-def writeSourceCode(filename, source_code):
+# Files written in this compilation, to detect collisions, and to identify
+# outdated files of previous compilations for incremental builds.
+_written_files = set()
+
+
+def _needsWriting(filename, contents, mode):
     # Prevent accidental overwriting. When this happens the collision detection
     # or something else has failed.
-    assert not os.path.isfile(filename), filename
+    assert filename not in _written_files, filename
+    _written_files.add(filename)
+
+    if not Options.isIncrementalBuild():
+        assert not os.path.isfile(filename), filename
+
+        return True
+
+    # Scons renames C files if the compiler has no C11 support, compare
+    # against that then.
+    if not os.path.isfile(filename) and os.path.isfile(filename + "pp"):
+        old_filename = filename + "pp"
+    else:
+        old_filename = filename
+
+    # Unchanged files keep their time stamp, so the C compiler need not look
+    # at them again.
+    if os.path.isfile(old_filename):
+        if getFileContents(old_filename, mode) == contents:
+            return False
 
+        deleteFile(old_filename, must_exist=True)
+
+    return True
+
+
+def writeSourceCode(filename, source_code):
     if python_version >= 300:
-        with open(filename, "wb") as output_file:
-            output_file.write(source_code.encode("latin1"))
+        source_code = source_code.encode("latin1")
+
+        if _needsWriting(filename, source_code, "rb"):
+            with open(filename, "wb") as output_file:
+                output_file.write(source_code)
     else:
-        with open(filename, "w") as output_file:
-            output_file.write(source_code)
+        if _needsWriting(filename, source_code, "r"):
+            with open(filename, "w") as output_file:
+                output_file.write(source_code)
 
 
 def writeBinaryData(filename, binary_data):
-    # Prevent accidental overwriting. When this happens the collision detection
-    # or something else has failed.
-    assert not os.path.isfile(filename), filename
-
     assert type(binary_data) is bytes
 
-    with open(filename, "wb") as output_file:
-        output_file.write(binary_data)
+    if _needsWriting(filename, binary_data, "rb"):
+        with open(filename, "wb") as output_file:
+            output_file.write(binary_data)
 
 
 def callExecPython(args, clean_path, add_path):
@@ -651,6 +757,9 @@ def compileTree(main_module):
                 filename=os.path.join(source_dir, "__constants.bin"),
                 binary_data=ConstantCodes.stream_data.getBytes(),
             )
+
+        if Options.isIncrementalBuild():
+            removeOutdatedSourceFiles(source_dir)
     else:
         source_dir = getSourceDirectoryPath(main_module)
 
@@ -348,6 +348,29 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is.""",
 )
 
+codegen_group.add_option(
+    "--module-cache",
+    action="store_true",
+    dest="module_cache",
+    default=False,
+    help="""\
+Cache the optimized node trees and the generated C code of compiled modules
+in the user cache directory. Modules whose source code, the Nuitka and Python
+versions, and the relevant options are unchanged, then restore their optimized
+tree instead of building it, and reuse their C code. Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--compress-bytecode",
+    action="store_true",
+    dest="compress_bytecode",
+    default=False,
+    help="""\
+Compress the bytecode of modules not compiled, but included as bytecode, with
+"zlib". It is decompressed when the module is imported, making the binary
+smaller. Defaults to off.""",
+)
+
 parser.add_option_group(codegen_group)
 
 output_group = OptionGroup(parser, "Output choices")
@@ -391,6 +414,17 @@ Removes the build directory after producing the module or exe file.
 Defaults to off.""",
 )
 
+output_group.add_option(
+    "--incremental",
+    action="store_true",
+    dest="incremental_build",
+    default=False,
+    help="""\
+Keep the build directory of a previous compilation, and only write generated C
+files whose contents changed, so that the C compiler only recompiles those.
+Defaults to off.""",
+)
+
 output_group.add_option(
     "--no-pyi-file",
     action="store_false",
@@ -436,7 +470,10 @@ debug_group.add_option(
     dest="profile",
     default=False,
     help="""\
-Enable vmprof based profiling of time spent. Defaults to off.""",
+Enable profiling of time spent in compiled code. The binary records calls
+and timings of compiled functions when run with environment variable
+NUITKA_PROFILE set to a file name for "pstats" output, or NUITKA_PROFILE_STACKS
+for collapsed stacks. Defaults to off.""",
 )
 
 debug_group.add_option(
@@ -595,6 +632,17 @@ Use link time optimizations if available and usable (gcc 4.6 and higher).
 Defaults to off.""",
 )
 
+c_compiler_group.add_option(
+    "--readonly-constants",
+    action="store_true",
+    dest="readonly_constants",
+    default=False,
+    help="""\
+Put the constants data into a read-only section of the binary, so its pages
+are shared between processes running the same binary. Only effective for
+gcc or clang on Linux. Defaults to off.""",
+)
+
 parser.add_option_group(c_compiler_group)
 
 tracing_group = OptionGroup(parser, "Tracing features")
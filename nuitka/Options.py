@@ -346,6 +346,18 @@ def isShowScons():
     return options.show_scons
 
 
+def shallUseModuleCache():
+    """ *bool* = "--module-cache"
+    """
+    return options.module_cache
+
+
+def shallCompressBytecode():
+    """ *bool* = "--compress-bytecode"
+    """
+    return options.compress_bytecode
+
+
 def getJobLimit():
     """ *int*, value of "--jobs" / "-j" or number of CPU kernels
     """
@@ -358,6 +370,12 @@ def isLto():
     return options.lto
 
 
+def shallUseReadonlyConstants():
+    """ *bool* = "--readonly-constants"
+    """
+    return options.readonly_constants
+
+
 def isClang():
     """ *bool* = "--clang"
     """
@@ -412,6 +430,12 @@ def isRemoveBuildDir():
     return options.remove_build and not options.generate_c_only
 
 
+def isIncrementalBuild():
+    """ *bool* = "--incremental"
+    """
+    return options.incremental_build and not options.remove_build
+
+
 def getIntendedPythonArch():
     """ *str*, one of "x86", "x86_64" or None
     """
@@ -317,6 +317,23 @@ class TempVariable(Variable):
     def isTempVariable(self):
         return True
 
+    def getTypeShapes(self):
+        # Temporary variables are not used before assignment, so the values
+        # are only those assigned, uninitialized and loop traces only add the
+        # absence of a value, e.g. for loop iterators of inner loops.
+        result = set()
+
+        for trace in self.traces:
+            if trace.isAssignTrace():
+                result.add(trace.getAssignNode().getAssignSource().getTypeShape())
+            elif trace.isUnknownTrace() or trace.isInitTrace():
+                result.add(ShapeUnknown)
+
+        if not result:
+            result.add(ShapeUnknown)
+
+        return result
+
 
 class LocalsDictVariable(Variable):
     __slots__ = ()
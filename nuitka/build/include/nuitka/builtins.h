@@ -43,6 +43,65 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_BUILTIN(PyObject *name) {
     return result;
 }
 
+#if PYTHON_VERSION >= 360
+// Cache of a module variable read at one access site. It is valid as long as
+// the version tags of the dictionaries it was looked up in are unchanged, and
+// then the value is still referenced by that dictionary.
+struct Nuitka_ModuleVariableCache {
+    uint64_t module_dict_version;
+    // Zero, if the value was found in the module dictionary.
+    uint64_t builtins_dict_version;
+    PyObject *value;
+};
+
+NUITKA_MAY_BE_UNUSED static PyObject *GET_MODULE_VARIABLE_VALUE_CACHED(PyDictObject *module_dict,
+                                                                       Nuitka_StringObject *name,
+                                                                       struct Nuitka_ModuleVariableCache *cache) {
+    if (likely(module_dict->ma_version_tag == cache->module_dict_version)) {
+        if (likely(cache->builtins_dict_version == 0 || cache->builtins_dict_version == dict_builtin->ma_version_tag)) {
+            return cache->value;
+        }
+    }
+
+    // Take the versions before the lookups, in case they modify the
+    // dictionaries, then the next access will miss.
+    cache->module_dict_version = module_dict->ma_version_tag;
+
+    PyObject *result = GET_STRING_DICT_VALUE(module_dict, name);
+
+    if (result == NULL) {
+        cache->builtins_dict_version = dict_builtin->ma_version_tag;
+
+        result = GET_STRING_DICT_VALUE(dict_builtin, name);
+    } else {
+        cache->builtins_dict_version = 0;
+    }
+
+    cache->value = result;
+
+    return result;
+}
+#endif
+
+#if PYTHON_VERSION >= 360
+// Cache of a built-in value read at one access site, see above.
+struct Nuitka_BuiltinLookupCache {
+    uint64_t builtins_dict_version;
+    PyObject *value;
+};
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_BUILTIN_CACHED(PyObject *name, struct Nuitka_BuiltinLookupCache *cache) {
+    if (likely(cache->builtins_dict_version == dict_builtin->ma_version_tag)) {
+        return cache->value;
+    }
+
+    cache->builtins_dict_version = dict_builtin->ma_version_tag;
+    cache->value = LOOKUP_BUILTIN(name);
+
+    return cache->value;
+}
+#endif
+
 extern void _initBuiltinModule();
 
 #define NUITKA_DECLARE_BUILTIN(name) extern PyObject *_python_original_builtin_value_##name;
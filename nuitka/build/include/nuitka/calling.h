@@ -78,6 +78,11 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_KEYARGS(PyObject *funct
     return CALL_FUNCTION(function_object, const_tuple_empty, named_args);
 }
 
+// Function call variant with positional arguments followed by the values of
+// keyword arguments in one array, and the keyword argument names as a tuple.
+extern PyObject *CALL_FUNCTION_WITH_ARGS_KWNAMES(PyObject *called, PyObject **args, Py_ssize_t args_size,
+                                                 PyObject *kw_names);
+
 // Method call variant with no arguments provided at all.
 extern PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attribute);
 
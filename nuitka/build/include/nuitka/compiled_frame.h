@@ -165,6 +165,8 @@ NUITKA_MAY_BE_UNUSED inline static void pushFrameStack(struct Nuitka_FrameObject
     Nuitka_Frame_MarkAsExecuting(frame_object);
     Py_INCREF(frame_object);
 
+    NUITKA_PROFILE_ENTER(frame_object->m_frame.f_code);
+
 #if _DEBUG_FRAME
     printf("Now at top frame %s %s\n", Nuitka_String_AsString(PyObject_Str((PyObject *)tstate->frame)),
            Nuitka_String_AsString(PyObject_Repr((PyObject *)tstate->frame->f_code)));
@@ -172,6 +174,8 @@ NUITKA_MAY_BE_UNUSED inline static void pushFrameStack(struct Nuitka_FrameObject
 }
 
 NUITKA_MAY_BE_UNUSED inline static void popFrameStack(void) {
+    NUITKA_PROFILE_LEAVE();
+
     PyThreadState *tstate = PyThreadState_GET();
 
     PyFrameObject *old = tstate->frame;
@@ -208,5 +212,7 @@ extern void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame);
 #define NUITKA_TYPE_DESCRIPTION_OBJECT 'o'
 #define NUITKA_TYPE_DESCRIPTION_OBJECT_PTR 'O'
 #define NUITKA_TYPE_DESCRIPTION_BOOL 'b'
+#define NUITKA_TYPE_DESCRIPTION_ILONG 'L'
+#define NUITKA_TYPE_DESCRIPTION_FLOAT 'F'
 
 #endif
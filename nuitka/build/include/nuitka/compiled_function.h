@@ -102,6 +102,43 @@ static inline PyObject *Nuitka_Function_GetName(PyObject *object) {
     return ((struct Nuitka_FunctionObject *)object)->m_name;
 }
 
+// Call of a module function known at compile time, with arguments matching
+// its positional parameters exactly. The code is checked to still be the
+// expected one, in which case the implementation is called directly, without
+// any argument parsing, otherwise the value was changed, and it is called
+// normally.
+NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_C_CODE(PyObject *called, function_impl_code c_code, PyObject **args,
+                                                           Py_ssize_t args_size) {
+    CHECK_OBJECT(called);
+
+    if (likely(Nuitka_Function_Check(called) && ((struct Nuitka_FunctionObject *)called)->m_c_code == c_code)) {
+        if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+            return NULL;
+        }
+
+        for (Py_ssize_t i = 0; i < args_size; i++) {
+            CHECK_OBJECT(args[i]);
+            Py_INCREF(args[i]);
+        }
+
+        PyObject *result = c_code((struct Nuitka_FunctionObject *)called, args);
+
+        Py_LeaveRecursiveCall();
+
+        return result;
+    }
+
+    if (args_size == 0) {
+        return CALL_FUNCTION_NO_ARGS(called);
+    }
+
+    PyObject *pos_args = MAKE_TUPLE(args, args_size);
+    PyObject *result = CALL_FUNCTION(called, pos_args, NULL);
+    Py_DECREF(pos_args);
+
+    return result;
+}
+
 extern bool parseArgumentsPos(struct Nuitka_FunctionObject const *function, PyObject **python_pars, PyObject **args,
                               Py_ssize_t args_size);
 extern bool parseArgumentsMethodPos(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
@@ -110,6 +147,11 @@ extern bool parseArgumentsMethodPos(struct Nuitka_FunctionObject const *function
 extern PyObject *Nuitka_CallFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *function, PyObject **args,
                                                   Py_ssize_t args_size, PyObject *kw);
 
+// Call with the keyword argument values following the positional arguments
+// in the array, and their names given as a tuple.
+extern PyObject *Nuitka_CallFunctionVectorcall(struct Nuitka_FunctionObject const *function, PyObject **args,
+                                               Py_ssize_t args_size, PyObject *kw_names);
+
 // These are fast calls of known compiled methods, without an actual object
 // of that kind. The object is that first argument, "self" or whatever, to
 // which the function would be bound.
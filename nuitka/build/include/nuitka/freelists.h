@@ -19,12 +19,64 @@
 #ifndef __NUITKA_FREELISTS_H__
 #define __NUITKA_FREELISTS_H__
 
+// Initial limits of the free lists. They grow when objects released to a full
+// list are needed again, up to a factor, unless given by the environment
+// variable "NUITKA_FREELISTS", e.g. "frames=500,generators=2000".
+#define MAX_CELL_FREE_LIST_COUNT 1000
+#define MAX_FRAME_FREE_LIST_COUNT 100
+#define MAX_FUNCTION_FREE_LIST_COUNT 100
+#define MAX_METHOD_FREE_LIST_COUNT 100
+#define MAX_GENERATOR_FREE_LIST_COUNT 100
+#define MAX_COROUTINE_FREE_LIST_COUNT 100
+#define MAX_ASYNCGEN_FREE_LIST_COUNT 100
+#define MAX_TRACEBACK_FREE_LIST_COUNT 1000
+
+#define FREE_LIST_GROWTH_FACTOR 16
+
+// Current state, limit, and statistics of a free list. With the environment
+// variable "NUITKA_FREELIST_STATS" set, these are output at exit.
+struct Nuitka_FreeListInfo {
+    char const *name;
+
+    int count;
+    int max_count;
+    int max_limit;
+    int high_water;
+
+    // Releases to a full list since the limit was last raised.
+    int recent_drops;
+
+    unsigned long hits;
+    unsigned long misses;
+    unsigned long drops;
+};
+
+#define NUITKA_FREE_LIST_INFO(name, max_count)                                                                         \
+    { name, 0, max_count, (max_count)*FREE_LIST_GROWTH_FACTOR, 0, 0, 0, 0, 0 }
+
+// Allocation had to be done from the heap. If objects were dropped from the
+// full list before, the churn is bigger than the limit, so raise it.
+NUITKA_MAY_BE_UNUSED static void _noteFreeListMiss(struct Nuitka_FreeListInfo *info) {
+    info->misses += 1;
+
+    if (info->recent_drops > 0 && info->max_count < info->max_limit) {
+        info->max_count = info->max_count * 2 + 1;
+
+        if (info->max_count > info->max_limit) {
+            info->max_count = info->max_limit;
+        }
+
+        info->recent_drops = 0;
+    }
+}
+
 #define allocateFromFreeList(free_list, object_type, type_type, size)                                                  \
     if (free_list != NULL) {                                                                                           \
         result = free_list;                                                                                            \
         free_list = *((object_type **)free_list);                                                                      \
-        free_list##_count -= 1;                                                                                        \
-        assert(free_list##_count >= 0);                                                                                \
+        free_list##_info.count -= 1;                                                                                   \
+        assert(free_list##_info.count >= 0);                                                                           \
+        free_list##_info.hits += 1;                                                                                    \
                                                                                                                        \
         if (Py_SIZE(result) < size) {                                                                                  \
             result = PyObject_GC_Resize(object_type, result, size);                                                    \
@@ -33,6 +85,7 @@
                                                                                                                        \
         _Py_NewReference((PyObject *)result);                                                                          \
     } else {                                                                                                           \
+        _noteFreeListMiss(&free_list##_info);                                                                          \
         result = (object_type *)Nuitka_GC_NewVar(&type_type, size);                                                    \
     }                                                                                                                  \
     CHECK_OBJECT(result);
@@ -41,32 +94,32 @@
     if (free_list != NULL) {                                                                                           \
         result = free_list;                                                                                            \
         free_list = *((object_type **)free_list);                                                                      \
-        free_list##_count -= 1;                                                                                        \
-        assert(free_list##_count >= 0);                                                                                \
+        free_list##_info.count -= 1;                                                                                   \
+        assert(free_list##_info.count >= 0);                                                                           \
+        free_list##_info.hits += 1;                                                                                    \
                                                                                                                        \
         _Py_NewReference((PyObject *)result);                                                                          \
     } else {                                                                                                           \
+        _noteFreeListMiss(&free_list##_info);                                                                          \
         result = (object_type *)PyObject_GC_New(object_type, &type_type);                                              \
     }                                                                                                                  \
     CHECK_OBJECT(result);
 
-#define releaseToFreeList(free_list, object, max_free_list_count)                                                      \
-    if (free_list != NULL) {                                                                                           \
-        if (free_list##_count > max_free_list_count) {                                                                 \
-            PyObject_GC_Del(object);                                                                                   \
-        } else {                                                                                                       \
-            *((void **)object) = (void *)free_list;                                                                    \
-            free_list = object;                                                                                        \
+#define releaseToFreeList(free_list, object)                                                                           \
+    if (free_list##_info.count >= free_list##_info.max_count) {                                                        \
+        PyObject_GC_Del(object);                                                                                       \
                                                                                                                        \
-            free_list##_count += 1;                                                                                    \
-        }                                                                                                              \
+        free_list##_info.drops += 1;                                                                                   \
+        free_list##_info.recent_drops += 1;                                                                            \
     } else {                                                                                                           \
+        *((void **)object) = (void *)free_list;                                                                        \
         free_list = object;                                                                                            \
-        *((void **)object) = NULL;                                                                                     \
                                                                                                                        \
-        assert(free_list##_count == 0);                                                                                \
+        free_list##_info.count += 1;                                                                                   \
                                                                                                                        \
-        free_list##_count += 1;                                                                                        \
+        if (free_list##_info.count > free_list##_info.high_water) {                                                    \
+            free_list##_info.high_water = free_list##_info.count;                                                      \
+        }                                                                                                              \
     }
 
 #endif
@@ -21,6 +21,19 @@
 // Attribute lookup except special slots below.
 extern PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name);
 
+// Cache of the type attribute lookup at one access site, valid while the type
+// and its version tag are unchanged.
+struct Nuitka_AttributeLookupCache {
+    PyTypeObject *type;
+    unsigned int version_tag;
+    // Result of "_PyType_Lookup", owned by the type, NULL if not found.
+    PyObject *descr;
+};
+
+// Attribute lookup except special slots below, with a per access site cache.
+extern PyObject *LOOKUP_ATTRIBUTE_CACHED(PyObject *source, PyObject *attr_name,
+                                         struct Nuitka_AttributeLookupCache *cache);
+
 // Attribute lookup of attribute slot "__dict__".
 extern PyObject *LOOKUP_ATTRIBUTE_DICT_SLOT(PyObject *source);
 
@@ -69,6 +69,8 @@ static PyObject *GET_STRING_DICT_VALUE(PyDictObject *dict, Nuitka_StringObject *
     return GET_STRING_DICT_ENTRY(dict, key)->me_value;
 }
 
+#define UPDATE_DICT_VERSION(dict)
+
 #else
 
 // Python 3.3 or higher.
@@ -183,6 +185,17 @@ static Nuitka_DictEntryHandle GET_STRING_DICT_ENTRY(PyDictObject *dict, Nuitka_S
 #endif
 }
 
+#if PYTHON_VERSION >= 360
+// Get a new, globally unique, dictionary version tag. Needed when modifying
+// dictionary values directly, so that caches keyed on "ma_version_tag" notice
+// the change.
+extern uint64_t Nuitka_GetNextDictVersion(void);
+
+#define UPDATE_DICT_VERSION(dict) (dict)->ma_version_tag = Nuitka_GetNextDictVersion()
+#else
+#define UPDATE_DICT_VERSION(dict)
+#endif
+
 NUITKA_MAY_BE_UNUSED static PyObject *GET_DICT_ENTRY_VALUE(Nuitka_DictEntryHandle handle) { return *handle; }
 
 NUITKA_MAY_BE_UNUSED static void SET_DICT_ENTRY_VALUE(Nuitka_DictEntryHandle handle, PyObject *value) {
@@ -304,6 +317,7 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT0(PyDictObject *dict, Nuitka_
     if (likely(old != NULL)) {
         Py_INCREF(value);
         SET_DICT_ENTRY_VALUE(entry, value);
+        UPDATE_DICT_VERSION(dict);
 
         CHECK_OBJECT(old);
 
@@ -331,6 +345,7 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT_INPLACE(PyDictObject *dict,
     // speculatively try the quickest access method.
     if (likely(old != NULL)) {
         SET_DICT_ENTRY_VALUE(entry, value);
+        UPDATE_DICT_VERSION(dict);
     } else {
         DICT_SET_ITEM((PyObject *)dict, (PyObject *)key, value);
         Py_DECREF(value);
@@ -355,6 +370,7 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT1(PyDictObject *dict, Nuitka_
     // speculatively try the quickest access method.
     if (likely(old != NULL)) {
         SET_DICT_ENTRY_VALUE(entry, value);
+        UPDATE_DICT_VERSION(dict);
 
         Py_DECREF(old);
     } else {
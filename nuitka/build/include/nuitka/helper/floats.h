@@ -0,0 +1,103 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_FLOATS_H__
+#define __NUITKA_HELPER_FLOATS_H__
+
+typedef enum {
+    NUITKA_FLOAT_UNASSIGNED = 0,
+    NUITKA_FLOAT_OBJECT_VALID = 1,
+    NUITKA_FLOAT_VALUE_VALID = 2,
+    NUITKA_FLOAT_BOTH_VALID = 3
+} nuitka_float_validity;
+
+typedef struct {
+    nuitka_float_validity validity;
+
+    PyObject *float_object;
+    double float_value;
+} nuitka_float;
+
+// Value for variables not yet assigned, usable for initialization and also
+// for assignment, which is needed when heap storage is used.
+NUITKA_MAY_BE_UNUSED static nuitka_float const nuitka_float_unassigned = {NUITKA_FLOAT_UNASSIGNED, NULL, 0.0};
+
+// Make sure the object value is present, the C value is boxed on demand, so
+// this is to be used where the value escapes to Python code.
+NUITKA_MAY_BE_UNUSED static void ENFORCE_FLOAT_OBJECT_VALUE(nuitka_float *value) {
+    assert(value->validity != NUITKA_FLOAT_UNASSIGNED);
+
+    if ((value->validity & NUITKA_FLOAT_OBJECT_VALID) == 0) {
+        value->float_object = PyFloat_FromDouble(value->float_value);
+        CHECK_OBJECT(value->float_object);
+
+        value->validity = NUITKA_FLOAT_BOTH_VALID;
+    }
+}
+
+// Assign a C value, the target must not hold a value.
+NUITKA_MAY_BE_UNUSED static void SET_FLOAT_VALUE(nuitka_float *target, double value) {
+    target->validity = NUITKA_FLOAT_VALUE_VALID;
+    target->float_value = value;
+}
+
+// Assign an object value, taking over the reference, the target must not hold
+// a value. For "float" objects, the C value is made available too.
+NUITKA_MAY_BE_UNUSED static void SET_FLOAT_OBJECT(nuitka_float *target, PyObject *value) {
+    CHECK_OBJECT(value);
+
+    target->float_object = value;
+
+    if (PyFloat_CheckExact(value)) {
+        target->validity = NUITKA_FLOAT_BOTH_VALID;
+        target->float_value = PyFloat_AS_DOUBLE(value);
+    } else {
+        target->validity = NUITKA_FLOAT_OBJECT_VALID;
+    }
+}
+
+// Copy a value, the target must not hold a value.
+NUITKA_MAY_BE_UNUSED static void COPY_FLOAT(nuitka_float *target, nuitka_float const *source) {
+    assert(source->validity != NUITKA_FLOAT_UNASSIGNED);
+
+    *target = *source;
+
+    if ((target->validity & NUITKA_FLOAT_OBJECT_VALID) != 0) {
+        Py_INCREF(target->float_object);
+    }
+}
+
+// Release the value if any, and make it unassigned.
+NUITKA_MAY_BE_UNUSED static void RELEASE_FLOAT(nuitka_float *value) {
+    if ((value->validity & NUITKA_FLOAT_OBJECT_VALID) != 0) {
+        Py_DECREF(value->float_object);
+    }
+
+    value->validity = NUITKA_FLOAT_UNASSIGNED;
+}
+
+NUITKA_MAY_BE_UNUSED static int CHECK_IF_TRUE_FLOAT(nuitka_float const *value) {
+    assert(value->validity != NUITKA_FLOAT_UNASSIGNED);
+
+    if ((value->validity & NUITKA_FLOAT_VALUE_VALID) != 0) {
+        return value->float_value != 0.0 ? 1 : 0;
+    } else {
+        return CHECK_IF_TRUE(value->float_object);
+    }
+}
+
+#endif
@@ -61,18 +61,74 @@ typedef struct {
     long ilong_value;
 } nuitka_ilong;
 
-NUITKA_MAY_BE_UNUSED static void ENFORCE_ILONG_OBJECT_VALUE(nuitka_ilong *value)
-{
-    assert( value->validity != NUITKA_ILONG_UNASSIGNED );
+// Value for variables not yet assigned, usable for initialization and also
+// for assignment, which is needed when heap storage is used.
+NUITKA_MAY_BE_UNUSED static nuitka_ilong const nuitka_ilong_unassigned = {NUITKA_ILONG_UNASSIGNED, NULL, 0};
 
-    if ((value->validity & NUITKA_ILONG_OBJECT_VALID) == 0)
-    {
-        value->ilong_object = PyLong_FromLong(value->ilong_value);
+// Make sure the object value is present, the C value is boxed on demand, so
+// this is to be used where the value escapes to Python code.
+NUITKA_MAY_BE_UNUSED static void ENFORCE_ILONG_OBJECT_VALUE(nuitka_ilong *value) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    if ((value->validity & NUITKA_ILONG_OBJECT_VALID) == 0) {
+        value->ilong_object = PyInt_FromLong(value->ilong_value);
+        CHECK_OBJECT(value->ilong_object);
 
         value->validity = NUITKA_ILONG_BOTH_VALID;
     }
 }
 
+// Assign a C value, the target must not hold a value.
+NUITKA_MAY_BE_UNUSED static void SET_ILONG_VALUE(nuitka_ilong *target, long value) {
+    target->validity = NUITKA_ILONG_VALUE_VALID;
+    target->ilong_value = value;
+}
+
+// Assign an object value, taking over the reference, the target must not hold
+// a value. For "int" objects, the C value is made available too.
+NUITKA_MAY_BE_UNUSED static void SET_ILONG_OBJECT(nuitka_ilong *target, PyObject *value) {
+    CHECK_OBJECT(value);
+
+    target->ilong_object = value;
+
+    if (PyInt_CheckExact(value)) {
+        target->validity = NUITKA_ILONG_BOTH_VALID;
+        target->ilong_value = PyInt_AS_LONG(value);
+    } else {
+        target->validity = NUITKA_ILONG_OBJECT_VALID;
+    }
+}
+
+// Copy a value, the target must not hold a value.
+NUITKA_MAY_BE_UNUSED static void COPY_ILONG(nuitka_ilong *target, nuitka_ilong const *source) {
+    assert(source->validity != NUITKA_ILONG_UNASSIGNED);
+
+    *target = *source;
+
+    if ((target->validity & NUITKA_ILONG_OBJECT_VALID) != 0) {
+        Py_INCREF(target->ilong_object);
+    }
+}
+
+// Release the value if any, and make it unassigned.
+NUITKA_MAY_BE_UNUSED static void RELEASE_ILONG(nuitka_ilong *value) {
+    if ((value->validity & NUITKA_ILONG_OBJECT_VALID) != 0) {
+        Py_DECREF(value->ilong_object);
+    }
+
+    value->validity = NUITKA_ILONG_UNASSIGNED;
+}
+
+NUITKA_MAY_BE_UNUSED static int CHECK_IF_TRUE_ILONG(nuitka_ilong const *value) {
+    assert(value->validity != NUITKA_ILONG_UNASSIGNED);
+
+    if ((value->validity & NUITKA_ILONG_VALUE_VALID) != 0) {
+        return value->ilong_value != 0 ? 1 : 0;
+    } else {
+        return CHECK_IF_TRUE(value->ilong_object);
+    }
+}
+
 #endif
 
 #endif
@@ -0,0 +1,47 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/* WARNING, this code is GENERATED. Modify the template instead! */
+/* C helpers for type specialized "|" (BitOr) operations */
+
+#if PYTHON_VERSION < 300
+
+/* Code referring to "INT" corresponds to Python2 'int'. */
+
+extern PyObject *BINARY_OPERATION_BITOR_OBJECT_INT(PyObject *operand1, PyObject *operand2);
+
+extern PyObject *BINARY_OPERATION_BITOR_INT_OBJECT(PyObject *operand1, PyObject *operand2);
+
+extern PyObject *BINARY_OPERATION_BITOR_INT_INT(PyObject *operand1, PyObject *operand2);
+
+extern bool BINARY_OPERATION_BITOR_INT_INT_INPLACE(PyObject **operand1, PyObject *operand2);
+
+#endif
+/* Code referring to "LONG" corresponds to Python2 'long', Python3 'int'. */
+
+extern PyObject *BINARY_OPERATION_BITOR_OBJECT_LONG(PyObject *operand1, PyObject *operand2);
+
+extern PyObject *BINARY_OPERATION_BITOR_LONG_OBJECT(PyObject *operand1, PyObject *operand2);
+
+extern PyObject *BINARY_OPERATION_BITOR_LONG_LONG(PyObject *operand1, PyObject *operand2);
+
+extern bool BINARY_OPERATION_BITOR_LONG_LONG_INPLACE(PyObject **operand1, PyObject *operand2);
+/* Code referring to "OBJECT" corresponds to Any Python object. */
+
+extern PyObject *BINARY_OPERATION_BITOR_OBJECT_OBJECT(PyObject *operand1, PyObject *operand2);
+
+extern bool BINARY_OPERATION_BITOR_OBJECT_OBJECT_INPLACE(PyObject **operand1, PyObject *operand2);
@@ -0,0 +1,260 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_OPERATIONS_FLOAT_H__
+#define __NUITKA_OPERATIONS_FLOAT_H__
+
+/* Operations on "nuitka_float" values, used for local variables that are
+ * known to be "float" values.
+ *
+ * These work on the C "double" values, without creating objects, which gives
+ * the same results, as that is what the "float" type does too. Operands that
+ * are not "float" objects use the object operations instead. Operands that
+ * are constants are passed as C "double", and other operands as objects.
+ */
+
+NUITKA_MAY_BE_UNUSED static bool _BINARY_OPERATION_NFLOAT_OBJECTS(nuitka_float *result, nuitka_float *operand1,
+                                                                  nuitka_float *operand2, binary_api api) {
+    ENFORCE_FLOAT_OBJECT_VALUE(operand1);
+    ENFORCE_FLOAT_OBJECT_VALUE(operand2);
+
+    PyObject *value = api(operand1->float_object, operand2->float_object);
+
+    if (unlikely(value == NULL)) {
+        return false;
+    }
+
+    SET_FLOAT_OBJECT(result, value);
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_NFLOAT_NFLOAT(nuitka_float *result, nuitka_float *operand1,
+                                                                    nuitka_float *operand2) {
+    if ((operand1->validity & NUITKA_FLOAT_VALUE_VALID) != 0 && (operand2->validity & NUITKA_FLOAT_VALUE_VALID) != 0) {
+        SET_FLOAT_VALUE(result, operand1->float_value + operand2->float_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_NFLOAT_OBJECTS(result, operand1, operand2, BINARY_OPERATION_ADD_OBJECT_OBJECT);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_NFLOAT_CDOUBLE(nuitka_float *result, nuitka_float *operand1,
+                                                                     double operand2) {
+    nuitka_float value2;
+    SET_FLOAT_VALUE(&value2, operand2);
+
+    bool r = BINARY_OPERATION_ADD_NFLOAT_NFLOAT(result, operand1, &value2);
+
+    RELEASE_FLOAT(&value2);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_CDOUBLE_NFLOAT(nuitka_float *result, double operand1,
+                                                                     nuitka_float *operand2) {
+    nuitka_float value1;
+    SET_FLOAT_VALUE(&value1, operand1);
+
+    bool r = BINARY_OPERATION_ADD_NFLOAT_NFLOAT(result, &value1, operand2);
+
+    RELEASE_FLOAT(&value1);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_NFLOAT_OBJECT(nuitka_float *result, nuitka_float *operand1,
+                                                                    PyObject *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_float value2;
+    SET_FLOAT_OBJECT(&value2, operand2);
+
+    return BINARY_OPERATION_ADD_NFLOAT_NFLOAT(result, operand1, &value2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_OBJECT_NFLOAT(nuitka_float *result, PyObject *operand1,
+                                                                    nuitka_float *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_float value1;
+    SET_FLOAT_OBJECT(&value1, operand1);
+
+    return BINARY_OPERATION_ADD_NFLOAT_NFLOAT(result, &value1, operand2);
+}
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_NFLOAT_NFLOAT(nuitka_float *result, nuitka_float *operand1,
+                                                                    nuitka_float *operand2) {
+    if ((operand1->validity & NUITKA_FLOAT_VALUE_VALID) != 0 && (operand2->validity & NUITKA_FLOAT_VALUE_VALID) != 0) {
+        SET_FLOAT_VALUE(result, operand1->float_value - operand2->float_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_NFLOAT_OBJECTS(result, operand1, operand2, BINARY_OPERATION_SUB_OBJECT_OBJECT);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_NFLOAT_CDOUBLE(nuitka_float *result, nuitka_float *operand1,
+                                                                     double operand2) {
+    nuitka_float value2;
+    SET_FLOAT_VALUE(&value2, operand2);
+
+    bool r = BINARY_OPERATION_SUB_NFLOAT_NFLOAT(result, operand1, &value2);
+
+    RELEASE_FLOAT(&value2);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_CDOUBLE_NFLOAT(nuitka_float *result, double operand1,
+                                                                     nuitka_float *operand2) {
+    nuitka_float value1;
+    SET_FLOAT_VALUE(&value1, operand1);
+
+    bool r = BINARY_OPERATION_SUB_NFLOAT_NFLOAT(result, &value1, operand2);
+
+    RELEASE_FLOAT(&value1);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_NFLOAT_OBJECT(nuitka_float *result, nuitka_float *operand1,
+                                                                    PyObject *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_float value2;
+    SET_FLOAT_OBJECT(&value2, operand2);
+
+    return BINARY_OPERATION_SUB_NFLOAT_NFLOAT(result, operand1, &value2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_OBJECT_NFLOAT(nuitka_float *result, PyObject *operand1,
+                                                                    nuitka_float *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_float value1;
+    SET_FLOAT_OBJECT(&value1, operand1);
+
+    return BINARY_OPERATION_SUB_NFLOAT_NFLOAT(result, &value1, operand2);
+}
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_MUL_NFLOAT_NFLOAT(nuitka_float *result, nuitka_float *operand1,
+                                                                    nuitka_float *operand2) {
+    if ((operand1->validity & NUITKA_FLOAT_VALUE_VALID) != 0 && (operand2->validity & NUITKA_FLOAT_VALUE_VALID) != 0) {
+        SET_FLOAT_VALUE(result, operand1->float_value * operand2->float_value);
+        return true;
+    }
+
+    return _BINARY_OPERATION_NFLOAT_OBJECTS(result, operand1, operand2, BINARY_OPERATION_MUL_OBJECT_OBJECT);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_MUL_NFLOAT_CDOUBLE(nuitka_float *result, nuitka_float *operand1,
+                                                                     double operand2) {
+    nuitka_float value2;
+    SET_FLOAT_VALUE(&value2, operand2);
+
+    bool r = BINARY_OPERATION_MUL_NFLOAT_NFLOAT(result, operand1, &value2);
+
+    RELEASE_FLOAT(&value2);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_MUL_CDOUBLE_NFLOAT(nuitka_float *result, double operand1,
+                                                                     nuitka_float *operand2) {
+    nuitka_float value1;
+    SET_FLOAT_VALUE(&value1, operand1);
+
+    bool r = BINARY_OPERATION_MUL_NFLOAT_NFLOAT(result, &value1, operand2);
+
+    RELEASE_FLOAT(&value1);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_MUL_NFLOAT_OBJECT(nuitka_float *result, nuitka_float *operand1,
+                                                                    PyObject *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_float value2;
+    SET_FLOAT_OBJECT(&value2, operand2);
+
+    return BINARY_OPERATION_MUL_NFLOAT_NFLOAT(result, operand1, &value2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_MUL_OBJECT_NFLOAT(nuitka_float *result, PyObject *operand1,
+                                                                    nuitka_float *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_float value1;
+    SET_FLOAT_OBJECT(&value1, operand1);
+
+    return BINARY_OPERATION_MUL_NFLOAT_NFLOAT(result, &value1, operand2);
+}
+// Rich comparison with "int" result, -1 indicates an error, "op" is one of
+// "Py_LT", "Py_LE", "Py_EQ", "Py_NE", "Py_GT", "Py_GE".
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NFLOAT_NFLOAT(nuitka_float *operand1, nuitka_float *operand2,
+                                                                int op) {
+    if ((operand1->validity & NUITKA_FLOAT_VALUE_VALID) != 0 && (operand2->validity & NUITKA_FLOAT_VALUE_VALID) != 0) {
+        double a = operand1->float_value;
+        double b = operand2->float_value;
+
+        switch (op) {
+        case Py_LT:
+            return a < b;
+        case Py_LE:
+            return a <= b;
+        case Py_EQ:
+            return a == b;
+        case Py_NE:
+            return a != b;
+        case Py_GT:
+            return a > b;
+        case Py_GE:
+            return a >= b;
+        default:
+            assert(false);
+        }
+    }
+
+    ENFORCE_FLOAT_OBJECT_VALUE(operand1);
+    ENFORCE_FLOAT_OBJECT_VALUE(operand2);
+
+    return PyObject_RichCompareBool(operand1->float_object, operand2->float_object, op);
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NFLOAT_CDOUBLE(nuitka_float *operand1, double operand2, int op) {
+    nuitka_float value2;
+    SET_FLOAT_VALUE(&value2, operand2);
+
+    int r = RICH_COMPARE_BOOL_NFLOAT_NFLOAT(operand1, &value2, op);
+
+    RELEASE_FLOAT(&value2);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_CDOUBLE_NFLOAT(double operand1, nuitka_float *operand2, int op) {
+    nuitka_float value1;
+    SET_FLOAT_VALUE(&value1, operand1);
+
+    int r = RICH_COMPARE_BOOL_NFLOAT_NFLOAT(&value1, operand2, op);
+
+    RELEASE_FLOAT(&value1);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NFLOAT_OBJECT(nuitka_float *operand1, PyObject *operand2, int op) {
+    // Not released, the reference is borrowed.
+    nuitka_float value2;
+    SET_FLOAT_OBJECT(&value2, operand2);
+
+    return RICH_COMPARE_BOOL_NFLOAT_NFLOAT(operand1, &value2, op);
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_OBJECT_NFLOAT(PyObject *operand1, nuitka_float *operand2, int op) {
+    // Not released, the reference is borrowed.
+    nuitka_float value1;
+    SET_FLOAT_OBJECT(&value1, operand1);
+
+    return RICH_COMPARE_BOOL_NFLOAT_NFLOAT(&value1, operand2, op);
+}
+
+#endif
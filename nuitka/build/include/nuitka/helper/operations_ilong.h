@@ -0,0 +1,230 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_OPERATIONS_ILONG_H__
+#define __NUITKA_OPERATIONS_ILONG_H__
+
+/* Operations on "nuitka_ilong" values, used for local variables that are
+ * known to be "int" or "long" values in Python2.
+ *
+ * As long as values are small, these work on the C "long" values, without
+ * creating objects. On overflow, or for "long" objects, the object operations
+ * are used instead. Operands that are constants are passed as C "long", and
+ * other operands as objects.
+ */
+
+#if PYTHON_VERSION < 300
+
+NUITKA_MAY_BE_UNUSED static bool _BINARY_OPERATION_ILONG_OBJECTS(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                 nuitka_ilong *operand2, binary_api api) {
+    ENFORCE_ILONG_OBJECT_VALUE(operand1);
+    ENFORCE_ILONG_OBJECT_VALUE(operand2);
+
+    PyObject *value = api(operand1->ilong_object, operand2->ilong_object);
+
+    if (unlikely(value == NULL)) {
+        return false;
+    }
+
+    SET_ILONG_OBJECT(result, value);
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_ILONG_ILONG(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                  nuitka_ilong *operand2) {
+    if ((operand1->validity & NUITKA_ILONG_VALUE_VALID) != 0 && (operand2->validity & NUITKA_ILONG_VALUE_VALID) != 0) {
+        long a = operand1->ilong_value;
+        long b = operand2->ilong_value;
+
+        long i = (long)((unsigned long)a + b);
+
+        if (likely((i ^ a) >= 0 || (i ^ b) >= 0)) {
+            SET_ILONG_VALUE(result, i);
+            return true;
+        }
+    }
+
+    return _BINARY_OPERATION_ILONG_OBJECTS(result, operand1, operand2, BINARY_OPERATION_ADD_OBJECT_OBJECT);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_ILONG_ILONG(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                  nuitka_ilong *operand2) {
+    if ((operand1->validity & NUITKA_ILONG_VALUE_VALID) != 0 && (operand2->validity & NUITKA_ILONG_VALUE_VALID) != 0) {
+        long a = operand1->ilong_value;
+        long b = operand2->ilong_value;
+
+        long i = (long)((unsigned long)a - b);
+
+        if (likely((i ^ a) >= 0 || (i ^ ~b) >= 0)) {
+            SET_ILONG_VALUE(result, i);
+            return true;
+        }
+    }
+
+    return _BINARY_OPERATION_ILONG_OBJECTS(result, operand1, operand2, BINARY_OPERATION_SUB_OBJECT_OBJECT);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_ILONG_CLONG(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                  long operand2) {
+    nuitka_ilong value2;
+    SET_ILONG_VALUE(&value2, operand2);
+
+    bool r = BINARY_OPERATION_ADD_ILONG_ILONG(result, operand1, &value2);
+
+    RELEASE_ILONG(&value2);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_CLONG_ILONG(nuitka_ilong *result, long operand1,
+                                                                  nuitka_ilong *operand2) {
+    nuitka_ilong value1;
+    SET_ILONG_VALUE(&value1, operand1);
+
+    bool r = BINARY_OPERATION_ADD_ILONG_ILONG(result, &value1, operand2);
+
+    RELEASE_ILONG(&value1);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_ILONG_CLONG(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                  long operand2) {
+    nuitka_ilong value2;
+    SET_ILONG_VALUE(&value2, operand2);
+
+    bool r = BINARY_OPERATION_SUB_ILONG_ILONG(result, operand1, &value2);
+
+    RELEASE_ILONG(&value2);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_CLONG_ILONG(nuitka_ilong *result, long operand1,
+                                                                  nuitka_ilong *operand2) {
+    nuitka_ilong value1;
+    SET_ILONG_VALUE(&value1, operand1);
+
+    bool r = BINARY_OPERATION_SUB_ILONG_ILONG(result, &value1, operand2);
+
+    RELEASE_ILONG(&value1);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_ILONG_OBJECT(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                   PyObject *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_ilong value2;
+    SET_ILONG_OBJECT(&value2, operand2);
+
+    return BINARY_OPERATION_ADD_ILONG_ILONG(result, operand1, &value2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_ADD_OBJECT_ILONG(nuitka_ilong *result, PyObject *operand1,
+                                                                   nuitka_ilong *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_ilong value1;
+    SET_ILONG_OBJECT(&value1, operand1);
+
+    return BINARY_OPERATION_ADD_ILONG_ILONG(result, &value1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_ILONG_OBJECT(nuitka_ilong *result, nuitka_ilong *operand1,
+                                                                   PyObject *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_ilong value2;
+    SET_ILONG_OBJECT(&value2, operand2);
+
+    return BINARY_OPERATION_SUB_ILONG_ILONG(result, operand1, &value2);
+}
+
+NUITKA_MAY_BE_UNUSED static bool BINARY_OPERATION_SUB_OBJECT_ILONG(nuitka_ilong *result, PyObject *operand1,
+                                                                   nuitka_ilong *operand2) {
+    // Not released, the reference is borrowed.
+    nuitka_ilong value1;
+    SET_ILONG_OBJECT(&value1, operand1);
+
+    return BINARY_OPERATION_SUB_ILONG_ILONG(result, &value1, operand2);
+}
+
+// Rich comparison with "int" result, -1 indicates an error, "op" is one of
+// "Py_LT", "Py_LE", "Py_EQ", "Py_NE", "Py_GT", "Py_GE".
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_ILONG_ILONG(nuitka_ilong *operand1, nuitka_ilong *operand2, int op) {
+    if ((operand1->validity & NUITKA_ILONG_VALUE_VALID) != 0 && (operand2->validity & NUITKA_ILONG_VALUE_VALID) != 0) {
+        long a = operand1->ilong_value;
+        long b = operand2->ilong_value;
+
+        switch (op) {
+        case Py_LT:
+            return a < b;
+        case Py_LE:
+            return a <= b;
+        case Py_EQ:
+            return a == b;
+        case Py_NE:
+            return a != b;
+        case Py_GT:
+            return a > b;
+        case Py_GE:
+            return a >= b;
+        default:
+            assert(false);
+        }
+    }
+
+    ENFORCE_ILONG_OBJECT_VALUE(operand1);
+    ENFORCE_ILONG_OBJECT_VALUE(operand2);
+
+    return PyObject_RichCompareBool(operand1->ilong_object, operand2->ilong_object, op);
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_ILONG_CLONG(nuitka_ilong *operand1, long operand2, int op) {
+    nuitka_ilong value2;
+    SET_ILONG_VALUE(&value2, operand2);
+
+    int r = RICH_COMPARE_BOOL_ILONG_ILONG(operand1, &value2, op);
+
+    RELEASE_ILONG(&value2);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_CLONG_ILONG(long operand1, nuitka_ilong *operand2, int op) {
+    nuitka_ilong value1;
+    SET_ILONG_VALUE(&value1, operand1);
+
+    int r = RICH_COMPARE_BOOL_ILONG_ILONG(&value1, operand2, op);
+
+    RELEASE_ILONG(&value1);
+    return r;
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_ILONG_OBJECT(nuitka_ilong *operand1, PyObject *operand2, int op) {
+    // Not released, the reference is borrowed.
+    nuitka_ilong value2;
+    SET_ILONG_OBJECT(&value2, operand2);
+
+    return RICH_COMPARE_BOOL_ILONG_ILONG(operand1, &value2, op);
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_OBJECT_ILONG(PyObject *operand1, nuitka_ilong *operand2, int op) {
+    // Not released, the reference is borrowed.
+    nuitka_ilong value1;
+    SET_ILONG_OBJECT(&value1, operand1);
+
+    return RICH_COMPARE_BOOL_ILONG_ILONG(&value1, operand2, op);
+}
+
+#endif
+
+#endif
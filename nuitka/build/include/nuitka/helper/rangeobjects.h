@@ -58,4 +58,121 @@ extern PyObject *MAKE_XRANGE(long start, long stop, long step);
 
 #endif
 
+/* Iteration over ranges by loops. Values are counted with C "long" values,
+   and no range or iterator object is created, unless the arguments do not
+   fit or the iterator escapes, then an iterator object is used. */
+typedef enum {
+    NUITKA_RANGE_ITERATOR_UNASSIGNED = 0,
+    NUITKA_RANGE_ITERATOR_VALUE_VALID = 1,
+    NUITKA_RANGE_ITERATOR_OBJECT_VALID = 2
+} nuitka_range_iterator_validity;
+
+typedef struct {
+    nuitka_range_iterator_validity validity;
+
+    PyObject *iterator;
+
+    long current;
+    long step;
+    unsigned long remaining;
+} nuitka_range_iterator;
+
+// Value for variables not yet assigned, usable for initialization and also
+// for assignment, which is needed when heap storage is used.
+NUITKA_MAY_BE_UNUSED static nuitka_range_iterator const nuitka_range_iterator_unassigned = {
+    NUITKA_RANGE_ITERATOR_UNASSIGNED, NULL, 0, 0, 0};
+
+// Start counting with C values, the target must not hold a value.
+NUITKA_MAY_BE_UNUSED static void SET_RANGE_ITERATOR_COUNTER(nuitka_range_iterator *target, long start, long step,
+                                                            unsigned long count) {
+    assert(step != 0);
+
+    target->validity = NUITKA_RANGE_ITERATOR_VALUE_VALID;
+    target->iterator = NULL;
+    target->current = start;
+    target->step = step;
+    target->remaining = count;
+}
+
+// Assign an iterator object, taking over the reference, the target must not
+// hold a value.
+NUITKA_MAY_BE_UNUSED static void SET_RANGE_ITERATOR_OBJECT(nuitka_range_iterator *target, PyObject *iterator) {
+    CHECK_OBJECT(iterator);
+
+    target->validity = NUITKA_RANGE_ITERATOR_OBJECT_VALID;
+    target->iterator = iterator;
+}
+
+// Release the value if any, and make it unassigned.
+NUITKA_MAY_BE_UNUSED static void RELEASE_RANGE_ITERATOR(nuitka_range_iterator *value) {
+    if (value->validity == NUITKA_RANGE_ITERATOR_OBJECT_VALID) {
+        Py_DECREF(value->iterator);
+    }
+
+    value->validity = NUITKA_RANGE_ITERATOR_UNASSIGNED;
+}
+
+// Start iteration over "range" (list is true, Python2 only) or "xrange" with
+// the given arguments. The low and step values are optional, i.e. NULL, as
+// they are for the built-ins. Errors are those of the built-ins.
+extern bool MAKE_RANGE_ITERATOR(nuitka_range_iterator *target, PyObject *low, PyObject *high, PyObject *step,
+                                bool list);
+
+// Make sure the iterator object is present, used where the iterator escapes
+// to Python code. Counting then continues with that object.
+extern void ENFORCE_RANGE_ITERATOR_OBJECT(nuitka_range_iterator *value);
+
+// Next value of a range iteration, NULL at the end, or for errors of an
+// iterator object.
+NUITKA_MAY_BE_UNUSED static PyObject *RANGE_ITERATOR_NEXT(nuitka_range_iterator *value) {
+    assert(value->validity != NUITKA_RANGE_ITERATOR_UNASSIGNED);
+
+    if (likely(value->validity == NUITKA_RANGE_ITERATOR_VALUE_VALID)) {
+        if (unlikely(value->remaining == 0)) {
+            return NULL;
+        }
+
+        long result = value->current;
+
+        // Unsigned arithmetic, after the last value, this may overflow.
+        value->current = (long)((unsigned long)result + (unsigned long)value->step);
+        value->remaining -= 1;
+
+        return PyInt_FromLong(result);
+    } else {
+        return ITERATOR_NEXT(value->iterator);
+    }
+}
+
+#if PYTHON_VERSION < 300
+// Next value of a range iteration assigned to a C value, false at the end,
+// or for errors of an iterator object. Only boxed if it escapes later.
+NUITKA_MAY_BE_UNUSED static bool RANGE_ITERATOR_NEXT_ILONG(nuitka_range_iterator *value, nuitka_ilong *target) {
+    assert(value->validity != NUITKA_RANGE_ITERATOR_UNASSIGNED);
+
+    if (likely(value->validity == NUITKA_RANGE_ITERATOR_VALUE_VALID)) {
+        if (unlikely(value->remaining == 0)) {
+            return false;
+        }
+
+        SET_ILONG_VALUE(target, value->current);
+
+        value->current = (long)((unsigned long)value->current + (unsigned long)value->step);
+        value->remaining -= 1;
+
+        return true;
+    } else {
+        PyObject *result = ITERATOR_NEXT(value->iterator);
+
+        if (result == NULL) {
+            return false;
+        }
+
+        SET_ILONG_OBJECT(target, result);
+
+        return true;
+    }
+}
+#endif
+
 #endif
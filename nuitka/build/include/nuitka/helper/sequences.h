@@ -53,4 +53,23 @@ NUITKA_MAY_BE_UNUSED static bool SEQUENCE_SETITEM(PyObject *sequence, Py_ssize_t
     }
 }
 
+// The "in" test for a tuple or list that is not created, but given as the
+// array of its items. Compatible with "tuplecontains" and "list_contains",
+// the identity check is done by "PyObject_RichCompareBool" for all types.
+NUITKA_MAY_BE_UNUSED static int SEQUENCE_CONTAINS_ITEMS(PyObject *element, PyObject *const *items, Py_ssize_t size) {
+    CHECK_OBJECT(element);
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        CHECK_OBJECT(items[i]);
+
+        int res = PyObject_RichCompareBool(element, items[i], Py_EQ);
+
+        if (res != 0) {
+            return res;
+        }
+    }
+
+    return 0;
+}
+
 #endif
@@ -59,10 +59,7 @@ extern Py_hash_t DEEP_HASH(PyObject *value);
 #endif
 
 // For profiling of Nuitka compiled binaries
-#if _NUITKA_PROFILE
-extern void startProfiling(void);
-extern void stopProfiling(void);
-#endif
+#include "nuitka/profiling.h"
 
 #include "nuitka/helper/boolean.h"
 #include "nuitka/helper/dictionaries.h"
@@ -108,6 +105,8 @@ NUITKA_MAY_BE_UNUSED static PyObject *TO_FLOAT(PyObject *value) {
 
 #include "nuitka/helper/ints.h"
 
+#include "nuitka/helper/floats.h"
+
 NUITKA_MAY_BE_UNUSED static PyObject *TO_UNICODE3(PyObject *value, PyObject *encoding, PyObject *errors) {
     CHECK_OBJECT(value);
     if (encoding)
@@ -237,6 +236,50 @@ extern PyObject *BUILTIN_CALLABLE(PyObject *value);
 // For quicker iter() functionality if 2 arguments arg given.
 extern PyObject *BUILTIN_ITER2(PyObject *callable, PyObject *sentinel);
 
+// For quicker enumerate() functionality, "start" may be NULL.
+extern PyObject *BUILTIN_ENUMERATE(PyObject *iterable, PyObject *start);
+
+// For quicker reversed() functionality.
+extern PyObject *BUILTIN_REVERSED(PyObject *value);
+
+// For quicker sorted() functionality, the optional arguments may be NULL.
+#if PYTHON_VERSION < 300
+extern PyObject *BUILTIN_SORTED(PyObject *iterable, PyObject *cmp, PyObject *key, PyObject *reverse);
+#else
+extern PyObject *BUILTIN_SORTED(PyObject *iterable, PyObject *key, PyObject *reverse);
+#endif
+
+// For quicker zip() functionality, with the iterables given as a tuple.
+extern PyObject *BUILTIN_ZIP(PyObject *iterables);
+
+// For quicker min() and max() functionality, with two values, the versions
+// for known types are a comparison only.
+#if PYTHON_VERSION < 300
+extern PyObject *BUILTIN_MIN2_INT_INT(PyObject *left, PyObject *right);
+extern PyObject *BUILTIN_MAX2_INT_INT(PyObject *left, PyObject *right);
+#endif
+extern PyObject *BUILTIN_MIN2_FLOAT_FLOAT(PyObject *left, PyObject *right);
+extern PyObject *BUILTIN_MAX2_FLOAT_FLOAT(PyObject *left, PyObject *right);
+extern PyObject *BUILTIN_MIN2_OBJECT_OBJECT(PyObject *left, PyObject *right);
+extern PyObject *BUILTIN_MAX2_OBJECT_OBJECT(PyObject *left, PyObject *right);
+
+// For quicker min() and max() functionality, with an iterable.
+extern PyObject *BUILTIN_MIN1(PyObject *iterable);
+extern PyObject *BUILTIN_MAX1(PyObject *iterable);
+
+// For quicker any() and all() functionality.
+extern PyObject *BUILTIN_ANY(PyObject *iterable);
+extern PyObject *BUILTIN_ALL(PyObject *iterable);
+
+// For quicker round() functionality, "ndigits" may be NULL.
+extern PyObject *BUILTIN_ROUND(PyObject *number, PyObject *ndigits);
+
+// For quicker map() functionality, with the iterables given as a tuple.
+extern PyObject *BUILTIN_MAP(PyObject *function, PyObject *iterables);
+
+// For quicker filter() functionality.
+extern PyObject *BUILTIN_FILTER(PyObject *function, PyObject *iterable);
+
 // For quicker type() functionality if 1 argument is given.
 extern PyObject *BUILTIN_TYPE1(PyObject *arg);
 
@@ -0,0 +1,54 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_PROFILING_H__
+#define __NUITKA_PROFILING_H__
+
+/* Profiling of compiled code, with "--profile" the entry and exit of code is
+ * recorded, if enabled at run time by the environment.
+ */
+
+#if _NUITKA_PROFILE
+
+extern void startProfiling(void);
+extern void stopProfiling(void);
+
+extern bool Nuitka_Profile_Enabled;
+
+extern void Nuitka_Profile_Enter(PyCodeObject *code_object);
+extern void Nuitka_Profile_Leave(void);
+extern void Nuitka_Profile_RegisterName(PyCodeObject *code_object, PyObject *qualname);
+
+#define NUITKA_PROFILE_ENTER(code_object)                                                                              \
+    if (unlikely(Nuitka_Profile_Enabled)) {                                                                            \
+        Nuitka_Profile_Enter(code_object);                                                                             \
+    }
+#define NUITKA_PROFILE_LEAVE()                                                                                         \
+    if (unlikely(Nuitka_Profile_Enabled)) {                                                                            \
+        Nuitka_Profile_Leave();                                                                                        \
+    }
+#define NUITKA_PROFILE_REGISTER_NAME(code_object, qualname)                                                            \
+    if (unlikely(Nuitka_Profile_Enabled)) {                                                                            \
+        Nuitka_Profile_RegisterName(code_object, qualname);                                                            \
+    }
+#else
+#define NUITKA_PROFILE_ENTER(code_object)
+#define NUITKA_PROFILE_LEAVE()
+#define NUITKA_PROFILE_REGISTER_NAME(code_object, qualname)
+#endif
+
+#endif
@@ -26,6 +26,18 @@ extern volatile int _Py_Ticker;
 #define _Py_CheckInterval 20
 #endif
 
+#if PYTHON_VERSION >= 350
+// Time the GIL was last given to other threads by compiled code.
+extern _PyTime_t Nuitka_thread_switch_time;
+#endif
+
+// Releasing the GIL can only help other threads, if there are any.
+NUITKA_MAY_BE_UNUSED static inline bool HAS_OTHER_THREADS(PyThreadState *tstate) {
+    PyThreadState *head = PyInterpreterState_ThreadHead(tstate->interp);
+
+    return head != tstate || PyThreadState_Next(head) != NULL;
+}
+
 NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING(void) {
     // Decrease ticker
     if (--_Py_Ticker < 0) {
@@ -40,12 +52,24 @@ NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING(void) {
         PyThreadState *tstate = PyThreadState_GET();
         assert(tstate);
 
-        if (PyEval_ThreadsInitialized()) {
-            // Release and acquire the GIL, it's very inefficient, because we
-            // don't even know if it makes sense to do it. A controlling thread
-            // should be used to determine if it's needed at all.
+        if (PyEval_ThreadsInitialized() && HAS_OTHER_THREADS(tstate)) {
+#if PYTHON_VERSION >= 350
+            // Like the CPython main loop, give up the GIL only after holding
+            // it for the switch interval. Waiting threads ask for the GIL after
+            // that time too, and only then "drop_gil" forces the switch, so
+            // this avoids the GIL bouncing between running threads.
+            _PyTime_t now = _PyTime_GetMonotonicClock();
+
+            if (now - Nuitka_thread_switch_time >= (_PyTime_t)_PyEval_GetSwitchInterval() * 1000) {
+                PyEval_SaveThread();
+                PyEval_AcquireThread(tstate);
+
+                Nuitka_thread_switch_time = _PyTime_GetMonotonicClock();
+            }
+#else
             PyEval_SaveThread();
             PyEval_AcquireThread(tstate);
+#endif
         }
 
         if (unlikely(tstate->async_exc != NULL)) {
@@ -24,6 +24,7 @@
 #define NUITKA_SHLIB_FLAG 1
 #define NUITKA_PACKAGE_FLAG 2
 #define NUITKA_BYTECODE_FLAG 4
+#define NUITKA_COMPRESSED_FLAG 8
 
 #if PYTHON_VERSION < 300
 typedef void (*module_initfunc)(void);
@@ -38,7 +39,8 @@ struct Nuitka_MetaPathBasedLoaderEntry {
     /* Entry function if compiled module, otherwise NULL. */
     module_initfunc python_initfunc;
 
-    /* For bytecode modules, start and size inside the constants blob. */
+    /* For bytecode modules, start and size inside the constants blob, which
+     * for compressed bytecode is the size of the "zlib" data. */
     int bytecode_start;
     int bytecode_size;
 
@@ -47,7 +49,8 @@ struct Nuitka_MetaPathBasedLoaderEntry {
 };
 
 /* For embedded modules, register the meta path based loader. Used by main
- * program/package only.
+ * program/package only. The entries must be sorted by name, so they can be
+ * searched with bisection.
  */
 extern void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *loader_entries);
 
@@ -178,6 +178,8 @@ static PyObject *_Nuitka_Asyncgen_send(struct Nuitka_AsyncgenObject *asyncgen, P
             Nuitka_Frame_MarkAsExecuting(asyncgen->m_frame);
         }
 
+        NUITKA_PROFILE_ENTER(asyncgen->m_code_object);
+
         PyObject *yielded;
 
         if (asyncgen->m_yieldfrom == NULL) {
@@ -192,6 +194,8 @@ static PyObject *_Nuitka_Asyncgen_send(struct Nuitka_AsyncgenObject *asyncgen, P
             yielded = Nuitka_YieldFromAsyncgenInitial(asyncgen);
         }
 
+        NUITKA_PROFILE_LEAVE();
+
         if (asyncgen->m_frame) {
             Nuitka_Frame_MarkAsNotExecuting(asyncgen->m_frame);
         }
@@ -532,9 +536,8 @@ static PyObject *Nuitka_Asyncgen_athrow(struct Nuitka_AsyncgenObject *asyncgen,
     return Nuitka_AsyncgenAthrow_New(asyncgen, args);
 }
 
-#define MAX_ASYNCGEN_FREE_LIST_COUNT 100
 static struct Nuitka_AsyncgenObject *free_list_asyncgens = NULL;
-static int free_list_asyncgens_count = 0;
+struct Nuitka_FreeListInfo free_list_asyncgens_info = NUITKA_FREE_LIST_INFO("asyncgens", MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 // TODO: This might have to be finalize actually.
 static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
@@ -598,7 +601,7 @@ static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
     Py_DECREF(asyncgen->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_asyncgens, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgens, asyncgen);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -742,6 +745,8 @@ PyObject *Nuitka_Asyncgen_New(asyncgen_code code, PyObject *module, PyObject *na
     result->m_frame = NULL;
     result->m_code_object = code_object;
 
+    NUITKA_PROFILE_REGISTER_NAME(code_object, qualname);
+
     result->m_resume_frame = NULL;
 
     result->m_finalizer = NULL;
@@ -757,14 +762,15 @@ struct Nuitka_AsyncgenWrappedValueObject {
 };
 
 static struct Nuitka_AsyncgenWrappedValueObject *free_list_asyncgen_value_wrappers = NULL;
-static int free_list_asyncgen_value_wrappers_count = 0;
+struct Nuitka_FreeListInfo free_list_asyncgen_value_wrappers_info =
+    NUITKA_FREE_LIST_INFO("asyncgen_value_wrappers", MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 static void asyncgen_value_wrapper_tp_dealloc(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper) {
     Nuitka_GC_UnTrack((PyObject *)asyncgen_value_wrapper);
 
     Py_DECREF(asyncgen_value_wrapper->m_value);
 
-    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper);
 }
 
 static int asyncgen_value_wrapper_tp_traverse(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper,
@@ -892,7 +898,8 @@ static PyObject *Nuitka_Asyncgen_unwrap_value(struct Nuitka_AsyncgenObject *asyn
 }
 
 static struct Nuitka_AsyncgenAsendObject *free_list_asyncgen_asends = NULL;
-static int free_list_asyncgen_asends_count = 0;
+struct Nuitka_FreeListInfo free_list_asyncgen_asends_info =
+    NUITKA_FREE_LIST_INFO("asyncgen_asends", MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *asyncgen_asend) {
     Nuitka_GC_UnTrack(asyncgen_asend);
@@ -900,7 +907,7 @@ static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *a
     Py_DECREF(asyncgen_asend->m_gen);
     Py_DECREF(asyncgen_asend->m_sendval);
 
-    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend);
 }
 
 static int Nuitka_AsyncgenAsend_tp_traverse(struct Nuitka_AsyncgenAsendObject *asyncgen_asend, visitproc visit,
@@ -1082,7 +1089,8 @@ struct Nuitka_AsyncgenAthrowObject {
 };
 
 static struct Nuitka_AsyncgenAthrowObject *free_list_asyncgen_athrows = NULL;
-static int free_list_asyncgen_athrows_count = 0;
+struct Nuitka_FreeListInfo free_list_asyncgen_athrows_info =
+    NUITKA_FREE_LIST_INFO("asyncgen_athrows", MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow) {
     Nuitka_GC_UnTrack(asyncgen_athrow);
@@ -1090,7 +1098,7 @@ static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *as
     Py_DECREF(asyncgen_athrow->m_gen);
     Py_XDECREF(asyncgen_athrow->m_args);
 
-    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow);
 }
 
 static int Nuitka_AsyncgenAthrow_traverse(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow, visitproc visit,
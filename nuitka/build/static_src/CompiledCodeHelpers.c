@@ -29,6 +29,7 @@
 
 #include "HelpersBuiltin.c"
 #include "HelpersClasses.c"
+#include "HelpersDictionaries.c"
 #include "HelpersHeapStorage.c"
 #include "HelpersImport.c"
 #include "HelpersPathTools.c"
@@ -541,6 +542,138 @@ PyObject *BUILTIN_XRANGE3(PyObject *low, PyObject *high, PyObject *step) {
 #endif
 }
 
+/* Iteration over ranges by loops, see "rangeobjects.h" for details. */
+static bool getRangeIteratorArg(PyObject *value, long *result) {
+#if PYTHON_VERSION < 300
+    if (PyInt_CheckExact(value)) {
+        *result = PyInt_AS_LONG(value);
+
+        return true;
+    }
+#else
+    if (PyLong_CheckExact(value)) {
+        int overflow;
+        *result = PyLong_AsLongAndOverflow(value, &overflow);
+
+        return overflow == 0;
+    }
+#endif
+
+    return false;
+}
+
+bool MAKE_RANGE_ITERATOR(nuitka_range_iterator *target, PyObject *low, PyObject *high, PyObject *step, bool list) {
+    CHECK_OBJECT(high);
+
+    long low_value = 0;
+    long high_value;
+    long step_value = 1;
+
+    if (getRangeIteratorArg(high, &high_value) && (low == NULL || getRangeIteratorArg(low, &low_value)) &&
+        (step == NULL || getRangeIteratorArg(step, &step_value)) && step_value != 0) {
+        unsigned long count;
+
+        if (step_value > 0 && low_value < high_value) {
+            count = 1UL + ((unsigned long)high_value - 1UL - (unsigned long)low_value) / (unsigned long)step_value;
+        } else if (step_value < 0 && low_value > high_value) {
+            count =
+                1UL + ((unsigned long)low_value - 1UL - (unsigned long)high_value) / (0UL - (unsigned long)step_value);
+        } else {
+            count = 0UL;
+        }
+
+#if PYTHON_VERSION < 300
+        // The built-ins raise "OverflowError" for too many items.
+        if (count <= (unsigned long)LONG_MAX)
+#endif
+        {
+            SET_RANGE_ITERATOR_COUNTER(target, low_value, step_value, count);
+
+            return true;
+        }
+    }
+
+    // Not possible to count with C values, let the built-ins do it, which
+    // also gives their errors.
+    PyObject *range;
+
+#if PYTHON_VERSION < 300
+    if (list) {
+        if (low == NULL) {
+            range = BUILTIN_RANGE(high);
+        } else if (step == NULL) {
+            range = BUILTIN_RANGE2(low, high);
+        } else {
+            range = BUILTIN_RANGE3(low, high, step);
+        }
+    } else
+#endif
+    {
+        if (low == NULL) {
+            range = BUILTIN_XRANGE1(high);
+        } else if (step == NULL) {
+            range = BUILTIN_XRANGE2(low, high);
+        } else {
+            range = BUILTIN_XRANGE3(low, high, step);
+        }
+    }
+
+    if (unlikely(range == NULL)) {
+        return false;
+    }
+
+    PyObject *iterator = MAKE_ITERATOR(range);
+    Py_DECREF(range);
+
+    if (unlikely(iterator == NULL)) {
+        return false;
+    }
+
+    SET_RANGE_ITERATOR_OBJECT(target, iterator);
+
+    return true;
+}
+
+void ENFORCE_RANGE_ITERATOR_OBJECT(nuitka_range_iterator *value) {
+    assert(value->validity != NUITKA_RANGE_ITERATOR_UNASSIGNED);
+
+    if (value->validity == NUITKA_RANGE_ITERATOR_VALUE_VALID) {
+        // Range of the remaining values, and iterate over that.
+#if PYTHON_VERSION < 300
+        struct _rangeobject2 *range = (struct _rangeobject2 *)PyObject_New(struct _rangeobject2, &PyRange_Type);
+        assert(range != NULL);
+
+        range->start = value->current;
+        range->step = value->step;
+        range->len = (long)value->remaining;
+#else
+        PyObject *start = PyLong_FromLong(value->current);
+        PyObject *step = PyLong_FromLong(value->step);
+        PyObject *count = PyLong_FromUnsignedLong(value->remaining);
+
+        PyObject *span = PyNumber_Multiply(count, step);
+        Py_DECREF(count);
+        CHECK_OBJECT(span);
+
+        PyObject *stop = PyNumber_Add(start, span);
+        Py_DECREF(span);
+        CHECK_OBJECT(stop);
+
+        PyObject *range = BUILTIN_XRANGE3(start, stop, step);
+        Py_DECREF(start);
+        Py_DECREF(stop);
+        Py_DECREF(step);
+#endif
+        CHECK_OBJECT(range);
+
+        value->iterator = MAKE_ITERATOR((PyObject *)range);
+        Py_DECREF(range);
+        CHECK_OBJECT(value->iterator);
+
+        value->validity = NUITKA_RANGE_ITERATOR_OBJECT_VALID;
+    }
+}
+
 PyObject *BUILTIN_LEN(PyObject *value) {
     CHECK_OBJECT(value);
 
@@ -1878,6 +2011,8 @@ void _initBuiltinModule() {
 
 #include "HelpersCalling.c"
 
+#include "HelpersFreelists.c"
+
 PyObject *MAKE_RELATIVE_PATH(PyObject *relative) {
     CHECK_OBJECT(relative);
 
@@ -1950,6 +2085,10 @@ void _initBuiltinOriginalValues() {
 volatile int _Py_Ticker = _Py_CheckInterval;
 #endif
 
+#if PYTHON_VERSION >= 350
+_PyTime_t Nuitka_thread_switch_time = 0;
+#endif
+
 // Reverse operation mapping.
 static int const swapped_op[] = {Py_GT, Py_GE, Py_EQ, Py_NE, Py_LT, Py_LE};
 
@@ -1993,6 +2132,28 @@ void _initSlotIternext() {
 
 #include "HelpersOperationBinaryInplaceAdd.c"
 
+#include "HelpersOperationBinarySub.c"
+
+#include "HelpersOperationBinaryMul.c"
+
+#include "HelpersOperationBinaryDiv.c"
+
+#include "HelpersOperationBinaryFloorDiv.c"
+
+#include "HelpersOperationBinaryTrueDiv.c"
+
+#include "HelpersOperationBinaryRemainder.c"
+
+#include "HelpersOperationBinaryLShift.c"
+
+#include "HelpersOperationBinaryRShift.c"
+
+#include "HelpersOperationBinaryBitAnd.c"
+
+#include "HelpersOperationBinaryBitOr.c"
+
+#include "HelpersOperationBinaryBitXor.c"
+
 #include "HelpersConstantsBlob.c"
 
 #if _NUITKA_PROFILE
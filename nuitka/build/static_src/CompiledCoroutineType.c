@@ -289,6 +289,8 @@ static PyObject *_Nuitka_Coroutine_send(struct Nuitka_CoroutineObject *coroutine
             Nuitka_Frame_MarkAsExecuting(coroutine->m_frame);
         }
 
+        NUITKA_PROFILE_ENTER(coroutine->m_code_object);
+
         PyObject *yielded;
 
         if (coroutine->m_yieldfrom == NULL) {
@@ -303,6 +305,8 @@ static PyObject *_Nuitka_Coroutine_send(struct Nuitka_CoroutineObject *coroutine
             yielded = Nuitka_YieldFromCoroutineInitial(coroutine);
         }
 
+        NUITKA_PROFILE_LEAVE();
+
         if (coroutine->m_frame) {
             Nuitka_Frame_MarkAsNotExecuting(coroutine->m_frame);
         }
@@ -754,7 +758,8 @@ static long Nuitka_Coroutine_tp_traverse(PyObject *coroutine, visitproc visit, v
 }
 
 static struct Nuitka_CoroutineWrapperObject *free_list_coro_wrappers = NULL;
-static int free_list_coro_wrappers_count = 0;
+struct Nuitka_FreeListInfo free_list_coro_wrappers_info =
+    NUITKA_FREE_LIST_INFO("coro_wrappers", MAX_COROUTINE_FREE_LIST_COUNT);
 
 static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine) {
 #if _DEBUG_COROUTINE
@@ -779,9 +784,8 @@ static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine
     return (PyObject *)result;
 }
 
-#define MAX_COROUTINE_FREE_LIST_COUNT 100
 static struct Nuitka_CoroutineObject *free_list_coros = NULL;
-static int free_list_coros_count = 0;
+struct Nuitka_FreeListInfo free_list_coros_info = NUITKA_FREE_LIST_INFO("coros", MAX_COROUTINE_FREE_LIST_COUNT);
 
 static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine) {
     // Revive temporarily.
@@ -820,7 +824,7 @@ static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine
     Py_DECREF(coroutine->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_coros, coroutine, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coros, coroutine);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -915,7 +919,7 @@ static void Nuitka_CoroutineWrapper_tp_dealloc(struct Nuitka_CoroutineWrapperObj
     Py_DECREF(cw->m_coroutine);
     cw->m_coroutine = NULL;
 
-    releaseToFreeList(free_list_coro_wrappers, cw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coro_wrappers, cw);
 }
 
 static PyObject *Nuitka_CoroutineWrapper_tp_iternext(struct Nuitka_CoroutineWrapperObject *cw) {
@@ -1074,6 +1078,8 @@ PyObject *Nuitka_Coroutine_New(coroutine_code code, PyObject *module, PyObject *
     result->m_frame = NULL;
     result->m_code_object = code_object;
 
+    NUITKA_PROFILE_REGISTER_NAME(code_object, qualname);
+
     result->m_resume_frame = NULL;
 
 #if PYTHON_VERSION >= 370
@@ -1247,7 +1253,8 @@ static int Nuitka_AIterWrapper_traverse(struct Nuitka_AIterWrapper *aw, visitpro
 }
 
 static struct Nuitka_AIterWrapper *free_list_coroutine_aiter_wrappers = NULL;
-static int free_list_coroutine_aiter_wrappers_count = 0;
+struct Nuitka_FreeListInfo free_list_coroutine_aiter_wrappers_info =
+    NUITKA_FREE_LIST_INFO("coroutine_aiter_wrappers", MAX_COROUTINE_FREE_LIST_COUNT);
 
 static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Nuitka_GC_UnTrack((PyObject *)aw);
@@ -1255,7 +1262,7 @@ static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Py_DECREF(aw->aw_aiter);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw);
 }
 
 static PyAsyncMethods Nuitka_AIterWrapper_as_async = {
@@ -176,6 +176,30 @@ static PyObject *Nuitka_Frame_getlocals(struct Nuitka_FrameObject *frame, void *
                 }
                 break;
             }
+#if PYTHON_VERSION < 300
+            case NUITKA_TYPE_DESCRIPTION_ILONG: {
+                nuitka_ilong value;
+                memcpy(&value, t, sizeof(nuitka_ilong));
+                t += sizeof(nuitka_ilong);
+
+                if ((value.validity & NUITKA_ILONG_OBJECT_VALID) != 0) {
+                    PyDict_SetItem(result, *varnames, value.ilong_object);
+                }
+
+                break;
+            }
+#endif
+            case NUITKA_TYPE_DESCRIPTION_FLOAT: {
+                nuitka_float value;
+                memcpy(&value, t, sizeof(nuitka_float));
+                t += sizeof(nuitka_float);
+
+                if ((value.validity & NUITKA_FLOAT_OBJECT_VALID) != 0) {
+                    PyDict_SetItem(result, *varnames, value.float_object);
+                }
+
+                break;
+            }
             default:
                 assert(false);
             }
@@ -294,6 +318,26 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
             case NUITKA_TYPE_DESCRIPTION_BOOL: {
                 t += sizeof(int);
 
+                break;
+            }
+#if PYTHON_VERSION < 300
+            case NUITKA_TYPE_DESCRIPTION_ILONG: {
+                nuitka_ilong value;
+                memcpy(&value, t, sizeof(nuitka_ilong));
+                RELEASE_ILONG(&value);
+
+                t += sizeof(nuitka_ilong);
+
+                break;
+            }
+#endif
+            case NUITKA_TYPE_DESCRIPTION_FLOAT: {
+                nuitka_float value;
+                memcpy(&value, t, sizeof(nuitka_float));
+                RELEASE_FLOAT(&value);
+
+                t += sizeof(nuitka_float);
+
                 break;
             }
             default:
@@ -309,9 +353,8 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
 
 void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame) { Nuitka_Frame_tp_clear(frame); }
 
-#define MAX_FRAME_FREE_LIST_COUNT 100
 static struct Nuitka_FrameObject *free_list_frames = NULL;
-static int free_list_frames_count = 0;
+struct Nuitka_FreeListInfo free_list_frames_info = NUITKA_FREE_LIST_INFO("frames", MAX_FRAME_FREE_LIST_COUNT);
 
 static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -339,7 +382,7 @@ static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 
     Nuitka_Frame_tp_clear(nuitka_frame);
 
-    releaseToFreeList(free_list_frames, nuitka_frame, MAX_FRAME_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_frames, nuitka_frame);
 
 #ifndef __NUITKA_NO_ASSERT__
     PyThreadState *tstate = PyThreadState_GET();
@@ -691,6 +734,38 @@ void Nuitka_Frame_AttachLocals(struct Nuitka_FrameObject *frame, char const *typ
             t += sizeof(value);
             break;
         }
+#if PYTHON_VERSION < 300
+        case NUITKA_TYPE_DESCRIPTION_ILONG: {
+            nuitka_ilong value = va_arg(ap, nuitka_ilong);
+
+            // The frame keeps its own reference to the object, creating it now
+            // if only the C value was present.
+            if ((value.validity & NUITKA_ILONG_OBJECT_VALID) != 0) {
+                Py_INCREF(value.ilong_object);
+            } else if (value.validity != NUITKA_ILONG_UNASSIGNED) {
+                ENFORCE_ILONG_OBJECT_VALUE(&value);
+            }
+
+            memcpy(t, &value, sizeof(nuitka_ilong));
+            t += sizeof(nuitka_ilong);
+            break;
+        }
+#endif
+        case NUITKA_TYPE_DESCRIPTION_FLOAT: {
+            nuitka_float value = va_arg(ap, nuitka_float);
+
+            // The frame keeps its own reference to the object, creating it now
+            // if only the C value was present.
+            if ((value.validity & NUITKA_FLOAT_OBJECT_VALID) != 0) {
+                Py_INCREF(value.float_object);
+            } else if (value.validity != NUITKA_FLOAT_UNASSIGNED) {
+                ENFORCE_FLOAT_OBJECT_VALUE(&value);
+            }
+
+            memcpy(t, &value, sizeof(nuitka_float));
+            t += sizeof(nuitka_float);
+            break;
+        }
         default:
             assert(false);
         }
@@ -455,9 +455,8 @@ static PyObject *Nuitka_Function_reduce(struct Nuitka_FunctionObject *function)
     return result;
 }
 
-#define MAX_FUNCTION_FREE_LIST_COUNT 100
 static struct Nuitka_FunctionObject *free_list_functions = NULL;
-static int free_list_functions_count = 0;
+struct Nuitka_FreeListInfo free_list_functions_info = NUITKA_FREE_LIST_INFO("functions", MAX_FUNCTION_FREE_LIST_COUNT);
 
 static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -499,7 +498,7 @@ static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
     }
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_functions, function, MAX_FUNCTION_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_functions, function);
 
 #ifndef __NUITKA_NO_ASSERT__
     PyThreadState *tstate = PyThreadState_GET();
@@ -627,6 +626,9 @@ struct Nuitka_FunctionObject *Nuitka_Function_New(function_impl_code c_code, PyO
 #endif
 
     result->m_code_object = code_object;
+#if PYTHON_VERSION >= 300
+    NUITKA_PROFILE_REGISTER_NAME(code_object, qualname);
+#endif
     result->m_args_positional_count = code_object->co_argcount;
     result->m_args_keywords_count = result->m_args_positional_count;
 #if PYTHON_VERSION >= 300
@@ -1787,6 +1789,159 @@ PyObject *Nuitka_CallFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *f
     return function->m_c_code(function, python_pars);
 }
 
+// Look up the parameter index of a keyword argument name, trying identity
+// first, as the names are normally interned constants on both sides.
+static Py_ssize_t findKeywordParameterIndex(struct Nuitka_FunctionObject const *function, PyObject *key) {
+    Py_ssize_t keywords_count = function->m_args_keywords_count;
+    PyObject **varnames = function->m_varnames;
+
+    for (Py_ssize_t i = 0; i < keywords_count; i++) {
+        if (varnames[i] == key) {
+            return i;
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < keywords_count; i++) {
+        if (RICH_COMPARE_BOOL_EQ_OBJECT_OBJECT_NORECURSE(varnames[i], key)) {
+            return i;
+        }
+    }
+
+    return -1;
+}
+
+// The slow path of vector calls, creating the keyword dictionary after all.
+static bool parseArgumentsVectorcallDict(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
+                                         PyObject **args, Py_ssize_t args_size, PyObject *kw_names) {
+    Py_ssize_t kw_size = PyTuple_GET_SIZE(kw_names);
+    PyObject *kw = _PyDict_NewPresized(kw_size);
+
+    for (Py_ssize_t i = 0; i < kw_size; i++) {
+        int res = PyDict_SetItem(kw, PyTuple_GET_ITEM(kw_names, i), args[args_size + i]);
+
+        if (unlikely(res != 0)) {
+            Py_DECREF(kw);
+            return false;
+        }
+    }
+
+    bool result = parseArgumentsFull(function, python_pars, args, args_size, kw);
+
+    Py_DECREF(kw);
+
+    return result;
+}
+
+// Parse arguments given as a C array, with the values of keyword arguments
+// following the positional ones, and their names given as a tuple. This is
+// what call sites with only constant keyword argument names use, so no
+// tuple or dictionary needs to be created for them.
+static bool parseArgumentsVectorcall(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
+                                     PyObject **args, Py_ssize_t args_size, PyObject *kw_names) {
+    Py_ssize_t kw_size = PyTuple_GET_SIZE(kw_names);
+    PyObject **kw_values = args + args_size;
+    bool result;
+#if PYTHON_VERSION >= 300
+    Py_ssize_t kw_only_found;
+    bool kw_only_error;
+#endif
+
+    // Star dict parameters need a dictionary anyway, and the error exits for
+    // no arguments allowed are better to be produced by the full variant.
+    if (function->m_args_star_dict_index != -1 || function->m_args_keywords_count == 0) {
+        return parseArgumentsVectorcallDict(function, python_pars, args, args_size, kw_names);
+    }
+
+#if PYTHON_VERSION >= 300
+    kw_only_found = 0;
+#endif
+
+    for (Py_ssize_t i = 0; i < kw_size; i++) {
+        Py_ssize_t index = findKeywordParameterIndex(function, PyTuple_GET_ITEM(kw_names, i));
+
+        // Unexpected keyword arguments, let the full variant raise the error.
+        if (unlikely(index == -1)) {
+            releaseParameters(function, python_pars);
+            memset(python_pars, 0, function->m_args_overall_count * sizeof(PyObject *));
+
+            return parseArgumentsVectorcallDict(function, python_pars, args, args_size, kw_names);
+        }
+
+        // The names are compile time constants, and cannot repeat.
+        assert(python_pars[index] == NULL);
+
+        python_pars[index] = kw_values[i];
+        Py_INCREF(python_pars[index]);
+
+#if PYTHON_VERSION >= 300
+        if (index >= function->m_args_positional_count) {
+            kw_only_found += 1;
+        }
+#endif
+    }
+
+#if PYTHON_VERSION < 270
+    result = handleArgumentsPlain(function, python_pars, NULL, args, args_size, kw_size, kw_size);
+#elif PYTHON_VERSION < 300
+    result = handleArgumentsPlain(function, python_pars, NULL, args, args_size, kw_size);
+#else
+    result = handleArgumentsPlain(function, python_pars, NULL, args, args_size, kw_size, kw_only_found);
+#endif
+
+    if (result == false)
+        goto error_exit;
+
+#if PYTHON_VERSION >= 300
+
+    // For Python3.3 the keyword only errors are all reported at once.
+    kw_only_error = false;
+
+    for (Py_ssize_t i = function->m_args_positional_count; i < function->m_args_keywords_count; i++) {
+        if (python_pars[i] == NULL) {
+            PyObject *arg_name = function->m_varnames[i];
+
+            if (function->m_kwdefaults != NULL) {
+                python_pars[i] = PyDict_GetItem(function->m_kwdefaults, arg_name);
+            }
+
+            if (python_pars[i] == NULL) {
+                kw_only_error = true;
+            } else {
+                Py_INCREF(python_pars[i]);
+            }
+        }
+    }
+
+    if (unlikely(kw_only_error)) {
+        formatErrorTooFewKwOnlyArguments(function, &python_pars[function->m_args_positional_count]);
+
+        goto error_exit;
+    }
+
+#endif
+
+    return true;
+
+error_exit:
+
+    releaseParameters(function, python_pars);
+    return false;
+}
+
+PyObject *Nuitka_CallFunctionVectorcall(struct Nuitka_FunctionObject const *function, PyObject **args,
+                                        Py_ssize_t args_size, PyObject *kw_names) {
+#ifdef _MSC_VER
+    PyObject **python_pars = (PyObject **)_alloca(sizeof(PyObject *) * function->m_args_overall_count);
+#else
+    PyObject *python_pars[function->m_args_overall_count];
+#endif
+    memset(python_pars, 0, function->m_args_overall_count * sizeof(PyObject *));
+
+    if (!parseArgumentsVectorcall(function, python_pars, args, args_size, kw_names))
+        return NULL;
+    return function->m_c_code(function, python_pars);
+}
+
 PyObject *Nuitka_CallMethodFunctionNoArgs(struct Nuitka_FunctionObject const *function, PyObject *object) {
 #ifdef _MSC_VER
     PyObject **python_pars = (PyObject **)_alloca(sizeof(PyObject *) * function->m_args_overall_count);
@@ -430,6 +430,8 @@ static PyObject *Nuitka_Generator_send2(struct Nuitka_GeneratorObject *generator
             Nuitka_Frame_MarkAsExecuting(generator->m_frame);
         }
 
+        NUITKA_PROFILE_ENTER(generator->m_code_object);
+
 #if PYTHON_VERSION >= 300
         PyObject *yielded;
 
@@ -449,6 +451,8 @@ static PyObject *Nuitka_Generator_send2(struct Nuitka_GeneratorObject *generator
             yielded = Nuitka_YieldFromGeneratorInitial(generator);
         }
 #endif
+
+        NUITKA_PROFILE_LEAVE();
         if (generator->m_frame) {
             Nuitka_Frame_MarkAsNotExecuting(generator->m_frame);
         }
@@ -802,9 +806,9 @@ static void Nuitka_Generator_tp_finalizer(struct Nuitka_GeneratorObject *generat
 
 #endif
 
-#define MAX_GENERATOR_FREE_LIST_COUNT 100
 static struct Nuitka_GeneratorObject *free_list_generators = NULL;
-static int free_list_generators_count = 0;
+struct Nuitka_FreeListInfo free_list_generators_info =
+    NUITKA_FREE_LIST_INFO("generators", MAX_GENERATOR_FREE_LIST_COUNT);
 
 static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator) {
     // Revive temporarily.
@@ -854,7 +858,7 @@ static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator
 #endif
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_generators, generator, MAX_GENERATOR_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_generators, generator);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -1100,6 +1104,10 @@ PyObject *Nuitka_Generator_New(generator_code code, PyObject *module, PyObject *
     result->m_frame = NULL;
     result->m_code_object = code_object;
 
+#if PYTHON_VERSION >= 350
+    NUITKA_PROFILE_REGISTER_NAME(code_object, qualname);
+#endif
+
     Nuitka_GC_Track(result);
     return (PyObject *)result;
 }
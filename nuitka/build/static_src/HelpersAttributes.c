@@ -16,7 +16,6 @@
 //     limitations under the License.
 //
 
-
 #if PYTHON_VERSION < 300
 PyObject *FIND_ATTRIBUTE_IN_CLASS(PyClassObject *klass, PyObject *attr_name) {
     CHECK_OBJECT(klass);
@@ -103,106 +102,113 @@ static PyObject *LOOKUP_INSTANCE(PyObject *source, PyObject *attr_name) {
 }
 #endif
 
-PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name) {
-    /* Note: There are 2 specializations of this function, that need to be
-     * updated in line with this: LOOKUP_ATTRIBUTE_[DICT|CLASS]_SLOT
-     */
-
-    CHECK_OBJECT(source);
-    CHECK_OBJECT(attr_name);
-
-    PyTypeObject *type = Py_TYPE(source);
-
-    if (type->tp_getattro == PyObject_GenericGetAttr) {
-        // Unfortunately this is required, although of cause rarely necessary.
-        if (unlikely(type->tp_dict == NULL)) {
-            if (unlikely(PyType_Ready(type) < 0)) {
-                return NULL;
-            }
-        }
-
-        PyObject *descr = _PyType_Lookup(type, attr_name);
-        descrgetfunc func = NULL;
+// Attribute lookup for types using the generic attribute lookup, with the
+// result of "_PyType_Lookup" for the attribute name already given.
+static PyObject *LOOKUP_ATTRIBUTE_GENERIC(PyObject *source, PyObject *attr_name, PyTypeObject *type, PyObject *descr) {
+    descrgetfunc func = NULL;
 
-        if (descr != NULL) {
-            Py_INCREF(descr);
+    if (descr != NULL) {
+        Py_INCREF(descr);
 
 #if PYTHON_VERSION < 300
-            if (PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)) {
+        if (PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)) {
 #endif
-                func = Py_TYPE(descr)->tp_descr_get;
+            func = Py_TYPE(descr)->tp_descr_get;
 
-                if (func != NULL && PyDescr_IsData(descr)) {
-                    PyObject *result = func(descr, source, (PyObject *)type);
-                    Py_DECREF(descr);
+            if (func != NULL && PyDescr_IsData(descr)) {
+                PyObject *result = func(descr, source, (PyObject *)type);
+                Py_DECREF(descr);
 
-                    return result;
-                }
-#if PYTHON_VERSION < 300
+                return result;
             }
-#endif
+#if PYTHON_VERSION < 300
         }
+#endif
+    }
 
-        Py_ssize_t dictoffset = type->tp_dictoffset;
-        PyObject *dict = NULL;
+    Py_ssize_t dictoffset = type->tp_dictoffset;
+    PyObject *dict = NULL;
 
-        if (dictoffset != 0) {
-            // Negative dictionary offsets have special meaning.
-            if (dictoffset < 0) {
-                Py_ssize_t tsize;
-                size_t size;
+    if (dictoffset != 0) {
+        // Negative dictionary offsets have special meaning.
+        if (dictoffset < 0) {
+            Py_ssize_t tsize;
+            size_t size;
 
-                tsize = ((PyVarObject *)source)->ob_size;
-                if (tsize < 0)
-                    tsize = -tsize;
-                size = _PyObject_VAR_SIZE(type, tsize);
+            tsize = ((PyVarObject *)source)->ob_size;
+            if (tsize < 0)
+                tsize = -tsize;
+            size = _PyObject_VAR_SIZE(type, tsize);
 
-                dictoffset += (long)size;
-            }
-
-            PyObject **dictptr = (PyObject **)((char *)source + dictoffset);
-            dict = *dictptr;
+            dictoffset += (long)size;
         }
 
-        if (dict != NULL) {
-            CHECK_OBJECT(dict);
-
-            Py_INCREF(dict);
+        PyObject **dictptr = (PyObject **)((char *)source + dictoffset);
+        dict = *dictptr;
+    }
 
-            PyObject *result = PyDict_GetItem(dict, attr_name);
+    if (dict != NULL) {
+        CHECK_OBJECT(dict);
 
-            if (result != NULL) {
-                Py_INCREF(result);
-                Py_XDECREF(descr);
-                Py_DECREF(dict);
+        Py_INCREF(dict);
 
-                CHECK_OBJECT(result);
-                return result;
-            }
+        PyObject *result = PyDict_GetItem(dict, attr_name);
 
+        if (result != NULL) {
+            Py_INCREF(result);
+            Py_XDECREF(descr);
             Py_DECREF(dict);
-        }
-
-        if (func != NULL) {
-            PyObject *result = func(descr, source, (PyObject *)type);
-            Py_DECREF(descr);
 
             CHECK_OBJECT(result);
             return result;
         }
 
-        if (descr != NULL) {
-            CHECK_OBJECT(descr);
-            return descr;
-        }
+        Py_DECREF(dict);
+    }
+
+    if (func != NULL) {
+        PyObject *result = func(descr, source, (PyObject *)type);
+        Py_DECREF(descr);
+
+        CHECK_OBJECT(result);
+        return result;
+    }
+
+    if (descr != NULL) {
+        CHECK_OBJECT(descr);
+        return descr;
+    }
 
 #if PYTHON_VERSION < 300
-        PyErr_Format(PyExc_AttributeError, "'%s' object has no attribute '%s'", type->tp_name,
-                     PyString_AS_STRING(attr_name));
+    PyErr_Format(PyExc_AttributeError, "'%s' object has no attribute '%s'", type->tp_name,
+                 PyString_AS_STRING(attr_name));
 #else
-        PyErr_Format(PyExc_AttributeError, "'%s' object has no attribute '%U'", type->tp_name, attr_name);
+    PyErr_Format(PyExc_AttributeError, "'%s' object has no attribute '%U'", type->tp_name, attr_name);
 #endif
-        return NULL;
+    return NULL;
+}
+
+PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name) {
+    /* Note: There are 2 specializations of this function, that need to be
+     * updated in line with this: LOOKUP_ATTRIBUTE_[DICT|CLASS]_SLOT
+     */
+
+    CHECK_OBJECT(source);
+    CHECK_OBJECT(attr_name);
+
+    PyTypeObject *type = Py_TYPE(source);
+
+    if (type->tp_getattro == PyObject_GenericGetAttr) {
+        // Unfortunately this is required, although of cause rarely necessary.
+        if (unlikely(type->tp_dict == NULL)) {
+            if (unlikely(PyType_Ready(type) < 0)) {
+                return NULL;
+            }
+        }
+
+        PyObject *descr = _PyType_Lookup(type, attr_name);
+
+        return LOOKUP_ATTRIBUTE_GENERIC(source, attr_name, type, descr);
     }
 #if PYTHON_VERSION < 300
     else if (type->tp_getattro == PyInstance_Type.tp_getattro) {
@@ -230,6 +236,45 @@ PyObject *LOOKUP_ATTRIBUTE(PyObject *source, PyObject *attr_name) {
     }
 }
 
+PyObject *LOOKUP_ATTRIBUTE_CACHED(PyObject *source, PyObject *attr_name, struct Nuitka_AttributeLookupCache *cache) {
+    CHECK_OBJECT(source);
+    CHECK_OBJECT(attr_name);
+
+    PyTypeObject *type = Py_TYPE(source);
+
+    // Monomorphic sites see the same type over and over, and while its version
+    // tag is valid and unchanged, neither it nor its bases were modified, so
+    // the type lookup result is still valid, and owned by the type.
+    if (likely(type == cache->type && type->tp_version_tag == cache->version_tag &&
+               PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG))) {
+        return LOOKUP_ATTRIBUTE_GENERIC(source, attr_name, type, cache->descr);
+    }
+
+    if (type->tp_getattro != PyObject_GenericGetAttr) {
+        return LOOKUP_ATTRIBUTE(source, attr_name);
+    }
+
+    if (unlikely(type->tp_dict == NULL)) {
+        if (unlikely(PyType_Ready(type) < 0)) {
+            return NULL;
+        }
+    }
+
+    PyObject *descr = _PyType_Lookup(type, attr_name);
+
+    // The type lookup assigns a version tag if possible, otherwise there is
+    // nothing that would tell us about changes, and we cannot cache.
+    if (PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)) {
+        cache->type = type;
+        cache->version_tag = type->tp_version_tag;
+        cache->descr = descr;
+    } else {
+        cache->type = NULL;
+    }
+
+    return LOOKUP_ATTRIBUTE_GENERIC(source, attr_name, type, descr);
+}
+
 PyObject *LOOKUP_ATTRIBUTE_DICT_SLOT(PyObject *source) {
     CHECK_OBJECT(source);
 
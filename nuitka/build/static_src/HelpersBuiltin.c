@@ -483,6 +483,545 @@ PyObject *BUILTIN_ITER2(PyObject *callable, PyObject *sentinel) {
     return (PyObject *)result;
 }
 
+/** The "enumerate" built-in.
+ *
+ * The "enumobject" is private to CPython, we define it here for ourselves,
+ * so it can be created without going through a call of the type.
+ *
+ **/
+
+// From CPython:
+typedef struct {
+    PyObject_HEAD Py_ssize_t en_index;
+    PyObject *en_sit;
+    PyObject *en_result;
+    PyObject *en_longindex;
+} enumobject;
+
+PyObject *BUILTIN_ENUMERATE(PyObject *iterable, PyObject *start) {
+    CHECK_OBJECT(iterable);
+
+    enumobject *result = (enumobject *)PyEnum_Type.tp_alloc(&PyEnum_Type, 0);
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    if (start != NULL) {
+        CHECK_OBJECT(start);
+
+        PyObject *index = PyNumber_Index(start);
+
+        if (unlikely(index == NULL)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+
+#if PYTHON_VERSION < 300
+        result->en_index = PyInt_AsSsize_t(index);
+#else
+        result->en_index = PyLong_AsSsize_t(index);
+#endif
+
+        if (result->en_index == -1 && ERROR_OCCURRED()) {
+            CLEAR_ERROR_OCCURRED();
+
+            result->en_index = PY_SSIZE_T_MAX;
+            result->en_longindex = index;
+        } else {
+            result->en_longindex = NULL;
+            Py_DECREF(index);
+        }
+    } else {
+        result->en_index = 0;
+        result->en_longindex = NULL;
+    }
+
+    result->en_sit = MAKE_ITERATOR(iterable);
+
+    if (unlikely(result->en_sit == NULL)) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    result->en_result = PyTuple_Pack(2, Py_None, Py_None);
+
+    if (unlikely(result->en_result == NULL)) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    return (PyObject *)result;
+}
+
+/** The "reversed" built-in.
+ *
+ * Values without "__reversed__" that are sequences, use a "reversedobject"
+ * that is private to CPython, we define it here for ourselves, and create it
+ * directly for tuples and strings, which are the most common ones.
+ *
+ **/
+
+// From CPython:
+typedef struct {
+    PyObject_HEAD Py_ssize_t index;
+    PyObject *seq;
+} reversedobject;
+
+PyObject *BUILTIN_REVERSED(PyObject *value) {
+    CHECK_OBJECT(value);
+
+#if PYTHON_VERSION < 300
+    if (PyTuple_CheckExact(value) || PyString_CheckExact(value) || PyUnicode_CheckExact(value)) {
+#else
+    if (PyTuple_CheckExact(value) || PyUnicode_CheckExact(value) || PyBytes_CheckExact(value)) {
+#endif
+        Py_ssize_t size = PySequence_Size(value);
+
+        if (unlikely(size == -1)) {
+            return NULL;
+        }
+
+        reversedobject *result = (reversedobject *)PyReversed_Type.tp_alloc(&PyReversed_Type, 0);
+
+        if (unlikely(result == NULL)) {
+            return NULL;
+        }
+
+        result->index = size - 1;
+        result->seq = value;
+        Py_INCREF(value);
+
+        return (PyObject *)result;
+    }
+
+    PyObject *pos_args = PyTuple_New(1);
+    PyTuple_SET_ITEM(pos_args, 0, value);
+    Py_INCREF(value);
+
+    PyObject *result = PyReversed_Type.tp_new(&PyReversed_Type, pos_args, NULL);
+
+    Py_DECREF(pos_args);
+
+    return result;
+}
+
+/** The "sorted" built-in.
+ *
+ * Makes a list and sorts it, without the need for a method call and keyword
+ * arguments, unless these are given.
+ *
+ **/
+
+extern PyObject *const_str_plain_sort;
+
+#if PYTHON_VERSION < 300
+PyObject *BUILTIN_SORTED(PyObject *iterable, PyObject *cmp, PyObject *key, PyObject *reverse)
+#else
+PyObject *BUILTIN_SORTED(PyObject *iterable, PyObject *key, PyObject *reverse)
+#endif
+{
+    CHECK_OBJECT(iterable);
+
+    PyObject *result = PySequence_List(iterable);
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+#if PYTHON_VERSION < 300
+    if (cmp == NULL && key == NULL && reverse == NULL)
+#else
+    if (key == NULL && reverse == NULL)
+#endif
+    {
+        if (unlikely(PyList_Sort(result) == -1)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+
+        return result;
+    }
+
+    PyObject *kw_args = PyDict_New();
+
+#if PYTHON_VERSION < 300
+    if (cmp != NULL) {
+        PyDict_SetItemString(kw_args, "cmp", cmp);
+    }
+#endif
+    if (key != NULL) {
+        PyDict_SetItemString(kw_args, "key", key);
+    }
+    if (reverse != NULL) {
+        PyDict_SetItemString(kw_args, "reverse", reverse);
+    }
+
+    PyObject *sort_method = LOOKUP_ATTRIBUTE(result, const_str_plain_sort);
+
+    if (unlikely(sort_method == NULL)) {
+        Py_DECREF(kw_args);
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    PyObject *sort_result = CALL_FUNCTION(sort_method, const_tuple_empty, kw_args);
+
+    Py_DECREF(sort_method);
+    Py_DECREF(kw_args);
+
+    if (unlikely(sort_result == NULL)) {
+        Py_DECREF(result);
+        return NULL;
+    }
+
+    Py_DECREF(sort_result);
+
+    return result;
+}
+
+/** The "zip" built-in.
+ *
+ * For Python2, it creates a list, and the built-in is called, for Python3
+ * it's an iterator type, that we create without calling the type.
+ *
+ **/
+
+#if PYTHON_VERSION < 300
+NUITKA_DEFINE_BUILTIN(zip);
+#endif
+
+PyObject *BUILTIN_ZIP(PyObject *iterables) {
+    CHECK_OBJECT(iterables);
+    assert(PyTuple_CheckExact(iterables));
+
+#if PYTHON_VERSION < 300
+    NUITKA_ASSIGN_BUILTIN(zip);
+
+    return CALL_FUNCTION(NUITKA_ACCESS_BUILTIN(zip), iterables, NULL);
+#else
+    return PyZip_Type.tp_new(&PyZip_Type, iterables, NULL);
+#endif
+}
+
+/** The "min" and "max" built-ins.
+ *
+ * With two arguments, these are a single comparison of the values, which
+ * is done directly for known types. With one argument, it is iterated and
+ * compared like the built-in does, but without calling it.
+ *
+ * The "key" and "default" arguments are not supported by these helpers.
+ **/
+
+#if PYTHON_VERSION < 300
+PyObject *BUILTIN_MIN2_INT_INT(PyObject *left, PyObject *right) {
+    PyObject *result = RICH_COMPARE_BOOL_LT_INT_INT(right, left) ? right : left;
+
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *BUILTIN_MAX2_INT_INT(PyObject *left, PyObject *right) {
+    PyObject *result = RICH_COMPARE_BOOL_GT_INT_INT(right, left) ? right : left;
+
+    Py_INCREF(result);
+    return result;
+}
+#endif
+
+PyObject *BUILTIN_MIN2_FLOAT_FLOAT(PyObject *left, PyObject *right) {
+    assert(PyFloat_CheckExact(left));
+    assert(PyFloat_CheckExact(right));
+
+    PyObject *result = PyFloat_AS_DOUBLE(right) < PyFloat_AS_DOUBLE(left) ? right : left;
+
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *BUILTIN_MAX2_FLOAT_FLOAT(PyObject *left, PyObject *right) {
+    assert(PyFloat_CheckExact(left));
+    assert(PyFloat_CheckExact(right));
+
+    PyObject *result = PyFloat_AS_DOUBLE(right) > PyFloat_AS_DOUBLE(left) ? right : left;
+
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *BUILTIN_MIN2_OBJECT_OBJECT(PyObject *left, PyObject *right) {
+    CHECK_OBJECT(left);
+    CHECK_OBJECT(right);
+
+    // Values of the same number type, if not known at compile time, are
+    // still common.
+#if PYTHON_VERSION < 300
+    if (PyInt_CheckExact(left) && PyInt_CheckExact(right)) {
+        return BUILTIN_MIN2_INT_INT(left, right);
+    }
+#endif
+    if (PyFloat_CheckExact(left) && PyFloat_CheckExact(right)) {
+        return BUILTIN_MIN2_FLOAT_FLOAT(left, right);
+    }
+
+    int res = RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(right, left);
+
+    if (unlikely(res == -1)) {
+        return NULL;
+    }
+
+    PyObject *result = res ? right : left;
+
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *BUILTIN_MAX2_OBJECT_OBJECT(PyObject *left, PyObject *right) {
+    CHECK_OBJECT(left);
+    CHECK_OBJECT(right);
+
+    // Values of the same number type, if not known at compile time, are
+    // still common.
+#if PYTHON_VERSION < 300
+    if (PyInt_CheckExact(left) && PyInt_CheckExact(right)) {
+        return BUILTIN_MAX2_INT_INT(left, right);
+    }
+#endif
+    if (PyFloat_CheckExact(left) && PyFloat_CheckExact(right)) {
+        return BUILTIN_MAX2_FLOAT_FLOAT(left, right);
+    }
+
+    int res = RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(right, left);
+
+    if (unlikely(res == -1)) {
+        return NULL;
+    }
+
+    PyObject *result = res ? right : left;
+
+    Py_INCREF(result);
+    return result;
+}
+
+static PyObject *_BUILTIN_MINMAX1(PyObject *iterable, int op, char const *name) {
+    CHECK_OBJECT(iterable);
+
+    PyObject *iterator = MAKE_ITERATOR(iterable);
+
+    if (unlikely(iterator == NULL)) {
+        return NULL;
+    }
+
+    PyObject *result = NULL;
+
+    for (;;) {
+        PyObject *value = ITERATOR_NEXT(iterator);
+
+        if (value == NULL) {
+            break;
+        }
+
+        if (result == NULL) {
+            result = value;
+            continue;
+        }
+
+        int res = op == Py_LT ? RICH_COMPARE_BOOL_LT_OBJECT_OBJECT(value, result)
+                              : RICH_COMPARE_BOOL_GT_OBJECT_OBJECT(value, result);
+
+        if (unlikely(res == -1)) {
+            Py_DECREF(value);
+            Py_DECREF(result);
+            Py_DECREF(iterator);
+
+            return NULL;
+        }
+
+        if (res) {
+            Py_DECREF(result);
+            result = value;
+        } else {
+            Py_DECREF(value);
+        }
+    }
+
+    Py_DECREF(iterator);
+
+    if (unlikely(!CHECK_AND_CLEAR_STOP_ITERATION_OCCURRED())) {
+        Py_XDECREF(result);
+
+        return NULL;
+    }
+
+    if (unlikely(result == NULL)) {
+        PyErr_Format(PyExc_ValueError, "%s() arg is an empty sequence", name);
+    }
+
+    return result;
+}
+
+PyObject *BUILTIN_MIN1(PyObject *iterable) { return _BUILTIN_MINMAX1(iterable, Py_LT, "min"); }
+
+PyObject *BUILTIN_MAX1(PyObject *iterable) { return _BUILTIN_MINMAX1(iterable, Py_GT, "max"); }
+
+/** The "any" and "all" built-ins.
+ *
+ * The iteration stops at the first value, that decides the result.
+ **/
+
+static PyObject *_BUILTIN_ANY_ALL(PyObject *iterable, int decisive) {
+    CHECK_OBJECT(iterable);
+
+    PyObject *iterator = MAKE_ITERATOR(iterable);
+
+    if (unlikely(iterator == NULL)) {
+        return NULL;
+    }
+
+    for (;;) {
+        PyObject *value = ITERATOR_NEXT(iterator);
+
+        if (value == NULL) {
+            break;
+        }
+
+        int res = CHECK_IF_TRUE(value);
+        Py_DECREF(value);
+
+        if (unlikely(res == -1)) {
+            Py_DECREF(iterator);
+            return NULL;
+        }
+
+        if (res == decisive) {
+            Py_DECREF(iterator);
+
+            PyObject *result = BOOL_FROM(decisive == 1);
+            Py_INCREF(result);
+            return result;
+        }
+    }
+
+    Py_DECREF(iterator);
+
+    if (unlikely(!CHECK_AND_CLEAR_STOP_ITERATION_OCCURRED())) {
+        return NULL;
+    }
+
+    PyObject *result = BOOL_FROM(decisive == 0);
+    Py_INCREF(result);
+    return result;
+}
+
+PyObject *BUILTIN_ANY(PyObject *iterable) { return _BUILTIN_ANY_ALL(iterable, 1); }
+
+PyObject *BUILTIN_ALL(PyObject *iterable) { return _BUILTIN_ANY_ALL(iterable, 0); }
+
+/** The "round" built-in.
+ *
+ * For Python3, rounding a "float" to an "int" is done directly, as is the
+ * trivial case of an "int", otherwise the built-in is called.
+ **/
+
+NUITKA_DEFINE_BUILTIN(round);
+
+PyObject *BUILTIN_ROUND(PyObject *number, PyObject *ndigits) {
+    CHECK_OBJECT(number);
+
+#if PYTHON_VERSION >= 300
+    if (ndigits == NULL) {
+        if (PyFloat_CheckExact(number)) {
+            double x = PyFloat_AS_DOUBLE(number);
+            double rounded = round(x);
+
+            // Round half to even, like "float.__round__" does.
+            if (fabs(x - rounded) == 0.5) {
+                rounded = 2.0 * round(x / 2.0);
+            }
+
+            return PyLong_FromDouble(rounded);
+        } else if (PyLong_CheckExact(number)) {
+            Py_INCREF(number);
+            return number;
+        }
+    }
+#endif
+
+    NUITKA_ASSIGN_BUILTIN(round);
+
+    if (ndigits == NULL) {
+        return CALL_FUNCTION_WITH_ARGS1(NUITKA_ACCESS_BUILTIN(round), &number);
+    } else {
+        PyObject *args[] = {number, ndigits};
+
+        return CALL_FUNCTION_WITH_ARGS2(NUITKA_ACCESS_BUILTIN(round), args);
+    }
+}
+
+/** The "map" and "filter" built-ins.
+ *
+ * For Python2, these create containers, and the built-in is called, for
+ * Python3 these are iterator types, that we create without calling the type.
+ **/
+
+#if PYTHON_VERSION < 300
+NUITKA_DEFINE_BUILTIN(map);
+NUITKA_DEFINE_BUILTIN(filter);
+#endif
+
+PyObject *BUILTIN_MAP(PyObject *function, PyObject *iterables) {
+    CHECK_OBJECT(function);
+    CHECK_OBJECT(iterables);
+    assert(PyTuple_CheckExact(iterables));
+
+    Py_ssize_t size = PyTuple_GET_SIZE(iterables);
+
+    PyObject *args = PyTuple_New(size + 1);
+
+    Py_INCREF(function);
+    PyTuple_SET_ITEM(args, 0, function);
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *iterable = PyTuple_GET_ITEM(iterables, i);
+
+        Py_INCREF(iterable);
+        PyTuple_SET_ITEM(args, i + 1, iterable);
+    }
+
+#if PYTHON_VERSION < 300
+    NUITKA_ASSIGN_BUILTIN(map);
+
+    PyObject *result = CALL_FUNCTION(NUITKA_ACCESS_BUILTIN(map), args, NULL);
+#else
+    PyObject *result = PyMap_Type.tp_new(&PyMap_Type, args, NULL);
+#endif
+
+    Py_DECREF(args);
+
+    return result;
+}
+
+PyObject *BUILTIN_FILTER(PyObject *function, PyObject *iterable) {
+    CHECK_OBJECT(function);
+    CHECK_OBJECT(iterable);
+
+#if PYTHON_VERSION < 300
+    NUITKA_ASSIGN_BUILTIN(filter);
+
+    PyObject *args[] = {function, iterable};
+
+    return CALL_FUNCTION_WITH_ARGS2(NUITKA_ACCESS_BUILTIN(filter), args);
+#else
+    PyObject *args = PyTuple_Pack(2, function, iterable);
+
+    PyObject *result = PyFilter_Type.tp_new(&PyFilter_Type, args, NULL);
+
+    Py_DECREF(args);
+
+    return result;
+#endif
+}
+
 /** The "type" built-in.
  *
  * This comes in two flavors, one being the detection of a values type,
@@ -235,6 +235,71 @@ PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called) {
     return CALL_FUNCTION(called, const_tuple_empty, NULL);
 }
 
+PyObject *CALL_FUNCTION_WITH_ARGS_KWNAMES(PyObject *called, PyObject **args, Py_ssize_t args_size, PyObject *kw_names) {
+    CHECK_OBJECT(called);
+    CHECK_OBJECT(kw_names);
+    assert(PyTuple_CheckExact(kw_names));
+
+    Py_ssize_t kw_size = PyTuple_GET_SIZE(kw_names);
+
+    if (Nuitka_Function_Check(called)) {
+        if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+            return NULL;
+        }
+
+        PyObject *result =
+            Nuitka_CallFunctionVectorcall((struct Nuitka_FunctionObject *)called, args, args_size, kw_names);
+
+        Py_LeaveRecursiveCall();
+
+        return result;
+    } else if (Nuitka_Method_Check(called)) {
+        struct Nuitka_MethodObject *method = (struct Nuitka_MethodObject *)called;
+
+        // Unbound method, let the error path be slow.
+        if (method->m_object != NULL) {
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+
+#ifdef _MSC_VER
+            PyObject **method_args = (PyObject **)_alloca(sizeof(PyObject *) * (args_size + kw_size + 1));
+#else
+            PyObject *method_args[args_size + kw_size + 1];
+#endif
+            method_args[0] = method->m_object;
+            memcpy(method_args + 1, args, sizeof(PyObject *) * (args_size + kw_size));
+
+            PyObject *result = Nuitka_CallFunctionVectorcall(method->m_function, method_args, args_size + 1, kw_names);
+
+            Py_LeaveRecursiveCall();
+
+            return result;
+        }
+    }
+
+    PyObject *pos_args = MAKE_TUPLE(args, args_size);
+    PyObject *named_args = _PyDict_NewPresized(kw_size);
+
+    for (Py_ssize_t i = 0; i < kw_size; i++) {
+        int res = PyDict_SetItem(named_args, PyTuple_GET_ITEM(kw_names, i), args[args_size + i]);
+
+        if (unlikely(res != 0)) {
+            Py_DECREF(pos_args);
+            Py_DECREF(named_args);
+
+            return NULL;
+        }
+    }
+
+    PyObject *result = CALL_FUNCTION(called, pos_args, named_args);
+
+    Py_DECREF(pos_args);
+    Py_DECREF(named_args);
+
+    return result;
+}
+
 PyObject *CALL_METHOD_WITH_POSARGS(PyObject *source, PyObject *attribute, PyObject *positional_args) {
     CHECK_OBJECT(source);
     CHECK_OBJECT(attribute);
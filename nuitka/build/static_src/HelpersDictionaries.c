@@ -0,0 +1,38 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for small helper routines for dictionaries, that are
+ * not worth inlining.
+ */
+
+#if PYTHON_VERSION >= 360
+// CPython keeps its global dictionary version counter private, so we modify a
+// dictionary of our own to get the next value from it.
+uint64_t Nuitka_GetNextDictVersion(void) {
+    static PyObject *version_dict = NULL;
+
+    if (unlikely(version_dict == NULL)) {
+        version_dict = PyDict_New();
+    }
+
+    NUITKA_MAY_BE_UNUSED int res = PyDict_SetItem(version_dict, Py_None, Py_None);
+    assert(res == 0);
+
+    return ((PyDictObject *)version_dict)->ma_version_tag;
+}
+#endif
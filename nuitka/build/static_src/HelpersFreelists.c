@@ -0,0 +1,119 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/* Free lists of all compiled types, tunable from the environment, and with
+ * statistics to find out, if they are sized right for a program.
+ */
+
+#include "nuitka/freelists.h"
+
+extern struct Nuitka_FreeListInfo free_list_cells_info;
+extern struct Nuitka_FreeListInfo free_list_frames_info;
+extern struct Nuitka_FreeListInfo free_list_functions_info;
+extern struct Nuitka_FreeListInfo free_list_methods_info;
+extern struct Nuitka_FreeListInfo free_list_generators_info;
+#if PYTHON_VERSION >= 350
+extern struct Nuitka_FreeListInfo free_list_coros_info;
+extern struct Nuitka_FreeListInfo free_list_coro_wrappers_info;
+extern struct Nuitka_FreeListInfo free_list_coroutine_aiter_wrappers_info;
+#endif
+#if PYTHON_VERSION >= 360
+extern struct Nuitka_FreeListInfo free_list_asyncgens_info;
+extern struct Nuitka_FreeListInfo free_list_asyncgen_value_wrappers_info;
+extern struct Nuitka_FreeListInfo free_list_asyncgen_asends_info;
+extern struct Nuitka_FreeListInfo free_list_asyncgen_athrows_info;
+#endif
+extern struct Nuitka_FreeListInfo free_list_tracebacks_info;
+
+static struct Nuitka_FreeListInfo *free_lists[] = {&free_list_cells_info,
+                                                   &free_list_frames_info,
+                                                   &free_list_functions_info,
+                                                   &free_list_methods_info,
+                                                   &free_list_generators_info,
+#if PYTHON_VERSION >= 350
+                                                   &free_list_coros_info,
+                                                   &free_list_coro_wrappers_info,
+                                                   &free_list_coroutine_aiter_wrappers_info,
+#endif
+#if PYTHON_VERSION >= 360
+                                                   &free_list_asyncgens_info,
+                                                   &free_list_asyncgen_value_wrappers_info,
+                                                   &free_list_asyncgen_asends_info,
+                                                   &free_list_asyncgen_athrows_info,
+#endif
+                                                   &free_list_tracebacks_info,
+                                                   NULL};
+
+// Apply limits given as comma separated "name=count" pairs. These are fixed
+// then, and do not grow anymore.
+static void applyFreeListLimits(char const *limits) {
+    while (*limits != 0) {
+        char const *value = strchr(limits, '=');
+
+        if (value == NULL) {
+            break;
+        }
+
+        size_t name_length = value - limits;
+        int max_count = atoi(value + 1);
+
+        for (struct Nuitka_FreeListInfo **info = free_lists; *info != NULL; info++) {
+            if (strlen((*info)->name) == name_length && strncmp((*info)->name, limits, name_length) == 0) {
+                (*info)->max_count = max_count > 0 ? max_count : 0;
+                (*info)->max_limit = (*info)->max_count;
+            }
+        }
+
+        limits = strchr(value, ',');
+
+        if (limits == NULL) {
+            break;
+        }
+
+        limits += 1;
+    }
+}
+
+static void dumpFreeListStats(void) {
+    fprintf(stderr, "%-26s %8s %8s %8s %12s %12s %12s\n", "Free list", "Limit", "Count", "Highest", "Hits", "Misses",
+            "Drops");
+
+    for (struct Nuitka_FreeListInfo **info = free_lists; *info != NULL; info++) {
+        fprintf(stderr, "%-26s %8d %8d %8d %12lu %12lu %12lu\n", (*info)->name, (*info)->max_count, (*info)->count,
+                (*info)->high_water, (*info)->hits, (*info)->misses, (*info)->drops);
+    }
+}
+
+void _initFreeLists(void) {
+    static bool init_done = false;
+
+    if (init_done) {
+        return;
+    }
+
+    init_done = true;
+
+    char const *limits = getenv("NUITKA_FREELISTS");
+
+    if (limits != NULL) {
+        applyFreeListLimits(limits);
+    }
+
+    if (getenv("NUITKA_FREELIST_STATS") != NULL) {
+        Py_AtExit(dumpFreeListStats);
+    }
+}
@@ -116,7 +116,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_INT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -154,7 +154,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_INT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -287,7 +287,7 @@ PyObject *BINARY_OPERATION_ADD_INT_OBJECT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -325,7 +325,7 @@ PyObject *BINARY_OPERATION_ADD_INT_OBJECT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -462,7 +462,7 @@ PyObject *BINARY_OPERATION_ADD_INT_INT(PyObject *operand1, PyObject *operand2) {
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -500,7 +500,7 @@ PyObject *BINARY_OPERATION_ADD_INT_INT(PyObject *operand1, PyObject *operand2) {
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -640,7 +640,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_STR(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -678,7 +678,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_STR(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -811,7 +811,7 @@ PyObject *BINARY_OPERATION_ADD_STR_OBJECT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -849,7 +849,7 @@ PyObject *BINARY_OPERATION_ADD_STR_OBJECT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -987,7 +987,7 @@ PyObject *BINARY_OPERATION_ADD_STR_STR(PyObject *operand1, PyObject *operand2) {
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1025,7 +1025,7 @@ PyObject *BINARY_OPERATION_ADD_STR_STR(PyObject *operand1, PyObject *operand2) {
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1162,7 +1162,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_UNICODE(PyObject *operand1, PyObject *oper
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1200,7 +1200,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_UNICODE(PyObject *operand1, PyObject *oper
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1331,7 +1331,7 @@ PyObject *BINARY_OPERATION_ADD_UNICODE_OBJECT(PyObject *operand1, PyObject *oper
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1369,7 +1369,7 @@ PyObject *BINARY_OPERATION_ADD_UNICODE_OBJECT(PyObject *operand1, PyObject *oper
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1503,7 +1503,7 @@ PyObject *BINARY_OPERATION_ADD_UNICODE_UNICODE(PyObject *operand1, PyObject *ope
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1541,7 +1541,7 @@ PyObject *BINARY_OPERATION_ADD_UNICODE_UNICODE(PyObject *operand1, PyObject *ope
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1678,7 +1678,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_FLOAT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1716,7 +1716,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_FLOAT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1849,7 +1849,7 @@ PyObject *BINARY_OPERATION_ADD_FLOAT_OBJECT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -1887,7 +1887,7 @@ PyObject *BINARY_OPERATION_ADD_FLOAT_OBJECT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2024,7 +2024,7 @@ PyObject *BINARY_OPERATION_ADD_FLOAT_FLOAT(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2062,7 +2062,7 @@ PyObject *BINARY_OPERATION_ADD_FLOAT_FLOAT(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2198,7 +2198,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_TUPLE(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2236,7 +2236,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_TUPLE(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2369,7 +2369,7 @@ PyObject *BINARY_OPERATION_ADD_TUPLE_OBJECT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2407,7 +2407,7 @@ PyObject *BINARY_OPERATION_ADD_TUPLE_OBJECT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2545,7 +2545,7 @@ PyObject *BINARY_OPERATION_ADD_TUPLE_TUPLE(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2583,7 +2583,7 @@ PyObject *BINARY_OPERATION_ADD_TUPLE_TUPLE(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2720,7 +2720,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_LIST(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2758,7 +2758,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_LIST(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2891,7 +2891,7 @@ PyObject *BINARY_OPERATION_ADD_LIST_OBJECT(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -2929,7 +2929,7 @@ PyObject *BINARY_OPERATION_ADD_LIST_OBJECT(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3067,7 +3067,7 @@ PyObject *BINARY_OPERATION_ADD_LIST_LIST(PyObject *operand1, PyObject *operand2)
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3105,7 +3105,7 @@ PyObject *BINARY_OPERATION_ADD_LIST_LIST(PyObject *operand1, PyObject *operand2)
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3244,7 +3244,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_BYTES(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3282,7 +3282,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_BYTES(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3415,7 +3415,7 @@ PyObject *BINARY_OPERATION_ADD_BYTES_OBJECT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3453,7 +3453,7 @@ PyObject *BINARY_OPERATION_ADD_BYTES_OBJECT(PyObject *operand1, PyObject *operan
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3591,7 +3591,7 @@ PyObject *BINARY_OPERATION_ADD_BYTES_BYTES(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3629,7 +3629,7 @@ PyObject *BINARY_OPERATION_ADD_BYTES_BYTES(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3768,7 +3768,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_LONG(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3806,7 +3806,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_LONG(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3939,7 +3939,7 @@ PyObject *BINARY_OPERATION_ADD_LONG_OBJECT(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -3977,7 +3977,7 @@ PyObject *BINARY_OPERATION_ADD_LONG_OBJECT(PyObject *operand1, PyObject *operand
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4114,7 +4114,7 @@ PyObject *BINARY_OPERATION_ADD_LONG_LONG(PyObject *operand1, PyObject *operand2)
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4152,7 +4152,7 @@ PyObject *BINARY_OPERATION_ADD_LONG_LONG(PyObject *operand1, PyObject *operand2)
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4289,7 +4289,7 @@ PyObject *BINARY_OPERATION_ADD_FLOAT_LONG(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4327,7 +4327,7 @@ PyObject *BINARY_OPERATION_ADD_FLOAT_LONG(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4464,7 +4464,7 @@ PyObject *BINARY_OPERATION_ADD_LONG_FLOAT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4502,7 +4502,7 @@ PyObject *BINARY_OPERATION_ADD_LONG_FLOAT(PyObject *operand1, PyObject *operand2
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4632,7 +4632,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_OBJECT(PyObject *operand1, PyObject *opera
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -4670,7 +4670,7 @@ PyObject *BINARY_OPERATION_ADD_OBJECT_OBJECT(PyObject *operand1, PyObject *opera
             if (err == 0) {
                 PyNumberMethods *mv = Py_TYPE(coerced1)->tp_as_number;
 
-                if (likely(mv == NULL)) {
+                if (mv != NULL) {
                     binaryfunc slot = mv->nb_add;
 
                     if (likely(slot != NULL)) {
@@ -0,0 +1,46 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/* These slots are still manually coded and are used by the generated code. */
+
+#if PYTHON_VERSION < 300
+
+static PyObject *SLOT_nb_and_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    long a = PyInt_AS_LONG(operand1);
+    long b = PyInt_AS_LONG(operand2);
+
+    return PyInt_FromLong(a & b);
+}
+
+#endif
+
+static PyObject *SLOT_nb_and_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    // TODO: Could in-line and specialize this too.
+    PyObject *x = PyLong_Type.tp_as_number->nb_and((PyObject *)operand1, (PyObject *)operand2);
+    assert(x != Py_NotImplemented);
+    return x;
+}
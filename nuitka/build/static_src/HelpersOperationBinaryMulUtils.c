@@ -0,0 +1,138 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/* These slots are still manually coded and are used by the generated code. */
+
+#if PYTHON_VERSION < 300
+
+static PyObject *SLOT_nb_multiply_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    long a = PyInt_AS_LONG(operand1);
+    long b = PyInt_AS_LONG(operand2);
+
+    long longprod = (long)((unsigned long)a * b);
+    double doubleprod = (double)a * (double)b;
+    double doubled_longprod = (double)longprod;
+
+    // Fast path for normal case, where the product fits.
+    if (likely(doubled_longprod == doubleprod)) {
+        return PyInt_FromLong(longprod);
+    }
+
+    // Somebody somewhere lost info. Close enough, or way off? Note that a
+    // != 0 and b != 0 (else doubled_longprod == doubleprod == 0), which is
+    // the same approach that CPython uses.
+    double diff = doubled_longprod - doubleprod;
+    double absdiff = diff >= 0.0 ? diff : -diff;
+    double absprod = doubleprod >= 0.0 ? doubleprod : -doubleprod;
+
+    if (32.0 * absdiff <= absprod) {
+        return PyInt_FromLong(longprod);
+    }
+
+    // TODO: Could in-line and specialize this too.
+    PyObject *x = PyLong_Type.tp_as_number->nb_multiply((PyObject *)operand1, (PyObject *)operand2);
+    assert(x != Py_NotImplemented);
+    return x;
+}
+
+#endif
+
+static PyObject *SLOT_nb_multiply_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    // TODO: Could in-line and specialize this too.
+    PyObject *x = PyLong_Type.tp_as_number->nb_multiply((PyObject *)operand1, (PyObject *)operand2);
+    assert(x != Py_NotImplemented);
+    return x;
+}
+
+static PyObject *SLOT_nb_multiply_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    double a = PyFloat_AS_DOUBLE(operand1);
+    double b = PyFloat_AS_DOUBLE(operand2);
+
+    return PyFloat_FromDouble(a * b);
+}
+
+static bool FLOAT_MUL_INCREMENTAL(PyObject **operand1, PyObject *operand2) {
+    assert(PyFloat_CheckExact(*operand1));
+    assert(PyFloat_CheckExact(operand2));
+
+    PyFPE_START_PROTECT("mul", return false);
+    PyFloat_AS_DOUBLE(*operand1) *= PyFloat_AS_DOUBLE(operand2);
+    PyFPE_END_PROTECT(*operand1);
+
+    return true;
+}
+
+static PyObject *SEQUENCE_REPEAT(ssizeargfunc repeatfunc, PyObject *seq, PyObject *n) {
+    if (unlikely(!PyIndex_Check(n))) {
+        PyErr_Format(PyExc_TypeError, "can't multiply sequence by non-int of type '%s'", Py_TYPE(n)->tp_name);
+
+        return NULL;
+    }
+
+    PyObject *index_value = PyNumber_Index(n);
+
+    if (unlikely(index_value == NULL)) {
+        return NULL;
+    }
+
+    /* We're done if PyInt_AsSsize_t() returns without error. */
+#if PYTHON_VERSION < 300
+    Py_ssize_t count = PyInt_AsSsize_t(index_value);
+#else
+    Py_ssize_t count = PyLong_AsSsize_t(index_value);
+#endif
+
+    Py_DECREF(index_value);
+
+    if (unlikely(count == -1)) // Note: -1 is an unlikely repetition count
+    {
+        PyObject *exception = GET_ERROR_OCCURRED();
+
+        if (unlikely(exception)) {
+            if (!EXCEPTION_MATCH_BOOL_SINGLE(exception, PyExc_OverflowError)) {
+                return NULL;
+            }
+
+            PyErr_Format(PyExc_OverflowError, "cannot fit '%s' into an index-sized integer", Py_TYPE(n)->tp_name);
+
+            return NULL;
+        }
+    }
+
+    PyObject *result = (*repeatfunc)(seq, count);
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    return result;
+}
@@ -16,81 +16,400 @@
 //     limitations under the License.
 //
 /**
- * This is responsible for profiling Nuitka using "vmprof".
+ * This is responsible for profiling Nuitka compiled code.
+ *
+ * Compiled code has no bytecode for the CPython profilers to trace, so the
+ * entry and exit of frames, and the resuming of generators, coroutines and
+ * asyncgen, are recorded here instead. With "--profile" this is compiled in,
+ * and it is done when the environment variable "NUITKA_PROFILE" names the
+ * file to write "pstats" compatible statistics to, or "NUITKA_PROFILE_STACKS"
+ * names a file for collapsed stacks, as taken by flame graph tools. Otherwise
+ * the only cost is a flag check per frame.
+ *
+ * Timings are taken with a monotonic clock, unless "NUITKA_PROFILE_CLOCK" is
+ * "cpu", then thread CPU time is used.
  */
 
 #if _NUITKA_PROFILE
 
-timespec diff(timespec start, timespec end);
+#if defined(_WIN32)
+#include <windows.h>
+#endif
+
+#if defined(_MSC_VER)
+#define NUITKA_THREAD_LOCAL __declspec(thread)
+#else
+#define NUITKA_THREAD_LOCAL __thread
+#endif
+
+bool Nuitka_Profile_Enabled = false;
+
+// Nanoseconds of the profiling clock.
+typedef unsigned long long profile_time_t;
+
+static bool profile_cpu_clock = false;
+
+#if defined(_WIN32)
+static LARGE_INTEGER profile_counter_frequency;
+#endif
 
-static timespec getTimespecDiff(timespec start, timespec end) {
-    timespec temp;
+static profile_time_t getProfileTime(void) {
+#if defined(_WIN32)
+    if (profile_cpu_clock) {
+        FILETIME creation_time, exit_time, kernel_time, user_time;
+        GetThreadTimes(GetCurrentThread(), &creation_time, &exit_time, &kernel_time, &user_time);
 
-    if ((end.tv_nsec - start.tv_nsec) < 0) {
-        temp.tv_sec = end.tv_sec - start.tv_sec - 1;
-        temp.tv_nsec = 1000000000 + end.tv_nsec - start.tv_nsec;
+        ULARGE_INTEGER kernel, user;
+        kernel.LowPart = kernel_time.dwLowDateTime;
+        kernel.HighPart = kernel_time.dwHighDateTime;
+        user.LowPart = user_time.dwLowDateTime;
+        user.HighPart = user_time.dwHighDateTime;
+
+        // Units of 100ns.
+        return (profile_time_t)(kernel.QuadPart + user.QuadPart) * 100;
     } else {
-        temp.tv_sec = end.tv_sec - start.tv_sec;
-        temp.tv_nsec = end.tv_nsec - start.tv_nsec;
+        LARGE_INTEGER counter;
+        QueryPerformanceCounter(&counter);
+
+        return (profile_time_t)((double)counter.QuadPart * 1e9 / (double)profile_counter_frequency.QuadPart);
     }
+#else
+    struct timespec now;
+    clock_gettime(profile_cpu_clock ? CLOCK_THREAD_CPUTIME_ID : CLOCK_MONOTONIC, &now);
 
-    return temp;
+    return (profile_time_t)now.tv_sec * 1000000000 + now.tv_nsec;
+#endif
 }
 
-static FILE *tempfile_profile;
-static PyObject *vmprof_module;
+// Calling context tree, every node is a code object, called from the code
+// object of the parent node. The roots have no code object, and there is
+// one per thread.
+struct Nuitka_ProfileNode {
+    PyCodeObject *m_code_object;
 
-static timespec time1, time2;
+    struct Nuitka_ProfileNode *m_parent;
+    struct Nuitka_ProfileNode *m_children;
 
-void startProfiling(void) {
-    tempfile_profile = fopen("nuitka-performance.dat", "wb");
+    // Next child of the parent, or next root.
+    struct Nuitka_ProfileNode *m_next;
+
+    unsigned long m_calls;
+
+    // Time spent including the children, and when it was last entered.
+    profile_time_t m_total;
+    profile_time_t m_start;
+};
+
+static struct Nuitka_ProfileNode *profile_roots = NULL;
+static NUITKA_THREAD_LOCAL struct Nuitka_ProfileNode *profile_current = NULL;
 
-    // Might be necessary to import "site" module to find "vmprof", lets just
-    // hope we don't suffer too much from that. If we do, what might be done
-    // is to try and just have the "PYTHONPATH" from it from out user.
-    PyImport_ImportModule("site");
-    vmprof_module = PyImport_ImportModule("vmprof");
+// Qualified names of code objects, where they are known.
+static PyObject *profile_names = NULL;
 
-    // Abort if it's not there.
-    if (vmprof_module == NULL) {
-        PyErr_Print();
+static struct Nuitka_ProfileNode *makeProfileNode(PyCodeObject *code_object, struct Nuitka_ProfileNode *parent) {
+    struct Nuitka_ProfileNode *result = (struct Nuitka_ProfileNode *)calloc(1, sizeof(struct Nuitka_ProfileNode));
+
+    if (unlikely(result == NULL)) {
+        fprintf(stderr, "Nuitka: Out of memory for profiling.\n");
         abort();
     }
 
-    PyObject *result = CALL_FUNCTION_WITH_SINGLE_ARG(PyObject_GetAttrString(vmprof_module, "enable"),
-                                                     PyInt_FromLong(fileno(tempfile_profile)));
+    Py_XINCREF(code_object);
+    result->m_code_object = code_object;
+    result->m_parent = parent;
+
+    return result;
+}
+
+void Nuitka_Profile_Enter(PyCodeObject *code_object) {
+    struct Nuitka_ProfileNode *current = profile_current;
+
+    // First profiled code of this thread, the GIL protects the roots.
+    if (unlikely(current == NULL)) {
+        current = makeProfileNode(NULL, NULL);
+
+        current->m_next = profile_roots;
+        profile_roots = current;
+    }
+
+    struct Nuitka_ProfileNode *node = current->m_children;
+
+    while (node != NULL && node->m_code_object != code_object) {
+        node = node->m_next;
+    }
+
+    if (node == NULL) {
+        node = makeProfileNode(code_object, current);
+
+        node->m_next = current->m_children;
+        current->m_children = node;
+    }
+
+    profile_current = node;
+
+    node->m_start = getProfileTime();
+}
+
+void Nuitka_Profile_Leave(void) {
+    profile_time_t now = getProfileTime();
+
+    struct Nuitka_ProfileNode *node = profile_current;
+
+    // Code entered before profiling was started, is not recorded.
+    if (node == NULL || node->m_parent == NULL) {
+        return;
+    }
+
+    node->m_calls += 1;
+    node->m_total += now - node->m_start;
+
+    profile_current = node->m_parent;
+}
+
+void Nuitka_Profile_RegisterName(PyCodeObject *code_object, PyObject *qualname) {
+    if (PyDict_GetItem(profile_names, (PyObject *)code_object) == NULL) {
+        PyDict_SetItem(profile_names, (PyObject *)code_object, qualname);
+    }
+}
+
+static PyObject *getProfileName(PyCodeObject *code_object) {
+    PyObject *result = PyDict_GetItem(profile_names, (PyObject *)code_object);
 
     if (result == NULL) {
-        PyErr_Print();
-        abort();
+        result = code_object->co_name;
+    }
+
+    return result;
+}
+
+// The "pstats" key of a code object, (filename, line, name).
+static PyObject *getProfileKey(PyCodeObject *code_object) {
+    return Py_BuildValue("(OiO)", code_object->co_filename, code_object->co_firstlineno, getProfileName(code_object));
+}
+
+static profile_time_t getProfileSelfTime(struct Nuitka_ProfileNode *node) {
+    profile_time_t children_time = 0;
+
+    for (struct Nuitka_ProfileNode *child = node->m_children; child != NULL; child = child->m_next) {
+        children_time += child->m_total;
+    }
+
+    // Children still running when profiling stopped, can make up for more.
+    return node->m_total > children_time ? node->m_total - children_time : 0;
+}
+
+// Recursive calls are not primitive, and their time is already included in
+// the cumulative time of the outermost call.
+static bool isProfileRecursion(struct Nuitka_ProfileNode *node) {
+    for (struct Nuitka_ProfileNode *parent = node->m_parent; parent != NULL; parent = parent->m_parent) {
+        if (parent->m_code_object == node->m_code_object) {
+            return true;
+        }
+    }
+
+    return false;
+}
+
+// Add call counts and times to a list of them, in the given order.
+static void addProfileCounts(PyObject *counts, unsigned long first, unsigned long second, double tt, double ct) {
+    double values[4] = {(double)first, (double)second, tt, ct};
+
+    for (int i = 0; i < 4; i++) {
+        PyObject *old = PyList_GET_ITEM(counts, i);
+        PyObject *value;
+
+        if (i < 2) {
+            value = PyInt_FromLong(PyInt_AsLong(old) + (long)values[i]);
+        } else {
+            value = PyFloat_FromDouble(PyFloat_AS_DOUBLE(old) + values[i]);
+        }
+
+        PyList_SET_ITEM(counts, i, value);
+        Py_DECREF(old);
     }
+}
+
+static PyObject *makeProfileCounts(void) { return Py_BuildValue("[iidd]", 0, 0, 0.0, 0.0); }
+
+static void addProfileStats(PyObject *stats, struct Nuitka_ProfileNode *node) {
+    for (; node != NULL; node = node->m_next) {
+        if (node->m_calls != 0) {
+            bool recursion = isProfileRecursion(node);
+
+            unsigned long primitive_calls = recursion ? 0 : node->m_calls;
+            double tt = (double)getProfileSelfTime(node) / 1e9;
+            double ct = recursion ? 0.0 : (double)node->m_total / 1e9;
+
+            PyObject *key = getProfileKey(node->m_code_object);
+            PyObject *entry = PyDict_GetItem(stats, key);
+
+            if (entry == NULL) {
+                // Counts, and the callers dictionary last.
+                entry = makeProfileCounts();
+                PyObject *callers = PyDict_New();
+                PyList_Append(entry, callers);
+                Py_DECREF(callers);
+
+                PyDict_SetItem(stats, key, entry);
+                Py_DECREF(entry);
+            }
+
+            addProfileCounts(entry, primitive_calls, node->m_calls, tt, ct);
+
+            if (node->m_parent->m_code_object != NULL) {
+                PyObject *callers = PyList_GET_ITEM(entry, 4);
+                PyObject *caller_key = getProfileKey(node->m_parent->m_code_object);
+                PyObject *caller_entry = PyDict_GetItem(callers, caller_key);
+
+                if (caller_entry == NULL) {
+                    caller_entry = makeProfileCounts();
+                    PyDict_SetItem(callers, caller_key, caller_entry);
+                    Py_DECREF(caller_entry);
+                }
+
+                // For callers, the order of call counts is reversed.
+                addProfileCounts(caller_entry, node->m_calls, primitive_calls, tt, ct);
 
-    clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time1);
+                Py_DECREF(caller_key);
+            }
+
+            Py_DECREF(key);
+        }
+
+        addProfileStats(stats, node->m_children);
+    }
+}
+
+// Convert the lists used while adding, to the tuples that "pstats" wants.
+static void finalizeProfileStats(PyObject *stats) {
+    Py_ssize_t pos = 0;
+    PyObject *key, *entry;
+
+    while (PyDict_Next(stats, &pos, &key, &entry)) {
+        PyObject *callers = PyList_GET_ITEM(entry, 4);
+
+        Py_ssize_t caller_pos = 0;
+        PyObject *caller_key, *caller_entry;
+
+        while (PyDict_Next(callers, &caller_pos, &caller_key, &caller_entry)) {
+            PyObject *value = PyList_AsTuple(caller_entry);
+            PyDict_SetItem(callers, caller_key, value);
+            Py_DECREF(value);
+        }
+
+        PyObject *value = PyList_AsTuple(entry);
+        PyDict_SetItem(stats, key, value);
+        Py_DECREF(value);
+    }
+}
+
+static void writeProfileStats(char const *filename) {
+    FILE *output = fopen(filename, "wb");
+
+    if (output == NULL) {
+        fprintf(stderr, "Nuitka: Cannot write profile to '%s'.\n", filename);
+        return;
+    }
+
+    PyObject *stats = PyDict_New();
+
+    addProfileStats(stats, profile_roots);
+    finalizeProfileStats(stats);
+
+    PyMarshal_WriteObjectToFile(stats, output, Py_MARSHAL_VERSION);
+
+    Py_DECREF(stats);
+    fclose(output);
+}
+
+static void writeProfileStacks(FILE *output, struct Nuitka_ProfileNode *node, char const *prefix) {
+    for (; node != NULL; node = node->m_next) {
+        PyCodeObject *code_object = node->m_code_object;
+
+        char name[1024];
+        snprintf(name, sizeof(name), "%s (%s:%d)", Nuitka_String_AsString(getProfileName(code_object)),
+                 Nuitka_String_AsString(code_object->co_filename), code_object->co_firstlineno);
+
+        // The separator of the format must not appear in the names.
+        for (char *c = name; *c != 0; c++) {
+            if (*c == ';') {
+                *c = '_';
+            }
+        }
+
+        size_t size = strlen(prefix) + strlen(name) + 2;
+        char *stack = (char *)malloc(size);
+
+        if (*prefix != 0) {
+            snprintf(stack, size, "%s;%s", prefix, name);
+        } else {
+            snprintf(stack, size, "%s", name);
+        }
+
+        unsigned long long self_time = getProfileSelfTime(node) / 1000;
+
+        if (self_time > 0) {
+            fprintf(output, "%s %llu\n", stack, self_time);
+        }
+
+        writeProfileStacks(output, node->m_children, stack);
+
+        free(stack);
+    }
+}
+
+void startProfiling(void) {
+    if (getenv("NUITKA_PROFILE") == NULL && getenv("NUITKA_PROFILE_STACKS") == NULL) {
+        return;
+    }
+
+    char const *clock_name = getenv("NUITKA_PROFILE_CLOCK");
+    profile_cpu_clock = clock_name != NULL && strcmp(clock_name, "cpu") == 0;
+
+#if defined(_WIN32)
+    QueryPerformanceFrequency(&profile_counter_frequency);
+#endif
+
+    profile_names = PyDict_New();
+
+    Nuitka_Profile_Enabled = true;
 }
 
 void stopProfiling(void) {
-    clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time2);
+    if (Nuitka_Profile_Enabled == false) {
+        return;
+    }
+
+    Nuitka_Profile_Enabled = false;
 
     // Save the current exception, if any, we must preserve it.
     PyObject *save_exception_type, *save_exception_value;
     PyTracebackObject *save_exception_tb;
     FETCH_ERROR_OCCURRED(&save_exception_type, &save_exception_value, &save_exception_tb);
 
-    PyObject *result = CALL_FUNCTION_NO_ARGS(PyObject_GetAttrString(vmprof_module, "disable"));
+    char const *stats_filename = getenv("NUITKA_PROFILE");
 
-    if (result == NULL)
-        CLEAR_ERROR_OCCURRED();
+    if (stats_filename != NULL) {
+        writeProfileStats(stats_filename);
+    }
 
-    fclose(tempfile_profile);
+    char const *stacks_filename = getenv("NUITKA_PROFILE_STACKS");
 
-    FILE *tempfile_times = fopen("nuitka-times.dat", "wb");
+    if (stacks_filename != NULL) {
+        FILE *output = fopen(stacks_filename, "w");
 
-    timespec diff = getTimespecDiff(time1, time2);
+        if (output != NULL) {
+            for (struct Nuitka_ProfileNode *root = profile_roots; root != NULL; root = root->m_next) {
+                writeProfileStacks(output, root->m_children, "");
+            }
 
-    long delta_ns = diff.tv_sec * 1000000000 + diff.tv_nsec;
-    fprintf(tempfile_times, "%ld\n", delta_ns);
+            fclose(output);
+        } else {
+            fprintf(stderr, "Nuitka: Cannot write profile to '%s'.\n", stacks_filename);
+        }
+    }
 
-    fclose(tempfile_times);
+    CLEAR_ERROR_OCCURRED();
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
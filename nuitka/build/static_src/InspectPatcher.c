@@ -324,9 +324,9 @@ void patchTypeComparison() {
 
 #include "nuitka/freelists.h"
 
-#define MAX_TRACEBACK_FREE_LIST_COUNT 1000
 static PyTracebackObject *free_list_tracebacks = NULL;
-static int free_list_tracebacks_count = 0;
+struct Nuitka_FreeListInfo free_list_tracebacks_info =
+    NUITKA_FREE_LIST_INFO("tracebacks", MAX_TRACEBACK_FREE_LIST_COUNT);
 
 // Create a traceback for a given frame, using a freelist hacked into the
 // existing type.
@@ -359,7 +359,7 @@ static void Nuitka_tb_dealloc(PyTracebackObject *tb) {
     Py_XDECREF(tb->tb_next);
     Py_XDECREF(tb->tb_frame);
 
-    releaseToFreeList(free_list_tracebacks, tb, MAX_TRACEBACK_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_tracebacks, tb);
 
     // Py_TRASHCAN_SAFE_END( tb )
 }
@@ -126,6 +126,7 @@ extern void _initCompiledCoroutineTypes();
 #if PYTHON_VERSION >= 360
 extern void _initCompiledAsyncgenTypes();
 #endif
+extern void _initFreeLists();
 
 #include <locale.h>
 
@@ -377,6 +378,8 @@ int main(int argc, char **argv) {
     _initCompiledAsyncgenTypes();
 #endif
 
+    _initFreeLists();
+
 #if PYTHON_VERSION < 300
     _initSlotCompare();
 #endif
@@ -54,18 +54,61 @@ static inline bool isVerbose(void) { return false; }
 
 static struct Nuitka_MetaPathBasedLoaderEntry *loader_entries = NULL;
 
+// The loader entries are sorted by name at compile time, so they can be
+// searched with bisection.
+static int loader_entries_count = 0;
+
+// The frozen modules table of CPython is not sorted, and can be changed at
+// run time, so we create a sorted index of it on demand.
+static struct _frozen const *frozen_modules_indexed = NULL;
+static struct _frozen const **frozen_modules_index = NULL;
+static int frozen_modules_count = 0;
+
+static int compareFrozenModules(void const *a, void const *b) {
+    return strcmp((*(struct _frozen const **)a)->name, (*(struct _frozen const **)b)->name);
+}
+
+static void indexFrozenModules(void) {
+    frozen_modules_count = 0;
+
+    for (struct _frozen const *p = PyImport_FrozenModules; p->name != NULL; p++) {
+        frozen_modules_count += 1;
+    }
+
+    free(frozen_modules_index);
+    frozen_modules_index = (struct _frozen const **)malloc(sizeof(struct _frozen const *) * (frozen_modules_count + 1));
+
+    for (int i = 0; i < frozen_modules_count; i++) {
+        frozen_modules_index[i] = &PyImport_FrozenModules[i];
+    }
+
+    qsort(frozen_modules_index, frozen_modules_count, sizeof(struct _frozen const *), compareFrozenModules);
+
+    frozen_modules_indexed = PyImport_FrozenModules;
+}
+
 static bool hasFrozenModule(char const *name) {
-    for (struct _frozen const *p = PyImport_FrozenModules;; p++) {
-        if (p->name == NULL) {
-            return false;
-        }
+    if (unlikely(frozen_modules_indexed != PyImport_FrozenModules)) {
+        indexFrozenModules();
+    }
+
+    int low = 0;
+    int high = frozen_modules_count;
 
-        if (strcmp(p->name, name) == 0) {
-            break;
+    while (low < high) {
+        int middle = low + (high - low) / 2;
+        int c = strcmp(frozen_modules_index[middle]->name, name);
+
+        if (c == 0) {
+            return true;
+        } else if (c < 0) {
+            low = middle + 1;
+        } else {
+            high = middle;
         }
     }
 
-    return true;
+    return false;
 }
 
 static char *copyModulenameAsPath(char *buffer, char const *module_name) {
@@ -236,15 +279,25 @@ static PyObject *loadModuleFromCodeObject(PyCodeObject *code_object, char const
 }
 
 static struct Nuitka_MetaPathBasedLoaderEntry *findEntry(char const *name) {
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-    assert(current);
+    assert(loader_entries);
 
-    while (current->name != NULL) {
-        if (strcmp(name, current->name) == 0) {
-            return current;
+    // Search the first entry not less than the name, so with duplicate names,
+    // the first one wins, as it would with a linear search.
+    int low = 0;
+    int high = loader_entries_count;
+
+    while (low < high) {
+        int middle = low + (high - low) / 2;
+
+        if (strcmp(loader_entries[middle].name, name) < 0) {
+            low = middle + 1;
+        } else {
+            high = middle;
         }
+    }
 
-        current++;
+    if (low < loader_entries_count && strcmp(loader_entries[low].name, name) == 0) {
+        return &loader_entries[low];
     }
 
     return NULL;
@@ -598,6 +651,41 @@ extern PyObject *const_str_plain___spec__;
 extern PyObject *const_str_plain__initializing;
 #endif
 
+// For compressed bytecode, this uses the "zlib" module, which is imported
+// only when the first such module is loaded.
+static PyObject *decompressBytecode(struct Nuitka_MetaPathBasedLoaderEntry *entry) {
+    static PyObject *zlib_decompress = NULL;
+
+    if (zlib_decompress == NULL) {
+        PyObject *zlib_module = PyImport_ImportModule("zlib");
+
+        if (unlikely(zlib_module == NULL)) {
+            return NULL;
+        }
+
+        zlib_decompress = PyObject_GetAttrString(zlib_module, "decompress");
+
+        Py_DECREF(zlib_module);
+
+        if (unlikely(zlib_decompress == NULL)) {
+            return NULL;
+        }
+    }
+
+    PyObject *compressed =
+        PyBytes_FromStringAndSize((char *)&constant_bin[entry->bytecode_start], entry->bytecode_size);
+
+    if (unlikely(compressed == NULL)) {
+        return NULL;
+    }
+
+    PyObject *result = PyObject_CallFunctionObjArgs(zlib_decompress, compressed, NULL);
+
+    Py_DECREF(compressed);
+
+    return result;
+}
+
 static PyObject *loadModule(PyObject *module_name, struct Nuitka_MetaPathBasedLoaderEntry *entry) {
 #ifdef _NUITKA_STANDALONE
     if ((entry->flags & NUITKA_SHLIB_FLAG) != 0) {
@@ -623,8 +711,24 @@ static PyObject *loadModule(PyObject *module_name, struct Nuitka_MetaPathBasedLo
     } else
 #endif
         if ((entry->flags & NUITKA_BYTECODE_FLAG) != 0) {
-        PyCodeObject *code_object = (PyCodeObject *)PyMarshal_ReadObjectFromString(
-            (char *)&constant_bin[entry->bytecode_start], entry->bytecode_size);
+        PyCodeObject *code_object;
+
+        if ((entry->flags & NUITKA_COMPRESSED_FLAG) != 0) {
+            PyObject *bytecode = decompressBytecode(entry);
+
+            if (unlikely(bytecode == NULL)) {
+                PyErr_Print();
+                abort();
+            }
+
+            code_object =
+                (PyCodeObject *)PyMarshal_ReadObjectFromString(PyBytes_AS_STRING(bytecode), PyBytes_GET_SIZE(bytecode));
+
+            Py_DECREF(bytecode);
+        } else {
+            code_object = (PyCodeObject *)PyMarshal_ReadObjectFromString((char *)&constant_bin[entry->bytecode_start],
+                                                                         entry->bytecode_size);
+        }
 
         // TODO: Probably a bit harsh reaction.
         if (unlikely(code_object == NULL)) {
@@ -1047,6 +1151,16 @@ void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loa
 
     loader_entries = _loader_entries;
 
+    while (loader_entries[loader_entries_count].name != NULL) {
+#ifndef __NUITKA_NO_ASSERT__
+        if (loader_entries_count > 0) {
+            assert(strcmp(loader_entries[loader_entries_count - 1].name, loader_entries[loader_entries_count].name) <=
+                   0);
+        }
+#endif
+        loader_entries_count += 1;
+    }
+
     PyType_Ready(&Nuitka_Loader_Type);
 
     // Register it as a meta path loader.
@@ -118,10 +118,14 @@ def generateAttributeLookupCode(to_name, expression, emit, context):
         elif attribute_name == "__class__":
             emit("%s = LOOKUP_ATTRIBUTE_CLASS_SLOT( %s );" % (value_name, source_name))
         else:
+            # Cached per access site, for the type of the last object.
+            emit("{")
+            emit("    static struct Nuitka_AttributeLookupCache cache;")
             emit(
-                "%s = LOOKUP_ATTRIBUTE( %s, %s );"
+                "    %s = LOOKUP_ATTRIBUTE_CACHED( %s, %s, &cache );"
                 % (value_name, source_name, context.getConstantCode(attribute_name))
             )
+            emit("}")
 
         getErrorExitCode(
             check_name=value_name,
@@ -24,8 +24,17 @@ and for freezing of bytecode.
 
 
 class StreamData(object):
+    """ Accumulate binary data for a blob, giving offsets into it.
+
+    Values are only added once, and later additions of the same value are
+    given the offset of the first one. The data is collected as chunks, and
+    only joined when requested.
+    """
+
     def __init__(self):
-        self.stream_data = bytes()
+        self.stream_data = []
+        self.stream_size = 0
+        self.offsets = {}
 
     def getStreamDataCode(self, value, fixed_size=False):
         offset = self.getStreamDataOffset(value)
@@ -36,16 +45,23 @@ class StreamData(object):
             return "&constant_bin[ %d ], %d" % (offset, len(value))
 
     def getStreamDataOffset(self, value):
-        offset = self.stream_data.find(value)
-        if offset == -1:
-            offset = len(self.stream_data)
-            self.stream_data += value
+        offset = self.offsets.get(value)
+
+        if offset is None:
+            offset = self.stream_size
+
+            self.stream_data.append(value)
+            self.stream_size += len(value)
+
+            self.offsets[value] = offset
 
         return offset
 
     def getBytes(self):
-        r = self.stream_data
+        r = b"".join(self.stream_data)
 
         # Release memory as soon as we are finished.
         del self.stream_data
+        del self.offsets
+
         return r
@@ -26,6 +26,7 @@ from nuitka.PythonVersions import python_version
 from .CodeHelpers import (
     decideConversionCheckNeeded,
     generateChildExpressionsCode,
+    pickCodeHelper,
     withObjectCodeTemporaryAssignment,
 )
 from .ErrorCodes import getAssertionCode, getErrorExitBoolCode, getErrorExitCode
@@ -39,10 +40,20 @@ def generateBuiltinRefCode(to_name, expression, emit, context):
         to_name, "builtin_value", expression, emit, context
     ) as value_name:
 
-        emit(
-            "%s = LOOKUP_BUILTIN( %s );"
-            % (value_name, context.getConstantCode(constant=builtin_name))
-        )
+        if python_version >= 360:
+            # Cached per access site, until the built-ins dictionary changes.
+            emit("{")
+            emit("    static struct Nuitka_BuiltinLookupCache cache;")
+            emit(
+                "    %s = LOOKUP_BUILTIN_CACHED( %s, &cache );"
+                % (value_name, context.getConstantCode(constant=builtin_name))
+            )
+            emit("}")
+        else:
+            emit(
+                "%s = LOOKUP_BUILTIN( %s );"
+                % (value_name, context.getConstantCode(constant=builtin_name))
+            )
 
         getAssertionCode(check="%s != NULL" % to_name, emit=emit)
 
@@ -163,6 +174,244 @@ def generateBuiltinSum2Code(to_name, expression, emit, context):
     )
 
 
+def generateBuiltinEnumerateCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_ENUMERATE",
+        arg_desc=(
+            ("enumerate_iterable", expression.getIterable()),
+            ("enumerate_start", expression.getStart()),
+        ),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        none_null=True,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinZipCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_ZIP",
+        arg_desc=(("zip_iterables", expression.getValue()),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinReversedCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_REVERSED",
+        arg_desc=(("reversed_arg", expression.getValue()),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinSortedCode(to_name, expression, emit, context):
+    arg_desc = (("sorted_iterable", expression.getIterable()),)
+
+    if python_version < 300:
+        arg_desc += (("sorted_cmp", expression.getCmp()),)
+
+    arg_desc += (
+        ("sorted_key", expression.getKey()),
+        ("sorted_reverse", expression.getReverse()),
+    )
+
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_SORTED",
+        arg_desc=arg_desc,
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        none_null=True,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinMapCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_MAP",
+        arg_desc=(
+            ("map_function", expression.getFunction()),
+            ("map_iterables", expression.getIterables()),
+        ),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinFilterCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_FILTER",
+        arg_desc=(
+            ("filter_function", expression.getFunction()),
+            ("filter_iterable", expression.getIterable()),
+        ),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+_min_max2_helpers_set = set(
+    (
+        "BUILTIN_MIN2_FLOAT_FLOAT",
+        "BUILTIN_MAX2_FLOAT_FLOAT",
+        "BUILTIN_MIN2_OBJECT_OBJECT",
+        "BUILTIN_MAX2_OBJECT_OBJECT",
+    )
+)
+
+if python_version < 300:
+    _min_max2_helpers_set.add("BUILTIN_MIN2_INT_INT")
+    _min_max2_helpers_set.add("BUILTIN_MAX2_INT_INT")
+
+
+def _generateBuiltinMinMax2Code(to_name, prefix, expression, emit, context):
+    left = expression.getLeft()
+    right = expression.getRight()
+
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi=pickCodeHelper(
+            prefix=prefix,
+            suffix="",
+            left_shape=left.getTypeShape(),
+            right_shape=right.getTypeShape(),
+            helpers=_min_max2_helpers_set,
+            warn_missing=False,
+        ),
+        arg_desc=(("minmax_arg1", left), ("minmax_arg2", right)),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinMin2Code(to_name, expression, emit, context):
+    _generateBuiltinMinMax2Code(
+        to_name=to_name,
+        prefix="BUILTIN_MIN2",
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinMax2Code(to_name, expression, emit, context):
+    _generateBuiltinMinMax2Code(
+        to_name=to_name,
+        prefix="BUILTIN_MAX2",
+        expression=expression,
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinMin1Code(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_MIN1",
+        arg_desc=(("min_iterable", expression.getValue()),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinMax1Code(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_MAX1",
+        arg_desc=(("max_iterable", expression.getValue()),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinAnyCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_ANY",
+        arg_desc=(("any_iterable", expression.getValue()),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinAllCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_ALL",
+        arg_desc=(("all_iterable", expression.getValue()),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinAbsCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="PyNumber_Absolute",
+        arg_desc=(("abs_arg", expression.getValue()),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
+def generateBuiltinRoundCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="BUILTIN_ROUND",
+        arg_desc=(
+            ("round_number", expression.getNumber()),
+            ("round_ndigits", expression.getNdigits()),
+        ),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        none_null=True,
+        emit=emit,
+        context=context,
+    )
+
+
 def generateBuiltinRange1Code(to_name, expression, emit, context):
     generateCAPIObjectCode(
         to_name=to_name,
@@ -43,6 +43,131 @@ from .templates.CodeTemplatesModules import (
 )
 
 
+def _getDirectCallFunctionBody(called, call_args):
+    """ Get the module function a call will normally target, or None.
+
+    This is for module variables only assigned once, by the module itself,
+    with a function creation, or variables only assigned once with a name
+    imported from another module, where that is known to be such a function,
+    and arguments that match the positional parameters exactly. The variable
+    can still be changed from the outside, so the call site checks the code
+    of the called value at run time.
+    """
+
+    if not called.isExpressionVariableRef():
+        return None
+
+    variable = called.getVariable()
+
+    if not variable.isModuleVariable() and not variable.isLocalVariable():
+        return None
+
+    if variable.hasWritesOutsideOf(variable.getOwner()) is not False:
+        return None
+
+    assign_traces = [
+        variable_trace
+        for variable_trace in variable.traces
+        if variable_trace.isAssignTrace()
+    ]
+
+    if len(assign_traces) != 1:
+        return None
+
+    assign_source = assign_traces[0].getAssignNode().getAssignSource()
+
+    if assign_source.isExpressionFunctionCreation():
+        if not variable.isModuleVariable():
+            return None
+
+        function_body = assign_source.getFunctionRef().getFunctionBody()
+
+        if not function_body.isExpressionFunctionBody():
+            return None
+    elif assign_source.isExpressionImportName():
+        function_body = assign_source.getImportedFunctionBody()
+
+        # The other module must export the function, which is decided before
+        # code generation.
+        if (
+            function_body is None
+            or not function_body.needsCreation()
+            or function_body not in called.getParentModule().getCrossCalledFunctions()
+        ):
+            return None
+    else:
+        return None
+
+    parameters = function_body.getParameters()
+
+    if (
+        parameters.getStarListArgumentName() is not None
+        or parameters.getStarDictArgumentName() is not None
+        or parameters.getKwOnlyParameterCount() != 0
+    ):
+        return None
+
+    if call_args is None:
+        arg_count = 0
+    elif call_args.isExpressionConstantRef():
+        arg_count = len(call_args.getConstant())
+    elif call_args.isExpressionMakeTuple():
+        arg_count = len(call_args.getElements())
+    else:
+        return None
+
+    if arg_count != parameters.getArgumentCount():
+        return None
+
+    return function_body
+
+
+def _generateCallCodeDirect(
+    to_name, expression, called_name, call_args, function_body, emit, context
+):
+    call_arg_names = _generateCallArgElementCodes(
+        call_args=call_args, emit=emit, context=context
+    )
+
+    context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
+
+    emitLineNumberUpdateCode(emit, context)
+
+    function_impl_identifier = "impl_" + function_body.getCodeName()
+
+    if call_arg_names:
+        emit(
+            """\
+{
+    PyObject *call_args[] = { %s };
+    %s = CALL_FUNCTION_C_CODE( %s, %s, call_args, %d );
+}
+"""
+            % (
+                ", ".join(str(call_arg_name) for call_arg_name in call_arg_names),
+                to_name,
+                called_name,
+                function_impl_identifier,
+                len(call_arg_names),
+            )
+        )
+    else:
+        emit(
+            "%s = CALL_FUNCTION_C_CODE( %s, %s, NULL, 0 );"
+            % (to_name, called_name, function_impl_identifier)
+        )
+
+    getErrorExitCode(
+        check_name=to_name,
+        release_names=[called_name] + call_arg_names,
+        needs_check=expression.mayRaiseException(BaseException),
+        emit=emit,
+        context=context,
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def _generateCallCodePosOnly(
     to_name, expression, called_name, called_attribute_name, emit, context
 ):
@@ -54,6 +179,24 @@ def _generateCallCodePosOnly(
 
     call_args = expression.getCallArgs()
 
+    if called_attribute_name is None:
+        function_body = _getDirectCallFunctionBody(
+            called=expression.getCalled(), call_args=call_args
+        )
+
+        if function_body is not None:
+            _generateCallCodeDirect(
+                to_name=to_name,
+                expression=expression,
+                called_name=called_name,
+                call_args=call_args,
+                function_body=function_body,
+                emit=emit,
+                context=context,
+            )
+
+            return
+
     if call_args is None or call_args.isExpressionConstantRef():
         context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
 
@@ -222,6 +365,140 @@ def _generateCallCodeKwOnly(
     )
 
 
+def _getCallKeywordNames(call_args, call_kw):
+    """ Get the keyword argument names of a call if known at compile time.
+
+    Only for these, and with positional arguments that are not given as a
+    tuple value, the call can pass all arguments in a C array, which lets
+    compiled functions avoid the tuple and dictionary creation entirely.
+    """
+
+    if not (
+        call_args is None
+        or call_args.isExpressionConstantRef()
+        or call_args.isExpressionMakeTuple()
+    ):
+        return None
+
+    if call_kw.isExpressionConstantRef():
+        kw_names = tuple(call_kw.getConstant())
+    elif call_kw.isExpressionMakeDict():
+        kw_names = []
+
+        for pair in call_kw.getPairs():
+            key = pair.getKey()
+
+            if not key.isExpressionConstantRef():
+                return None
+
+            kw_names.append(key.getConstant())
+
+        kw_names = tuple(kw_names)
+    else:
+        return None
+
+    if not kw_names or any(type(kw_name) is not str for kw_name in kw_names):
+        return None
+
+    return kw_names
+
+
+def _generateCallArgElementCodes(call_args, emit, context):
+    call_arg_names = []
+
+    if call_args is None:
+        pass
+    elif call_args.isExpressionConstantRef():
+        for call_arg_element in call_args.getConstant():
+            call_arg_name = context.allocateTempName("call_arg_element")
+
+            getConstantAccess(
+                to_name=call_arg_name,
+                constant=call_arg_element,
+                emit=emit,
+                context=context,
+            )
+
+            call_arg_names.append(call_arg_name)
+    else:
+        for call_arg_element in call_args.getElements():
+            call_arg_name = generateChildExpressionCode(
+                child_name=call_args.getChildName() + "_element",
+                expression=call_arg_element,
+                emit=emit,
+                context=context,
+            )
+
+            call_arg_names.append(call_arg_name)
+
+    return call_arg_names
+
+
+def _generateCallCodeKwNames(
+    to_name, expression, called_name, call_args, call_kw, emit, context
+):
+    call_arg_names = _generateCallArgElementCodes(
+        call_args=call_args, emit=emit, context=context
+    )
+
+    kw_names = _getCallKeywordNames(call_args, call_kw)
+
+    if call_kw.isExpressionConstantRef():
+        kw_values = call_kw.getConstant()
+
+        for kw_name in kw_names:
+            call_arg_name = context.allocateTempName("call_kw_value")
+
+            getConstantAccess(
+                to_name=call_arg_name,
+                constant=kw_values[kw_name],
+                emit=emit,
+                context=context,
+            )
+
+            call_arg_names.append(call_arg_name)
+    else:
+        for pair in call_kw.getPairs():
+            call_arg_name = generateChildExpressionCode(
+                child_name=call_kw.getChildName() + "_value",
+                expression=pair.getValue(),
+                emit=emit,
+                context=context,
+            )
+
+            call_arg_names.append(call_arg_name)
+
+    context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
+
+    emitLineNumberUpdateCode(emit, context)
+
+    emit(
+        """\
+{
+    PyObject *call_args[] = { %s };
+    %s = CALL_FUNCTION_WITH_ARGS_KWNAMES( %s, call_args, %d, %s );
+}
+"""
+        % (
+            ", ".join(str(call_arg_name) for call_arg_name in call_arg_names),
+            to_name,
+            called_name,
+            len(call_arg_names) - len(kw_names),
+            context.getConstantCode(constant=kw_names),
+        )
+    )
+
+    getErrorExitCode(
+        check_name=to_name,
+        release_names=[called_name] + call_arg_names,
+        needs_check=expression.mayRaiseException(BaseException),
+        emit=emit,
+        context=context,
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateCallCode(to_name, expression, emit, context):
     # There is a whole lot of different cases, for each of which, we create
     # optimized code, constant, with and without positional or keyword arguments
@@ -278,6 +555,16 @@ def generateCallCode(to_name, expression, emit, context):
                 emit=emit,
                 context=context,
             )
+        elif _getCallKeywordNames(call_args, call_kw) is not None:
+            _generateCallCodeKwNames(
+                to_name=result_name,
+                called_name=called_name,
+                expression=expression,
+                call_args=call_args,
+                call_kw=call_kw,
+                emit=emit,
+                context=context,
+            )
         else:
             call_args = expression.getCallArgs()
 
@@ -574,6 +861,13 @@ def _getCallCodePosKeywordArgs(
     context.addCleanupTempName(to_name)
 
 
+def addQuickCallsUsed(quick_calls, quick_instance_calls):
+    """ Register quick calls used by code not generated in this run. """
+
+    quick_calls_used.update(quick_calls)
+    quick_instance_calls_used.update(quick_instance_calls)
+
+
 def getCallsDecls():
     result = []
 
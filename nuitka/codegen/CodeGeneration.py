@@ -44,7 +44,10 @@ from .AttributeCodes import (
 )
 from .BranchCodes import generateBranchCode
 from .BuiltinCodes import (
+    generateBuiltinAbsCode,
+    generateBuiltinAllCode,
     generateBuiltinAnonymousRefCode,
+    generateBuiltinAnyCode,
     generateBuiltinBinCode,
     generateBuiltinBoolCode,
     generateBuiltinBytearray1Code,
@@ -52,14 +55,24 @@ from .BuiltinCodes import (
     generateBuiltinClassmethodCode,
     generateBuiltinComplex1Code,
     generateBuiltinComplex2Code,
+    generateBuiltinEnumerateCode,
+    generateBuiltinFilterCode,
     generateBuiltinFloatCode,
     generateBuiltinHexCode,
+    generateBuiltinMapCode,
+    generateBuiltinMax1Code,
+    generateBuiltinMax2Code,
+    generateBuiltinMin1Code,
+    generateBuiltinMin2Code,
     generateBuiltinOctCode,
     generateBuiltinOpenCode,
     generateBuiltinRange1Code,
     generateBuiltinRange2Code,
     generateBuiltinRange3Code,
     generateBuiltinRefCode,
+    generateBuiltinReversedCode,
+    generateBuiltinRoundCode,
+    generateBuiltinSortedCode,
     generateBuiltinStaticmethodCode,
     generateBuiltinSum1Code,
     generateBuiltinSum2Code,
@@ -68,6 +81,7 @@ from .BuiltinCodes import (
     generateBuiltinXrange1Code,
     generateBuiltinXrange2Code,
     generateBuiltinXrange3Code,
+    generateBuiltinZipCode,
 )
 from .CallCodes import generateCallCode, getCallsCode, getCallsDecls
 from .ClassCodes import generateBuiltinSuperCode, generateSelectMetaclassCode
@@ -128,6 +142,7 @@ from .FunctionCodes import (
     getExportScopeCode,
     getFunctionCode,
     getFunctionDirectDecl,
+    getFunctionImplDecl,
 )
 from .GeneratorCodes import (
     generateMakeGeneratorObjectCode,
@@ -159,6 +174,7 @@ from .IteratorCodes import (
     generateBuiltinIter1Code,
     generateBuiltinIter2Code,
     generateBuiltinIterForUnpackCode,
+    generateBuiltinIterRangeCode,
     generateBuiltinLenCode,
     generateBuiltinNext1Code,
     generateBuiltinNext2Code,
@@ -338,6 +354,11 @@ def generateFunctionBodyCode(function_body, context):
     else:
         parameters = function_body.getParameters()
 
+        if function_context.isForCreatedFunction():
+            cross_module = function_body.isCrossModuleCalled()
+        else:
+            cross_module = function_body.isCrossModuleUsed()
+
         function_code = getFunctionCode(
             context=function_context,
             function_identifier=function_identifier,
@@ -348,9 +369,7 @@ def generateFunctionBodyCode(function_body, context):
             temp_variables=function_body.getTempVariables(),
             function_doc=function_body.getDoc(),
             needs_exception_exit=needs_exception_exit,
-            file_scope=getExportScopeCode(
-                cross_module=function_body.isCrossModuleUsed()
-            ),
+            file_scope=getExportScopeCode(cross_module=cross_module),
         )
 
     return function_code, function_context
@@ -385,6 +404,13 @@ def _generateFunctionDeclCode(function_body, context):
             ),
             context=context,
         )
+    elif function_body.needsCreation():
+        return getFunctionImplDecl(
+            function_identifier=function_body.getCodeName(),
+            file_scope=getExportScopeCode(
+                cross_module=function_body.isCrossModuleCalled()
+            ),
+        )
     else:
         return None
 
@@ -442,6 +468,18 @@ def prepareModuleCode(global_context, module, module_name):
 
         function_decl_codes.append(function_decl)
 
+    # These are for functions of other modules called directly, with the
+    # called value checked at run time.
+    for function_body in module.getCrossCalledFunctions():
+        assert function_body.isCrossModuleCalled()
+
+        function_decl = getFunctionImplDecl(
+            function_identifier=function_body.getCodeName(),
+            file_scope=getExportScopeCode(cross_module=True),
+        )
+
+        function_decl_codes.append(function_decl)
+
     template_values = getModuleValues(
         module_name=module_name,
         module_identifier=module.getCodeName(),
@@ -490,12 +528,27 @@ setExpressionDispatchDict(
         "EXPRESSION_BUILTIN_EVAL": generateEvalCode,
         "EXPRESSION_BUILTIN_EXEC": generateEvalCode,
         "EXPRESSION_BUILTIN_ITER_FOR_UNPACK": generateBuiltinIterForUnpackCode,
+        "EXPRESSION_BUILTIN_ITER_RANGE": generateBuiltinIterRangeCode,
         "EXPRESSION_BUILTIN_ITER1": generateBuiltinIter1Code,
         "EXPRESSION_BUILTIN_ITER2": generateBuiltinIter2Code,
         "EXPRESSION_BUILTIN_NEXT1": generateBuiltinNext1Code,
         "EXPRESSION_BUILTIN_NEXT2": generateBuiltinNext2Code,
         "EXPRESSION_BUILTIN_SUM1": generateBuiltinSum1Code,
         "EXPRESSION_BUILTIN_SUM2": generateBuiltinSum2Code,
+        "EXPRESSION_BUILTIN_ENUMERATE": generateBuiltinEnumerateCode,
+        "EXPRESSION_BUILTIN_ZIP": generateBuiltinZipCode,
+        "EXPRESSION_BUILTIN_REVERSED": generateBuiltinReversedCode,
+        "EXPRESSION_BUILTIN_SORTED": generateBuiltinSortedCode,
+        "EXPRESSION_BUILTIN_MIN1": generateBuiltinMin1Code,
+        "EXPRESSION_BUILTIN_MIN2": generateBuiltinMin2Code,
+        "EXPRESSION_BUILTIN_MAX1": generateBuiltinMax1Code,
+        "EXPRESSION_BUILTIN_MAX2": generateBuiltinMax2Code,
+        "EXPRESSION_BUILTIN_ABS": generateBuiltinAbsCode,
+        "EXPRESSION_BUILTIN_ANY": generateBuiltinAnyCode,
+        "EXPRESSION_BUILTIN_ALL": generateBuiltinAllCode,
+        "EXPRESSION_BUILTIN_ROUND": generateBuiltinRoundCode,
+        "EXPRESSION_BUILTIN_MAP": generateBuiltinMapCode,
+        "EXPRESSION_BUILTIN_FILTER": generateBuiltinFilterCode,
         "EXPRESSION_BUILTIN_TYPE1": generateBuiltinType1Code,
         "EXPRESSION_BUILTIN_TYPE3": generateBuiltinType3Code,
         "EXPRESSION_BUILTIN_IMPORT": generateBuiltinImportCode,
@@ -621,6 +674,7 @@ setExpressionDispatchDict(
         "EXPRESSION_OPERATION_BINARY": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_ADD": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_MULT": generateOperationBinaryCode,
+        "EXPRESSION_OPERATION_BINARY_SUB": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_DIVMOD": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_INPLACE": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_UNARY": generateOperationUnaryCode,
@@ -24,8 +24,13 @@ Rich comparisons, "in", and "not in", also "is", and "is not", and the
 from nuitka.nodes.shapes.BuiltinTypeShapes import ShapeTypeBool
 
 from . import OperatorCodes
-from .CodeHelpers import generateExpressionCode, pickCodeHelper
+from .CodeHelpers import (
+    generateChildExpressionCode,
+    generateExpressionCode,
+    pickCodeHelper,
+)
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCodes
+from .OperationCodes import getNativeOperandsCode
 
 _cmp_obj_result_helpers_set = set(
     (
@@ -88,6 +93,55 @@ _cmp_bool_result_helpers_set = set(
 )
 
 
+def _generateContainingItemsComparisonCode(
+    to_name, expression, left_name, emit, context
+):
+    comparator = expression.getComparator()
+    right = expression.getRight()
+
+    item_names = []
+
+    for element in right.getElements():
+        item_names.append(
+            generateChildExpressionCode(
+                child_name="compexpr_item",
+                expression=element,
+                emit=emit,
+                context=context,
+            )
+        )
+
+    res_name = context.getIntResName()
+
+    emit(
+        """\
+{
+    PyObject *items[] = { %s };
+    %s = SEQUENCE_CONTAINS_ITEMS( %s, items, %d );
+}"""
+        % (
+            ", ".join(str(item_name) for item_name in item_names),
+            res_name,
+            left_name,
+            len(item_names),
+        )
+    )
+
+    getErrorExitBoolCode(
+        condition="%s == -1" % res_name,
+        release_names=[left_name] + item_names,
+        needs_check=right.mayRaiseExceptionIn(BaseException, expression.getLeft()),
+        emit=emit,
+        context=context,
+    )
+
+    to_name.getCType().emitAssignmentCodeFromBoolCondition(
+        to_name=to_name,
+        condition="%s == %d" % (res_name, 1 if comparator == "In" else 0),
+        emit=emit,
+    )
+
+
 def generateComparisonExpressionCode(to_name, expression, emit, context):
     # Currently high complexity, due to manual C typing and doing all
     # in one place, pylint: disable=too-many-branches,too-many-statements
@@ -97,6 +151,47 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
 
     comparator = expression.getComparator()
 
+    # Comparisons of C values for "int", "long", and "float" in local
+    # variables, avoid creating objects for them.
+    if comparator in OperatorCodes.rich_comparison_codes:
+        for c_type in ("nuitka_ilong", "nuitka_float"):
+            operand_codes = getNativeOperandsCode(
+                c_type=c_type, left=left, right=right, emit=emit, context=context
+            )
+
+            if operand_codes is not None:
+                break
+
+        if operand_codes is not None:
+            suffix, left_code, right_code, release_names = operand_codes
+
+            res_name = context.getIntResName()
+
+            emit(
+                "%s = RICH_COMPARE_BOOL_%s( %s, %s, Py_%s );"
+                % (
+                    res_name,
+                    suffix,
+                    left_code,
+                    right_code,
+                    OperatorCodes.rich_comparison_codes[comparator],
+                )
+            )
+
+            getErrorExitBoolCode(
+                condition="%s == -1" % res_name,
+                release_names=release_names,
+                needs_check=expression.mayRaiseExceptionComparison(),
+                emit=emit,
+                context=context,
+            )
+
+            to_name.getCType().emitAssignmentCodeFromBoolCondition(
+                to_name=to_name, condition="%s != 0" % res_name, emit=emit
+            )
+
+            return
+
     type_name = "PyObject *"
     if comparator in ("Is", "IsNot"):
         if (
@@ -106,11 +201,27 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
             type_name = "nuitka_bool"
 
     left_name = context.allocateTempName("compexpr_left", type_name=type_name)
-    right_name = context.allocateTempName("compexpr_right", type_name=type_name)
 
     generateExpressionCode(
         to_name=left_name, expression=left, emit=emit, context=context
     )
+
+    # Tests against a tuple or list made for only that, need not create it.
+    if comparator in OperatorCodes.containing_comparison_codes and (
+        right.isExpressionMakeTuple() or right.isExpressionMakeList()
+    ):
+        _generateContainingItemsComparisonCode(
+            to_name=to_name,
+            expression=expression,
+            left_name=left_name,
+            emit=emit,
+            context=context,
+        )
+
+        return
+
+    right_name = context.allocateTempName("compexpr_right", type_name=type_name)
+
     generateExpressionCode(
         to_name=right_name, expression=right, emit=emit, context=context
     )
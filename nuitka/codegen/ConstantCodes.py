@@ -23,7 +23,8 @@ program.
 
 There are shared constants, which are created for multiple modules to use, you
 can think of them as globals. And there are module local constants, which are
-for a single module only.
+for a single module only. Shared constants only used by compiled modules are
+created when the first of these modules is initialized.
 
 """
 
@@ -49,7 +50,12 @@ from nuitka.Version import getNuitkaVersion
 from .BlobCodes import StreamData
 from .Emission import SourceCodeCollector
 from .Indentation import indented
-from .templates.CodeTemplatesConstants import template_constants_reading
+from .templates.CodeTemplatesConstants import (
+    template_constants_group,
+    template_constants_group_check,
+    template_constants_reading,
+    template_module_shared_constants,
+)
 
 
 def generateConstantReferenceCode(to_name, expression, emit, context):
@@ -836,7 +842,7 @@ CHECK_OBJECT( const_int_pos_1 );
     assert False, (type(constant_value), constant_value, constant_identifier)
 
 
-def getConstantsInitCode(context):
+def getConstantsInitCode(context, lazy_constants=()):
     emit = SourceCodeCollector()
 
     check = SourceCodeCollector()
@@ -847,6 +853,10 @@ def getConstantsInitCode(context):
     )
 
     for constant_identifier, constant_value in sorted_constants:
+        # These are created when the first module using them is initialized.
+        if constant_identifier in lazy_constants:
+            continue
+
         _addConstantInitCode(
             emit=emit,
             check=check,
@@ -899,6 +909,30 @@ def getConstantAccess(to_name, constant, emit, context):
     if to_name.c_type == "nuitka_bool" and Options.isDebug():
         info("Missing optimization for constant to C bool.")
 
+    # The object is only created when the value escapes. Limited to what a C
+    # "long" holds on all platforms, larger ones are rare anyway.
+    if (
+        to_name.c_type == "nuitka_ilong"
+        and type(constant) is int
+        and -2 ** 31 < constant < 2 ** 31
+    ):
+        to_name.getCType().emitAssignmentCodeFromConstant(
+            to_name=to_name, constant=constant, emit=emit
+        )
+
+        return
+
+    if (
+        to_name.c_type == "nuitka_float"
+        and type(constant) is float
+        and -float("inf") < constant < float("inf")
+    ):
+        to_name.getCType().emitAssignmentCodeFromConstant(
+            to_name=to_name, constant=constant, emit=emit
+        )
+
+        return
+
     if type(constant) is dict:
         if constant:
             for key, value in iterItems(constant):
@@ -1006,9 +1040,9 @@ def getConstantInitCodes(module_context):
     inits = SourceCodeCollector()
     checks = SourceCodeCollector()
 
-    sorted_constants = sorted(
-        module_context.getConstants(), key=lambda k: (len(k[0]), k[0])
-    )
+    # Sort for deterministic output, independent of the order constants got
+    # used in, which also differs for modules taken from the cache.
+    sorted_constants = sorted(module_context.getConstants(), key=lambda k: (len(k), k))
 
     global_context = module_context.global_context
 
@@ -1085,14 +1119,147 @@ def allocateNestedConstants(module_context):
             considerForDeferral(builtin_named_values[constant_value])
 
 
-def getConstantsDefinitionCode(context):
+def _getLazyConstantUsers(context, module_contexts):
+    """ Find the shared constants only used by compiled modules.
+
+        These need not be created at program start, but only when the first
+        module using them is initialized. Constants used by the helper code
+        or the internal module have a higher use count than modules using
+        them, and must be created at start.
+
+        Returns a dictionary of constant identifiers to the set of module
+        code names using them.
+    """
+
+    result = {}
+
+    for module_context in module_contexts:
+        if module_context.getOwner().isInternalModule():
+            continue
+
+        for constant_identifier in module_context.getConstants():
+            if not constant_identifier.startswith("const_"):
+                continue
+
+            if context.getConstantUseCount(constant_identifier) == 1:
+                continue
+
+            if constant_identifier not in result:
+                result[constant_identifier] = set()
+
+            result[constant_identifier].add(module_context.getModuleCodeName())
+
+    return dict(
+        (constant_identifier, frozenset(module_code_names))
+        for constant_identifier, module_code_names in iterItems(result)
+        if context.getConstantUseCount(constant_identifier) == len(module_code_names)
+    )
+
+
+def _getLazyConstantsCode(context, module_contexts, lazy_constant_users):
+    """ Create code for the lazy creation of shared constants.
+
+        Constants used by the same set of modules are created together in a
+        group. Nested constants are used by at least the modules using their
+        container, so creating groups of more modules first, makes sure that
+        these exist already.
+    """
+
+    groups = {}
+
+    for constant_identifier, module_code_names in iterItems(lazy_constant_users):
+        if module_code_names not in groups:
+            groups[module_code_names] = []
+
+        groups[module_code_names].append(constant_identifier)
+
+    sorted_groups = sorted(
+        groups,
+        key=lambda module_code_names: (
+            -len(module_code_names),
+            sorted(module_code_names),
+        ),
+    )
+
+    group_codes = []
+    group_checks = []
+    module_group_calls = dict(
+        (module_context.getModuleCodeName(), []) for module_context in module_contexts
+    )
+
+    constants = context.getConstants()
+
+    for group_index, module_code_names in enumerate(sorted_groups):
+        emit = SourceCodeCollector()
+        check = SourceCodeCollector()
+
+        for constant_identifier in sorted(
+            groups[module_code_names], key=lambda k: (len(k), k)
+        ):
+            constant_value = constants[constant_identifier]
+
+            _addConstantInitCode(
+                emit=emit,
+                check=check,
+                constant_type=type(constant_value),
+                constant_value=constant_value,
+                constant_identifier=constant_identifier,
+                module_level=False,
+                context=context,
+            )
+
+        group_codes.append(
+            template_constants_group
+            % {"group_index": group_index, "constant_inits": indented(emit.codes)}
+        )
+
+        if check.codes:
+            group_checks.append(
+                template_constants_group_check
+                % {
+                    "group_index": group_index,
+                    "constant_checks": indented(check.codes, 2),
+                }
+            )
+
+        for module_code_name in sorted(module_code_names):
+            module_group_calls[module_code_name].append(
+                "createConstantsGroup%d();" % group_index
+            )
+
+    for module_code_name, group_calls in sorted(iterItems(module_group_calls)):
+        group_codes.append(
+            template_module_shared_constants
+            % {
+                "module_identifier": module_code_name,
+                "group_calls": indented(group_calls),
+            }
+        )
+
+    return group_codes, group_checks
+
+
+def getConstantsDefinitionCode(context, module_contexts):
     """ Create the code code "__constants.c" file.
 
         This needs to create code to make all global constants (used in more
-        than one module) and create them.
+        than one module) and create them. Where only compiled modules use
+        them, that is delayed until the first of them is initialized.
 
     """
-    constant_inits, constant_checks = getConstantsInitCode(context=context)
+    lazy_constant_users = _getLazyConstantUsers(
+        context=context, module_contexts=module_contexts
+    )
+
+    constant_inits, constant_checks = getConstantsInitCode(
+        context=context, lazy_constants=lazy_constant_users
+    )
+
+    lazy_constants_codes, lazy_constants_checks = _getLazyConstantsCode(
+        context=context,
+        module_contexts=module_contexts,
+        lazy_constant_users=lazy_constant_users,
+    )
 
     constant_declarations = getConstantsDeclCode(context=context)
 
@@ -1127,6 +1294,8 @@ def getConstantsDefinitionCode(context):
         "constant_declarations": "\n".join(constant_declarations),
         "constant_inits": indented(constant_inits),
         "constant_checks": indented(constant_checks),
+        "lazy_constants_codes": "\n".join(lazy_constants_codes),
+        "lazy_constants_checks": "\n".join(lazy_constants_checks),
         "sys_executable": sys_executable,
         "sys_prefix": sys_prefix,
         "sys_base_prefix": sys_base_prefix,
@@ -614,6 +614,10 @@ def _getConstantDefaultPopulation():
         "bytearray",
         "staticmethod",
         "classmethod",
+        # Method called by "sorted" built-in if arguments are given.
+        "sort",
+        # Called by the "round" built-in helper, if not a number.
+        "round",
         # Arguments of __import__ built-in used in helper code.
         "name",
         "globals",
@@ -663,9 +667,13 @@ def _getConstantDefaultPopulation():
         # For patching Python2 "sys" attributes for current exception
         result += ("exc_type", "exc_value", "exc_traceback")
 
-    # The xrange built-in is Python2 only.
+    # The xrange built-in is Python2 only, and "zip", "map", and "filter" are
+    # called for Python2 only.
     if python_version < 300:
         result.append("xrange")
+        result.append("zip")
+        result.append("map")
+        result.append("filter")
 
     # Executables only
     if not Options.shallMakeModule():
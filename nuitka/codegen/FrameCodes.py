@@ -212,6 +212,8 @@ def getTypeSizeOf(type_indicator):
         return "sizeof(nuitka_bool)"
     elif type_indicator == "L":
         return "sizeof(nuitka_ilong)"
+    elif type_indicator == "F":
+        return "sizeof(nuitka_float)"
     else:
         assert False, type_indicator
 
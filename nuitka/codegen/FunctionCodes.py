@@ -42,6 +42,7 @@ from .templates.CodeTemplatesFunction import (
     template_function_body,
     template_function_direct_declaration,
     template_function_exception_exit,
+    template_function_impl_declaration,
     template_function_make_declaration,
     template_function_return_exit,
     template_make_function,
@@ -435,6 +436,15 @@ def getFunctionDirectDecl(function_identifier, closure_variables, file_scope, co
     return result
 
 
+def getFunctionImplDecl(function_identifier, file_scope):
+    # Created functions are called directly from known call sites, which may
+    # come before their definition, or be in other modules.
+    return template_function_impl_declaration % {
+        "file_scope": file_scope,
+        "function_identifier": function_identifier,
+    }
+
+
 def setupFunctionLocalVariables(
     context, parameters, closure_variables, user_variables, temp_variables
 ):
@@ -637,6 +647,7 @@ def _getFunctionCode(
         }
     else:
         result += template_function_body % {
+            "file_scope": file_scope,
             "function_identifier": function_identifier,
             "parameter_objects_decl": ", ".join(parameter_objects_decl),
             "function_locals": indented(function_locals),
@@ -20,6 +20,7 @@
 Next variants and unpacking with related checks.
 """
 
+from nuitka.nodes.shapes.BuiltinTypeShapes import ShapeTypeList
 from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import (
@@ -28,7 +29,9 @@ from .CodeHelpers import (
     generateExpressionCode,
     withObjectCodeTemporaryAssignment,
 )
+from .ConstantCodes import max_unsigned_long, min_signed_long
 from .ErrorCodes import (
+    getErrorExitBoolCode,
     getErrorExitCode,
     getErrorExitReleaseCode,
     getFrameVariableTypeDescriptionCode,
@@ -66,7 +69,15 @@ def generateBuiltinNext1Code(to_name, expression, emit, context):
 
 
 def getBuiltinLoopBreakNextCode(to_name, value, emit, context):
-    emit("%s = %s;" % (to_name, "ITERATOR_NEXT( %s )" % value))
+    if value.c_type == "nuitka_range_iterator":
+        if to_name.c_type == "nuitka_ilong":
+            condition = "!RANGE_ITERATOR_NEXT_ILONG( &%s, &%s )" % (value, to_name)
+        else:
+            emit("%s = RANGE_ITERATOR_NEXT( &%s );" % (to_name, value))
+            condition = "%s == NULL" % to_name
+    else:
+        emit("%s = %s;" % (to_name, "ITERATOR_NEXT( %s )" % value))
+        condition = "%s == NULL" % to_name
 
     getReleaseCode(release_name=value, emit=emit, context=context)
 
@@ -84,7 +95,7 @@ def getBuiltinLoopBreakNextCode(to_name, value, emit, context):
     emit(
         template_loop_break_next
         % {
-            "to_name": to_name,
+            "condition": condition,
             "break_indicator_code": break_indicator_code,
             "break_target": break_target,
             "release_temps": indented(getErrorExitReleaseCode(context), 2),
@@ -99,7 +110,8 @@ def getBuiltinLoopBreakNextCode(to_name, value, emit, context):
         }
     )
 
-    context.addCleanupTempName(to_name)
+    if to_name.c_type == "PyObject *":
+        context.addCleanupTempName(to_name)
 
 
 def generateSpecialUnpackCode(to_name, expression, emit, context):
@@ -220,6 +232,97 @@ def generateBuiltinIter1Code(to_name, expression, emit, context):
     )
 
 
+def _getConstantRangeCounter(constant):
+    """ Start, step, and count of a constant range, if C values can do it. """
+
+    try:
+        count = len(constant)
+    except OverflowError:
+        return None
+
+    if count == 0:
+        return 0, 1, 0
+
+    start = constant[0]
+    step = constant[1] - start if count > 1 else 1
+
+    # The last value is computed by adding the step, it must fit as well.
+    last = start + (count - 1) * step
+
+    for value in (start, step, last):
+        if not min_signed_long <= value <= -min_signed_long:
+            return None
+
+    if count > max_unsigned_long:
+        return None
+
+    return start, step, count
+
+
+def generateBuiltinIterRangeCode(to_name, expression, emit, context):
+    # Only loops that count with C values use it, others get an object.
+    if to_name.c_type != "nuitka_range_iterator":
+        generateBuiltinIter1Code(
+            to_name=to_name, expression=expression, emit=emit, context=context
+        )
+        return
+
+    value = expression.getValue()
+
+    if value.isExpressionConstantXrangeRef():
+        counter = _getConstantRangeCounter(value.getConstant())
+
+        if counter is None:
+            # Converted from an iterator object then.
+            generateBuiltinIter1Code(
+                to_name=to_name, expression=expression, emit=emit, context=context
+            )
+        else:
+            emit(
+                "SET_RANGE_ITERATOR_COUNTER(&%s, %dL, %dL, %dUL);"
+                % ((to_name,) + counter)
+            )
+
+        return
+
+    arg_names = generateChildExpressionsCode(
+        expression=value, emit=emit, context=context
+    )
+
+    # One argument is the high value, the step is optional.
+    if len(arg_names) == 1:
+        low_name, high_name, step_name = "NULL", arg_names[0], "NULL"
+    elif len(arg_names) == 2:
+        low_name, high_name = arg_names
+        step_name = "NULL"
+    else:
+        low_name, high_name, step_name = arg_names
+
+    context.setCurrentSourceCodeReference(value.getCompatibleSourceReference())
+
+    res_name = context.getBoolResName()
+
+    emit(
+        "%s = MAKE_RANGE_ITERATOR(&%s, %s, %s, %s, %s);"
+        % (
+            res_name,
+            to_name,
+            low_name,
+            high_name,
+            step_name,
+            "true" if value.getTypeShape() is ShapeTypeList else "false",
+        )
+    )
+
+    getErrorExitBoolCode(
+        condition="%s == false" % res_name,
+        release_names=arg_names,
+        needs_check=expression.mayRaiseException(BaseException),
+        emit=emit,
+        context=context,
+    )
+
+
 def generateBuiltinIterForUnpackCode(to_name, expression, emit, context):
     generateCAPIObjectCode(
         to_name=to_name,
@@ -21,7 +21,9 @@ This is for generating the look-up table for the modules included in a binary
 or distribution folder.
 """
 
+import zlib
 
+from nuitka import Options
 from nuitka.ModuleRegistry import getUncompiledNonTechnicalModules
 
 from . import ConstantCodes
@@ -60,35 +62,61 @@ def getModuleMetapathLoaderEntryCode(
 stream_data = ConstantCodes.stream_data
 
 
+def _getLoaderEntrySortKey(module_name):
+    # The loader searches the table with "strcmp", so sort by the bytes.
+    if str is not bytes:
+        module_name = module_name.encode("utf8")
+
+    return module_name
+
+
+def _getBytecodeModuleEntryCode(module_name, code_data, is_package):
+    flags = ["NUITKA_BYTECODE_FLAG"]
+    if is_package:
+        flags.append("NUITKA_PACKAGE_FLAG")
+
+    if Options.shallCompressBytecode():
+        compressed_data = zlib.compress(code_data, 9)
+
+        # Tiny modules may not become smaller.
+        if len(compressed_data) < len(code_data):
+            code_data = compressed_data
+            flags.append("NUITKA_COMPRESSED_FLAG")
+
+    return template_metapath_loader_bytecode_module_entry % {
+        "module_name": module_name,
+        "bytecode": stream_data.getStreamDataOffset(code_data),
+        "size": len(code_data),
+        "flags": " | ".join(flags),
+    }
+
+
 def getMetapathLoaderBodyCode(other_modules):
     metapath_loader_inittab = []
     metapath_module_decls = []
 
     for other_module in other_modules:
         if other_module.isUncompiledPythonModule():
-            code_data = other_module.getByteCode()
-            is_package = other_module.isUncompiledPythonPackage()
-
-            flags = ["NUITKA_BYTECODE_FLAG"]
-            if is_package:
-                flags.append("NUITKA_PACKAGE_FLAG")
-
             metapath_loader_inittab.append(
-                template_metapath_loader_bytecode_module_entry
-                % {
-                    "module_name": other_module.getFullName(),
-                    "bytecode": stream_data.getStreamDataOffset(code_data),
-                    "size": len(code_data),
-                    "flags": " | ".join(flags),
-                }
+                (
+                    other_module.getFullName(),
+                    _getBytecodeModuleEntryCode(
+                        module_name=other_module.getFullName(),
+                        code_data=other_module.getByteCode(),
+                        is_package=other_module.isUncompiledPythonPackage(),
+                    ),
+                )
             )
         else:
             metapath_loader_inittab.append(
-                getModuleMetapathLoaderEntryCode(
-                    module_name=other_module.getFullName(),
-                    module_identifier=other_module.getCodeName(),
-                    is_shlib=other_module.isPythonShlibModule(),
-                    is_package=other_module.isCompiledPythonPackage(),
+                (
+                    other_module.getFullName(),
+                    getModuleMetapathLoaderEntryCode(
+                        module_name=other_module.getFullName(),
+                        module_identifier=other_module.getCodeName(),
+                        is_shlib=other_module.isPythonShlibModule(),
+                        is_package=other_module.isCompiledPythonPackage(),
+                    ),
                 )
             )
 
@@ -98,24 +126,24 @@ def getMetapathLoaderBodyCode(other_modules):
             )
 
     for uncompiled_module in getUncompiledNonTechnicalModules():
-        code_data = uncompiled_module.getByteCode()
-        is_package = uncompiled_module.isUncompiledPythonPackage()
-
-        flags = ["NUITKA_BYTECODE_FLAG"]
-        if is_package:
-            flags.append("NUITKA_PACKAGE_FLAG")
-
         metapath_loader_inittab.append(
-            template_metapath_loader_bytecode_module_entry
-            % {
-                "module_name": uncompiled_module.getFullName(),
-                "bytecode": stream_data.getStreamDataOffset(code_data),
-                "size": len(code_data),
-                "flags": " | ".join(flags),
-            }
+            (
+                uncompiled_module.getFullName(),
+                _getBytecodeModuleEntryCode(
+                    module_name=uncompiled_module.getFullName(),
+                    code_data=uncompiled_module.getByteCode(),
+                    is_package=uncompiled_module.isUncompiledPythonPackage(),
+                ),
+            )
         )
 
+    # The loader uses bisection to find entries, so they must be sorted. The
+    # sort is stable, so for duplicate names, the first entry still wins.
+    metapath_loader_inittab.sort(key=lambda entry: _getLoaderEntrySortKey(entry[0]))
+
     return template_metapath_loader_body % {
         "metapath_module_decls": indented(metapath_module_decls, 0),
-        "metapath_loader_inittab": indented(metapath_loader_inittab),
+        "metapath_loader_inittab": indented(
+            entry_code for _module_name, entry_code in metapath_loader_inittab
+        ),
     }
@@ -0,0 +1,287 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistent cache for the generated C code of compiled modules.
+
+The C code of a module is determined by its optimized node tree, the Nuitka
+and Python versions, and the options that influence code generation. When all
+of these are unchanged, the prepared template values of a previous compilation
+can be used instead of running code generation again.
+
+Constants are only referenced by the module code, their declaration and
+creation is decided globally when writing the files, therefore we store the
+constant values used, and register them again when using a cache entry.
+"""
+
+import marshal
+import os
+import pickle
+import re
+import sys
+from logging import info
+
+from nuitka import Options
+from nuitka.Constants import isMarshalPreserved
+from nuitka.PythonVersions import python_version
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import makePath
+from nuitka.utils.Hashing import Hash, getFileContentsHash
+from nuitka.Version import getNuitkaVersion
+
+from . import Contexts
+from .CallCodes import addQuickCallsUsed
+
+_call_function_with_args_re = re.compile(r"\bCALL_FUNCTION_WITH_ARGS(\d+)\(")
+_call_method_with_args_re = re.compile(r"\bCALL_METHOD_WITH_ARGS(\d+)\(")
+
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _getCacheDirectory():
+    result = os.path.join(getCacheDir(), "module_codes")
+
+    makePath(result)
+
+    return result
+
+
+def _getOptionsCacheValues():
+    """ The option values that have an influence on generated module code. """
+
+    return (
+        Options.isDebug(),
+        Options.isFullCompat(),
+        Options.shallTraceExecution(),
+        Options.isProfile(),
+        Options.isStandaloneMode(),
+        Options.shallMakeModule(),
+        Options.getFileReferenceMode(),
+        sorted(Options.getPythonFlags()),
+        sorted(Options.getExperimentalIndications()),
+    )
+
+
+def _getModuleCacheKey(module):
+    key = Hash()
+
+    key.updateFromValues(
+        getNuitkaVersion(),
+        sys.version,
+        sys.platform,
+        python_version,
+        _getOptionsCacheValues(),
+        module.getFullName(),
+    )
+
+    source_filename = module.getCompileTimeFilename()
+    if os.path.isfile(source_filename):
+        key.updateFromValues(getFileContentsHash(source_filename))
+
+    # The optimized tree is what code generation works on, and exported
+    # functions are declared differently.
+    key.updateFromValues(
+        module.asXmlText(),
+        sorted(
+            function_body.getCodeName()
+            for function_body in module.getCrossUsedFunctions()
+        ),
+        sorted(
+            function_body.getCodeName()
+            for function_body in module.getUsedFunctions()
+            if function_body.isExpressionFunctionBody()
+            and function_body.isCrossModuleCalled()
+        ),
+    )
+
+    # Direct calls into other modules depend on their functions.
+    key.updateFromValues(
+        sorted(
+            (
+                function_body.getCodeName(),
+                function_body.needsCreation(),
+                function_body.getParameters().getArgumentCount(),
+            )
+            for function_body in module.getCrossCalledFunctions()
+        )
+    )
+
+    return key.asHexDigest()
+
+
+def _getCacheFilename(module):
+    return os.path.join(_getCacheDirectory(), _getModuleCacheKey(module))
+
+
+def _getQuickCallsUsed(template_values):
+    quick_calls = set()
+    quick_instance_calls = set()
+
+    for value in template_values.values():
+        if type(value) is not str:
+            continue
+
+        quick_calls.update(
+            int(arg_count) for arg_count in _call_function_with_args_re.findall(value)
+        )
+        quick_instance_calls.update(
+            int(arg_count) for arg_count in _call_method_with_args_re.findall(value)
+        )
+
+    return quick_calls, quick_instance_calls
+
+
+def _encodeConstant(constant_value):
+    # Marshal preserves the interning of strings, which pickle does not, and
+    # that matters for the marshal data of constants written later.
+    if isMarshalPreserved(constant_value):
+        try:
+            return True, marshal.dumps(constant_value)
+        except ValueError:
+            pass
+
+    return False, constant_value
+
+
+def _loadModuleCode(global_context, module, module_name, cache_filename):
+    with open(cache_filename, "rb") as cache_file:
+        cache_entry = pickle.load(cache_file)
+
+    context = Contexts.PythonModuleContext(
+        module=module,
+        module_name=module_name,
+        code_name=module.getCodeName(),
+        filename=module.getFilename(),
+        global_context=global_context,
+    )
+
+    # Register the constants again, as if code generation had used them.
+    for is_marshal, constant_value in cache_entry["constants"]:
+        if is_marshal:
+            constant_value = marshal.loads(constant_value)
+
+        context.getConstantCode(constant_value)
+
+    if cache_entry["needs_module_filename_object"]:
+        context.markAsNeedsModuleFilenameObject()
+
+    addQuickCallsUsed(
+        quick_calls=cache_entry["quick_calls"],
+        quick_instance_calls=cache_entry["quick_instance_calls"],
+    )
+
+    return cache_entry["template_values"], context
+
+
+def _storeModuleCode(template_values, module_context, cache_filename):
+    quick_calls, quick_instance_calls = _getQuickCallsUsed(template_values)
+
+    constants = module_context.global_context.getConstants()
+
+    cache_entry = {
+        "template_values": template_values,
+        "constants": [
+            _encodeConstant(constants[constant_identifier])
+            for constant_identifier in sorted(module_context.getConstants())
+        ],
+        "needs_module_filename_object": module_context.needsModuleFilenameObject(),
+        "quick_calls": quick_calls,
+        "quick_instance_calls": quick_instance_calls,
+    }
+
+    try:
+        cache_data = pickle.dumps(cache_entry, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Some constant values, e.g. "Ellipsis" on Python2, cannot be pickled,
+        # these modules are then simply not cached.
+        return
+
+    # Write to a temporary file first, so a concurrent compilation never sees
+    # a partial cache entry.
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    with open(temp_filename, "wb") as cache_file:
+        cache_file.write(cache_data)
+
+    os.rename(temp_filename, cache_filename)
+
+
+def prepareModuleCodeCached(global_context, module, module_name, prepare_function):
+    """ Prepare module code, using the cache if possible.
+
+    Args:
+        global_context: the global context for code generation
+        module: the compiled module node, already optimized
+        module_name: the full name of the module
+        prepare_function: function to call for actual code generation
+    Returns:
+        tuple of template values and module context, like "prepare_function"
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _cache_hits, _cache_misses
+
+    # Internal modules have their constants forced global, and are created
+    # from scratch each time, no need to cache them.
+    if module.isInternalModule():
+        return prepare_function(
+            global_context=global_context, module=module, module_name=module_name
+        )
+
+    cache_filename = _getCacheFilename(module)
+
+    if os.path.exists(cache_filename):
+        try:
+            result = _loadModuleCode(
+                global_context=global_context,
+                module=module,
+                module_name=module_name,
+                cache_filename=cache_filename,
+            )
+        except (
+            EOFError,
+            KeyError,
+            ValueError,
+            AttributeError,
+            ImportError,
+            pickle.UnpicklingError,
+        ):
+            # Broken cache entries are ignored and overwritten.
+            pass
+        else:
+            _cache_hits += 1
+
+            return result
+
+    _cache_misses += 1
+
+    template_values, module_context = prepare_function(
+        global_context=global_context, module=module, module_name=module_name
+    )
+
+    _storeModuleCode(
+        template_values=template_values,
+        module_context=module_context,
+        cache_filename=cache_filename,
+    )
+
+    return template_values, module_context
+
+
+def reportModuleCodeCacheStatistics():
+    if Options.isShowProgress():
+        info("Module code cache: %d hits, %d misses." % (_cache_hits, _cache_misses))
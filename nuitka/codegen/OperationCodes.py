@@ -26,13 +26,177 @@ in-place assignments, which have other operation variants.
 from . import OperatorCodes
 from .CodeHelpers import (
     generateChildExpressionsCode,
+    generateExpressionCode,
     pickCodeHelper,
     withObjectCodeTemporaryAssignment,
 )
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode
+from .VariableCodes import getLocalVariableDeclaration
+
+
+def _getNativeOperandCode(expression, c_type, context):
+    if expression.isExpressionConstantIntRef():
+        constant = expression.getConstant()
+
+        if c_type == "nuitka_ilong" and -2 ** 31 < constant < 2 ** 31:
+            return "CLONG", "%dL" % constant
+
+        # Converted to "double" exactly, which is what "float" does too.
+        if c_type == "nuitka_float" and -2 ** 53 < constant < 2 ** 53:
+            return "CDOUBLE", repr(float(constant))
+    elif expression.isExpressionConstantFloatRef():
+        constant = expression.getConstant()
+
+        # Infinity and NaN have no literals.
+        if c_type == "nuitka_float" and -float("inf") < constant < float("inf"):
+            return "CDOUBLE", repr(constant)
+    elif (
+        expression.isExpressionVariableRef() or expression.isExpressionTempVariableRef()
+    ):
+        variable = expression.getVariable()
+
+        if variable.isModuleVariable() or expression.mayRaiseException(BaseException):
+            return None
+
+        variable_declaration = getLocalVariableDeclaration(
+            context, variable, expression.getVariableTrace()
+        )
+
+        if variable_declaration.c_type == c_type:
+            return _native_value_codes[c_type], "&%s" % variable_declaration
+
+    return None
+
+
+# Helper name parts for C types of local variables with C values.
+_native_value_codes = {"nuitka_ilong": "ILONG", "nuitka_float": "NFLOAT"}
+
+
+def getNativeOperandsCode(c_type, left, right, emit, context):
+    """ Get code for two operands to use with helpers for C values.
+
+    One operand must be a local variable of the C type "nuitka_ilong" or
+    "nuitka_float" given, the other one can also be a C constant, or an
+    object, for which code is generated.
+
+    Returns:
+        Tuple of helper name suffix, the operand codes, and the names to
+        release after use, or None if not possible.
+    """
+
+    value_code = _native_value_codes[c_type]
+
+    left_code = _getNativeOperandCode(left, c_type, context)
+    right_code = _getNativeOperandCode(right, c_type, context)
+
+    if left_code is None:
+        if right_code is None or right_code[0] != value_code:
+            return None
+    elif right_code is None:
+        # The variable is read after the right operand is evaluated, which
+        # must therefore not be able to change it.
+        if left_code[0] != value_code or right.mayHaveSideEffects():
+            return None
+    elif left_code[0] != value_code and right_code[0] != value_code:
+        # Constant folding would have dealt with it.
+        return None
+
+    release_names = []
+
+    if left_code is None:
+        left_name = context.allocateTempName("operand_left")
+
+        generateExpressionCode(
+            to_name=left_name, expression=left, emit=emit, context=context
+        )
+
+        left_code = "OBJECT", left_name
+        release_names.append(left_name)
+
+    if right_code is None:
+        right_name = context.allocateTempName("operand_right")
+
+        generateExpressionCode(
+            to_name=right_name, expression=right, emit=emit, context=context
+        )
+
+        right_code = "OBJECT", right_name
+        release_names.append(right_name)
+
+    return (
+        "%s_%s" % (left_code[0], right_code[0]),
+        left_code[1],
+        right_code[1],
+        release_names,
+    )
+
+
+# Operations done on C values, for "int" and "long" only the ones that
+# can check for overflow cheaply.
+_native_operation_helpers = {
+    "nuitka_ilong": {"Add": "ADD", "IAdd": "ADD", "Sub": "SUB", "ISub": "SUB"},
+    "nuitka_float": {
+        "Add": "ADD",
+        "IAdd": "ADD",
+        "Sub": "SUB",
+        "ISub": "SUB",
+        "Mult": "MUL",
+        "IMult": "MUL",
+    },
+}
+
+
+def _getNativeBinaryOperationCode(to_name, expression, emit, context):
+    operand_codes = getNativeOperandsCode(
+        c_type=to_name.c_type,
+        left=expression.getLeft(),
+        right=expression.getRight(),
+        emit=emit,
+        context=context,
+    )
+
+    if operand_codes is None:
+        return False
+
+    suffix, left_code, right_code, release_names = operand_codes
+
+    res_name = context.getBoolResName()
+
+    emit(
+        "%s = BINARY_OPERATION_%s_%s( &%s, %s, %s );"
+        % (
+            res_name,
+            _native_operation_helpers[to_name.c_type][expression.getOperator()],
+            suffix,
+            to_name,
+            left_code,
+            right_code,
+        )
+    )
+
+    getErrorExitBoolCode(
+        condition="%s == false" % res_name,
+        release_names=release_names,
+        needs_check=expression.mayRaiseExceptionOperation(),
+        emit=emit,
+        context=context,
+    )
+
+    return True
 
 
 def generateOperationBinaryCode(to_name, expression, emit, context):
+    # Operations on C values for "int", "long", and "float" in local
+    # variables, avoid creating objects for them.
+    if (
+        to_name.c_type in _native_operation_helpers
+        and expression.getOperator() in _native_operation_helpers[to_name.c_type]
+    ):
+        if _getNativeBinaryOperationCode(
+            to_name=to_name, expression=expression, emit=emit, context=context
+        ):
+            return
+
     left_arg_name, right_arg_name = generateChildExpressionsCode(
         expression=expression, emit=emit, context=context
     )
@@ -40,6 +204,10 @@ def generateOperationBinaryCode(to_name, expression, emit, context):
     # TODO: Decide and use one single spelling, inplace or in_place
     inplace = expression.isInplaceSuspect()
 
+    # The target variable is not an object, so it cannot be updated in-place.
+    if to_name.c_type in _native_operation_helpers:
+        inplace = False
+
     assert not inplace or not expression.getLeft().isCompileTimeConstant(), expression
 
     _getBinaryOperationCode(
@@ -153,6 +321,331 @@ _iadd_helpers_set = set(
     )
 )
 
+_sub_helpers_set = set(
+    (
+        "BINARY_OPERATION_SUB_OBJECT_INT",
+        "BINARY_OPERATION_SUB_INT_OBJECT",
+        "BINARY_OPERATION_SUB_INT_INT",
+        "BINARY_OPERATION_SUB_OBJECT_FLOAT",
+        "BINARY_OPERATION_SUB_FLOAT_OBJECT",
+        "BINARY_OPERATION_SUB_FLOAT_FLOAT",
+        "BINARY_OPERATION_SUB_OBJECT_LONG",
+        "BINARY_OPERATION_SUB_LONG_OBJECT",
+        "BINARY_OPERATION_SUB_LONG_LONG",
+        "BINARY_OPERATION_SUB_FLOAT_LONG",
+        "BINARY_OPERATION_SUB_LONG_FLOAT",
+        "BINARY_OPERATION_SUB_OBJECT_OBJECT",
+    )
+)
+
+_isub_helpers_set = set(
+    (
+        "BINARY_OPERATION_SUB_INT_INT_INPLACE",
+        "BINARY_OPERATION_SUB_FLOAT_FLOAT_INPLACE",
+        "BINARY_OPERATION_SUB_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_SUB_FLOAT_LONG_INPLACE",
+        "BINARY_OPERATION_SUB_LONG_FLOAT_INPLACE",
+        "BINARY_OPERATION_SUB_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_mul_helpers_set = set(
+    (
+        "BINARY_OPERATION_MUL_OBJECT_INT",
+        "BINARY_OPERATION_MUL_INT_OBJECT",
+        "BINARY_OPERATION_MUL_INT_INT",
+        "BINARY_OPERATION_MUL_OBJECT_STR",
+        "BINARY_OPERATION_MUL_STR_OBJECT",
+        "BINARY_OPERATION_MUL_OBJECT_UNICODE",
+        "BINARY_OPERATION_MUL_UNICODE_OBJECT",
+        "BINARY_OPERATION_MUL_OBJECT_FLOAT",
+        "BINARY_OPERATION_MUL_FLOAT_OBJECT",
+        "BINARY_OPERATION_MUL_FLOAT_FLOAT",
+        "BINARY_OPERATION_MUL_OBJECT_TUPLE",
+        "BINARY_OPERATION_MUL_TUPLE_OBJECT",
+        "BINARY_OPERATION_MUL_OBJECT_LIST",
+        "BINARY_OPERATION_MUL_LIST_OBJECT",
+        "BINARY_OPERATION_MUL_OBJECT_BYTES",
+        "BINARY_OPERATION_MUL_BYTES_OBJECT",
+        "BINARY_OPERATION_MUL_OBJECT_LONG",
+        "BINARY_OPERATION_MUL_LONG_OBJECT",
+        "BINARY_OPERATION_MUL_LONG_LONG",
+        "BINARY_OPERATION_MUL_FLOAT_LONG",
+        "BINARY_OPERATION_MUL_LONG_FLOAT",
+        "BINARY_OPERATION_MUL_STR_INT",
+        "BINARY_OPERATION_MUL_STR_LONG",
+        "BINARY_OPERATION_MUL_UNICODE_INT",
+        "BINARY_OPERATION_MUL_UNICODE_LONG",
+        "BINARY_OPERATION_MUL_TUPLE_INT",
+        "BINARY_OPERATION_MUL_TUPLE_LONG",
+        "BINARY_OPERATION_MUL_LIST_INT",
+        "BINARY_OPERATION_MUL_LIST_LONG",
+        "BINARY_OPERATION_MUL_BYTES_LONG",
+        "BINARY_OPERATION_MUL_OBJECT_OBJECT",
+    )
+)
+
+_imul_helpers_set = set(
+    (
+        "BINARY_OPERATION_MUL_INT_INT_INPLACE",
+        "BINARY_OPERATION_MUL_FLOAT_FLOAT_INPLACE",
+        "BINARY_OPERATION_MUL_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_MUL_FLOAT_LONG_INPLACE",
+        "BINARY_OPERATION_MUL_LONG_FLOAT_INPLACE",
+        "BINARY_OPERATION_MUL_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_div_helpers_set = set(
+    (
+        "BINARY_OPERATION_DIV_OBJECT_INT",
+        "BINARY_OPERATION_DIV_INT_OBJECT",
+        "BINARY_OPERATION_DIV_INT_INT",
+        "BINARY_OPERATION_DIV_OBJECT_FLOAT",
+        "BINARY_OPERATION_DIV_FLOAT_OBJECT",
+        "BINARY_OPERATION_DIV_FLOAT_FLOAT",
+        "BINARY_OPERATION_DIV_OBJECT_LONG",
+        "BINARY_OPERATION_DIV_LONG_OBJECT",
+        "BINARY_OPERATION_DIV_LONG_LONG",
+        "BINARY_OPERATION_DIV_FLOAT_LONG",
+        "BINARY_OPERATION_DIV_LONG_FLOAT",
+        "BINARY_OPERATION_DIV_OBJECT_OBJECT",
+    )
+)
+
+_idiv_helpers_set = set(
+    (
+        "BINARY_OPERATION_DIV_INT_INT_INPLACE",
+        "BINARY_OPERATION_DIV_FLOAT_FLOAT_INPLACE",
+        "BINARY_OPERATION_DIV_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_DIV_FLOAT_LONG_INPLACE",
+        "BINARY_OPERATION_DIV_LONG_FLOAT_INPLACE",
+        "BINARY_OPERATION_DIV_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_floordiv_helpers_set = set(
+    (
+        "BINARY_OPERATION_FLOORDIV_OBJECT_INT",
+        "BINARY_OPERATION_FLOORDIV_INT_OBJECT",
+        "BINARY_OPERATION_FLOORDIV_INT_INT",
+        "BINARY_OPERATION_FLOORDIV_OBJECT_FLOAT",
+        "BINARY_OPERATION_FLOORDIV_FLOAT_OBJECT",
+        "BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT",
+        "BINARY_OPERATION_FLOORDIV_OBJECT_LONG",
+        "BINARY_OPERATION_FLOORDIV_LONG_OBJECT",
+        "BINARY_OPERATION_FLOORDIV_LONG_LONG",
+        "BINARY_OPERATION_FLOORDIV_FLOAT_LONG",
+        "BINARY_OPERATION_FLOORDIV_LONG_FLOAT",
+        "BINARY_OPERATION_FLOORDIV_OBJECT_OBJECT",
+    )
+)
+
+_ifloordiv_helpers_set = set(
+    (
+        "BINARY_OPERATION_FLOORDIV_INT_INT_INPLACE",
+        "BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT_INPLACE",
+        "BINARY_OPERATION_FLOORDIV_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_FLOORDIV_FLOAT_LONG_INPLACE",
+        "BINARY_OPERATION_FLOORDIV_LONG_FLOAT_INPLACE",
+        "BINARY_OPERATION_FLOORDIV_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_truediv_helpers_set = set(
+    (
+        "BINARY_OPERATION_TRUEDIV_OBJECT_INT",
+        "BINARY_OPERATION_TRUEDIV_INT_OBJECT",
+        "BINARY_OPERATION_TRUEDIV_INT_INT",
+        "BINARY_OPERATION_TRUEDIV_OBJECT_FLOAT",
+        "BINARY_OPERATION_TRUEDIV_FLOAT_OBJECT",
+        "BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT",
+        "BINARY_OPERATION_TRUEDIV_OBJECT_LONG",
+        "BINARY_OPERATION_TRUEDIV_LONG_OBJECT",
+        "BINARY_OPERATION_TRUEDIV_LONG_LONG",
+        "BINARY_OPERATION_TRUEDIV_FLOAT_LONG",
+        "BINARY_OPERATION_TRUEDIV_LONG_FLOAT",
+        "BINARY_OPERATION_TRUEDIV_OBJECT_OBJECT",
+    )
+)
+
+_itruediv_helpers_set = set(
+    (
+        "BINARY_OPERATION_TRUEDIV_INT_INT_INPLACE",
+        "BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT_INPLACE",
+        "BINARY_OPERATION_TRUEDIV_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_TRUEDIV_FLOAT_LONG_INPLACE",
+        "BINARY_OPERATION_TRUEDIV_LONG_FLOAT_INPLACE",
+        "BINARY_OPERATION_TRUEDIV_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_remainder_helpers_set = set(
+    (
+        "BINARY_OPERATION_REMAINDER_OBJECT_INT",
+        "BINARY_OPERATION_REMAINDER_INT_OBJECT",
+        "BINARY_OPERATION_REMAINDER_INT_INT",
+        "BINARY_OPERATION_REMAINDER_OBJECT_STR",
+        "BINARY_OPERATION_REMAINDER_STR_OBJECT",
+        "BINARY_OPERATION_REMAINDER_OBJECT_UNICODE",
+        "BINARY_OPERATION_REMAINDER_UNICODE_OBJECT",
+        "BINARY_OPERATION_REMAINDER_OBJECT_FLOAT",
+        "BINARY_OPERATION_REMAINDER_FLOAT_OBJECT",
+        "BINARY_OPERATION_REMAINDER_FLOAT_FLOAT",
+        "BINARY_OPERATION_REMAINDER_OBJECT_LONG",
+        "BINARY_OPERATION_REMAINDER_LONG_OBJECT",
+        "BINARY_OPERATION_REMAINDER_LONG_LONG",
+        "BINARY_OPERATION_REMAINDER_FLOAT_LONG",
+        "BINARY_OPERATION_REMAINDER_LONG_FLOAT",
+        "BINARY_OPERATION_REMAINDER_STR_TUPLE",
+        "BINARY_OPERATION_REMAINDER_UNICODE_TUPLE",
+        "BINARY_OPERATION_REMAINDER_OBJECT_OBJECT",
+    )
+)
+
+_iremainder_helpers_set = set(
+    (
+        "BINARY_OPERATION_REMAINDER_INT_INT_INPLACE",
+        "BINARY_OPERATION_REMAINDER_FLOAT_FLOAT_INPLACE",
+        "BINARY_OPERATION_REMAINDER_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_REMAINDER_FLOAT_LONG_INPLACE",
+        "BINARY_OPERATION_REMAINDER_LONG_FLOAT_INPLACE",
+        "BINARY_OPERATION_REMAINDER_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_lshift_helpers_set = set(
+    (
+        "BINARY_OPERATION_LSHIFT_OBJECT_INT",
+        "BINARY_OPERATION_LSHIFT_INT_OBJECT",
+        "BINARY_OPERATION_LSHIFT_INT_INT",
+        "BINARY_OPERATION_LSHIFT_OBJECT_LONG",
+        "BINARY_OPERATION_LSHIFT_LONG_OBJECT",
+        "BINARY_OPERATION_LSHIFT_LONG_LONG",
+        "BINARY_OPERATION_LSHIFT_OBJECT_OBJECT",
+    )
+)
+
+_ilshift_helpers_set = set(
+    (
+        "BINARY_OPERATION_LSHIFT_INT_INT_INPLACE",
+        "BINARY_OPERATION_LSHIFT_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_LSHIFT_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_rshift_helpers_set = set(
+    (
+        "BINARY_OPERATION_RSHIFT_OBJECT_INT",
+        "BINARY_OPERATION_RSHIFT_INT_OBJECT",
+        "BINARY_OPERATION_RSHIFT_INT_INT",
+        "BINARY_OPERATION_RSHIFT_OBJECT_LONG",
+        "BINARY_OPERATION_RSHIFT_LONG_OBJECT",
+        "BINARY_OPERATION_RSHIFT_LONG_LONG",
+        "BINARY_OPERATION_RSHIFT_OBJECT_OBJECT",
+    )
+)
+
+_irshift_helpers_set = set(
+    (
+        "BINARY_OPERATION_RSHIFT_INT_INT_INPLACE",
+        "BINARY_OPERATION_RSHIFT_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_RSHIFT_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_bitand_helpers_set = set(
+    (
+        "BINARY_OPERATION_BITAND_OBJECT_INT",
+        "BINARY_OPERATION_BITAND_INT_OBJECT",
+        "BINARY_OPERATION_BITAND_INT_INT",
+        "BINARY_OPERATION_BITAND_OBJECT_LONG",
+        "BINARY_OPERATION_BITAND_LONG_OBJECT",
+        "BINARY_OPERATION_BITAND_LONG_LONG",
+        "BINARY_OPERATION_BITAND_OBJECT_OBJECT",
+    )
+)
+
+_ibitand_helpers_set = set(
+    (
+        "BINARY_OPERATION_BITAND_INT_INT_INPLACE",
+        "BINARY_OPERATION_BITAND_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_BITAND_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_bitor_helpers_set = set(
+    (
+        "BINARY_OPERATION_BITOR_OBJECT_INT",
+        "BINARY_OPERATION_BITOR_INT_OBJECT",
+        "BINARY_OPERATION_BITOR_INT_INT",
+        "BINARY_OPERATION_BITOR_OBJECT_LONG",
+        "BINARY_OPERATION_BITOR_LONG_OBJECT",
+        "BINARY_OPERATION_BITOR_LONG_LONG",
+        "BINARY_OPERATION_BITOR_OBJECT_OBJECT",
+    )
+)
+
+_ibitor_helpers_set = set(
+    (
+        "BINARY_OPERATION_BITOR_INT_INT_INPLACE",
+        "BINARY_OPERATION_BITOR_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_BITOR_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+_bitxor_helpers_set = set(
+    (
+        "BINARY_OPERATION_BITXOR_OBJECT_INT",
+        "BINARY_OPERATION_BITXOR_INT_OBJECT",
+        "BINARY_OPERATION_BITXOR_INT_INT",
+        "BINARY_OPERATION_BITXOR_OBJECT_LONG",
+        "BINARY_OPERATION_BITXOR_LONG_OBJECT",
+        "BINARY_OPERATION_BITXOR_LONG_LONG",
+        "BINARY_OPERATION_BITXOR_OBJECT_OBJECT",
+    )
+)
+
+_ibitxor_helpers_set = set(
+    (
+        "BINARY_OPERATION_BITXOR_INT_INT_INPLACE",
+        "BINARY_OPERATION_BITXOR_LONG_LONG_INPLACE",
+        "BINARY_OPERATION_BITXOR_OBJECT_OBJECT_INPLACE",
+    )
+)
+
+# Operators with specialized helpers, the helper name prefix and the helpers
+# that exist for it, for normal and in-place usage.
+_binary_operation_helpers = {
+    "Add": ("BINARY_OPERATION_ADD", _add_helpers_set),
+    "Sub": ("BINARY_OPERATION_SUB", _sub_helpers_set),
+    "Mult": ("BINARY_OPERATION_MUL", _mul_helpers_set),
+    "Div": ("BINARY_OPERATION_DIV", _div_helpers_set),
+    "FloorDiv": ("BINARY_OPERATION_FLOORDIV", _floordiv_helpers_set),
+    "TrueDiv": ("BINARY_OPERATION_TRUEDIV", _truediv_helpers_set),
+    "Mod": ("BINARY_OPERATION_REMAINDER", _remainder_helpers_set),
+    "LShift": ("BINARY_OPERATION_LSHIFT", _lshift_helpers_set),
+    "RShift": ("BINARY_OPERATION_RSHIFT", _rshift_helpers_set),
+    "BitAnd": ("BINARY_OPERATION_BITAND", _bitand_helpers_set),
+    "BitOr": ("BINARY_OPERATION_BITOR", _bitor_helpers_set),
+    "BitXor": ("BINARY_OPERATION_BITXOR", _bitxor_helpers_set),
+}
+
+_binary_operation_inplace_helpers = {
+    "IAdd": ("BINARY_OPERATION_ADD", _iadd_helpers_set),
+    "ISub": ("BINARY_OPERATION_SUB", _isub_helpers_set),
+    "IMult": ("BINARY_OPERATION_MUL", _imul_helpers_set),
+    "IDiv": ("BINARY_OPERATION_DIV", _idiv_helpers_set),
+    "IFloorDiv": ("BINARY_OPERATION_FLOORDIV", _ifloordiv_helpers_set),
+    "ITrueDiv": ("BINARY_OPERATION_TRUEDIV", _itruediv_helpers_set),
+    "IMod": ("BINARY_OPERATION_REMAINDER", _iremainder_helpers_set),
+    "ILShift": ("BINARY_OPERATION_LSHIFT", _ilshift_helpers_set),
+    "IRShift": ("BINARY_OPERATION_RSHIFT", _irshift_helpers_set),
+    "IBitAnd": ("BINARY_OPERATION_BITAND", _ibitand_helpers_set),
+    "IBitOr": ("BINARY_OPERATION_BITOR", _ibitor_helpers_set),
+    "IBitXor": ("BINARY_OPERATION_BITXOR", _ibitxor_helpers_set),
+}
+
 
 def _getBinaryOperationCode(
     to_name, expression, operator, arg_names, in_place, emit, context
@@ -172,36 +665,26 @@ def _getBinaryOperationCode(
         helper = "POWER_OPERATION_INPLACE"
     elif operator == "IPow":
         helper = "POWER_OPERATION2"
-    elif operator == "Add":
+    elif operator in _binary_operation_helpers:
+        prefix, helpers = _binary_operation_helpers[operator]
+
         helper = pickCodeHelper(
-            prefix="BINARY_OPERATION_ADD",
+            prefix=prefix,
             suffix="",
             left_shape=left.getTypeShape(),
             right_shape=expression.getRight().getTypeShape(),
-            helpers=_add_helpers_set,
+            helpers=helpers,
         )
-    elif operator == "IAdd" and in_place:
+    elif operator in _binary_operation_inplace_helpers and in_place:
+        prefix, helpers = _binary_operation_inplace_helpers[operator]
+
         helper = pickCodeHelper(
-            prefix="BINARY_OPERATION_ADD",
+            prefix=prefix,
             suffix="_INPLACE",
             left_shape=left.getTypeShape(),
             right_shape=expression.getRight().getTypeShape(),
-            helpers=_iadd_helpers_set,
+            helpers=helpers,
         )
-    elif operator == "IMult" and in_place:
-        helper = "BINARY_OPERATION_MUL_INPLACE"
-    elif operator == "Sub":
-        helper = "BINARY_OPERATION_SUB"
-    elif operator == "Div":
-        helper = "BINARY_OPERATION_DIV"
-    elif operator == "FloorDiv":
-        helper = "BINARY_OPERATION_FLOORDIV"
-    elif operator == "TrueDiv":
-        helper = "BINARY_OPERATION_TRUEDIV"
-    elif operator == "Mult":
-        helper = "BINARY_OPERATION_MUL"
-    elif operator == "Mod":
-        helper = "BINARY_OPERATION_REMAINDER"
     elif operator == "Divmod":
         helper = "BUILTIN_DIVMOD"
     elif len(arg_names) == 2:
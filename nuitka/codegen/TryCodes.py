@@ -29,7 +29,7 @@ from .ErrorCodes import getMustNotGetHereCode
 from .ExceptionCodes import getExceptionUnpublishedReleaseCode
 from .IteratorCodes import getBuiltinLoopBreakNextCode
 from .LabelCodes import getGotoCode, getLabelCode
-from .VariableCodes import getVariableAssignmentCode
+from .VariableCodes import getLocalVariableDeclaration, getVariableAssignmentCode
 
 
 def generateTryCode(statement, emit, context):
@@ -53,12 +53,20 @@ def generateTryCode(statement, emit, context):
 
     tried_block_may_raise = tried_block.mayRaiseException(BaseException)
 
-    assert (
-        tried_block_may_raise
-        or continue_handler is not None
-        or break_handler is not None
-        or return_handler is not None
-    ), statement.asXmlText()
+    # Loop traces may become more precise after the try statement was last
+    # optimized, so the tried block might no longer raise. Then nothing can
+    # reach the handlers, and it's only the tried block that matters.
+    if (
+        not tried_block_may_raise
+        and continue_handler is None
+        and break_handler is None
+        and return_handler is None
+    ):
+        generateStatementSequenceCode(
+            statement_sequence=tried_block, emit=emit, allow_none=False, context=context
+        )
+
+        return
 
     # The tried statements might raise, for which we define an escape.
     tried_handler_escape = context.allocateLabel("try_except_handler")
@@ -297,16 +305,40 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     if not no_statements[0].isStatementReraiseException():
         return False
 
-    tmp_name = context.allocateTempName("next_source")
+    next_source = assign_source.getValue()
+    variable = tried_statement.getVariable()
 
-    generateExpressionCode(
-        expression=assign_source.getValue(),
-        to_name=tmp_name,
-        emit=emit,
-        context=context,
-    )
+    tmp_name = None
+    tmp_name2 = None
+
+    # Loops over ranges count with C values, directly in the variable of the
+    # iterator, and for Python2 maybe also the value.
+    if next_source.isExpressionTempVariableRef():
+        iterator_declaration = getLocalVariableDeclaration(
+            context, next_source.getVariable(), next_source.getVariableTrace()
+        )
+
+        if iterator_declaration.c_type == "nuitka_range_iterator":
+            tmp_name = iterator_declaration
+
+            if (
+                not variable.isModuleVariable()
+                and getLocalVariableDeclaration(
+                    context, variable, tried_statement.getVariableTrace()
+                ).c_type
+                == "nuitka_ilong"
+            ):
+                tmp_name2 = context.allocateTempName("assign_source", "nuitka_ilong")
+
+    if tmp_name is None:
+        tmp_name = context.allocateTempName("next_source")
+
+        generateExpressionCode(
+            expression=next_source, to_name=tmp_name, emit=emit, context=context
+        )
 
-    tmp_name2 = context.allocateTempName("assign_source")
+    if tmp_name2 is None:
+        tmp_name2 = context.allocateTempName("assign_source")
 
     old_source_ref = context.setCurrentSourceCodeReference(
         assign_source.getSourceReference()
@@ -320,7 +352,7 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
 
     getVariableAssignmentCode(
         tmp_name=tmp_name2,
-        variable=tried_statement.getVariable(),
+        variable=variable,
         variable_trace=tried_statement.getVariableTrace(),
         needs_release=None,
         in_place=False,
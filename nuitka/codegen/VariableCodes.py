@@ -21,12 +21,16 @@
 
 from nuitka.nodes.shapes.BuiltinTypeShapes import (
     ShapeTypeBool,
+    ShapeTypeFloat,
     ShapeTypeInt,
     ShapeTypeIntOrLong,
     ShapeTypeLong,
 )
 from nuitka.PythonVersions import python_version
 
+from .c_types.CTypeNuitkaFloats import CTypeNuitkaFloatStruct
+from .c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
+from .c_types.CTypeNuitkaRangeIterators import CTypeNuitkaRangeIteratorStruct
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
     CTypePyObjectPtr,
@@ -63,11 +67,22 @@ def generateAssignmentVariableCode(statement, emit, context):
         ):
             tmp_name = context.allocateTempName("assign_source", "nuitka_bool")
         elif (
-            source_shape is ShapeTypeIntOrLong
+            source_shape in (ShapeTypeInt, ShapeTypeIntOrLong)
             and variable_declaration.c_type == "nuitka_ilong"
         ):
-
             tmp_name = context.allocateTempName("assign_source", "nuitka_ilong")
+        elif (
+            source_shape is ShapeTypeFloat
+            and variable_declaration.c_type == "nuitka_float"
+        ):
+            tmp_name = context.allocateTempName("assign_source", "nuitka_float")
+        elif (
+            assign_source.isExpressionBuiltinIterRange()
+            and variable_declaration.c_type == "nuitka_range_iterator"
+        ):
+            tmp_name = context.allocateTempName(
+                "assign_source", "nuitka_range_iterator"
+            )
         else:
             tmp_name = context.allocateTempName("assign_source")
 
@@ -208,7 +223,20 @@ def getPickedCType(variable, context):
                 if len(shapes) > 1:
                     return CTypePyObjectPtr
 
-            return shapes.pop().getCType()
+            result = shapes.pop().getCType()
+
+            # Directly called functions and class bodies get passed local
+            # variables by reference, which is only done for objects.
+            if (
+                result
+                in (
+                    CTypeNuitkaIntOrLongStruct,
+                    CTypeNuitkaFloatStruct,
+                    CTypeNuitkaRangeIteratorStruct,
+                )
+                and variable.shared_users
+            ):
+                result = CTypePyObjectPtr
     elif context.isForDirectCall():
         if variable.isSharedTechnically():
             result = CTypeCellObject
@@ -23,7 +23,9 @@ from contextlib import contextmanager
 
 from .c_types.CTypeModuleDictVariables import CTypeModuleDictVariable
 from .c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
+from .c_types.CTypeNuitkaFloats import CTypeNuitkaFloatStruct
 from .c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
+from .c_types.CTypeNuitkaRangeIterators import CTypeNuitkaRangeIteratorStruct
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
     CTypePyObjectPtr,
@@ -100,6 +102,10 @@ class VariableDeclaration(object):
             return CTypeNuitkaBoolEnum
         elif c_type == "nuitka_ilong":
             return CTypeNuitkaIntOrLongStruct
+        elif c_type == "nuitka_float":
+            return CTypeNuitkaFloatStruct
+        elif c_type == "nuitka_range_iterator":
+            return CTypeNuitkaRangeIteratorStruct
         elif c_type == "module_var":
             return CTypeModuleDictVariable
         elif c_type == "void":
@@ -27,6 +27,7 @@ type_indicators = {
     "struct Nuitka_CellObject *": "c",
     "nuitka_bool": "b",
     "nuitka_ilong": "L",
+    "nuitka_float": "F",
 }
 
 
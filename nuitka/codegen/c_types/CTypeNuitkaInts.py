@@ -20,56 +20,65 @@
 """
 
 
-from nuitka.codegen.templates.CodeTemplatesVariables import (
-    template_release_clear,
-    template_release_unclear,
-)
-
 from .CTypeBases import CTypeBase
 
 
 class CTypeNuitkaIntOrLongStruct(CTypeBase):
+    """ C type for Python2 "int" or "long" values.
+
+    The struct may hold a C "long" value, an object, or both. The object, if
+    present, is owned by the struct, and only created on demand, when the
+    value escapes, e.g. when passed to a function or returned.
+    """
+
     c_type = "nuitka_ilong"
 
     @classmethod
     def emitVariableAssignCode(
         cls, value_name, needs_release, tmp_name, ref_count, in_place, emit, context
     ):
-        assert not in_place
+        # In-place operations are not done on the value, pylint: disable=unused-argument
 
-        if tmp_name.c_type == "nuitka_bool":
-            assert False
+        if tmp_name.c_type == "nuitka_ilong":
+            if needs_release is not False:
+                emit("RELEASE_ILONG(&%s);" % value_name)
 
+            # The struct owns the object, so this transfers it.
             emit("%s = %s;" % (value_name, tmp_name))
-        else:
-            if tmp_name.c_type == "PyObject *":
-                emit("%s.validity = NUITKA_ILONG_OBJECT_VALID;" % value_name)
+        elif tmp_name.c_type == "PyObject *":
+            # The value may be borrowed from the old value, so take the
+            # reference before releasing it.
+            if not ref_count:
+                emit("Py_INCREF(%s);" % tmp_name)
 
-                emit("%s.ilong_object = %s;" % (value_name, tmp_name))
+            if needs_release is not False:
+                emit("RELEASE_ILONG(&%s);" % value_name)
 
-                if ref_count:
-                    emit("/* REFCOUNT ? */")
-            else:
-                assert False, tmp_name
+            emit("SET_ILONG_OBJECT(&%s, %s);" % (value_name, tmp_name))
+        else:
+            assert False, tmp_name
 
     @classmethod
     def getLocalVariableInitTestCode(cls, value_name, inverted):
-        assert False, "TODO"
-
-        return "%s %s NUITKA_BOOL_UNASSIGNED" % (value_name, "==" if inverted else "!=")
-
-    @classmethod
-    def getTruthCheckCode(cls, value_name):
-        assert False, "TODO"
-
-        return "%s == NUITKA_BOOL_TRUE" % value_name
+        return "%s.validity %s NUITKA_ILONG_UNASSIGNED" % (
+            value_name,
+            "==" if inverted else "!=",
+        )
 
     @classmethod
     def emitTruthCheckCode(cls, to_name, value_name, needs_check, emit, context):
-        # pylint: disable=unused-argument
-        assert False, "TODO"
+        # Truth checks of "int" and "long" cannot fail, pylint: disable=unused-argument
+        emit("%s = CHECK_IF_TRUE_ILONG(&%s);" % (to_name, value_name))
 
-        emit("%s = %s ? 1 : 0;" % (to_name, cls.getTruthCheckCode(value_name)))
+    @classmethod
+    def emitAssignmentCodeToNuitkaBool(
+        cls, to_name, value_name, needs_check, emit, context
+    ):
+        # Truth checks of "int" and "long" cannot fail, pylint: disable=unused-argument
+        emit(
+            "%s = CHECK_IF_TRUE_ILONG(&%s) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;"
+            % (to_name, value_name)
+        )
 
     @classmethod
     def emitValueAccessCode(cls, value_name, emit, context):
@@ -83,63 +92,47 @@ class CTypeNuitkaIntOrLongStruct(CTypeBase):
 
     @classmethod
     def emitAssignConversionCode(cls, to_name, value_name, needs_check, emit, context):
-        assert False, "TODO"
+        # Conversion cannot fail, pylint: disable=unused-argument
 
         if value_name.c_type == cls.c_type:
-            emit("%s = %s;" % (to_name, value_name))
+            emit("COPY_ILONG(&%s, &%s);" % (to_name, value_name))
+        elif value_name.c_type == "PyObject *":
+            # Take over the reference if there is one, otherwise make one.
+            if context.needsCleanup(value_name):
+                context.removeCleanupTempName(value_name)
+            else:
+                emit("Py_INCREF(%s);" % value_name)
+
+            emit("SET_ILONG_OBJECT(&%s, %s);" % (to_name, value_name))
         else:
-            value_name.getCType().emitAssignmentCodeToNuitkaBool(
-                to_name=to_name,
-                value_name=value_name,
-                needs_check=needs_check,
-                emit=emit,
-                context=context,
-            )
+            assert False, value_name
+
+    @classmethod
+    def emitAssignmentCodeFromConstant(cls, to_name, constant, emit):
+        """ Assign a constant "int" value, without creating an object. """
+        emit("SET_ILONG_VALUE(&%s, %dL);" % (to_name, constant))
 
     @classmethod
     def getInitValue(cls, init_from):
         if init_from is None:
-            # TODO: In debug mode, use more crash prone maybe.
-            return "{NUITKA_ILONG_UNASSIGNED, NULL, 0}"
+            return "nuitka_ilong_unassigned"
         else:
             assert False, init_from
             return init_from
 
     @classmethod
     def getReleaseCode(cls, variable_code_name, needs_check, emit):
-        emit(
-            "if ((%s.validity & NUITKA_ILONG_OBJECT_VALID) == NUITKA_ILONG_OBJECT_VALID) {"
-            % variable_code_name
-        )
-
-        if needs_check:
-            template = template_release_unclear
-        else:
-            template = template_release_clear
-
-        emit(template % {"identifier": "%s.ilong_object" % variable_code_name})
-
-        emit("}")
+        # The release checks for assignment anyway, pylint: disable=unused-argument
+        emit("RELEASE_ILONG(&%s);" % variable_code_name)
 
     @classmethod
     def getDeleteObjectCode(
         cls, to_name, value_name, needs_check, tolerant, emit, context
     ):
-        assert False, "TODO"
-
-        if not needs_check:
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-        elif tolerant:
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-        else:
-            emit("%s = %s == NUITKA_BOOL_UNASSIGNED;" % (to_name, value_name))
-            emit("%s = NUITKA_BOOL_UNASSIGNED;" % value_name)
-
-    @classmethod
-    def emitAssignmentCodeFromBoolCondition(cls, to_name, condition, emit):
-        assert False, "TODO"
+        if needs_check and not tolerant:
+            emit(
+                "%s = %s;"
+                % (to_name, cls.getLocalVariableInitTestCode(value_name, False))
+            )
 
-        emit(
-            "%(to_name)s = ( %(condition)s ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;"
-            % {"to_name": to_name, "condition": condition}
-        )
+        emit("RELEASE_ILONG(&%s);" % value_name)
@@ -0,0 +1,118 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" CType classes for nuitka_range_iterator, a struct to iterate over ranges.
+
+"""
+
+
+from .CTypeBases import CTypeBase
+
+
+class CTypeNuitkaRangeIteratorStruct(CTypeBase):
+    """ C type for iterators over "range" and "xrange" used by loops.
+
+    The struct counts with C "long" values, or holds an iterator object, if
+    the arguments were not suitable for that. The object, owned by the
+    struct, is also created on demand, when the iterator escapes.
+    """
+
+    c_type = "nuitka_range_iterator"
+
+    @classmethod
+    def emitVariableAssignCode(
+        cls, value_name, needs_release, tmp_name, ref_count, in_place, emit, context
+    ):
+        # In-place operations are not done on the value, pylint: disable=unused-argument
+
+        if tmp_name.c_type == "nuitka_range_iterator":
+            if needs_release is not False:
+                emit("RELEASE_RANGE_ITERATOR(&%s);" % value_name)
+
+            # The struct owns the object, so this transfers it.
+            emit("%s = %s;" % (value_name, tmp_name))
+        elif tmp_name.c_type == "PyObject *":
+            # The value may be borrowed from the old value, so take the
+            # reference before releasing it.
+            if not ref_count:
+                emit("Py_INCREF(%s);" % tmp_name)
+
+            if needs_release is not False:
+                emit("RELEASE_RANGE_ITERATOR(&%s);" % value_name)
+
+            emit("SET_RANGE_ITERATOR_OBJECT(&%s, %s);" % (value_name, tmp_name))
+        else:
+            assert False, tmp_name
+
+    @classmethod
+    def getLocalVariableInitTestCode(cls, value_name, inverted):
+        return "%s.validity %s NUITKA_RANGE_ITERATOR_UNASSIGNED" % (
+            value_name,
+            "==" if inverted else "!=",
+        )
+
+    @classmethod
+    def emitValueAccessCode(cls, value_name, emit, context):
+        # Nothing to do for this type, pylint: disable=unused-argument
+        return value_name
+
+    @classmethod
+    def emitValueAssertionCode(cls, value_name, emit, context):
+        # Not using the context, pylint: disable=unused-argument
+        emit("assert(%s.validity != NUITKA_RANGE_ITERATOR_UNASSIGNED);" % value_name)
+
+    @classmethod
+    def emitAssignConversionCode(cls, to_name, value_name, needs_check, emit, context):
+        # Conversion cannot fail, pylint: disable=unused-argument
+
+        # Copying the struct would make two iterators of one, which is only
+        # possible with an object shared by both.
+        if value_name.c_type == "PyObject *":
+            # Take over the reference if there is one, otherwise make one.
+            if context.needsCleanup(value_name):
+                context.removeCleanupTempName(value_name)
+            else:
+                emit("Py_INCREF(%s);" % value_name)
+
+            emit("SET_RANGE_ITERATOR_OBJECT(&%s, %s);" % (to_name, value_name))
+        else:
+            assert False, value_name
+
+    @classmethod
+    def getInitValue(cls, init_from):
+        if init_from is None:
+            return "nuitka_range_iterator_unassigned"
+        else:
+            assert False, init_from
+            return init_from
+
+    @classmethod
+    def getReleaseCode(cls, variable_code_name, needs_check, emit):
+        # The release checks for assignment anyway, pylint: disable=unused-argument
+        emit("RELEASE_RANGE_ITERATOR(&%s);" % variable_code_name)
+
+    @classmethod
+    def getDeleteObjectCode(
+        cls, to_name, value_name, needs_check, tolerant, emit, context
+    ):
+        if needs_check and not tolerant:
+            emit(
+                "%s = %s;"
+                % (to_name, cls.getLocalVariableInitTestCode(value_name, False))
+            )
+
+        emit("RELEASE_RANGE_ITERATOR(&%s);" % value_name)
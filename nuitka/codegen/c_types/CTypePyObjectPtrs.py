@@ -200,6 +200,14 @@ class CTypePyObjectPtr(CPythonPyObjectPtrBase):
             emit("ENFORCE_ILONG_OBJECT_VALUE(&%s);" % value_name)
 
             emit("%s = %s.ilong_object;" % (to_name, value_name))
+        elif value_name.c_type == "nuitka_float":
+            emit("ENFORCE_FLOAT_OBJECT_VALUE(&%s);" % value_name)
+
+            emit("%s = %s.float_object;" % (to_name, value_name))
+        elif value_name.c_type == "nuitka_range_iterator":
+            emit("ENFORCE_RANGE_ITERATOR_OBJECT(&%s);" % value_name)
+
+            emit("%s = %s.iterator;" % (to_name, value_name))
         else:
             assert False, to_name.c_type
 
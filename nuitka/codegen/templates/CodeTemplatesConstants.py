@@ -32,6 +32,8 @@ PyObject *Nuitka_dunder_compiled_value = NULL;
 
 %(constant_declarations)s
 
+%(lazy_constants_codes)s
+
 static void _createGlobalConstants( void )
 {
     NUITKA_MAY_BE_UNUSED PyObject *exception_type, *exception_value;
@@ -129,6 +131,8 @@ static void _createGlobalConstants( void )
 void checkGlobalConstants( void )
 {
 %(constant_checks)s
+
+%(lazy_constants_checks)s
 }
 #endif
 
@@ -149,6 +153,35 @@ void createGlobalConstants( void )
 }
 """
 
+template_constants_group = """\
+// Indicator if this group of shared constants was created yet.
+static bool constants_group_%(group_index)d_created = false;
+
+static void createConstantsGroup%(group_index)d( void )
+{
+    if ( constants_group_%(group_index)d_created ) return;
+
+%(constant_inits)s
+
+    constants_group_%(group_index)d_created = true;
+}
+"""
+
+template_constants_group_check = """\
+    if ( constants_group_%(group_index)d_created )
+    {
+%(constant_checks)s
+    }
+"""
+
+template_module_shared_constants = """\
+// Create the shared constants used by module "%(module_identifier)s".
+void createSharedConstants_%(module_identifier)s( void )
+{
+%(group_calls)s
+}
+"""
+
 from . import TemplateDebugWrapper  # isort:skip
 
 TemplateDebugWrapper.checkDebug(globals())
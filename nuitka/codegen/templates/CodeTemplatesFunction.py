@@ -27,6 +27,10 @@ template_function_direct_declaration = """\
 %(file_scope)s PyObject *impl_%(function_identifier)s( %(direct_call_arg_spec)s );
 """
 
+template_function_impl_declaration = """\
+%(file_scope)s PyObject *impl_%(function_identifier)s( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+"""
+
 template_make_function_body = """
 static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args)s )
 {
@@ -57,7 +61,7 @@ template_make_function = """\
 """
 
 template_function_body = """\
-static PyObject *impl_%(function_identifier)s( %(parameter_objects_decl)s )
+%(file_scope)s PyObject *impl_%(function_identifier)s( %(parameter_objects_decl)s )
 {
     // Preserve error status for checks
 #ifndef __NUITKA_NO_ASSERT__
@@ -64,7 +64,7 @@ else
 }"""
 
 template_loop_break_next = """\
-if ( %(to_name)s == NULL )
+if ( %(condition)s )
 {
     if ( CHECK_AND_CLEAR_STOP_ITERATION_OCCURRED() )
     {
@@ -63,9 +63,15 @@ PyDictObject *moduledict_%(module_identifier)s;
 /* Indicator if this modules private constants were created yet. */
 static bool constants_created = false;
 
+/* Function to create shared constants used by this module, unless some other
+ * module already did. */
+extern void createSharedConstants_%(module_identifier)s( void );
+
 /* Function to create module private constants. */
 static void createModuleConstants( void )
 {
+    createSharedConstants_%(module_identifier)s();
+
 %(constant_init_codes)s
 
     constants_created = true;
@@ -138,6 +144,7 @@ extern void _initCompiledCoroutineTypes();
 #if PYTHON_VERSION >= 360
 extern void _initCompiledAsyncgenTypes();
 #endif
+extern void _initFreeLists();
 
 extern PyTypeObject Nuitka_Loader_Type;
 
@@ -188,6 +195,8 @@ MOD_INIT_DECL( %(module_identifier)s )
     _initCompiledAsyncgenTypes();
 #endif
 
+    _initFreeLists();
+
 #if PYTHON_VERSION < 300
     _initSlotCompare();
 #endif
@@ -131,6 +131,17 @@ of '--include-plugin-directory' or '--include-plugin-files'."""
 
                 node_module.addCrossUsedFunction(function_body)
 
+        if node.isExpressionImportName():
+            function_body = node.getImportedFunctionBody()
+
+            if function_body is not None:
+                node_module = node.getParentModule()
+
+                if function_body.getParentModule() is not node_module:
+                    function_body.markAsCrossModuleCalled()
+
+                    node_module.addCrossCalledFunction(function_body)
+
         if node.isStatementAssignmentVariable():
             target_var = node.getVariable()
             assign_source = node.getAssignSource()
@@ -0,0 +1,269 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistent cache for the DLL dependencies of binaries.
+
+Scanning a binary for the DLLs it uses is expensive, so the results are kept
+in the user cache directory. Entries are identified by the contents of the
+binary, not its path, so they are shared between virtualenvs and projects
+using the same extension modules.
+
+All entries live in a single index file, which is loaded on first use and
+written back once after the scan. It is bounded in size, dropping the least
+recently used entries.
+"""
+
+import os
+import pickle
+import sys
+import time
+from logging import info
+
+from nuitka import Options
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import getFileContents, makePath
+from nuitka.utils.Hashing import getFileContentsHash, getValuesHash
+from nuitka.utils.ThreadedExecutor import Lock
+from nuitka.utils.Utils import getArchitecture
+
+# Maximum number of binaries to keep results for.
+_max_entries = 10000
+
+# Format version of the index file, to be increased on changes.
+_cache_format = 1
+
+_cache_lock = Lock()
+_cache_entries = None
+_cache_modified = False
+
+_cache_hits = 0
+_cache_misses = 0
+
+
+def _getCacheFilename():
+    cache_dir = getCacheDir()
+
+    makePath(cache_dir)
+
+    return os.path.join(
+        cache_dir,
+        "library_deps_pefile.index"
+        if Options.isExperimental("use_pefile")
+        else "library_deps.index",
+    )
+
+
+def _loadCacheEntries(cache_filename):
+    try:
+        with open(cache_filename, "rb") as cache_file:
+            cache_format, entries = pickle.load(cache_file)
+    except (IOError, OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return {}
+
+    # Broken or outdated index files are ignored and overwritten.
+    if cache_format != _cache_format or type(entries) is not dict:
+        return {}
+
+    return entries
+
+
+def _getCacheEntries():
+    # Singleton, pylint: disable=global-statement
+    global _cache_entries
+
+    if _cache_entries is None:
+        _cache_entries = _loadCacheEntries(_getCacheFilename())
+
+    return _cache_entries
+
+
+def getDllDependenciesCacheKey(
+    is_main_executable, source_dir, binary_filename, package_name
+):
+    """ Cache key for the DLL dependencies of a binary.
+
+    Args:
+        is_main_executable: the binary is the compiled program itself
+        source_dir: the build directory of the compilation
+        binary_filename: the binary to scan
+        package_name: package the binary belongs to, influences the scan
+
+    Returns:
+        hex digest string
+    """
+
+    if is_main_executable:
+        # The main program changes with every compilation, but its DLL usage
+        # only depends on how it was built. Normalize the build directory out
+        # of the scons information, so it applies across projects.
+        contents = getFileContents(os.path.join(source_dir, "scons-report.txt"))
+
+        for path in (os.path.abspath(source_dir), source_dir):
+            contents = contents.replace(path, "")
+
+        binary_value = contents
+    else:
+        binary_value = getFileContentsHash(binary_filename)
+
+    return getValuesHash(
+        is_main_executable,
+        binary_value,
+        package_name,
+        getArchitecture(),
+        sys.version_info[:2],
+    )
+
+
+def _getPathAnchors(original_dir):
+    # The DLLs found are mostly in the directory of the binary or the Python
+    # installation, which differ between virtualenvs, so store them relative
+    # to these.
+    result = []
+
+    if original_dir is not None:
+        result.append(("original", os.path.normcase(os.path.abspath(original_dir))))
+
+    result.append(("prefix", os.path.normcase(os.path.abspath(sys.prefix))))
+
+    return result
+
+
+def _encodePath(dll_filename, anchors):
+    for anchor_name, anchor_path in anchors:
+        if os.path.normcase(dll_filename).startswith(anchor_path + os.path.sep):
+            return anchor_name, dll_filename[len(anchor_path) + 1 :]
+
+    return "", dll_filename
+
+
+def _decodePath(anchor_name, path, anchors):
+    if not anchor_name:
+        return path
+
+    return os.path.join(dict(anchors)[anchor_name], path)
+
+
+def getCachedDllDependencies(cache_key, original_dir):
+    """ Get cached DLL dependencies of a binary.
+
+    Args:
+        cache_key: value from "getDllDependenciesCacheKey"
+        original_dir: directory of the binary, to resolve relative entries
+
+    Returns:
+        set of DLL filenames or None if not cached.
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _cache_hits, _cache_misses, _cache_modified
+
+    with _cache_lock:
+        cache_entries = _getCacheEntries()
+
+        if cache_key in cache_entries:
+            _last_used, encoded_paths = cache_entries[cache_key]
+
+            anchors = _getPathAnchors(original_dir)
+
+            result = set(
+                _decodePath(anchor_name, path, anchors)
+                for anchor_name, path in encoded_paths
+            )
+
+            # Entries from other installations may point to DLLs that do not
+            # exist here, scan again then.
+            if all(os.path.exists(dll_filename) for dll_filename in result):
+                cache_entries[cache_key] = time.time(), encoded_paths
+                _cache_modified = True
+                _cache_hits += 1
+
+                return result
+
+        _cache_misses += 1
+
+        return None
+
+
+def storeCachedDllDependencies(cache_key, original_dir, dll_filenames):
+    """ Store the DLL dependencies of a binary in the cache.
+
+    Args:
+        cache_key: value from "getDllDependenciesCacheKey"
+        original_dir: directory of the binary, to make entries relative
+        dll_filenames: the DLLs used by the binary
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _cache_modified
+
+    anchors = _getPathAnchors(original_dir)
+
+    encoded_paths = tuple(
+        sorted(_encodePath(dll_filename, anchors) for dll_filename in dll_filenames)
+    )
+
+    with _cache_lock:
+        _getCacheEntries()[cache_key] = time.time(), encoded_paths
+        _cache_modified = True
+
+
+def saveDllDependenciesCache():
+    """ Write the cache index back to disk, if it was changed.
+
+    Entries stored by other processes in the meantime are merged, and the
+    least recently used entries are removed to keep the size bounded.
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _cache_modified
+
+    with _cache_lock:
+        if not _cache_modified:
+            return
+
+        cache_filename = _getCacheFilename()
+
+        cache_entries = _loadCacheEntries(cache_filename)
+
+        for cache_key, entry in _getCacheEntries().items():
+            if cache_key not in cache_entries or cache_entries[cache_key] < entry:
+                cache_entries[cache_key] = entry
+
+        if len(cache_entries) > _max_entries:
+            for cache_key in sorted(
+                cache_entries, key=lambda cache_key: cache_entries[cache_key][0]
+            )[: len(cache_entries) - _max_entries]:
+                del cache_entries[cache_key]
+
+        # Write to a temporary file first, so a concurrent compilation never
+        # sees a partial index.
+        temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+        with open(temp_filename, "wb") as cache_file:
+            pickle.dump((_cache_format, cache_entries), cache_file, protocol=2)
+
+        if os.path.exists(cache_filename) and os.name == "nt":
+            os.unlink(cache_filename)
+
+        os.rename(temp_filename, cache_filename)
+
+        _cache_modified = False
+
+
+def reportDllDependenciesCacheStatistics():
+    if Options.isShowProgress() and (_cache_hits or _cache_misses):
+        info("DLL dependency cache: %d hits, %d misses." % (_cache_hits, _cache_misses))
@@ -25,7 +25,6 @@ very welcome.
 from __future__ import print_function
 
 import contextlib
-import hashlib
 import inspect
 import marshal
 import os
@@ -47,13 +46,12 @@ from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 from nuitka.utils import Utils
-from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.ElfFiles import getElfDependencies
 from nuitka.utils.Execution import withEnvironmentPathAdded
 from nuitka.utils.FileOperations import (
     areSamePaths,
     deleteFile,
     getFileContentByLine,
-    getFileContents,
     getSubDirectories,
     isPathBelow,
     listDir,
@@ -65,6 +63,13 @@ from nuitka.utils.Timing import TimerReport
 from nuitka.utils.Utils import getArchitecture
 
 from .DependsExe import getDependsExePath
+from .DllDependenciesCache import (
+    getCachedDllDependencies,
+    getDllDependenciesCacheKey,
+    reportDllDependenciesCacheStatistics,
+    saveDllDependenciesCache,
+    storeCachedDllDependencies,
+)
 
 # Use PE file analysis only on Win32
 if Utils.isWin32Windows() and Options.isExperimental("use_pefile"):
@@ -474,6 +479,10 @@ def detectEarlyImports():
     if python_version >= 300:
         import_code += "import inspect;"
 
+    # Compressed bytecode is decompressed with "zlib" by the loader.
+    if Options.shallCompressBytecode():
+        import_code += "import zlib;"
+
     result = _detectImports(command=import_code, user_provided=False, technical=True)
 
     if Options.shallFreezeAllStdlib():
@@ -548,6 +557,47 @@ _detected_python_rpath = None
 ldd_result_cache = {}
 
 
+def _getLddLibraries(dll_filename):
+    # Ask "ldd" about the libraries being used by the created binary, these
+    # are the ones that interest us.
+    result = []
+
+    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _detected_python_rpath):
+        process = subprocess.Popen(
+            args=["ldd", dll_filename], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+
+        stdout, _stderr = process.communicate()
+
+    for line in stdout.split(b"\n"):
+        if not line:
+            continue
+
+        if b"=>" not in line:
+            continue
+
+        part = line.split(b" => ", 2)[1]
+
+        if b"(" in part:
+            filename = part[: part.rfind(b"(") - 1]
+        else:
+            filename = part
+
+        if not filename:
+            continue
+
+        if python_version >= 300:
+            filename = filename.decode("utf-8")
+
+        # Sometimes might use stuff not found or supplied by ldd itself.
+        if filename in ("not found", "ldd"):
+            continue
+
+        result.append(filename)
+
+    return result
+
+
 def _detectBinaryPathDLLsLinuxBSD(dll_filename):
     # This is complex, as it also includes the caching mechanism
     # pylint: disable=too-many-branches
@@ -555,8 +605,6 @@ def _detectBinaryPathDLLsLinuxBSD(dll_filename):
     if ldd_result_cache.get(dll_filename):
         return ldd_result_cache[dll_filename]
 
-    # Ask "ldd" about the libraries being used by the created binary, these
-    # are the ones that interest us.
     result = set()
 
     # This is the rpath of the Python binary, which will be effective when
@@ -571,84 +619,73 @@ def _detectBinaryPathDLLsLinuxBSD(dll_filename):
                 b"$ORIGIN", os.path.dirname(sys.executable).encode("utf-8")
             )
 
-    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _detected_python_rpath):
-        process = subprocess.Popen(
-            args=["ldd", dll_filename], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-
-        stdout, _stderr = process.communicate()
+    # On Linux, read the ELF files ourselves, which avoids starting a process
+    # for every binary, and fall back to "ldd" for anything else.
+    library_filenames = None
 
-        for line in stdout.split(b"\n"):
-            if not line:
-                continue
-
-            if b"=>" not in line:
-                continue
-
-            part = line.split(b" => ", 2)[1]
-
-            if b"(" in part:
-                filename = part[: part.rfind(b"(") - 1]
-            else:
-                filename = part
-
-            if not filename:
-                continue
+    if Utils.getOS() == "Linux":
+        library_paths = []
+        if _detected_python_rpath:
+            library_paths = _detected_python_rpath.split(b":")
 
             if python_version >= 300:
-                filename = filename.decode("utf-8")
+                library_paths = [path.decode("utf-8") for path in library_paths]
 
-            # Sometimes might use stuff not found or supplied by ldd itself.
-            if filename in ("not found", "ldd"):
-                continue
+        library_filenames = getElfDependencies(
+            dll_filename, library_paths=library_paths
+        )
 
-            # Do not include kernel / glibc specific libraries. This list has been
-            # assembled by looking what are the most common .so files provided by
-            # glibc packages from ArchLinux, Debian Stretch and CentOS.
-            #
-            # Online sources:
-            #  - https://centos.pkgs.org/7/puias-computational-x86_64/glibc-aarch64-linux-gnu-2.24-2.sdl7.2.noarch.rpm.html
-            #  - https://centos.pkgs.org/7/centos-x86_64/glibc-2.17-222.el7.x86_64.rpm.html
-            #  - https://archlinux.pkgs.org/rolling/archlinux-core-x86_64/glibc-2.28-5-x86_64.pkg.tar.xz.html
-            #  - https://packages.debian.org/stretch/amd64/libc6/filelist
-            #
-            # Note: This list may still be incomplete. Some additional libraries
-            # might be provided by glibc - it may vary between the package versions
-            # and between Linux distros. It might or might not be a problem in the
-            # future, but it should be enough for now.
-            if os.path.basename(filename).startswith(
-                (
-                    "ld-linux-x86-64.so",
-                    "libc.so.",
-                    "libpthread.so.",
-                    "libm.so.",
-                    "libdl.so.",
-                    "libBrokenLocale.so.",
-                    "libSegFault.so",
-                    "libanl.so.",
-                    "libcidn.so.",
-                    "libcrypt.so.",
-                    "libmemusage.so",
-                    "libmvec.so.",
-                    "libnsl.so.",
-                    "libnss_compat.so.",
-                    "libnss_db.so.",
-                    "libnss_dns.so.",
-                    "libnss_files.so.",
-                    "libnss_hesiod.so.",
-                    "libnss_nis.so.",
-                    "libnss_nisplus.so.",
-                    "libpcprofile.so",
-                    "libresolv.so.",
-                    "librt.so.",
-                    "libthread_db-1.0.so",
-                    "libthread_db.so.",
-                    "libutil.so.",
-                )
-            ):
-                continue
+    if library_filenames is None:
+        library_filenames = _getLddLibraries(dll_filename)
+
+    for filename in library_filenames:
+        # Do not include kernel / glibc specific libraries. This list has been
+        # assembled by looking what are the most common .so files provided by
+        # glibc packages from ArchLinux, Debian Stretch and CentOS.
+        #
+        # Online sources:
+        #  - https://centos.pkgs.org/7/puias-computational-x86_64/glibc-aarch64-linux-gnu-2.24-2.sdl7.2.noarch.rpm.html
+        #  - https://centos.pkgs.org/7/centos-x86_64/glibc-2.17-222.el7.x86_64.rpm.html
+        #  - https://archlinux.pkgs.org/rolling/archlinux-core-x86_64/glibc-2.28-5-x86_64.pkg.tar.xz.html
+        #  - https://packages.debian.org/stretch/amd64/libc6/filelist
+        #
+        # Note: This list may still be incomplete. Some additional libraries
+        # might be provided by glibc - it may vary between the package versions
+        # and between Linux distros. It might or might not be a problem in the
+        # future, but it should be enough for now.
+        if os.path.basename(filename).startswith(
+            (
+                "ld-linux-x86-64.so",
+                "libc.so.",
+                "libpthread.so.",
+                "libm.so.",
+                "libdl.so.",
+                "libBrokenLocale.so.",
+                "libSegFault.so",
+                "libanl.so.",
+                "libcidn.so.",
+                "libcrypt.so.",
+                "libmemusage.so",
+                "libmvec.so.",
+                "libnsl.so.",
+                "libnss_compat.so.",
+                "libnss_db.so.",
+                "libnss_dns.so.",
+                "libnss_files.so.",
+                "libnss_hesiod.so.",
+                "libnss_nis.so.",
+                "libnss_nisplus.so.",
+                "libpcprofile.so",
+                "libresolv.so.",
+                "librt.so.",
+                "libthread_db-1.0.so",
+                "libthread_db.so.",
+                "libutil.so.",
+            )
+        ):
+            continue
 
-            result.add(filename)
+        result.add(filename)
 
     # Allow plugins to prevent inclusion.
     blocked = Plugins.removeDllDependencies(
@@ -705,37 +742,6 @@ def _detectBinaryPathDLLsMacOS(original_dir, binary_filename):
     return result
 
 
-def _getCacheFilename(is_main_executable, source_dir, original_dir, binary_filename):
-    original_filename = os.path.join(original_dir, os.path.basename(binary_filename))
-
-    original_filename = os.path.normcase(original_filename)
-
-    if is_main_executable:
-        # Normalize main program name for caching as well, but need to use the
-        # scons information to distinguish different Python and arches, and
-        # compilers, so we use different libs there.
-        hashed_value = getFileContents(os.path.join(source_dir, "scons-report.txt"))
-    else:
-        hashed_value = original_filename
-
-    # Have different values for different Python major versions.
-    hashed_value += sys.version + sys.executable
-
-    if str is not bytes:
-        hashed_value = hashed_value.encode("utf8")
-
-    cache_dir = os.path.join(
-        getCacheDir(),
-        "library_deps_pefile"
-        if Options.isExperimental("use_pefile")
-        else "library_deps",
-    )
-
-    makePath(cache_dir)
-
-    return os.path.join(cache_dir, hashlib.md5(hashed_value).hexdigest())
-
-
 # Locking seems to be only required for Windows currently, expressed that in the
 # lock name.
 windows_lock = None
@@ -1018,20 +1024,20 @@ def _detectBinaryPathDLLsWindows(
 
     result = set()
 
-    cache_filename = _getCacheFilename(
-        is_main_executable, source_dir, original_dir, binary_filename
+    cache_key = getDllDependenciesCacheKey(
+        is_main_executable=is_main_executable,
+        source_dir=source_dir,
+        binary_filename=binary_filename,
+        package_name=package_name,
     )
 
-    if (
-        os.path.exists(cache_filename)
-        and not Options.shallNotUseDependsExeCachedResults()
-    ):
-        for line in getFileContentByLine(cache_filename):
-            line = line.strip()
-
-            result.add(line)
+    if not Options.shallNotUseDependsExeCachedResults():
+        cached_result = getCachedDllDependencies(
+            cache_key=cache_key, original_dir=original_dir
+        )
 
-        return result
+        if cached_result is not None:
+            return cached_result
 
     # User query should only happen once if at all.
     with _withLock():
@@ -1105,9 +1111,9 @@ SxS
     deleteFile(binary_filename + ".dwp", must_exist=True)
 
     if not Options.shallNotStoreDependsExeCachedResults():
-        with open(cache_filename, "w") as cache_file:
-            for dll_filename in result:
-                print(dll_filename, file=cache_file)
+        storeCachedDllDependencies(
+            cache_key=cache_key, original_dir=original_dir, dll_filenames=result
+        )
 
     return result
 
@@ -1186,20 +1192,20 @@ def _detectBinaryPathDLLsWindowsPE(
 
     result = set()
 
-    cache_filename = _getCacheFilename(
-        is_main_executable, source_dir, original_dir, binary_filename
+    cache_key = getDllDependenciesCacheKey(
+        is_main_executable=is_main_executable,
+        source_dir=source_dir,
+        binary_filename=binary_filename,
+        package_name=package_name,
     )
 
-    if (
-        os.path.exists(cache_filename)
-        and not Options.shallNotUseDependsExeCachedResults()
-    ):
-        for line in getFileContentByLine(cache_filename):
-            line = line.strip()
-
-            result.add(line)
+    if not Options.shallNotUseDependsExeCachedResults():
+        cached_result = getCachedDllDependencies(
+            cache_key=cache_key, original_dir=original_dir
+        )
 
-        return result
+        if cached_result is not None:
+            return cached_result
 
     scan_dirs = [sys.prefix]
 
@@ -1264,9 +1270,9 @@ def _detectBinaryPathDLLsWindowsPE(
     _parsePEFileOutput(binary_filename, scan_dirs, result)
 
     if not Options.shallNotStoreDependsExeCachedResults():
-        with open(cache_filename, "w") as cache_file:
-            for dll_filename in result:
-                print(dll_filename, file=cache_file)
+        storeCachedDllDependencies(
+            cache_key=cache_key, original_dir=original_dir, dll_filenames=result
+        )
 
     return result
 
@@ -1376,6 +1382,9 @@ manually."""
                     result[dll_filename] = []
                 result[dll_filename].append(binary_filename)
 
+    saveDllDependenciesCache()
+    reportDllDependenciesCacheStatistics()
+
     return result
 
 
@@ -263,6 +263,15 @@ class StatementAssignmentVariable(StatementChildHavingBase):
 Side effects of assignments promoted to statements.""",
             )
 
+        from nuitka.optimizations.ContainerUnpacking import convertContainerUnpacking
+
+        if convertContainerUnpacking(self):
+            return (
+                None,
+                "new_statements",
+                "Unpacking of non-escaping container assigns elements directly.",
+            )
+
         # Let assignment source may re-compute first.
         trace_collection.onExpression(self.getAssignSource())
         source = self.getAssignSource()
@@ -384,6 +384,9 @@ class ExpressionAttributeCheck(ExpressionChildHavingBase):
 
         self.attribute_name = attribute_name
 
+    def getDetails(self):
+        return {"attribute_name": self.attribute_name}
+
     getLookupSource = ExpressionChildHavingBase.childGetter("source")
 
     def computeExpression(self, trace_collection):
@@ -0,0 +1,88 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for the calls to the 'any' and 'all' built-ins.
+
+These always give a "bool", and for a generator expression given to them, the
+loop can be in-lined, returning as soon as the result is known.
+"""
+
+from nuitka.specs import BuiltinParameterSpecs
+
+from .ExpressionBases import ExpressionBuiltinSingleArgBase
+from .shapes.BuiltinTypeShapes import ShapeTypeBool
+
+
+class ExpressionBuiltinAnyAllBase(ExpressionBuiltinSingleArgBase):
+    # Name of the built-in, used as the consumer of generator expressions.
+    builtin_name = None
+
+    # Value the built-in gives for an empty iterable.
+    empty_value = None
+
+    def getTypeShape(self):
+        return ShapeTypeBool
+
+    def computeExpression(self, trace_collection):
+        value = self.getValue()
+
+        if value.isExpressionOutlineBody():
+            from nuitka.optimizations.GeneratorExpressionInlining import (
+                convertGeneratorExpressionToOutline,
+            )
+
+            result = convertGeneratorExpressionToOutline(
+                genexpr=value, consumer=self.builtin_name, start_value=self.empty_value
+            )
+
+            if result is not None:
+                # The loop is only computed in the next pass, but may raise.
+                trace_collection.onExceptionRaiseExit(BaseException)
+
+                return (
+                    result,
+                    "new_expression",
+                    "Generator expression consumed by '%s' in-lined as a loop."
+                    % self.builtin_name,
+                )
+
+        if value.isCompileTimeConstant():
+            return self.computeBuiltinSpec(
+                trace_collection=trace_collection, given_values=(value,)
+            )
+
+        # Iterating and checking the truth values could run any code.
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
+class ExpressionBuiltinAny(ExpressionBuiltinAnyAllBase):
+    kind = "EXPRESSION_BUILTIN_ANY"
+
+    builtin_spec = BuiltinParameterSpecs.builtin_any_spec
+    builtin_name = "any"
+    empty_value = False
+
+
+class ExpressionBuiltinAll(ExpressionBuiltinAnyAllBase):
+    kind = "EXPRESSION_BUILTIN_ALL"
+
+    builtin_spec = BuiltinParameterSpecs.builtin_all_spec
+    builtin_name = "all"
+    empty_value = True
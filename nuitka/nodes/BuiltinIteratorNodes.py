@@ -24,6 +24,7 @@ The length of things is an important optimization issue for these to be
 good.
 """
 
+from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
 from nuitka.Builtins import calledWithBuiltinArgumentNamesDecorator
 from nuitka.PythonVersions import python_version
 
@@ -33,10 +34,22 @@ from .ExpressionBases import (
 )
 from .NodeBases import StatementChildHavingBase
 from .NodeMakingHelpers import (
+    makeConstantReplacementNode,
     makeRaiseExceptionReplacementStatement,
     wrapExpressionWithSideEffects,
 )
-from .shapes.StandardShapes import ShapeIterator
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeBytes,
+    ShapeTypeEnumerate,
+    ShapeTypeList,
+    ShapeTypeReversed,
+    ShapeTypeStr,
+    ShapeTypeTuple,
+    ShapeTypeUnicode,
+    ShapeTypeXrangeIteratorCounting,
+    ShapeTypeZip,
+)
+from .shapes.StandardShapes import ShapeIterator, ShapeUnknown
 
 
 class ExpressionBuiltinIter1(ExpressionBuiltinSingleArgBase):
@@ -141,6 +154,74 @@ class ExpressionBuiltinIter1(ExpressionBuiltinSingleArgBase):
         pass
 
 
+# Values that "ExpressionBuiltinIterRange" can count with C values.
+_range_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_RANGE1",
+        "EXPRESSION_BUILTIN_RANGE2",
+        "EXPRESSION_BUILTIN_RANGE3",
+        "EXPRESSION_BUILTIN_XRANGE1",
+        "EXPRESSION_BUILTIN_XRANGE2",
+        "EXPRESSION_BUILTIN_XRANGE3",
+        "EXPRESSION_CONSTANT_XRANGE_REF",
+    )
+)
+
+
+class ExpressionBuiltinIterRange(ExpressionBuiltinIter1):
+    """ Iteration over "range" or "xrange" by a loop.
+
+    Loops assign the iterator to a temporary variable only, so it cannot be
+    seen by user code, and code generation can count with C values instead
+    of creating a range and an iterator object.
+    """
+
+    kind = "EXPRESSION_BUILTIN_ITER_RANGE"
+
+    def computeExpression(self, trace_collection):
+        value = self.getValue()
+
+        # The range may have been computed to something else, e.g. a tuple
+        # for small "range" values in Python2.
+        if value.kind not in _range_kinds:
+            result = ExpressionBuiltinIter1(
+                value=value, source_ref=self.getSourceReference()
+            )
+
+            return (
+                result,
+                "new_builtin",
+                "Iteration over former range is no longer a counting one.",
+            )
+
+        return ExpressionBuiltinIter1.computeExpression(self, trace_collection)
+
+    def getTypeShape(self):
+        return ShapeTypeXrangeIteratorCounting
+
+
+def makeExpressionBuiltinIterRange(iter_node):
+    """ Make iteration over a range a counting one, if it's done by a loop.
+
+    Returns None, if the iterator could be seen by user code.
+    """
+
+    if not iter_node.isExpressionBuiltinIter1():
+        return None
+
+    parent = iter_node.parent
+
+    if (
+        not parent.isStatementAssignmentVariable()
+        or not parent.getVariable().isTempVariable()
+    ):
+        return None
+
+    return ExpressionBuiltinIterRange(
+        value=iter_node.getValue(), source_ref=iter_node.getSourceReference()
+    )
+
+
 class ExpressionBuiltinIterForUnpack(ExpressionBuiltinIter1):
     kind = "EXPRESSION_BUILTIN_ITER_FOR_UNPACK"
 
@@ -275,6 +356,142 @@ class ExpressionBuiltinIter2(ExpressionChildrenHavingBase):
         return self, "new_builtin", "Eliminated useless iterator creation."
 
 
+class ExpressionBuiltinEnumerate(ExpressionChildrenHavingBase):
+    """ Node for the "enumerate" built-in.
+
+    Loops that unpack index and value do not need to create it at all, see
+    "convertEnumerateLoop".
+    """
+
+    kind = "EXPRESSION_BUILTIN_ENUMERATE"
+
+    named_children = ("iterable", "start")
+
+    def __init__(self, iterable, start, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self, values={"iterable": iterable, "start": start}, source_ref=source_ref
+        )
+
+    getIterable = ExpressionChildrenHavingBase.childGetter("iterable")
+    getStart = ExpressionChildrenHavingBase.childGetter("start")
+
+    def getTypeShape(self):
+        return ShapeTypeEnumerate
+
+    def computeExpression(self, trace_collection):
+        # Creating the iterator of the iterable may run any code.
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        from nuitka.optimizations.EnumerateLoops import convertEnumerateLoop
+
+        result = convertEnumerateLoop(iter_node)
+
+        if result is not None:
+            return (
+                result,
+                "new_expression",
+                "Loop over 'enumerate' counts the index without creating tuples.",
+            )
+
+        return self, "new_builtin", "Eliminated useless iterator creation."
+
+
+class ExpressionBuiltinZip(ExpressionBuiltinSingleArgBase):
+    """ Node for the "zip" built-in.
+
+    The iterables are given as one tuple value, which is what the C helper
+    uses anyway.
+    """
+
+    kind = "EXPRESSION_BUILTIN_ZIP"
+
+    def getTypeShape(self):
+        # Python2 creates a list, Python3 an iterator.
+        if python_version < 300:
+            return ShapeTypeList
+        else:
+            return ShapeTypeZip
+
+    def computeExpression(self, trace_collection):
+        value = self.getValue()
+
+        if python_version < 300 and value.isCompileTimeConstant():
+            return trace_collection.getCompileTimeComputationResult(
+                node=self,
+                computation=lambda: zip(*value.getCompileTimeConstant()),
+                description="Built-in call to 'zip' pre-computed.",
+            )
+
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        if python_version < 300:
+            return iter_node, None, None
+
+        return self, "new_builtin", "Eliminated useless iterator creation."
+
+
+# Types without "__reversed__", for which "reversed" creates its own iterator.
+_reversed_sequence_types = (tuple, str, unicode, bytes)
+_reversed_sequence_shapes = (
+    ShapeTypeTuple,
+    ShapeTypeStr,
+    ShapeTypeUnicode,
+    ShapeTypeBytes,
+)
+
+
+class ExpressionBuiltinReversed(ExpressionBuiltinSingleArgBase):
+    kind = "EXPRESSION_BUILTIN_REVERSED"
+
+    def getTypeShape(self):
+        # With "__reversed__", the result can be anything.
+        if self.getValue().getTypeShape() in _reversed_sequence_shapes:
+            return ShapeTypeReversed
+        else:
+            return ShapeUnknown
+
+    def computeExpression(self, trace_collection):
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        value = self.getValue()
+
+        # Iteration over known values, can use the reversed value directly.
+        if (
+            value.isCompileTimeConstant()
+            and type(value.getCompileTimeConstant()) in _reversed_sequence_types
+            and len(value.getCompileTimeConstant()) < 256
+        ):
+            result = ExpressionBuiltinIter1(
+                value=makeConstantReplacementNode(
+                    constant=tuple(reversed(value.getCompileTimeConstant())), node=value
+                ),
+                source_ref=iter_node.getSourceReference(),
+            )
+
+            return (
+                result,
+                "new_constant",
+                "Iteration over 'reversed' of constant value uses reversed constant.",
+            )
+
+        if self.getTypeShape() is ShapeTypeReversed:
+            return self, "new_builtin", "Eliminated useless iterator creation."
+
+        return iter_node, None, None
+
+
 class ExpressionAsyncIter(ExpressionBuiltinSingleArgBase):
     kind = "EXPRESSION_ASYNC_ITER"
 
@@ -0,0 +1,172 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for the calls to the 'map' and 'filter' built-ins.
+
+For Python2, these create containers, and can be computed for constant
+values, for Python3 they are iterators, that are created directly by the C
+helpers, without calling the type.
+"""
+
+from nuitka.PythonVersions import python_version
+from nuitka.specs import BuiltinParameterSpecs
+
+from .ExpressionBases import (
+    ExpressionChildrenHavingBase,
+    ExpressionSpecBasedComputationBase,
+)
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeDict,
+    ShapeTypeFilter,
+    ShapeTypeFrozenset,
+    ShapeTypeList,
+    ShapeTypeMap,
+    ShapeTypeSet,
+    ShapeTypeStr,
+    ShapeTypeTuple,
+    ShapeTypeUnicode,
+    ShapeTypeXrange,
+)
+from .shapes.StandardShapes import ShapeUnknown
+
+
+class ExpressionBuiltinMap(ExpressionChildrenHavingBase):
+    """ Node for the "map" built-in.
+
+    The iterables are given as a tuple expression, which is what the C
+    helper wants to have anyway.
+    """
+
+    kind = "EXPRESSION_BUILTIN_MAP"
+
+    named_children = ("function", "iterables")
+
+    def __init__(self, function, iterables, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values={"function": function, "iterables": iterables},
+            source_ref=source_ref,
+        )
+
+    getFunction = ExpressionChildrenHavingBase.childGetter("function")
+    getIterables = ExpressionChildrenHavingBase.childGetter("iterables")
+
+    def getTypeShape(self):
+        if python_version < 300:
+            return ShapeTypeList
+        else:
+            return ShapeTypeMap
+
+    def computeExpression(self, trace_collection):
+        function = self.getFunction()
+        iterables = self.getIterables()
+
+        # For Python3 this is an iterator, which cannot be a constant.
+        if (
+            python_version < 300
+            and function.isCompileTimeConstant()
+            and iterables.isCompileTimeConstant()
+        ):
+            return trace_collection.getCompileTimeComputationResult(
+                node=self,
+                computation=lambda: map(
+                    function.getCompileTimeConstant(),
+                    *iterables.getCompileTimeConstant()
+                ),
+                description="Built-in call to 'map' pre-computed.",
+            )
+
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        if python_version < 300:
+            return iter_node, None, None
+
+        # Iteration over an iterator is that iterator.
+        return (self, "new_builtin", "Eliminated useless iterator creation.")
+
+
+# For Python2, "filter" gives these types for their values, and lists for
+# all others.
+_filter_same_shapes = (ShapeTypeStr, ShapeTypeUnicode, ShapeTypeTuple)
+_filter_list_shapes = (
+    ShapeTypeList,
+    ShapeTypeSet,
+    ShapeTypeFrozenset,
+    ShapeTypeDict,
+    ShapeTypeXrange,
+)
+
+
+class ExpressionBuiltinFilter(ExpressionSpecBasedComputationBase):
+    kind = "EXPRESSION_BUILTIN_FILTER"
+
+    named_children = ("function", "iterable")
+
+    builtin_spec = BuiltinParameterSpecs.builtin_filter_spec
+
+    def __init__(self, function, iterable, source_ref):
+        ExpressionSpecBasedComputationBase.__init__(
+            self,
+            values={"function": function, "iterable": iterable},
+            source_ref=source_ref,
+        )
+
+    getFunction = ExpressionChildrenHavingBase.childGetter("function")
+    getIterable = ExpressionChildrenHavingBase.childGetter("iterable")
+
+    def getTypeShape(self):
+        if python_version >= 300:
+            return ShapeTypeFilter
+
+        iterable_shape = self.getIterable().getTypeShape()
+
+        if iterable_shape in _filter_same_shapes:
+            return iterable_shape
+        elif iterable_shape in _filter_list_shapes:
+            return ShapeTypeList
+        else:
+            return ShapeUnknown
+
+    def computeExpression(self, trace_collection):
+        function = self.getFunction()
+        iterable = self.getIterable()
+
+        # For Python3 this is an iterator, which cannot be a constant.
+        if (
+            python_version < 300
+            and function.isCompileTimeConstant()
+            and iterable.isCompileTimeConstant()
+        ):
+            return self.computeBuiltinSpec(
+                trace_collection=trace_collection, given_values=(function, iterable)
+            )
+
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        if python_version < 300:
+            return iter_node, None, None
+
+        # Iteration over an iterator is that iterator.
+        return (self, "new_builtin", "Eliminated useless iterator creation.")
@@ -0,0 +1,150 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for the calls to the 'min' and 'max' built-ins.
+
+With two arguments, these are a single comparison of the values, and the
+knowledge about comparing shapes applies. For an iterable, the loop over it
+is done in a C helper. The "key" and "default" arguments are not handled with
+these nodes.
+"""
+
+from nuitka.specs import BuiltinParameterSpecs
+
+from .ExpressionBases import (
+    ExpressionBuiltinSingleArgBase,
+    ExpressionChildrenHavingBase,
+    ExpressionSpecBasedComputationBase,
+)
+from .shapes.StandardShapes import ShapeUnknown
+
+
+class ExpressionBuiltinMinMax2Base(ExpressionSpecBasedComputationBase):
+    named_children = ("left", "right")
+
+    def __init__(self, left, right, source_ref):
+        ExpressionSpecBasedComputationBase.__init__(
+            self, values={"left": left, "right": right}, source_ref=source_ref
+        )
+
+        self.escape_desc = None
+
+    getLeft = ExpressionChildrenHavingBase.childGetter("left")
+    getRight = ExpressionChildrenHavingBase.childGetter("right")
+
+    def getTypeShape(self):
+        left_shape = self.getLeft().getTypeShape()
+
+        # One of the values is the result, so if they agree, that is it.
+        if left_shape is self.getRight().getTypeShape():
+            return left_shape
+        else:
+            return ShapeUnknown
+
+    @staticmethod
+    def getComparisonShape(left_shape, right_shape):
+        raise NotImplementedError
+
+    def computeExpression(self, trace_collection):
+        left = self.getLeft()
+        right = self.getRight()
+
+        if left.isCompileTimeConstant() and right.isCompileTimeConstant():
+            return self.computeBuiltinSpec(
+                trace_collection=trace_collection, given_values=(left, right)
+            )
+
+        # The new value is compared to the one found so far, i.e. the right
+        # value is the left operand of the comparison.
+        _type_shape, self.escape_desc = self.getComparisonShape(
+            right.getTypeShape(), left.getTypeShape()
+        )
+
+        exception_raise_exit = self.escape_desc.getExceptionExit()
+        if exception_raise_exit is not None:
+            trace_collection.onExceptionRaiseExit(exception_raise_exit)
+
+        if self.escape_desc.isValueEscaping():
+            # The value of these nodes escaped and could change its contents.
+            trace_collection.removeKnowledge(left)
+            trace_collection.removeKnowledge(right)
+
+        if self.escape_desc.isControlFlowEscape():
+            # Any code could be run, note that.
+            trace_collection.onControlFlowEscape(self)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return (
+            self.mayRaiseExceptionComparison()
+            or self.getLeft().mayRaiseException(exception_type)
+            or self.getRight().mayRaiseException(exception_type)
+        )
+
+    def mayRaiseExceptionComparison(self):
+        return (
+            self.escape_desc is None or self.escape_desc.getExceptionExit() is not None
+        )
+
+
+class ExpressionBuiltinMin2(ExpressionBuiltinMinMax2Base):
+    kind = "EXPRESSION_BUILTIN_MIN2"
+
+    builtin_spec = BuiltinParameterSpecs.builtin_min_spec
+
+    @staticmethod
+    def getComparisonShape(left_shape, right_shape):
+        return left_shape.getComparisonLtShape(right_shape)
+
+
+class ExpressionBuiltinMax2(ExpressionBuiltinMinMax2Base):
+    kind = "EXPRESSION_BUILTIN_MAX2"
+
+    builtin_spec = BuiltinParameterSpecs.builtin_max_spec
+
+    @staticmethod
+    def getComparisonShape(left_shape, right_shape):
+        return left_shape.getComparisonGtShape(right_shape)
+
+
+class ExpressionBuiltinMinMax1Base(ExpressionBuiltinSingleArgBase):
+    def computeExpression(self, trace_collection):
+        value = self.getValue()
+
+        if value.isCompileTimeConstant():
+            return self.computeBuiltinSpec(
+                trace_collection=trace_collection, given_values=(value,)
+            )
+
+        # Iterating and comparing could run any code.
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
+class ExpressionBuiltinMin1(ExpressionBuiltinMinMax1Base):
+    kind = "EXPRESSION_BUILTIN_MIN1"
+
+    builtin_spec = BuiltinParameterSpecs.builtin_min_spec
+
+
+class ExpressionBuiltinMax1(ExpressionBuiltinMinMax1Base):
+    kind = "EXPRESSION_BUILTIN_MAX1"
+
+    builtin_spec = BuiltinParameterSpecs.builtin_max_spec
@@ -25,6 +25,14 @@ from .ExpressionBases import (
     ExpressionBuiltinSingleArgBase,
     ExpressionChildrenHavingBase,
 )
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeEnumerate,
+    ShapeTypeIntOrLong,
+    ShapeTypeTuple,
+    ShapeTypeXrangeIterator,
+    ShapeTypeXrangeIteratorCounting,
+    ShapeTypeZip,
+)
 
 
 class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
@@ -40,6 +48,20 @@ class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
             next_node=self, trace_collection=trace_collection
         )
 
+    def getTypeShape(self):
+        # Iteration over ranges gives only integer values.
+        if self.getValue().getTypeShape() in (
+            ShapeTypeXrangeIterator,
+            ShapeTypeXrangeIteratorCounting,
+        ):
+            return ShapeTypeIntOrLong
+
+        # These give tuples of index and value, or of the values.
+        if self.getValue().getTypeShape() in (ShapeTypeEnumerate, ShapeTypeZip):
+            return ShapeTypeTuple
+
+        return ExpressionBuiltinSingleArgBase.getTypeShape(self)
+
 
 class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
     kind = "EXPRESSION_SPECIAL_UNPACK"
@@ -0,0 +1,140 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Nodes for the calls to the 'abs' and 'round' built-ins.
+
+For the number shapes, the result shape is known, and for 'abs' it cannot
+raise either.
+"""
+
+from nuitka.PythonVersions import python_version
+from nuitka.specs import BuiltinParameterSpecs
+
+from .ExpressionBases import (
+    ExpressionBuiltinSingleArgBase,
+    ExpressionChildrenHavingBase,
+    ExpressionSpecBasedComputationBase,
+)
+from .shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeComplex,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeIntOrLong,
+    ShapeTypeLong,
+    ShapeTypeNoneType,
+)
+from .shapes.StandardShapes import ShapeUnknown
+
+_abs_result_shapes = {
+    ShapeTypeBool: ShapeTypeInt,
+    # For Python2, the negative minimum value becomes a "long".
+    ShapeTypeInt: ShapeTypeIntOrLong,
+    ShapeTypeLong: ShapeTypeLong,
+    ShapeTypeIntOrLong: ShapeTypeIntOrLong,
+    ShapeTypeFloat: ShapeTypeFloat,
+    ShapeTypeComplex: ShapeTypeFloat,
+}
+
+
+class ExpressionBuiltinAbs(ExpressionBuiltinSingleArgBase):
+    kind = "EXPRESSION_BUILTIN_ABS"
+
+    builtin_spec = BuiltinParameterSpecs.builtin_abs_spec
+
+    def getTypeShape(self):
+        return _abs_result_shapes.get(self.getValue().getTypeShape(), ShapeUnknown)
+
+    def computeExpression(self, trace_collection):
+        value = self.getValue()
+
+        if value.isCompileTimeConstant():
+            return self.computeBuiltinSpec(
+                trace_collection=trace_collection, given_values=(value,)
+            )
+
+        if self.mayRaiseExceptionAbs():
+            # Any code could be run, note that.
+            trace_collection.onControlFlowEscape(self)
+
+            trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return self.mayRaiseExceptionAbs() or self.getValue().mayRaiseException(
+            exception_type
+        )
+
+    def mayRaiseExceptionAbs(self):
+        # The "complex" values can overflow.
+        shape = self.getValue().getTypeShape()
+
+        return shape is ShapeTypeComplex or shape not in _abs_result_shapes
+
+
+class ExpressionBuiltinRound(ExpressionSpecBasedComputationBase):
+    kind = "EXPRESSION_BUILTIN_ROUND"
+
+    named_children = ("number", "ndigits")
+
+    builtin_spec = BuiltinParameterSpecs.builtin_round_spec
+
+    def __init__(self, number, ndigits, source_ref):
+        ExpressionSpecBasedComputationBase.__init__(
+            self, values={"number": number, "ndigits": ndigits}, source_ref=source_ref
+        )
+
+    getNumber = ExpressionChildrenHavingBase.childGetter("number")
+    getNdigits = ExpressionChildrenHavingBase.childGetter("ndigits")
+
+    def getTypeShape(self):
+        # Python2 gives a float for everything, and raises otherwise.
+        if python_version < 300:
+            return ShapeTypeFloat
+
+        number_shape = self.getNumber().getTypeShape()
+
+        if number_shape in (ShapeTypeBool, ShapeTypeInt):
+            return ShapeTypeInt
+        elif number_shape is ShapeTypeFloat:
+            ndigits = self.getNdigits()
+
+            # Giving "None" is the same as not giving it.
+            if ndigits is None or ndigits.getTypeShape() is ShapeTypeNoneType:
+                return ShapeTypeInt
+            elif ndigits.getTypeShape() in (ShapeTypeBool, ShapeTypeInt):
+                return ShapeTypeFloat
+            else:
+                return ShapeUnknown
+        else:
+            return ShapeUnknown
+
+    def computeExpression(self, trace_collection):
+        given_values = (self.getNumber(), self.getNdigits())
+
+        if self.builtin_spec.isCompileTimeComputable(given_values):
+            return self.computeBuiltinSpec(
+                trace_collection=trace_collection, given_values=given_values
+            )
+
+        # Any code could be run, note that.
+        trace_collection.onControlFlowEscape(self)
+
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
@@ -28,6 +28,7 @@ import math
 from nuitka.PythonVersions import python_version
 from nuitka.specs import BuiltinParameterSpecs
 
+from .BuiltinIteratorNodes import makeExpressionBuiltinIterRange
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .NodeMakingHelpers import makeConstantReplacementNode
 from .shapes.BuiltinTypeShapes import ShapeTypeList, ShapeTypeXrange
@@ -134,6 +135,15 @@ class ExpressionBuiltinRangeBase(ExpressionChildrenHavingBase):
                 "Replaced 'range' with 'xrange' built-in call for iteration.",
             )
 
+        result = makeExpressionBuiltinIterRange(iter_node)
+
+        if result is not None:
+            return (
+                result,
+                "new_expression",
+                "Iteration over 'range' by loop counts with C values.",
+            )
+
         # No exception will be raised on ranges.
 
         return iter_node, None, None
@@ -432,6 +442,16 @@ class ExpressionBuiltinXrangeBase(ExpressionChildrenHavingBase):
         )
 
     def computeExpressionIter1(self, iter_node, trace_collection):
+        result = makeExpressionBuiltinIterRange(iter_node)
+
+        if result is not None:
+            return (
+                result,
+                "new_expression",
+                "Iteration over '%s' by loop counts with C values."
+                % self.builtin_spec.getName(),
+            )
+
         # No exception will be raised on xrange iteration.
 
         return iter_node, None, None
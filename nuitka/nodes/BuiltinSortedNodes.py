@@ -0,0 +1,90 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Node for the calls to the 'sorted' built-in.
+
+The result is always a new list, which gives a type shape, and for constant
+values, it can be computed at compile time.
+"""
+
+from nuitka.PythonVersions import python_version
+from nuitka.specs import BuiltinParameterSpecs
+
+from .ExpressionBases import ExpressionSpecBasedComputationBase
+from .shapes.BuiltinTypeShapes import ShapeTypeList
+
+
+class ExpressionBuiltinSorted(ExpressionSpecBasedComputationBase):
+    kind = "EXPRESSION_BUILTIN_SORTED"
+
+    if python_version < 300:
+        named_children = ("iterable", "cmp", "key", "reverse")
+    else:
+        named_children = ("iterable", "key", "reverse")
+
+    builtin_spec = BuiltinParameterSpecs.builtin_sorted_spec
+
+    if python_version < 300:
+
+        def __init__(self, iterable, cmp, key, reverse, source_ref):
+            assert iterable is not None
+
+            ExpressionSpecBasedComputationBase.__init__(
+                self,
+                values={
+                    "iterable": iterable,
+                    "cmp": cmp,
+                    "key": key,
+                    "reverse": reverse,
+                },
+                source_ref=source_ref,
+            )
+
+    else:
+
+        def __init__(self, iterable, key, reverse, source_ref):
+            assert iterable is not None
+
+            ExpressionSpecBasedComputationBase.__init__(
+                self,
+                values={"iterable": iterable, "key": key, "reverse": reverse},
+                source_ref=source_ref,
+            )
+
+    getIterable = ExpressionSpecBasedComputationBase.childGetter("iterable")
+    if python_version < 300:
+        getCmp = ExpressionSpecBasedComputationBase.childGetter("cmp")
+    getKey = ExpressionSpecBasedComputationBase.childGetter("key")
+    getReverse = ExpressionSpecBasedComputationBase.childGetter("reverse")
+
+    def getTypeShape(self):
+        return ShapeTypeList
+
+    def computeExpression(self, trace_collection):
+        if python_version < 300:
+            given_values = (
+                self.getIterable(),
+                self.getCmp(),
+                self.getKey(),
+                self.getReverse(),
+            )
+        else:
+            given_values = (self.getIterable(), self.getKey(), self.getReverse())
+
+        return self.computeBuiltinSpec(
+            trace_collection=trace_collection, given_values=given_values
+        )
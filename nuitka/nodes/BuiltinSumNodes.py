@@ -22,6 +22,7 @@ it that could be in-lined sometimes for more static analysis.
 
 """
 
+from nuitka.__past__ import long  # pylint: disable=I0021,redefined-builtin
 from nuitka.specs import BuiltinParameterSpecs
 
 from .ExpressionBases import ExpressionChildrenHavingBase
@@ -36,6 +37,28 @@ class ExpressionBuiltinSumBase(ExpressionChildrenHavingBase):
             self, values=values, source_ref=source_ref
         )
 
+    @staticmethod
+    def computeGeneratorExpressionSum(trace_collection, genexpr, start_value):
+        from nuitka.optimizations.GeneratorExpressionInlining import (
+            convertGeneratorExpressionToOutline,
+        )
+
+        result = convertGeneratorExpressionToOutline(
+            genexpr=genexpr, consumer="sum", start_value=start_value
+        )
+
+        if result is None:
+            return None
+
+        # The loop is only computed in the next pass, but may raise.
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return (
+            result,
+            "new_expression",
+            "Generator expression consumed by 'sum' in-lined as a loop.",
+        )
+
     def computeBuiltinSpec(self, trace_collection, given_values):
         assert self.builtin_spec is not None, self
 
@@ -71,6 +94,14 @@ class ExpressionBuiltinSum1(ExpressionBuiltinSumBase):
     def computeExpression(self, trace_collection):
         sequence = self.getSequence()
 
+        if sequence.isExpressionOutlineBody():
+            result = self.computeGeneratorExpressionSum(
+                trace_collection=trace_collection, genexpr=sequence, start_value=0
+            )
+
+            if result is not None:
+                return result
+
         # TODO: Protect against large xrange constants
         return self.computeBuiltinSpec(
             trace_collection=trace_collection, given_values=(sequence,)
@@ -97,6 +128,22 @@ class ExpressionBuiltinSum2(ExpressionBuiltinSumBase):
         sequence = self.getSequence()
         start = self.getStart()
 
+        # Other start values, e.g. strings, are rejected by "sum", so only
+        # numbers are added up in-line.
+        if (
+            sequence.isExpressionOutlineBody()
+            and start.isExpressionConstantRef()
+            and type(start.getConstant()) in (int, long, float, complex)
+        ):
+            result = self.computeGeneratorExpressionSum(
+                trace_collection=trace_collection,
+                genexpr=sequence,
+                start_value=start.getConstant(),
+            )
+
+            if result is not None:
+                return result
+
         # TODO: Protect against large xrange constants
         return self.computeBuiltinSpec(
             trace_collection=trace_collection, given_values=(sequence, start)
@@ -52,6 +52,11 @@ class ExpressionBuiltinContainerBase(ExpressionSpecBasedComputationBase):
 
     builtin_spec = None
 
+    # Consumer name and start value, for generator expressions that can be
+    # in-lined as a loop filling the container.
+    generator_consumer = None
+    generator_start_value = None
+
     named_children = ("value",)
 
     def __init__(self, value, source_ref):
@@ -76,6 +81,28 @@ class ExpressionBuiltinContainerBase(ExpressionSpecBasedComputationBase):
             else:
                 return self, None, None
         else:
+            if self.generator_consumer is not None and value.isExpressionOutlineBody():
+                from nuitka.optimizations.GeneratorExpressionInlining import (
+                    convertGeneratorExpressionToOutline,
+                )
+
+                result = convertGeneratorExpressionToOutline(
+                    genexpr=value,
+                    consumer=self.generator_consumer,
+                    start_value=self.generator_start_value,
+                )
+
+                if result is not None:
+                    # The loop is only computed in the next pass, but may raise.
+                    trace_collection.onExceptionRaiseExit(BaseException)
+
+                    return (
+                        result,
+                        "new_expression",
+                        "Generator expression consumed by '%s' in-lined as a loop."
+                        % self.generator_consumer,
+                    )
+
             return self.computeBuiltinSpec(
                 trace_collection=trace_collection, given_values=(value,)
             )
@@ -86,18 +113,27 @@ class ExpressionBuiltinTuple(ExpressionBuiltinContainerBase):
 
     builtin_spec = BuiltinParameterSpecs.builtin_tuple_spec
 
+    generator_consumer = "tuple"
+    generator_start_value = []
+
 
 class ExpressionBuiltinList(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_LIST"
 
     builtin_spec = BuiltinParameterSpecs.builtin_list_spec
 
+    generator_consumer = "list"
+    generator_start_value = []
+
 
 class ExpressionBuiltinSet(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_SET"
 
     builtin_spec = BuiltinParameterSpecs.builtin_set_spec
 
+    generator_consumer = "set"
+    generator_start_value = set()
+
 
 class ExpressionBuiltinFrozenset(ExpressionBuiltinContainerBase):
     kind = "EXPRESSION_BUILTIN_FROZENSET"
@@ -773,6 +773,22 @@ class ExpressionConstantXrangeRef(ExpressionConstantRefBase):
     def getTypeShape(self):
         return ShapeTypeXrange
 
+    def computeExpressionIter1(self, iter_node, trace_collection):
+        from .BuiltinIteratorNodes import makeExpressionBuiltinIterRange
+
+        result = makeExpressionBuiltinIterRange(iter_node)
+
+        if result is not None:
+            return (
+                result,
+                "new_expression",
+                "Iteration over constant range by loop counts with C values.",
+            )
+
+        return ExpressionConstantRefBase.computeExpressionIter1(
+            self, iter_node=iter_node, trace_collection=trace_collection
+        )
+
 
 class ExpressionConstantTypeRef(ExpressionConstantRefBase):
     kind = "EXPRESSION_CONSTANT_TYPE_REF"
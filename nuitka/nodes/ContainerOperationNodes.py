@@ -128,8 +128,22 @@ class StatementSetOperationAdd(StatementChildrenHavingBase):
 
         trace_collection.removeKnowledge(self.getSet())
 
+        if not self.getValue().isKnownToBeHashable():
+            # Any exception may be raised.
+            trace_collection.onExceptionRaiseExit(BaseException)
+
         return self, None, None
 
+    def mayRaiseException(self, exception_type):
+        value = self.getValue()
+
+        if not value.isKnownToBeHashable():
+            return True
+
+        return value.mayRaiseException(
+            exception_type
+        ) or self.getSet().mayRaiseException(exception_type)
+
 
 class ExpressionSetOperationUpdate(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_SET_OPERATION_UPDATE"
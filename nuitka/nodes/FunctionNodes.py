@@ -443,6 +443,9 @@ class ExpressionFunctionBody(
         # Indicator if the function is used outside of where it's defined.
         self.cross_module_use = False
 
+        # Indicator if the function is called directly from other modules.
+        self.cross_module_call = False
+
         self.parameters = parameters
         self.parameters.setOwner(self)
 
@@ -541,6 +544,12 @@ class ExpressionFunctionBody(
     def markAsCrossModuleUsed(self):
         self.cross_module_use = True
 
+    def isCrossModuleCalled(self):
+        return self.cross_module_call
+
+    def markAsCrossModuleCalled(self):
+        self.cross_module_call = True
+
     def computeExpressionCall(self, call_node, call_args, call_kw, trace_collection):
         # TODO: Until we have something to re-order the arguments, we need to
         # skip this. For the immediate need, we avoid this complexity, as a
@@ -937,6 +946,12 @@ class ExpressionFunctionQualnameRef(CompileTimeConstantExpressionBase):
         del self.parent
         del self.function_body
 
+    def getDetails(self):
+        return {"function_body": self.function_body}
+
+    def getDetailsForDisplay(self):
+        return {"code_name": self.function_body.getCodeName()}
+
     def computeExpressionRaw(self, trace_collection):
         result = makeConstantReplacementNode(
             node=self, constant=self.function_body.getFunctionQualname()
@@ -64,6 +64,9 @@ class ExpressionBuiltinLocalsBase(ExpressionBase):
         del self.locals_scope
         del self.variable_traces
 
+    def getDetails(self):
+        return {"locals_scope": self.locals_scope}
+
     def mayHaveSideEffects(self):
         return False
 
@@ -34,6 +34,8 @@ from nuitka.importing.Importing import findModule, getModuleNameAndKindFromFilen
 from nuitka.importing.Recursion import decideRecursion, recurseTo
 from nuitka.importing.Whitelisting import getModuleWhiteList
 from nuitka.ModuleRegistry import getUncompiledModule
+from nuitka.optimizations.ModuleKnowledge import getModuleKnowledge
+from nuitka.Options import isExperimental
 from nuitka.utils.FileOperations import relpath
 
 from .ExpressionBases import (
@@ -43,6 +45,10 @@ from .ExpressionBases import (
 )
 from .LocalsScopes import GlobalsDictHandle
 from .NodeBases import StatementChildHavingBase
+from .NodeMakingHelpers import (
+    makeConstantReplacementNode,
+    wrapExpressionWithSideEffects,
+)
 from .shapes.BuiltinTypeShapes import ShapeTypeBuiltinModule, ShapeTypeModule
 
 
@@ -432,7 +438,76 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
         # the future with embedded modules.
         return self, None, None
 
-    # TODO: Add computeExpressionImportName
+    def _getImportNameKnowledge(self, import_name):
+        if self.imported_module_desc is None:
+            return None
+
+        imported_module_name = self.imported_module_desc[0]
+
+        # For packages, the name may be a sub-module imported by this, which
+        # then is the value instead.
+        for import_list_module_desc in self.import_list_modules_desc:
+            if import_list_module_desc[0] == imported_module_name + "." + import_name:
+                return None
+
+        return getModuleKnowledge(imported_module_name)
+
+    def getImportNameConstantNode(self, import_node, import_name):
+        """ Constant node for an imported name known to be constant, or None.
+
+            Other modules could still change the value, e.g. with "setattr",
+            therefore this is experimental.
+        """
+
+        if not isExperimental("module_constants"):
+            return None
+
+        knowledge = self._getImportNameKnowledge(import_name)
+
+        if knowledge is None or not knowledge.hasConstant(import_name):
+            return None
+
+        return makeConstantReplacementNode(
+            constant=knowledge.getConstant(import_name), node=import_node
+        )
+
+    def getImportNameFunctionBody(self, import_name):
+        """ Function body of an imported name known to be a function, or None.
+
+            The value can still be changed from the outside, so calls using
+            this must check the called value at run time.
+        """
+
+        knowledge = self._getImportNameKnowledge(import_name)
+
+        if knowledge is None:
+            return None
+
+        return knowledge.getFunctionBody(import_name)
+
+    def computeExpressionImportName(self, import_node, import_name, trace_collection):
+        result = self.getImportNameConstantNode(
+            import_node=import_node, import_name=import_name
+        )
+
+        if result is not None:
+            result = wrapExpressionWithSideEffects(
+                side_effects=(self,), old_node=import_node, new_node=result
+            )
+
+            return (
+                result,
+                "new_constant",
+                "Imported name '%s' is known to be constant in module '%s'."
+                % (import_name, self.imported_module_desc[0]),
+            )
+
+        return ExpressionChildrenHavingBase.computeExpressionImportName(
+            self,
+            import_node=import_node,
+            import_name=import_name,
+            trace_collection=trace_collection,
+        )
 
     def mayRaiseException(self, exception_type):
         return self.finding != "built-in"
@@ -465,6 +540,12 @@ class StatementImportStar(StatementChildHavingBase):
         if type(self.target_scope) is GlobalsDictHandle:
             self.target_scope.markAsEscaped()
 
+    def getDetails(self):
+        return {"target_scope": self.target_scope}
+
+    def getDetailsForDisplay(self):
+        return {}
+
     getSourceModule = StatementChildHavingBase.childGetter("module")
 
     def getTargetDictScope(self):
@@ -537,3 +618,26 @@ class ExpressionImportName(ExpressionChildHavingBase):
         return self.getModule().mayRaiseExceptionImportName(
             exception_type=exception_type, import_name=self.import_name
         )
+
+    def getImportedFunctionBody(self):
+        """ Function body of the imported name if known, or None.
+
+            The imported value can still be changed from the outside, so
+            calls using this must check the called value at run time.
+        """
+
+        module = self.getModule()
+
+        # For "from x import a, b" the module is in a temporary variable.
+        if module.isExpressionTempVariableRef():
+            variable_trace = module.getVariableTrace()
+
+            if variable_trace is None or not variable_trace.isAssignTrace():
+                return None
+
+            module = variable_trace.getAssignNode().getAssignSource()
+
+        if not module.isExpressionBuiltinImport():
+            return None
+
+        return module.getImportNameFunctionBody(self.import_name)
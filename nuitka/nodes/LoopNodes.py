@@ -22,6 +22,7 @@ statements for it. These re-formulations require that optimization of loops has
 to be very general, yet the node type for loop, becomes very simple.
 """
 
+from nuitka import Variables
 from nuitka.optimizations.TraceCollections import TraceCollectionBranch
 from nuitka.tree.Extractions import getVariablesWritten
 
@@ -36,7 +37,7 @@ class StatementLoop(StatementChildHavingBase):
 
     checker = checkStatementsSequenceOrNone
 
-    __slots__ = ("loop_variables", "loop_memory")
+    __slots__ = ("loop_variables", "loop_memory", "loop_variables_complete")
 
     def __init__(self, body, source_ref):
         StatementChildHavingBase.__init__(self, value=body, source_ref=source_ref)
@@ -44,9 +45,18 @@ class StatementLoop(StatementChildHavingBase):
         self.loop_variables = None
         self.loop_memory = None
 
+        # Were the loop variable shapes learned with complete variable usage.
+        self.loop_variables_complete = False
+
     getLoopBody = StatementChildHavingBase.childGetter("body")
     setLoopBody = StatementChildHavingBase.childSetter("body")
 
+    def resetLoopVariables(self):
+        # The loop body was changed to write other variables, so what was
+        # learned in previous passes is not valid anymore.
+        self.loop_variables = None
+        self.loop_memory = None
+
     def mayReturn(self):
         loop_body = self.getLoopBody()
 
@@ -94,12 +104,20 @@ class StatementLoop(StatementChildHavingBase):
             loop_body = self.getLoopBody()
 
             if loop_body is not None:
+                # Shapes learned before variable usage was complete can be
+                # too pessimistic, and as they only ever grow, learn them
+                # again once.
+                if not self.loop_variables_complete and Variables.complete:
+                    self.resetLoopVariables()
+
                 # Look ahead. what will be written and degrade to initial loop
                 # traces about that if we are in the first iteration, later we
                 # will have more precise knowledge.
                 if self.loop_variables is None:
                     early = True
 
+                    self.loop_variables_complete = Variables.complete
+
                     loop_variables = getVariablesWritten(loop_body)
 
                     self.loop_variables = {}
@@ -177,6 +195,11 @@ class StatementLoop(StatementChildHavingBase):
 
                 continue_collections = trace_collection.getLoopContinueCollections()
 
+                # Shapes learned with complete variable usage, e.g. restored
+                # from a cached tree, are not to be widened by too pessimistic
+                # ones before usage is complete.
+                learn_shapes = Variables.complete or not self.loop_variables_complete
+
                 for variable, loop_entry_trace in loop_entry_traces:
                     loop_end_traces = set()
 
@@ -186,9 +209,10 @@ class StatementLoop(StatementChildHavingBase):
                         )
 
                         if loop_end_trace is not loop_entry_trace:
-                            loop_end_trace.getTypeShape().emitAlternatives(
-                                self.loop_variables[variable].add
-                            )
+                            if learn_shapes:
+                                loop_end_trace.getTypeShape().emitAlternatives(
+                                    self.loop_variables[variable].add
+                                )
 
                             loop_end_traces.add(loop_end_trace)
 
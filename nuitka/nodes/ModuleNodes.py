@@ -261,6 +261,9 @@ class CompiledPythonModule(
         self.active_functions = OrderedSet()
         self.cross_used_functions = OrderedSet()
 
+        # Functions of other modules, that this one calls directly.
+        self.cross_called_functions = OrderedSet()
+
         # Often "None" until tree building finishes its part.
         self.future_spec = future_spec
 
@@ -458,6 +461,12 @@ class CompiledPythonModule(
     def getCrossUsedFunctions(self):
         return self.cross_used_functions
 
+    def addCrossCalledFunction(self, function_body):
+        self.cross_called_functions.add(function_body)
+
+    def getCrossCalledFunctions(self):
+        return self.cross_called_functions
+
     def getFunctionFromCodeName(self, code_name):
         for function in self.getFunctions():
             if function.getCodeName() == code_name:
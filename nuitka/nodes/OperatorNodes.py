@@ -85,7 +85,7 @@ class ExpressionOperationBinaryBase(ExpressionChildrenHavingBase):
     def computeExpression(self, trace_collection):
         operator = self.getOperator()
 
-        assert operator not in ("Mult", "Add")
+        assert operator not in ("Mult", "Add", "Sub")
 
         left = self.subnode_left
         right = self.subnode_right
@@ -219,6 +219,73 @@ class ExpressionOperationBinaryAdd(ExpressionOperationBinaryBase):
         )
 
 
+class ExpressionOperationBinarySub(ExpressionOperationBinaryBase):
+    kind = "EXPRESSION_OPERATION_BINARY_SUB"
+
+    def __init__(self, left, right, source_ref):
+        ExpressionOperationBinaryBase.__init__(
+            self, operator="Sub", left=left, right=right, source_ref=source_ref
+        )
+
+        self.type_shape = None
+        self.escape_desc = None
+
+    def getDetails(self):
+        return {}
+
+    def getTypeShape(self):
+        return self.type_shape
+
+    def computeExpression(self, trace_collection):
+        left = self.subnode_left
+        right = self.subnode_right
+
+        left_shape = left.getTypeShape()
+        right_shape = right.getTypeShape()
+
+        self.type_shape, self.escape_desc = left_shape.getOperationBinarySubShape(
+            right_shape
+        )
+
+        if left.isCompileTimeConstant() and right.isCompileTimeConstant():
+            left_value = left.getCompileTimeConstant()
+            right_value = right.getCompileTimeConstant()
+
+            return trace_collection.getCompileTimeComputationResult(
+                node=self,
+                computation=lambda: self.getSimulator()(left_value, right_value),
+                description="Operator '-' with constant arguments.",
+            )
+
+        exception_raise_exit = self.escape_desc.getExceptionExit()
+        if exception_raise_exit is not None:
+            trace_collection.onExceptionRaiseExit(exception_raise_exit)
+
+        if self.escape_desc.isValueEscaping():
+            # The value of these nodes escaped and could change its contents.
+            trace_collection.removeKnowledge(left)
+            trace_collection.removeKnowledge(right)
+
+        if self.escape_desc.isControlFlowEscape():
+            # Any code could be run, note that.
+            trace_collection.onControlFlowEscape(self)
+
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return (
+            self.escape_desc is None
+            or self.escape_desc.getExceptionExit() is not None
+            or self.subnode_left.mayRaiseException(exception_type)
+            or self.subnode_right.mayRaiseException(exception_type)
+        )
+
+    def mayRaiseExceptionOperation(self):
+        return (
+            self.escape_desc is None or self.escape_desc.getExceptionExit() is not None
+        )
+
+
 class ExpressionOperationBinaryMult(ExpressionOperationBinaryBase):
     kind = "EXPRESSION_OPERATION_BINARY_MULT"
 
@@ -228,6 +295,7 @@ class ExpressionOperationBinaryMult(ExpressionOperationBinaryBase):
         )
 
         self.shape = None
+        self.type_shape = ShapeUnknown
 
     def getDetails(self):
         return {}
@@ -242,7 +310,7 @@ class ExpressionOperationBinaryMult(ExpressionOperationBinaryBase):
         if self.shape is not None:
             return self.shape.getTypeShape()
         else:
-            return ShapeUnknown
+            return self.type_shape
 
     def getIterationLength(self):
         left_length = self.getLeft().getIterationLength()
@@ -327,6 +395,11 @@ class ExpressionOperationBinaryMult(ExpressionOperationBinaryBase):
                 description="Operator '*' with constant arguments.",
             )
 
+        # Only numbers are predicted, sequence repetition is not.
+        self.type_shape, _escape_desc = left.getTypeShape().getOperationBinaryMultShape(
+            right.getTypeShape()
+        )
+
         # The value of these nodes escaped and could change its contents.
         trace_collection.removeKnowledge(left)
         trace_collection.removeKnowledge(right)
@@ -372,6 +445,9 @@ class ExpressionOperationBinaryDivmod(ExpressionOperationBinaryBase):
 
         self.shape = None
 
+    def getDetails(self):
+        return {}
+
     # TODO: Value shape is two elemented tuple of int or float both.
     def getTypeShape(self):
         return ShapeTypeTuple
@@ -382,6 +458,10 @@ def makeBinaryOperationNode(operator, left, right, source_ref):
         return ExpressionOperationBinaryAdd(
             left=left, right=right, source_ref=source_ref
         )
+    elif operator == "Sub":
+        return ExpressionOperationBinarySub(
+            left=left, right=right, source_ref=source_ref
+        )
     elif operator == "Mult":
         return ExpressionOperationBinaryMult(
             left=left, right=right, source_ref=source_ref
@@ -522,6 +602,19 @@ class ExpressionOperationNOT(ExpressionOperationUnaryBase):
         return (self,)
 
 
+_inplace_shape_getters = {
+    "IAdd": lambda left_shape, right_shape: left_shape.getOperationBinaryAddShape(
+        right_shape
+    ),
+    "ISub": lambda left_shape, right_shape: left_shape.getOperationBinarySubShape(
+        right_shape
+    ),
+    "IMult": lambda left_shape, right_shape: left_shape.getOperationBinaryMultShape(
+        right_shape
+    ),
+}
+
+
 class ExpressionOperationBinaryInplace(ExpressionOperationBinary):
     kind = "EXPRESSION_OPERATION_BINARY_INPLACE"
 
@@ -530,10 +623,15 @@ class ExpressionOperationBinaryInplace(ExpressionOperationBinary):
             self, operator=operator, left=left, right=right, source_ref=source_ref
         )
 
+        self.type_shape = ShapeUnknown
+
     @staticmethod
     def isExpressionOperationBinary():
         return True
 
+    def getTypeShape(self):
+        return self.type_shape
+
     def computeExpression(self, trace_collection):
         # In-place operation requires extra care to avoid corruption of
         # values.
@@ -561,6 +659,15 @@ Lowered in-place binary operation of compile time constant to binary operation."
 
             return result.computeExpression(trace_collection)
 
+        # For numbers, in-place operations are the same as normal ones, and
+        # create new objects, so the result shape can be predicted.
+        shape_getter = _inplace_shape_getters.get(self.getOperator())
+
+        if shape_getter is not None:
+            self.type_shape, _escape_desc = shape_getter(
+                left.getTypeShape(), right.getTypeShape()
+            )
+
         # Any exception may be raised.
         trace_collection.onExceptionRaiseExit(BaseException)
 
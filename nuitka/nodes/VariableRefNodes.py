@@ -122,6 +122,11 @@ class ExpressionVariableRefBase(ExpressionBase):
     def getVariable(self):
         return self.variable
 
+    def setVariable(self, variable):
+        assert isinstance(variable, Variables.Variable), repr(variable)
+
+        self.variable = variable
+
     def getVariableTrace(self):
         return self.variable_trace
 
@@ -292,11 +297,6 @@ class ExpressionVariableRef(ExpressionVariableRefBase):
     def getVariable(self):
         return self.variable
 
-    def setVariable(self, variable):
-        assert isinstance(variable, Variables.Variable), repr(variable)
-
-        self.variable = variable
-
     def computeExpressionRaw(self, trace_collection):
         # Terribly detailed, pylint: disable=too-many-branches,too-many-statements
 
@@ -536,6 +536,11 @@ class ExpressionTempVariableRef(ExpressionVariableRefBase):
             current_index = trace_collection.getIteratorNextCount(value)
             trace_collection.onIteratorNext(value)
 
+            # Unpacking of containers is checked for in the next pass, see
+            # "convertContainerUnpacking".
+            if next_node.isExpressionSpecialUnpack() and not next_node.getStarred():
+                self.variable_trace.addUnpackUsage(next_node)
+
             if value.hasShapeSlotNext():
                 if (
                     current_index is not None
@@ -592,6 +597,29 @@ class ExpressionTempVariableRef(ExpressionVariableRefBase):
                 self, exception_type, import_name
             )
 
+    def computeExpressionImportName(self, import_node, import_name, trace_collection):
+        if self.variable_trace.isAssignTrace():
+            value = self.variable_trace.getAssignNode().getAssignSource()
+
+            if value.isExpressionBuiltinImport():
+                result = value.getImportNameConstantNode(
+                    import_node=import_node, import_name=import_name
+                )
+
+                if result is not None:
+                    return (
+                        result,
+                        "new_constant",
+                        "Imported name '%s' is known to be constant." % import_name,
+                    )
+
+        return ExpressionBase.computeExpressionImportName(
+            self,
+            import_node=import_node,
+            import_name=import_name,
+            trace_collection=trace_collection,
+        )
+
     def isKnownToBeIterableAtMin(self, count):
         # TODO: See through the variable current trace.
         return None
@@ -20,7 +20,11 @@
 """
 
 from nuitka.codegen.c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
+from nuitka.codegen.c_types.CTypeNuitkaFloats import CTypeNuitkaFloatStruct
 from nuitka.codegen.c_types.CTypeNuitkaInts import CTypeNuitkaIntOrLongStruct
+from nuitka.codegen.c_types.CTypeNuitkaRangeIterators import (
+    CTypeNuitkaRangeIteratorStruct,
+)
 from nuitka.codegen.Reports import onMissingOperation
 from nuitka.Options import isExperimental
 from nuitka.PythonVersions import python_version
@@ -55,6 +59,34 @@ def _getOperationBinaryAddShapeGeneric(cls, right_shape):
     return operation_result_unknown
 
 
+def _getOperationBinarySubShapeGeneric(cls, right_shape):
+    if right_shape is ShapeUnknown:
+        return operation_result_unknown
+
+    if type(right_shape) is ShapeLoopCompleteAlternative:
+        return right_shape.getOperationBinarySubLShape(cls)
+
+    if type(right_shape) is ShapeLoopInitialAlternative:
+        return operation_result_unknown
+
+    onMissingOperation("Sub", cls, right_shape)
+    return operation_result_unknown
+
+
+def _getOperationBinaryMultShapeGeneric(cls, right_shape):
+    if right_shape is ShapeUnknown:
+        return operation_result_unknown
+
+    if type(right_shape) is ShapeLoopCompleteAlternative:
+        return right_shape.getOperationBinaryMultLShape(cls)
+
+    if type(right_shape) is ShapeLoopInitialAlternative:
+        return operation_result_unknown
+
+    onMissingOperation("Mult", cls, right_shape)
+    return operation_result_unknown
+
+
 def _getComparisonLtShapeGeneric(cls, right_shape):
     if type(right_shape) is ShapeLoopCompleteAlternative:
         return right_shape.getComparisonLtLShape(cls)
@@ -210,6 +242,21 @@ class ShapeTypeBool(ShapeBase):
 
         return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        # For numbers, the result types are the same as for adding.
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
+    @classmethod
+    def getOperationBinaryMultShape(cls, right_shape):
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinaryMultShapeGeneric(cls, right_shape)
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -231,6 +278,12 @@ class ShapeTypeBool(ShapeBase):
 
 
 class ShapeTypeInt(ShapeBase):
+    if python_version < 300 and isExperimental("nuitka_ilong"):
+
+        @staticmethod
+        def getCType():
+            return CTypeNuitkaIntOrLongStruct
+
     @staticmethod
     def getTypeName():
         return "int"
@@ -298,6 +351,21 @@ class ShapeTypeInt(ShapeBase):
 
         return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        # For numbers, the result types are the same as for adding.
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
+    @classmethod
+    def getOperationBinaryMultShape(cls, right_shape):
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinaryMultShapeGeneric(cls, right_shape)
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -380,6 +448,21 @@ class ShapeTypeLong(ShapeBase):
 
         return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        # For numbers, the result types are the same as for adding.
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
+    @classmethod
+    def getOperationBinaryMultShape(cls, right_shape):
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinaryMultShapeGeneric(cls, right_shape)
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -467,6 +550,21 @@ if python_version < 300:
 
             return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+        @classmethod
+        def getOperationBinarySubShape(cls, right_shape):
+            # For numbers, the result types are the same as for adding.
+            if right_shape in _number_shapes:
+                return cls.getOperationBinaryAddShape(right_shape)
+
+            return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
+        @classmethod
+        def getOperationBinaryMultShape(cls, right_shape):
+            if right_shape in _number_shapes:
+                return cls.getOperationBinaryAddShape(right_shape)
+
+            return _getOperationBinaryMultShapeGeneric(cls, right_shape)
+
         @classmethod
         def getComparisonLtShape(cls, right_shape):
             if right_shape is ShapeUnknown:
@@ -496,6 +594,10 @@ class ShapeTypeIntOrLongDerived(ShapeUnknown):
 
 
 class ShapeTypeFloat(ShapeBase):
+    @staticmethod
+    def getCType():
+        return CTypeNuitkaFloatStruct
+
     @staticmethod
     def getTypeName():
         return "float"
@@ -557,6 +659,21 @@ class ShapeTypeFloat(ShapeBase):
 
         return _getOperationBinaryAddShapeGeneric(cls, right_shape)
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        # For numbers, the result types are the same as for adding.
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinarySubShapeGeneric(cls, right_shape)
+
+    @classmethod
+    def getOperationBinaryMultShape(cls, right_shape):
+        if right_shape in _number_shapes:
+            return cls.getOperationBinaryAddShape(right_shape)
+
+        return _getOperationBinaryMultShapeGeneric(cls, right_shape)
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         if right_shape is ShapeUnknown:
@@ -581,6 +698,16 @@ class ShapeTypeFloatDerived(ShapeUnknown):
     pass
 
 
+# Numbers that give the same result shapes for "-" and "*" as for "+".
+_number_shapes = (
+    ShapeTypeBool,
+    ShapeTypeInt,
+    ShapeTypeLong,
+    ShapeTypeIntOrLong,
+    ShapeTypeFloat,
+)
+
+
 class ShapeTypeComplex(ShapeBase):
     @staticmethod
     def getTypeName():
@@ -1617,6 +1744,104 @@ class ShapeTypeXrangeIterator(ShapeIterator):
         return False
 
 
+class ShapeTypeXrangeIteratorCounting(ShapeTypeXrangeIterator):
+    """ Iterator over a range created by a loop, never seen by user code. """
+
+    @staticmethod
+    def getCType():
+        return CTypeNuitkaRangeIteratorStruct
+
+
+class ShapeTypeEnumerate(ShapeIterator):
+    @staticmethod
+    def getTypeName():
+        return "enumerate"
+
+    @staticmethod
+    def hasShapeSlotBool():
+        return True
+
+    @staticmethod
+    def hasShapeSlotLen():
+        return False
+
+    @staticmethod
+    def getShapeIter():
+        return ShapeTypeEnumerate
+
+
+class ShapeTypeZip(ShapeIterator):
+    @staticmethod
+    def getTypeName():
+        return "zip"
+
+    @staticmethod
+    def hasShapeSlotBool():
+        return True
+
+    @staticmethod
+    def hasShapeSlotLen():
+        return False
+
+    @staticmethod
+    def getShapeIter():
+        return ShapeTypeZip
+
+
+class ShapeTypeReversed(ShapeIterator):
+    @staticmethod
+    def getTypeName():
+        return "reversed"
+
+    @staticmethod
+    def hasShapeSlotBool():
+        return True
+
+    @staticmethod
+    def hasShapeSlotLen():
+        return False
+
+    @staticmethod
+    def getShapeIter():
+        return ShapeTypeReversed
+
+
+class ShapeTypeMap(ShapeIterator):
+    @staticmethod
+    def getTypeName():
+        return "map"
+
+    @staticmethod
+    def hasShapeSlotBool():
+        return True
+
+    @staticmethod
+    def hasShapeSlotLen():
+        return False
+
+    @staticmethod
+    def getShapeIter():
+        return ShapeTypeMap
+
+
+class ShapeTypeFilter(ShapeIterator):
+    @staticmethod
+    def getTypeName():
+        return "filter"
+
+    @staticmethod
+    def hasShapeSlotBool():
+        return True
+
+    @staticmethod
+    def hasShapeSlotLen():
+        return False
+
+    @staticmethod
+    def getShapeIter():
+        return ShapeTypeFilter
+
+
 class ShapeTypeType(ShapeBase):
     @staticmethod
     def getTypeName():
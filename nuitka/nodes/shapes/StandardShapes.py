@@ -88,6 +88,18 @@ class ShapeBase(object):
 
         return ShapeUnknown, ControlFlowDescriptionFullEscape
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        onMissingOperation("Sub", cls, right_shape)
+
+        return ShapeUnknown, ControlFlowDescriptionFullEscape
+
+    @classmethod
+    def getOperationBinaryMultShape(cls, right_shape):
+        onMissingOperation("Mult", cls, right_shape)
+
+        return ShapeUnknown, ControlFlowDescriptionFullEscape
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         onMissingOperation("Lt", cls, right_shape)
@@ -124,6 +136,14 @@ class ShapeUnknown(ShapeBase):
     def getOperationBinaryAddShape(cls, right_shape):
         return ShapeUnknown, ControlFlowDescriptionFullEscape
 
+    @classmethod
+    def getOperationBinarySubShape(cls, right_shape):
+        return ShapeUnknown, ControlFlowDescriptionFullEscape
+
+    @classmethod
+    def getOperationBinaryMultShape(cls, right_shape):
+        return ShapeUnknown, ControlFlowDescriptionFullEscape
+
     @classmethod
     def getComparisonLtShape(cls, right_shape):
         return ShapeUnknown, ControlFlowDescriptionFullEscape
@@ -264,6 +284,32 @@ class ShapeLoopInitialAlternative(ShapeBase):
                 ControlFlowDescriptionFullEscape,
             )
 
+    def getOperationBinarySubShape(self, right_shape):
+        if right_shape is ShapeUnknown:
+            return ShapeUnknown, ControlFlowDescriptionFullEscape
+        else:
+            return (
+                self._collectInitialShape(
+                    operation=lambda left_shape: left_shape.getOperationBinarySubShape(
+                        right_shape
+                    )
+                ),
+                ControlFlowDescriptionFullEscape,
+            )
+
+    def getOperationBinaryMultShape(self, right_shape):
+        if right_shape is ShapeUnknown:
+            return ShapeUnknown, ControlFlowDescriptionFullEscape
+        else:
+            return (
+                self._collectInitialShape(
+                    operation=lambda left_shape: left_shape.getOperationBinaryMultShape(
+                        right_shape
+                    )
+                ),
+                ControlFlowDescriptionFullEscape,
+            )
+
     def getComparisonLtShape(self, right_shape):
         if right_shape is ShapeUnknown:
             return ShapeUnknown, ControlFlowDescriptionFullEscape
@@ -375,6 +421,40 @@ class ShapeLoopCompleteAlternative(ShapeBase):
             operation=left_shape.getOperationBinaryAddShape
         )
 
+    def getOperationBinarySubShape(self, right_shape):
+        if right_shape is ShapeUnknown:
+            return ShapeUnknown, ControlFlowDescriptionFullEscape
+
+        return self._collectShapeOperation(
+            operation=lambda left_shape: left_shape.getOperationBinarySubShape(
+                right_shape
+            )
+        )
+
+    def getOperationBinarySubLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return self._collectShapeOperation(
+            operation=left_shape.getOperationBinarySubShape
+        )
+
+    def getOperationBinaryMultShape(self, right_shape):
+        if right_shape is ShapeUnknown:
+            return ShapeUnknown, ControlFlowDescriptionFullEscape
+
+        return self._collectShapeOperation(
+            operation=lambda left_shape: left_shape.getOperationBinaryMultShape(
+                right_shape
+            )
+        )
+
+    def getOperationBinaryMultLShape(self, left_shape):
+        assert left_shape is not ShapeUnknown
+
+        return self._collectShapeOperation(
+            operation=left_shape.getOperationBinaryMultShape
+        )
+
     def getComparisonLtShape(self, right_shape):
         if right_shape is ShapeUnknown:
             return ShapeUnknown, ControlFlowDescriptionFullEscape
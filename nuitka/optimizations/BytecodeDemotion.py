@@ -28,6 +28,8 @@ from nuitka.nodes.ModuleNodes import makeUncompiledPythonModule
 from nuitka.plugins.Plugins import Plugins
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 
+from .ModuleKnowledge import forgetModuleKnowledge
+
 
 def demoteCompiledModuleToBytecode(module):
     """ Demote a compiled module to uncompiled (bytecode).
@@ -64,5 +66,9 @@ def demoteCompiledModuleToBytecode(module):
 
     replaceRootModule(old=module, new=uncompiled_module)
 
+    # Its functions will not be compiled, so they cannot be called directly
+    # from other modules.
+    forgetModuleKnowledge(full_name)
+
     assert module.trace_collection is not None
     uncompiled_module.setUsedModules(module.trace_collection.getUsedModules())
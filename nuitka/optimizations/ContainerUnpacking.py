@@ -0,0 +1,132 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Unpacking of tuples and lists that are made only for it.
+
+For "a, b = x, y", the re-formulation creates a tuple, an iterator over it,
+and then unpacks the elements from that iterator. When the iterator does not
+escape, i.e. the previous pass has seen that it is only used for unpacking
+exactly all of its elements, the elements can be assigned to the unpacked
+values directly, and neither the tuple nor the iterator is created.
+"""
+
+from nuitka.nodes.NodeMakingHelpers import makeConstantReplacementNode
+
+
+def _isAttached(node):
+    """ Check if a node from the previous pass is still part of the tree. """
+
+    while not node.isParentVariableProvider():
+        parent = node.getParent()
+
+        if parent is None or node not in parent.getVisitableNodes():
+            return False
+
+        node = parent
+
+    return True
+
+
+def _getUnpackUsages(assign_node, element_count):
+    variable = assign_node.getVariable()
+
+    last_trace = variable.getMatchingAssignTrace(assign_node)
+
+    if last_trace is None or last_trace.getNameUsageCount():
+        return None
+
+    # In loops, the value is merged into the next iteration, which is not a
+    # use, unless that merged value is used.
+    for variable_trace in variable.traces:
+        if (
+            variable_trace is not last_trace
+            and variable_trace.getDefiniteUsages() > variable_trace.getLoopUsageCount()
+        ):
+            return None
+
+    unpack_usages = last_trace.getUnpackUsages()
+
+    # Other uses of the iterator, e.g. the unpacking check, let it escape.
+    if (
+        len(unpack_usages) != element_count
+        or last_trace.getDefiniteUsages() - last_trace.getLoopUsageCount()
+        != element_count
+    ):
+        return None
+
+    unpack_usages = sorted(unpack_usages, key=lambda node: node.getCount())
+
+    for count, unpack_node in enumerate(unpack_usages, 1):
+        if unpack_node.getCount() != count or not _isAttached(unpack_node):
+            return None
+
+    return unpack_usages
+
+
+def convertContainerUnpacking(assign_node):
+    """ Convert the unpacking of a tuple or list made for only that.
+
+        The "assign_node" is the assignment of the iterator over the
+        container to a temporary variable. The unpacking nodes are replaced
+        with the container elements, and True is returned to indicate that
+        the assignment is to be removed, or False if it cannot be done.
+    """
+
+    variable = assign_node.getVariable()
+
+    if not variable.isTempVariable():
+        return False
+
+    iter_node = assign_node.getAssignSource()
+
+    if not (
+        iter_node.isExpressionBuiltinIter1()
+        or iter_node.isExpressionBuiltinIterForUnpack()
+    ):
+        return False
+
+    container = iter_node.getValue()
+
+    if container.isExpressionMakeTuple() or container.isExpressionMakeList():
+        element_count = len(container.getElements())
+    elif container.isExpressionConstantRef() and type(container.getConstant()) in (
+        tuple,
+        list,
+    ):
+        element_count = len(container.getConstant())
+    else:
+        return False
+
+    unpack_usages = _getUnpackUsages(assign_node, element_count)
+
+    if unpack_usages is None:
+        return False
+
+    # The elements are now evaluated one by one, where they are unpacked, in
+    # the same order, and the unpacked values are released in all cases.
+    if container.isExpressionConstantRef():
+        elements = [
+            makeConstantReplacementNode(constant=constant, node=unpack_node)
+            for constant, unpack_node in zip(container.getConstant(), unpack_usages)
+        ]
+    else:
+        elements = container.getElements()
+
+    for unpack_node, element in zip(unpack_usages, elements):
+        unpack_node.getParent().replaceChild(unpack_node, element)
+
+    return True
@@ -0,0 +1,298 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Loops over "enumerate" that unpack index and value.
+
+For "for i, x in enumerate(y)", the loop is re-formulated to iterate over "y"
+directly, and to count the index in a temporary variable. The tuples given by
+"enumerate" are then not created, and the unpacking of them, which needs an
+iterator for each one, is not done anymore, the two values are assigned
+directly.
+"""
+
+from nuitka.__past__ import long  # pylint: disable=I0021,redefined-builtin
+from nuitka.nodes.AssignNodes import (
+    StatementAssignmentVariable,
+    StatementReleaseVariable,
+)
+from nuitka.nodes.BuiltinIteratorNodes import ExpressionBuiltinIter1
+from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.OperatorNodes import makeBinaryOperationNode
+from nuitka.nodes.StatementNodes import StatementsSequence
+from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
+
+
+def _isTempVariableRef(node, variable):
+    return node.isExpressionTempVariableRef() and node.getVariable() is variable
+
+
+def _getTriedStatements(statement):
+    if statement is None or not statement.isStatementTry():
+        return None
+
+    return statement.getBlockTry().getStatements()
+
+
+def _getStartValue(enumerate_node):
+    start = enumerate_node.getStart()
+
+    if start is None:
+        return 0
+
+    # Other values would have to be converted with "__index__" first.
+    if start.isExpressionConstantRef() and type(start.getConstant()) in (int, long):
+        return start.getConstant()
+
+    return None
+
+
+def _getLoopParts(iter_node):
+    """ Decompose a for loop over the iterator created by "iter_node".
+
+        Returns the variable of the iterator, the "try" statement holding
+        the loop, the loop, and the variables assigned by unpacking the
+        value, or None if the loop is not in the shape produced by the
+        "for" loop re-formulation with unpacking to two targets anymore.
+    """
+
+    # Many details to check, pylint: disable=too-many-return-statements
+
+    assign_iter = iter_node.getParent()
+
+    if (
+        not assign_iter.isStatementAssignmentVariable()
+        or not assign_iter.getVariable().isTempVariable()
+    ):
+        return None
+
+    iter_variable = assign_iter.getVariable()
+
+    parent = assign_iter.getParent()
+
+    if not parent.isStatementsSequence():
+        return None
+
+    statements = parent.getStatements()
+    index = statements.index(assign_iter)
+
+    if index + 1 >= len(statements):
+        return None
+
+    try_statement = statements[index + 1]
+    tried = _getTriedStatements(try_statement)
+
+    if tried is None or len(tried) != 1 or not tried[0].isStatementLoop():
+        return None
+
+    loop_statement = tried[0]
+    loop_body = loop_statement.getLoopBody()
+
+    if loop_body is None or len(loop_body.getStatements()) < 2:
+        return None
+
+    next_try, unpack_try = loop_body.getStatements()[:2]
+
+    # The "next" of the iterator, which is the end of the loop.
+    next_tried = _getTriedStatements(next_try)
+
+    if (
+        next_tried is None
+        or len(next_tried) != 1
+        or not next_tried[0].isStatementAssignmentVariable()
+    ):
+        return None
+
+    next_node = next_tried[0].getAssignSource()
+
+    if not next_node.isExpressionBuiltinNext1() or not _isTempVariableRef(
+        next_node.getValue(), iter_variable
+    ):
+        return None
+
+    value_variable = next_tried[0].getVariable()
+
+    # The unpacking of the value to exactly two elements.
+    unpack_tried = _getTriedStatements(unpack_try)
+
+    if unpack_tried is None or len(unpack_tried) != 2:
+        return None
+
+    assign_source_iter, element_try = unpack_tried
+
+    if not assign_source_iter.isStatementAssignmentVariable():
+        return None
+
+    source_iter = assign_source_iter.getAssignSource()
+
+    if not (
+        source_iter.isExpressionBuiltinIter1()
+        or source_iter.isExpressionBuiltinIterForUnpack()
+    ) or not _isTempVariableRef(source_iter.getValue(), value_variable):
+        return None
+
+    source_iter_variable = assign_source_iter.getVariable()
+
+    element_statements = _getTriedStatements(element_try)
+
+    if element_statements is None or len(element_statements) != 3:
+        return None
+
+    element_variables = []
+
+    for count, statement in enumerate(element_statements[:2], 1):
+        if not statement.isStatementAssignmentVariable():
+            return None
+
+        unpack_node = statement.getAssignSource()
+
+        if (
+            not unpack_node.isExpressionSpecialUnpack()
+            or unpack_node.getCount() != count
+            or unpack_node.getStarred()
+            or not _isTempVariableRef(unpack_node.getValue(), source_iter_variable)
+        ):
+            return None
+
+        element_variables.append(statement.getVariable())
+
+    unpack_check = element_statements[2]
+
+    if not unpack_check.isStatementSpecialUnpackCheck() or unpack_check.getCount() != 2:
+        return None
+
+    return (
+        iter_variable,
+        try_statement,
+        loop_statement,
+        value_variable,
+        element_variables,
+    )
+
+
+def convertEnumerateLoop(iter_node):
+    """ Convert a loop over "enumerate" to count the index itself.
+
+        The "iter_node" is the iterator creation of the loop, with the
+        "enumerate" as its value. Returns the new iterator creation to use
+        instead, or None if the loop cannot be converted.
+    """
+
+    # Many details to build, pylint: disable=too-many-locals
+
+    enumerate_node = iter_node.getValue()
+
+    start_value = _getStartValue(enumerate_node)
+
+    if start_value is None:
+        return None
+
+    parts = _getLoopParts(iter_node)
+
+    if parts is None:
+        return None
+
+    iter_variable, try_statement, loop_statement, value_variable, element_variables = (
+        parts
+    )
+
+    source_ref = iter_node.getSourceReference()
+
+    provider = iter_variable.getOwner()
+
+    index_variable = provider.allocateTempVariable(
+        temp_scope=provider.allocateTempScope("enumerate"), name="index"
+    )
+
+    # The unpacking is replaced with assignments of the index and the value,
+    # and the counting of the index.
+    loop_body = loop_statement.getLoopBody()
+    loop_statements = loop_body.getStatements()
+
+    loop_body.setStatements(
+        (
+            loop_statements[0],
+            StatementAssignmentVariable(
+                variable=element_variables[0],
+                source=ExpressionTempVariableRef(
+                    variable=index_variable, source_ref=source_ref
+                ),
+                source_ref=source_ref,
+            ),
+            StatementAssignmentVariable(
+                variable=index_variable,
+                source=makeBinaryOperationNode(
+                    operator="Add",
+                    left=ExpressionTempVariableRef(
+                        variable=index_variable, source_ref=source_ref
+                    ),
+                    right=makeConstantRefNode(constant=1, source_ref=source_ref),
+                    source_ref=source_ref,
+                ),
+                source_ref=source_ref,
+            ),
+            StatementAssignmentVariable(
+                variable=element_variables[1],
+                source=ExpressionTempVariableRef(
+                    variable=value_variable, source_ref=source_ref
+                ),
+                source_ref=source_ref,
+            ),
+        )
+        + loop_statements[2:]
+    )
+    loop_statement.resetLoopVariables()
+
+    # The index is initialized before the loop, and released after it, for
+    # all the ways of leaving the "try" that holds the loop.
+    try_statement.setBlockTry(
+        StatementsSequence(
+            statements=(
+                StatementAssignmentVariable(
+                    variable=index_variable,
+                    source=makeConstantRefNode(
+                        constant=start_value, source_ref=source_ref
+                    ),
+                    source_ref=source_ref,
+                ),
+                loop_statement,
+                StatementReleaseVariable(
+                    variable=index_variable, source_ref=source_ref
+                ),
+            ),
+            source_ref=source_ref,
+        )
+    )
+
+    for handler in (
+        try_statement.getBlockExceptHandler(),
+        try_statement.getBlockBreakHandler(),
+        try_statement.getBlockContinueHandler(),
+        try_statement.getBlockReturnHandler(),
+    ):
+        if handler is not None:
+            handler.setStatements(
+                (
+                    StatementReleaseVariable(
+                        variable=index_variable, source_ref=source_ref
+                    ),
+                )
+                + handler.getStatements()
+            )
+
+    return ExpressionBuiltinIter1(
+        value=enumerate_node.getIterable(), source_ref=source_ref
+    )
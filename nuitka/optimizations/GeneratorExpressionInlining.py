@@ -0,0 +1,436 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" In-lining of generator expressions.
+
+Generator expressions given directly to a built-in that consumes them, e.g.
+"sum(x for x in y)", cannot escape, so there is no need for a generator object
+with its own storage, or to resume it for every value. Instead the generator
+body is cloned into an outline function, with the "yield" replaced by what the
+built-in would do with the value.
+"""
+
+from nuitka.nodes.AssignNodes import (
+    StatementAssignmentVariable,
+    StatementReleaseVariable,
+)
+from nuitka.nodes.BuiltinTypeNodes import ExpressionBuiltinTuple
+from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
+from nuitka.nodes.ConditionalNodes import makeStatementConditional
+from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.ContainerOperationNodes import (
+    StatementListOperationAppend,
+    StatementSetOperationAdd,
+)
+from nuitka.nodes.ExceptionNodes import (
+    ExpressionBuiltinMakeException,
+    ExpressionCaughtExceptionValueRef,
+    StatementRaiseException,
+    StatementReraiseException,
+)
+from nuitka.nodes.FrameNodes import StatementsFrameFunction
+from nuitka.nodes.GlobalsLocalsNodes import ExpressionBuiltinLocalsBase
+from nuitka.nodes.OperatorNodes import makeBinaryOperationNode
+from nuitka.nodes.OutlineNodes import ExpressionOutlineFunction
+from nuitka.nodes.ReturnNodes import StatementReturn, makeStatementReturnConstant
+from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
+from nuitka.PythonVersions import python_version
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+from nuitka.tree.ReformulationTryExceptStatements import makeTryExceptSingleHandlerNode
+from nuitka.tree.ReformulationTryFinallyStatements import makeTryFinallyStatement
+from nuitka.tree.TreeHelpers import (
+    makeStatementsSequenceFromStatement,
+    makeStatementsSequenceFromStatements,
+)
+
+
+def _getGeneratorExpressionParts(genexpr):
+    """ Decompose a generator expression outline.
+
+        Returns the variable and creation of the iterator given to the
+        generator, and the generator body, or None if the outline is not
+        in the shape produced by "buildGeneratorExpressionNode" anymore.
+    """
+
+    if not genexpr.isExpressionOutlineBody() or genexpr.name != "genexpr":
+        return None
+
+    statements = genexpr.getBody().getStatements()
+
+    if len(statements) < 2:
+        return None
+
+    assign_iter, try_statement = statements[:2]
+
+    if not assign_iter.isStatementAssignmentVariable():
+        return None
+    if not try_statement.isStatementTry():
+        return None
+
+    return_statement = try_statement.getBlockTry().getStatements()[0]
+
+    if not return_statement.isStatementReturn():
+        return None
+
+    make_generator = return_statement.getExpression()
+
+    if not make_generator.isExpressionMakeGeneratorObject():
+        return None
+
+    generator_body = make_generator.getGeneratorRef().getFunctionBody()
+
+    return assign_iter.getVariable(), assign_iter.getAssignSource(), generator_body
+
+
+class _GeneratorBodyInspector(VisitorNoopMixin):
+    """ Find the frame and the yield, and detect what cannot be in-lined.
+
+        Functions created in the generator body would have to move their
+        closure to the in-lined copy, that is not attempted.
+    """
+
+    def __init__(self):
+        self.frames = []
+        self.yields = []
+        self.unsupported = False
+
+    def onEnterNode(self, node):
+        if node.isStatementsFrameGenerator():
+            self.frames.append(node)
+        elif node.isExpressionYield():
+            self.yields.append(node)
+        elif (
+            node.isExpressionYieldFrom()
+            or node.isExpressionYieldFromWaitable()
+            or node.isStatementReturn()
+            or node.isStatementGeneratorReturn()
+            or node.isStatementGeneratorReturnNone()
+            or node.isExpressionFunctionRef()
+            or isinstance(node, ExpressionBuiltinLocalsBase)
+        ):
+            self.unsupported = True
+
+
+class _VariableTranslator(VisitorNoopMixin):
+    """ Move variable usages of the generator to the in-lined copy. """
+
+    def __init__(self, translation):
+        self.translation = translation
+
+    def onEnterNode(self, node):
+        if (
+            node.isStatementAssignmentVariable()
+            or node.isStatementDelVariable()
+            or node.isStatementReleaseVariable()
+            or node.isExpressionVariableRef()
+            or node.isExpressionTempVariableRef()
+        ):
+            variable = node.getVariable()
+
+            if variable in self.translation:
+                node.setVariable(self.translation[variable])
+
+
+def _makeConsumeStatement(consumer, result_variable, value, source_ref):
+    # The first value that decides the result, returns it.
+    if consumer == "any":
+        return makeStatementConditional(
+            condition=value,
+            yes_branch=makeStatementReturnConstant(
+                constant=True, source_ref=source_ref
+            ),
+            no_branch=None,
+            source_ref=source_ref,
+        )
+    elif consumer == "all":
+        return makeStatementConditional(
+            condition=value,
+            yes_branch=None,
+            no_branch=makeStatementReturnConstant(
+                constant=False, source_ref=source_ref
+            ),
+            source_ref=source_ref,
+        )
+
+    result_ref = ExpressionTempVariableRef(
+        variable=result_variable, source_ref=source_ref
+    )
+
+    if consumer == "sum":
+        return StatementAssignmentVariable(
+            variable=result_variable,
+            source=makeBinaryOperationNode(
+                operator="Add", left=result_ref, right=value, source_ref=source_ref
+            ),
+            source_ref=source_ref,
+        )
+    elif consumer in ("list", "tuple"):
+        return StatementListOperationAppend(
+            list_arg=result_ref, value=value, source_ref=source_ref
+        )
+    elif consumer == "set":
+        return StatementSetOperationAdd(
+            set_arg=result_ref, value=value, source_ref=source_ref
+        )
+    else:
+        assert False, consumer
+
+
+def _makeResultExpression(consumer, result_variable, source_ref):
+    result = ExpressionTempVariableRef(variable=result_variable, source_ref=source_ref)
+
+    if consumer == "tuple":
+        result = ExpressionBuiltinTuple(value=result, source_ref=source_ref)
+
+    return result
+
+
+def convertGeneratorExpressionToOutline(genexpr, consumer, start_value):
+    """ Convert a generator expression consumed by a built-in to a loop.
+
+        The consumer is one of "sum", "list", "tuple", "set", "any", and
+        "all", and the start value the initial value of the result, which
+        for "any" and "all" is the result if no value decides it. Returns
+        None if the generator expression cannot be in-lined.
+    """
+
+    # Many details to check and build, pylint: disable=too-many-locals
+
+    parts = _getGeneratorExpressionParts(genexpr)
+
+    if parts is None:
+        return None
+
+    iter_variable, iter_source, generator_body = parts
+
+    if not generator_body.isExpressionGeneratorObjectBody():
+        return None
+
+    source_ref = genexpr.getSourceReference()
+
+    inspector = _GeneratorBodyInspector()
+    visitTree(generator_body.getBody(), inspector)
+
+    if (
+        inspector.unsupported
+        or len(inspector.frames) != 1
+        or len(inspector.yields) != 1
+    ):
+        return None
+
+    # Only clone once it is known to be supported, not all nodes can be.
+    body = generator_body.getBody().makeClone()
+
+    inspector = _GeneratorBodyInspector()
+    visitTree(body, inspector)
+
+    generator_frame = inspector.frames[0]
+    yield_node = inspector.yields[0]
+    yield_statement = yield_node.getParent()
+
+    # The value of the "yield" must not be used, as there is no sender.
+    if not yield_statement.isStatementExpressionOnly():
+        return None
+
+    outline_body = ExpressionOutlineFunction(
+        provider=genexpr.provider, name="genexpr_inline", source_ref=source_ref
+    )
+
+    temp_scope = outline_body.getOutlineTempScope()
+
+    translation = {}
+
+    new_iter_variable = outline_body.allocateTempVariable(
+        temp_scope=temp_scope, name=iter_variable.getName()
+    )
+    translation[iter_variable] = new_iter_variable
+
+    # Closure variables are taken from the provider, only the ones of the
+    # generator itself move.
+    for variable in tuple(generator_body.getLocalVariables()) + tuple(
+        generator_body.getTempVariables()
+    ):
+        if variable.getOwner() is not generator_body:
+            continue
+
+        translation[variable] = outline_body.allocateTempVariable(
+            temp_scope=temp_scope, name=variable.getName()
+        )
+
+    result_variable = outline_body.allocateTempVariable(
+        temp_scope=temp_scope, name="result"
+    )
+    value_variable = outline_body.allocateTempVariable(
+        temp_scope=temp_scope, name="value"
+    )
+    consuming_variable = outline_body.allocateTempVariable(
+        temp_scope=temp_scope, name="consuming"
+    )
+
+    visitTree(body, _VariableTranslator(translation))
+
+    yield_source_ref = yield_statement.getSourceReference()
+
+    # The value is computed by the generator body, but the consumer is not
+    # part of it, so exceptions it raises, e.g. "StopIteration" from "__add__"
+    # or "__bool__", must not be handled like ones from the generator body.
+    consume_statements = (
+        StatementAssignmentVariable(
+            variable=value_variable,
+            source=yield_node.getExpression(),
+            source_ref=yield_source_ref,
+        ),
+        StatementAssignmentVariable(
+            variable=consuming_variable,
+            source=makeConstantRefNode(constant=True, source_ref=yield_source_ref),
+            source_ref=yield_source_ref,
+        ),
+        _makeConsumeStatement(
+            consumer=consumer,
+            result_variable=result_variable,
+            value=ExpressionTempVariableRef(
+                variable=value_variable, source_ref=yield_source_ref
+            ),
+            source_ref=yield_source_ref,
+        ),
+        StatementAssignmentVariable(
+            variable=consuming_variable,
+            source=makeConstantRefNode(constant=False, source_ref=yield_source_ref),
+            source_ref=yield_source_ref,
+        ),
+    )
+
+    yield_parent = yield_statement.getParent()
+    parent_statements = list(yield_parent.getStatements())
+    index = parent_statements.index(yield_statement)
+    parent_statements[index : index + 1] = consume_statements
+    yield_parent.setStatements(parent_statements)
+
+    # A "StopIteration" leaving the generator body ends the iteration before
+    # Python3.7, and is converted to a "RuntimeError" after, PEP 479.
+    if python_version < 370:
+        handler_body = StatementReturn(
+            expression=_makeResultExpression(
+                consumer=consumer,
+                result_variable=result_variable,
+                source_ref=source_ref,
+            ),
+            source_ref=source_ref,
+        )
+    else:
+        handler_body = StatementRaiseException(
+            exception_type=ExpressionBuiltinMakeException(
+                exception_name="RuntimeError",
+                args=(
+                    makeConstantRefNode(
+                        constant="generator raised StopIteration", source_ref=source_ref
+                    ),
+                ),
+                source_ref=source_ref,
+            ),
+            exception_value=None,
+            exception_trace=None,
+            exception_cause=ExpressionCaughtExceptionValueRef(source_ref=source_ref),
+            source_ref=source_ref,
+        )
+
+    generator_code_object = generator_frame.getCodeObject()
+
+    code_object = CodeObjectSpec(
+        co_name=generator_code_object.getCodeObjectName(),
+        co_kind="Function",
+        co_varnames=generator_code_object.getVarNames(),
+        co_argcount=generator_code_object.getArgumentCount(),
+        co_kwonlyargcount=0,
+        co_has_starlist=False,
+        co_has_stardict=False,
+        co_filename=generator_code_object.getFilename(),
+        co_lineno=generator_code_object.getLineNumber(),
+        future_spec=generator_code_object.getFutureSpec(),
+    )
+
+    generator_frame.getParent().replaceChild(
+        generator_frame,
+        makeTryExceptSingleHandlerNode(
+            tried=makeStatementsSequenceFromStatement(
+                statement=StatementsFrameFunction(
+                    statements=generator_frame.getStatements(),
+                    code_object=code_object,
+                    source_ref=generator_frame.getSourceReference(),
+                )
+            ),
+            exception_name="StopIteration",
+            handler_body=makeStatementConditional(
+                condition=ExpressionTempVariableRef(
+                    variable=consuming_variable, source_ref=source_ref
+                ),
+                yes_branch=StatementReraiseException(source_ref=source_ref),
+                no_branch=handler_body,
+                source_ref=source_ref,
+            ),
+            source_ref=source_ref,
+        ),
+    )
+
+    statements = (
+        StatementAssignmentVariable(
+            variable=result_variable,
+            source=makeConstantRefNode(constant=start_value, source_ref=source_ref),
+            source_ref=source_ref,
+        ),
+        StatementAssignmentVariable(
+            variable=consuming_variable,
+            source=makeConstantRefNode(constant=False, source_ref=source_ref),
+            source_ref=source_ref,
+        ),
+        body,
+        StatementReturn(
+            expression=_makeResultExpression(
+                consumer=consumer,
+                result_variable=result_variable,
+                source_ref=source_ref,
+            ),
+            source_ref=source_ref,
+        ),
+    )
+
+    release_statements = [
+        StatementReleaseVariable(variable=variable, source_ref=source_ref)
+        for variable in translation.values()
+    ]
+    release_statements += [
+        StatementReleaseVariable(variable=variable, source_ref=source_ref)
+        for variable in (result_variable, value_variable, consuming_variable)
+    ]
+
+    outline_body.setBody(
+        makeStatementsSequenceFromStatements(
+            StatementAssignmentVariable(
+                variable=new_iter_variable,
+                source=iter_source.makeClone(),
+                source_ref=source_ref,
+            ),
+            makeTryFinallyStatement(
+                provider=outline_body,
+                tried=statements,
+                final=release_statements,
+                source_ref=source_ref.atInternal(),
+            ),
+        )
+    )
+
+    return outline_body
@@ -0,0 +1,177 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Knowledge about compiled modules, to be used by other modules.
+
+After each optimization step of a module, its module variables are checked
+for values that other modules can rely on. These are the ones only assigned
+once, at module level, to an immutable constant, and the ones only assigned
+once to a function.
+
+Imports of names from these modules then can use the constant value, or call
+the function directly. When the knowledge of a module changes, the modules
+using it have to be optimized again, which the return value indicates.
+"""
+
+_module_knowledge = {}
+
+
+class ModuleKnowledge(object):
+    __slots__ = ("constants", "functions")
+
+    def __init__(self, constants, functions):
+        # Module variable names to immutable constant values.
+        self.constants = constants
+
+        # Module variable names to function bodies.
+        self.functions = functions
+
+    def __repr__(self):
+        return "<ModuleKnowledge constants %s functions %s>" % (
+            sorted(self.constants),
+            sorted(self.functions),
+        )
+
+    def isSame(self, other):
+        # Compare constant values by type and representation, so that e.g.
+        # "1" and "True" or float NaN values do not confuse this.
+        return (
+            set(
+                (name, type(value), repr(value))
+                for name, value in self.constants.items()
+            )
+            == set(
+                (name, type(value), repr(value))
+                for name, value in other.constants.items()
+            )
+            and self.functions == other.functions
+        )
+
+    def hasConstant(self, name):
+        return name in self.constants
+
+    def getConstant(self, name):
+        return self.constants[name]
+
+    def getFunctionBody(self, name):
+        return self.functions.get(name)
+
+
+def _isModuleLevelStatement(statement, module):
+    """ Check if a statement is executed unconditionally by the module. """
+
+    node = statement.getParent()
+
+    while node is not module:
+        if not node.isStatementsSequence():
+            return False
+
+        node = node.getParent()
+
+    return True
+
+
+def _getSingleAssignNode(variable, module):
+    # Writes from other modules are not visible here, these could happen with
+    # "setattr", but for direct calls, the called value is checked at run time
+    # anyway.
+    if variable.hasWritesOutsideOf(module) is not False:
+        return None
+
+    assign_traces = []
+
+    for variable_trace in variable.traces:
+        if variable_trace.isAssignTrace():
+            assign_traces.append(variable_trace)
+        elif variable_trace.isUninitTrace() and variable_trace.getPrevious():
+            # Deleted again, e.g. with "del".
+            return None
+
+    if len(assign_traces) != 1:
+        return None
+
+    return assign_traces[0].getAssignNode()
+
+
+def _makeModuleKnowledge(module):
+    constants = {}
+    functions = {}
+
+    # With "globals()" escaping, e.g. to "exec", values may change.
+    module_dict_escaped = module.getModuleDictScope().isEscaped()
+
+    for variable in module.getVariables():
+        variable_name = variable.getName()
+
+        # Module attributes like "__doc__" may be changed by the import
+        # mechanism and other run time things, do not bother with them.
+        if variable_name.startswith("__") and variable_name.endswith("__"):
+            continue
+
+        assign_node = _getSingleAssignNode(variable, module)
+
+        if assign_node is None:
+            continue
+
+        assign_source = assign_node.getAssignSource()
+
+        if assign_source.isExpressionFunctionCreation():
+            function_body = assign_source.getFunctionRef().getFunctionBody()
+
+            if function_body.isExpressionFunctionBody():
+                functions[variable_name] = function_body
+        elif (
+            not module_dict_escaped
+            and assign_source.isExpressionConstantRef()
+            and not assign_source.isMutable()
+            and _isModuleLevelStatement(assign_node, module)
+        ):
+            constants[variable_name] = assign_source.getConstant()
+
+    return ModuleKnowledge(constants=constants, functions=functions)
+
+
+def onModuleOptimizationStep(module):
+    """ Update the knowledge about a module after optimizing it.
+
+        Returns True if the knowledge changed, so other modules can take
+        advantage of it in another pass.
+    """
+
+    module_name = module.getFullName()
+
+    knowledge = _makeModuleKnowledge(module)
+
+    old_knowledge = _module_knowledge.get(module_name)
+    _module_knowledge[module_name] = knowledge
+
+    if old_knowledge is None:
+        return bool(knowledge.constants or knowledge.functions)
+    else:
+        return not old_knowledge.isSame(knowledge)
+
+
+def forgetModuleKnowledge(module_name):
+    """ Forget the knowledge about a module, e.g. when demoted to bytecode. """
+
+    _module_knowledge.pop(module_name, None)
+
+
+def getModuleKnowledge(module_name):
+    """ Get the knowledge about a compiled module, or None if not known. """
+
+    return _module_knowledge.get(module_name)
@@ -33,7 +33,7 @@ from nuitka.plugins.Plugins import Plugins
 from nuitka.Tracing import printLine
 from nuitka.utils import MemoryUsage
 
-from . import Graphs, TraceCollections
+from . import Graphs, ModuleKnowledge, TraceCollections
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
 from .Tags import TagSet
 
@@ -104,6 +104,11 @@ def optimizeCompiledPythonModule(module):
 
         Graphs.onModuleOptimizationStep(module)
 
+        # Other modules may make use of changed knowledge about this one, so
+        # they need to be optimized again.
+        if ModuleKnowledge.onModuleOptimizationStep(module):
+            touched = True
+
         # Search for local change tags.
         for tag in tag_set:
             if tag == "new_code":
@@ -32,6 +32,7 @@ from nuitka.nodes.AttributeNodes import (
     ExpressionBuiltinHasattr,
     ExpressionBuiltinSetattr,
 )
+from nuitka.nodes.BuiltinAnyAllNodes import ExpressionBuiltinAll, ExpressionBuiltinAny
 from nuitka.nodes.BuiltinComplexNodes import (
     ExpressionBuiltinComplex1,
     ExpressionBuiltinComplex2,
@@ -56,11 +57,25 @@ from nuitka.nodes.BuiltinIntegerNodes import (
     ExpressionBuiltinInt2,
 )
 from nuitka.nodes.BuiltinIteratorNodes import (
+    ExpressionBuiltinEnumerate,
     ExpressionBuiltinIter1,
     ExpressionBuiltinIter2,
+    ExpressionBuiltinReversed,
+    ExpressionBuiltinZip,
 )
 from nuitka.nodes.BuiltinLenNodes import ExpressionBuiltinLen
+from nuitka.nodes.BuiltinMapFilterNodes import (
+    ExpressionBuiltinFilter,
+    ExpressionBuiltinMap,
+)
+from nuitka.nodes.BuiltinMinMaxNodes import (
+    ExpressionBuiltinMax1,
+    ExpressionBuiltinMax2,
+    ExpressionBuiltinMin1,
+    ExpressionBuiltinMin2,
+)
 from nuitka.nodes.BuiltinNextNodes import ExpressionBuiltinNext1, ExpressionBuiltinNext2
+from nuitka.nodes.BuiltinNumberNodes import ExpressionBuiltinAbs, ExpressionBuiltinRound
 from nuitka.nodes.BuiltinOpenNodes import ExpressionBuiltinOpen
 from nuitka.nodes.BuiltinRangeNodes import (
     ExpressionBuiltinRange1,
@@ -74,6 +89,7 @@ from nuitka.nodes.BuiltinRefNodes import (
     ExpressionBuiltinAnonymousRef,
     makeExpressionBuiltinRef,
 )
+from nuitka.nodes.BuiltinSortedNodes import ExpressionBuiltinSorted
 from nuitka.nodes.BuiltinSumNodes import ExpressionBuiltinSum1, ExpressionBuiltinSum2
 from nuitka.nodes.BuiltinTypeNodes import (
     ExpressionBuiltinBool,
@@ -1225,6 +1241,204 @@ def divmod_extractor(node):
     )
 
 
+def enumerate_extractor(node):
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinEnumerate,
+        builtin_spec=BuiltinParameterSpecs.builtin_enumerate_spec,
+    )
+
+
+def zip_extractor(node):
+    def wrapZipCreation(iterables, source_ref):
+        return ExpressionBuiltinZip(
+            value=makeSequenceCreationOrConstant(
+                sequence_kind="tuple", elements=iterables, source_ref=source_ref
+            ),
+            source_ref=source_ref,
+        )
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=wrapZipCreation,
+        builtin_spec=BuiltinParameterSpecs.builtin_zip_spec,
+    )
+
+
+def reversed_extractor(node):
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinReversed,
+        builtin_spec=BuiltinParameterSpecs.builtin_reversed_spec,
+    )
+
+
+def sorted_extractor(node):
+    # For Python3, only the iterable is a positional argument, but the spec
+    # cannot express keyword only arguments.
+    if python_version >= 300:
+        args = node.getCallArgs()
+
+        if (
+            args is not None
+            and args.canPredictIterationValues()
+            and args.getIterationLength() > 1
+        ):
+            return wrapExpressionWithSideEffects(
+                new_node=makeRaiseExceptionReplacementExpressionFromInstance(
+                    expression=node,
+                    exception=TypeError(
+                        "must use keyword argument for key function"
+                        if python_version < 370
+                        else "sorted expected 1 arguments, got %d"
+                        % args.getIterationLength()
+                    ),
+                ),
+                old_node=node,
+                side_effects=node.extractSideEffectsPreCall(),
+            )
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinSorted,
+        builtin_spec=BuiltinParameterSpecs.builtin_sorted_spec,
+    )
+
+
+def _isMinMaxCallSupported(node):
+    # Only one or two positional arguments are handled, the "key" and
+    # "default" keyword only arguments are not supported by the nodes.
+    call_kw = node.getCallKw()
+
+    if call_kw is not None and (
+        not call_kw.isExpressionConstantRef() or call_kw.getConstant() != {}
+    ):
+        return False
+
+    args = node.getCallArgs()
+
+    return (
+        args is not None
+        and args.canPredictIterationValues()
+        and args.getIterationLength() in (1, 2)
+    )
+
+
+def min_extractor(node):
+    def selectMinBuiltinClass(arg1, arg2, source_ref):
+        if arg2 is None:
+            return ExpressionBuiltinMin1(value=arg1, source_ref=source_ref)
+        else:
+            return ExpressionBuiltinMin2(left=arg1, right=arg2, source_ref=source_ref)
+
+    if not _isMinMaxCallSupported(node):
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=selectMinBuiltinClass,
+        builtin_spec=BuiltinParameterSpecs.builtin_min_spec,
+    )
+
+
+def max_extractor(node):
+    def selectMaxBuiltinClass(arg1, arg2, source_ref):
+        if arg2 is None:
+            return ExpressionBuiltinMax1(value=arg1, source_ref=source_ref)
+        else:
+            return ExpressionBuiltinMax2(left=arg1, right=arg2, source_ref=source_ref)
+
+    if not _isMinMaxCallSupported(node):
+        return None
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=selectMaxBuiltinClass,
+        builtin_spec=BuiltinParameterSpecs.builtin_max_spec,
+    )
+
+
+def abs_extractor(node):
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinAbs,
+        builtin_spec=BuiltinParameterSpecs.builtin_abs_spec,
+    )
+
+
+def any_extractor(node):
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinAny,
+        builtin_spec=BuiltinParameterSpecs.builtin_any_spec,
+    )
+
+
+def all_extractor(node):
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinAll,
+        builtin_spec=BuiltinParameterSpecs.builtin_all_spec,
+    )
+
+
+def round_extractor(node):
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinRound,
+        builtin_spec=BuiltinParameterSpecs.builtin_round_spec,
+    )
+
+
+def map_extractor(node):
+    def wrapMapCreation(function, iterable, iterables, source_ref):
+        return ExpressionBuiltinMap(
+            function=function,
+            iterables=makeSequenceCreationOrConstant(
+                sequence_kind="tuple",
+                elements=(iterable,) + tuple(iterables),
+                source_ref=source_ref,
+            ),
+            source_ref=source_ref,
+        )
+
+    # The function alone is refused with a message of its own.
+    args = node.getCallArgs()
+
+    if (
+        node.getCallKw() is None
+        and args is not None
+        and args.canPredictIterationValues()
+        and args.getIterationLength() == 1
+    ):
+        return wrapExpressionWithSideEffects(
+            new_node=makeRaiseExceptionReplacementExpressionFromInstance(
+                expression=node,
+                exception=TypeError(
+                    "map() requires at least two args"
+                    if python_version < 300
+                    else "map() must have at least two arguments."
+                ),
+            ),
+            old_node=node,
+            side_effects=node.extractSideEffectsPreCall(),
+        )
+
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=wrapMapCreation,
+        builtin_spec=BuiltinParameterSpecs.builtin_map_spec,
+    )
+
+
+def filter_extractor(node):
+    return BuiltinParameterSpecs.extractBuiltinArgs(
+        node=node,
+        builtin_class=ExpressionBuiltinFilter,
+        builtin_spec=BuiltinParameterSpecs.builtin_filter_spec,
+    )
+
+
 _dispatch_dict = {
     "compile": compile_extractor,
     "globals": globals_extractor,
@@ -1268,6 +1482,18 @@ _dispatch_dict = {
     "staticmethod": staticmethod_extractor,
     "classmethod": classmethod_extractor,
     "divmod": divmod_extractor,
+    "enumerate": enumerate_extractor,
+    "zip": zip_extractor,
+    "reversed": reversed_extractor,
+    "sorted": sorted_extractor,
+    "min": min_extractor,
+    "max": max_extractor,
+    "abs": abs_extractor,
+    "any": any_extractor,
+    "all": all_extractor,
+    "round": round_extractor,
+    "map": map_extractor,
+    "filter": filter_extractor,
 }
 
 if python_version < 300:
@@ -1301,16 +1527,6 @@ _builtin_white_list = (
     # Not supporting 'print', because it could be replaced, and is not
     # worth the effort yet.
     "print",
-    # TODO: This could, and should be supported, as we could e.g. lower
-    # types easily for it.
-    "sorted",
-    # TODO: This would be very worthwhile, as it could easily optimize
-    # its iteration away.
-    "zip",
-    # TODO: This would be most precious due to the type hint it gives
-    "enumerate",
-    # TODO: Also worthwhile for known values.
-    "reversed",
     # TODO: Not sure what this really is about.
     "memoryview",
 )
@@ -1386,8 +1602,12 @@ def computeBuiltinCall(builtin_name, call_node):
     if builtin_name in _dispatch_dict:
         new_node = _dispatch_dict[builtin_name](call_node)
 
+        # Extractors may refuse to handle a call, e.g. for arguments that the
+        # node cannot represent.
+        if new_node is None:
+            return call_node, None, None
+
         assert new_node is not call_node, builtin_name
-        assert new_node is not None, builtin_name
 
         # For traces, we are going to ignore side effects, and output traces
         # only based on the basis of it.
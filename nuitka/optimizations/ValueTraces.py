@@ -122,6 +122,9 @@ class ValueTraceBase(object):
     def hasLoopUsages(self):
         return self.loop_usages > 0
 
+    def getLoopUsageCount(self):
+        return self.loop_usages
+
     def getPrevious(self):
         return self.previous
 
@@ -387,7 +390,7 @@ class ValueTraceLoopComplete(ValueTraceLoopInitial):
 
 
 class ValueTraceAssign(ValueTraceBase):
-    __slots__ = ("assign_node", "replace_it")
+    __slots__ = ("assign_node", "replace_it", "unpack_usages")
 
     def __init__(self, owner, assign_node, previous):
         ValueTraceBase.__init__(self, owner=owner, previous=previous)
@@ -395,6 +398,9 @@ class ValueTraceAssign(ValueTraceBase):
         self.assign_node = assign_node
         self.replace_it = None
 
+        # Unpacking "next" nodes that used the value, an iterator then.
+        self.unpack_usages = []
+
     def __repr__(self):
         return "<ValueTraceAssign at {source_ref} of {value}>".format(
             source_ref=self.assign_node.getSourceReference().getAsString(),
@@ -420,6 +426,12 @@ class ValueTraceAssign(ValueTraceBase):
     def getAssignNode(self):
         return self.assign_node
 
+    def addUnpackUsage(self, unpack_node):
+        self.unpack_usages.append(unpack_node)
+
+    def getUnpackUsages(self):
+        return self.unpack_usages
+
     def setReplacementNode(self, replacement):
         self.replace_it = replacement
 
@@ -414,22 +414,51 @@ builtin_classmethod_spec = BuiltinParameterSpecNoKeywords(
 )
 
 if python_version < 300:
-    builtin_sorted_spec = BuiltinParameterSpecNoKeywords(
-        "sorted", ("iterable", "cmp", "key", "reverse"), 2
+    builtin_sorted_spec = BuiltinParameterSpecPosArgs(
+        "sorted", ("iterable", "cmp", "key", "reverse"), 3, 1
     )
 else:
-    builtin_sorted_spec = BuiltinParameterSpecNoKeywords(
-        "sorted", ("iterable", "key", "reverse"), 2
+    # Only "key" and "reverse" are keyword only arguments, which the extractor
+    # has to check for.
+    builtin_sorted_spec = BuiltinParameterSpecPosArgs(
+        "sorted", ("iterable", "key", "reverse"), 2, 1
     )
 
-builtin_reversed_spec = BuiltinParameterSpecNoKeywords("reversed", ("object",), 0)
+builtin_reversed_spec = BuiltinParameterSpecNoKeywords("reversed", ("sequence",), 0)
 
-builtin_reversed_spec = BuiltinParameterSpecNoKeywords("reversed", ("object",), 0)
+if python_version < 300:
+    builtin_enumerate_spec = BuiltinParameterSpec("enumerate", ("sequence", "start"), 1)
+else:
+    builtin_enumerate_spec = BuiltinParameterSpec("enumerate", ("iterable", "start"), 1)
+
+builtin_zip_spec = BuiltinParameterSpecNoKeywords(
+    "zip", (), 0, list_star_arg="iterables"
+)
+
+# Only the forms with one or two positional arguments, the extractor checks
+# for that, and the "key" and "default" keyword only arguments.
+builtin_min_spec = BuiltinParameterSpecNoKeywords("min", ("arg1", "arg2"), 1)
+builtin_max_spec = BuiltinParameterSpecNoKeywords("max", ("arg1", "arg2"), 1)
+
+builtin_abs_spec = BuiltinParameterSpecNoKeywords("abs", ("x",), 0)
+builtin_any_spec = BuiltinParameterSpecNoKeywords("any", ("iterable",), 0)
+builtin_all_spec = BuiltinParameterSpecNoKeywords("all", ("iterable",), 0)
+builtin_round_spec = BuiltinParameterSpec("round", ("number", "ndigits"), 1)
 
 if python_version < 300:
-    builtin_enumerate_spec = BuiltinParameterSpec("enumerate", ("sequence",), 0)
+    builtin_map_spec = BuiltinParameterSpecNoKeywords(
+        "map", ("function", "sequence"), 0, list_star_arg="sequences"
+    )
+    builtin_filter_spec = BuiltinParameterSpecNoKeywords(
+        "filter", ("function", "sequence"), 0
+    )
 else:
-    builtin_enumerate_spec = BuiltinParameterSpec("enumerate", ("iterable",), 0)
+    builtin_map_spec = BuiltinParameterSpecNoKeywords(
+        "map", ("func", "iterable"), 0, list_star_arg="iterables"
+    )
+    builtin_filter_spec = BuiltinParameterSpecNoKeywords(
+        "filter", ("function", "iterable"), 0
+    )
 
 
 class BuiltinRangeSpec(BuiltinParameterSpecNoKeywords):
@@ -17,75 +17,45 @@
 #
 """ Profiling for Nuitka and CPython.
 
-This provides the capability of comparing performance results of Nuitka and
-CPython relatively to one another.
+This runs a program with CPython and "cProfile", as a comparison for programs
+compiled with "--profile". With the environment variable "NUITKA_PROFILE" set,
+the statistics are written to that file, just like the compiled program does,
+so both can be looked at with the "pstats" module, otherwise they are output.
 """
 
-# Note: This is currently severely broken.
-
 from __future__ import print_function
 
+import cProfile
+import os
+import pstats
 import runpy
 import sys
-import tempfile
-
-import vmprof  # @UnresolvedImport pylint: disable=I0021,import-error
-
-
-def _namelen(e):
-    if e.startswith("py:"):
-        return len(e.split(":")[1])
-    else:
-        return len(e)
-
-
-def show(stats):
-    p = stats.top_profile()
-    if not p:
-        print("no stats")
-        return
-
-    p.sort(key=lambda x: x[1], reverse=True)
-    top = p[0][1]
-
-    max_len = max([_namelen(e[0]) for e in p])
-
-    print(" vmprof output:")
-    print(" %:      name:" + " " * (max_len - 3) + "location:")
-
-    for k, v in p:
-        v = "%.1f%%" % (float(v) / top * 100)
-        if v == "0.0%":
-            v = "<0.1%"
-        if k.startswith("py:"):
-            _, func_name, lineno, filename = k.split(":", 3)
-            lineno = int(lineno)
-            print(
-                " %s %s %s:%d"
-                % (v.ljust(7), func_name.ljust(max_len + 1), filename, lineno)
-            )
-        else:
-            print(" %s %s" % (v.ljust(7), k.ljust(max_len + 1)))
 
 
 def main():
-    with tempfile.NamedTemporaryFile() as prof_file:
-        vmprof.enable(prof_file.fileno(), 0.001)
+    if len(sys.argv) < 2:
+        sys.exit("Error, need to give program to profile and its arguments.")
 
-        try:
-            program = sys.argv[1]
-            del sys.argv[1]
+    program = sys.argv[1]
+    sys.argv = sys.argv[1:]
 
-            #            sys.argv = [args.program] + args.args
-            runpy.run_path(program, run_name="__main__")
-        except (KeyboardInterrupt, SystemExit):
-            pass
+    profiler = cProfile.Profile()
+    profiler.enable()
 
-        vmprof.disable()
+    try:
+        runpy.run_path(program, run_name="__main__")
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        profiler.disable()
 
-        stats = vmprof.read_profile(prof_file.name, virtual_only=True)
+    stats_filename = os.environ.get("NUITKA_PROFILE")
 
-        show(stats)
+    if stats_filename:
+        profiler.dump_stats(stats_filename)
+    else:
+        stats = pstats.Stats(profiler)
+        stats.sort_stats("cumulative").print_stats(30)
 
 
 if __name__ == "__main__":
@@ -156,7 +156,8 @@ class TypeDescBase(TypeMetaClassBase):
         return """\
 PyErr_Format(PyExc_TypeError, "unsupported operand type(s) for %s: '%s' and '%s'"%s);
 return NULL;""" % (
-            operation,
+            # The operation is part of the format string.
+            operation.replace("%", "%%"),
             "%s" if self is object_desc else self.type_name,
             "%s" if other is object_desc else other.type_name,
             args,
@@ -178,6 +179,11 @@ return NULL;""" % (
                 cand, "sq_concat", operand1, operand2
             )
 
+        # Other operations without a number slot, e.g. "*" for sequences, have
+        # nothing to specialize.
+        if not cand.hasSlot(slot):
+            return ""
+
         return "return SLOT_%s_%s_%s(%s, %s);" % (
             slot,
             helper_name,
@@ -220,6 +226,12 @@ assert(%(is_newstyle)sNEW_STYLE_NUMBER(%(operand)s));
     def getTypeValueExpression(self, operand):
         pass
 
+    def getTypeCheckExactExpression(self, operand):
+        return "%s_CheckExact(%s)" % (
+            self.getTypeValueExpression(operand)[1:].split("_")[0],
+            operand,
+        )
+
     def getSqConcatSlotSpecializationCode(self, other, slot, operand1, operand2):
         if not self.hasSlot(slot):
             return ""
@@ -276,7 +288,7 @@ class StrDesc(ConcreteTypeBase):
 
     def hasSlot(self, slot):
         if slot.startswith("nb_"):
-            return "slot" == "nb_remainder"
+            return slot == "nb_remainder"
         elif slot.startswith("sq_"):
             return "ass" not in slot
         else:
@@ -309,7 +321,7 @@ assert(NEW_STYLE_NUMBER(%(operand)s));""" % {
 
     def hasSlot(self, slot):
         if slot.startswith("nb_"):
-            return "slot" == "nb_remainder"
+            return slot == "nb_remainder"
         elif slot.startswith("sq_"):
             return "ass" not in slot
         else:
@@ -403,7 +415,8 @@ class BytesDesc(ConcreteTypeBase):
 
     def hasSlot(self, slot):
         if slot.startswith("nb_"):
-            return "slot" == "nb_remainder"
+            # Only Python3.5 or higher has "%" for bytes, not worth it.
+            return False
         elif slot.startswith("sq_"):
             return "ass" not in slot and slot != "sq_slice"
         else:
@@ -513,19 +526,288 @@ types = (
 )
 
 
-def makeHelpersBinaryOperationAdd(emit_h, emit_c, emit):
-    binary_operation_add_template = env.get_template("HelperOperationBinaryAdd.c.j2")
+class BinaryOperationDesc(object):
+    """ Description of a binary operation to generate helpers for. """
+
+    def __init__(
+        self,
+        op_code,
+        op_name,
+        operator,
+        nb_slot,
+        inplace_api,
+        types,
+        same_types,
+        extra_pairs=(),
+        incremental_helper=None,
+        python_requirement=None,
+    ):
+        # Name part of the helpers, e.g. "SUB" for "BINARY_OPERATION_SUB_*".
+        self.op_code = op_code
+
+        # Name part of the generated files, e.g. "Sub" for the C file
+        # "HelpersOperationBinarySub.c" and its "Utils" file.
+        self.op_name = op_name
+
+        # Python operator, used for error messages.
+        self.operator = operator
+
+        # The number slot of the operation.
+        self.nb_slot = nb_slot
+
+        # CPython API for the in-place operation, None if the in-place
+        # helpers are not generated.
+        self.inplace_api = inplace_api
+
+        # Types to specialize in combination with "object" values.
+        self.types = types
+
+        # Types to specialize with themselves, these need "SLOT_" helpers
+        # that are still manually coded.
+        self.same_types = same_types
+
+        # Combinations of different types to specialize.
+        self.extra_pairs = extra_pairs
+
+        # For "float" values that are only referenced by us, the value
+        # can be changed in-place.
+        self.incremental_helper = incremental_helper
+
+        # For operations that exist only in some Python versions.
+        self.python_requirement = python_requirement
+
+    def getHelperFilenames(self):
+        return (
+            "nuitka/build/static_src/HelpersOperationBinary%s.c" % self.op_name,
+            "nuitka/build/include/nuitka/helper/operations_binary_%s.h"
+            % self.op_code.lower(),
+        )
+
+
+license_header = """\
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//"""
+
+
+number_types = (int_desc, float_desc, long_desc)
+
+number_pairs = ((float_desc, long_desc), (long_desc, float_desc))
+
+binary_operations = (
+    BinaryOperationDesc(
+        op_code="ADD",
+        op_name="Add",
+        operator="+",
+        nb_slot="nb_add",
+        # In-place helpers for "+" are still manually coded.
+        inplace_api=None,
+        types=types[:-1],
+        same_types=types[:-1],
+        extra_pairs=number_pairs,
+    ),
+    BinaryOperationDesc(
+        op_code="SUB",
+        op_name="Sub",
+        operator="-",
+        nb_slot="nb_subtract",
+        inplace_api="PyNumber_InPlaceSubtract",
+        types=number_types,
+        same_types=number_types,
+        extra_pairs=number_pairs,
+        incremental_helper="FLOAT_SUB_INCREMENTAL",
+    ),
+    BinaryOperationDesc(
+        op_code="MUL",
+        op_name="Mul",
+        operator="*",
+        nb_slot="nb_multiply",
+        inplace_api="PyNumber_InPlaceMultiply",
+        types=types[:-1],
+        same_types=number_types,
+        extra_pairs=number_pairs
+        + tuple(
+            (sequence_desc, count_desc)
+            for sequence_desc in (
+                str_desc,
+                unicode_desc,
+                tuple_desc,
+                list_desc,
+                bytes_desc,
+            )
+            for count_desc in (int_desc, long_desc)
+        ),
+        incremental_helper="FLOAT_MUL_INCREMENTAL",
+    ),
+    BinaryOperationDesc(
+        op_code="DIV",
+        op_name="Div",
+        operator="/",
+        nb_slot="nb_divide",
+        inplace_api="PyNumber_InPlaceDivide",
+        types=number_types,
+        same_types=number_types,
+        extra_pairs=number_pairs,
+        python_requirement="PYTHON_VERSION < 300",
+    ),
+    BinaryOperationDesc(
+        op_code="FLOORDIV",
+        op_name="FloorDiv",
+        operator="//",
+        nb_slot="nb_floor_divide",
+        inplace_api="PyNumber_InPlaceFloorDivide",
+        types=number_types,
+        same_types=number_types,
+        extra_pairs=number_pairs,
+    ),
+    BinaryOperationDesc(
+        op_code="TRUEDIV",
+        op_name="TrueDiv",
+        operator="/",
+        nb_slot="nb_true_divide",
+        inplace_api="PyNumber_InPlaceTrueDivide",
+        types=number_types,
+        same_types=number_types,
+        extra_pairs=number_pairs,
+        incremental_helper="FLOAT_TRUEDIV_INCREMENTAL",
+    ),
+    BinaryOperationDesc(
+        op_code="REMAINDER",
+        op_name="Remainder",
+        operator="%",
+        nb_slot="nb_remainder",
+        inplace_api="PyNumber_InPlaceRemainder",
+        types=(int_desc, str_desc, unicode_desc, float_desc, long_desc),
+        same_types=number_types,
+        # String formatting with tuples of values is very common.
+        extra_pairs=number_pairs + ((str_desc, tuple_desc), (unicode_desc, tuple_desc)),
+    ),
+    BinaryOperationDesc(
+        op_code="LSHIFT",
+        op_name="LShift",
+        operator="<<",
+        nb_slot="nb_lshift",
+        inplace_api="PyNumber_InPlaceLshift",
+        types=(int_desc, long_desc),
+        same_types=(int_desc, long_desc),
+    ),
+    BinaryOperationDesc(
+        op_code="RSHIFT",
+        op_name="RShift",
+        operator=">>",
+        nb_slot="nb_rshift",
+        inplace_api="PyNumber_InPlaceRshift",
+        types=(int_desc, long_desc),
+        same_types=(int_desc, long_desc),
+    ),
+    BinaryOperationDesc(
+        op_code="BITAND",
+        op_name="BitAnd",
+        operator="&",
+        nb_slot="nb_and",
+        inplace_api="PyNumber_InPlaceAnd",
+        types=(int_desc, long_desc),
+        same_types=(int_desc, long_desc),
+    ),
+    BinaryOperationDesc(
+        op_code="BITOR",
+        op_name="BitOr",
+        operator="|",
+        nb_slot="nb_or",
+        inplace_api="PyNumber_InPlaceOr",
+        types=(int_desc, long_desc),
+        same_types=(int_desc, long_desc),
+    ),
+    BinaryOperationDesc(
+        op_code="BITXOR",
+        op_name="BitXor",
+        operator="^",
+        nb_slot="nb_xor",
+        inplace_api="PyNumber_InPlaceXor",
+        types=(int_desc, long_desc),
+        same_types=(int_desc, long_desc),
+    ),
+)
+
+
+def _getPythonRequirement(*descs):
+    requirements = sorted(
+        set(desc.python_requirement for desc in descs if desc.python_requirement)
+    )
+
+    # Types of different Python versions cannot meet.
+    if len(requirements) > 1:
+        return None
+
+    return requirements[0] if requirements else ""
+
 
-    emit('/* C helpers for type specialized "+" (Add) operations */')
+def makeHelpersBinaryOperation(operation, emit_h, emit_c, emit):
+    # Many cases to cover, pylint: disable=too-many-branches
+    binary_operation_template = env.get_template("HelperOperationBinary.c.j2")
+    binary_operation_inplace_template = env.get_template(
+        "HelperOperationBinaryInplace.c.j2"
+    )
+
+    emit(
+        '/* C helpers for type specialized "%s" (%s) operations */'
+        % (operation.operator, operation.op_name)
+    )
     emit()
 
     def emitCode(left, right):
-        code = binary_operation_add_template.render(left=left, right=right)
+        code = binary_operation_template.render(
+            left=left,
+            right=right,
+            op_code=operation.op_code,
+            operator=operation.operator,
+            nb_slot=operation.nb_slot,
+        )
+
+        emit_c(code)
+        emit_h("extern " + code.splitlines()[0].replace(" {", ";"))
+
+    def emitInplaceCode(left, right):
+        if operation.inplace_api is None:
+            return
+
+        # Only for values that have no in-place slots, the other cases are
+        # left to the "object" variant.
+        if left is not object_desc and (
+            left not in number_types or right not in number_types
+        ):
+            return
+
+        code = binary_operation_inplace_template.render(
+            left=left,
+            right=right,
+            op_code=operation.op_code,
+            inplace_api=operation.inplace_api,
+            same_types=operation.same_types,
+            incremental_helper=operation.incremental_helper
+            if left is right is float_desc
+            else None,
+        )
 
+        emit()
         emit_c(code)
         emit_h("extern " + code.splitlines()[0].replace(" {", ";"))
 
-    for left in types[:-1]:
+    for left in operation.types:
         if left.python_requirement:
             emit("#if %s" % left.python_requirement)
             emit()
@@ -539,18 +821,36 @@ def makeHelpersBinaryOperationAdd(emit_h, emit_c, emit):
         emitCode(left=object_desc, right=left)
 
         for right in [object_desc, left]:
+            if right is left and left not in operation.same_types:
+                continue
+
             emit()
             emitCode(left=left, right=right)
 
+        if left in operation.same_types:
+            emitInplaceCode(left=left, right=left)
+
         if left.python_requirement:
             emit()
             emit("#endif")
 
-    emit()
-    emitCode(left=float_desc, right=long_desc)
+    for left, right in operation.extra_pairs:
+        python_requirement = _getPythonRequirement(left, right)
 
-    emit()
-    emitCode(left=long_desc, right=float_desc)
+        if python_requirement is None:
+            continue
+
+        if python_requirement:
+            emit()
+            emit("#if %s" % python_requirement)
+
+        emit()
+        emitCode(left=left, right=right)
+        emitInplaceCode(left=left, right=right)
+
+        if python_requirement:
+            emit()
+            emit("#endif")
 
     emit(
         '/* Code referring to "%s" corresponds to %s. */'
@@ -558,6 +858,7 @@ def makeHelpersBinaryOperationAdd(emit_h, emit_c, emit):
     )
     emit()
     emitCode(left=object_desc, right=object_desc)
+    emitInplaceCode(left=object_desc, right=object_desc)
 
     if False:  # TODO, pylint: disable=using-constant-test
         emit(
@@ -565,14 +866,14 @@ def makeHelpersBinaryOperationAdd(emit_h, emit_c, emit):
             % (clong_desc.getHelperCodeName(), clong_desc.type_desc)
         )
         emit()
-        emit(binary_operation_add_template.render(left=long_desc, right=clong_desc))
+        emit(binary_operation_template.render(left=long_desc, right=clong_desc))
 
 
-def main():
-    filename_c = "nuitka/build/static_src/HelpersOperationBinaryAdd.c"
-    filename_h = "nuitka/build/include/nuitka/helper/operations_binary_add.h"
+def makeHelpersFiles(operation):
+    filename_c, filename_h = operation.getHelperFilenames()
 
     def emitGenerationWarning(emit):
+        emit(license_header)
         emit("/* WARNING, this code is GENERATED. Modify the template instead! */")
 
     with open(filename_c, "w") as output_c:
@@ -599,15 +900,26 @@ def main():
             emitGenerationWarning(emit_h)
             emitGenerationWarning(emit_c)
 
+            if operation.python_requirement:
+                emit("#if %s" % operation.python_requirement)
+
             emit_c(
                 '#include "%s"' % os.path.basename(filename_c).replace(".c", "Utils.c")
             )
 
-            makeHelpersBinaryOperationAdd(emit_h, emit_c, emit)
+            makeHelpersBinaryOperation(operation, emit_h, emit_c, emit)
+
+            if operation.python_requirement:
+                emit("#endif")
 
     cleanupClangFormat(filename_c)
     cleanupClangFormat(filename_h)
 
 
+def main():
+    for operation in binary_operations:
+        makeHelpersFiles(operation)
+
+
 if __name__ == "__main__":
     main()
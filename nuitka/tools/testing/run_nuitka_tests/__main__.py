@@ -605,6 +605,9 @@ def main():
             setExtraFlags(None, "standalone", flags)
             executeSubTest("./tests/standalone/run_all.py search")
 
+            # Standalone mode relies on this for dependencies on Linux.
+            executeSubTest("./tests/elf-files/run_all.py search")
+
         if options.reflection_test and not options.coverage:
             print(
                 "Running the reflection test with options '%s' with %s:"
@@ -111,6 +111,7 @@ from nuitka.utils import MemoryUsage
 from nuitka.utils.FileOperations import splitPath
 
 from . import SyntaxErrors
+from .ModuleTreeCache import restoreModuleTreeCached
 from .ReformulationAssertStatements import buildAssertNode
 from .ReformulationAssignmentStatements import (
     buildAnnAssignNode,
@@ -963,28 +964,34 @@ def createModuleTree(module, source_ref, source_code, is_main):
     if Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
-    try:
-        module_body = buildParseTree(
-            provider=module,
-            source_code=source_code,
-            source_ref=source_ref,
-            is_module=True,
-            is_main=is_main,
-        )
-    except RuntimeError as e:
-        if "maximum recursion depth" in e.args[0]:
-            raise CodeTooComplexCode(
-                module.getFullName(), module.getCompileTimeFilename()
+    # The optimized tree of a previous compilation may be used instead.
+    restored = Options.shallUseModuleCache() and restoreModuleTreeCached(
+        module=module, source_ref=source_ref, source_code=source_code, is_main=is_main
+    )
+
+    if not restored:
+        try:
+            module_body = buildParseTree(
+                provider=module,
+                source_code=source_code,
+                source_ref=source_ref,
+                is_module=True,
+                is_main=is_main,
             )
+        except RuntimeError as e:
+            if "maximum recursion depth" in e.args[0]:
+                raise CodeTooComplexCode(
+                    module.getFullName(), module.getCompileTimeFilename()
+                )
 
-        raise
+            raise
 
-    if module_body.isStatementsFrame():
-        module_body = makeStatementsSequenceFromStatement(statement=module_body)
+        if module_body.isStatementsFrame():
+            module_body = makeStatementsSequenceFromStatement(statement=module_body)
 
-    module.setBody(module_body)
+        module.setBody(module_body)
 
-    completeVariableClosures(module)
+        completeVariableClosures(module)
 
     if Options.isShowMemory():
         memory_watch.finish()
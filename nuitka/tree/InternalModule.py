@@ -29,6 +29,9 @@ from nuitka.SourceCodeReferences import fromFilename
 
 internal_source_ref = fromFilename("internal").atInternal()
 
+# Singleton getters by their qualified names, to find them again by name.
+_once_getters = {}
+
 
 def once_decorator(func):
     """ Cache result of a function call without arguments.
@@ -48,9 +51,31 @@ def once_decorator(func):
 
         return func.cached_value
 
+    _once_getters["%s.%s" % (func.__module__, func.__name__)] = func, replacement
+
     return replacement
 
 
+def getInternalHelperGetterName(function_body):
+    """ Name of the getter that created an internal helper function, or None.
+
+    """
+
+    for getter_name, (func, _replacement) in _once_getters.items():
+        if func.cached_value is function_body:
+            return getter_name
+
+    return None
+
+
+def getInternalHelperFromGetterName(getter_name):
+    """ Get an internal helper function by its getter name, creating it if needed.
+
+    """
+
+    return _once_getters[getter_name][1]()
+
+
 @once_decorator
 def getInternalModule():
     """ Get the singleton internal module.
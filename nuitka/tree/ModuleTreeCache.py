@@ -0,0 +1,223 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistent cache for the optimized node trees of compiled modules.
+
+The node tree of a module is determined by its source code, the Nuitka and
+Python versions, and the options that influence tree building and
+optimization. When all of these are unchanged, the optimized tree of a
+previous compilation is restored instead of building it from source. The
+optimization of it then only has to compute the traces again, and finds
+nothing left to change.
+
+Knowledge from other modules that ends up in a tree, i.e. direct calls of
+their functions, cannot be persisted, such modules are not cached.
+"""
+
+import os
+import pickle
+import sys
+from logging import info
+
+from nuitka import Options
+from nuitka.importing.PreloadedPackages import getPthImportedPackages
+from nuitka.PythonVersions import python_version
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import makePath
+from nuitka.utils.Hashing import Hash
+from nuitka.Version import getNuitkaVersion
+
+from .TreePersistence import (
+    TreePersistenceError,
+    getModuleTreeXML,
+    restoreModuleTreeFromXML,
+)
+
+_cache_hits = 0
+_cache_misses = 0
+
+# Cache filenames of the modules built in this compilation, to store them
+# after optimization.
+_cache_filenames = {}
+
+
+def _getCacheDirectory():
+    result = os.path.join(getCacheDir(), "module_trees")
+
+    makePath(result)
+
+    return result
+
+
+def _getOptionsCacheValues():
+    """ The option values that have an influence on optimized module trees. """
+
+    result = [
+        Options.isDebug(),
+        Options.isFullCompat(),
+        Options.isStandaloneMode(),
+        Options.shallMakeModule(),
+        Options.getFileReferenceMode(),
+        Options.shallOptimizeStringExec(),
+        Options.shallFollowStandardLibrary(),
+        Options.shallFollowNoImports(),
+        Options.shallFollowAllImports(),
+        sorted(Options.getShallFollowInNoCase()),
+        sorted(Options.getShallFollowModules()),
+        sorted(Options.getShallFollowExtra()),
+        sorted(Options.getShallFollowExtraFilePatterns()),
+        sorted(Options.getPythonFlags()),
+        sorted(Options.getExperimentalIndications()),
+        sorted(Options.getPluginsDisabled()),
+    ]
+
+    for plugin_name in sorted(Options.getPluginsEnabled()):
+        result.append((plugin_name, Options.getPluginOptions(plugin_name)))
+
+    # User plugins can change, so their code is part of it too.
+    for user_plugin in sorted(Options.getUserPlugins()):
+        plugin_filename = user_plugin.split("=", 1)[0]
+
+        result.append((user_plugin, Options.getPluginOptions(plugin_filename)))
+
+        if os.path.isfile(plugin_filename):
+            with open(plugin_filename, "rb") as plugin_file:
+                result.append(plugin_file.read())
+
+    return result
+
+
+def _getModuleCacheKey(module, source_ref, source_code, is_main):
+    key = Hash()
+
+    key.updateFromValues(
+        getNuitkaVersion(),
+        sys.version,
+        sys.platform,
+        python_version,
+        _getOptionsCacheValues(),
+        module.getFullName(),
+        module.__class__.__name__,
+        module.isTopModule(),
+        module.mode,
+        is_main,
+        source_ref.getFilename(),
+        source_ref.getLineNumber(),
+        source_code,
+    )
+
+    # Main programs get imports of ".pth" file packages added.
+    if is_main:
+        key.updateFromValues(getPthImportedPackages())
+
+    return key.asHexDigest()
+
+
+def restoreModuleTreeCached(module, source_ref, source_code, is_main):
+    """ Restore the optimized tree of a module from the cache.
+
+    Args:
+        module: the compiled module node, without a body yet
+        source_ref: source code reference of the module
+        source_code: the source code of the module
+        is_main: is this the main module
+    Returns:
+        bool, if the tree was restored, otherwise it has to be built
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _cache_hits, _cache_misses
+
+    # Constant values of other modules are not visible in the tree, and could
+    # change without this module changing.
+    if Options.isExperimental("module_constants"):
+        return False
+
+    cache_filename = os.path.join(
+        _getCacheDirectory(),
+        _getModuleCacheKey(
+            module=module,
+            source_ref=source_ref,
+            source_code=source_code,
+            is_main=is_main,
+        ),
+    )
+
+    if os.path.exists(cache_filename):
+        try:
+            with open(cache_filename, "rb") as cache_file:
+                text = cache_file.read().decode("utf8")
+
+            restoreModuleTreeFromXML(module, text)
+        except (
+            TreePersistenceError,
+            EOFError,
+            KeyError,
+            IndexError,
+            ValueError,
+            TypeError,
+            AttributeError,
+            AssertionError,
+            ImportError,
+            SyntaxError,
+            pickle.UnpicklingError,
+        ):
+            # Broken cache entries are ignored and overwritten.
+            pass
+        else:
+            _cache_hits += 1
+
+            return True
+
+    _cache_misses += 1
+    _cache_filenames[module] = cache_filename
+
+    return False
+
+
+def storeModuleTreeCached(module):
+    """ Store the optimized tree of a module in the cache.
+
+    Args:
+        module: the compiled module node, after optimization
+    """
+
+    cache_filename = _cache_filenames.get(module)
+
+    # Modules without source code, or restored from the cache.
+    if cache_filename is None:
+        return
+
+    try:
+        text = getModuleTreeXML(module)
+    except TreePersistenceError:
+        # Trees with values that cannot be represented are simply not cached.
+        return
+
+    # Write to a temporary file first, so a concurrent compilation never sees
+    # a partial cache entry.
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    with open(temp_filename, "wb") as cache_file:
+        cache_file.write(text.encode("utf8"))
+
+    os.rename(temp_filename, cache_filename)
+
+
+def reportModuleTreeCacheStatistics():
+    if Options.isShowProgress():
+        info("Module tree cache: %d hits, %d misses." % (_cache_hits, _cache_misses))
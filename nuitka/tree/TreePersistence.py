@@ -0,0 +1,1026 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistence of optimized module trees.
+
+The node tree of a compiled module is written as XML, with attribute values
+that are typed, so that it can be restored into a module object again, with
+the same variables, code names, and locals dictionaries. Traces are not part
+of it, optimization will compute them again for the restored tree.
+
+The closure givers, i.e. the module, functions, classes, and outlines, are
+called owners here, as variables belong to them. They are created first, in
+an order that has providers before the things they provide to, then the
+variables, and then the nodes from the leaves up.
+
+Values that cannot be represented raise "TreePersistenceError", the module
+is then built from source as usual.
+"""
+
+import binascii
+import marshal
+import pickle
+import re
+from io import BytesIO
+
+from nuitka import TreeXML, Variables
+from nuitka.__past__ import builtins, iterItems
+from nuitka.Builtins import builtin_anon_names, builtin_anon_values
+from nuitka.Constants import isConstant, isMarshalPreserved
+from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
+from nuitka.nodes.FutureSpecs import FutureSpec
+from nuitka.nodes.LocalsScopes import (
+    GlobalsDictHandle,
+    LocalsDictHandle,
+    getLocalsDictHandle,
+    getLocalsDictHandles,
+    setLocalsDictType,
+)
+from nuitka.nodes.NodeBases import ClosureGiverNodeMixin, NodeBase, getNodeClassFromKind
+from nuitka.SourceCodeReferences import SourceCodeReference, SourceCodeReferenceInternal
+from nuitka.specs.ParameterSpecs import ParameterSpec
+
+from .Extractions import getVariablesWritten
+from .InternalModule import getInternalHelperFromGetterName, getInternalHelperGetterName
+
+
+class TreePersistenceError(Exception):
+    pass
+
+
+# Node attributes used for the node itself, these cannot be details.
+_node_attributes = (
+    "kind",
+    "owner",
+    "loop_state",
+    "line",
+    "column",
+    "filename",
+    "internal",
+    "compat_line",
+    "compat_column",
+)
+
+# Node state that is not part of the details, but decided during tree
+# building, and not computed again by optimization. Variable versions are
+# not details, so clones get new ones.
+_node_state_attributes = ("user_provided", "inplace_suspect", "variable_version")
+
+# Children that are named differently as constructor arguments, with "None"
+# for children the constructor creates itself.
+_child_argument_names = {
+    "ExpressionAttributeCheck": {"source": "object_arg"},
+    "ExpressionBuiltinCompile": {"source": "source_code"},
+    "ExpressionBuiltinEval": {
+        "source": "source_code",
+        "globals": "globals_arg",
+        "locals": "locals_arg",
+    },
+    "ExpressionBuiltinExec": {
+        "source": "source_code",
+        "globals": "globals_arg",
+        "locals": "locals_arg",
+    },
+    "ExpressionBuiltinExecfile": {
+        "source": "source_code",
+        "globals": "globals_arg",
+        "locals": "locals_arg",
+    },
+    "ExpressionBuiltinHasattr": {"source": "object_arg", "attribute": "name"},
+    "ExpressionBuiltinSetattr": {"source": "object_arg", "attribute": "name"},
+    "ExpressionBuiltinSuper": {"type": "super_type", "object": "super_object"},
+    "ExpressionBuiltinType3": {"dict": "type_dict"},
+    "StatementExec": {
+        "source": "source_code",
+        "globals": "globals_arg",
+        "locals": "locals_arg",
+    },
+    "StatementImportStar": {"module": "module_import"},
+    "StatementSetLocalsDictionary": {"new_locals": None},
+}
+
+# Owner state that is plain data, and only decided during tree building.
+_owner_state_attributes = (
+    "code_name",
+    "temp_scopes",
+    "preserver_id",
+    "flags",
+    "unoptimized_locals",
+    "unqualified_exec",
+    "needs_annotations_dict",
+    "temp_scope",
+    "non_local_declarations",
+)
+
+_code_name_uid_re = re.compile(r"[a-z]*_(\d+)")
+
+
+def _isPlainText(value):
+    for c in value:
+        if not " " <= c <= "~":
+            return False
+
+    return True
+
+
+def _getPicklePersistentId(value):
+    # Types without a name to be found by, e.g. "NoneType", cannot be pickled,
+    # and built-in types are not to be pickled by their module either.
+    if type(value) is type:
+        if value in builtin_anon_values:
+            return "a" + builtin_anon_values[value]
+        if getattr(builtins, value.__name__, None) is value:
+            return "b" + value.__name__
+
+    return None
+
+
+def _getPicklePersistentValue(persistent_id):
+    if persistent_id[0] == "a":
+        return builtin_anon_names[persistent_id[1:]]
+    else:
+        return getattr(builtins, persistent_id[1:])
+
+
+def _pickleValue(value):
+    output = BytesIO()
+
+    pickler = pickle.Pickler(output, pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = _getPicklePersistentId
+    pickler.dump(value)
+
+    return output.getvalue()
+
+
+def _unpickleValue(data):
+    unpickler = pickle.Unpickler(BytesIO(data))
+    unpickler.persistent_load = _getPicklePersistentValue
+
+    return unpickler.load()
+
+
+def _encodeData(value):
+    return binascii.hexlify(value).decode("ascii")
+
+
+def _decodeData(value):
+    return binascii.unhexlify(value.encode("ascii"))
+
+
+def _isOwner(node):
+    return isinstance(node, ClosureGiverNodeMixin) or node.isExpressionOutlineBody()
+
+
+def _getLocalsDictName(owner):
+    if owner.isCompiledPythonModule():
+        return owner.module_dict_name
+    else:
+        return getattr(owner, "locals_dict_name", None)
+
+
+class _TreeWriter(object):
+    def __init__(self, module):
+        self.module = module
+        self.filename = module.getSourceReference().getFilename()
+
+        self.owners = [module]
+        self.owner_indexes = {module: 0}
+        self.owners_written = set()
+
+        self.variables = []
+        self.variable_indexes = {}
+
+        self.code_objects = []
+        self.code_object_indexes = {}
+
+        self.future_specs = []
+        self.future_spec_indexes = {}
+
+        self.node_modules = set()
+
+    def getOwnerIndex(self, owner):
+        if owner not in self.owner_indexes:
+            if owner.getParentModule() is not self.module:
+                raise TreePersistenceError("Owner of other module", owner)
+
+            # Providers are created first when restoring, so add them first.
+            if owner.isExpressionOutlineBody():
+                self.getOwnerIndex(owner.provider)
+            else:
+                self.getOwnerIndex(owner.getParentVariableProvider())
+
+            self.owner_indexes[owner] = len(self.owners)
+            self.owners.append(owner)
+
+        return self.owner_indexes[owner]
+
+    def getVariableIndex(self, variable):
+        if variable not in self.variable_indexes:
+            if variable.isLocalsDictVariable():
+                self.checkLocalsDictHandle(variable.getOwner())
+            else:
+                self.getOwnerIndex(variable.getOwner())
+
+            self.variable_indexes[variable] = len(self.variables)
+            self.variables.append(variable)
+
+        return self.variable_indexes[variable]
+
+    def getCodeObjectIndex(self, code_object):
+        if code_object not in self.code_object_indexes:
+            self.getFutureSpecIndex(code_object.getFutureSpec())
+
+            self.code_object_indexes[code_object] = len(self.code_objects)
+            self.code_objects.append(code_object)
+
+        return self.code_object_indexes[code_object]
+
+    def getFutureSpecIndex(self, future_spec):
+        if future_spec not in self.future_spec_indexes:
+            self.future_spec_indexes[future_spec] = len(self.future_specs)
+            self.future_specs.append(future_spec)
+
+        return self.future_spec_indexes[future_spec]
+
+    def checkLocalsDictHandle(self, locals_scope):
+        locals_name = locals_scope.getName()
+
+        if getLocalsDictHandles().get(locals_name) is not locals_scope:
+            raise TreePersistenceError("Unregistered locals dict", locals_scope)
+
+        for owner in self.owners:
+            if _getLocalsDictName(owner) == locals_name:
+                return
+
+        raise TreePersistenceError("Locals dict of other module", locals_scope)
+
+    def encodeValue(self, value):
+        # Many cases, pylint: disable=too-many-return-statements
+        if type(value) is str and _isPlainText(value):
+            return "s" + value
+        elif isinstance(value, Variables.Variable):
+            return "v%d" % self.getVariableIndex(value)
+        elif isinstance(value, NodeBase):
+            if value.getParentModule().isInternalModule():
+                getter_name = getInternalHelperGetterName(value)
+
+                if getter_name is None:
+                    raise TreePersistenceError("Unknown internal node", value)
+
+                return "h" + getter_name
+            elif _isOwner(value):
+                return "o%d" % self.getOwnerIndex(value)
+            else:
+                raise TreePersistenceError("Node reference", value)
+        elif isinstance(value, CodeObjectSpec):
+            return "k%d" % self.getCodeObjectIndex(value)
+        elif isinstance(value, FutureSpec):
+            return "f%d" % self.getFutureSpecIndex(value)
+        elif isinstance(value, (LocalsDictHandle, GlobalsDictHandle)):
+            self.checkLocalsDictHandle(value)
+
+            return "l" + value.getName()
+
+        if isMarshalPreserved(value):
+            try:
+                return "c" + _encodeData(marshal.dumps(value))
+            except ValueError:
+                pass
+
+        # Constant values like types can only be pickled, but other objects
+        # must not be, so they are not accidentally copied.
+        if not isConstant(value):
+            raise TreePersistenceError("Unsupported value", value)
+
+        try:
+            return "p" + _encodeData(_pickleValue(value))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            raise TreePersistenceError("Unsupported constant", value)
+
+    def setSourceReference(self, element, source_ref, prefix):
+        element.set(prefix + "line", str(source_ref.getLineNumber()))
+
+        if source_ref.getColumnNumber() is not None:
+            element.set(prefix + "column", str(source_ref.getColumnNumber()))
+
+        if source_ref.getFilename() != self.filename:
+            element.set(prefix + "filename", self.encodeValue(source_ref.getFilename()))
+
+        if source_ref.isInternal():
+            element.set(prefix + "internal", "1")
+
+    def makeNodeElement(self, node):
+        self.node_modules.add(node.__class__.__module__)
+
+        element = TreeXML.Element("node", kind=node.__class__.__name__)
+
+        source_ref = node.getSourceReference()
+        self.setSourceReference(element, source_ref, "")
+
+        compat_source_ref = node.getCompatibleSourceReference()
+        if compat_source_ref is not source_ref:
+            if (
+                compat_source_ref.getFilename() != source_ref.getFilename()
+                or compat_source_ref.isInternal() is not source_ref.isInternal()
+            ):
+                raise TreePersistenceError("Compatible source reference", node)
+
+            element.set("compat_line", str(compat_source_ref.getLineNumber()))
+
+            if compat_source_ref.getColumnNumber() is not None:
+                element.set("compat_column", str(compat_source_ref.getColumnNumber()))
+
+        if _isOwner(node):
+            # The owner itself is created from the owners table, only the
+            # children are given here.
+            if node in self.owners_written:
+                raise TreePersistenceError("Owner node used twice", node)
+            self.owners_written.add(node)
+
+            element.set("owner", str(self.getOwnerIndex(node)))
+        else:
+            details = node.getDetails()
+
+            for key in _node_state_attributes:
+                value = getattr(node, key, None)
+
+                if value is not None and value is not False and key not in details:
+                    details[key] = value
+
+            for key, value in iterItems(details):
+                if key in _node_attributes:
+                    raise TreePersistenceError("Detail name", node, key)
+
+                element.set(key, self.encodeValue(value))
+
+            if node.isStatementLoop() and node.loop_variables is not None:
+                self.setLoopState(element, node)
+
+        for name, children in node.getVisitableNodesNamed():
+            # Functions of modules are handled separately.
+            if name == "functions" and node.isCompiledPythonModule():
+                continue
+
+            role = TreeXML.Element("role", name=name)
+            element.append(role)
+
+            if children is None:
+                role.set("type", "none")
+            elif type(children) is tuple:
+                role.set("type", "list")
+
+                for child in children:
+                    role.append(self.makeNodeElement(child))
+            else:
+                role.append(self.makeNodeElement(children))
+
+        return element
+
+    def setLoopState(self, element, loop_node):
+        # The shapes of loop variables are learned over several passes, with
+        # them a restored tree does not have to learn them again. Variables no
+        # longer written by the loop are not needed.
+        variables_written = getVariablesWritten(loop_node.getLoopBody())
+
+        loop_state = [
+            (self.getVariableIndex(variable), shapes, loop_node.loop_memory[variable])
+            for variable, shapes in iterItems(loop_node.loop_variables)
+            if variable in variables_written
+        ]
+
+        try:
+            value = _pickleValue((loop_node.loop_variables_complete, loop_state))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        element.set("loop_state", _encodeData(value))
+
+    def makeOwnerElement(self, owner):
+        element = TreeXML.Element(
+            "owner", kind=owner.__class__.__name__, index=str(self.owner_indexes[owner])
+        )
+
+        if owner is not self.module:
+            self.setSourceReference(element, owner.getSourceReference(), "")
+
+            element.set("name", self.encodeValue(owner.name))
+
+            if owner.isExpressionOutlineBody():
+                provider = owner.provider
+            else:
+                provider = owner.getParentVariableProvider()
+
+            element.set("provider", self.encodeValue(provider))
+
+            if hasattr(owner, "code_object"):
+                element.set("code_object", self.encodeValue(owner.code_object))
+            if hasattr(owner, "doc"):
+                element.set("doc", self.encodeValue(owner.doc))
+            if hasattr(owner, "parameters"):
+                if type(owner.parameters) is not ParameterSpec:
+                    raise TreePersistenceError("Parameters", owner)
+
+                element.set(
+                    "parameters", self.encodeValue(owner.parameters.getDetails())
+                )
+        else:
+            element.set("future_spec", self.encodeValue(owner.future_spec))
+
+        for key in _owner_state_attributes:
+            if hasattr(owner, key):
+                element.set(key, self.encodeValue(getattr(owner, key)))
+
+        if hasattr(owner, "uids"):
+            element.set("uids", self.encodeValue(owner.uids))
+
+        if hasattr(owner, "providing"):
+            element.set(
+                "providing",
+                self.encodeValue(
+                    [
+                        (variable_name, self.getVariableIndex(variable))
+                        for variable_name, variable in iterItems(owner.providing)
+                    ]
+                ),
+            )
+            element.set("variable_order", self.encodeValue(owner.variable_order))
+            element.set(
+                "temp_variables",
+                self.encodeValue(
+                    [
+                        (variable_name, self.getVariableIndex(variable))
+                        for variable_name, variable in iterItems(owner.temp_variables)
+                    ]
+                ),
+            )
+
+        if hasattr(owner, "taken"):
+            element.set(
+                "taken",
+                self.encodeValue(
+                    sorted(self.getVariableIndex(variable) for variable in owner.taken)
+                ),
+            )
+
+        if hasattr(owner, "qualname_provider"):
+            element.set("qualname_provider", self.encodeValue(owner.qualname_provider))
+
+        if owner.isCompiledPythonModule():
+            for variable in owner.getVariables():
+                self.getVariableIndex(variable)
+
+        locals_dict_name = _getLocalsDictName(owner)
+
+        if locals_dict_name is not None:
+            locals_scope = getLocalsDictHandles().get(locals_dict_name)
+
+            # Propagated locals dicts are removed after optimization.
+            if locals_scope is None:
+                element.set("locals_removed", "1")
+            else:
+                if getattr(locals_scope, "escaped", False):
+                    element.set("locals_escaped", "1")
+
+                for variable in locals_scope.variables.values():
+                    self.getVariableIndex(variable)
+
+        return element
+
+    def makeVariableElement(self, variable):
+        element = TreeXML.Element(
+            "variable",
+            kind=variable.__class__.__name__,
+            name=self.encodeValue(variable.getName()),
+            version=str(variable.version_number),
+        )
+
+        if variable.isLocalsDictVariable():
+            element.set("owner", self.encodeValue(variable.getOwner()))
+        else:
+            element.set("owner", str(self.owner_indexes[variable.getOwner()]))
+
+        if variable.shared_users:
+            element.set("shared_users", "1")
+        if variable.shared_scopes:
+            element.set("shared_scopes", "1")
+
+        return element
+
+    def makeCodeObjectElement(self, code_object):
+        element = TreeXML.Element(
+            "code_object", future_spec=self.encodeValue(code_object.getFutureSpec())
+        )
+
+        for key, value in iterItems(code_object.getDetails()):
+            if key != "code_flags":
+                element.set(key, self.encodeValue(value))
+
+        return element
+
+    def makeFutureSpecElement(self, future_spec):
+        return TreeXML.Element(
+            "future_spec",
+            values=self.encodeValue(
+                dict((key, getattr(future_spec, key)) for key in FutureSpec.__slots__)
+            ),
+        )
+
+    def makeModuleElement(self):
+        module = self.module
+
+        result = TreeXML.Element("module_tree", name=module.getFullName())
+
+        body = self.makeNodeElement(module)
+
+        functions = TreeXML.Element("functions")
+        for function_body in module.getFunctions():
+            functions.append(self.makeNodeElement(function_body))
+
+        # Owner state refers to further owners and variables, until all are
+        # found.
+        owners = TreeXML.Element("owners")
+        count = 0
+        while count < len(self.owners):
+            owners.append(self.makeOwnerElement(self.owners[count]))
+            count += 1
+
+        variables = TreeXML.Element("variables")
+        for variable in self.variables:
+            variables.append(self.makeVariableElement(variable))
+
+        code_objects = TreeXML.Element("code_objects")
+        for code_object in self.code_objects:
+            code_objects.append(self.makeCodeObjectElement(code_object))
+
+        future_specs = TreeXML.Element("future_specs")
+        for future_spec in self.future_specs:
+            future_specs.append(self.makeFutureSpecElement(future_spec))
+
+        result.set("node_modules", self.encodeValue(sorted(self.node_modules)))
+
+        for element in (future_specs, code_objects, owners, variables, body, functions):
+            result.append(element)
+
+        return result
+
+
+class _TreeRestorer(object):
+    def __init__(self, module):
+        self.module = module
+        self.filename = module.getSourceReference().getFilename()
+
+        self.owners = []
+        self.variables = []
+        self.code_objects = []
+        self.future_specs = []
+
+        self.source_refs = {}
+
+    def decodeValue(self, value):
+        # Many cases, pylint: disable=too-many-return-statements
+        code, value = value[0], value[1:]
+
+        if code == "s":
+            return value
+        elif code == "c":
+            return marshal.loads(_decodeData(value))
+        elif code == "v":
+            return self.variables[int(value)]
+        elif code == "o":
+            return self.owners[int(value)]
+        elif code == "h":
+            return getInternalHelperFromGetterName(value)
+        elif code == "k":
+            return self.code_objects[int(value)]
+        elif code == "f":
+            return self.future_specs[int(value)]
+        elif code == "l":
+            return getLocalsDictHandle(value)
+        elif code == "p":
+            return _unpickleValue(_decodeData(value))
+        else:
+            raise TreePersistenceError("Illegal value code", code)
+
+    def getSourceReference(self, element, prefix):
+        if prefix + "filename" in element.attrib:
+            filename = self.decodeValue(element.attrib[prefix + "filename"])
+        else:
+            filename = self.filename
+
+        line = int(element.attrib[prefix + "line"])
+        column = element.attrib.get(prefix + "column")
+        if column is not None:
+            column = int(column)
+        internal = prefix + "internal" in element.attrib
+
+        key = filename, line, column, internal
+
+        if key not in self.source_refs:
+            if internal:
+                source_ref = SourceCodeReferenceInternal.fromFilenameAndLine(
+                    filename=filename, line=line
+                )
+            else:
+                source_ref = SourceCodeReference.fromFilenameAndLine(
+                    filename=filename, line=line
+                )
+
+            source_ref.column = column
+
+            self.source_refs[key] = source_ref
+
+        return self.source_refs[key]
+
+    def restoreFutureSpec(self, element):
+        result = FutureSpec()
+
+        for key, value in iterItems(self.decodeValue(element.attrib["values"])):
+            setattr(result, key, value)
+
+        return result
+
+    def restoreCodeObject(self, element):
+        args = dict(
+            (key, self.decodeValue(value)) for key, value in iterItems(element.attrib)
+        )
+
+        return CodeObjectSpec(**args)
+
+    def restoreOwner(self, element):
+        kind = element.attrib["kind"]
+
+        if int(element.attrib["index"]) == 0:
+            if kind != self.module.__class__.__name__:
+                raise TreePersistenceError("Module kind", kind)
+
+            self.module.future_spec = self.decodeValue(element.attrib["future_spec"])
+            self.owners.append(self.module)
+
+            return
+
+        owner_class = getNodeClassFromKind(kind)
+
+        provider = self.decodeValue(element.attrib["provider"])
+        name = self.decodeValue(element.attrib["name"])
+        source_ref = self.getSourceReference(element, "")
+
+        flags = None
+        if "flags" in element.attrib:
+            flags = self.decodeValue(element.attrib["flags"])
+
+        # Entry points determine their code name when created, make sure they
+        # get the same one as before.
+        code_name = None
+        if "code_name" in element.attrib:
+            code_name = self.decodeValue(element.attrib["code_name"])
+
+        if code_name is not None:
+            entry_point = provider.getEntryPoint()
+
+            prefix = entry_point.getCodeName() + "$$$"
+
+            match = _code_name_uid_re.match(code_name, len(prefix))
+            if not code_name.startswith(prefix) or match is None:
+                raise TreePersistenceError("Code name", code_name)
+
+            entry_point.uids[owner_class.kind] = int(match.group(1)) - 1
+
+        if owner_class.kind == "EXPRESSION_FUNCTION_BODY":
+            result = owner_class(
+                provider=provider,
+                name=name,
+                code_object=self.decodeValue(element.attrib["code_object"]),
+                doc=self.decodeValue(element.attrib["doc"]),
+                parameters=ParameterSpec(
+                    **self.decodeValue(element.attrib["parameters"])
+                ),
+                flags=flags or set(),
+                source_ref=source_ref,
+            )
+        elif owner_class.kind in (
+            "EXPRESSION_GENERATOR_OBJECT_BODY",
+            "EXPRESSION_COROUTINE_OBJECT_BODY",
+            "EXPRESSION_ASYNCGEN_OBJECT_BODY",
+        ):
+            result = owner_class(
+                provider=provider,
+                name=name,
+                code_object=self.decodeValue(element.attrib["code_object"]),
+                flags=flags or set(),
+                source_ref=source_ref,
+            )
+        elif owner_class.kind == "EXPRESSION_CLASS_BODY":
+            result = owner_class(
+                provider=provider,
+                name=name,
+                doc=self.decodeValue(element.attrib["doc"]),
+                source_ref=source_ref,
+            )
+        elif owner_class.kind in (
+            "EXPRESSION_OUTLINE_FUNCTION",
+            "EXPRESSION_OUTLINE_BODY",
+        ):
+            result = owner_class(provider=provider, name=name, source_ref=source_ref)
+        else:
+            raise TreePersistenceError("Owner kind", kind)
+
+        # Registered first, so a failure removes its locals dict too.
+        self.owners.append(result)
+
+        if code_name is not None:
+            if result.code_name is None:
+                result.code_name = code_name
+            elif result.code_name != code_name:
+                raise TreePersistenceError("Code name", code_name)
+
+    def restoreVariable(self, element):
+        kind = element.attrib["kind"]
+        variable_name = self.decodeValue(element.attrib["name"])
+
+        if kind == "LocalsDictVariable":
+            locals_scope = self.decodeValue(element.attrib["owner"])
+
+            return locals_scope.getLocalsDictVariable(variable_name)
+
+        owner = self.owners[int(element.attrib["owner"])]
+
+        if kind == "ParameterVariable":
+            for variable in owner.getParameters().getAllVariables():
+                if variable.getName() == variable_name:
+                    return variable
+
+            raise TreePersistenceError("Parameter variable", variable_name)
+        elif kind == "ModuleVariable":
+            if owner is not self.module:
+                raise TreePersistenceError("Module variable", variable_name)
+
+            result = Variables.ModuleVariable(module=owner, variable_name=variable_name)
+            owner.variables[variable_name] = result
+
+            return result
+        elif kind == "LocalVariable":
+            return Variables.LocalVariable(owner=owner, variable_name=variable_name)
+        elif kind == "TempVariable":
+            return Variables.TempVariable(owner=owner, variable_name=variable_name)
+        else:
+            raise TreePersistenceError("Variable kind", kind)
+
+    def restoreOwnerState(self, owner, element):
+        for key in _owner_state_attributes:
+            if key in element.attrib:
+                value = self.decodeValue(element.attrib[key])
+
+                # Marshal has no difference between lists and tuples.
+                if key == "non_local_declarations":
+                    value = type(getattr(owner, key))(value)
+
+                setattr(owner, key, value)
+
+        if "providing" in element.attrib:
+            owner.providing = dict(
+                (variable_name, self.variables[index])
+                for variable_name, index in self.decodeValue(
+                    element.attrib["providing"]
+                )
+            )
+            owner.variable_order = list(
+                self.decodeValue(element.attrib["variable_order"])
+            )
+            owner.temp_variables = dict(
+                (variable_name, self.variables[index])
+                for variable_name, index in self.decodeValue(
+                    element.attrib["temp_variables"]
+                )
+            )
+
+        if "taken" in element.attrib:
+            owner.taken = set(
+                self.variables[index]
+                for index in self.decodeValue(element.attrib["taken"])
+            )
+
+        if "qualname_provider" in element.attrib:
+            owner.qualname_provider = self.decodeValue(
+                element.attrib["qualname_provider"]
+            )
+
+        locals_dict_name = _getLocalsDictName(owner)
+
+        if "locals_escaped" in element.attrib:
+            getLocalsDictHandle(locals_dict_name).markAsEscaped()
+
+    def restoreLoopState(self, loop_node, value):
+        loop_variables_complete, loop_state = _unpickleValue(_decodeData(value))
+
+        loop_node.loop_variables_complete = loop_variables_complete
+        loop_node.loop_variables = {}
+        loop_node.loop_memory = {}
+
+        for variable_index, shapes, memory in loop_state:
+            variable = self.variables[variable_index]
+
+            loop_node.loop_variables[variable] = shapes
+            loop_node.loop_memory[variable] = memory
+
+    def restoreNode(self, element):
+        children = {}
+
+        for role in element:
+            role_type = role.attrib.get("type")
+
+            if role_type == "none":
+                value = None
+            elif role_type == "list":
+                value = tuple(self.restoreNode(child) for child in role)
+            else:
+                (child,) = role
+                value = self.restoreNode(child)
+
+            children[role.attrib["name"]] = value
+
+        if "owner" in element.attrib:
+            result = self.owners[int(element.attrib["owner"])]
+
+            for name, value in iterItems(children):
+                result.setChild(name, value)
+
+            return result
+
+        kind = element.attrib["kind"]
+
+        args = {}
+        for key, value in iterItems(element.attrib):
+            if key not in _node_attributes and key not in _node_state_attributes:
+                args[key] = self.decodeValue(value)
+
+        late_children = {}
+        argument_names = _child_argument_names.get(kind, {})
+
+        for name, value in iterItems(children):
+            argument_name = argument_names.get(name, name)
+
+            if argument_name is None:
+                late_children[name] = value
+            else:
+                args[argument_name] = value
+
+        result = getNodeClassFromKind(kind)(
+            source_ref=self.getSourceReference(element, ""), **args
+        )
+
+        for name, value in iterItems(late_children):
+            result.setChild(name, value)
+
+        for key in _node_state_attributes:
+            if key in element.attrib:
+                setattr(result, key, self.decodeValue(element.attrib[key]))
+
+        if "loop_state" in element.attrib:
+            self.restoreLoopState(result, element.attrib["loop_state"])
+
+        if "compat_line" in element.attrib:
+            compat_source_ref = result.getSourceReference().atLineNumber(
+                int(element.attrib["compat_line"])
+            )
+
+            if "compat_column" in element.attrib:
+                compat_source_ref = compat_source_ref.atColumnNumber(
+                    int(element.attrib["compat_column"])
+                )
+
+            result.setCompatibleSourceReference(compat_source_ref)
+
+        return result
+
+    def restore(self, root):
+        (future_specs, code_objects, owners, variables, body, functions) = root
+
+        if root.attrib["name"] != self.module.getFullName():
+            raise TreePersistenceError("Module name", root.attrib["name"])
+
+        # Node classes are found by name, which requires their modules to be
+        # loaded, some are only used by optimization.
+        for module_name in self.decodeValue(root.attrib["node_modules"]):
+            __import__(module_name)
+
+        for element in future_specs:
+            self.future_specs.append(self.restoreFutureSpec(element))
+
+        for element in code_objects:
+            self.code_objects.append(self.restoreCodeObject(element))
+
+        for element in owners:
+            self.restoreOwner(element)
+
+        for element in variables:
+            self.variables.append(self.restoreVariable(element))
+
+        for owner, element in zip(self.owners, owners):
+            self.restoreOwnerState(owner, element)
+
+        module_body = self.restoreNode(body)
+        assert module_body is self.module
+
+        self.module.setFunctions(
+            tuple(self.restoreNode(element) for element in functions)
+        )
+
+        # Creating nodes may allocate variable versions and child UIDs, these
+        # must be like before, so new ones do not clash.
+        for variable, element in zip(self.variables, variables):
+            variable.version_number = int(element.attrib["version"])
+            variable.shared_users = "shared_users" in element.attrib
+            variable.shared_scopes = "shared_scopes" in element.attrib
+
+        for owner, element in zip(self.owners, owners):
+            if "uids" in element.attrib:
+                owner.uids = self.decodeValue(element.attrib["uids"])
+
+            if "locals_removed" in element.attrib:
+                locals_dict_handles = getLocalsDictHandles()
+                locals_dict_name = _getLocalsDictName(owner)
+
+                locals_dict_handles[locals_dict_name].finalize()
+                del locals_dict_handles[locals_dict_name]
+
+
+def _resetModuleTree(module, owners):
+    """ Make a module like before a failed restore, to be built from source. """
+
+    locals_dict_handles = getLocalsDictHandles()
+
+    for owner in owners:
+        locals_dict_name = _getLocalsDictName(owner)
+
+        if owner is not module and locals_dict_name in locals_dict_handles:
+            del locals_dict_handles[locals_dict_name]
+
+    # The module dictionary may have been marked as escaped.
+    del locals_dict_handles[module.module_dict_name]
+    setLocalsDictType(module.module_dict_name, "module_dict")
+
+    module.providing = {}
+    module.variable_order = []
+    module.temp_variables = {}
+    module.temp_scopes = {}
+    module.preserver_id = 0
+    module.uids = {}
+    module.variables = {}
+    module.future_spec = None
+    module.needs_annotations_dict = False
+
+    if module.getBody() is not None:
+        module.setChild("body", None)
+    module.setFunctions(())
+
+
+def getModuleTreeXML(module):
+    """ Get the XML text for a compiled module tree.
+
+    Args:
+        module: the compiled module node, with all functions
+    Returns:
+        XML text, to be given to "restoreModuleTreeFromXML"
+    Notes:
+        Raises "TreePersistenceError" for trees that cannot be persisted.
+    """
+
+    writer = _TreeWriter(module)
+
+    return TreeXML.toString(writer.makeModuleElement())
+
+
+def restoreModuleTreeFromXML(module, text):
+    """ Restore the tree of a compiled module from XML text.
+
+    Args:
+        module: a compiled module node, without a body yet
+        text: XML text, as made by "getModuleTreeXML"
+    Notes:
+        Raises "TreePersistenceError" for unusable texts, but as with
+        corrupt files, other exceptions are possible too. The module is
+        then reset, to be built from source.
+    """
+
+    restorer = _TreeRestorer(module)
+
+    try:
+        restorer.restore(TreeXML.fromString(text))
+    except BaseException:
+        _resetModuleTree(module, restorer.owners)
+
+        raise
@@ -0,0 +1,406 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Reading dependency information from ELF files.
+
+For standalone mode on Linux, we need to know the shared libraries used by
+extension modules and other shared libraries. Asking "ldd" means to start a
+process per file, which in turn loads the library, which is slow for large
+numbers of them. Instead, we read the dynamic section of the ELF file here,
+and resolve the "DT_NEEDED" entries like "ld.so" would do.
+
+"""
+
+import glob
+import os
+import struct
+
+from nuitka.PythonVersions import python_version
+
+# ELF identification values.
+_ELF_MAGIC = b"\x7fELF"
+_ELFCLASS32 = 1
+_ELFCLASS64 = 2
+_ELFDATA2LSB = 1
+_ELFDATA2MSB = 2
+
+# Program header types.
+_PT_LOAD = 1
+_PT_DYNAMIC = 2
+
+# Dynamic section tags.
+_DT_NULL = 0
+_DT_NEEDED = 1
+_DT_STRTAB = 5
+_DT_STRSZ = 10
+_DT_RPATH = 15
+_DT_RUNPATH = 29
+
+
+class ElfFileInfo(object):
+    """ Dependency relevant information of one ELF file. """
+
+    __slots__ = ("machine", "needed", "rpath", "runpath")
+
+    def __init__(self, machine, needed, rpath, runpath):
+        # Class, byte order, and machine, libraries must match these to be
+        # usable for a loading ELF file.
+        self.machine = machine
+
+        # Library names from "DT_NEEDED" in order of appearance.
+        self.needed = needed
+
+        # Search paths, unexpanded, None if not present.
+        self.rpath = rpath
+        self.runpath = runpath
+
+
+def _decodeElfString(value):
+    if python_version >= 300:
+        return value.decode("utf-8")
+    else:
+        return value
+
+
+def _readElfFileInfo(filename):
+    # Plain binary format parsing, pylint: disable=too-many-locals
+
+    with open(filename, "rb") as elf_file:
+        ident = elf_file.read(16)
+
+        if len(ident) != 16 or ident[:4] != _ELF_MAGIC:
+            return None
+
+        elf_class, elf_data = bytearray(ident[4:6])
+
+        if elf_data == _ELFDATA2LSB:
+            endian = "<"
+        elif elf_data == _ELFDATA2MSB:
+            endian = ">"
+        else:
+            return None
+
+        if elf_class == _ELFCLASS64:
+            header_format = endian + "HHIQQQIHHHHHH"
+            program_header_format = endian + "IIQQQQQQ"
+            dynamic_format = endian + "qQ"
+        elif elf_class == _ELFCLASS32:
+            header_format = endian + "HHIIIIIHHHHHH"
+            program_header_format = endian + "IIIIIIII"
+            dynamic_format = endian + "iI"
+        else:
+            return None
+
+        header = elf_file.read(struct.calcsize(header_format))
+        if len(header) != struct.calcsize(header_format):
+            return None
+
+        header = struct.unpack(header_format, header)
+        machine = header[1]
+        program_header_offset = header[4]
+        program_header_size = header[8]
+        program_header_count = header[9]
+
+        loads = []
+        dynamic = None
+
+        for count in range(program_header_count):
+            elf_file.seek(program_header_offset + count * program_header_size)
+            program_header = elf_file.read(struct.calcsize(program_header_format))
+
+            if len(program_header) != struct.calcsize(program_header_format):
+                return None
+
+            program_header = struct.unpack(program_header_format, program_header)
+
+            # The field order differs between 32 and 64 bits.
+            if elf_class == _ELFCLASS64:
+                p_type, _p_flags, p_offset, p_vaddr, _p_paddr, p_filesz = program_header[
+                    :6
+                ]
+            else:
+                p_type, p_offset, p_vaddr, _p_paddr, p_filesz = program_header[:5]
+
+            if p_type == _PT_LOAD:
+                loads.append((p_vaddr, p_filesz, p_offset))
+            elif p_type == _PT_DYNAMIC:
+                dynamic = p_offset, p_filesz
+
+        machine = (elf_class, elf_data, machine)
+
+        # Statically linked, nothing to load then.
+        if dynamic is None:
+            return ElfFileInfo(machine=machine, needed=(), rpath=None, runpath=None)
+
+        elf_file.seek(dynamic[0])
+        dynamic_data = elf_file.read(dynamic[1])
+
+        entries = []
+        entry_size = struct.calcsize(dynamic_format)
+
+        for offset in range(0, len(dynamic_data) - entry_size + 1, entry_size):
+            tag, value = struct.unpack_from(dynamic_format, dynamic_data, offset)
+
+            if tag == _DT_NULL:
+                break
+
+            entries.append((tag, value))
+
+        entries_dict = dict(entries)
+
+        if _DT_STRTAB not in entries_dict:
+            return None
+
+        # The string table is given as a virtual address, translate it to the
+        # file offset of the segment loading it.
+        string_table_address = entries_dict[_DT_STRTAB]
+
+        for p_vaddr, p_filesz, p_offset in loads:
+            if p_vaddr <= string_table_address < p_vaddr + p_filesz:
+                string_table_offset = string_table_address - p_vaddr + p_offset
+                break
+        else:
+            return None
+
+        elf_file.seek(string_table_offset)
+        string_table = elf_file.read(entries_dict.get(_DT_STRSZ, 65536))
+
+    def getString(offset):
+        end = string_table.find(b"\0", offset)
+
+        if end == -1:
+            end = len(string_table)
+
+        return _decodeElfString(string_table[offset:end])
+
+    needed = tuple(getString(value) for tag, value in entries if tag == _DT_NEEDED)
+
+    rpath = entries_dict.get(_DT_RPATH)
+    if rpath is not None:
+        rpath = getString(rpath)
+
+    runpath = entries_dict.get(_DT_RUNPATH)
+    if runpath is not None:
+        runpath = getString(runpath)
+
+    return ElfFileInfo(machine=machine, needed=needed, rpath=rpath, runpath=runpath)
+
+
+# Cache of file information, keyed by real path, size, and modification time,
+# so symbolic links to the same library are only parsed once.
+_elf_info_cache = {}
+
+
+def getElfFileInfo(filename):
+    """ Get the dependency information of an ELF file.
+
+    Args:
+        filename: path of the file to read
+
+    Returns:
+        ElfFileInfo object or None, if the file is not a valid ELF file.
+    """
+    filename = os.path.realpath(filename)
+
+    try:
+        stat_result = os.stat(filename)
+    except OSError:
+        return None
+
+    key = filename, stat_result.st_size, stat_result.st_mtime
+
+    if key not in _elf_info_cache:
+        try:
+            _elf_info_cache[key] = _readElfFileInfo(filename)
+        except (struct.error, IOError, OSError):
+            _elf_info_cache[key] = None
+
+    return _elf_info_cache[key]
+
+
+def _getMachine(filename):
+    # Only the header is needed to check compatibility, avoid hashing
+    # candidates that will not be used anyway.
+    try:
+        with open(filename, "rb") as elf_file:
+            ident = elf_file.read(20)
+    except (IOError, OSError):
+        return None
+
+    if len(ident) != 20 or ident[:4] != _ELF_MAGIC:
+        return None
+
+    elf_class, elf_data = bytearray(ident[4:6])
+    (machine,) = struct.unpack("<H" if elf_data == _ELFDATA2LSB else ">H", ident[18:20])
+
+    return elf_class, elf_data, machine
+
+
+def _parseLdSoConf(filename, result):
+    try:
+        with open(filename) as conf_file:
+            lines = conf_file.readlines()
+    except (IOError, OSError):
+        return
+
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+
+        if not line:
+            continue
+
+        if line.startswith("include"):
+            pattern = line.split(None, 1)[1]
+
+            if not os.path.isabs(pattern):
+                pattern = os.path.join(os.path.dirname(filename), pattern)
+
+            for include_filename in sorted(glob.glob(pattern)):
+                _parseLdSoConf(include_filename, result)
+        elif line.startswith("hwcap"):
+            continue
+        else:
+            result.extend(line.replace(",", " ").split())
+
+
+_ld_so_conf_paths = None
+
+
+def _getLdSoConfPaths():
+    # Singleton, pylint: disable=global-statement
+    global _ld_so_conf_paths
+
+    if _ld_so_conf_paths is None:
+        _ld_so_conf_paths = []
+        _parseLdSoConf("/etc/ld.so.conf", _ld_so_conf_paths)
+
+    return _ld_so_conf_paths
+
+
+def _getDefaultPaths(machine):
+    if machine[0] == _ELFCLASS64:
+        return ("/lib64", "/usr/lib64", "/lib", "/usr/lib")
+    else:
+        return ("/lib", "/usr/lib")
+
+
+def _expandSearchPath(search_path, origin):
+    result = []
+
+    for path in search_path.split(":"):
+        path = path.replace("${ORIGIN}", origin).replace("$ORIGIN", origin)
+
+        # Other dynamic string tokens, e.g. "$PLATFORM" are not supported,
+        # and empty elements mean the current directory.
+        if "$" in path or not path:
+            continue
+
+        result.append(path)
+
+    return result
+
+
+def _locateElfLibrary(name, machine, search_paths):
+    if "/" in name:
+        return os.path.abspath(name) if os.path.isfile(name) else None
+
+    for path in search_paths:
+        candidate = os.path.join(path, name)
+
+        # Libraries of other architectures, e.g. 32 bits ones in a 64 bits
+        # search path are skipped by "ld.so" as well.
+        if os.path.isfile(candidate) and _getMachine(candidate) == machine:
+            return os.path.normpath(candidate)
+
+    return None
+
+
+def getElfDependencies(filename, library_paths=()):
+    """ Get the shared libraries needed by an ELF file, transitively.
+
+    Args:
+        filename: path of the ELF file to investigate
+        library_paths: additional search paths, behaving like "LD_LIBRARY_PATH"
+
+    Returns:
+        List of library paths in order of discovery, or None, if the file
+        is not a valid ELF file and therefore cannot be handled here.
+
+    Notes:
+        This follows the search order of "ld.so" being "DT_RPATH" of the
+        loading objects (if not "DT_RUNPATH" is present), "LD_LIBRARY_PATH",
+        "DT_RUNPATH", "/etc/ld.so.conf" and the default paths. Libraries
+        that cannot be found are omitted, much like "ldd" does.
+    """
+    # Follows the loader algorithm, pylint: disable=too-many-locals
+
+    elf_info = getElfFileInfo(filename)
+
+    if elf_info is None:
+        return None
+
+    env_paths = [
+        path for path in os.environ.get("LD_LIBRARY_PATH", "").split(":") if path
+    ]
+    env_paths.extend(library_paths)
+
+    result = []
+    seen = set()
+
+    # Work list of files to resolve with the "DT_RPATH" values of their
+    # loaders inherited.
+    pending = [(os.path.abspath(filename), elf_info, ())]
+
+    while pending:
+        current_filename, current_info, inherited_rpaths = pending.pop(0)
+
+        origin = os.path.dirname(os.path.realpath(current_filename))
+
+        # The "DT_RPATH" of the loading chain applies, unless the file itself
+        # has "DT_RUNPATH", which is not inherited.
+        rpaths = inherited_rpaths
+        if current_info.rpath is not None and current_info.runpath is None:
+            rpaths = tuple(_expandSearchPath(current_info.rpath, origin)) + rpaths
+
+        if current_info.runpath is not None:
+            search_paths = env_paths + _expandSearchPath(current_info.runpath, origin)
+        else:
+            search_paths = list(rpaths) + env_paths
+
+        search_paths += _getLdSoConfPaths()
+        search_paths += _getDefaultPaths(current_info.machine)
+
+        for name in current_info.needed:
+            if name in seen:
+                continue
+
+            library_filename = _locateElfLibrary(
+                name=name, machine=current_info.machine, search_paths=search_paths
+            )
+
+            if library_filename is None:
+                continue
+
+            seen.add(name)
+            result.append(library_filename)
+
+            library_info = getElfFileInfo(library_filename)
+
+            if library_info is not None:
+                pending.append((library_filename, library_info, rpaths))
+
+    return result
@@ -0,0 +1,90 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Hashing utils for Nuitka.
+
+These are used to identify file contents and values for caching purposes,
+where a stable hash independent of paths and modification times is needed.
+"""
+
+import hashlib
+
+from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
+
+
+class Hash(object):
+    """ Incremental hash of values, to be used as cache keys. """
+
+    __slots__ = ("hash",)
+
+    def __init__(self):
+        self.hash = hashlib.md5()
+
+    def updateFromValues(self, *values):
+        for value in values:
+            if type(value) in (tuple, list):
+                self.updateFromValues(*value)
+            elif type(value) is bytes:
+                self.hash.update(value)
+            elif type(value) is unicode:
+                self.hash.update(value.encode("utf8"))
+            else:
+                self.hash.update(str(value).encode("utf8"))
+
+            # Separate the values, so adjacent values do not blend.
+            self.hash.update(b"\0")
+
+    def updateFromFile(self, filename):
+        with open(filename, "rb") as input_file:
+            while True:
+                chunk = input_file.read(65536)
+
+                if not chunk:
+                    break
+
+                self.hash.update(chunk)
+
+    def asHexDigest(self):
+        return self.hash.hexdigest()
+
+
+def getFileContentsHash(filename):
+    """ Hash of the contents of a file, independent of its name and time stamp.
+
+    Args:
+        filename: path of the file to hash
+    Returns:
+        hex digest string
+    """
+    result = Hash()
+    result.updateFromFile(filename)
+
+    return result.asHexDigest()
+
+
+def getValuesHash(*values):
+    """ Hash of a sequence of values, e.g. to be used as a cache key.
+
+    Args:
+        values: any values that have a stable string representation
+    Returns:
+        hex digest string
+    """
+    result = Hash()
+    result.updateFromValues(*values)
+
+    return result.asHexDigest()
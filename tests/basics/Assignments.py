@@ -253,6 +253,69 @@ def globalErrors():
         print("Del on unassigned global gives", repr(e))
 
 
+def displayUnpacking():
+    # Unpacking of tuples and lists made only for it, assigns the elements
+    # directly, this must preserve order of evaluation and errors.
+
+    def value(x):
+        print("Evaluating", x, end=' ')
+        return x
+
+    a, b, c = value(1), value(2), value(3)
+    print("-> unpacked tuple", a, b, c)
+
+    a, b, c = [value(4), value(5), value(6)]
+    print("-> unpacked list", a, b, c)
+
+    a, b, c = c, a, b
+    print("Rotated", a, b, c)
+
+    a, b = (7, 8)
+    print("Unpacked constant", a, b)
+
+    (a, b), c = (value(1), value(2)), value(3)
+    print("-> nested unpacking", a, b, c)
+
+    for x in range(3):
+        a, b = b, x
+    print("Unpacked in loop", a, b)
+
+    try:
+        a, b = value(1), value(2), value(3)
+    except ValueError as e:
+        print("-> too many values gives", repr(e))
+
+    try:
+        a, b, c = value(4), value(5)
+    except ValueError as e:
+        print("-> too few values gives", repr(e))
+
+    try:
+        a, b = 1, 2, 3
+    except ValueError as e:
+        print("Too many constant values gives", repr(e))
+
+    def raising(x):
+        raise ValueError(x)
+
+    a = b = c = None
+
+    try:
+        a, b, c = value(1), raising(2), value(3)
+    except ValueError as e:
+        print("-> raising element gives", repr(e), "with", a, b, c)
+
+    class Target(object):
+        def __setattr__(self, attr, value):
+            print("Assigning", attr, value, end=' ')
+
+            object.__setattr__(self, attr, value)
+
+    t = Target()
+    t.a, t.b = value(1), value(2)
+    print("-> attributes assigned", t.a, t.b)
+
+
 someFunction()
 varargsFunction(1,2,3,4)
 otherFunction()
@@ -264,3 +327,4 @@ optimizeableTargets()
 complexDel()
 sliceDel()
 globalErrors()
+displayUnpacking()
@@ -209,3 +209,22 @@ try:
 except Exception as e:
     print(repr(e))
 print(a, b, c)
+
+def starredDisplayUnpacking():
+    # Starred unpacking of tuples made only for it is not optimized away.
+    a, *b = 1, 2, 3
+    print("Starred unpacking of tuple", a, b)
+
+    x = 4
+    *a, b = [x, x + 1, x + 2]
+    print("Starred unpacking of list", a, b)
+
+    a, *b, c = x, x + 1
+    print("Starred unpacking with empty middle", a, b, c)
+
+    try:
+        a, *b, c = (x,)
+    except ValueError as e:
+        print("Starred unpacking with too few values gives", repr(e))
+
+starredDisplayUnpacking()
@@ -170,3 +170,43 @@ b = A('b',1)
 c = A('c',0)
 
 print(a < b < c)
+
+def inDisplayComparisons():
+    # The "in" against tuples and lists made only for it, compares the
+    # elements directly, this must preserve order and errors.
+
+    def value(x):
+        print("Evaluating", x, end=' ')
+        return x
+
+    print("-> in tuple", value(2) in (value(1), value(2), value(3)))
+    print("-> not in list", value(4) not in [value(1), value(2)])
+    print("-> in empty tuple", value(4) in ())
+
+    class EqualRaising(object):
+        def __eq__(self, other):
+            raise ValueError("from __eq__")
+
+    try:
+        print(EqualRaising() in (1, 2))
+    except ValueError as e:
+        print("In with raising __eq__ gives", repr(e))
+
+    try:
+        print(1 not in [EqualRaising(), 1])
+    except ValueError as e:
+        print("Not in with raising __eq__ gives", repr(e))
+
+    def raising(x):
+        raise ValueError(x)
+
+    try:
+        print(value(1) in (value(2), raising(3), value(4)))
+    except ValueError as e:
+        print("-> raising element gives", repr(e))
+
+    # Identity is checked first, for "nan" this matters.
+    nan = float("nan")
+    print("Nan in tuple", nan in (1, nan))
+
+inDisplayComparisons()
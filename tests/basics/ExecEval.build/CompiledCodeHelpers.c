@@ -0,0 +1 @@
+/root/package/nuitka/build/static_src/CompiledCodeHelpers.c
\ No newline at end of file
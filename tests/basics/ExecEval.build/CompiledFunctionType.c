@@ -0,0 +1 @@
+/root/package/nuitka/build/static_src/CompiledFunctionType.c
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/nuitka/build/static_src/CompiledGeneratorType.c
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/nuitka/build/static_src/CompiledMethodType.c
\ No newline at end of file
@@ -0,0 +1 @@
+/root/package/nuitka/build/static_src/MainProgram.c
\ No newline at end of file
@@ -0,0 +1,16582 @@
+/* Generated code for Python module '__main__'
+ * created by Nuitka version 0.6.4rc3
+ *
+ * This code is in part copyright 2019 Kay Hayen.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "nuitka/prelude.h"
+
+#include "__helpers.h"
+
+/* The "_module___main__" is a Python object pointer of module type.
+ *
+ * Note: For full compatibility with CPython, every module variable access
+ * needs to go through it except for cases where the module cannot possibly
+ * have changed in the mean time.
+ */
+
+PyObject *module___main__;
+PyDictObject *moduledict___main__;
+
+/* The declarations of module constants used, if any. */
+extern PyObject *const_int_0;
+extern PyObject *const_int_pos_1;
+static PyObject *const_int_pos_2;
+static PyObject *const_int_pos_3;
+static PyObject *const_int_pos_4;
+static PyObject *const_int_pos_7;
+static PyObject *const_int_pos_11;
+static PyObject *const_str_plain_0;
+static PyObject *const_str_plain_a;
+static PyObject *const_str_plain_d;
+static PyObject *const_str_plain_e;
+static PyObject *const_str_plain_f;
+static PyObject *const_str_plain_g;
+static PyObject *const_str_plain_l;
+static PyObject *const_str_plain_r;
+static PyObject *const_str_plain_s;
+static PyObject *const_str_plain_w;
+static PyObject *const_str_plain_x;
+static PyObject *const_str_plain_y;
+extern PyObject *const_tuple_empty;
+static PyObject *const_str_plain_f1;
+static PyObject *const_str_plain_os;
+static PyObject *const_str_plain_r1;
+static PyObject *const_str_plain_r2;
+static PyObject *const_str_plain_rU;
+static PyObject *const_str_plain_sys;
+static PyObject *const_str_plain_yes;
+static PyObject *const_str_plain_None;
+static PyObject *const_str_plain_code;
+static PyObject *const_str_plain_eval;
+static PyObject *const_str_plain_exec;
+static PyObject *const_str_plain_func;
+static PyObject *const_str_plain_keys;
+extern PyObject *const_str_plain_read;
+extern PyObject *const_str_plain_site;
+static PyObject *const_str_plain_False;
+static PyObject *const_str_plain_close;
+static PyObject *const_str_plain_space;
+static PyObject *const_str_plain_strip;
+static PyObject *const_str_plain_write;
+static PyObject *const_str_angle_module;
+static PyObject *const_str_angle_string;
+static PyObject *const_str_plain_append;
+extern PyObject *const_str_plain_locals;
+static PyObject *const_str_plain_result;
+static PyObject *const_str_plain_unlink;
+static PyObject *const_str_angle_genexpr;
+extern PyObject *const_str_plain___doc__;
+static PyObject *const_str_angle_execfile;
+extern PyObject *const_str_plain___file__;
+extern PyObject *const_str_plain___main__;
+static PyObject *const_str_plain_tempfile;
+static PyObject *const_list_int_pos_2_list;
+static PyObject *const_str_plain___debug__;
+extern PyObject *const_str_plain___module__;
+static PyObject *const_str_plain_gettempdir;
+static PyObject *const_str_plain_local_vars;
+static PyObject *const_str_plain_memoryview;
+static PyObject *const_str_plain_global_vars;
+static PyObject *const_str_plain_makeAddPair;
+static PyObject *const_tuple_int_pos_3_tuple;
+static PyObject *const_str_plain_closureMaker;
+static PyObject *const_str_plain_tmp_filename;
+static PyObject *const_str_plain_version_info;
+extern PyObject *const_str_plain___metaclass__;
+static PyObject *const_str_plain_classExecfile;
+static PyObject *const_str_plain_functionEval1;
+static PyObject *const_str_plain_functionEval2;
+static PyObject *const_str_plain_functionEval3;
+static PyObject *const_str_plain_functionExec1;
+static PyObject *const_str_plain_functionExec2;
+static PyObject *const_tuple_str_plain_e_tuple;
+static PyObject *const_tuple_str_plain_f_tuple;
+static PyObject *const_tuple_str_plain_x_tuple;
+static PyObject *const_str_plain_print_global_y;
+static PyObject *const_str_plain_functionExecfile;
+static PyObject *const_tuple_str_plain_code_tuple;
+static PyObject *const_str_plain_evalInContractions;
+static PyObject *const_str_plain_execWithShortTuple;
+static PyObject *const_str_plain_functionEvalNones2;
+static PyObject *const_str_plain_functionExecNonesTuple;
+static PyObject *const_str_plain_functionExecNonesSyntax;
+static PyObject *const_str_plain_functionExecNonesTuple2;
+static PyObject *const_str_plain_functionExecNonesSyntax2;
+static PyObject *const_str_plain_functionGlobalsExecShadow;
+static PyObject *const_str_plain_generatorFunctionWithExec;
+static PyObject *const_dict_1c8abfc1519cfeb18a5406f0d5baaf73;
+static PyObject *const_dict_d7a83763264779d47b24cb7ebf0196f6;
+static PyObject *const_tuple_anon_code_type_memoryview_tuple;
+static PyObject *const_tuple_int_0_int_pos_1_int_pos_2_tuple;
+static PyObject *const_tuple_str_plain_a_str_plain_code_tuple;
+static PyObject *const_tuple_str_plain_x_str_plain_result_tuple;
+static PyObject *const_tuple_str_plain_code_str_plain_func_tuple;
+static PyObject *const_str_plain_functionWithExecAffectingClosure;
+static PyObject *const_str_digest_005bb0ac160d91925b1aa21e45bfede6;
+static PyObject *const_str_digest_063096dcccc39cee036f3f5ca3b41511;
+static PyObject *const_str_digest_06b716c854966bbcdbe2a7410c2e122e;
+static PyObject *const_str_digest_07e08e7eef02f483d242b0eaf118d0dc;
+static PyObject *const_str_digest_08feb529f1c748683d0f13dbc46a6346;
+static PyObject *const_str_digest_0be97f8e6e49e9a9f5457ccd63ea1adf;
+static PyObject *const_str_digest_0d7bc3f4ef5ef0685b5d7756f85ee411;
+static PyObject *const_str_digest_0f903759b8d2feb65efa89cb4402b3d0;
+static PyObject *const_str_digest_18ea4f2e481b8a61def37aa874174772;
+static PyObject *const_str_digest_19fc81ddf40563cb1855b82f72d1d59d;
+static PyObject *const_str_digest_248f360acf257acb903ae3f061fe6af1;
+static PyObject *const_str_digest_2a9252df6c82849cccf77f84dd96b233;
+static PyObject *const_str_digest_34bcccce7b2d8347939d3a9a2695a1cf;
+static PyObject *const_str_digest_3953231f8e2d8a134eb31bf0fdb146c3;
+static PyObject *const_str_digest_40ff59c4788ff32b430bc257697c5065;
+static PyObject *const_str_digest_4b194deb8804510009fd513a06c46b46;
+static PyObject *const_str_digest_4b5228fbb1896df3babfd53af4450d91;
+static PyObject *const_str_digest_4cf7ee3772e58919b7d820508e63144e;
+static PyObject *const_str_digest_4e8ba78bb68185a62646568d766f622d;
+static PyObject *const_str_digest_5bb5a01d8bca65ab0d9326a38bbe95b2;
+static PyObject *const_str_digest_5e9d9241799e86d970c5dd9e1901ac08;
+static PyObject *const_str_digest_5efe39d911f5869252dcfb645fbe8550;
+static PyObject *const_str_digest_69b939c21a2c20fcfd3a18934d6a8e50;
+static PyObject *const_str_digest_6c6fbf32885e4c30e49c8654849ac269;
+static PyObject *const_str_digest_726a7d88c6429830552ff1ae931156e2;
+static PyObject *const_str_digest_7bfacfe8f3a4cd5d5fd933a434c95998;
+static PyObject *const_str_digest_7e0a7d659dbe48de213ffa2b3183b4c7;
+static PyObject *const_str_digest_811f03bba7485579dac319cd6f95d838;
+static PyObject *const_str_digest_82ce1947d3a8dc3eea8410b612114549;
+static PyObject *const_str_digest_85535d85183d9a6f37630a8c0602e20c;
+static PyObject *const_str_digest_86073439a5c284ad71bc88107637e387;
+static PyObject *const_str_digest_8784c77ba7bd531819aae6c5a91834a4;
+static PyObject *const_str_digest_88a4ea53be43a6b3910a00cacc390988;
+static PyObject *const_str_digest_8a9b3ade60b73fed3f891de8e6c7f61b;
+static PyObject *const_str_digest_8ff7185fd52c43b4e0cecc7952b817a4;
+static PyObject *const_str_digest_970ab3a0dd5be16ecd8310f2681b379c;
+static PyObject *const_str_digest_9bbcdd1ad6f075459737599dab381555;
+static PyObject *const_str_digest_a1f9a58c987b25e3e6bdaea6f6c92e28;
+static PyObject *const_str_digest_a36f41ad69eb85f0993cb010132f13d6;
+static PyObject *const_str_digest_abad8710825108b72fe08ee2e34b5ad7;
+static PyObject *const_str_digest_ac02ab0238280e341b2aff0eed15b128;
+static PyObject *const_str_digest_acea28d3c2899a6da4ce30c30a7d19b6;
+static PyObject *const_str_digest_ae4c4a545acbb0ad86ab60319f4015fe;
+static PyObject *const_str_digest_b005fb9fba2b19875ef69d94173f0be0;
+static PyObject *const_str_digest_b6fe7a4dee6abbb04f9a378b95c034fa;
+static PyObject *const_str_digest_b9c4baf879ebd882d40843df3a4dead7;
+static PyObject *const_str_digest_c017e7bf746e544289a8119779dc1659;
+static PyObject *const_str_digest_c416a96f64347d56a3ea7dd95e587796;
+static PyObject *const_str_digest_d0fc61e455af63ca5afa211bdd917659;
+static PyObject *const_str_digest_d3d5e86d5f22461305291a6ba678d9fc;
+static PyObject *const_str_digest_db79741939c6a7248bf2a0c07da13397;
+static PyObject *const_str_digest_dec5e302898faac76ce954c36c0c633a;
+static PyObject *const_str_digest_e01ca43dcaf5af281a38d385f25b2474;
+static PyObject *const_str_digest_e3a18846495adb68b811665d47ec5f40;
+static PyObject *const_str_digest_e4e0d34620c1d68d536f2ca8b42e4e1b;
+static PyObject *const_str_digest_e547a09269f65d4a3bb57ce1c1a2673f;
+static PyObject *const_str_digest_e8e47c167be7dfc6fd7f993359547b0f;
+static PyObject *const_str_digest_ef7aa81fa65c218307ec6cc37701dc66;
+static PyObject *const_str_digest_f0b555a714023c2b8122ef7241eb357d;
+static PyObject *const_str_digest_f687ea35b43f26d6209fbaa354137816;
+static PyObject *const_str_digest_fc25bd7cdf8db85f3ea4a0bfcaa8985f;
+static PyObject *const_str_digest_ff0a6018ba8f720c664541ccefa60fc8;
+static PyObject *const_str_plain_functionWithClosureProvidedByExec;
+static PyObject *const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple;
+static PyObject *const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple;
+static PyObject *const_tuple_bf0438733bb84e321aa8f0a1aba1a907_tuple;
+static PyObject *const_str_plain_execDefinesFunctionToLocalsExplicity;
+static PyObject *const_tuple_int_0_int_pos_1_int_pos_2_int_pos_3_tuple;
+static PyObject *const_tuple_str_plain_a_str_plain_r_str_plain_g_tuple;
+static PyObject *const_tuple_str_plain_y_str_plain_print_global_y_tuple;
+static PyObject *const_tuple_str_plain_s_str_plain_r1_str_plain_r2_tuple;
+static PyObject *const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple;
+static PyObject *const_tuple_str_digest_c416a96f64347d56a3ea7dd95e587796_tuple;
+static PyObject *const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple;
+static PyObject *const_tuple_str_digest_b9c4baf879ebd882d40843df3a4dead7_str_plain_s_tuple;
+static PyObject *module_filename_obj;
+
+/* Indicator if this modules private constants were created yet. */
+static bool constants_created = false;
+
+/* Function to create shared constants used by this module, unless some other
+ * module already did. */
+extern void createSharedConstants___main__( void );
+
+/* Function to create module private constants. */
+static void createModuleConstants( void )
+{
+    createSharedConstants___main__();
+
+    const_int_pos_2 = PyInt_FromLong( 2l );
+    const_int_pos_3 = PyInt_FromLong( 3l );
+    const_int_pos_4 = PyInt_FromLong( 4l );
+    const_int_pos_7 = PyInt_FromLong( 7l );
+    const_int_pos_11 = PyInt_FromLong( 11l );
+    const_str_plain_0 = UNSTREAM_CHAR( 48, 0 );
+    const_str_plain_a = UNSTREAM_CHAR( 97, 1 );
+    const_str_plain_d = UNSTREAM_CHAR( 100, 1 );
+    const_str_plain_e = UNSTREAM_CHAR( 101, 1 );
+    const_str_plain_f = UNSTREAM_CHAR( 102, 1 );
+    const_str_plain_g = UNSTREAM_CHAR( 103, 1 );
+    const_str_plain_l = UNSTREAM_CHAR( 108, 1 );
+    const_str_plain_r = UNSTREAM_CHAR( 114, 1 );
+    const_str_plain_s = UNSTREAM_CHAR( 115, 1 );
+    const_str_plain_w = UNSTREAM_CHAR( 119, 1 );
+    const_str_plain_x = UNSTREAM_CHAR( 120, 1 );
+    const_str_plain_y = UNSTREAM_CHAR( 121, 1 );
+    const_str_plain_f1 = UNSTREAM_STRING( &constant_bin[ 0 ], 2, 1 );
+    const_str_plain_os = UNSTREAM_STRING( &constant_bin[ 2 ], 2, 1 );
+    const_str_plain_r1 = UNSTREAM_STRING( &constant_bin[ 4 ], 2, 1 );
+    const_str_plain_r2 = UNSTREAM_STRING( &constant_bin[ 6 ], 2, 1 );
+    const_str_plain_rU = UNSTREAM_STRING( &constant_bin[ 8 ], 2, 1 );
+    const_str_plain_sys = UNSTREAM_STRING( &constant_bin[ 10 ], 3, 1 );
+    const_str_plain_yes = UNSTREAM_STRING( &constant_bin[ 13 ], 3, 1 );
+    const_str_plain_None = UNSTREAM_STRING( &constant_bin[ 16 ], 4, 1 );
+    const_str_plain_code = UNSTREAM_STRING( &constant_bin[ 20 ], 4, 1 );
+    const_str_plain_eval = UNSTREAM_STRING( &constant_bin[ 24 ], 4, 1 );
+    const_str_plain_exec = UNSTREAM_STRING( &constant_bin[ 28 ], 4, 1 );
+    const_str_plain_func = UNSTREAM_STRING( &constant_bin[ 32 ], 4, 1 );
+    const_str_plain_keys = UNSTREAM_STRING( &constant_bin[ 36 ], 4, 1 );
+    const_str_plain_False = UNSTREAM_STRING( &constant_bin[ 40 ], 5, 1 );
+    const_str_plain_close = UNSTREAM_STRING( &constant_bin[ 45 ], 5, 1 );
+    const_str_plain_space = UNSTREAM_STRING( &constant_bin[ 50 ], 5, 1 );
+    const_str_plain_strip = UNSTREAM_STRING( &constant_bin[ 55 ], 5, 1 );
+    const_str_plain_write = UNSTREAM_STRING( &constant_bin[ 60 ], 5, 1 );
+    const_str_angle_module = UNSTREAM_STRING( &constant_bin[ 65 ], 8, 0 );
+    const_str_angle_string = UNSTREAM_STRING( &constant_bin[ 73 ], 8, 0 );
+    const_str_plain_append = UNSTREAM_STRING( &constant_bin[ 81 ], 6, 1 );
+    const_str_plain_result = UNSTREAM_STRING( &constant_bin[ 87 ], 6, 1 );
+    const_str_plain_unlink = UNSTREAM_STRING( &constant_bin[ 93 ], 6, 1 );
+    const_str_angle_genexpr = UNSTREAM_STRING( &constant_bin[ 99 ], 9, 0 );
+    const_str_angle_execfile = UNSTREAM_STRING( &constant_bin[ 108 ], 10, 0 );
+    const_str_plain_tempfile = UNSTREAM_STRING( &constant_bin[ 118 ], 8, 1 );
+    const_list_int_pos_2_list = PyList_New( 1 );
+    PyList_SET_ITEM( const_list_int_pos_2_list, 0, const_int_pos_2 ); Py_INCREF( const_int_pos_2 );
+    const_str_plain___debug__ = UNSTREAM_STRING( &constant_bin[ 126 ], 9, 1 );
+    const_str_plain_gettempdir = UNSTREAM_STRING( &constant_bin[ 135 ], 10, 1 );
+    const_str_plain_local_vars = UNSTREAM_STRING( &constant_bin[ 145 ], 10, 1 );
+    const_str_plain_memoryview = UNSTREAM_STRING( &constant_bin[ 155 ], 10, 1 );
+    const_str_plain_global_vars = UNSTREAM_STRING( &constant_bin[ 165 ], 11, 1 );
+    const_str_plain_makeAddPair = UNSTREAM_STRING( &constant_bin[ 176 ], 11, 1 );
+    const_tuple_int_pos_3_tuple = PyTuple_New( 1 );
+    PyTuple_SET_ITEM( const_tuple_int_pos_3_tuple, 0, const_int_pos_3 ); Py_INCREF( const_int_pos_3 );
+    const_str_plain_closureMaker = UNSTREAM_STRING( &constant_bin[ 187 ], 12, 1 );
+    const_str_plain_tmp_filename = UNSTREAM_STRING( &constant_bin[ 199 ], 12, 1 );
+    const_str_plain_version_info = UNSTREAM_STRING( &constant_bin[ 211 ], 12, 1 );
+    const_str_plain_classExecfile = UNSTREAM_STRING( &constant_bin[ 223 ], 13, 1 );
+    const_str_plain_functionEval1 = UNSTREAM_STRING( &constant_bin[ 236 ], 13, 1 );
+    const_str_plain_functionEval2 = UNSTREAM_STRING( &constant_bin[ 249 ], 13, 1 );
+    const_str_plain_functionEval3 = UNSTREAM_STRING( &constant_bin[ 262 ], 13, 1 );
+    const_str_plain_functionExec1 = UNSTREAM_STRING( &constant_bin[ 275 ], 13, 1 );
+    const_str_plain_functionExec2 = UNSTREAM_STRING( &constant_bin[ 288 ], 13, 1 );
+    const_tuple_str_plain_e_tuple = PyTuple_New( 1 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_e_tuple, 0, const_str_plain_e ); Py_INCREF( const_str_plain_e );
+    const_tuple_str_plain_f_tuple = PyTuple_New( 1 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_f_tuple, 0, const_str_plain_f ); Py_INCREF( const_str_plain_f );
+    const_tuple_str_plain_x_tuple = PyTuple_New( 1 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_x_tuple, 0, const_str_plain_x ); Py_INCREF( const_str_plain_x );
+    const_str_plain_print_global_y = UNSTREAM_STRING( &constant_bin[ 301 ], 14, 1 );
+    const_str_plain_functionExecfile = UNSTREAM_STRING( &constant_bin[ 315 ], 16, 1 );
+    const_tuple_str_plain_code_tuple = PyTuple_New( 1 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_code_tuple, 0, const_str_plain_code ); Py_INCREF( const_str_plain_code );
+    const_str_plain_evalInContractions = UNSTREAM_STRING( &constant_bin[ 331 ], 18, 1 );
+    const_str_plain_execWithShortTuple = UNSTREAM_STRING( &constant_bin[ 349 ], 18, 1 );
+    const_str_plain_functionEvalNones2 = UNSTREAM_STRING( &constant_bin[ 367 ], 18, 1 );
+    const_str_plain_functionExecNonesTuple = UNSTREAM_STRING( &constant_bin[ 385 ], 22, 1 );
+    const_str_plain_functionExecNonesSyntax = UNSTREAM_STRING( &constant_bin[ 407 ], 23, 1 );
+    const_str_plain_functionExecNonesTuple2 = UNSTREAM_STRING( &constant_bin[ 430 ], 23, 1 );
+    const_str_plain_functionExecNonesSyntax2 = UNSTREAM_STRING( &constant_bin[ 453 ], 24, 1 );
+    const_str_plain_functionGlobalsExecShadow = UNSTREAM_STRING( &constant_bin[ 477 ], 25, 1 );
+    const_str_plain_generatorFunctionWithExec = UNSTREAM_STRING( &constant_bin[ 502 ], 25, 1 );
+    const_dict_1c8abfc1519cfeb18a5406f0d5baaf73 = _PyDict_NewPresized( 4 );
+    PyDict_SetItem( const_dict_1c8abfc1519cfeb18a5406f0d5baaf73, const_str_plain_code, const_str_plain_f );
+    PyDict_SetItem( const_dict_1c8abfc1519cfeb18a5406f0d5baaf73, const_str_plain_l, Py_None );
+    PyDict_SetItem( const_dict_1c8abfc1519cfeb18a5406f0d5baaf73, const_str_plain_g, Py_None );
+    PyDict_SetItem( const_dict_1c8abfc1519cfeb18a5406f0d5baaf73, const_str_plain_f, const_int_pos_11 );
+    assert( PyDict_Size( const_dict_1c8abfc1519cfeb18a5406f0d5baaf73 ) == 4 );
+    const_dict_d7a83763264779d47b24cb7ebf0196f6 = _PyDict_NewPresized( 2 );
+    PyDict_SetItem( const_dict_d7a83763264779d47b24cb7ebf0196f6, const_str_plain_e, const_str_plain_0 );
+    PyDict_SetItem( const_dict_d7a83763264779d47b24cb7ebf0196f6, const_str_plain_f, const_int_0 );
+    assert( PyDict_Size( const_dict_d7a83763264779d47b24cb7ebf0196f6 ) == 2 );
+    const_tuple_anon_code_type_memoryview_tuple = PyTuple_New( 2 );
+    PyTuple_SET_ITEM( const_tuple_anon_code_type_memoryview_tuple, 0, (PyObject *)&PyCode_Type ); Py_INCREF( (PyObject *)&PyCode_Type );
+    PyTuple_SET_ITEM( const_tuple_anon_code_type_memoryview_tuple, 1, (PyObject *)&PyMemoryView_Type ); Py_INCREF( (PyObject *)&PyMemoryView_Type );
+    const_tuple_int_0_int_pos_1_int_pos_2_tuple = PyTuple_New( 3 );
+    PyTuple_SET_ITEM( const_tuple_int_0_int_pos_1_int_pos_2_tuple, 0, const_int_0 ); Py_INCREF( const_int_0 );
+    PyTuple_SET_ITEM( const_tuple_int_0_int_pos_1_int_pos_2_tuple, 1, const_int_pos_1 ); Py_INCREF( const_int_pos_1 );
+    PyTuple_SET_ITEM( const_tuple_int_0_int_pos_1_int_pos_2_tuple, 2, const_int_pos_2 ); Py_INCREF( const_int_pos_2 );
+    const_tuple_str_plain_a_str_plain_code_tuple = PyTuple_New( 2 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_a_str_plain_code_tuple, 0, const_str_plain_a ); Py_INCREF( const_str_plain_a );
+    PyTuple_SET_ITEM( const_tuple_str_plain_a_str_plain_code_tuple, 1, const_str_plain_code ); Py_INCREF( const_str_plain_code );
+    const_tuple_str_plain_x_str_plain_result_tuple = PyTuple_New( 2 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_x_str_plain_result_tuple, 0, const_str_plain_x ); Py_INCREF( const_str_plain_x );
+    PyTuple_SET_ITEM( const_tuple_str_plain_x_str_plain_result_tuple, 1, const_str_plain_result ); Py_INCREF( const_str_plain_result );
+    const_tuple_str_plain_code_str_plain_func_tuple = PyTuple_New( 2 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_code_str_plain_func_tuple, 0, const_str_plain_code ); Py_INCREF( const_str_plain_code );
+    PyTuple_SET_ITEM( const_tuple_str_plain_code_str_plain_func_tuple, 1, const_str_plain_func ); Py_INCREF( const_str_plain_func );
+    const_str_plain_functionWithExecAffectingClosure = UNSTREAM_STRING( &constant_bin[ 527 ], 32, 1 );
+    const_str_digest_005bb0ac160d91925b1aa21e45bfede6 = UNSTREAM_STRING( &constant_bin[ 559 ], 48, 0 );
+    const_str_digest_063096dcccc39cee036f3f5ca3b41511 = UNSTREAM_STRING( &constant_bin[ 607 ], 42, 0 );
+    const_str_digest_06b716c854966bbcdbe2a7410c2e122e = UNSTREAM_STRING( &constant_bin[ 649 ], 30, 0 );
+    const_str_digest_07e08e7eef02f483d242b0eaf118d0dc = UNSTREAM_STRING( &constant_bin[ 679 ], 56, 0 );
+    const_str_digest_08feb529f1c748683d0f13dbc46a6346 = UNSTREAM_STRING( &constant_bin[ 735 ], 50, 0 );
+    const_str_digest_0be97f8e6e49e9a9f5457ccd63ea1adf = UNSTREAM_STRING( &constant_bin[ 785 ], 27, 0 );
+    const_str_digest_0d7bc3f4ef5ef0685b5d7756f85ee411 = UNSTREAM_STRING( &constant_bin[ 812 ], 5, 0 );
+    const_str_digest_0f903759b8d2feb65efa89cb4402b3d0 = UNSTREAM_STRING( &constant_bin[ 817 ], 95, 0 );
+    const_str_digest_18ea4f2e481b8a61def37aa874174772 = UNSTREAM_STRING( &constant_bin[ 912 ], 35, 0 );
+    const_str_digest_19fc81ddf40563cb1855b82f72d1d59d = UNSTREAM_STRING( &constant_bin[ 947 ], 58, 0 );
+    const_str_digest_248f360acf257acb903ae3f061fe6af1 = UNSTREAM_STRING( &constant_bin[ 1005 ], 12, 0 );
+    const_str_digest_2a9252df6c82849cccf77f84dd96b233 = UNSTREAM_STRING( &constant_bin[ 1017 ], 40, 0 );
+    const_str_digest_34bcccce7b2d8347939d3a9a2695a1cf = UNSTREAM_STRING( &constant_bin[ 1057 ], 69, 0 );
+    const_str_digest_3953231f8e2d8a134eb31bf0fdb146c3 = UNSTREAM_STRING( &constant_bin[ 1126 ], 20, 0 );
+    const_str_digest_40ff59c4788ff32b430bc257697c5065 = UNSTREAM_STRING( &constant_bin[ 1146 ], 38, 0 );
+    const_str_digest_4b194deb8804510009fd513a06c46b46 = UNSTREAM_STRING( &constant_bin[ 1184 ], 52, 0 );
+    const_str_digest_4b5228fbb1896df3babfd53af4450d91 = UNSTREAM_STRING( &constant_bin[ 1236 ], 3, 0 );
+    const_str_digest_4cf7ee3772e58919b7d820508e63144e = UNSTREAM_STRING( &constant_bin[ 1239 ], 43, 0 );
+    const_str_digest_4e8ba78bb68185a62646568d766f622d = UNSTREAM_STRING( &constant_bin[ 1282 ], 60, 0 );
+    const_str_digest_5bb5a01d8bca65ab0d9326a38bbe95b2 = UNSTREAM_STRING( &constant_bin[ 1342 ], 17, 0 );
+    const_str_digest_5e9d9241799e86d970c5dd9e1901ac08 = UNSTREAM_STRING( &constant_bin[ 1359 ], 4, 0 );
+    const_str_digest_5efe39d911f5869252dcfb645fbe8550 = UNSTREAM_STRING( &constant_bin[ 1363 ], 201, 0 );
+    const_str_digest_69b939c21a2c20fcfd3a18934d6a8e50 = UNSTREAM_STRING( &constant_bin[ 1564 ], 30, 0 );
+    const_str_digest_6c6fbf32885e4c30e49c8654849ac269 = UNSTREAM_STRING( &constant_bin[ 1594 ], 5, 0 );
+    const_str_digest_726a7d88c6429830552ff1ae931156e2 = UNSTREAM_STRING( &constant_bin[ 1599 ], 19, 0 );
+    const_str_digest_7bfacfe8f3a4cd5d5fd933a434c95998 = UNSTREAM_STRING( &constant_bin[ 1618 ], 115, 0 );
+    const_str_digest_7e0a7d659dbe48de213ffa2b3183b4c7 = UNSTREAM_STRING( &constant_bin[ 1733 ], 52, 0 );
+    const_str_digest_811f03bba7485579dac319cd6f95d838 = UNSTREAM_STRING( &constant_bin[ 1785 ], 97, 0 );
+    const_str_digest_82ce1947d3a8dc3eea8410b612114549 = UNSTREAM_STRING( &constant_bin[ 1882 ], 4, 0 );
+    const_str_digest_85535d85183d9a6f37630a8c0602e20c = UNSTREAM_STRING( &constant_bin[ 1886 ], 25, 0 );
+    const_str_digest_86073439a5c284ad71bc88107637e387 = UNSTREAM_STRING( &constant_bin[ 1911 ], 16, 0 );
+    const_str_digest_8784c77ba7bd531819aae6c5a91834a4 = UNSTREAM_STRING( &constant_bin[ 1927 ], 38, 0 );
+    const_str_digest_88a4ea53be43a6b3910a00cacc390988 = UNSTREAM_STRING( &constant_bin[ 1965 ], 4, 0 );
+    const_str_digest_8a9b3ade60b73fed3f891de8e6c7f61b = UNSTREAM_STRING( &constant_bin[ 1969 ], 9, 0 );
+    const_str_digest_8ff7185fd52c43b4e0cecc7952b817a4 = UNSTREAM_STRING( &constant_bin[ 1978 ], 50, 0 );
+    const_str_digest_970ab3a0dd5be16ecd8310f2681b379c = UNSTREAM_STRING( &constant_bin[ 2028 ], 40, 0 );
+    const_str_digest_9bbcdd1ad6f075459737599dab381555 = UNSTREAM_STRING( &constant_bin[ 2068 ], 7, 0 );
+    const_str_digest_a1f9a58c987b25e3e6bdaea6f6c92e28 = UNSTREAM_STRING( &constant_bin[ 2075 ], 50, 0 );
+    const_str_digest_a36f41ad69eb85f0993cb010132f13d6 = UNSTREAM_STRING( &constant_bin[ 2125 ], 9, 0 );
+    const_str_digest_abad8710825108b72fe08ee2e34b5ad7 = UNSTREAM_STRING( &constant_bin[ 2134 ], 3, 0 );
+    const_str_digest_ac02ab0238280e341b2aff0eed15b128 = UNSTREAM_STRING( &constant_bin[ 2137 ], 2, 0 );
+    const_str_digest_acea28d3c2899a6da4ce30c30a7d19b6 = UNSTREAM_STRING( &constant_bin[ 2139 ], 55, 0 );
+    const_str_digest_ae4c4a545acbb0ad86ab60319f4015fe = UNSTREAM_STRING( &constant_bin[ 2194 ], 27, 0 );
+    const_str_digest_b005fb9fba2b19875ef69d94173f0be0 = UNSTREAM_STRING( &constant_bin[ 2221 ], 3, 0 );
+    const_str_digest_b6fe7a4dee6abbb04f9a378b95c034fa = UNSTREAM_STRING( &constant_bin[ 2224 ], 59, 0 );
+    const_str_digest_b9c4baf879ebd882d40843df3a4dead7 = UNSTREAM_STRING( &constant_bin[ 2283 ], 2, 1 );
+    const_str_digest_c017e7bf746e544289a8119779dc1659 = UNSTREAM_STRING( &constant_bin[ 2285 ], 28, 0 );
+    const_str_digest_c416a96f64347d56a3ea7dd95e587796 = UNSTREAM_STRING( &constant_bin[ 2313 ], 8, 0 );
+    const_str_digest_d0fc61e455af63ca5afa211bdd917659 = UNSTREAM_STRING( &constant_bin[ 2321 ], 10, 0 );
+    const_str_digest_d3d5e86d5f22461305291a6ba678d9fc = UNSTREAM_STRING( &constant_bin[ 2331 ], 22, 0 );
+    const_str_digest_db79741939c6a7248bf2a0c07da13397 = UNSTREAM_STRING( &constant_bin[ 2353 ], 3, 0 );
+    const_str_digest_dec5e302898faac76ce954c36c0c633a = UNSTREAM_STRING( &constant_bin[ 2356 ], 36, 0 );
+    const_str_digest_e01ca43dcaf5af281a38d385f25b2474 = UNSTREAM_STRING( &constant_bin[ 2392 ], 16, 0 );
+    const_str_digest_e3a18846495adb68b811665d47ec5f40 = UNSTREAM_STRING( &constant_bin[ 2408 ], 61, 0 );
+    const_str_digest_e4e0d34620c1d68d536f2ca8b42e4e1b = UNSTREAM_STRING( &constant_bin[ 2469 ], 75, 0 );
+    const_str_digest_e547a09269f65d4a3bb57ce1c1a2673f = UNSTREAM_STRING( &constant_bin[ 2544 ], 5, 0 );
+    const_str_digest_e8e47c167be7dfc6fd7f993359547b0f = UNSTREAM_STRING( &constant_bin[ 2549 ], 22, 0 );
+    const_str_digest_ef7aa81fa65c218307ec6cc37701dc66 = UNSTREAM_STRING( &constant_bin[ 2571 ], 20, 0 );
+    const_str_digest_f0b555a714023c2b8122ef7241eb357d = UNSTREAM_STRING( &constant_bin[ 2591 ], 86, 0 );
+    const_str_digest_f687ea35b43f26d6209fbaa354137816 = UNSTREAM_STRING( &constant_bin[ 2677 ], 26, 0 );
+    const_str_digest_fc25bd7cdf8db85f3ea4a0bfcaa8985f = UNSTREAM_STRING( &constant_bin[ 2703 ], 38, 0 );
+    const_str_digest_ff0a6018ba8f720c664541ccefa60fc8 = UNSTREAM_STRING( &constant_bin[ 2741 ], 3, 0 );
+    const_str_plain_functionWithClosureProvidedByExec = UNSTREAM_STRING( &constant_bin[ 2744 ], 33, 1 );
+    const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple = PyTuple_New( 5 );
+    PyTuple_SET_ITEM( const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple, 0, const_str_plain_global_vars ); Py_INCREF( const_str_plain_global_vars );
+    PyTuple_SET_ITEM( const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple, 1, const_str_plain_local_vars ); Py_INCREF( const_str_plain_local_vars );
+    PyTuple_SET_ITEM( const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple, 2, const_str_plain_e ); Py_INCREF( const_str_plain_e );
+    PyTuple_SET_ITEM( const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple, 3, const_str_plain_x ); Py_INCREF( const_str_plain_x );
+    PyTuple_SET_ITEM( const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple, 4, const_str_plain_f ); Py_INCREF( const_str_plain_f );
+    const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple = PyTuple_New( 5 );
+    PyTuple_SET_ITEM( const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple, 0, const_str_plain_f1 ); Py_INCREF( const_str_plain_f1 );
+    PyTuple_SET_ITEM( const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple, 1, const_str_plain_code ); Py_INCREF( const_str_plain_code );
+    PyTuple_SET_ITEM( const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple, 2, const_str_plain_l ); Py_INCREF( const_str_plain_l );
+    PyTuple_SET_ITEM( const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple, 3, const_str_plain_g ); Py_INCREF( const_str_plain_g );
+    PyTuple_SET_ITEM( const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple, 4, const_str_plain_f ); Py_INCREF( const_str_plain_f );
+    const_tuple_bf0438733bb84e321aa8f0a1aba1a907_tuple = PyTuple_New( 4 );
+    PyTuple_SET_ITEM( const_tuple_bf0438733bb84e321aa8f0a1aba1a907_tuple, 0, const_str_plain_x ); Py_INCREF( const_str_plain_x );
+    PyTuple_SET_ITEM( const_tuple_bf0438733bb84e321aa8f0a1aba1a907_tuple, 1, const_str_plain_code ); Py_INCREF( const_str_plain_code );
+    PyTuple_SET_ITEM( const_tuple_bf0438733bb84e321aa8f0a1aba1a907_tuple, 2, const_str_plain_closureMaker ); Py_INCREF( const_str_plain_closureMaker );
+    PyTuple_SET_ITEM( const_tuple_bf0438733bb84e321aa8f0a1aba1a907_tuple, 3, const_str_plain_space ); Py_INCREF( const_str_plain_space );
+    const_str_plain_execDefinesFunctionToLocalsExplicity = UNSTREAM_STRING( &constant_bin[ 2777 ], 36, 1 );
+    const_tuple_int_0_int_pos_1_int_pos_2_int_pos_3_tuple = PyTuple_New( 4 );
+    PyTuple_SET_ITEM( const_tuple_int_0_int_pos_1_int_pos_2_int_pos_3_tuple, 0, const_int_0 ); Py_INCREF( const_int_0 );
+    PyTuple_SET_ITEM( const_tuple_int_0_int_pos_1_int_pos_2_int_pos_3_tuple, 1, const_int_pos_1 ); Py_INCREF( const_int_pos_1 );
+    PyTuple_SET_ITEM( const_tuple_int_0_int_pos_1_int_pos_2_int_pos_3_tuple, 2, const_int_pos_2 ); Py_INCREF( const_int_pos_2 );
+    PyTuple_SET_ITEM( const_tuple_int_0_int_pos_1_int_pos_2_int_pos_3_tuple, 3, const_int_pos_3 ); Py_INCREF( const_int_pos_3 );
+    const_tuple_str_plain_a_str_plain_r_str_plain_g_tuple = PyTuple_New( 3 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_a_str_plain_r_str_plain_g_tuple, 0, const_str_plain_a ); Py_INCREF( const_str_plain_a );
+    PyTuple_SET_ITEM( const_tuple_str_plain_a_str_plain_r_str_plain_g_tuple, 1, const_str_plain_r ); Py_INCREF( const_str_plain_r );
+    PyTuple_SET_ITEM( const_tuple_str_plain_a_str_plain_r_str_plain_g_tuple, 2, const_str_plain_g ); Py_INCREF( const_str_plain_g );
+    const_tuple_str_plain_y_str_plain_print_global_y_tuple = PyTuple_New( 2 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_y_str_plain_print_global_y_tuple, 0, const_str_plain_y ); Py_INCREF( const_str_plain_y );
+    PyTuple_SET_ITEM( const_tuple_str_plain_y_str_plain_print_global_y_tuple, 1, const_str_plain_print_global_y ); Py_INCREF( const_str_plain_print_global_y );
+    const_tuple_str_plain_s_str_plain_r1_str_plain_r2_tuple = PyTuple_New( 3 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_s_str_plain_r1_str_plain_r2_tuple, 0, const_str_plain_s ); Py_INCREF( const_str_plain_s );
+    PyTuple_SET_ITEM( const_tuple_str_plain_s_str_plain_r1_str_plain_r2_tuple, 1, const_str_plain_r1 ); Py_INCREF( const_str_plain_r1 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_s_str_plain_r1_str_plain_r2_tuple, 2, const_str_plain_r2 ); Py_INCREF( const_str_plain_r2 );
+    const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple = PyTuple_New( 1 );
+    PyTuple_SET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0, const_str_digest_ac02ab0238280e341b2aff0eed15b128 ); Py_INCREF( const_str_digest_ac02ab0238280e341b2aff0eed15b128 );
+    const_tuple_str_digest_c416a96f64347d56a3ea7dd95e587796_tuple = PyTuple_New( 1 );
+    PyTuple_SET_ITEM( const_tuple_str_digest_c416a96f64347d56a3ea7dd95e587796_tuple, 0, const_str_digest_c416a96f64347d56a3ea7dd95e587796 ); Py_INCREF( const_str_digest_c416a96f64347d56a3ea7dd95e587796 );
+    const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple = PyTuple_New( 4 );
+    PyTuple_SET_ITEM( const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple, 0, const_str_plain_code ); Py_INCREF( const_str_plain_code );
+    PyTuple_SET_ITEM( const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple, 1, const_str_plain_l ); Py_INCREF( const_str_plain_l );
+    PyTuple_SET_ITEM( const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple, 2, const_str_plain_g ); Py_INCREF( const_str_plain_g );
+    PyTuple_SET_ITEM( const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple, 3, const_str_plain_f ); Py_INCREF( const_str_plain_f );
+    const_tuple_str_digest_b9c4baf879ebd882d40843df3a4dead7_str_plain_s_tuple = PyTuple_New( 2 );
+    PyTuple_SET_ITEM( const_tuple_str_digest_b9c4baf879ebd882d40843df3a4dead7_str_plain_s_tuple, 0, const_str_digest_b9c4baf879ebd882d40843df3a4dead7 ); Py_INCREF( const_str_digest_b9c4baf879ebd882d40843df3a4dead7 );
+    PyTuple_SET_ITEM( const_tuple_str_digest_b9c4baf879ebd882d40843df3a4dead7_str_plain_s_tuple, 1, const_str_plain_s ); Py_INCREF( const_str_plain_s );
+
+    constants_created = true;
+}
+
+/* Function to verify module private constants for non-corruption. */
+#ifndef __NUITKA_NO_ASSERT__
+void checkModuleConstants___main__( void )
+{
+    // The module may not have been used at all, then ignore this.
+    if (constants_created == false) return;
+
+
+}
+#endif
+
+// The module code objects.
+static PyCodeObject *codeobj_c537def1486cf539a83a18a1c7837e16;
+static PyCodeObject *codeobj_68f38697c98d703901c499a665bbbaa6;
+static PyCodeObject *codeobj_0f7f4469dcc16a50cb530f8481e5a772;
+static PyCodeObject *codeobj_8a366b625ec3cbfcb967585db5acde80;
+static PyCodeObject *codeobj_745c1c1c411b0216b3f64e2c5b36d53e;
+static PyCodeObject *codeobj_8b666ac29bc4a94d89ad930ffea9f352;
+static PyCodeObject *codeobj_8630b57232f6cdb964e7c7c559eb3f43;
+static PyCodeObject *codeobj_dd3383cadf1471c5f27335a46f766b01;
+static PyCodeObject *codeobj_549de24ca1e36e2a09f1b50863c7b541;
+static PyCodeObject *codeobj_e4a7ddb19b3654ee7f42c778db7bd1f0;
+static PyCodeObject *codeobj_43b3eefcc7874990a75a773ede927677;
+static PyCodeObject *codeobj_a09c1147a92e95201ba715c7d121c66f;
+static PyCodeObject *codeobj_d67934f3fe344ceb7e29d8ae3194013c;
+static PyCodeObject *codeobj_472f6472b729bfbce6bbbd8b00c24d04;
+static PyCodeObject *codeobj_af258049efa2050aa4d2842fd8645d14;
+static PyCodeObject *codeobj_f9139bcd9ae1e170c2a3f294b75c9b9e;
+static PyCodeObject *codeobj_e26d2d618dc98f60c4cee33ec95bb6a6;
+static PyCodeObject *codeobj_304cc3492cfb936d1b66ffa5445800a3;
+static PyCodeObject *codeobj_b0336bb790b5bbc97a76086edd70e3df;
+static PyCodeObject *codeobj_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6;
+static PyCodeObject *codeobj_00d60fde43d27ec513f170a102d005e8;
+static PyCodeObject *codeobj_87f0811e96640ed92d76bddb83b77fbf;
+static PyCodeObject *codeobj_5f6ff8d2eda5b6f8919e933d974bea75;
+static PyCodeObject *codeobj_b19b9b217d5b765d94c1924f515b24fb;
+/* For use in "MainProgram.c". */
+PyCodeObject *codeobj_main = NULL;
+
+static void createModuleCodeObjects(void)
+{
+    module_filename_obj = const_str_digest_8784c77ba7bd531819aae6c5a91834a4;
+    codeobj_c537def1486cf539a83a18a1c7837e16 = MAKE_CODEOBJ( module_filename_obj, const_str_angle_genexpr, 290, const_tuple_str_digest_b9c4baf879ebd882d40843df3a4dead7_str_plain_s_tuple, 1, CO_GENERATOR | CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_68f38697c98d703901c499a665bbbaa6 = MAKE_CODEOBJ( module_filename_obj, const_str_angle_module, 1, const_tuple_empty, 0, CO_NOFREE );
+    codeobj_main = codeobj_68f38697c98d703901c499a665bbbaa6;
+    codeobj_0f7f4469dcc16a50cb530f8481e5a772 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_classExecfile, 107, const_tuple_empty, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_8a366b625ec3cbfcb967585db5acde80 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_closureMaker, 271, const_tuple_str_plain_x_tuple, 0, CO_OPTIMIZED | CO_NEWLOCALS );
+    codeobj_745c1c1c411b0216b3f64e2c5b36d53e = MAKE_CODEOBJ( module_filename_obj, const_str_plain_evalInContractions, 288, const_tuple_str_plain_s_str_plain_r1_str_plain_r2_tuple, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_8b666ac29bc4a94d89ad930ffea9f352 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_execDefinesFunctionToLocalsExplicity, 297, const_tuple_empty, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_8630b57232f6cdb964e7c7c559eb3f43 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_execWithShortTuple, 315, const_tuple_str_plain_e_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_dd3383cadf1471c5f27335a46f766b01 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_func, 254, const_tuple_empty, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_549de24ca1e36e2a09f1b50863c7b541 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionEval1, 24, const_tuple_empty, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_e4a7ddb19b3654ee7f42c778db7bd1f0 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionEval2, 29, const_tuple_str_plain_a_str_plain_r_str_plain_g_tuple, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_43b3eefcc7874990a75a773ede927677 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionEval3, 40, const_tuple_str_plain_x_str_plain_result_tuple, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_a09c1147a92e95201ba715c7d121c66f = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionEvalNones2, 136, const_tuple_b8e3d4ac033dc8be1bc8fdd37919e25c_tuple, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_d67934f3fe344ceb7e29d8ae3194013c = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionExec1, 54, const_tuple_str_plain_a_str_plain_code_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_472f6472b729bfbce6bbbd8b00c24d04 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionExec2, 62, const_tuple_str_plain_a_str_plain_code_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_af258049efa2050aa4d2842fd8645d14 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionExecNonesSyntax, 126, const_tuple_str_plain_f_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_f9139bcd9ae1e170c2a3f294b75c9b9e = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionExecNonesSyntax2, 161, const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_e26d2d618dc98f60c4cee33ec95bb6a6 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionExecNonesTuple, 120, const_tuple_str_plain_f_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_304cc3492cfb936d1b66ffa5445800a3 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionExecNonesTuple2, 150, const_tuple_str_plain_code_str_plain_l_str_plain_g_str_plain_f_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_b0336bb790b5bbc97a76086edd70e3df = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionExecfile, 93, const_tuple_962c827674bd095fca7cd4d3e2d257c1_tuple, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionGlobalsExecShadow, 192, const_tuple_str_plain_y_str_plain_print_global_y_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_00d60fde43d27ec513f170a102d005e8 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionWithClosureProvidedByExec, 248, const_tuple_str_plain_code_str_plain_func_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_87f0811e96640ed92d76bddb83b77fbf = MAKE_CODEOBJ( module_filename_obj, const_str_plain_functionWithExecAffectingClosure, 263, const_tuple_bf0438733bb84e321aa8f0a1aba1a907_tuple, 0, CO_NEWLOCALS | CO_NOFREE );
+    codeobj_5f6ff8d2eda5b6f8919e933d974bea75 = MAKE_CODEOBJ( module_filename_obj, const_str_plain_generatorFunctionWithExec, 278, const_tuple_str_plain_code_tuple, 0, CO_GENERATOR | CO_NEWLOCALS | CO_NOFREE );
+    codeobj_b19b9b217d5b765d94c1924f515b24fb = MAKE_CODEOBJ( module_filename_obj, const_str_plain_print_global_y, 237, const_tuple_empty, 0, CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE );
+}
+
+// The module function declarations.
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_13_functionEval1( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_14_functionEval2( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_15_functionEval3( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_1_functionExec1( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_2_functionExec2( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_16_functionExecfile( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_3_functionExecNonesTuple( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_4_functionExecNonesSyntax( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_17_functionEvalNones2( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_5_functionExecNonesTuple2( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_6_functionExecNonesSyntax2( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_7_functionGlobalsExecShadow( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_7_functionGlobalsExecShadow$$$function_1_print_global_y( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_8_functionWithClosureProvidedByExec( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_8_functionWithClosureProvidedByExec$$$function_1_func( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_9_functionWithExecAffectingClosure( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_9_functionWithExecAffectingClosure$$$function_1_closureMaker( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_10_generatorFunctionWithExec( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+static PyObject *__main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_maker( void );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_18_evalInContractions( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+static PyObject *__main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_maker( void );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_11_execDefinesFunctionToLocalsExplicity( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_12_execWithShortTuple( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_10_generatorFunctionWithExec(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_11_execDefinesFunctionToLocalsExplicity(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_12_execWithShortTuple(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_13_functionEval1(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_14_functionEval2(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_15_functionEval3(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_16_functionExecfile(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_17_functionEvalNones2(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_18_evalInContractions(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_1_functionExec1(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_2_functionExec2(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_3_functionExecNonesTuple(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_4_functionExecNonesSyntax(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_5_functionExecNonesTuple2(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_6_functionExecNonesSyntax2(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_7_functionGlobalsExecShadow(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_7_functionGlobalsExecShadow$$$function_1_print_global_y(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_8_functionWithClosureProvidedByExec(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_8_functionWithClosureProvidedByExec$$$function_1_func(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_9_functionWithExecAffectingClosure(  );
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_9_functionWithExecAffectingClosure$$$function_1_closureMaker(  );
+
+
+// The module function definitions.
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_13_functionEval1( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *tmp_eval_call_1__globals = NULL;
+    PyObject *tmp_eval_call_1__locals = NULL;
+    PyObject *tmp_eval_call_1__source = NULL;
+    struct Nuitka_FrameObject *frame_549de24ca1e36e2a09f1b50863c7b541;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    static struct Nuitka_FrameObject *cache_frame_549de24ca1e36e2a09f1b50863c7b541 = NULL;
+
+    // Actual function body.
+    MAKE_OR_REUSE_FRAME( cache_frame_549de24ca1e36e2a09f1b50863c7b541, codeobj_549de24ca1e36e2a09f1b50863c7b541, module___main__, 0 );
+    frame_549de24ca1e36e2a09f1b50863c7b541 = cache_frame_549de24ca1e36e2a09f1b50863c7b541;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_549de24ca1e36e2a09f1b50863c7b541 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_549de24ca1e36e2a09f1b50863c7b541 ) == 2 ); // Frame stack
+
+    // Framed code:
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = PyDict_New();
+        assert( tmp_eval_call_1__locals == NULL );
+        tmp_eval_call_1__locals = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = (PyObject *)moduledict___main__;
+        assert( tmp_eval_call_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        tmp_eval_call_1__globals = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        tmp_assign_source_3 = const_str_digest_5e9d9241799e86d970c5dd9e1901ac08;
+        assert( tmp_eval_call_1__source == NULL );
+        Py_INCREF( tmp_assign_source_3 );
+        tmp_eval_call_1__source = tmp_assign_source_3;
+    }
+    // Tried code:
+    {
+        PyObject *tmp_assign_source_4;
+        PyObject *tmp_called_instance_1;
+        tmp_called_instance_1 = const_str_digest_5e9d9241799e86d970c5dd9e1901ac08;
+        frame_549de24ca1e36e2a09f1b50863c7b541->m_frame.f_lineno = 25;
+        tmp_assign_source_4 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_1, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+        if ( tmp_assign_source_4 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 25;
+
+            goto try_except_handler_1;
+        }
+        {
+            PyObject *old = tmp_eval_call_1__source;
+            assert( old != NULL );
+            tmp_eval_call_1__source = tmp_assign_source_4;
+            Py_DECREF( old );
+        }
+
+    }
+    {
+        PyObject *tmp_eval_source_1;
+        PyObject *tmp_eval_globals_1;
+        PyObject *tmp_eval_locals_1;
+        PyObject *tmp_eval_compiled_1;
+        CHECK_OBJECT( tmp_eval_call_1__source );
+        tmp_eval_source_1 = tmp_eval_call_1__source;
+        CHECK_OBJECT( tmp_eval_call_1__globals );
+        tmp_eval_globals_1 = tmp_eval_call_1__globals;
+        CHECK_OBJECT( tmp_eval_call_1__locals );
+        tmp_eval_locals_1 = tmp_eval_call_1__locals;
+        tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+        if ( tmp_eval_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 25;
+
+            goto try_except_handler_1;
+        }
+        tmp_return_value = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+        Py_DECREF( tmp_eval_compiled_1 );
+        if ( tmp_return_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 25;
+
+            goto try_except_handler_1;
+        }
+        goto try_return_handler_1;
+    }
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_13_functionEval1 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+    Py_DECREF( tmp_eval_call_1__globals );
+    tmp_eval_call_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+    Py_DECREF( tmp_eval_call_1__locals );
+    tmp_eval_call_1__locals = NULL;
+
+    Py_XDECREF( tmp_eval_call_1__source );
+    tmp_eval_call_1__source = NULL;
+
+    goto outline_result_1;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+    Py_DECREF( tmp_eval_call_1__globals );
+    tmp_eval_call_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+    Py_DECREF( tmp_eval_call_1__locals );
+    tmp_eval_call_1__locals = NULL;
+
+    Py_XDECREF( tmp_eval_call_1__source );
+    tmp_eval_call_1__source = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_13_functionEval1 );
+    return NULL;
+    outline_result_1:;
+    goto frame_return_exit_1;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_549de24ca1e36e2a09f1b50863c7b541 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_return_exit_1:;
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_549de24ca1e36e2a09f1b50863c7b541 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto function_return_exit;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_549de24ca1e36e2a09f1b50863c7b541 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_549de24ca1e36e2a09f1b50863c7b541, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_549de24ca1e36e2a09f1b50863c7b541->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_549de24ca1e36e2a09f1b50863c7b541, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_549de24ca1e36e2a09f1b50863c7b541,
+        type_description_1
+    );
+
+
+    // Release cached frame.
+    if ( frame_549de24ca1e36e2a09f1b50863c7b541 == cache_frame_549de24ca1e36e2a09f1b50863c7b541 )
+    {
+        Py_DECREF( frame_549de24ca1e36e2a09f1b50863c7b541 );
+    }
+    cache_frame_549de24ca1e36e2a09f1b50863c7b541 = NULL;
+
+    assertFrameObject( frame_549de24ca1e36e2a09f1b50863c7b541 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto function_exception_exit;
+
+    frame_no_exception_1:;
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_13_functionEval1 );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_14_functionEval2( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_a = NULL;
+    PyObject *var_r = NULL;
+    PyObject *var_g = NULL;
+    PyObject *tmp_eval_call_1__globals = NULL;
+    PyObject *tmp_eval_call_1__locals = NULL;
+    PyObject *tmp_eval_call_1__source = NULL;
+    struct Nuitka_FrameObject *frame_e4a7ddb19b3654ee7f42c778db7bd1f0;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    int tmp_res;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_return_value = NULL;
+    static struct Nuitka_FrameObject *cache_frame_e4a7ddb19b3654ee7f42c778db7bd1f0 = NULL;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+
+    // Actual function body.
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = LIST_COPY( const_list_int_pos_2_list );
+        assert( var_a == NULL );
+        var_a = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = PyDict_New();
+        assert( var_g == NULL );
+        var_g = tmp_assign_source_2;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_e4a7ddb19b3654ee7f42c778db7bd1f0, codeobj_e4a7ddb19b3654ee7f42c778db7bd1f0, module___main__, sizeof(void *)+sizeof(void *)+sizeof(void *) );
+    frame_e4a7ddb19b3654ee7f42c778db7bd1f0 = cache_frame_e4a7ddb19b3654ee7f42c778db7bd1f0;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 ) == 2 ); // Frame stack
+
+    // Framed code:
+    {
+        PyObject *tmp_assign_source_3;
+        {
+            PyObject *tmp_assign_source_4;
+            CHECK_OBJECT( var_g );
+            tmp_assign_source_4 = var_g;
+            assert( tmp_eval_call_1__globals == NULL );
+            Py_INCREF( tmp_assign_source_4 );
+            tmp_eval_call_1__globals = tmp_assign_source_4;
+        }
+        {
+            PyObject *tmp_assign_source_5;
+            nuitka_bool tmp_condition_result_1;
+            PyObject *tmp_compexpr_left_1;
+            PyObject *tmp_compexpr_right_1;
+            PyObject *tmp_dict_key_1;
+            PyObject *tmp_dict_value_1;
+            PyObject *tmp_dict_key_2;
+            PyObject *tmp_dict_value_2;
+            CHECK_OBJECT( tmp_eval_call_1__globals );
+            tmp_compexpr_left_1 = tmp_eval_call_1__globals;
+            tmp_compexpr_right_1 = Py_None;
+            tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+            {
+                goto condexpr_true_1;
+            }
+            else
+            {
+                goto condexpr_false_1;
+            }
+            condexpr_true_1:;
+            CHECK_OBJECT( var_a );
+            tmp_dict_value_1 = var_a;
+            tmp_dict_key_1 = const_str_plain_a;
+            tmp_assign_source_5 = _PyDict_NewPresized( 2 );
+            tmp_res = PyDict_SetItem( tmp_assign_source_5, tmp_dict_key_1, tmp_dict_value_1 );
+            assert( !(tmp_res != 0) );
+            CHECK_OBJECT( var_g );
+            tmp_dict_value_2 = var_g;
+            tmp_dict_key_2 = const_str_plain_g;
+            tmp_res = PyDict_SetItem( tmp_assign_source_5, tmp_dict_key_2, tmp_dict_value_2 );
+            assert( !(tmp_res != 0) );
+            goto condexpr_end_1;
+            condexpr_false_1:;
+            CHECK_OBJECT( tmp_eval_call_1__globals );
+            tmp_assign_source_5 = tmp_eval_call_1__globals;
+            Py_INCREF( tmp_assign_source_5 );
+            condexpr_end_1:;
+            assert( tmp_eval_call_1__locals == NULL );
+            tmp_eval_call_1__locals = tmp_assign_source_5;
+        }
+        {
+            nuitka_bool tmp_condition_result_2;
+            PyObject *tmp_compexpr_left_2;
+            PyObject *tmp_compexpr_right_2;
+            CHECK_OBJECT( tmp_eval_call_1__globals );
+            tmp_compexpr_left_2 = tmp_eval_call_1__globals;
+            tmp_compexpr_right_2 = Py_None;
+            tmp_condition_result_2 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_1;
+            }
+            else
+            {
+                goto branch_no_1;
+            }
+            branch_yes_1:;
+            {
+                PyObject *tmp_assign_source_6;
+                tmp_assign_source_6 = (PyObject *)moduledict___main__;
+                {
+                    PyObject *old = tmp_eval_call_1__globals;
+                    assert( old != NULL );
+                    tmp_eval_call_1__globals = tmp_assign_source_6;
+                    Py_INCREF( tmp_eval_call_1__globals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_1:;
+        }
+        {
+            PyObject *tmp_assign_source_7;
+            tmp_assign_source_7 = const_str_digest_4b5228fbb1896df3babfd53af4450d91;
+            assert( tmp_eval_call_1__source == NULL );
+            Py_INCREF( tmp_assign_source_7 );
+            tmp_eval_call_1__source = tmp_assign_source_7;
+        }
+        // Tried code:
+        {
+            PyObject *tmp_assign_source_8;
+            PyObject *tmp_called_instance_1;
+            tmp_called_instance_1 = const_str_digest_4b5228fbb1896df3babfd53af4450d91;
+            frame_e4a7ddb19b3654ee7f42c778db7bd1f0->m_frame.f_lineno = 34;
+            tmp_assign_source_8 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_1, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+            if ( tmp_assign_source_8 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 34;
+                type_description_1 = "ooo";
+                goto try_except_handler_2;
+            }
+            {
+                PyObject *old = tmp_eval_call_1__source;
+                assert( old != NULL );
+                tmp_eval_call_1__source = tmp_assign_source_8;
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            PyObject *tmp_eval_source_1;
+            PyObject *tmp_eval_globals_1;
+            PyObject *tmp_eval_locals_1;
+            PyObject *tmp_eval_compiled_1;
+            CHECK_OBJECT( tmp_eval_call_1__source );
+            tmp_eval_source_1 = tmp_eval_call_1__source;
+            CHECK_OBJECT( tmp_eval_call_1__globals );
+            tmp_eval_globals_1 = tmp_eval_call_1__globals;
+            CHECK_OBJECT( tmp_eval_call_1__locals );
+            tmp_eval_locals_1 = tmp_eval_call_1__locals;
+            tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+            if ( tmp_eval_compiled_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 34;
+                type_description_1 = "ooo";
+                goto try_except_handler_2;
+            }
+            tmp_assign_source_3 = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+            Py_DECREF( tmp_eval_compiled_1 );
+            if ( tmp_assign_source_3 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 34;
+                type_description_1 = "ooo";
+                goto try_except_handler_2;
+            }
+            goto try_return_handler_2;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_14_functionEval2 );
+        return NULL;
+        // Return handler code:
+        try_return_handler_2:;
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+        Py_DECREF( tmp_eval_call_1__globals );
+        tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+        Py_DECREF( tmp_eval_call_1__locals );
+        tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( tmp_eval_call_1__source );
+        tmp_eval_call_1__source = NULL;
+
+        goto outline_result_1;
+        // Exception handler code:
+        try_except_handler_2:;
+        exception_keeper_type_1 = exception_type;
+        exception_keeper_value_1 = exception_value;
+        exception_keeper_tb_1 = exception_tb;
+        exception_keeper_lineno_1 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+        Py_DECREF( tmp_eval_call_1__globals );
+        tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+        Py_DECREF( tmp_eval_call_1__locals );
+        tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( tmp_eval_call_1__source );
+        tmp_eval_call_1__source = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_1;
+        exception_value = exception_keeper_value_1;
+        exception_tb = exception_keeper_tb_1;
+        exception_lineno = exception_keeper_lineno_1;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_14_functionEval2 );
+        return NULL;
+        outline_result_1:;
+        assert( var_r == NULL );
+        var_r = tmp_assign_source_3;
+    }
+    {
+        PyObject *tmp_tuple_element_1;
+        PyObject *tmp_called_instance_2;
+        CHECK_OBJECT( var_r );
+        tmp_tuple_element_1 = var_r;
+        tmp_return_value = PyTuple_New( 3 );
+        Py_INCREF( tmp_tuple_element_1 );
+        PyTuple_SET_ITEM( tmp_return_value, 0, tmp_tuple_element_1 );
+        CHECK_OBJECT( var_g );
+        tmp_called_instance_2 = var_g;
+        frame_e4a7ddb19b3654ee7f42c778db7bd1f0->m_frame.f_lineno = 36;
+        tmp_tuple_element_1 = CALL_METHOD_NO_ARGS( tmp_called_instance_2, const_str_plain_keys );
+        if ( tmp_tuple_element_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_return_value );
+
+            exception_lineno = 36;
+            type_description_1 = "ooo";
+            goto frame_exception_exit_1;
+        }
+        PyTuple_SET_ITEM( tmp_return_value, 1, tmp_tuple_element_1 );
+        CHECK_OBJECT( var_a );
+        tmp_tuple_element_1 = var_a;
+        Py_INCREF( tmp_tuple_element_1 );
+        PyTuple_SET_ITEM( tmp_return_value, 2, tmp_tuple_element_1 );
+        goto frame_return_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_return_exit_1:;
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto try_return_handler_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_e4a7ddb19b3654ee7f42c778db7bd1f0, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_e4a7ddb19b3654ee7f42c778db7bd1f0->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_e4a7ddb19b3654ee7f42c778db7bd1f0, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_e4a7ddb19b3654ee7f42c778db7bd1f0,
+        type_description_1,
+        var_a,
+        var_r,
+        var_g
+    );
+
+
+    // Release cached frame.
+    if ( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 == cache_frame_e4a7ddb19b3654ee7f42c778db7bd1f0 )
+    {
+        Py_DECREF( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 );
+    }
+    cache_frame_e4a7ddb19b3654ee7f42c778db7bd1f0 = NULL;
+
+    assertFrameObject( frame_e4a7ddb19b3654ee7f42c778db7bd1f0 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_14_functionEval2 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    CHECK_OBJECT( (PyObject *)var_a );
+    Py_DECREF( var_a );
+    var_a = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_r );
+    Py_DECREF( var_r );
+    var_r = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_g );
+    Py_DECREF( var_g );
+    var_g = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)var_a );
+    Py_DECREF( var_a );
+    var_a = NULL;
+
+    Py_XDECREF( var_r );
+    var_r = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_g );
+    Py_DECREF( var_g );
+    var_g = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_14_functionEval2 );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_15_functionEval3( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_x = NULL;
+    PyObject *var_result = NULL;
+    PyObject *tmp_eval_call_1__globals = NULL;
+    PyObject *tmp_eval_call_1__locals = NULL;
+    PyObject *tmp_eval_call_1__source = NULL;
+    PyObject *tmp_for_loop_1__for_iterator = NULL;
+    PyObject *tmp_for_loop_1__iter_value = NULL;
+    struct Nuitka_FrameObject *frame_43b3eefcc7874990a75a773ede927677;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    int tmp_res;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    static struct Nuitka_FrameObject *cache_frame_43b3eefcc7874990a75a773ede927677 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = PyList_New( 0 );
+        assert( var_result == NULL );
+        var_result = tmp_assign_source_1;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_43b3eefcc7874990a75a773ede927677, codeobj_43b3eefcc7874990a75a773ede927677, module___main__, sizeof(void *)+sizeof(void *) );
+    frame_43b3eefcc7874990a75a773ede927677 = cache_frame_43b3eefcc7874990a75a773ede927677;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_43b3eefcc7874990a75a773ede927677 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_43b3eefcc7874990a75a773ede927677 ) == 2 ); // Frame stack
+
+    // Framed code:
+    {
+        PyObject *tmp_assign_source_2;
+        PyObject *tmp_iter_arg_1;
+        {
+            PyObject *tmp_assign_source_3;
+            PyObject *tmp_dict_key_1;
+            PyObject *tmp_dict_value_1;
+            CHECK_OBJECT( var_result );
+            tmp_dict_value_1 = var_result;
+            tmp_dict_key_1 = const_str_plain_result;
+            tmp_assign_source_3 = _PyDict_NewPresized( 1 );
+            tmp_res = PyDict_SetItem( tmp_assign_source_3, tmp_dict_key_1, tmp_dict_value_1 );
+            assert( !(tmp_res != 0) );
+            assert( tmp_eval_call_1__locals == NULL );
+            tmp_eval_call_1__locals = tmp_assign_source_3;
+        }
+        {
+            PyObject *tmp_assign_source_4;
+            tmp_assign_source_4 = (PyObject *)moduledict___main__;
+            assert( tmp_eval_call_1__globals == NULL );
+            Py_INCREF( tmp_assign_source_4 );
+            tmp_eval_call_1__globals = tmp_assign_source_4;
+        }
+        {
+            PyObject *tmp_assign_source_5;
+            tmp_assign_source_5 = const_str_digest_e547a09269f65d4a3bb57ce1c1a2673f;
+            assert( tmp_eval_call_1__source == NULL );
+            Py_INCREF( tmp_assign_source_5 );
+            tmp_eval_call_1__source = tmp_assign_source_5;
+        }
+        // Tried code:
+        {
+            PyObject *tmp_assign_source_6;
+            PyObject *tmp_called_instance_1;
+            tmp_called_instance_1 = const_str_digest_e547a09269f65d4a3bb57ce1c1a2673f;
+            frame_43b3eefcc7874990a75a773ede927677->m_frame.f_lineno = 43;
+            tmp_assign_source_6 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_1, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+            if ( tmp_assign_source_6 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 43;
+                type_description_1 = "oo";
+                goto try_except_handler_2;
+            }
+            {
+                PyObject *old = tmp_eval_call_1__source;
+                assert( old != NULL );
+                tmp_eval_call_1__source = tmp_assign_source_6;
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            PyObject *tmp_eval_source_1;
+            PyObject *tmp_eval_globals_1;
+            PyObject *tmp_eval_locals_1;
+            PyObject *tmp_eval_compiled_1;
+            CHECK_OBJECT( tmp_eval_call_1__source );
+            tmp_eval_source_1 = tmp_eval_call_1__source;
+            CHECK_OBJECT( tmp_eval_call_1__globals );
+            tmp_eval_globals_1 = tmp_eval_call_1__globals;
+            CHECK_OBJECT( tmp_eval_call_1__locals );
+            tmp_eval_locals_1 = tmp_eval_call_1__locals;
+            tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+            if ( tmp_eval_compiled_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 43;
+                type_description_1 = "oo";
+                goto try_except_handler_2;
+            }
+            tmp_iter_arg_1 = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+            Py_DECREF( tmp_eval_compiled_1 );
+            if ( tmp_iter_arg_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 43;
+                type_description_1 = "oo";
+                goto try_except_handler_2;
+            }
+            goto try_return_handler_2;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_15_functionEval3 );
+        return NULL;
+        // Return handler code:
+        try_return_handler_2:;
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+        Py_DECREF( tmp_eval_call_1__globals );
+        tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+        Py_DECREF( tmp_eval_call_1__locals );
+        tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( tmp_eval_call_1__source );
+        tmp_eval_call_1__source = NULL;
+
+        goto outline_result_1;
+        // Exception handler code:
+        try_except_handler_2:;
+        exception_keeper_type_1 = exception_type;
+        exception_keeper_value_1 = exception_value;
+        exception_keeper_tb_1 = exception_tb;
+        exception_keeper_lineno_1 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+        Py_DECREF( tmp_eval_call_1__globals );
+        tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+        Py_DECREF( tmp_eval_call_1__locals );
+        tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( tmp_eval_call_1__source );
+        tmp_eval_call_1__source = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_1;
+        exception_value = exception_keeper_value_1;
+        exception_tb = exception_keeper_tb_1;
+        exception_lineno = exception_keeper_lineno_1;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_15_functionEval3 );
+        return NULL;
+        outline_result_1:;
+        tmp_assign_source_2 = MAKE_ITERATOR( tmp_iter_arg_1 );
+        Py_DECREF( tmp_iter_arg_1 );
+        if ( tmp_assign_source_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 43;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        assert( tmp_for_loop_1__for_iterator == NULL );
+        tmp_for_loop_1__for_iterator = tmp_assign_source_2;
+    }
+    // Tried code:
+    loop_start_1:;
+    {
+        PyObject *tmp_next_source_1;
+        PyObject *tmp_assign_source_7;
+        CHECK_OBJECT( tmp_for_loop_1__for_iterator );
+        tmp_next_source_1 = tmp_for_loop_1__for_iterator;
+        tmp_assign_source_7 = ITERATOR_NEXT( tmp_next_source_1 );
+        if ( tmp_assign_source_7 == NULL )
+        {
+            if ( CHECK_AND_CLEAR_STOP_ITERATION_OCCURRED() )
+            {
+
+                goto loop_end_1;
+            }
+            else
+            {
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+                type_description_1 = "oo";
+                exception_lineno = 43;
+                goto try_except_handler_3;
+            }
+        }
+
+        {
+            PyObject *old = tmp_for_loop_1__iter_value;
+            tmp_for_loop_1__iter_value = tmp_assign_source_7;
+            Py_XDECREF( old );
+        }
+
+    }
+    {
+        PyObject *tmp_assign_source_8;
+        CHECK_OBJECT( tmp_for_loop_1__iter_value );
+        tmp_assign_source_8 = tmp_for_loop_1__iter_value;
+        {
+            PyObject *old = var_x;
+            var_x = tmp_assign_source_8;
+            Py_INCREF( var_x );
+            Py_XDECREF( old );
+        }
+
+    }
+    {
+        PyObject *tmp_called_instance_2;
+        PyObject *tmp_call_result_1;
+        PyObject *tmp_args_element_name_1;
+        CHECK_OBJECT( var_result );
+        tmp_called_instance_2 = var_result;
+        CHECK_OBJECT( var_x );
+        tmp_args_element_name_1 = var_x;
+        frame_43b3eefcc7874990a75a773ede927677->m_frame.f_lineno = 44;
+        {
+            PyObject *call_args[] = { tmp_args_element_name_1 };
+            tmp_call_result_1 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_2, const_str_plain_append, call_args );
+        }
+
+        if ( tmp_call_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 44;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_call_result_1 );
+    }
+    if ( CONSIDER_THREADING() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 43;
+        type_description_1 = "oo";
+        goto try_except_handler_3;
+    }
+    goto loop_start_1;
+    loop_end_1:;
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( tmp_for_loop_1__iter_value );
+    tmp_for_loop_1__iter_value = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_for_loop_1__for_iterator );
+    Py_DECREF( tmp_for_loop_1__for_iterator );
+    tmp_for_loop_1__for_iterator = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_43b3eefcc7874990a75a773ede927677 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_43b3eefcc7874990a75a773ede927677 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_43b3eefcc7874990a75a773ede927677, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_43b3eefcc7874990a75a773ede927677->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_43b3eefcc7874990a75a773ede927677, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_43b3eefcc7874990a75a773ede927677,
+        type_description_1,
+        var_x,
+        var_result
+    );
+
+
+    // Release cached frame.
+    if ( frame_43b3eefcc7874990a75a773ede927677 == cache_frame_43b3eefcc7874990a75a773ede927677 )
+    {
+        Py_DECREF( frame_43b3eefcc7874990a75a773ede927677 );
+    }
+    cache_frame_43b3eefcc7874990a75a773ede927677 = NULL;
+
+    assertFrameObject( frame_43b3eefcc7874990a75a773ede927677 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    Py_XDECREF( tmp_for_loop_1__iter_value );
+    tmp_for_loop_1__iter_value = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_for_loop_1__for_iterator );
+    Py_DECREF( tmp_for_loop_1__for_iterator );
+    tmp_for_loop_1__for_iterator = NULL;
+
+    CHECK_OBJECT( var_result );
+    tmp_return_value = var_result;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_15_functionEval3 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_x );
+    var_x = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_result );
+    Py_DECREF( var_result );
+    var_result = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_x );
+    var_x = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_result );
+    Py_DECREF( var_result );
+    var_result = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_15_functionEval3 );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_1_functionExec1( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_a = NULL;
+    PyObject *var_code = NULL;
+    PyObject *tmp_exec_1__exec_source = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    PyObject *locals___main__$$$function_1_functionExec1 = NULL;
+    struct Nuitka_FrameObject *frame_d67934f3fe344ceb7e29d8ae3194013c;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *tmp_return_value = NULL;
+    static struct Nuitka_FrameObject *cache_frame_d67934f3fe344ceb7e29d8ae3194013c = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_1_functionExec1 = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_pos_1;
+        assert( var_a == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_a = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = const_str_digest_abad8710825108b72fe08ee2e34b5ad7;
+        assert( var_code == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        var_code = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        CHECK_OBJECT( var_code );
+        tmp_assign_source_3 = var_code;
+        assert( tmp_exec_1__exec_source == NULL );
+        Py_INCREF( tmp_assign_source_3 );
+        tmp_exec_1__exec_source = tmp_assign_source_3;
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        tmp_assign_source_4 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_4 );
+        tmp_exec_1__globals = tmp_assign_source_4;
+    }
+    {
+        PyObject *tmp_assign_source_5;
+        if (locals___main__$$$function_1_functionExec1 == NULL) locals___main__$$$function_1_functionExec1 = PyDict_New();
+        tmp_assign_source_5 = locals___main__$$$function_1_functionExec1;
+        Py_INCREF( tmp_assign_source_5 );
+        if ( var_a != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_a );
+            value = var_a;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_5, (Nuitka_StringObject *)const_str_plain_a, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_5, const_str_plain_a );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        if ( var_code != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_code );
+            value = var_code;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_5, (Nuitka_StringObject *)const_str_plain_code, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_5, const_str_plain_code );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_1__locals == NULL );
+        tmp_exec_1__locals = tmp_assign_source_5;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_d67934f3fe344ceb7e29d8ae3194013c, codeobj_d67934f3fe344ceb7e29d8ae3194013c, module___main__, sizeof(void *)+sizeof(void *) );
+    frame_d67934f3fe344ceb7e29d8ae3194013c = cache_frame_d67934f3fe344ceb7e29d8ae3194013c;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_d67934f3fe344ceb7e29d8ae3194013c );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_d67934f3fe344ceb7e29d8ae3194013c ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        CHECK_OBJECT( tmp_exec_1__exec_source );
+        tmp_exec_source_1 = tmp_exec_1__exec_source;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 58;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 58;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 58;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_1;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_1 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_a );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_1 );
+            Py_XDECREF( exception_keeper_value_1 );
+            Py_XDECREF( exception_keeper_tb_1 );
+
+            exception_lineno = 58;
+            type_description_1 = "oo";
+            goto try_except_handler_2;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_a;
+            var_a = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_code );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_1 );
+            Py_XDECREF( exception_keeper_value_1 );
+            Py_XDECREF( exception_keeper_tb_1 );
+
+            exception_lineno = 58;
+            type_description_1 = "oo";
+            goto try_except_handler_2;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_code;
+            var_code = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        PyObject *tmp_sync_locals_2;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_2 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_a );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 58;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_a;
+            var_a = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_code );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 58;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_code;
+            var_code = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    if ( var_a == NULL )
+    {
+
+        exception_type = PyExc_UnboundLocalError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "a" );
+        exception_tb = NULL;
+
+        exception_lineno = 60;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_return_value = var_a;
+    Py_INCREF( tmp_return_value );
+    goto frame_return_exit_1;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_d67934f3fe344ceb7e29d8ae3194013c );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_return_exit_1:;
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_d67934f3fe344ceb7e29d8ae3194013c );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto try_return_handler_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_d67934f3fe344ceb7e29d8ae3194013c );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_d67934f3fe344ceb7e29d8ae3194013c, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_d67934f3fe344ceb7e29d8ae3194013c->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_d67934f3fe344ceb7e29d8ae3194013c, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_d67934f3fe344ceb7e29d8ae3194013c,
+        type_description_1,
+        var_a,
+        var_code
+    );
+
+
+    // Release cached frame.
+    if ( frame_d67934f3fe344ceb7e29d8ae3194013c == cache_frame_d67934f3fe344ceb7e29d8ae3194013c )
+    {
+        Py_DECREF( frame_d67934f3fe344ceb7e29d8ae3194013c );
+    }
+    cache_frame_d67934f3fe344ceb7e29d8ae3194013c = NULL;
+
+    assertFrameObject( frame_d67934f3fe344ceb7e29d8ae3194013c );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_1_functionExec1 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_a );
+    var_a = NULL;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_a );
+    var_a = NULL;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_1_functionExec1 );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_1_functionExec1 );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_1_functionExec1 );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_2_functionExec2( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_a = NULL;
+    PyObject *var_code = NULL;
+    PyObject *tmp_exec_1__exec_source = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    nuitka_bool tmp_exec_1__plain = NUITKA_BOOL_UNASSIGNED;
+    PyObject *locals___main__$$$function_2_functionExec2 = NULL;
+    struct Nuitka_FrameObject *frame_472f6472b729bfbce6bbbd8b00c24d04;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *tmp_return_value = NULL;
+    static struct Nuitka_FrameObject *cache_frame_472f6472b729bfbce6bbbd8b00c24d04 = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_2_functionExec2 = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_pos_1;
+        assert( var_a == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_a = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = const_str_digest_abad8710825108b72fe08ee2e34b5ad7;
+        assert( var_code == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        var_code = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        CHECK_OBJECT( var_code );
+        tmp_assign_source_3 = var_code;
+        assert( tmp_exec_1__exec_source == NULL );
+        Py_INCREF( tmp_assign_source_3 );
+        tmp_exec_1__exec_source = tmp_assign_source_3;
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        tmp_assign_source_4 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_4 );
+        tmp_exec_1__globals = tmp_assign_source_4;
+    }
+    {
+        PyObject *tmp_assign_source_5;
+        if (locals___main__$$$function_2_functionExec2 == NULL) locals___main__$$$function_2_functionExec2 = PyDict_New();
+        tmp_assign_source_5 = locals___main__$$$function_2_functionExec2;
+        Py_INCREF( tmp_assign_source_5 );
+        if ( var_a != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_a );
+            value = var_a;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_5, (Nuitka_StringObject *)const_str_plain_a, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_5, const_str_plain_a );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        if ( var_code != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_code );
+            value = var_code;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_5, (Nuitka_StringObject *)const_str_plain_code, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_5, const_str_plain_code );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_1__locals == NULL );
+        tmp_exec_1__locals = tmp_assign_source_5;
+    }
+    {
+        nuitka_bool tmp_assign_source_6;
+        tmp_assign_source_6 = NUITKA_BOOL_FALSE;
+        tmp_exec_1__plain = tmp_assign_source_6;
+    }
+    {
+        nuitka_bool tmp_condition_result_1;
+        PyObject *tmp_compexpr_left_1;
+        PyObject *tmp_compexpr_right_1;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_compexpr_left_1 = tmp_exec_1__globals;
+        tmp_compexpr_right_1 = Py_None;
+        tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_1;
+        }
+        else
+        {
+            goto branch_no_1;
+        }
+        branch_yes_1:;
+        {
+            PyObject *tmp_assign_source_7;
+            tmp_assign_source_7 = (PyObject *)moduledict___main__;
+            {
+                PyObject *old = tmp_exec_1__globals;
+                assert( old != NULL );
+                tmp_exec_1__globals = tmp_assign_source_7;
+                Py_INCREF( tmp_exec_1__globals );
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            nuitka_bool tmp_condition_result_2;
+            PyObject *tmp_compexpr_left_2;
+            PyObject *tmp_compexpr_right_2;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_compexpr_left_2 = tmp_exec_1__locals;
+            tmp_compexpr_right_2 = Py_None;
+            tmp_condition_result_2 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_2;
+            }
+            else
+            {
+                goto branch_no_2;
+            }
+            branch_yes_2:;
+            {
+                PyObject *tmp_assign_source_8;
+                if (locals___main__$$$function_2_functionExec2 == NULL) locals___main__$$$function_2_functionExec2 = PyDict_New();
+                tmp_assign_source_8 = locals___main__$$$function_2_functionExec2;
+                Py_INCREF( tmp_assign_source_8 );
+                if ( var_a != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_a );
+                    value = var_a;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_8, (Nuitka_StringObject *)const_str_plain_a, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_8, const_str_plain_a );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                if ( var_code != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_code );
+                    value = var_code;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_8, (Nuitka_StringObject *)const_str_plain_code, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_8, const_str_plain_code );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                {
+                    PyObject *old = tmp_exec_1__locals;
+                    assert( old != NULL );
+                    tmp_exec_1__locals = tmp_assign_source_8;
+                    Py_DECREF( old );
+                }
+
+            }
+            {
+                nuitka_bool tmp_assign_source_9;
+                tmp_assign_source_9 = NUITKA_BOOL_TRUE;
+                tmp_exec_1__plain = tmp_assign_source_9;
+            }
+            branch_no_2:;
+        }
+        goto branch_end_1;
+        branch_no_1:;
+        {
+            nuitka_bool tmp_condition_result_3;
+            PyObject *tmp_compexpr_left_3;
+            PyObject *tmp_compexpr_right_3;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_compexpr_left_3 = tmp_exec_1__locals;
+            tmp_compexpr_right_3 = Py_None;
+            tmp_condition_result_3 = ( tmp_compexpr_left_3 == tmp_compexpr_right_3 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_3 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_3;
+            }
+            else
+            {
+                goto branch_no_3;
+            }
+            branch_yes_3:;
+            {
+                PyObject *tmp_assign_source_10;
+                CHECK_OBJECT( tmp_exec_1__globals );
+                tmp_assign_source_10 = tmp_exec_1__globals;
+                {
+                    PyObject *old = tmp_exec_1__locals;
+                    assert( old != NULL );
+                    tmp_exec_1__locals = tmp_assign_source_10;
+                    Py_INCREF( tmp_exec_1__locals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_3:;
+        }
+        branch_end_1:;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_472f6472b729bfbce6bbbd8b00c24d04, codeobj_472f6472b729bfbce6bbbd8b00c24d04, module___main__, sizeof(void *)+sizeof(void *) );
+    frame_472f6472b729bfbce6bbbd8b00c24d04 = cache_frame_472f6472b729bfbce6bbbd8b00c24d04;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_472f6472b729bfbce6bbbd8b00c24d04 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_472f6472b729bfbce6bbbd8b00c24d04 ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        CHECK_OBJECT( tmp_exec_1__exec_source );
+        tmp_exec_source_1 = tmp_exec_1__exec_source;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 66;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 66;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 66;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        nuitka_bool tmp_condition_result_4;
+        nuitka_bool tmp_compexpr_left_4;
+        nuitka_bool tmp_compexpr_right_4;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_4 = tmp_exec_1__plain;
+        tmp_compexpr_right_4 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_4 = ( tmp_compexpr_left_4 == tmp_compexpr_right_4 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_4 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_4;
+        }
+        else
+        {
+            goto branch_no_4;
+        }
+        branch_yes_4:;
+        {
+            PyObject *tmp_sync_locals_1;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_1 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_a );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 66;
+                type_description_1 = "oo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_a;
+                var_a = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 66;
+                type_description_1 = "oo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_4:;
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    Py_XDECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        nuitka_bool tmp_condition_result_5;
+        nuitka_bool tmp_compexpr_left_5;
+        nuitka_bool tmp_compexpr_right_5;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_5 = tmp_exec_1__plain;
+        tmp_compexpr_right_5 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_5 = ( tmp_compexpr_left_5 == tmp_compexpr_right_5 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_5 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_5;
+        }
+        else
+        {
+            goto branch_no_5;
+        }
+        branch_yes_5:;
+        {
+            PyObject *tmp_sync_locals_2;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_2 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_a );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 66;
+                type_description_1 = "oo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_a;
+                var_a = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 66;
+                type_description_1 = "oo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_5:;
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    Py_XDECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    if ( var_a == NULL )
+    {
+
+        exception_type = PyExc_UnboundLocalError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "a" );
+        exception_tb = NULL;
+
+        exception_lineno = 68;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_return_value = var_a;
+    Py_INCREF( tmp_return_value );
+    goto frame_return_exit_1;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_472f6472b729bfbce6bbbd8b00c24d04 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_return_exit_1:;
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_472f6472b729bfbce6bbbd8b00c24d04 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto try_return_handler_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_472f6472b729bfbce6bbbd8b00c24d04 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_472f6472b729bfbce6bbbd8b00c24d04, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_472f6472b729bfbce6bbbd8b00c24d04->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_472f6472b729bfbce6bbbd8b00c24d04, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_472f6472b729bfbce6bbbd8b00c24d04,
+        type_description_1,
+        var_a,
+        var_code
+    );
+
+
+    // Release cached frame.
+    if ( frame_472f6472b729bfbce6bbbd8b00c24d04 == cache_frame_472f6472b729bfbce6bbbd8b00c24d04 )
+    {
+        Py_DECREF( frame_472f6472b729bfbce6bbbd8b00c24d04 );
+    }
+    cache_frame_472f6472b729bfbce6bbbd8b00c24d04 = NULL;
+
+    assertFrameObject( frame_472f6472b729bfbce6bbbd8b00c24d04 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_2_functionExec2 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_a );
+    var_a = NULL;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_a );
+    var_a = NULL;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_2_functionExec2 );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_2_functionExec2 );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_2_functionExec2 );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_16_functionExecfile( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_global_vars = NULL;
+    PyObject *var_local_vars = NULL;
+    PyObject *var_x = NULL;
+    PyObject *tmp_execfile_call_1__globals = NULL;
+    PyObject *tmp_execfile_call_1__locals = NULL;
+    struct Nuitka_FrameObject *frame_b0336bb790b5bbc97a76086edd70e3df;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *tmp_print_value;
+    bool tmp_result;
+    int tmp_res;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    static struct Nuitka_FrameObject *cache_frame_b0336bb790b5bbc97a76086edd70e3df = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+
+    // Actual function body.
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = PyDict_Copy( const_dict_d7a83763264779d47b24cb7ebf0196f6 );
+        assert( var_global_vars == NULL );
+        var_global_vars = tmp_assign_source_1;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_b0336bb790b5bbc97a76086edd70e3df, codeobj_b0336bb790b5bbc97a76086edd70e3df, module___main__, sizeof(void *)+sizeof(void *)+sizeof(void *)+sizeof(void *)+sizeof(void *) );
+    frame_b0336bb790b5bbc97a76086edd70e3df = cache_frame_b0336bb790b5bbc97a76086edd70e3df;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_b0336bb790b5bbc97a76086edd70e3df );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_b0336bb790b5bbc97a76086edd70e3df ) == 2 ); // Frame stack
+
+    // Framed code:
+    {
+        PyObject *tmp_assign_source_2;
+        PyObject *tmp_dict_seq_1;
+        CHECK_OBJECT( var_global_vars );
+        tmp_dict_seq_1 = var_global_vars;
+        tmp_assign_source_2 = TO_DICT( tmp_dict_seq_1, NULL );
+        if ( tmp_assign_source_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 98;
+            type_description_1 = "ooNoN";
+            goto frame_exception_exit_1;
+        }
+        assert( var_local_vars == NULL );
+        var_local_vars = tmp_assign_source_2;
+    }
+    tmp_print_value = const_str_digest_4b194deb8804510009fd513a06c46b46;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 100;
+        type_description_1 = "ooNoN";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        {
+            PyObject *tmp_assign_source_4;
+            CHECK_OBJECT( var_global_vars );
+            tmp_assign_source_4 = var_global_vars;
+            assert( tmp_execfile_call_1__globals == NULL );
+            Py_INCREF( tmp_assign_source_4 );
+            tmp_execfile_call_1__globals = tmp_assign_source_4;
+        }
+        {
+            PyObject *tmp_assign_source_5;
+            CHECK_OBJECT( var_local_vars );
+            tmp_assign_source_5 = var_local_vars;
+            assert( tmp_execfile_call_1__locals == NULL );
+            Py_INCREF( tmp_assign_source_5 );
+            tmp_execfile_call_1__locals = tmp_assign_source_5;
+        }
+        {
+            nuitka_bool tmp_condition_result_1;
+            PyObject *tmp_compexpr_left_1;
+            PyObject *tmp_compexpr_right_1;
+            CHECK_OBJECT( tmp_execfile_call_1__locals );
+            tmp_compexpr_left_1 = tmp_execfile_call_1__locals;
+            tmp_compexpr_right_1 = Py_None;
+            tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_1;
+            }
+            else
+            {
+                goto branch_no_1;
+            }
+            branch_yes_1:;
+            {
+                PyObject *tmp_assign_source_6;
+                nuitka_bool tmp_condition_result_2;
+                PyObject *tmp_compexpr_left_2;
+                PyObject *tmp_compexpr_right_2;
+                PyObject *tmp_dict_key_1;
+                PyObject *tmp_dict_value_1;
+                PyObject *tmp_dict_key_2;
+                PyObject *tmp_dict_value_2;
+                PyObject *tmp_dict_key_3;
+                PyObject *tmp_dict_value_3;
+                PyObject *tmp_dict_key_4;
+                PyObject *tmp_dict_value_4;
+                CHECK_OBJECT( tmp_execfile_call_1__globals );
+                tmp_compexpr_left_2 = tmp_execfile_call_1__globals;
+                tmp_compexpr_right_2 = Py_None;
+                tmp_condition_result_2 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+                if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+                {
+                    goto condexpr_true_1;
+                }
+                else
+                {
+                    goto condexpr_false_1;
+                }
+                condexpr_true_1:;
+                CHECK_OBJECT( var_global_vars );
+                tmp_dict_value_1 = var_global_vars;
+                tmp_dict_key_1 = const_str_plain_global_vars;
+                tmp_assign_source_6 = _PyDict_NewPresized( 4 );
+                tmp_res = PyDict_SetItem( tmp_assign_source_6, tmp_dict_key_1, tmp_dict_value_1 );
+                assert( !(tmp_res != 0) );
+                CHECK_OBJECT( var_local_vars );
+                tmp_dict_value_2 = var_local_vars;
+                tmp_dict_key_2 = const_str_plain_local_vars;
+                tmp_res = PyDict_SetItem( tmp_assign_source_6, tmp_dict_key_2, tmp_dict_value_2 );
+                assert( !(tmp_res != 0) );
+                tmp_dict_value_3 = const_int_0;
+                tmp_dict_key_3 = const_str_plain_e;
+                tmp_res = PyDict_SetItem( tmp_assign_source_6, tmp_dict_key_3, tmp_dict_value_3 );
+                assert( !(tmp_res != 0) );
+                tmp_dict_value_4 = const_int_0;
+                tmp_dict_key_4 = const_str_plain_f;
+                tmp_res = PyDict_SetItem( tmp_assign_source_6, tmp_dict_key_4, tmp_dict_value_4 );
+                assert( !(tmp_res != 0) );
+                goto condexpr_end_1;
+                condexpr_false_1:;
+                CHECK_OBJECT( tmp_execfile_call_1__globals );
+                tmp_assign_source_6 = tmp_execfile_call_1__globals;
+                Py_INCREF( tmp_assign_source_6 );
+                condexpr_end_1:;
+                {
+                    PyObject *old = tmp_execfile_call_1__locals;
+                    assert( old != NULL );
+                    tmp_execfile_call_1__locals = tmp_assign_source_6;
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_1:;
+        }
+        {
+            nuitka_bool tmp_condition_result_3;
+            PyObject *tmp_compexpr_left_3;
+            PyObject *tmp_compexpr_right_3;
+            CHECK_OBJECT( tmp_execfile_call_1__globals );
+            tmp_compexpr_left_3 = tmp_execfile_call_1__globals;
+            tmp_compexpr_right_3 = Py_None;
+            tmp_condition_result_3 = ( tmp_compexpr_left_3 == tmp_compexpr_right_3 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_3 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_2;
+            }
+            else
+            {
+                goto branch_no_2;
+            }
+            branch_yes_2:;
+            {
+                PyObject *tmp_assign_source_7;
+                tmp_assign_source_7 = (PyObject *)moduledict___main__;
+                {
+                    PyObject *old = tmp_execfile_call_1__globals;
+                    assert( old != NULL );
+                    tmp_execfile_call_1__globals = tmp_assign_source_7;
+                    Py_INCREF( tmp_execfile_call_1__globals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_2:;
+        }
+        // Tried code:
+        {
+            PyObject *tmp_eval_source_1;
+            PyObject *tmp_eval_globals_1;
+            PyObject *tmp_eval_locals_1;
+            PyObject *tmp_called_instance_1;
+            PyObject *tmp_open_filename_1;
+            PyObject *tmp_mvar_value_1;
+            PyObject *tmp_open_mode_1;
+            PyObject *tmp_eval_compiled_1;
+            tmp_mvar_value_1 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+
+            if (unlikely( tmp_mvar_value_1 == NULL ))
+            {
+                tmp_mvar_value_1 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+            }
+
+            if ( tmp_mvar_value_1 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "global name '%s' is not defined", "tmp_filename" );
+                exception_tb = NULL;
+
+                exception_lineno = 101;
+                type_description_1 = "ooNoN";
+                goto try_except_handler_2;
+            }
+
+            tmp_open_filename_1 = tmp_mvar_value_1;
+            tmp_open_mode_1 = const_str_plain_rU;
+            tmp_called_instance_1 = BUILTIN_OPEN( tmp_open_filename_1, tmp_open_mode_1, NULL );
+            if ( tmp_called_instance_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 101;
+                type_description_1 = "ooNoN";
+                goto try_except_handler_2;
+            }
+            frame_b0336bb790b5bbc97a76086edd70e3df->m_frame.f_lineno = 101;
+            tmp_eval_source_1 = CALL_METHOD_NO_ARGS( tmp_called_instance_1, const_str_plain_read );
+            Py_DECREF( tmp_called_instance_1 );
+            if ( tmp_eval_source_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 101;
+                type_description_1 = "ooNoN";
+                goto try_except_handler_2;
+            }
+            CHECK_OBJECT( tmp_execfile_call_1__globals );
+            tmp_eval_globals_1 = tmp_execfile_call_1__globals;
+            CHECK_OBJECT( tmp_execfile_call_1__locals );
+            tmp_eval_locals_1 = tmp_execfile_call_1__locals;
+            tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_execfile, const_str_plain_exec, NULL, NULL );
+            Py_DECREF( tmp_eval_source_1 );
+            if ( tmp_eval_compiled_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 101;
+                type_description_1 = "ooNoN";
+                goto try_except_handler_2;
+            }
+            tmp_assign_source_3 = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+            Py_DECREF( tmp_eval_compiled_1 );
+            if ( tmp_assign_source_3 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 101;
+                type_description_1 = "ooNoN";
+                goto try_except_handler_2;
+            }
+            goto try_return_handler_2;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_16_functionExecfile );
+        return NULL;
+        // Return handler code:
+        try_return_handler_2:;
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__globals );
+        Py_DECREF( tmp_execfile_call_1__globals );
+        tmp_execfile_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__locals );
+        Py_DECREF( tmp_execfile_call_1__locals );
+        tmp_execfile_call_1__locals = NULL;
+
+        goto outline_result_1;
+        // Exception handler code:
+        try_except_handler_2:;
+        exception_keeper_type_1 = exception_type;
+        exception_keeper_value_1 = exception_value;
+        exception_keeper_tb_1 = exception_tb;
+        exception_keeper_lineno_1 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__globals );
+        Py_DECREF( tmp_execfile_call_1__globals );
+        tmp_execfile_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__locals );
+        Py_DECREF( tmp_execfile_call_1__locals );
+        tmp_execfile_call_1__locals = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_1;
+        exception_value = exception_keeper_value_1;
+        exception_tb = exception_keeper_tb_1;
+        exception_lineno = exception_keeper_lineno_1;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_16_functionExecfile );
+        return NULL;
+        outline_result_1:;
+        assert( var_x == NULL );
+        var_x = tmp_assign_source_3;
+    }
+    CHECK_OBJECT( var_x );
+    tmp_print_value = var_x;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 102;
+        type_description_1 = "ooNoN";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_instance_2;
+        CHECK_OBJECT( var_global_vars );
+        tmp_called_instance_2 = var_global_vars;
+        frame_b0336bb790b5bbc97a76086edd70e3df->m_frame.f_lineno = 103;
+        tmp_print_value = CALL_METHOD_NO_ARGS( tmp_called_instance_2, const_str_plain_keys );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 103;
+            type_description_1 = "ooNoN";
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 103;
+            type_description_1 = "ooNoN";
+            goto frame_exception_exit_1;
+        }
+    }
+    CHECK_OBJECT( var_local_vars );
+    tmp_print_value = var_local_vars;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 103;
+        type_description_1 = "ooNoN";
+        goto frame_exception_exit_1;
+    }
+    tmp_print_value = const_str_plain_0;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 103;
+        type_description_1 = "ooNoN";
+        goto frame_exception_exit_1;
+    }
+    tmp_print_value = const_str_plain_0;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 103;
+        type_description_1 = "ooNoN";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 103;
+        type_description_1 = "ooNoN";
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_b0336bb790b5bbc97a76086edd70e3df );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_b0336bb790b5bbc97a76086edd70e3df );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_b0336bb790b5bbc97a76086edd70e3df, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_b0336bb790b5bbc97a76086edd70e3df->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_b0336bb790b5bbc97a76086edd70e3df, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_b0336bb790b5bbc97a76086edd70e3df,
+        type_description_1,
+        var_global_vars,
+        var_local_vars,
+        NULL,
+        var_x,
+        NULL
+    );
+
+
+    // Release cached frame.
+    if ( frame_b0336bb790b5bbc97a76086edd70e3df == cache_frame_b0336bb790b5bbc97a76086edd70e3df )
+    {
+        Py_DECREF( frame_b0336bb790b5bbc97a76086edd70e3df );
+    }
+    cache_frame_b0336bb790b5bbc97a76086edd70e3df = NULL;
+
+    assertFrameObject( frame_b0336bb790b5bbc97a76086edd70e3df );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_16_functionExecfile );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    CHECK_OBJECT( (PyObject *)var_global_vars );
+    Py_DECREF( var_global_vars );
+    var_global_vars = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_local_vars );
+    Py_DECREF( var_local_vars );
+    var_local_vars = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_x );
+    Py_DECREF( var_x );
+    var_x = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)var_global_vars );
+    Py_DECREF( var_global_vars );
+    var_global_vars = NULL;
+
+    Py_XDECREF( var_local_vars );
+    var_local_vars = NULL;
+
+    Py_XDECREF( var_x );
+    var_x = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_16_functionExecfile );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_3_functionExecNonesTuple( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_f = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    PyObject *locals___main__$$$function_3_functionExecNonesTuple = NULL;
+    struct Nuitka_FrameObject *frame_e26d2d618dc98f60c4cee33ec95bb6a6;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *tmp_print_value;
+    static struct Nuitka_FrameObject *cache_frame_e26d2d618dc98f60c4cee33ec95bb6a6 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_3_functionExecNonesTuple = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_0;
+        assert( var_f == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_f = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        tmp_exec_1__globals = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        if (locals___main__$$$function_3_functionExecNonesTuple == NULL) locals___main__$$$function_3_functionExecNonesTuple = PyDict_New();
+        tmp_assign_source_3 = locals___main__$$$function_3_functionExecNonesTuple;
+        Py_INCREF( tmp_assign_source_3 );
+        if ( var_f != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_f );
+            value = var_f;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_3, (Nuitka_StringObject *)const_str_plain_f, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_3, const_str_plain_f );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_1__locals == NULL );
+        tmp_exec_1__locals = tmp_assign_source_3;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_e26d2d618dc98f60c4cee33ec95bb6a6, codeobj_e26d2d618dc98f60c4cee33ec95bb6a6, module___main__, sizeof(void *) );
+    frame_e26d2d618dc98f60c4cee33ec95bb6a6 = cache_frame_e26d2d618dc98f60c4cee33ec95bb6a6;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_e26d2d618dc98f60c4cee33ec95bb6a6 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_e26d2d618dc98f60c4cee33ec95bb6a6 ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        tmp_exec_source_1 = const_str_digest_b005fb9fba2b19875ef69d94173f0be0;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 123;
+            type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 123;
+            type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 123;
+            type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_1;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_1 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_f );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_1 );
+            Py_XDECREF( exception_keeper_value_1 );
+            Py_XDECREF( exception_keeper_tb_1 );
+
+            exception_lineno = 123;
+            type_description_1 = "o";
+            goto try_except_handler_2;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_f;
+            var_f = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        PyObject *tmp_sync_locals_2;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_2 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_f );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 123;
+            type_description_1 = "o";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_f;
+            var_f = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    tmp_print_value = const_str_digest_b6fe7a4dee6abbb04f9a378b95c034fa;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 124;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+    if ( var_f == NULL )
+    {
+
+        exception_type = PyExc_UnboundLocalError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "f" );
+        exception_tb = NULL;
+
+        exception_lineno = 124;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_print_value = var_f;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 124;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 124;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_e26d2d618dc98f60c4cee33ec95bb6a6 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_e26d2d618dc98f60c4cee33ec95bb6a6 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_e26d2d618dc98f60c4cee33ec95bb6a6, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_e26d2d618dc98f60c4cee33ec95bb6a6->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_e26d2d618dc98f60c4cee33ec95bb6a6, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_e26d2d618dc98f60c4cee33ec95bb6a6,
+        type_description_1,
+        var_f
+    );
+
+
+    // Release cached frame.
+    if ( frame_e26d2d618dc98f60c4cee33ec95bb6a6 == cache_frame_e26d2d618dc98f60c4cee33ec95bb6a6 )
+    {
+        Py_DECREF( frame_e26d2d618dc98f60c4cee33ec95bb6a6 );
+    }
+    cache_frame_e26d2d618dc98f60c4cee33ec95bb6a6 = NULL;
+
+    assertFrameObject( frame_e26d2d618dc98f60c4cee33ec95bb6a6 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_3_functionExecNonesTuple );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_3_functionExecNonesTuple );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_3_functionExecNonesTuple );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_3_functionExecNonesTuple );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_4_functionExecNonesSyntax( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_f = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    PyObject *locals___main__$$$function_4_functionExecNonesSyntax = NULL;
+    struct Nuitka_FrameObject *frame_af258049efa2050aa4d2842fd8645d14;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *tmp_print_value;
+    static struct Nuitka_FrameObject *cache_frame_af258049efa2050aa4d2842fd8645d14 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_4_functionExecNonesSyntax = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_0;
+        assert( var_f == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_f = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        tmp_exec_1__globals = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        if (locals___main__$$$function_4_functionExecNonesSyntax == NULL) locals___main__$$$function_4_functionExecNonesSyntax = PyDict_New();
+        tmp_assign_source_3 = locals___main__$$$function_4_functionExecNonesSyntax;
+        Py_INCREF( tmp_assign_source_3 );
+        if ( var_f != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_f );
+            value = var_f;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_3, (Nuitka_StringObject *)const_str_plain_f, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_3, const_str_plain_f );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_1__locals == NULL );
+        tmp_exec_1__locals = tmp_assign_source_3;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_af258049efa2050aa4d2842fd8645d14, codeobj_af258049efa2050aa4d2842fd8645d14, module___main__, sizeof(void *) );
+    frame_af258049efa2050aa4d2842fd8645d14 = cache_frame_af258049efa2050aa4d2842fd8645d14;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_af258049efa2050aa4d2842fd8645d14 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_af258049efa2050aa4d2842fd8645d14 ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        tmp_exec_source_1 = const_str_digest_ff0a6018ba8f720c664541ccefa60fc8;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 128;
+            type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 128;
+            type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 128;
+            type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_1;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_1 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_f );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_1 );
+            Py_XDECREF( exception_keeper_value_1 );
+            Py_XDECREF( exception_keeper_tb_1 );
+
+            exception_lineno = 128;
+            type_description_1 = "o";
+            goto try_except_handler_2;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_f;
+            var_f = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        PyObject *tmp_sync_locals_2;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_2 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_f );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 128;
+            type_description_1 = "o";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_f;
+            var_f = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    tmp_print_value = const_str_digest_4e8ba78bb68185a62646568d766f622d;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 129;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+    if ( var_f == NULL )
+    {
+
+        exception_type = PyExc_UnboundLocalError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "f" );
+        exception_tb = NULL;
+
+        exception_lineno = 129;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_print_value = var_f;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 129;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 129;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_af258049efa2050aa4d2842fd8645d14 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_af258049efa2050aa4d2842fd8645d14 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_af258049efa2050aa4d2842fd8645d14, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_af258049efa2050aa4d2842fd8645d14->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_af258049efa2050aa4d2842fd8645d14, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_af258049efa2050aa4d2842fd8645d14,
+        type_description_1,
+        var_f
+    );
+
+
+    // Release cached frame.
+    if ( frame_af258049efa2050aa4d2842fd8645d14 == cache_frame_af258049efa2050aa4d2842fd8645d14 )
+    {
+        Py_DECREF( frame_af258049efa2050aa4d2842fd8645d14 );
+    }
+    cache_frame_af258049efa2050aa4d2842fd8645d14 = NULL;
+
+    assertFrameObject( frame_af258049efa2050aa4d2842fd8645d14 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_4_functionExecNonesSyntax );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_4_functionExecNonesSyntax );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_4_functionExecNonesSyntax );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_4_functionExecNonesSyntax );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_17_functionEvalNones2( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_f1 = NULL;
+    PyObject *tmp_eval_call_1__globals = NULL;
+    PyObject *tmp_eval_call_1__locals = NULL;
+    PyObject *tmp_eval_call_1__source = NULL;
+    struct Nuitka_FrameObject *frame_a09c1147a92e95201ba715c7d121c66f;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_print_value;
+    bool tmp_result;
+    static struct Nuitka_FrameObject *cache_frame_a09c1147a92e95201ba715c7d121c66f = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+
+    // Actual function body.
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_a09c1147a92e95201ba715c7d121c66f, codeobj_a09c1147a92e95201ba715c7d121c66f, module___main__, sizeof(void *)+sizeof(void *)+sizeof(void *)+sizeof(void *)+sizeof(void *) );
+    frame_a09c1147a92e95201ba715c7d121c66f = cache_frame_a09c1147a92e95201ba715c7d121c66f;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_a09c1147a92e95201ba715c7d121c66f );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_a09c1147a92e95201ba715c7d121c66f ) == 2 ); // Frame stack
+
+    // Framed code:
+    {
+        PyObject *tmp_assign_source_1;
+        {
+            PyObject *tmp_assign_source_2;
+            tmp_assign_source_2 = PyDict_Copy( const_dict_1c8abfc1519cfeb18a5406f0d5baaf73 );
+            assert( tmp_eval_call_1__locals == NULL );
+            tmp_eval_call_1__locals = tmp_assign_source_2;
+        }
+        {
+            PyObject *tmp_assign_source_3;
+            tmp_assign_source_3 = (PyObject *)moduledict___main__;
+            assert( tmp_eval_call_1__globals == NULL );
+            Py_INCREF( tmp_assign_source_3 );
+            tmp_eval_call_1__globals = tmp_assign_source_3;
+        }
+        {
+            PyObject *tmp_assign_source_4;
+            tmp_assign_source_4 = const_str_plain_f;
+            assert( tmp_eval_call_1__source == NULL );
+            Py_INCREF( tmp_assign_source_4 );
+            tmp_eval_call_1__source = tmp_assign_source_4;
+        }
+        // Tried code:
+        {
+            PyObject *tmp_assign_source_5;
+            PyObject *tmp_called_instance_1;
+            tmp_called_instance_1 = const_str_plain_f;
+            frame_a09c1147a92e95201ba715c7d121c66f->m_frame.f_lineno = 143;
+            tmp_assign_source_5 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_1, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+            if ( tmp_assign_source_5 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 143;
+                type_description_1 = "oNNNN";
+                goto try_except_handler_2;
+            }
+            {
+                PyObject *old = tmp_eval_call_1__source;
+                assert( old != NULL );
+                tmp_eval_call_1__source = tmp_assign_source_5;
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            PyObject *tmp_eval_source_1;
+            PyObject *tmp_eval_globals_1;
+            PyObject *tmp_eval_locals_1;
+            PyObject *tmp_eval_compiled_1;
+            CHECK_OBJECT( tmp_eval_call_1__source );
+            tmp_eval_source_1 = tmp_eval_call_1__source;
+            CHECK_OBJECT( tmp_eval_call_1__globals );
+            tmp_eval_globals_1 = tmp_eval_call_1__globals;
+            CHECK_OBJECT( tmp_eval_call_1__locals );
+            tmp_eval_locals_1 = tmp_eval_call_1__locals;
+            tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+            if ( tmp_eval_compiled_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 143;
+                type_description_1 = "oNNNN";
+                goto try_except_handler_2;
+            }
+            tmp_assign_source_1 = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+            Py_DECREF( tmp_eval_compiled_1 );
+            if ( tmp_assign_source_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 143;
+                type_description_1 = "oNNNN";
+                goto try_except_handler_2;
+            }
+            goto try_return_handler_2;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_17_functionEvalNones2 );
+        return NULL;
+        // Return handler code:
+        try_return_handler_2:;
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+        Py_DECREF( tmp_eval_call_1__globals );
+        tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+        Py_DECREF( tmp_eval_call_1__locals );
+        tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( tmp_eval_call_1__source );
+        tmp_eval_call_1__source = NULL;
+
+        goto outline_result_1;
+        // Exception handler code:
+        try_except_handler_2:;
+        exception_keeper_type_1 = exception_type;
+        exception_keeper_value_1 = exception_value;
+        exception_keeper_tb_1 = exception_tb;
+        exception_keeper_lineno_1 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+        Py_DECREF( tmp_eval_call_1__globals );
+        tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+        Py_DECREF( tmp_eval_call_1__locals );
+        tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( tmp_eval_call_1__source );
+        tmp_eval_call_1__source = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_1;
+        exception_value = exception_keeper_value_1;
+        exception_tb = exception_keeper_tb_1;
+        exception_lineno = exception_keeper_lineno_1;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_17_functionEvalNones2 );
+        return NULL;
+        outline_result_1:;
+        assert( var_f1 == NULL );
+        var_f1 = tmp_assign_source_1;
+    }
+    tmp_print_value = const_str_digest_19fc81ddf40563cb1855b82f72d1d59d;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 145;
+        type_description_1 = "oNNNN";
+        goto frame_exception_exit_1;
+    }
+    CHECK_OBJECT( var_f1 );
+    tmp_print_value = var_f1;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 145;
+        type_description_1 = "oNNNN";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 145;
+        type_description_1 = "oNNNN";
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_a09c1147a92e95201ba715c7d121c66f );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_a09c1147a92e95201ba715c7d121c66f );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_a09c1147a92e95201ba715c7d121c66f, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_a09c1147a92e95201ba715c7d121c66f->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_a09c1147a92e95201ba715c7d121c66f, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_a09c1147a92e95201ba715c7d121c66f,
+        type_description_1,
+        var_f1,
+        NULL,
+        NULL,
+        NULL,
+        NULL
+    );
+
+
+    // Release cached frame.
+    if ( frame_a09c1147a92e95201ba715c7d121c66f == cache_frame_a09c1147a92e95201ba715c7d121c66f )
+    {
+        Py_DECREF( frame_a09c1147a92e95201ba715c7d121c66f );
+    }
+    cache_frame_a09c1147a92e95201ba715c7d121c66f = NULL;
+
+    assertFrameObject( frame_a09c1147a92e95201ba715c7d121c66f );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_17_functionEvalNones2 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    CHECK_OBJECT( (PyObject *)var_f1 );
+    Py_DECREF( var_f1 );
+    var_f1 = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_f1 );
+    var_f1 = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_17_functionEvalNones2 );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_5_functionExecNonesTuple2( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_code = NULL;
+    PyObject *var_l = NULL;
+    PyObject *var_g = NULL;
+    PyObject *var_f = NULL;
+    PyObject *tmp_exec_1__exec_source = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    nuitka_bool tmp_exec_1__plain = NUITKA_BOOL_UNASSIGNED;
+    PyObject *locals___main__$$$function_5_functionExecNonesTuple2 = NULL;
+    struct Nuitka_FrameObject *frame_304cc3492cfb936d1b66ffa5445800a3;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *tmp_print_value;
+    static struct Nuitka_FrameObject *cache_frame_304cc3492cfb936d1b66ffa5445800a3 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_5_functionExecNonesTuple2 = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_0;
+        assert( var_f == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_f = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = const_str_digest_b005fb9fba2b19875ef69d94173f0be0;
+        assert( var_code == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        var_code = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        tmp_assign_source_3 = Py_None;
+        assert( var_g == NULL );
+        Py_INCREF( tmp_assign_source_3 );
+        var_g = tmp_assign_source_3;
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        tmp_assign_source_4 = Py_None;
+        assert( var_l == NULL );
+        Py_INCREF( tmp_assign_source_4 );
+        var_l = tmp_assign_source_4;
+    }
+    {
+        PyObject *tmp_assign_source_5;
+        CHECK_OBJECT( var_code );
+        tmp_assign_source_5 = var_code;
+        assert( tmp_exec_1__exec_source == NULL );
+        Py_INCREF( tmp_assign_source_5 );
+        tmp_exec_1__exec_source = tmp_assign_source_5;
+    }
+    {
+        PyObject *tmp_assign_source_6;
+        CHECK_OBJECT( var_l );
+        tmp_assign_source_6 = var_l;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_6 );
+        tmp_exec_1__globals = tmp_assign_source_6;
+    }
+    {
+        PyObject *tmp_assign_source_7;
+        CHECK_OBJECT( var_g );
+        tmp_assign_source_7 = var_g;
+        assert( tmp_exec_1__locals == NULL );
+        Py_INCREF( tmp_assign_source_7 );
+        tmp_exec_1__locals = tmp_assign_source_7;
+    }
+    {
+        nuitka_bool tmp_assign_source_8;
+        tmp_assign_source_8 = NUITKA_BOOL_FALSE;
+        tmp_exec_1__plain = tmp_assign_source_8;
+    }
+    {
+        nuitka_bool tmp_condition_result_1;
+        PyObject *tmp_compexpr_left_1;
+        PyObject *tmp_compexpr_right_1;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_compexpr_left_1 = tmp_exec_1__globals;
+        tmp_compexpr_right_1 = Py_None;
+        tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_1;
+        }
+        else
+        {
+            goto branch_no_1;
+        }
+        branch_yes_1:;
+        {
+            PyObject *tmp_assign_source_9;
+            tmp_assign_source_9 = (PyObject *)moduledict___main__;
+            {
+                PyObject *old = tmp_exec_1__globals;
+                assert( old != NULL );
+                tmp_exec_1__globals = tmp_assign_source_9;
+                Py_INCREF( tmp_exec_1__globals );
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            nuitka_bool tmp_condition_result_2;
+            PyObject *tmp_compexpr_left_2;
+            PyObject *tmp_compexpr_right_2;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_compexpr_left_2 = tmp_exec_1__locals;
+            tmp_compexpr_right_2 = Py_None;
+            tmp_condition_result_2 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_2;
+            }
+            else
+            {
+                goto branch_no_2;
+            }
+            branch_yes_2:;
+            {
+                PyObject *tmp_assign_source_10;
+                if (locals___main__$$$function_5_functionExecNonesTuple2 == NULL) locals___main__$$$function_5_functionExecNonesTuple2 = PyDict_New();
+                tmp_assign_source_10 = locals___main__$$$function_5_functionExecNonesTuple2;
+                Py_INCREF( tmp_assign_source_10 );
+                if ( var_f != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_f );
+                    value = var_f;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_f, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_f );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                if ( var_code != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_code );
+                    value = var_code;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_code, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_code );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                if ( var_g != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_g );
+                    value = var_g;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_g, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_g );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                if ( var_l != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_l );
+                    value = var_l;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_l, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_l );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                {
+                    PyObject *old = tmp_exec_1__locals;
+                    assert( old != NULL );
+                    tmp_exec_1__locals = tmp_assign_source_10;
+                    Py_DECREF( old );
+                }
+
+            }
+            {
+                nuitka_bool tmp_assign_source_11;
+                tmp_assign_source_11 = NUITKA_BOOL_TRUE;
+                tmp_exec_1__plain = tmp_assign_source_11;
+            }
+            branch_no_2:;
+        }
+        goto branch_end_1;
+        branch_no_1:;
+        {
+            nuitka_bool tmp_condition_result_3;
+            PyObject *tmp_compexpr_left_3;
+            PyObject *tmp_compexpr_right_3;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_compexpr_left_3 = tmp_exec_1__locals;
+            tmp_compexpr_right_3 = Py_None;
+            tmp_condition_result_3 = ( tmp_compexpr_left_3 == tmp_compexpr_right_3 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_3 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_3;
+            }
+            else
+            {
+                goto branch_no_3;
+            }
+            branch_yes_3:;
+            {
+                PyObject *tmp_assign_source_12;
+                CHECK_OBJECT( tmp_exec_1__globals );
+                tmp_assign_source_12 = tmp_exec_1__globals;
+                {
+                    PyObject *old = tmp_exec_1__locals;
+                    assert( old != NULL );
+                    tmp_exec_1__locals = tmp_assign_source_12;
+                    Py_INCREF( tmp_exec_1__locals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_3:;
+        }
+        branch_end_1:;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_304cc3492cfb936d1b66ffa5445800a3, codeobj_304cc3492cfb936d1b66ffa5445800a3, module___main__, sizeof(void *)+sizeof(void *)+sizeof(void *)+sizeof(void *) );
+    frame_304cc3492cfb936d1b66ffa5445800a3 = cache_frame_304cc3492cfb936d1b66ffa5445800a3;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_304cc3492cfb936d1b66ffa5445800a3 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_304cc3492cfb936d1b66ffa5445800a3 ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        CHECK_OBJECT( tmp_exec_1__exec_source );
+        tmp_exec_source_1 = tmp_exec_1__exec_source;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 157;
+            type_description_1 = "oooo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 157;
+            type_description_1 = "oooo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 157;
+            type_description_1 = "oooo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        nuitka_bool tmp_condition_result_4;
+        nuitka_bool tmp_compexpr_left_4;
+        nuitka_bool tmp_compexpr_right_4;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_4 = tmp_exec_1__plain;
+        tmp_compexpr_right_4 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_4 = ( tmp_compexpr_left_4 == tmp_compexpr_right_4 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_4 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_4;
+        }
+        else
+        {
+            goto branch_no_4;
+        }
+        branch_yes_4:;
+        {
+            PyObject *tmp_sync_locals_1;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_1 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_f );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_f;
+                var_f = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_g );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_g;
+                var_g = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_l );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_l;
+                var_l = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_4:;
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    Py_XDECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        nuitka_bool tmp_condition_result_5;
+        nuitka_bool tmp_compexpr_left_5;
+        nuitka_bool tmp_compexpr_right_5;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_5 = tmp_exec_1__plain;
+        tmp_compexpr_right_5 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_5 = ( tmp_compexpr_left_5 == tmp_compexpr_right_5 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_5 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_5;
+        }
+        else
+        {
+            goto branch_no_5;
+        }
+        branch_yes_5:;
+        {
+            PyObject *tmp_sync_locals_2;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_2 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_f );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_f;
+                var_f = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_g );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_g;
+                var_g = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_l );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 157;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_l;
+                var_l = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_5:;
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    Py_XDECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    tmp_print_value = const_str_digest_e3a18846495adb68b811665d47ec5f40;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 159;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+    if ( var_f == NULL )
+    {
+
+        exception_type = PyExc_UnboundLocalError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "f" );
+        exception_tb = NULL;
+
+        exception_lineno = 159;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_print_value = var_f;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 159;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 159;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_304cc3492cfb936d1b66ffa5445800a3 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_304cc3492cfb936d1b66ffa5445800a3 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_304cc3492cfb936d1b66ffa5445800a3, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_304cc3492cfb936d1b66ffa5445800a3->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_304cc3492cfb936d1b66ffa5445800a3, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_304cc3492cfb936d1b66ffa5445800a3,
+        type_description_1,
+        var_code,
+        var_l,
+        var_g,
+        var_f
+    );
+
+
+    // Release cached frame.
+    if ( frame_304cc3492cfb936d1b66ffa5445800a3 == cache_frame_304cc3492cfb936d1b66ffa5445800a3 )
+    {
+        Py_DECREF( frame_304cc3492cfb936d1b66ffa5445800a3 );
+    }
+    cache_frame_304cc3492cfb936d1b66ffa5445800a3 = NULL;
+
+    assertFrameObject( frame_304cc3492cfb936d1b66ffa5445800a3 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_5_functionExecNonesTuple2 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    Py_XDECREF( var_l );
+    var_l = NULL;
+
+    Py_XDECREF( var_g );
+    var_g = NULL;
+
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    Py_XDECREF( var_l );
+    var_l = NULL;
+
+    Py_XDECREF( var_g );
+    var_g = NULL;
+
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_5_functionExecNonesTuple2 );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_5_functionExecNonesTuple2 );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_5_functionExecNonesTuple2 );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_6_functionExecNonesSyntax2( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_code = NULL;
+    PyObject *var_l = NULL;
+    PyObject *var_g = NULL;
+    PyObject *var_f = NULL;
+    PyObject *tmp_exec_1__exec_source = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    nuitka_bool tmp_exec_1__plain = NUITKA_BOOL_UNASSIGNED;
+    PyObject *locals___main__$$$function_6_functionExecNonesSyntax2 = NULL;
+    struct Nuitka_FrameObject *frame_f9139bcd9ae1e170c2a3f294b75c9b9e;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *tmp_print_value;
+    static struct Nuitka_FrameObject *cache_frame_f9139bcd9ae1e170c2a3f294b75c9b9e = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_6_functionExecNonesSyntax2 = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_0;
+        assert( var_f == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_f = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = const_str_digest_ff0a6018ba8f720c664541ccefa60fc8;
+        assert( var_code == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        var_code = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        tmp_assign_source_3 = Py_None;
+        assert( var_g == NULL );
+        Py_INCREF( tmp_assign_source_3 );
+        var_g = tmp_assign_source_3;
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        tmp_assign_source_4 = Py_None;
+        assert( var_l == NULL );
+        Py_INCREF( tmp_assign_source_4 );
+        var_l = tmp_assign_source_4;
+    }
+    {
+        PyObject *tmp_assign_source_5;
+        CHECK_OBJECT( var_code );
+        tmp_assign_source_5 = var_code;
+        assert( tmp_exec_1__exec_source == NULL );
+        Py_INCREF( tmp_assign_source_5 );
+        tmp_exec_1__exec_source = tmp_assign_source_5;
+    }
+    {
+        PyObject *tmp_assign_source_6;
+        CHECK_OBJECT( var_l );
+        tmp_assign_source_6 = var_l;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_6 );
+        tmp_exec_1__globals = tmp_assign_source_6;
+    }
+    {
+        PyObject *tmp_assign_source_7;
+        CHECK_OBJECT( var_g );
+        tmp_assign_source_7 = var_g;
+        assert( tmp_exec_1__locals == NULL );
+        Py_INCREF( tmp_assign_source_7 );
+        tmp_exec_1__locals = tmp_assign_source_7;
+    }
+    {
+        nuitka_bool tmp_assign_source_8;
+        tmp_assign_source_8 = NUITKA_BOOL_FALSE;
+        tmp_exec_1__plain = tmp_assign_source_8;
+    }
+    {
+        nuitka_bool tmp_condition_result_1;
+        PyObject *tmp_compexpr_left_1;
+        PyObject *tmp_compexpr_right_1;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_compexpr_left_1 = tmp_exec_1__globals;
+        tmp_compexpr_right_1 = Py_None;
+        tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_1;
+        }
+        else
+        {
+            goto branch_no_1;
+        }
+        branch_yes_1:;
+        {
+            PyObject *tmp_assign_source_9;
+            tmp_assign_source_9 = (PyObject *)moduledict___main__;
+            {
+                PyObject *old = tmp_exec_1__globals;
+                assert( old != NULL );
+                tmp_exec_1__globals = tmp_assign_source_9;
+                Py_INCREF( tmp_exec_1__globals );
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            nuitka_bool tmp_condition_result_2;
+            PyObject *tmp_compexpr_left_2;
+            PyObject *tmp_compexpr_right_2;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_compexpr_left_2 = tmp_exec_1__locals;
+            tmp_compexpr_right_2 = Py_None;
+            tmp_condition_result_2 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_2;
+            }
+            else
+            {
+                goto branch_no_2;
+            }
+            branch_yes_2:;
+            {
+                PyObject *tmp_assign_source_10;
+                if (locals___main__$$$function_6_functionExecNonesSyntax2 == NULL) locals___main__$$$function_6_functionExecNonesSyntax2 = PyDict_New();
+                tmp_assign_source_10 = locals___main__$$$function_6_functionExecNonesSyntax2;
+                Py_INCREF( tmp_assign_source_10 );
+                if ( var_f != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_f );
+                    value = var_f;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_f, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_f );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                if ( var_code != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_code );
+                    value = var_code;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_code, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_code );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                if ( var_g != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_g );
+                    value = var_g;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_g, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_g );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                if ( var_l != NULL )
+                {
+                    PyObject *value;
+                    CHECK_OBJECT( var_l );
+                    value = var_l;
+
+                    UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_10, (Nuitka_StringObject *)const_str_plain_l, value );
+                }
+                else
+                {
+                    int res = PyDict_DelItem( tmp_assign_source_10, const_str_plain_l );
+
+                    if ( res != 0 )
+                    {
+                        CLEAR_ERROR_OCCURRED();
+                    }
+                }
+
+                {
+                    PyObject *old = tmp_exec_1__locals;
+                    assert( old != NULL );
+                    tmp_exec_1__locals = tmp_assign_source_10;
+                    Py_DECREF( old );
+                }
+
+            }
+            {
+                nuitka_bool tmp_assign_source_11;
+                tmp_assign_source_11 = NUITKA_BOOL_TRUE;
+                tmp_exec_1__plain = tmp_assign_source_11;
+            }
+            branch_no_2:;
+        }
+        goto branch_end_1;
+        branch_no_1:;
+        {
+            nuitka_bool tmp_condition_result_3;
+            PyObject *tmp_compexpr_left_3;
+            PyObject *tmp_compexpr_right_3;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_compexpr_left_3 = tmp_exec_1__locals;
+            tmp_compexpr_right_3 = Py_None;
+            tmp_condition_result_3 = ( tmp_compexpr_left_3 == tmp_compexpr_right_3 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_3 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_3;
+            }
+            else
+            {
+                goto branch_no_3;
+            }
+            branch_yes_3:;
+            {
+                PyObject *tmp_assign_source_12;
+                CHECK_OBJECT( tmp_exec_1__globals );
+                tmp_assign_source_12 = tmp_exec_1__globals;
+                {
+                    PyObject *old = tmp_exec_1__locals;
+                    assert( old != NULL );
+                    tmp_exec_1__locals = tmp_assign_source_12;
+                    Py_INCREF( tmp_exec_1__locals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_3:;
+        }
+        branch_end_1:;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_f9139bcd9ae1e170c2a3f294b75c9b9e, codeobj_f9139bcd9ae1e170c2a3f294b75c9b9e, module___main__, sizeof(void *)+sizeof(void *)+sizeof(void *)+sizeof(void *) );
+    frame_f9139bcd9ae1e170c2a3f294b75c9b9e = cache_frame_f9139bcd9ae1e170c2a3f294b75c9b9e;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_f9139bcd9ae1e170c2a3f294b75c9b9e );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_f9139bcd9ae1e170c2a3f294b75c9b9e ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        CHECK_OBJECT( tmp_exec_1__exec_source );
+        tmp_exec_source_1 = tmp_exec_1__exec_source;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 168;
+            type_description_1 = "oooo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 168;
+            type_description_1 = "oooo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 168;
+            type_description_1 = "oooo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        nuitka_bool tmp_condition_result_4;
+        nuitka_bool tmp_compexpr_left_4;
+        nuitka_bool tmp_compexpr_right_4;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_4 = tmp_exec_1__plain;
+        tmp_compexpr_right_4 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_4 = ( tmp_compexpr_left_4 == tmp_compexpr_right_4 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_4 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_4;
+        }
+        else
+        {
+            goto branch_no_4;
+        }
+        branch_yes_4:;
+        {
+            PyObject *tmp_sync_locals_1;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_1 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_f );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_f;
+                var_f = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_g );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_g;
+                var_g = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_l );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_l;
+                var_l = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_4:;
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    Py_XDECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        nuitka_bool tmp_condition_result_5;
+        nuitka_bool tmp_compexpr_left_5;
+        nuitka_bool tmp_compexpr_right_5;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_5 = tmp_exec_1__plain;
+        tmp_compexpr_right_5 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_5 = ( tmp_compexpr_left_5 == tmp_compexpr_right_5 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_5 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_5;
+        }
+        else
+        {
+            goto branch_no_5;
+        }
+        branch_yes_5:;
+        {
+            PyObject *tmp_sync_locals_2;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_2 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_f );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_f;
+                var_f = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_g );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_g;
+                var_g = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_l );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 168;
+                type_description_1 = "oooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_l;
+                var_l = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_5:;
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    Py_XDECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    tmp_print_value = const_str_digest_005bb0ac160d91925b1aa21e45bfede6;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 170;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+    if ( var_f == NULL )
+    {
+
+        exception_type = PyExc_UnboundLocalError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "f" );
+        exception_tb = NULL;
+
+        exception_lineno = 170;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_print_value = var_f;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 170;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 170;
+        type_description_1 = "oooo";
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_f9139bcd9ae1e170c2a3f294b75c9b9e );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_f9139bcd9ae1e170c2a3f294b75c9b9e );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_f9139bcd9ae1e170c2a3f294b75c9b9e, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_f9139bcd9ae1e170c2a3f294b75c9b9e->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_f9139bcd9ae1e170c2a3f294b75c9b9e, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_f9139bcd9ae1e170c2a3f294b75c9b9e,
+        type_description_1,
+        var_code,
+        var_l,
+        var_g,
+        var_f
+    );
+
+
+    // Release cached frame.
+    if ( frame_f9139bcd9ae1e170c2a3f294b75c9b9e == cache_frame_f9139bcd9ae1e170c2a3f294b75c9b9e )
+    {
+        Py_DECREF( frame_f9139bcd9ae1e170c2a3f294b75c9b9e );
+    }
+    cache_frame_f9139bcd9ae1e170c2a3f294b75c9b9e = NULL;
+
+    assertFrameObject( frame_f9139bcd9ae1e170c2a3f294b75c9b9e );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_6_functionExecNonesSyntax2 );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    Py_XDECREF( var_l );
+    var_l = NULL;
+
+    Py_XDECREF( var_g );
+    var_g = NULL;
+
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    Py_XDECREF( var_l );
+    var_l = NULL;
+
+    Py_XDECREF( var_g );
+    var_g = NULL;
+
+    Py_XDECREF( var_f );
+    var_f = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_6_functionExecNonesSyntax2 );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_6_functionExecNonesSyntax2 );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_6_functionExecNonesSyntax2 );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_7_functionGlobalsExecShadow( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_y = NULL;
+    PyObject *var_print_global_y = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    PyObject *tmp_exec_2__globals = NULL;
+    PyObject *tmp_exec_2__locals = NULL;
+    PyObject *tmp_exec_3__globals = NULL;
+    PyObject *tmp_exec_3__locals = NULL;
+    PyObject *tmp_exec_4__globals = NULL;
+    PyObject *tmp_exec_4__locals = NULL;
+    PyObject *locals___main__$$$function_7_functionGlobalsExecShadow = NULL;
+    struct Nuitka_FrameObject *frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *tmp_print_value;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+    PyObject *exception_keeper_type_4;
+    PyObject *exception_keeper_value_4;
+    PyTracebackObject *exception_keeper_tb_4;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_4;
+    PyObject *exception_keeper_type_5;
+    PyObject *exception_keeper_value_5;
+    PyTracebackObject *exception_keeper_tb_5;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_5;
+    PyObject *exception_keeper_type_6;
+    PyObject *exception_keeper_value_6;
+    PyTracebackObject *exception_keeper_tb_6;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_6;
+    PyObject *exception_keeper_type_7;
+    PyObject *exception_keeper_value_7;
+    PyTracebackObject *exception_keeper_tb_7;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_7;
+    PyObject *exception_keeper_type_8;
+    PyObject *exception_keeper_value_8;
+    PyTracebackObject *exception_keeper_tb_8;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_8;
+    static struct Nuitka_FrameObject *cache_frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_9;
+    PyObject *exception_keeper_value_9;
+    PyTracebackObject *exception_keeper_tb_9;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_9;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_7_functionGlobalsExecShadow = tmp_set_locals_1;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6, codeobj_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6, module___main__, sizeof(void *)+sizeof(void *) );
+    frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 = cache_frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 ) == 2 ); // Frame stack
+
+    // Framed code:
+    tmp_print_value = const_str_digest_726a7d88c6429830552ff1ae931156e2;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 194;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_1;
+        tmp_mvar_value_1 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_x );
+
+        if (unlikely( tmp_mvar_value_1 == NULL ))
+        {
+            tmp_mvar_value_1 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_x );
+        }
+
+        if ( tmp_mvar_value_1 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "global name '%s' is not defined", "x" );
+            exception_tb = NULL;
+
+            exception_lineno = 194;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_1;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 194;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 194;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_0;
+        assert( var_y == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_y = tmp_assign_source_1;
+    }
+    tmp_print_value = const_str_digest_3953231f8e2d8a134eb31bf0fdb146c3;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 197;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    CHECK_OBJECT( var_y );
+    tmp_print_value = var_y;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 197;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 197;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    tmp_print_value = const_str_digest_e01ca43dcaf5af281a38d385f25b2474;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 199;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    if (locals___main__$$$function_7_functionGlobalsExecShadow == NULL) locals___main__$$$function_7_functionGlobalsExecShadow = PyDict_New();
+    tmp_print_value = locals___main__$$$function_7_functionGlobalsExecShadow;
+    Py_INCREF( tmp_print_value );
+    if ( var_y != NULL )
+    {
+        PyObject *value;
+        CHECK_OBJECT( var_y );
+        value = var_y;
+
+        UPDATE_STRING_DICT0( (PyDictObject *)tmp_print_value, (Nuitka_StringObject *)const_str_plain_y, value );
+    }
+    else
+    {
+        int res = PyDict_DelItem( tmp_print_value, const_str_plain_y );
+
+        if ( res != 0 )
+        {
+            CLEAR_ERROR_OCCURRED();
+        }
+    }
+
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    Py_DECREF( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 199;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 199;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        tmp_exec_1__globals = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        if (locals___main__$$$function_7_functionGlobalsExecShadow == NULL) locals___main__$$$function_7_functionGlobalsExecShadow = PyDict_New();
+        tmp_assign_source_3 = locals___main__$$$function_7_functionGlobalsExecShadow;
+        Py_INCREF( tmp_assign_source_3 );
+        if ( var_y != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_y );
+            value = var_y;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_3, (Nuitka_StringObject *)const_str_plain_y, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_3, const_str_plain_y );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_1__locals == NULL );
+        tmp_exec_1__locals = tmp_assign_source_3;
+    }
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        tmp_exec_source_1 = const_str_digest_e4e0d34620c1d68d536f2ca8b42e4e1b;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 200;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 200;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 200;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_1;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_1 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_1 );
+            Py_XDECREF( exception_keeper_value_1 );
+            Py_XDECREF( exception_keeper_tb_1 );
+
+            exception_lineno = 200;
+            type_description_1 = "oo";
+            goto try_except_handler_2;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        PyObject *tmp_sync_locals_2;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_2 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 200;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    tmp_print_value = const_str_digest_8ff7185fd52c43b4e0cecc7952b817a4;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 205;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_2;
+        tmp_mvar_value_2 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_x );
+
+        if (unlikely( tmp_mvar_value_2 == NULL ))
+        {
+            tmp_mvar_value_2 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_x );
+        }
+
+        if ( tmp_mvar_value_2 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "global name '%s' is not defined", "x" );
+            exception_tb = NULL;
+
+            exception_lineno = 205;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_2;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 205;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 205;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        tmp_assign_source_4 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_2__globals == NULL );
+        Py_INCREF( tmp_assign_source_4 );
+        tmp_exec_2__globals = tmp_assign_source_4;
+    }
+    {
+        PyObject *tmp_assign_source_5;
+        if (locals___main__$$$function_7_functionGlobalsExecShadow == NULL) locals___main__$$$function_7_functionGlobalsExecShadow = PyDict_New();
+        tmp_assign_source_5 = locals___main__$$$function_7_functionGlobalsExecShadow;
+        Py_INCREF( tmp_assign_source_5 );
+        if ( var_y != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_y );
+            value = var_y;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_5, (Nuitka_StringObject *)const_str_plain_y, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_5, const_str_plain_y );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_2__locals == NULL );
+        tmp_exec_2__locals = tmp_assign_source_5;
+    }
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_2;
+        PyObject *tmp_exec_globals_2;
+        PyObject *tmp_exec_locals_2;
+        PyObject *tmp_exec_filename_2;
+        PyObject *tmp_exec_compiled_2;
+        PyObject *tmp_exec_result_2;
+        tmp_exec_source_2 = const_str_digest_34bcccce7b2d8347939d3a9a2695a1cf;
+        CHECK_OBJECT( tmp_exec_2__globals );
+        tmp_exec_globals_2 = tmp_exec_2__globals;
+        CHECK_OBJECT( tmp_exec_2__locals );
+        tmp_exec_locals_2 = tmp_exec_2__locals;
+        tmp_exec_filename_2 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_2 );
+        Py_INCREF( tmp_exec_source_2 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_2, &tmp_exec_filename_2 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_2 );
+            Py_DECREF( tmp_exec_source_2 );
+
+            exception_lineno = 207;
+            type_description_1 = "oo";
+            goto try_except_handler_5;
+        }
+        tmp_exec_compiled_2 = COMPILE_CODE( tmp_exec_source_2, tmp_exec_filename_2, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_2 );
+        Py_DECREF( tmp_exec_filename_2 );
+        if ( tmp_exec_compiled_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 207;
+            type_description_1 = "oo";
+            goto try_except_handler_5;
+        }
+        tmp_exec_result_2 = EVAL_CODE( tmp_exec_compiled_2, tmp_exec_globals_2, tmp_exec_locals_2 );
+        Py_DECREF( tmp_exec_compiled_2 );
+        if ( tmp_exec_result_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 207;
+            type_description_1 = "oo";
+            goto try_except_handler_5;
+        }
+        Py_DECREF( tmp_exec_result_2 );
+    }
+    goto try_end_3;
+    // Exception handler code:
+    try_except_handler_5:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_3;
+        CHECK_OBJECT( tmp_exec_2__locals );
+        tmp_sync_locals_3 = tmp_exec_2__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_3, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_3 );
+            Py_XDECREF( exception_keeper_value_3 );
+            Py_XDECREF( exception_keeper_tb_3 );
+
+            exception_lineno = 207;
+            type_description_1 = "oo";
+            goto try_except_handler_4;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto try_except_handler_4;
+    // End of try:
+    try_end_3:;
+    goto try_end_4;
+    // Exception handler code:
+    try_except_handler_4:;
+    exception_keeper_type_4 = exception_type;
+    exception_keeper_value_4 = exception_value;
+    exception_keeper_tb_4 = exception_tb;
+    exception_keeper_lineno_4 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__globals );
+    Py_DECREF( tmp_exec_2__globals );
+    tmp_exec_2__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__locals );
+    Py_DECREF( tmp_exec_2__locals );
+    tmp_exec_2__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_4;
+    exception_value = exception_keeper_value_4;
+    exception_tb = exception_keeper_tb_4;
+    exception_lineno = exception_keeper_lineno_4;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_4:;
+    {
+        PyObject *tmp_sync_locals_4;
+        CHECK_OBJECT( tmp_exec_2__locals );
+        tmp_sync_locals_4 = tmp_exec_2__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_4, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 207;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__globals );
+    Py_DECREF( tmp_exec_2__globals );
+    tmp_exec_2__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__locals );
+    Py_DECREF( tmp_exec_2__locals );
+    tmp_exec_2__locals = NULL;
+
+    tmp_print_value = const_str_digest_40ff59c4788ff32b430bc257697c5065;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 211;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        nuitka_bool tmp_condition_result_1;
+        PyObject *tmp_called_name_1;
+        tmp_condition_result_1 = ( PyDict_GetItem( locals___main__$$$function_7_functionGlobalsExecShadow, const_str_plain_locals ) ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+        {
+            goto condexpr_true_1;
+        }
+        else
+        {
+            goto condexpr_false_1;
+        }
+        condexpr_true_1:;
+        tmp_called_name_1 = PyDict_GetItem( locals___main__$$$function_7_functionGlobalsExecShadow, const_str_plain_locals );
+
+        if ( tmp_called_name_1 == NULL && CHECK_AND_CLEAR_KEY_ERROR_OCCURRED() )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "global name '%s' is not defined", "locals" );
+            exception_tb = NULL;
+
+            exception_lineno = 211;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+
+        if ( tmp_called_name_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 211;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6->m_frame.f_lineno = 211;
+        tmp_print_value = CALL_FUNCTION_NO_ARGS( tmp_called_name_1 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 211;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        goto condexpr_end_1;
+        condexpr_false_1:;
+        if (locals___main__$$$function_7_functionGlobalsExecShadow == NULL) locals___main__$$$function_7_functionGlobalsExecShadow = PyDict_New();
+        tmp_print_value = locals___main__$$$function_7_functionGlobalsExecShadow;
+        Py_INCREF( tmp_print_value );
+        if ( var_y != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_y );
+            value = var_y;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_print_value, (Nuitka_StringObject *)const_str_plain_y, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_print_value, const_str_plain_y );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        condexpr_end_1:;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 211;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 211;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_6;
+        tmp_assign_source_6 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_3__globals == NULL );
+        Py_INCREF( tmp_assign_source_6 );
+        tmp_exec_3__globals = tmp_assign_source_6;
+    }
+    {
+        PyObject *tmp_assign_source_7;
+        if (locals___main__$$$function_7_functionGlobalsExecShadow == NULL) locals___main__$$$function_7_functionGlobalsExecShadow = PyDict_New();
+        tmp_assign_source_7 = locals___main__$$$function_7_functionGlobalsExecShadow;
+        Py_INCREF( tmp_assign_source_7 );
+        if ( var_y != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_y );
+            value = var_y;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_7, (Nuitka_StringObject *)const_str_plain_y, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_7, const_str_plain_y );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_3__locals == NULL );
+        tmp_exec_3__locals = tmp_assign_source_7;
+    }
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_3;
+        PyObject *tmp_exec_globals_3;
+        PyObject *tmp_exec_locals_3;
+        PyObject *tmp_exec_filename_3;
+        PyObject *tmp_exec_compiled_3;
+        PyObject *tmp_exec_result_3;
+        tmp_exec_source_3 = const_str_digest_811f03bba7485579dac319cd6f95d838;
+        CHECK_OBJECT( tmp_exec_3__globals );
+        tmp_exec_globals_3 = tmp_exec_3__globals;
+        CHECK_OBJECT( tmp_exec_3__locals );
+        tmp_exec_locals_3 = tmp_exec_3__locals;
+        tmp_exec_filename_3 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_3 );
+        Py_INCREF( tmp_exec_source_3 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_3, &tmp_exec_filename_3 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_3 );
+            Py_DECREF( tmp_exec_source_3 );
+
+            exception_lineno = 213;
+            type_description_1 = "oo";
+            goto try_except_handler_7;
+        }
+        tmp_exec_compiled_3 = COMPILE_CODE( tmp_exec_source_3, tmp_exec_filename_3, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_3 );
+        Py_DECREF( tmp_exec_filename_3 );
+        if ( tmp_exec_compiled_3 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 213;
+            type_description_1 = "oo";
+            goto try_except_handler_7;
+        }
+        tmp_exec_result_3 = EVAL_CODE( tmp_exec_compiled_3, tmp_exec_globals_3, tmp_exec_locals_3 );
+        Py_DECREF( tmp_exec_compiled_3 );
+        if ( tmp_exec_result_3 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 213;
+            type_description_1 = "oo";
+            goto try_except_handler_7;
+        }
+        Py_DECREF( tmp_exec_result_3 );
+    }
+    goto try_end_5;
+    // Exception handler code:
+    try_except_handler_7:;
+    exception_keeper_type_5 = exception_type;
+    exception_keeper_value_5 = exception_value;
+    exception_keeper_tb_5 = exception_tb;
+    exception_keeper_lineno_5 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_5;
+        CHECK_OBJECT( tmp_exec_3__locals );
+        tmp_sync_locals_5 = tmp_exec_3__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_5, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_5 );
+            Py_XDECREF( exception_keeper_value_5 );
+            Py_XDECREF( exception_keeper_tb_5 );
+
+            exception_lineno = 213;
+            type_description_1 = "oo";
+            goto try_except_handler_6;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_5;
+    exception_value = exception_keeper_value_5;
+    exception_tb = exception_keeper_tb_5;
+    exception_lineno = exception_keeper_lineno_5;
+
+    goto try_except_handler_6;
+    // End of try:
+    try_end_5:;
+    goto try_end_6;
+    // Exception handler code:
+    try_except_handler_6:;
+    exception_keeper_type_6 = exception_type;
+    exception_keeper_value_6 = exception_value;
+    exception_keeper_tb_6 = exception_tb;
+    exception_keeper_lineno_6 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__globals );
+    Py_DECREF( tmp_exec_3__globals );
+    tmp_exec_3__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__locals );
+    Py_DECREF( tmp_exec_3__locals );
+    tmp_exec_3__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_6;
+    exception_value = exception_keeper_value_6;
+    exception_tb = exception_keeper_tb_6;
+    exception_lineno = exception_keeper_lineno_6;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_6:;
+    {
+        PyObject *tmp_sync_locals_6;
+        CHECK_OBJECT( tmp_exec_3__locals );
+        tmp_sync_locals_6 = tmp_exec_3__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_6, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 213;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__globals );
+    Py_DECREF( tmp_exec_3__globals );
+    tmp_exec_3__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__locals );
+    Py_DECREF( tmp_exec_3__locals );
+    tmp_exec_3__locals = NULL;
+
+    tmp_print_value = const_str_digest_063096dcccc39cee036f3f5ca3b41511;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 219;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_3;
+        tmp_mvar_value_3 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_x );
+
+        if (unlikely( tmp_mvar_value_3 == NULL ))
+        {
+            tmp_mvar_value_3 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_x );
+        }
+
+        if ( tmp_mvar_value_3 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "global name '%s' is not defined", "x" );
+            exception_tb = NULL;
+
+            exception_lineno = 219;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_3;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 219;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 219;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_8;
+        tmp_assign_source_8 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_4__globals == NULL );
+        Py_INCREF( tmp_assign_source_8 );
+        tmp_exec_4__globals = tmp_assign_source_8;
+    }
+    {
+        PyObject *tmp_assign_source_9;
+        if (locals___main__$$$function_7_functionGlobalsExecShadow == NULL) locals___main__$$$function_7_functionGlobalsExecShadow = PyDict_New();
+        tmp_assign_source_9 = locals___main__$$$function_7_functionGlobalsExecShadow;
+        Py_INCREF( tmp_assign_source_9 );
+        if ( var_y != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_y );
+            value = var_y;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_9, (Nuitka_StringObject *)const_str_plain_y, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_9, const_str_plain_y );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_4__locals == NULL );
+        tmp_exec_4__locals = tmp_assign_source_9;
+    }
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_4;
+        PyObject *tmp_exec_globals_4;
+        PyObject *tmp_exec_locals_4;
+        PyObject *tmp_exec_filename_4;
+        PyObject *tmp_exec_compiled_4;
+        PyObject *tmp_exec_result_4;
+        tmp_exec_source_4 = const_str_digest_5efe39d911f5869252dcfb645fbe8550;
+        CHECK_OBJECT( tmp_exec_4__globals );
+        tmp_exec_globals_4 = tmp_exec_4__globals;
+        CHECK_OBJECT( tmp_exec_4__locals );
+        tmp_exec_locals_4 = tmp_exec_4__locals;
+        tmp_exec_filename_4 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_4 );
+        Py_INCREF( tmp_exec_source_4 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_4, &tmp_exec_filename_4 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_4 );
+            Py_DECREF( tmp_exec_source_4 );
+
+            exception_lineno = 221;
+            type_description_1 = "oo";
+            goto try_except_handler_9;
+        }
+        tmp_exec_compiled_4 = COMPILE_CODE( tmp_exec_source_4, tmp_exec_filename_4, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_4 );
+        Py_DECREF( tmp_exec_filename_4 );
+        if ( tmp_exec_compiled_4 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 221;
+            type_description_1 = "oo";
+            goto try_except_handler_9;
+        }
+        tmp_exec_result_4 = EVAL_CODE( tmp_exec_compiled_4, tmp_exec_globals_4, tmp_exec_locals_4 );
+        Py_DECREF( tmp_exec_compiled_4 );
+        if ( tmp_exec_result_4 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 221;
+            type_description_1 = "oo";
+            goto try_except_handler_9;
+        }
+        Py_DECREF( tmp_exec_result_4 );
+    }
+    goto try_end_7;
+    // Exception handler code:
+    try_except_handler_9:;
+    exception_keeper_type_7 = exception_type;
+    exception_keeper_value_7 = exception_value;
+    exception_keeper_tb_7 = exception_tb;
+    exception_keeper_lineno_7 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_7;
+        CHECK_OBJECT( tmp_exec_4__locals );
+        tmp_sync_locals_7 = tmp_exec_4__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_7, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_7 );
+            Py_XDECREF( exception_keeper_value_7 );
+            Py_XDECREF( exception_keeper_tb_7 );
+
+            exception_lineno = 221;
+            type_description_1 = "oo";
+            goto try_except_handler_8;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_7;
+    exception_value = exception_keeper_value_7;
+    exception_tb = exception_keeper_tb_7;
+    exception_lineno = exception_keeper_lineno_7;
+
+    goto try_except_handler_8;
+    // End of try:
+    try_end_7:;
+    goto try_end_8;
+    // Exception handler code:
+    try_except_handler_8:;
+    exception_keeper_type_8 = exception_type;
+    exception_keeper_value_8 = exception_value;
+    exception_keeper_tb_8 = exception_tb;
+    exception_keeper_lineno_8 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_4__globals );
+    Py_DECREF( tmp_exec_4__globals );
+    tmp_exec_4__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_4__locals );
+    Py_DECREF( tmp_exec_4__locals );
+    tmp_exec_4__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_8;
+    exception_value = exception_keeper_value_8;
+    exception_tb = exception_keeper_tb_8;
+    exception_lineno = exception_keeper_lineno_8;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_8:;
+    {
+        PyObject *tmp_sync_locals_8;
+        CHECK_OBJECT( tmp_exec_4__locals );
+        tmp_sync_locals_8 = tmp_exec_4__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_8, const_str_plain_y );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 221;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_y;
+            var_y = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_4__globals );
+    Py_DECREF( tmp_exec_4__globals );
+    tmp_exec_4__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_4__locals );
+    Py_DECREF( tmp_exec_4__locals );
+    tmp_exec_4__locals = NULL;
+
+    {
+        PyObject *tmp_assign_source_10;
+        tmp_assign_source_10 = MAKE_FUNCTION___main__$$$function_7_functionGlobalsExecShadow$$$function_1_print_global_y(  );
+
+
+
+        assert( var_print_global_y == NULL );
+        var_print_global_y = tmp_assign_source_10;
+    }
+    {
+        PyObject *tmp_called_name_2;
+        PyObject *tmp_call_result_1;
+        CHECK_OBJECT( var_print_global_y );
+        tmp_called_name_2 = var_print_global_y;
+        frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6->m_frame.f_lineno = 243;
+        tmp_call_result_1 = CALL_FUNCTION_NO_ARGS( tmp_called_name_2 );
+        if ( tmp_call_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 243;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_1 );
+    }
+    tmp_print_value = const_str_digest_a36f41ad69eb85f0993cb010132f13d6;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 244;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    if ( var_y == NULL )
+    {
+
+        exception_type = PyExc_UnboundLocalError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "y" );
+        exception_tb = NULL;
+
+        exception_lineno = 244;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_print_value = var_y;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 244;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 244;
+        type_description_1 = "oo";
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6,
+        type_description_1,
+        var_y,
+        var_print_global_y
+    );
+
+
+    // Release cached frame.
+    if ( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 == cache_frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 )
+    {
+        Py_DECREF( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 );
+    }
+    cache_frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 = NULL;
+
+    assertFrameObject( frame_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_7_functionGlobalsExecShadow );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_y );
+    var_y = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_print_global_y );
+    Py_DECREF( var_print_global_y );
+    var_print_global_y = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_9 = exception_type;
+    exception_keeper_value_9 = exception_value;
+    exception_keeper_tb_9 = exception_tb;
+    exception_keeper_lineno_9 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_y );
+    var_y = NULL;
+
+    Py_XDECREF( var_print_global_y );
+    var_print_global_y = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_9;
+    exception_value = exception_keeper_value_9;
+    exception_tb = exception_keeper_tb_9;
+    exception_lineno = exception_keeper_lineno_9;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_7_functionGlobalsExecShadow );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_7_functionGlobalsExecShadow );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_7_functionGlobalsExecShadow );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_7_functionGlobalsExecShadow$$$function_1_print_global_y( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    struct Nuitka_FrameObject *frame_b19b9b217d5b765d94c1924f515b24fb;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *tmp_print_value;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    static struct Nuitka_FrameObject *cache_frame_b19b9b217d5b765d94c1924f515b24fb = NULL;
+    PyObject *tmp_return_value = NULL;
+
+    // Actual function body.
+    MAKE_OR_REUSE_FRAME( cache_frame_b19b9b217d5b765d94c1924f515b24fb, codeobj_b19b9b217d5b765d94c1924f515b24fb, module___main__, 0 );
+    frame_b19b9b217d5b765d94c1924f515b24fb = cache_frame_b19b9b217d5b765d94c1924f515b24fb;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_b19b9b217d5b765d94c1924f515b24fb );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_b19b9b217d5b765d94c1924f515b24fb ) == 2 ); // Frame stack
+
+    // Framed code:
+    tmp_print_value = const_str_digest_86073439a5c284ad71bc88107637e387;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 241;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_1;
+        tmp_mvar_value_1 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_y );
+
+        if (unlikely( tmp_mvar_value_1 == NULL ))
+        {
+            tmp_mvar_value_1 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_y );
+        }
+
+        if ( tmp_mvar_value_1 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "global name '%s' is not defined", "y" );
+            exception_tb = NULL;
+
+            exception_lineno = 241;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_1;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 241;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 241;
+
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_b19b9b217d5b765d94c1924f515b24fb );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_b19b9b217d5b765d94c1924f515b24fb );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_b19b9b217d5b765d94c1924f515b24fb, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_b19b9b217d5b765d94c1924f515b24fb->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_b19b9b217d5b765d94c1924f515b24fb, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_b19b9b217d5b765d94c1924f515b24fb,
+        type_description_1
+    );
+
+
+    // Release cached frame.
+    if ( frame_b19b9b217d5b765d94c1924f515b24fb == cache_frame_b19b9b217d5b765d94c1924f515b24fb )
+    {
+        Py_DECREF( frame_b19b9b217d5b765d94c1924f515b24fb );
+    }
+    cache_frame_b19b9b217d5b765d94c1924f515b24fb = NULL;
+
+    assertFrameObject( frame_b19b9b217d5b765d94c1924f515b24fb );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto function_exception_exit;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto function_return_exit;
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_7_functionGlobalsExecShadow$$$function_1_print_global_y );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_8_functionWithClosureProvidedByExec( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_code = NULL;
+    PyObject *var_func = NULL;
+    PyObject *tmp_exec_1__exec_source = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    PyObject *locals___main__$$$function_8_functionWithClosureProvidedByExec = NULL;
+    struct Nuitka_FrameObject *frame_00d60fde43d27ec513f170a102d005e8;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    static struct Nuitka_FrameObject *cache_frame_00d60fde43d27ec513f170a102d005e8 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_8_functionWithClosureProvidedByExec = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_str_digest_d3d5e86d5f22461305291a6ba678d9fc;
+        assert( var_code == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        var_code = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        CHECK_OBJECT( var_code );
+        tmp_assign_source_2 = var_code;
+        assert( tmp_exec_1__exec_source == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        tmp_exec_1__exec_source = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        tmp_assign_source_3 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_3 );
+        tmp_exec_1__globals = tmp_assign_source_3;
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        if (locals___main__$$$function_8_functionWithClosureProvidedByExec == NULL) locals___main__$$$function_8_functionWithClosureProvidedByExec = PyDict_New();
+        tmp_assign_source_4 = locals___main__$$$function_8_functionWithClosureProvidedByExec;
+        Py_INCREF( tmp_assign_source_4 );
+        if ( var_code != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_code );
+            value = var_code;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_4, (Nuitka_StringObject *)const_str_plain_code, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_4, const_str_plain_code );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( tmp_exec_1__locals == NULL );
+        tmp_exec_1__locals = tmp_assign_source_4;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_00d60fde43d27ec513f170a102d005e8, codeobj_00d60fde43d27ec513f170a102d005e8, module___main__, sizeof(void *)+sizeof(void *) );
+    frame_00d60fde43d27ec513f170a102d005e8 = cache_frame_00d60fde43d27ec513f170a102d005e8;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_00d60fde43d27ec513f170a102d005e8 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_00d60fde43d27ec513f170a102d005e8 ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        CHECK_OBJECT( tmp_exec_1__exec_source );
+        tmp_exec_source_1 = tmp_exec_1__exec_source;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 252;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 252;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 252;
+            type_description_1 = "oo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_1;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_1 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_code );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_1 );
+            Py_XDECREF( exception_keeper_value_1 );
+            Py_XDECREF( exception_keeper_tb_1 );
+
+            exception_lineno = 252;
+            type_description_1 = "oo";
+            goto try_except_handler_2;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_code;
+            var_code = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        PyObject *tmp_sync_locals_2;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_sync_locals_2 = tmp_exec_1__locals;
+        tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_code );
+        if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 252;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = var_code;
+            var_code = tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    {
+        PyObject *tmp_assign_source_5;
+        tmp_assign_source_5 = MAKE_FUNCTION___main__$$$function_8_functionWithClosureProvidedByExec$$$function_1_func(  );
+
+
+
+        assert( var_func == NULL );
+        var_func = tmp_assign_source_5;
+    }
+    {
+        PyObject *tmp_called_name_1;
+        PyObject *tmp_call_result_1;
+        CHECK_OBJECT( var_func );
+        tmp_called_name_1 = var_func;
+        frame_00d60fde43d27ec513f170a102d005e8->m_frame.f_lineno = 257;
+        tmp_call_result_1 = CALL_FUNCTION_NO_ARGS( tmp_called_name_1 );
+        if ( tmp_call_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 257;
+            type_description_1 = "oo";
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_1 );
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_00d60fde43d27ec513f170a102d005e8 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_00d60fde43d27ec513f170a102d005e8 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_00d60fde43d27ec513f170a102d005e8, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_00d60fde43d27ec513f170a102d005e8->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_00d60fde43d27ec513f170a102d005e8, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_00d60fde43d27ec513f170a102d005e8,
+        type_description_1,
+        var_code,
+        var_func
+    );
+
+
+    // Release cached frame.
+    if ( frame_00d60fde43d27ec513f170a102d005e8 == cache_frame_00d60fde43d27ec513f170a102d005e8 )
+    {
+        Py_DECREF( frame_00d60fde43d27ec513f170a102d005e8 );
+    }
+    cache_frame_00d60fde43d27ec513f170a102d005e8 = NULL;
+
+    assertFrameObject( frame_00d60fde43d27ec513f170a102d005e8 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto try_return_handler_1;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_8_functionWithClosureProvidedByExec );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_func );
+    Py_DECREF( var_func );
+    var_func = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    Py_XDECREF( var_func );
+    var_func = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_8_functionWithClosureProvidedByExec );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_8_functionWithClosureProvidedByExec );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_8_functionWithClosureProvidedByExec );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_8_functionWithClosureProvidedByExec$$$function_1_func( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    struct Nuitka_FrameObject *frame_dd3383cadf1471c5f27335a46f766b01;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *tmp_print_value;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    static struct Nuitka_FrameObject *cache_frame_dd3383cadf1471c5f27335a46f766b01 = NULL;
+    PyObject *tmp_return_value = NULL;
+
+    // Actual function body.
+    MAKE_OR_REUSE_FRAME( cache_frame_dd3383cadf1471c5f27335a46f766b01, codeobj_dd3383cadf1471c5f27335a46f766b01, module___main__, 0 );
+    frame_dd3383cadf1471c5f27335a46f766b01 = cache_frame_dd3383cadf1471c5f27335a46f766b01;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_dd3383cadf1471c5f27335a46f766b01 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_dd3383cadf1471c5f27335a46f766b01 ) == 2 ); // Frame stack
+
+    // Framed code:
+    tmp_print_value = const_str_digest_f687ea35b43f26d6209fbaa354137816;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 255;
+
+        goto frame_exception_exit_1;
+    }
+    tmp_print_value = const_str_digest_69b939c21a2c20fcfd3a18934d6a8e50;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 255;
+
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 255;
+
+        goto frame_exception_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_dd3383cadf1471c5f27335a46f766b01 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_dd3383cadf1471c5f27335a46f766b01 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_dd3383cadf1471c5f27335a46f766b01, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_dd3383cadf1471c5f27335a46f766b01->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_dd3383cadf1471c5f27335a46f766b01, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_dd3383cadf1471c5f27335a46f766b01,
+        type_description_1
+    );
+
+
+    // Release cached frame.
+    if ( frame_dd3383cadf1471c5f27335a46f766b01 == cache_frame_dd3383cadf1471c5f27335a46f766b01 )
+    {
+        Py_DECREF( frame_dd3383cadf1471c5f27335a46f766b01 );
+    }
+    cache_frame_dd3383cadf1471c5f27335a46f766b01 = NULL;
+
+    assertFrameObject( frame_dd3383cadf1471c5f27335a46f766b01 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto function_exception_exit;
+
+    frame_no_exception_1:;
+    tmp_return_value = Py_None;
+    Py_INCREF( tmp_return_value );
+    goto function_return_exit;
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_8_functionWithClosureProvidedByExec$$$function_1_func );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_9_functionWithExecAffectingClosure( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    struct Nuitka_CellObject *var_x = PyCell_EMPTY();
+    PyObject *var_code = NULL;
+    PyObject *var_space = NULL;
+    PyObject *var_closureMaker = NULL;
+    PyObject *tmp_exec_1__exec_source = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    nuitka_bool tmp_exec_1__plain = NUITKA_BOOL_UNASSIGNED;
+    PyObject *locals___main__$$$function_9_functionWithExecAffectingClosure = NULL;
+    struct Nuitka_FrameObject *frame_87f0811e96640ed92d76bddb83b77fbf;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    bool tmp_result;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *tmp_return_value = NULL;
+    static struct Nuitka_FrameObject *cache_frame_87f0811e96640ed92d76bddb83b77fbf = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_9_functionWithExecAffectingClosure = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_int_pos_4;
+        assert( PyCell_GET( var_x ) == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        PyCell_SET( var_x, tmp_assign_source_1 );
+
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = const_str_digest_9bbcdd1ad6f075459737599dab381555;
+        assert( var_code == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        var_code = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        if (locals___main__$$$function_9_functionWithExecAffectingClosure == NULL) locals___main__$$$function_9_functionWithExecAffectingClosure = PyDict_New();
+        tmp_assign_source_3 = locals___main__$$$function_9_functionWithExecAffectingClosure;
+        Py_INCREF( tmp_assign_source_3 );
+        if ( var_x->ob_ref != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( PyCell_GET( var_x ) );
+            value = PyCell_GET( var_x );
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_3, (Nuitka_StringObject *)const_str_plain_x, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_3, const_str_plain_x );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        if ( var_code != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( var_code );
+            value = var_code;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_3, (Nuitka_StringObject *)const_str_plain_code, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_3, const_str_plain_code );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( var_space == NULL );
+        var_space = tmp_assign_source_3;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_87f0811e96640ed92d76bddb83b77fbf, codeobj_87f0811e96640ed92d76bddb83b77fbf, module___main__, sizeof(void *)+sizeof(void *)+sizeof(void *)+sizeof(void *) );
+    frame_87f0811e96640ed92d76bddb83b77fbf = cache_frame_87f0811e96640ed92d76bddb83b77fbf;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_87f0811e96640ed92d76bddb83b77fbf );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_87f0811e96640ed92d76bddb83b77fbf ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    {
+        PyObject *tmp_assign_source_4;
+        if ( var_code == NULL )
+        {
+
+            exception_type = PyExc_UnboundLocalError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "local variable '%s' referenced before assignment", "code" );
+            exception_tb = NULL;
+
+            exception_lineno = 269;
+            type_description_1 = "cooo";
+            goto try_except_handler_2;
+        }
+
+        tmp_assign_source_4 = var_code;
+        assert( tmp_exec_1__exec_source == NULL );
+        Py_INCREF( tmp_assign_source_4 );
+        tmp_exec_1__exec_source = tmp_assign_source_4;
+    }
+    {
+        PyObject *tmp_assign_source_5;
+        CHECK_OBJECT( var_space );
+        tmp_assign_source_5 = var_space;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_5 );
+        tmp_exec_1__globals = tmp_assign_source_5;
+    }
+    {
+        nuitka_bool tmp_assign_source_6;
+        tmp_assign_source_6 = NUITKA_BOOL_FALSE;
+        tmp_exec_1__plain = tmp_assign_source_6;
+    }
+    {
+        nuitka_bool tmp_condition_result_1;
+        PyObject *tmp_compexpr_left_1;
+        PyObject *tmp_compexpr_right_1;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_compexpr_left_1 = tmp_exec_1__globals;
+        tmp_compexpr_right_1 = Py_None;
+        tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_1;
+        }
+        else
+        {
+            goto branch_no_1;
+        }
+        branch_yes_1:;
+        {
+            PyObject *tmp_assign_source_7;
+            tmp_assign_source_7 = (PyObject *)moduledict___main__;
+            {
+                PyObject *old = tmp_exec_1__globals;
+                assert( old != NULL );
+                tmp_exec_1__globals = tmp_assign_source_7;
+                Py_INCREF( tmp_exec_1__globals );
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            PyObject *tmp_assign_source_8;
+            if (locals___main__$$$function_9_functionWithExecAffectingClosure == NULL) locals___main__$$$function_9_functionWithExecAffectingClosure = PyDict_New();
+            tmp_assign_source_8 = locals___main__$$$function_9_functionWithExecAffectingClosure;
+            Py_INCREF( tmp_assign_source_8 );
+            if ( var_x->ob_ref != NULL )
+            {
+                PyObject *value;
+                CHECK_OBJECT( PyCell_GET( var_x ) );
+                value = PyCell_GET( var_x );
+
+                UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_8, (Nuitka_StringObject *)const_str_plain_x, value );
+            }
+            else
+            {
+                int res = PyDict_DelItem( tmp_assign_source_8, const_str_plain_x );
+
+                if ( res != 0 )
+                {
+                    CLEAR_ERROR_OCCURRED();
+                }
+            }
+
+            if ( var_code != NULL )
+            {
+                PyObject *value;
+                CHECK_OBJECT( var_code );
+                value = var_code;
+
+                UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_8, (Nuitka_StringObject *)const_str_plain_code, value );
+            }
+            else
+            {
+                int res = PyDict_DelItem( tmp_assign_source_8, const_str_plain_code );
+
+                if ( res != 0 )
+                {
+                    CLEAR_ERROR_OCCURRED();
+                }
+            }
+
+            if ( var_space != NULL )
+            {
+                PyObject *value;
+                CHECK_OBJECT( var_space );
+                value = var_space;
+
+                UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_8, (Nuitka_StringObject *)const_str_plain_space, value );
+            }
+            else
+            {
+                int res = PyDict_DelItem( tmp_assign_source_8, const_str_plain_space );
+
+                if ( res != 0 )
+                {
+                    CLEAR_ERROR_OCCURRED();
+                }
+            }
+
+            assert( tmp_exec_1__locals == NULL );
+            tmp_exec_1__locals = tmp_assign_source_8;
+        }
+        {
+            nuitka_bool tmp_assign_source_9;
+            tmp_assign_source_9 = NUITKA_BOOL_TRUE;
+            tmp_exec_1__plain = tmp_assign_source_9;
+        }
+        goto branch_end_1;
+        branch_no_1:;
+        {
+            PyObject *tmp_assign_source_10;
+            CHECK_OBJECT( tmp_exec_1__globals );
+            tmp_assign_source_10 = tmp_exec_1__globals;
+            assert( tmp_exec_1__locals == NULL );
+            Py_INCREF( tmp_assign_source_10 );
+            tmp_exec_1__locals = tmp_assign_source_10;
+        }
+        branch_end_1:;
+    }
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        CHECK_OBJECT( tmp_exec_1__exec_source );
+        tmp_exec_source_1 = tmp_exec_1__exec_source;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 269;
+            type_description_1 = "cooo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 269;
+            type_description_1 = "cooo";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 269;
+            type_description_1 = "cooo";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        nuitka_bool tmp_condition_result_2;
+        nuitka_bool tmp_compexpr_left_2;
+        nuitka_bool tmp_compexpr_right_2;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_2 = tmp_exec_1__plain;
+        tmp_compexpr_right_2 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_2 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_2;
+        }
+        else
+        {
+            goto branch_no_2;
+        }
+        branch_yes_2:;
+        {
+            PyObject *tmp_sync_locals_1;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_1 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 269;
+                type_description_1 = "cooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_space );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 269;
+                type_description_1 = "cooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_space;
+                var_space = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_x );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+                Py_DECREF( exception_keeper_type_1 );
+                Py_XDECREF( exception_keeper_value_1 );
+                Py_XDECREF( exception_keeper_tb_1 );
+
+                exception_lineno = 269;
+                type_description_1 = "cooo";
+                goto try_except_handler_2;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = PyCell_GET( var_x );
+                PyCell_SET( var_x, tmp_locals_value );
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_2:;
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    Py_XDECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    Py_XDECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        nuitka_bool tmp_condition_result_3;
+        nuitka_bool tmp_compexpr_left_3;
+        nuitka_bool tmp_compexpr_right_3;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_3 = tmp_exec_1__plain;
+        tmp_compexpr_right_3 = NUITKA_BOOL_TRUE;
+        tmp_condition_result_3 = ( tmp_compexpr_left_3 == tmp_compexpr_right_3 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_3 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_3;
+        }
+        else
+        {
+            goto branch_no_3;
+        }
+        branch_yes_3:;
+        {
+            PyObject *tmp_sync_locals_2;
+            CHECK_OBJECT( tmp_exec_1__locals );
+            tmp_sync_locals_2 = tmp_exec_1__locals;
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_code );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 269;
+                type_description_1 = "cooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_code;
+                var_code = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_space );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 269;
+                type_description_1 = "cooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = var_space;
+                var_space = tmp_locals_value;
+                Py_XDECREF( old );
+            }
+
+            }
+            tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_x );
+            if ( tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 269;
+                type_description_1 = "cooo";
+                goto frame_exception_exit_1;
+            }
+            CLEAR_ERROR_OCCURRED();
+            if ( tmp_locals_value != NULL )
+            {
+            {
+                PyObject *old = PyCell_GET( var_x );
+                PyCell_SET( var_x, tmp_locals_value );
+                Py_XDECREF( old );
+            }
+
+            }
+        }
+        branch_no_3:;
+    }
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__exec_source );
+    Py_DECREF( tmp_exec_1__exec_source );
+    tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    {
+        PyObject *tmp_assign_source_11;
+        tmp_assign_source_11 = MAKE_FUNCTION___main__$$$function_9_functionWithExecAffectingClosure$$$function_1_closureMaker(  );
+
+        ((struct Nuitka_FunctionObject *)tmp_assign_source_11)->m_closure[0] = var_x;
+        Py_INCREF( ((struct Nuitka_FunctionObject *)tmp_assign_source_11)->m_closure[0] );
+
+
+        assert( var_closureMaker == NULL );
+        var_closureMaker = tmp_assign_source_11;
+    }
+    {
+        PyObject *tmp_tuple_element_1;
+        PyObject *tmp_mvar_value_1;
+        PyObject *tmp_called_name_1;
+        tmp_tuple_element_1 = PyDict_GetItem( locals___main__$$$function_9_functionWithExecAffectingClosure, const_str_plain_d );
+
+        if ( tmp_tuple_element_1 == NULL )
+        {
+            tmp_mvar_value_1 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_d );
+
+            if (unlikely( tmp_mvar_value_1 == NULL ))
+            {
+                tmp_mvar_value_1 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_d );
+            }
+
+            if ( tmp_mvar_value_1 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "global name '%s' is not defined", "d" );
+                exception_tb = NULL;
+
+                exception_lineno = 274;
+                type_description_1 = "cooo";
+                goto frame_exception_exit_1;
+            }
+
+            tmp_tuple_element_1 = tmp_mvar_value_1;
+        }
+
+        tmp_return_value = PyTuple_New( 2 );
+        Py_INCREF( tmp_tuple_element_1 );
+        PyTuple_SET_ITEM( tmp_return_value, 0, tmp_tuple_element_1 );
+        CHECK_OBJECT( var_closureMaker );
+        tmp_called_name_1 = var_closureMaker;
+        frame_87f0811e96640ed92d76bddb83b77fbf->m_frame.f_lineno = 274;
+        tmp_tuple_element_1 = CALL_FUNCTION_NO_ARGS( tmp_called_name_1 );
+        if ( tmp_tuple_element_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_return_value );
+
+            exception_lineno = 274;
+            type_description_1 = "cooo";
+            goto frame_exception_exit_1;
+        }
+        PyTuple_SET_ITEM( tmp_return_value, 1, tmp_tuple_element_1 );
+        goto frame_return_exit_1;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_87f0811e96640ed92d76bddb83b77fbf );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_return_exit_1:;
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_87f0811e96640ed92d76bddb83b77fbf );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto try_return_handler_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_87f0811e96640ed92d76bddb83b77fbf );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_87f0811e96640ed92d76bddb83b77fbf, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_87f0811e96640ed92d76bddb83b77fbf->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_87f0811e96640ed92d76bddb83b77fbf, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_87f0811e96640ed92d76bddb83b77fbf,
+        type_description_1,
+        var_x,
+        var_code,
+        var_closureMaker,
+        var_space
+    );
+
+
+    // Release cached frame.
+    if ( frame_87f0811e96640ed92d76bddb83b77fbf == cache_frame_87f0811e96640ed92d76bddb83b77fbf )
+    {
+        Py_DECREF( frame_87f0811e96640ed92d76bddb83b77fbf );
+    }
+    cache_frame_87f0811e96640ed92d76bddb83b77fbf = NULL;
+
+    assertFrameObject( frame_87f0811e96640ed92d76bddb83b77fbf );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_9_functionWithExecAffectingClosure );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    CHECK_OBJECT( (PyObject *)var_x );
+    Py_DECREF( var_x );
+    var_x = NULL;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_closureMaker );
+    Py_DECREF( var_closureMaker );
+    var_closureMaker = NULL;
+
+    Py_XDECREF( var_space );
+    var_space = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)var_x );
+    Py_DECREF( var_x );
+    var_x = NULL;
+
+    Py_XDECREF( var_code );
+    var_code = NULL;
+
+    Py_XDECREF( var_closureMaker );
+    var_closureMaker = NULL;
+
+    Py_XDECREF( var_space );
+    var_space = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_9_functionWithExecAffectingClosure );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_9_functionWithExecAffectingClosure );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_9_functionWithExecAffectingClosure );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_9_functionWithExecAffectingClosure$$$function_1_closureMaker( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    struct Nuitka_FrameObject *frame_8a366b625ec3cbfcb967585db5acde80;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    static struct Nuitka_FrameObject *cache_frame_8a366b625ec3cbfcb967585db5acde80 = NULL;
+
+    // Actual function body.
+    MAKE_OR_REUSE_FRAME( cache_frame_8a366b625ec3cbfcb967585db5acde80, codeobj_8a366b625ec3cbfcb967585db5acde80, module___main__, sizeof(void *) );
+    frame_8a366b625ec3cbfcb967585db5acde80 = cache_frame_8a366b625ec3cbfcb967585db5acde80;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_8a366b625ec3cbfcb967585db5acde80 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_8a366b625ec3cbfcb967585db5acde80 ) == 2 ); // Frame stack
+
+    // Framed code:
+    if ( PyCell_GET( self->m_closure[0] ) == NULL )
+    {
+
+        exception_type = PyExc_NameError;
+        Py_INCREF( exception_type );
+        exception_value = PyString_FromFormat( "free variable '%s' referenced before assignment in enclosing scope", "x" );
+        exception_tb = NULL;
+
+        exception_lineno = 272;
+        type_description_1 = "c";
+        goto frame_exception_exit_1;
+    }
+
+    tmp_return_value = PyCell_GET( self->m_closure[0] );
+    Py_INCREF( tmp_return_value );
+    goto frame_return_exit_1;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_8a366b625ec3cbfcb967585db5acde80 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_return_exit_1:;
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_8a366b625ec3cbfcb967585db5acde80 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto function_return_exit;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_8a366b625ec3cbfcb967585db5acde80 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_8a366b625ec3cbfcb967585db5acde80, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_8a366b625ec3cbfcb967585db5acde80->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_8a366b625ec3cbfcb967585db5acde80, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_8a366b625ec3cbfcb967585db5acde80,
+        type_description_1,
+        self->m_closure[0]
+    );
+
+
+    // Release cached frame.
+    if ( frame_8a366b625ec3cbfcb967585db5acde80 == cache_frame_8a366b625ec3cbfcb967585db5acde80 )
+    {
+        Py_DECREF( frame_8a366b625ec3cbfcb967585db5acde80 );
+    }
+    cache_frame_8a366b625ec3cbfcb967585db5acde80 = NULL;
+
+    assertFrameObject( frame_8a366b625ec3cbfcb967585db5acde80 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto function_exception_exit;
+
+    frame_no_exception_1:;
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_9_functionWithExecAffectingClosure$$$function_1_closureMaker );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_10_generatorFunctionWithExec( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *tmp_return_value = NULL;
+
+    // Actual function body.
+    tmp_return_value = __main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_maker();
+
+
+
+    goto function_return_exit;
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_10_generatorFunctionWithExec );
+    return NULL;
+
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+
+struct __main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_locals {
+    PyObject *var_code;
+    PyObject *tmp_exec_1__exec_source;
+    PyObject *tmp_exec_1__globals;
+    PyObject *tmp_exec_1__locals;
+    PyObject *locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec;
+    char const *type_description_1;
+    PyObject *exception_type;
+    PyObject *exception_value;
+    PyTracebackObject *exception_tb;
+    int exception_lineno;
+    bool tmp_result;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    int exception_keeper_lineno_1;
+    PyObject *tmp_locals_value;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    int exception_keeper_lineno_2;
+    char yield_tmps[1024];
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    int exception_keeper_lineno_3;
+};
+
+static PyObject *__main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+{
+    CHECK_OBJECT( (PyObject *)generator );
+    assert( Nuitka_Generator_Check( (PyObject *)generator ) );
+
+    // Heap access if used.
+    struct __main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_locals *generator_heap = (struct __main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_locals *)generator->m_heap_storage;
+
+    // Dispatch to yield based on return label index:
+    switch(generator->m_yield_return_index) {
+    case 2: goto yield_return_2;
+    case 1: goto yield_return_1;
+    }
+
+    // Local variable initialization
+    static struct Nuitka_FrameObject *cache_m_frame = NULL;
+    generator_heap->var_code = NULL;
+    generator_heap->tmp_exec_1__exec_source = NULL;
+    generator_heap->tmp_exec_1__globals = NULL;
+    generator_heap->tmp_exec_1__locals = NULL;
+    generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec = NULL;
+    generator_heap->type_description_1 = NULL;
+    generator_heap->exception_type = NULL;
+    generator_heap->exception_value = NULL;
+    generator_heap->exception_tb = NULL;
+    generator_heap->exception_lineno = 0;
+
+    // Actual generator function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec = tmp_set_locals_1;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_m_frame, codeobj_5f6ff8d2eda5b6f8919e933d974bea75, module___main__, sizeof(void *) );
+    generator->m_frame = cache_m_frame;
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    Py_INCREF( generator->m_frame );
+    assert( Py_REFCNT( generator->m_frame ) == 2 ); // Frame stack
+
+#if PYTHON_VERSION >= 340
+    generator->m_frame->m_frame.f_gen = (PyObject *)generator;
+#endif
+
+    Py_CLEAR( generator->m_frame->m_frame.f_back );
+
+    generator->m_frame->m_frame.f_back = PyThreadState_GET()->frame;
+    Py_INCREF( generator->m_frame->m_frame.f_back );
+
+    PyThreadState_GET()->frame = &generator->m_frame->m_frame;
+    Py_INCREF( generator->m_frame );
+
+    Nuitka_Frame_MarkAsExecuting( generator->m_frame );
+
+#if PYTHON_VERSION >= 300
+    // Accept currently existing exception as the one to publish again when we
+    // yield or yield from.
+    {
+        PyThreadState *thread_state = PyThreadState_GET();
+
+#if PYTHON_VERSION < 370
+        generator->m_frame->m_frame.f_exc_type = EXC_TYPE( thread_state );
+    if ( generator->m_frame->m_frame.f_exc_type == Py_None ) generator->m_frame->m_frame.f_exc_type = NULL;
+        Py_XINCREF( generator->m_frame->m_frame.f_exc_type );
+    generator->m_frame->m_frame.f_exc_value = EXC_VALUE( thread_state );
+        Py_XINCREF( generator->m_frame->m_frame.f_exc_value );
+    generator->m_frame->m_frame.f_exc_traceback = EXC_TRACEBACK( thread_state );
+        Py_XINCREF( generator->m_frame->m_frame.f_exc_traceback );
+#else
+        generator->m_exc_state.exc_type = EXC_TYPE( thread_state );
+        if ( generator->m_exc_state.exc_type == Py_None ) generator->m_exc_state.exc_type = NULL;
+        Py_XINCREF( generator->m_exc_state.exc_type );
+        generator->m_exc_state.exc_value = EXC_VALUE( thread_state );
+        Py_XINCREF( generator->m_exc_state.exc_value );
+        generator->m_exc_state.exc_traceback = EXC_TRACEBACK( thread_state );
+        Py_XINCREF( generator->m_exc_state.exc_traceback );
+#endif
+    }
+
+#endif
+
+    // Framed code:
+    {
+        PyObject *tmp_expression_name_1;
+        NUITKA_MAY_BE_UNUSED PyObject *tmp_yield_result_1;
+        tmp_expression_name_1 = const_int_pos_1;
+        Py_INCREF( tmp_expression_name_1 );
+        generator->m_yield_return_index = 1;
+        return tmp_expression_name_1;
+        yield_return_1:
+        if ( yield_return_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+            generator_heap->exception_lineno = 279;
+            generator_heap->type_description_1 = "o";
+            goto frame_exception_exit_1;
+        }
+        tmp_yield_result_1 = yield_return_value;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = const_str_digest_0d7bc3f4ef5ef0685b5d7756f85ee411;
+        assert( generator_heap->var_code == NULL );
+        Py_INCREF( tmp_assign_source_1 );
+        generator_heap->var_code = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        CHECK_OBJECT( generator_heap->var_code );
+        tmp_assign_source_2 = generator_heap->var_code;
+        assert( generator_heap->tmp_exec_1__exec_source == NULL );
+        Py_INCREF( tmp_assign_source_2 );
+        generator_heap->tmp_exec_1__exec_source = tmp_assign_source_2;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        tmp_assign_source_3 = (PyObject *)moduledict___main__;
+        assert( generator_heap->tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_3 );
+        generator_heap->tmp_exec_1__globals = tmp_assign_source_3;
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        if (generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec == NULL) generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec = PyDict_New();
+        tmp_assign_source_4 = generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec;
+        Py_INCREF( tmp_assign_source_4 );
+        if ( generator_heap->var_code != NULL )
+        {
+            PyObject *value;
+            CHECK_OBJECT( generator_heap->var_code );
+            value = generator_heap->var_code;
+
+            UPDATE_STRING_DICT0( (PyDictObject *)tmp_assign_source_4, (Nuitka_StringObject *)const_str_plain_code, value );
+        }
+        else
+        {
+            int res = PyDict_DelItem( tmp_assign_source_4, const_str_plain_code );
+
+            if ( res != 0 )
+            {
+                CLEAR_ERROR_OCCURRED();
+            }
+        }
+
+        assert( generator_heap->tmp_exec_1__locals == NULL );
+        generator_heap->tmp_exec_1__locals = tmp_assign_source_4;
+    }
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        CHECK_OBJECT( generator_heap->tmp_exec_1__exec_source );
+        tmp_exec_source_1 = generator_heap->tmp_exec_1__exec_source;
+        CHECK_OBJECT( generator_heap->tmp_exec_1__globals );
+        tmp_exec_globals_1 = generator_heap->tmp_exec_1__globals;
+        CHECK_OBJECT( generator_heap->tmp_exec_1__locals );
+        tmp_exec_locals_1 = generator_heap->tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        generator_heap->tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( generator_heap->tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            generator_heap->exception_lineno = 282;
+            generator_heap->type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+            generator_heap->exception_lineno = 282;
+            generator_heap->type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+            generator_heap->exception_lineno = 282;
+            generator_heap->type_description_1 = "o";
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    generator_heap->exception_keeper_type_1 = generator_heap->exception_type;
+    generator_heap->exception_keeper_value_1 = generator_heap->exception_value;
+    generator_heap->exception_keeper_tb_1 = generator_heap->exception_tb;
+    generator_heap->exception_keeper_lineno_1 = generator_heap->exception_lineno;
+    generator_heap->exception_type = NULL;
+    generator_heap->exception_value = NULL;
+    generator_heap->exception_tb = NULL;
+    generator_heap->exception_lineno = 0;
+
+    {
+        PyObject *tmp_sync_locals_1;
+        CHECK_OBJECT( generator_heap->tmp_exec_1__locals );
+        tmp_sync_locals_1 = generator_heap->tmp_exec_1__locals;
+        generator_heap->tmp_locals_value = PyObject_GetItem( tmp_sync_locals_1, const_str_plain_code );
+        if ( generator_heap->tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+            Py_DECREF( generator_heap->exception_keeper_type_1 );
+            Py_XDECREF( generator_heap->exception_keeper_value_1 );
+            Py_XDECREF( generator_heap->exception_keeper_tb_1 );
+
+            generator_heap->exception_lineno = 282;
+            generator_heap->type_description_1 = "o";
+            goto try_except_handler_2;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( generator_heap->tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = generator_heap->var_code;
+            generator_heap->var_code = generator_heap->tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    // Re-raise.
+    generator_heap->exception_type = generator_heap->exception_keeper_type_1;
+    generator_heap->exception_value = generator_heap->exception_keeper_value_1;
+    generator_heap->exception_tb = generator_heap->exception_keeper_tb_1;
+    generator_heap->exception_lineno = generator_heap->exception_keeper_lineno_1;
+
+    goto try_except_handler_2;
+    // End of try:
+    try_end_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    generator_heap->exception_keeper_type_2 = generator_heap->exception_type;
+    generator_heap->exception_keeper_value_2 = generator_heap->exception_value;
+    generator_heap->exception_keeper_tb_2 = generator_heap->exception_tb;
+    generator_heap->exception_keeper_lineno_2 = generator_heap->exception_lineno;
+    generator_heap->exception_type = NULL;
+    generator_heap->exception_value = NULL;
+    generator_heap->exception_tb = NULL;
+    generator_heap->exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)generator_heap->tmp_exec_1__exec_source );
+    Py_DECREF( generator_heap->tmp_exec_1__exec_source );
+    generator_heap->tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)generator_heap->tmp_exec_1__globals );
+    Py_DECREF( generator_heap->tmp_exec_1__globals );
+    generator_heap->tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)generator_heap->tmp_exec_1__locals );
+    Py_DECREF( generator_heap->tmp_exec_1__locals );
+    generator_heap->tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    generator_heap->exception_type = generator_heap->exception_keeper_type_2;
+    generator_heap->exception_value = generator_heap->exception_keeper_value_2;
+    generator_heap->exception_tb = generator_heap->exception_keeper_tb_2;
+    generator_heap->exception_lineno = generator_heap->exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        PyObject *tmp_sync_locals_2;
+        CHECK_OBJECT( generator_heap->tmp_exec_1__locals );
+        tmp_sync_locals_2 = generator_heap->tmp_exec_1__locals;
+        generator_heap->tmp_locals_value = PyObject_GetItem( tmp_sync_locals_2, const_str_plain_code );
+        if ( generator_heap->tmp_locals_value == NULL && !EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_KeyError ) )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+            generator_heap->exception_lineno = 282;
+            generator_heap->type_description_1 = "o";
+            goto frame_exception_exit_1;
+        }
+        CLEAR_ERROR_OCCURRED();
+        if ( generator_heap->tmp_locals_value != NULL )
+        {
+        {
+            PyObject *old = generator_heap->var_code;
+            generator_heap->var_code = generator_heap->tmp_locals_value;
+            Py_XDECREF( old );
+        }
+
+        }
+    }
+    CHECK_OBJECT( (PyObject *)generator_heap->tmp_exec_1__exec_source );
+    Py_DECREF( generator_heap->tmp_exec_1__exec_source );
+    generator_heap->tmp_exec_1__exec_source = NULL;
+
+    CHECK_OBJECT( (PyObject *)generator_heap->tmp_exec_1__globals );
+    Py_DECREF( generator_heap->tmp_exec_1__globals );
+    generator_heap->tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)generator_heap->tmp_exec_1__locals );
+    Py_DECREF( generator_heap->tmp_exec_1__locals );
+    generator_heap->tmp_exec_1__locals = NULL;
+
+    {
+        PyObject *tmp_expression_name_2;
+        PyObject *tmp_mvar_value_1;
+        NUITKA_MAY_BE_UNUSED PyObject *tmp_yield_result_2;
+        tmp_expression_name_2 = PyDict_GetItem( generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec, const_str_plain_y );
+
+        if ( tmp_expression_name_2 == NULL )
+        {
+            tmp_mvar_value_1 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_y );
+
+            if (unlikely( tmp_mvar_value_1 == NULL ))
+            {
+                tmp_mvar_value_1 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_y );
+            }
+
+            if ( tmp_mvar_value_1 == NULL )
+            {
+
+                generator_heap->exception_type = PyExc_NameError;
+                Py_INCREF( generator_heap->exception_type );
+                generator_heap->exception_value = PyString_FromFormat( "global name '%s' is not defined", "y" );
+                generator_heap->exception_tb = NULL;
+
+                generator_heap->exception_lineno = 284;
+                generator_heap->type_description_1 = "o";
+                goto frame_exception_exit_1;
+            }
+
+            tmp_expression_name_2 = tmp_mvar_value_1;
+        }
+
+        Py_INCREF( tmp_expression_name_2 );
+        Nuitka_PreserveHeap( generator_heap->yield_tmps, &tmp_mvar_value_1, sizeof(PyObject *), NULL );
+        generator->m_yield_return_index = 2;
+        return tmp_expression_name_2;
+        yield_return_2:
+        Nuitka_RestoreHeap( generator_heap->yield_tmps, &tmp_mvar_value_1, sizeof(PyObject *), NULL );
+        if ( yield_return_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+            generator_heap->exception_lineno = 284;
+            generator_heap->type_description_1 = "o";
+            goto frame_exception_exit_1;
+        }
+        tmp_yield_result_2 = yield_return_value;
+    }
+
+    Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+
+#if PYTHON_VERSION >= 370
+    Py_CLEAR( generator->m_exc_state.exc_type );
+    Py_CLEAR( generator->m_exc_state.exc_value );
+    Py_CLEAR( generator->m_exc_state.exc_traceback );
+#elif PYTHON_VERSION >= 300
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_type );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_value );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_traceback );
+#endif
+
+    // Allow re-use of the frame again.
+    Py_DECREF( generator->m_frame );
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+    // If it's not an exit exception, consider and create a traceback for it.
+    if ( !EXCEPTION_MATCH_GENERATOR( generator_heap->exception_type ) )
+    {
+        if ( generator_heap->exception_tb == NULL )
+        {
+            generator_heap->exception_tb = MAKE_TRACEBACK( generator->m_frame, generator_heap->exception_lineno );
+        }
+        else if ( generator_heap->exception_tb->tb_frame != &generator->m_frame->m_frame )
+        {
+            generator_heap->exception_tb = ADD_TRACEBACK( generator_heap->exception_tb, generator->m_frame, generator_heap->exception_lineno );
+        }
+
+        Nuitka_Frame_AttachLocals(
+            (struct Nuitka_FrameObject *)generator->m_frame,
+            generator_heap->type_description_1,
+            generator_heap->var_code
+        );
+
+
+        // Release cached frame.
+        if ( generator->m_frame == cache_m_frame )
+        {
+            Py_DECREF( generator->m_frame );
+        }
+        cache_m_frame = NULL;
+
+        assertFrameObject( generator->m_frame );
+    }
+
+#if PYTHON_VERSION >= 370
+    Py_CLEAR( generator->m_exc_state.exc_type );
+    Py_CLEAR( generator->m_exc_state.exc_value );
+    Py_CLEAR( generator->m_exc_state.exc_traceback );
+#elif PYTHON_VERSION >= 300
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_type );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_value );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_traceback );
+#endif
+
+    Py_DECREF( generator->m_frame );
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    goto try_end_3;
+    // Exception handler code:
+    try_except_handler_1:;
+    generator_heap->exception_keeper_type_3 = generator_heap->exception_type;
+    generator_heap->exception_keeper_value_3 = generator_heap->exception_value;
+    generator_heap->exception_keeper_tb_3 = generator_heap->exception_tb;
+    generator_heap->exception_keeper_lineno_3 = generator_heap->exception_lineno;
+    generator_heap->exception_type = NULL;
+    generator_heap->exception_value = NULL;
+    generator_heap->exception_tb = NULL;
+    generator_heap->exception_lineno = 0;
+
+    Py_XDECREF( generator_heap->var_code );
+    generator_heap->var_code = NULL;
+
+    // Re-raise.
+    generator_heap->exception_type = generator_heap->exception_keeper_type_3;
+    generator_heap->exception_value = generator_heap->exception_keeper_value_3;
+    generator_heap->exception_tb = generator_heap->exception_keeper_tb_3;
+    generator_heap->exception_lineno = generator_heap->exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+    try_end_3:;
+    Py_XDECREF( generator_heap->var_code );
+    generator_heap->var_code = NULL;
+
+
+    Py_XDECREF( generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec );
+
+    return NULL;
+
+    function_exception_exit:
+    Py_XDECREF( generator_heap->locals___main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec );
+    assert( generator_heap->exception_type );
+    RESTORE_ERROR_OCCURRED( generator_heap->exception_type, generator_heap->exception_value, generator_heap->exception_tb );
+
+    return NULL;
+
+}
+
+static PyObject *__main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_maker( void )
+{
+    return Nuitka_Generator_New(
+        __main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_context,
+        module___main__,
+        const_str_plain_generatorFunctionWithExec,
+#if PYTHON_VERSION >= 350
+        NULL,
+#endif
+        codeobj_5f6ff8d2eda5b6f8919e933d974bea75,
+        0,
+        sizeof(struct __main__$$$function_10_generatorFunctionWithExec$$$genobj_1_generatorFunctionWithExec_locals)
+    );
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_18_evalInContractions( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_s = NULL;
+    PyObject *var_r1 = NULL;
+    PyObject *var_r2 = NULL;
+    PyObject *tmp_eval_call_1__globals = NULL;
+    PyObject *tmp_eval_call_1__locals = NULL;
+    PyObject *tmp_eval_call_1__source = NULL;
+    PyObject *tmp_genexpr_1__$0 = NULL;
+    PyObject *tmp_list_contraction_1__$0 = NULL;
+    PyObject *tmp_list_contraction_1__contraction_result = NULL;
+    PyObject *tmp_list_contraction_1__iter_value_0 = NULL;
+    struct Nuitka_FrameObject *frame_745c1c1c411b0216b3f64e2c5b36d53e;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    int tmp_res;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    static struct Nuitka_FrameObject *cache_frame_745c1c1c411b0216b3f64e2c5b36d53e = NULL;
+    PyObject *tmp_return_value = NULL;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+
+    // Actual function body.
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_745c1c1c411b0216b3f64e2c5b36d53e, codeobj_745c1c1c411b0216b3f64e2c5b36d53e, module___main__, sizeof(void *)+sizeof(void *)+sizeof(void *) );
+    frame_745c1c1c411b0216b3f64e2c5b36d53e = cache_frame_745c1c1c411b0216b3f64e2c5b36d53e;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_745c1c1c411b0216b3f64e2c5b36d53e );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_745c1c1c411b0216b3f64e2c5b36d53e ) == 2 ); // Frame stack
+
+    // Framed code:
+    {
+        PyObject *tmp_assign_source_1;
+        PyObject *tmp_list_arg_1;
+        {
+            PyObject *tmp_assign_source_2;
+            PyObject *tmp_iter_arg_1;
+            tmp_iter_arg_1 = const_tuple_int_0_int_pos_1_int_pos_2_tuple;
+            tmp_assign_source_2 = MAKE_ITERATOR( tmp_iter_arg_1 );
+            assert( !(tmp_assign_source_2 == NULL) );
+            assert( tmp_genexpr_1__$0 == NULL );
+            tmp_genexpr_1__$0 = tmp_assign_source_2;
+        }
+        // Tried code:
+        tmp_list_arg_1 = __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_maker();
+
+        ((struct Nuitka_GeneratorObject *)tmp_list_arg_1)->m_closure[0] = PyCell_NEW0( tmp_genexpr_1__$0 );
+
+
+        goto try_return_handler_2;
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+        return NULL;
+        // Return handler code:
+        try_return_handler_2:;
+        CHECK_OBJECT( (PyObject *)tmp_genexpr_1__$0 );
+        Py_DECREF( tmp_genexpr_1__$0 );
+        tmp_genexpr_1__$0 = NULL;
+
+        goto outline_result_1;
+        // End of try:
+        CHECK_OBJECT( (PyObject *)tmp_genexpr_1__$0 );
+        Py_DECREF( tmp_genexpr_1__$0 );
+        tmp_genexpr_1__$0 = NULL;
+
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+        return NULL;
+        outline_result_1:;
+        tmp_assign_source_1 = PySequence_List( tmp_list_arg_1 );
+        Py_DECREF( tmp_list_arg_1 );
+        if ( tmp_assign_source_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 290;
+            type_description_1 = "ooo";
+            goto frame_exception_exit_1;
+        }
+        assert( var_r1 == NULL );
+        var_r1 = tmp_assign_source_1;
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        {
+            PyObject *tmp_assign_source_4;
+            PyObject *tmp_iter_arg_2;
+            tmp_iter_arg_2 = const_tuple_int_0_int_pos_1_int_pos_2_int_pos_3_tuple;
+            tmp_assign_source_4 = MAKE_ITERATOR( tmp_iter_arg_2 );
+            assert( !(tmp_assign_source_4 == NULL) );
+            assert( tmp_list_contraction_1__$0 == NULL );
+            tmp_list_contraction_1__$0 = tmp_assign_source_4;
+        }
+        {
+            PyObject *tmp_assign_source_5;
+            tmp_assign_source_5 = PyList_New( 0 );
+            assert( tmp_list_contraction_1__contraction_result == NULL );
+            tmp_list_contraction_1__contraction_result = tmp_assign_source_5;
+        }
+        // Tried code:
+        loop_start_1:;
+        {
+            PyObject *tmp_next_source_1;
+            PyObject *tmp_assign_source_6;
+            CHECK_OBJECT( tmp_list_contraction_1__$0 );
+            tmp_next_source_1 = tmp_list_contraction_1__$0;
+            tmp_assign_source_6 = ITERATOR_NEXT( tmp_next_source_1 );
+            if ( tmp_assign_source_6 == NULL )
+            {
+                if ( CHECK_AND_CLEAR_STOP_ITERATION_OCCURRED() )
+                {
+
+                    goto loop_end_1;
+                }
+                else
+                {
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+                    type_description_1 = "ooo";
+                    exception_lineno = 291;
+                    goto try_except_handler_3;
+                }
+            }
+
+            {
+                PyObject *old = tmp_list_contraction_1__iter_value_0;
+                tmp_list_contraction_1__iter_value_0 = tmp_assign_source_6;
+                Py_XDECREF( old );
+            }
+
+        }
+        {
+            PyObject *tmp_assign_source_7;
+            CHECK_OBJECT( tmp_list_contraction_1__iter_value_0 );
+            tmp_assign_source_7 = tmp_list_contraction_1__iter_value_0;
+            {
+                PyObject *old = var_s;
+                var_s = tmp_assign_source_7;
+                Py_INCREF( var_s );
+                Py_XDECREF( old );
+            }
+
+        }
+        {
+            PyObject *tmp_append_list_1;
+            PyObject *tmp_append_value_1;
+            CHECK_OBJECT( tmp_list_contraction_1__contraction_result );
+            tmp_append_list_1 = tmp_list_contraction_1__contraction_result;
+            {
+                PyObject *tmp_assign_source_8;
+                PyObject *tmp_dict_key_1;
+                PyObject *tmp_dict_value_1;
+                PyObject *tmp_dict_key_2;
+                PyObject *tmp_dict_value_2;
+                CHECK_OBJECT( var_s );
+                tmp_dict_value_1 = var_s;
+                tmp_dict_key_1 = const_str_plain_s;
+                tmp_assign_source_8 = _PyDict_NewPresized( 2 );
+                tmp_res = PyDict_SetItem( tmp_assign_source_8, tmp_dict_key_1, tmp_dict_value_1 );
+                assert( !(tmp_res != 0) );
+                CHECK_OBJECT( var_r1 );
+                tmp_dict_value_2 = var_r1;
+                tmp_dict_key_2 = const_str_plain_r1;
+                tmp_res = PyDict_SetItem( tmp_assign_source_8, tmp_dict_key_2, tmp_dict_value_2 );
+                assert( !(tmp_res != 0) );
+                assert( tmp_eval_call_1__locals == NULL );
+                tmp_eval_call_1__locals = tmp_assign_source_8;
+            }
+            {
+                PyObject *tmp_assign_source_9;
+                tmp_assign_source_9 = (PyObject *)moduledict___main__;
+                assert( tmp_eval_call_1__globals == NULL );
+                Py_INCREF( tmp_assign_source_9 );
+                tmp_eval_call_1__globals = tmp_assign_source_9;
+            }
+            // Tried code:
+            {
+                PyObject *tmp_assign_source_10;
+                PyObject *tmp_str_arg_1;
+                CHECK_OBJECT( var_s );
+                tmp_str_arg_1 = var_s;
+                tmp_assign_source_10 = PyObject_Str( tmp_str_arg_1 );
+                if ( tmp_assign_source_10 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 291;
+                    type_description_1 = "ooo";
+                    goto try_except_handler_4;
+                }
+                assert( tmp_eval_call_1__source == NULL );
+                tmp_eval_call_1__source = tmp_assign_source_10;
+            }
+            {
+                nuitka_bool tmp_condition_result_1;
+                PyObject *tmp_operand_name_1;
+                PyObject *tmp_isinstance_inst_1;
+                PyObject *tmp_isinstance_cls_1;
+                CHECK_OBJECT( tmp_eval_call_1__source );
+                tmp_isinstance_inst_1 = tmp_eval_call_1__source;
+                tmp_isinstance_cls_1 = const_tuple_anon_code_type_memoryview_tuple;
+                tmp_res = Nuitka_IsInstance( tmp_isinstance_inst_1, tmp_isinstance_cls_1 );
+                if ( tmp_res == -1 )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 291;
+                    type_description_1 = "ooo";
+                    goto try_except_handler_4;
+                }
+                tmp_operand_name_1 = ( tmp_res != 0 ) ? Py_True : Py_False;
+                tmp_res = CHECK_IF_TRUE( tmp_operand_name_1 );
+                if ( tmp_res == -1 )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 291;
+                    type_description_1 = "ooo";
+                    goto try_except_handler_4;
+                }
+                tmp_condition_result_1 = ( tmp_res == 0 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+                if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+                {
+                    goto branch_yes_1;
+                }
+                else
+                {
+                    goto branch_no_1;
+                }
+                branch_yes_1:;
+                {
+                    PyObject *tmp_assign_source_11;
+                    PyObject *tmp_called_instance_1;
+                    CHECK_OBJECT( tmp_eval_call_1__source );
+                    tmp_called_instance_1 = tmp_eval_call_1__source;
+                    frame_745c1c1c411b0216b3f64e2c5b36d53e->m_frame.f_lineno = 291;
+                    tmp_assign_source_11 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_1, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+                    if ( tmp_assign_source_11 == NULL )
+                    {
+                        assert( ERROR_OCCURRED() );
+
+                        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                        exception_lineno = 291;
+                        type_description_1 = "ooo";
+                        goto try_except_handler_4;
+                    }
+                    {
+                        PyObject *old = tmp_eval_call_1__source;
+                        assert( old != NULL );
+                        tmp_eval_call_1__source = tmp_assign_source_11;
+                        Py_DECREF( old );
+                    }
+
+                }
+                branch_no_1:;
+            }
+            {
+                PyObject *tmp_eval_source_1;
+                PyObject *tmp_eval_globals_1;
+                PyObject *tmp_eval_locals_1;
+                PyObject *tmp_eval_compiled_1;
+                CHECK_OBJECT( tmp_eval_call_1__source );
+                tmp_eval_source_1 = tmp_eval_call_1__source;
+                CHECK_OBJECT( tmp_eval_call_1__globals );
+                tmp_eval_globals_1 = tmp_eval_call_1__globals;
+                CHECK_OBJECT( tmp_eval_call_1__locals );
+                tmp_eval_locals_1 = tmp_eval_call_1__locals;
+                tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+                if ( tmp_eval_compiled_1 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 291;
+                    type_description_1 = "ooo";
+                    goto try_except_handler_4;
+                }
+                tmp_append_value_1 = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+                Py_DECREF( tmp_eval_compiled_1 );
+                if ( tmp_append_value_1 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 291;
+                    type_description_1 = "ooo";
+                    goto try_except_handler_4;
+                }
+                goto try_return_handler_4;
+            }
+            // tried codes exits in all cases
+            NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+            return NULL;
+            // Return handler code:
+            try_return_handler_4:;
+            CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+            Py_DECREF( tmp_eval_call_1__globals );
+            tmp_eval_call_1__globals = NULL;
+
+            CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+            Py_DECREF( tmp_eval_call_1__locals );
+            tmp_eval_call_1__locals = NULL;
+
+            Py_XDECREF( tmp_eval_call_1__source );
+            tmp_eval_call_1__source = NULL;
+
+            goto outline_result_3;
+            // Exception handler code:
+            try_except_handler_4:;
+            exception_keeper_type_1 = exception_type;
+            exception_keeper_value_1 = exception_value;
+            exception_keeper_tb_1 = exception_tb;
+            exception_keeper_lineno_1 = exception_lineno;
+            exception_type = NULL;
+            exception_value = NULL;
+            exception_tb = NULL;
+            exception_lineno = 0;
+
+            CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+            Py_DECREF( tmp_eval_call_1__globals );
+            tmp_eval_call_1__globals = NULL;
+
+            CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+            Py_DECREF( tmp_eval_call_1__locals );
+            tmp_eval_call_1__locals = NULL;
+
+            Py_XDECREF( tmp_eval_call_1__source );
+            tmp_eval_call_1__source = NULL;
+
+            // Re-raise.
+            exception_type = exception_keeper_type_1;
+            exception_value = exception_keeper_value_1;
+            exception_tb = exception_keeper_tb_1;
+            exception_lineno = exception_keeper_lineno_1;
+
+            goto try_except_handler_3;
+            // End of try:
+            // Return statement must have exited already.
+            NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+            return NULL;
+            outline_result_3:;
+            assert( PyList_Check( tmp_append_list_1 ) );
+            tmp_res = PyList_Append( tmp_append_list_1, tmp_append_value_1 );
+            Py_DECREF( tmp_append_value_1 );
+            if ( tmp_res == -1 )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 291;
+                type_description_1 = "ooo";
+                goto try_except_handler_3;
+            }
+        }
+        if ( CONSIDER_THREADING() == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 291;
+            type_description_1 = "ooo";
+            goto try_except_handler_3;
+        }
+        goto loop_start_1;
+        loop_end_1:;
+        CHECK_OBJECT( tmp_list_contraction_1__contraction_result );
+        tmp_assign_source_3 = tmp_list_contraction_1__contraction_result;
+        Py_INCREF( tmp_assign_source_3 );
+        goto try_return_handler_3;
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+        return NULL;
+        // Return handler code:
+        try_return_handler_3:;
+        CHECK_OBJECT( (PyObject *)tmp_list_contraction_1__$0 );
+        Py_DECREF( tmp_list_contraction_1__$0 );
+        tmp_list_contraction_1__$0 = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_list_contraction_1__contraction_result );
+        Py_DECREF( tmp_list_contraction_1__contraction_result );
+        tmp_list_contraction_1__contraction_result = NULL;
+
+        Py_XDECREF( tmp_list_contraction_1__iter_value_0 );
+        tmp_list_contraction_1__iter_value_0 = NULL;
+
+        goto outline_result_2;
+        // Exception handler code:
+        try_except_handler_3:;
+        exception_keeper_type_2 = exception_type;
+        exception_keeper_value_2 = exception_value;
+        exception_keeper_tb_2 = exception_tb;
+        exception_keeper_lineno_2 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)tmp_list_contraction_1__$0 );
+        Py_DECREF( tmp_list_contraction_1__$0 );
+        tmp_list_contraction_1__$0 = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_list_contraction_1__contraction_result );
+        Py_DECREF( tmp_list_contraction_1__contraction_result );
+        tmp_list_contraction_1__contraction_result = NULL;
+
+        Py_XDECREF( tmp_list_contraction_1__iter_value_0 );
+        tmp_list_contraction_1__iter_value_0 = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_2;
+        exception_value = exception_keeper_value_2;
+        exception_tb = exception_keeper_tb_2;
+        exception_lineno = exception_keeper_lineno_2;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+        return NULL;
+        outline_result_2:;
+        assert( var_r2 == NULL );
+        var_r2 = tmp_assign_source_3;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_745c1c1c411b0216b3f64e2c5b36d53e );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_745c1c1c411b0216b3f64e2c5b36d53e );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_745c1c1c411b0216b3f64e2c5b36d53e, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_745c1c1c411b0216b3f64e2c5b36d53e->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_745c1c1c411b0216b3f64e2c5b36d53e, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_745c1c1c411b0216b3f64e2c5b36d53e,
+        type_description_1,
+        var_s,
+        var_r1,
+        var_r2
+    );
+
+
+    // Release cached frame.
+    if ( frame_745c1c1c411b0216b3f64e2c5b36d53e == cache_frame_745c1c1c411b0216b3f64e2c5b36d53e )
+    {
+        Py_DECREF( frame_745c1c1c411b0216b3f64e2c5b36d53e );
+    }
+    cache_frame_745c1c1c411b0216b3f64e2c5b36d53e = NULL;
+
+    assertFrameObject( frame_745c1c1c411b0216b3f64e2c5b36d53e );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    {
+        PyObject *tmp_tuple_element_1;
+        CHECK_OBJECT( var_r1 );
+        tmp_tuple_element_1 = var_r1;
+        tmp_return_value = PyTuple_New( 2 );
+        Py_INCREF( tmp_tuple_element_1 );
+        PyTuple_SET_ITEM( tmp_return_value, 0, tmp_tuple_element_1 );
+        CHECK_OBJECT( var_r2 );
+        tmp_tuple_element_1 = var_r2;
+        Py_INCREF( tmp_tuple_element_1 );
+        PyTuple_SET_ITEM( tmp_return_value, 1, tmp_tuple_element_1 );
+        goto try_return_handler_1;
+    }
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    Py_XDECREF( var_s );
+    var_s = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_r1 );
+    Py_DECREF( var_r1 );
+    var_r1 = NULL;
+
+    CHECK_OBJECT( (PyObject *)var_r2 );
+    Py_DECREF( var_r2 );
+    var_r2 = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_s );
+    var_s = NULL;
+
+    Py_XDECREF( var_r1 );
+    var_r1 = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions );
+    return NULL;
+
+function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+
+struct __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_locals {
+    PyObject *var_s;
+    PyObject *tmp_eval_call_1__globals;
+    PyObject *tmp_eval_call_1__locals;
+    PyObject *tmp_eval_call_1__source;
+    PyObject *tmp_iter_value_0;
+    char const *type_description_1;
+    PyObject *exception_type;
+    PyObject *exception_value;
+    PyTracebackObject *exception_tb;
+    int exception_lineno;
+    int tmp_res;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    int exception_keeper_lineno_1;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    int exception_keeper_lineno_2;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    int exception_keeper_lineno_3;
+};
+
+static PyObject *__main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_context( struct Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+{
+    CHECK_OBJECT( (PyObject *)generator );
+    assert( Nuitka_Generator_Check( (PyObject *)generator ) );
+
+    // Heap access if used.
+    struct __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_locals *generator_heap = (struct __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_locals *)generator->m_heap_storage;
+
+    // Dispatch to yield based on return label index:
+    switch(generator->m_yield_return_index) {
+    case 1: goto yield_return_1;
+    }
+
+    // Local variable initialization
+    static struct Nuitka_FrameObject *cache_m_frame = NULL;
+    generator_heap->var_s = NULL;
+    generator_heap->tmp_eval_call_1__globals = NULL;
+    generator_heap->tmp_eval_call_1__locals = NULL;
+    generator_heap->tmp_eval_call_1__source = NULL;
+    generator_heap->tmp_iter_value_0 = NULL;
+    generator_heap->type_description_1 = NULL;
+    generator_heap->exception_type = NULL;
+    generator_heap->exception_value = NULL;
+    generator_heap->exception_tb = NULL;
+    generator_heap->exception_lineno = 0;
+
+    // Actual generator function body.
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_m_frame, codeobj_c537def1486cf539a83a18a1c7837e16, module___main__, sizeof(void *)+sizeof(void *) );
+    generator->m_frame = cache_m_frame;
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    Py_INCREF( generator->m_frame );
+    assert( Py_REFCNT( generator->m_frame ) == 2 ); // Frame stack
+
+#if PYTHON_VERSION >= 340
+    generator->m_frame->m_frame.f_gen = (PyObject *)generator;
+#endif
+
+    Py_CLEAR( generator->m_frame->m_frame.f_back );
+
+    generator->m_frame->m_frame.f_back = PyThreadState_GET()->frame;
+    Py_INCREF( generator->m_frame->m_frame.f_back );
+
+    PyThreadState_GET()->frame = &generator->m_frame->m_frame;
+    Py_INCREF( generator->m_frame );
+
+    Nuitka_Frame_MarkAsExecuting( generator->m_frame );
+
+#if PYTHON_VERSION >= 300
+    // Accept currently existing exception as the one to publish again when we
+    // yield or yield from.
+    {
+        PyThreadState *thread_state = PyThreadState_GET();
+
+#if PYTHON_VERSION < 370
+        generator->m_frame->m_frame.f_exc_type = EXC_TYPE( thread_state );
+    if ( generator->m_frame->m_frame.f_exc_type == Py_None ) generator->m_frame->m_frame.f_exc_type = NULL;
+        Py_XINCREF( generator->m_frame->m_frame.f_exc_type );
+    generator->m_frame->m_frame.f_exc_value = EXC_VALUE( thread_state );
+        Py_XINCREF( generator->m_frame->m_frame.f_exc_value );
+    generator->m_frame->m_frame.f_exc_traceback = EXC_TRACEBACK( thread_state );
+        Py_XINCREF( generator->m_frame->m_frame.f_exc_traceback );
+#else
+        generator->m_exc_state.exc_type = EXC_TYPE( thread_state );
+        if ( generator->m_exc_state.exc_type == Py_None ) generator->m_exc_state.exc_type = NULL;
+        Py_XINCREF( generator->m_exc_state.exc_type );
+        generator->m_exc_state.exc_value = EXC_VALUE( thread_state );
+        Py_XINCREF( generator->m_exc_state.exc_value );
+        generator->m_exc_state.exc_traceback = EXC_TRACEBACK( thread_state );
+        Py_XINCREF( generator->m_exc_state.exc_traceback );
+#endif
+    }
+
+#endif
+
+    // Framed code:
+    // Tried code:
+    loop_start_1:;
+    {
+        PyObject *tmp_next_source_1;
+        PyObject *tmp_assign_source_1;
+        CHECK_OBJECT( PyCell_GET( generator->m_closure[0] ) );
+        tmp_next_source_1 = PyCell_GET( generator->m_closure[0] );
+        tmp_assign_source_1 = ITERATOR_NEXT( tmp_next_source_1 );
+        if ( tmp_assign_source_1 == NULL )
+        {
+            if ( CHECK_AND_CLEAR_STOP_ITERATION_OCCURRED() )
+            {
+
+                goto loop_end_1;
+            }
+            else
+            {
+
+                FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+                generator_heap->type_description_1 = "No";
+                generator_heap->exception_lineno = 290;
+                goto try_except_handler_2;
+            }
+        }
+
+        {
+            PyObject *old = generator_heap->tmp_iter_value_0;
+            generator_heap->tmp_iter_value_0 = tmp_assign_source_1;
+            Py_XDECREF( old );
+        }
+
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        CHECK_OBJECT( generator_heap->tmp_iter_value_0 );
+        tmp_assign_source_2 = generator_heap->tmp_iter_value_0;
+        {
+            PyObject *old = generator_heap->var_s;
+            generator_heap->var_s = tmp_assign_source_2;
+            Py_INCREF( generator_heap->var_s );
+            Py_XDECREF( old );
+        }
+
+    }
+    {
+        PyObject *tmp_expression_name_1;
+        NUITKA_MAY_BE_UNUSED PyObject *tmp_yield_result_1;
+        {
+            PyObject *tmp_assign_source_3;
+            PyObject *tmp_dict_key_1;
+            PyObject *tmp_dict_value_1;
+            CHECK_OBJECT( generator_heap->var_s );
+            tmp_dict_value_1 = generator_heap->var_s;
+            tmp_dict_key_1 = const_str_plain_s;
+            tmp_assign_source_3 = _PyDict_NewPresized( 1 );
+            generator_heap->tmp_res = PyDict_SetItem( tmp_assign_source_3, tmp_dict_key_1, tmp_dict_value_1 );
+            assert( !(generator_heap->tmp_res != 0) );
+            assert( generator_heap->tmp_eval_call_1__locals == NULL );
+            generator_heap->tmp_eval_call_1__locals = tmp_assign_source_3;
+        }
+        {
+            PyObject *tmp_assign_source_4;
+            tmp_assign_source_4 = (PyObject *)moduledict___main__;
+            assert( generator_heap->tmp_eval_call_1__globals == NULL );
+            Py_INCREF( tmp_assign_source_4 );
+            generator_heap->tmp_eval_call_1__globals = tmp_assign_source_4;
+        }
+        // Tried code:
+        {
+            PyObject *tmp_assign_source_5;
+            PyObject *tmp_str_arg_1;
+            CHECK_OBJECT( generator_heap->var_s );
+            tmp_str_arg_1 = generator_heap->var_s;
+            tmp_assign_source_5 = PyObject_Str( tmp_str_arg_1 );
+            if ( tmp_assign_source_5 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+                generator_heap->exception_lineno = 290;
+                generator_heap->type_description_1 = "No";
+                goto try_except_handler_3;
+            }
+            assert( generator_heap->tmp_eval_call_1__source == NULL );
+            generator_heap->tmp_eval_call_1__source = tmp_assign_source_5;
+        }
+        {
+            nuitka_bool tmp_condition_result_1;
+            PyObject *tmp_operand_name_1;
+            PyObject *tmp_isinstance_inst_1;
+            PyObject *tmp_isinstance_cls_1;
+            CHECK_OBJECT( generator_heap->tmp_eval_call_1__source );
+            tmp_isinstance_inst_1 = generator_heap->tmp_eval_call_1__source;
+            tmp_isinstance_cls_1 = const_tuple_anon_code_type_memoryview_tuple;
+            generator_heap->tmp_res = Nuitka_IsInstance( tmp_isinstance_inst_1, tmp_isinstance_cls_1 );
+            if ( generator_heap->tmp_res == -1 )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+                generator_heap->exception_lineno = 290;
+                generator_heap->type_description_1 = "No";
+                goto try_except_handler_3;
+            }
+            tmp_operand_name_1 = ( generator_heap->tmp_res != 0 ) ? Py_True : Py_False;
+            generator_heap->tmp_res = CHECK_IF_TRUE( tmp_operand_name_1 );
+            if ( generator_heap->tmp_res == -1 )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+                generator_heap->exception_lineno = 290;
+                generator_heap->type_description_1 = "No";
+                goto try_except_handler_3;
+            }
+            tmp_condition_result_1 = ( generator_heap->tmp_res == 0 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_1;
+            }
+            else
+            {
+                goto branch_no_1;
+            }
+            branch_yes_1:;
+            {
+                PyObject *tmp_assign_source_6;
+                PyObject *tmp_called_instance_1;
+                CHECK_OBJECT( generator_heap->tmp_eval_call_1__source );
+                tmp_called_instance_1 = generator_heap->tmp_eval_call_1__source;
+                generator->m_frame->m_frame.f_lineno = 290;
+                tmp_assign_source_6 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_1, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+                if ( tmp_assign_source_6 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+                    generator_heap->exception_lineno = 290;
+                    generator_heap->type_description_1 = "No";
+                    goto try_except_handler_3;
+                }
+                {
+                    PyObject *old = generator_heap->tmp_eval_call_1__source;
+                    assert( old != NULL );
+                    generator_heap->tmp_eval_call_1__source = tmp_assign_source_6;
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_1:;
+        }
+        {
+            PyObject *tmp_eval_source_1;
+            PyObject *tmp_eval_globals_1;
+            PyObject *tmp_eval_locals_1;
+            PyObject *tmp_eval_compiled_1;
+            CHECK_OBJECT( generator_heap->tmp_eval_call_1__source );
+            tmp_eval_source_1 = generator_heap->tmp_eval_call_1__source;
+            CHECK_OBJECT( generator_heap->tmp_eval_call_1__globals );
+            tmp_eval_globals_1 = generator_heap->tmp_eval_call_1__globals;
+            CHECK_OBJECT( generator_heap->tmp_eval_call_1__locals );
+            tmp_eval_locals_1 = generator_heap->tmp_eval_call_1__locals;
+            tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+            if ( tmp_eval_compiled_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+                generator_heap->exception_lineno = 290;
+                generator_heap->type_description_1 = "No";
+                goto try_except_handler_3;
+            }
+            tmp_expression_name_1 = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+            Py_DECREF( tmp_eval_compiled_1 );
+            if ( tmp_expression_name_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+                generator_heap->exception_lineno = 290;
+                generator_heap->type_description_1 = "No";
+                goto try_except_handler_3;
+            }
+            goto try_return_handler_3;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr );
+        return NULL;
+        // Return handler code:
+        try_return_handler_3:;
+        CHECK_OBJECT( (PyObject *)generator_heap->tmp_eval_call_1__globals );
+        Py_DECREF( generator_heap->tmp_eval_call_1__globals );
+        generator_heap->tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)generator_heap->tmp_eval_call_1__locals );
+        Py_DECREF( generator_heap->tmp_eval_call_1__locals );
+        generator_heap->tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( generator_heap->tmp_eval_call_1__source );
+        generator_heap->tmp_eval_call_1__source = NULL;
+
+        goto outline_result_1;
+        // Exception handler code:
+        try_except_handler_3:;
+        generator_heap->exception_keeper_type_1 = generator_heap->exception_type;
+        generator_heap->exception_keeper_value_1 = generator_heap->exception_value;
+        generator_heap->exception_keeper_tb_1 = generator_heap->exception_tb;
+        generator_heap->exception_keeper_lineno_1 = generator_heap->exception_lineno;
+        generator_heap->exception_type = NULL;
+        generator_heap->exception_value = NULL;
+        generator_heap->exception_tb = NULL;
+        generator_heap->exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)generator_heap->tmp_eval_call_1__globals );
+        Py_DECREF( generator_heap->tmp_eval_call_1__globals );
+        generator_heap->tmp_eval_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)generator_heap->tmp_eval_call_1__locals );
+        Py_DECREF( generator_heap->tmp_eval_call_1__locals );
+        generator_heap->tmp_eval_call_1__locals = NULL;
+
+        Py_XDECREF( generator_heap->tmp_eval_call_1__source );
+        generator_heap->tmp_eval_call_1__source = NULL;
+
+        // Re-raise.
+        generator_heap->exception_type = generator_heap->exception_keeper_type_1;
+        generator_heap->exception_value = generator_heap->exception_keeper_value_1;
+        generator_heap->exception_tb = generator_heap->exception_keeper_tb_1;
+        generator_heap->exception_lineno = generator_heap->exception_keeper_lineno_1;
+
+        goto try_except_handler_2;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr );
+        return NULL;
+        outline_result_1:;
+        generator->m_yield_return_index = 1;
+        return tmp_expression_name_1;
+        yield_return_1:
+        if ( yield_return_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+            generator_heap->exception_lineno = 290;
+            generator_heap->type_description_1 = "No";
+            goto try_except_handler_2;
+        }
+        tmp_yield_result_1 = yield_return_value;
+    }
+    if ( CONSIDER_THREADING() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &generator_heap->exception_type, &generator_heap->exception_value, &generator_heap->exception_tb );
+
+
+        generator_heap->exception_lineno = 290;
+        generator_heap->type_description_1 = "No";
+        goto try_except_handler_2;
+    }
+    goto loop_start_1;
+    loop_end_1:;
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_2:;
+    generator_heap->exception_keeper_type_2 = generator_heap->exception_type;
+    generator_heap->exception_keeper_value_2 = generator_heap->exception_value;
+    generator_heap->exception_keeper_tb_2 = generator_heap->exception_tb;
+    generator_heap->exception_keeper_lineno_2 = generator_heap->exception_lineno;
+    generator_heap->exception_type = NULL;
+    generator_heap->exception_value = NULL;
+    generator_heap->exception_tb = NULL;
+    generator_heap->exception_lineno = 0;
+
+    Py_XDECREF( generator_heap->tmp_iter_value_0 );
+    generator_heap->tmp_iter_value_0 = NULL;
+
+    // Re-raise.
+    generator_heap->exception_type = generator_heap->exception_keeper_type_2;
+    generator_heap->exception_value = generator_heap->exception_keeper_value_2;
+    generator_heap->exception_tb = generator_heap->exception_keeper_tb_2;
+    generator_heap->exception_lineno = generator_heap->exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_1:;
+
+    Nuitka_Frame_MarkAsNotExecuting( generator->m_frame );
+
+#if PYTHON_VERSION >= 370
+    Py_CLEAR( generator->m_exc_state.exc_type );
+    Py_CLEAR( generator->m_exc_state.exc_value );
+    Py_CLEAR( generator->m_exc_state.exc_traceback );
+#elif PYTHON_VERSION >= 300
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_type );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_value );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_traceback );
+#endif
+
+    // Allow re-use of the frame again.
+    Py_DECREF( generator->m_frame );
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+    // If it's not an exit exception, consider and create a traceback for it.
+    if ( !EXCEPTION_MATCH_GENERATOR( generator_heap->exception_type ) )
+    {
+        if ( generator_heap->exception_tb == NULL )
+        {
+            generator_heap->exception_tb = MAKE_TRACEBACK( generator->m_frame, generator_heap->exception_lineno );
+        }
+        else if ( generator_heap->exception_tb->tb_frame != &generator->m_frame->m_frame )
+        {
+            generator_heap->exception_tb = ADD_TRACEBACK( generator_heap->exception_tb, generator->m_frame, generator_heap->exception_lineno );
+        }
+
+        Nuitka_Frame_AttachLocals(
+            (struct Nuitka_FrameObject *)generator->m_frame,
+            generator_heap->type_description_1,
+            NULL,
+            generator_heap->var_s
+        );
+
+
+        // Release cached frame.
+        if ( generator->m_frame == cache_m_frame )
+        {
+            Py_DECREF( generator->m_frame );
+        }
+        cache_m_frame = NULL;
+
+        assertFrameObject( generator->m_frame );
+    }
+
+#if PYTHON_VERSION >= 370
+    Py_CLEAR( generator->m_exc_state.exc_type );
+    Py_CLEAR( generator->m_exc_state.exc_value );
+    Py_CLEAR( generator->m_exc_state.exc_traceback );
+#elif PYTHON_VERSION >= 300
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_type );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_value );
+    Py_CLEAR( generator->m_frame->m_frame.f_exc_traceback );
+#endif
+
+    Py_DECREF( generator->m_frame );
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_1:;
+    generator_heap->exception_keeper_type_3 = generator_heap->exception_type;
+    generator_heap->exception_keeper_value_3 = generator_heap->exception_value;
+    generator_heap->exception_keeper_tb_3 = generator_heap->exception_tb;
+    generator_heap->exception_keeper_lineno_3 = generator_heap->exception_lineno;
+    generator_heap->exception_type = NULL;
+    generator_heap->exception_value = NULL;
+    generator_heap->exception_tb = NULL;
+    generator_heap->exception_lineno = 0;
+
+    Py_XDECREF( generator_heap->var_s );
+    generator_heap->var_s = NULL;
+
+    // Re-raise.
+    generator_heap->exception_type = generator_heap->exception_keeper_type_3;
+    generator_heap->exception_value = generator_heap->exception_keeper_value_3;
+    generator_heap->exception_tb = generator_heap->exception_keeper_tb_3;
+    generator_heap->exception_lineno = generator_heap->exception_keeper_lineno_3;
+
+    goto function_exception_exit;
+    // End of try:
+    try_end_2:;
+    Py_XDECREF( generator_heap->tmp_iter_value_0 );
+    generator_heap->tmp_iter_value_0 = NULL;
+
+    Py_XDECREF( generator_heap->var_s );
+    generator_heap->var_s = NULL;
+
+
+
+    return NULL;
+
+    function_exception_exit:
+    assert( generator_heap->exception_type );
+    RESTORE_ERROR_OCCURRED( generator_heap->exception_type, generator_heap->exception_value, generator_heap->exception_tb );
+
+    return NULL;
+
+}
+
+static PyObject *__main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_maker( void )
+{
+    return Nuitka_Generator_New(
+        __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_context,
+        module___main__,
+        const_str_angle_genexpr,
+#if PYTHON_VERSION >= 350
+        NULL,
+#endif
+        codeobj_c537def1486cf539a83a18a1c7837e16,
+        1,
+        sizeof(struct __main__$$$function_18_evalInContractions$$$genexpr_1_genexpr_locals)
+    );
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_11_execDefinesFunctionToLocalsExplicity( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    nuitka_bool tmp_exec_1__plain = NUITKA_BOOL_UNASSIGNED;
+    PyObject *locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity = NULL;
+    struct Nuitka_FrameObject *frame_8b666ac29bc4a94d89ad930ffea9f352;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    bool tmp_result;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    int tmp_res;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    static struct Nuitka_FrameObject *cache_frame_8b666ac29bc4a94d89ad930ffea9f352 = NULL;
+    PyObject *tmp_return_value = NULL;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity = tmp_set_locals_1;
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        if (locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity == NULL) locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity = PyDict_New();
+        tmp_assign_source_1 = locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity;
+        Py_INCREF( tmp_assign_source_1 );
+        assert( tmp_exec_1__globals == NULL );
+        tmp_exec_1__globals = tmp_assign_source_1;
+    }
+    {
+        nuitka_bool tmp_assign_source_2;
+        tmp_assign_source_2 = NUITKA_BOOL_FALSE;
+        tmp_exec_1__plain = tmp_assign_source_2;
+    }
+    {
+        nuitka_bool tmp_condition_result_1;
+        PyObject *tmp_compexpr_left_1;
+        PyObject *tmp_compexpr_right_1;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_compexpr_left_1 = tmp_exec_1__globals;
+        tmp_compexpr_right_1 = Py_None;
+        tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_1;
+        }
+        else
+        {
+            goto branch_no_1;
+        }
+        branch_yes_1:;
+        {
+            PyObject *tmp_assign_source_3;
+            tmp_assign_source_3 = (PyObject *)moduledict___main__;
+            {
+                PyObject *old = tmp_exec_1__globals;
+                assert( old != NULL );
+                tmp_exec_1__globals = tmp_assign_source_3;
+                Py_INCREF( tmp_exec_1__globals );
+                Py_DECREF( old );
+            }
+
+        }
+        {
+            PyObject *tmp_assign_source_4;
+            if (locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity == NULL) locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity = PyDict_New();
+            tmp_assign_source_4 = locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity;
+            Py_INCREF( tmp_assign_source_4 );
+            assert( tmp_exec_1__locals == NULL );
+            tmp_exec_1__locals = tmp_assign_source_4;
+        }
+        {
+            nuitka_bool tmp_assign_source_5;
+            tmp_assign_source_5 = NUITKA_BOOL_TRUE;
+            tmp_exec_1__plain = tmp_assign_source_5;
+        }
+        goto branch_end_1;
+        branch_no_1:;
+        {
+            PyObject *tmp_assign_source_6;
+            CHECK_OBJECT( tmp_exec_1__globals );
+            tmp_assign_source_6 = tmp_exec_1__globals;
+            assert( tmp_exec_1__locals == NULL );
+            Py_INCREF( tmp_assign_source_6 );
+            tmp_exec_1__locals = tmp_assign_source_6;
+        }
+        branch_end_1:;
+    }
+    MAKE_OR_REUSE_FRAME( cache_frame_8b666ac29bc4a94d89ad930ffea9f352, codeobj_8b666ac29bc4a94d89ad930ffea9f352, module___main__, 0 );
+    frame_8b666ac29bc4a94d89ad930ffea9f352 = cache_frame_8b666ac29bc4a94d89ad930ffea9f352;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_8b666ac29bc4a94d89ad930ffea9f352 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_8b666ac29bc4a94d89ad930ffea9f352 ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        tmp_exec_source_1 = const_str_digest_0f903759b8d2feb65efa89cb4402b3d0;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 298;
+
+            goto try_except_handler_2;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 298;
+
+            goto try_except_handler_2;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 298;
+
+            goto try_except_handler_2;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    {
+        PyObject *tmp_value_name_1;
+        nuitka_bool tmp_compexpr_left_2;
+        nuitka_bool tmp_compexpr_right_2;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_2 = tmp_exec_1__plain;
+        tmp_compexpr_right_2 = NUITKA_BOOL_TRUE;
+        tmp_value_name_1 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? Py_True : Py_False;
+        tmp_res = CHECK_IF_TRUE( tmp_value_name_1 );
+        if ( tmp_res == -1 )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+            Py_DECREF( exception_keeper_type_1 );
+            Py_XDECREF( exception_keeper_value_1 );
+            Py_XDECREF( exception_keeper_tb_1 );
+
+            exception_lineno = 298;
+
+            goto try_except_handler_1;
+        }
+    }
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto try_except_handler_1;
+    // End of try:
+    try_end_1:;
+    {
+        PyObject *tmp_value_name_2;
+        nuitka_bool tmp_compexpr_left_3;
+        nuitka_bool tmp_compexpr_right_3;
+        assert( tmp_exec_1__plain != NUITKA_BOOL_UNASSIGNED);
+        tmp_compexpr_left_3 = tmp_exec_1__plain;
+        tmp_compexpr_right_3 = NUITKA_BOOL_TRUE;
+        tmp_value_name_2 = ( tmp_compexpr_left_3 == tmp_compexpr_right_3 ) ? Py_True : Py_False;
+        tmp_res = CHECK_IF_TRUE( tmp_value_name_2 );
+        if ( tmp_res == -1 )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 298;
+
+            goto try_except_handler_1;
+        }
+    }
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    {
+        nuitka_bool tmp_condition_result_2;
+        PyObject *tmp_compexpr_left_4;
+        PyObject *tmp_source_name_1;
+        PyObject *tmp_mvar_value_1;
+        PyObject *tmp_compexpr_right_4;
+        tmp_source_name_1 = PyDict_GetItem( locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity, const_str_plain_sys );
+
+        if ( tmp_source_name_1 == NULL )
+        {
+            tmp_mvar_value_1 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_sys );
+
+            if (unlikely( tmp_mvar_value_1 == NULL ))
+            {
+                tmp_mvar_value_1 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_sys );
+            }
+
+            if ( tmp_mvar_value_1 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "global name '%s' is not defined", "sys" );
+                exception_tb = NULL;
+
+                exception_lineno = 305;
+
+                goto frame_exception_exit_1;
+            }
+
+            tmp_source_name_1 = tmp_mvar_value_1;
+        }
+
+        {
+            static struct Nuitka_AttributeLookupCache cache;
+            tmp_compexpr_left_4 = LOOKUP_ATTRIBUTE_CACHED( tmp_source_name_1, const_str_plain_version_info, &cache );
+        }
+        if ( tmp_compexpr_left_4 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 305;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_compexpr_right_4 = const_tuple_int_pos_3_tuple;
+        tmp_res = RICH_COMPARE_BOOL_LT_OBJECT_OBJECT( tmp_compexpr_left_4, tmp_compexpr_right_4 );
+        Py_DECREF( tmp_compexpr_left_4 );
+        if ( tmp_res == -1 )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 305;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_condition_result_2 = ( tmp_res != 0 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_2;
+        }
+        else
+        {
+            goto branch_no_2;
+        }
+        branch_yes_2:;
+        {
+            nuitka_bool tmp_condition_result_3;
+            PyObject *tmp_operand_name_1;
+            PyObject *tmp_mvar_value_2;
+            tmp_operand_name_1 = PyDict_GetItem( locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity, const_str_plain_makeAddPair );
+
+            if ( tmp_operand_name_1 == NULL )
+            {
+                tmp_mvar_value_2 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_makeAddPair );
+
+                if (unlikely( tmp_mvar_value_2 == NULL ))
+                {
+                    tmp_mvar_value_2 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_makeAddPair );
+                }
+
+                if ( tmp_mvar_value_2 == NULL )
+                {
+
+                    exception_type = PyExc_NameError;
+                    Py_INCREF( exception_type );
+                    exception_value = PyString_FromFormat( "global name '%s' is not defined", "makeAddPair" );
+                    exception_tb = NULL;
+
+                    exception_lineno = 306;
+
+                    goto frame_exception_exit_1;
+                }
+
+                tmp_operand_name_1 = tmp_mvar_value_2;
+            }
+
+            tmp_res = CHECK_IF_TRUE( tmp_operand_name_1 );
+            if ( tmp_res == -1 )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 306;
+
+                goto frame_exception_exit_1;
+            }
+            tmp_condition_result_3 = ( tmp_res == 0 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_3 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_3;
+            }
+            else
+            {
+                goto branch_no_3;
+            }
+            branch_yes_3:;
+            {
+                PyObject *tmp_raise_type_1;
+                tmp_raise_type_1 = PyExc_AssertionError;
+                exception_type = tmp_raise_type_1;
+                Py_INCREF( tmp_raise_type_1 );
+                exception_lineno = 306;
+                RAISE_EXCEPTION_WITH_TYPE( &exception_type, &exception_value, &exception_tb );
+
+                goto frame_exception_exit_1;
+            }
+            branch_no_3:;
+        }
+        branch_no_2:;
+    }
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_8b666ac29bc4a94d89ad930ffea9f352 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_exception_exit_1:;
+
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_8b666ac29bc4a94d89ad930ffea9f352 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_8b666ac29bc4a94d89ad930ffea9f352, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_8b666ac29bc4a94d89ad930ffea9f352->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_8b666ac29bc4a94d89ad930ffea9f352, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_8b666ac29bc4a94d89ad930ffea9f352,
+        type_description_1
+    );
+
+
+    // Release cached frame.
+    if ( frame_8b666ac29bc4a94d89ad930ffea9f352 == cache_frame_8b666ac29bc4a94d89ad930ffea9f352 )
+    {
+        Py_DECREF( frame_8b666ac29bc4a94d89ad930ffea9f352 );
+    }
+    cache_frame_8b666ac29bc4a94d89ad930ffea9f352 = NULL;
+
+    assertFrameObject( frame_8b666ac29bc4a94d89ad930ffea9f352 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto function_exception_exit;
+
+    frame_no_exception_1:;
+    tmp_return_value = const_str_plain_yes;
+    Py_INCREF( tmp_return_value );
+    goto function_return_exit;
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_11_execDefinesFunctionToLocalsExplicity );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_11_execDefinesFunctionToLocalsExplicity );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+NUITKA_LOCAL_MODULE PyObject *impl___main__$$$function_12_execWithShortTuple( struct Nuitka_FunctionObject const *self, PyObject **python_pars )
+{
+    // Preserve error status for checks
+#ifndef __NUITKA_NO_ASSERT__
+    NUITKA_MAY_BE_UNUSED bool had_error = ERROR_OCCURRED();
+#endif
+
+    // Local variable declarations.
+    PyObject *var_e = NULL;
+    PyObject *locals___main__$$$function_12_execWithShortTuple = NULL;
+    struct Nuitka_FrameObject *frame_8630b57232f6cdb964e7c7c559eb3f43;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    int tmp_res;
+    PyObject *tmp_return_value = NULL;
+    bool tmp_result;
+    static struct Nuitka_FrameObject *cache_frame_8630b57232f6cdb964e7c7c559eb3f43 = NULL;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+
+    // Actual function body.
+    {
+        PyObject *tmp_set_locals_1;
+        tmp_set_locals_1 = PyDict_New();
+        locals___main__$$$function_12_execWithShortTuple = tmp_set_locals_1;
+    }
+    // Tried code:
+    MAKE_OR_REUSE_FRAME( cache_frame_8630b57232f6cdb964e7c7c559eb3f43, codeobj_8630b57232f6cdb964e7c7c559eb3f43, module___main__, sizeof(void *) );
+    frame_8630b57232f6cdb964e7c7c559eb3f43 = cache_frame_8630b57232f6cdb964e7c7c559eb3f43;
+
+    // Push the new frame as the currently active one.
+    pushFrameStack( frame_8630b57232f6cdb964e7c7c559eb3f43 );
+
+    // Mark the frame object as in use, ref count 1 will be up for reuse.
+    assert( Py_REFCNT( frame_8630b57232f6cdb964e7c7c559eb3f43 ) == 2 ); // Frame stack
+
+    // Framed code:
+    // Tried code:
+    {
+        PyObject *tmp_raise_type_1;
+        PyObject *tmp_raise_value_1;
+        tmp_raise_type_1 = PyExc_TypeError;
+        tmp_raise_value_1 = const_str_digest_a1f9a58c987b25e3e6bdaea6f6c92e28;
+        exception_type = tmp_raise_type_1;
+        Py_INCREF( tmp_raise_type_1 );
+        exception_value = tmp_raise_value_1;
+        Py_INCREF( tmp_raise_value_1 );
+        exception_lineno = 317;
+        RAISE_EXCEPTION_WITH_VALUE( &exception_type, &exception_value, &exception_tb );
+        type_description_1 = "o";
+        goto try_except_handler_2;
+    }
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_12_execWithShortTuple );
+    return NULL;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    // Preserve existing published exception.
+    PRESERVE_FRAME_EXCEPTION( frame_8630b57232f6cdb964e7c7c559eb3f43 );
+    if ( exception_keeper_tb_1 == NULL )
+    {
+        exception_keeper_tb_1 = MAKE_TRACEBACK( frame_8630b57232f6cdb964e7c7c559eb3f43, exception_keeper_lineno_1 );
+    }
+    else if ( exception_keeper_lineno_1 != 0 )
+    {
+        exception_keeper_tb_1 = ADD_TRACEBACK( exception_keeper_tb_1, frame_8630b57232f6cdb964e7c7c559eb3f43, exception_keeper_lineno_1 );
+    }
+
+    NORMALIZE_EXCEPTION( &exception_keeper_type_1, &exception_keeper_value_1, &exception_keeper_tb_1 );
+    PUBLISH_EXCEPTION( &exception_keeper_type_1, &exception_keeper_value_1, &exception_keeper_tb_1 );
+    {
+        nuitka_bool tmp_condition_result_1;
+        PyObject *tmp_compexpr_left_1;
+        PyObject *tmp_compexpr_right_1;
+        tmp_compexpr_left_1 = EXC_TYPE(PyThreadState_GET());
+        tmp_compexpr_right_1 = PyExc_Exception;
+        tmp_res = EXCEPTION_MATCH_BOOL( tmp_compexpr_left_1, tmp_compexpr_right_1 );
+        if ( tmp_res == -1 )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 318;
+            type_description_1 = "o";
+            goto frame_exception_exit_1;
+        }
+        tmp_condition_result_1 = ( tmp_res != 0 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+        {
+            goto branch_yes_1;
+        }
+        else
+        {
+            goto branch_no_1;
+        }
+        branch_yes_1:;
+        {
+            PyObject *tmp_assign_source_1;
+            tmp_assign_source_1 = EXC_VALUE(PyThreadState_GET());
+            assert( var_e == NULL );
+            Py_INCREF( tmp_assign_source_1 );
+            var_e = tmp_assign_source_1;
+        }
+        {
+            PyObject *tmp_left_name_1;
+            PyObject *tmp_right_name_1;
+            PyObject *tmp_operand_name_1;
+            tmp_left_name_1 = const_str_digest_5bb5a01d8bca65ab0d9326a38bbe95b2;
+            CHECK_OBJECT( var_e );
+            tmp_operand_name_1 = var_e;
+            tmp_right_name_1 = UNARY_OPERATION( PyObject_Repr, tmp_operand_name_1 );
+            if ( tmp_right_name_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 319;
+                type_description_1 = "o";
+                goto frame_exception_exit_1;
+            }
+            tmp_return_value = BINARY_OPERATION_ADD_STR_OBJECT( tmp_left_name_1, tmp_right_name_1 );
+            Py_DECREF( tmp_right_name_1 );
+            if ( tmp_return_value == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 319;
+                type_description_1 = "o";
+                goto frame_exception_exit_1;
+            }
+            goto frame_return_exit_1;
+        }
+        goto branch_end_1;
+        branch_no_1:;
+        tmp_result = RERAISE_EXCEPTION( &exception_type, &exception_value, &exception_tb );
+        if (unlikely( tmp_result == false ))
+        {
+            exception_lineno = 316;
+        }
+
+        if (exception_tb && exception_tb->tb_frame == &frame_8630b57232f6cdb964e7c7c559eb3f43->m_frame) frame_8630b57232f6cdb964e7c7c559eb3f43->m_frame.f_lineno = exception_tb->tb_lineno;
+        type_description_1 = "o";
+        goto frame_exception_exit_1;
+        branch_end_1:;
+    }
+    // End of try:
+
+#if 1
+    RESTORE_FRAME_EXCEPTION( frame_8630b57232f6cdb964e7c7c559eb3f43 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto frame_no_exception_1;
+
+    frame_return_exit_1:;
+#if 1
+    RESTORE_FRAME_EXCEPTION( frame_8630b57232f6cdb964e7c7c559eb3f43 );
+#endif
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    goto try_return_handler_1;
+
+    frame_exception_exit_1:;
+
+#if 1
+    RESTORE_FRAME_EXCEPTION( frame_8630b57232f6cdb964e7c7c559eb3f43 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_8630b57232f6cdb964e7c7c559eb3f43, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_8630b57232f6cdb964e7c7c559eb3f43->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_8630b57232f6cdb964e7c7c559eb3f43, exception_lineno );
+    }
+
+    // Attachs locals to frame if any.
+    Nuitka_Frame_AttachLocals(
+        (struct Nuitka_FrameObject *)frame_8630b57232f6cdb964e7c7c559eb3f43,
+        type_description_1,
+        var_e
+    );
+
+
+    // Release cached frame.
+    if ( frame_8630b57232f6cdb964e7c7c559eb3f43 == cache_frame_8630b57232f6cdb964e7c7c559eb3f43 )
+    {
+        Py_DECREF( frame_8630b57232f6cdb964e7c7c559eb3f43 );
+    }
+    cache_frame_8630b57232f6cdb964e7c7c559eb3f43 = NULL;
+
+    assertFrameObject( frame_8630b57232f6cdb964e7c7c559eb3f43 );
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto try_except_handler_1;
+
+    frame_no_exception_1:;
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_12_execWithShortTuple );
+    return NULL;
+    // Return handler code:
+    try_return_handler_1:;
+    CHECK_OBJECT( (PyObject *)var_e );
+    Py_DECREF( var_e );
+    var_e = NULL;
+
+    goto function_return_exit;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( var_e );
+    var_e = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto function_exception_exit;
+    // End of try:
+
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__$$$function_12_execWithShortTuple );
+    return NULL;
+
+function_exception_exit:
+    Py_XDECREF( locals___main__$$$function_12_execWithShortTuple );
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+
+    return NULL;
+
+function_return_exit:
+   // Function cleanup code if any.
+    Py_XDECREF( locals___main__$$$function_12_execWithShortTuple );
+
+
+   // Actual function exit with return value, making sure we did not make
+   // the error status worse despite non-NULL return.
+   CHECK_OBJECT( tmp_return_value );
+   assert( had_error || !ERROR_OCCURRED() );
+   return tmp_return_value;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_10_generatorFunctionWithExec(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_10_generatorFunctionWithExec,
+        const_str_plain_generatorFunctionWithExec,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_5f6ff8d2eda5b6f8919e933d974bea75,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_11_execDefinesFunctionToLocalsExplicity(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_11_execDefinesFunctionToLocalsExplicity,
+        const_str_plain_execDefinesFunctionToLocalsExplicity,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_8b666ac29bc4a94d89ad930ffea9f352,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_12_execWithShortTuple(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_12_execWithShortTuple,
+        const_str_plain_execWithShortTuple,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_8630b57232f6cdb964e7c7c559eb3f43,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_13_functionEval1(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_13_functionEval1,
+        const_str_plain_functionEval1,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_549de24ca1e36e2a09f1b50863c7b541,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_14_functionEval2(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_14_functionEval2,
+        const_str_plain_functionEval2,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_e4a7ddb19b3654ee7f42c778db7bd1f0,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_15_functionEval3(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_15_functionEval3,
+        const_str_plain_functionEval3,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_43b3eefcc7874990a75a773ede927677,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_16_functionExecfile(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_16_functionExecfile,
+        const_str_plain_functionExecfile,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_b0336bb790b5bbc97a76086edd70e3df,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_17_functionEvalNones2(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_17_functionEvalNones2,
+        const_str_plain_functionEvalNones2,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_a09c1147a92e95201ba715c7d121c66f,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_18_evalInContractions(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_18_evalInContractions,
+        const_str_plain_evalInContractions,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_745c1c1c411b0216b3f64e2c5b36d53e,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_1_functionExec1(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_1_functionExec1,
+        const_str_plain_functionExec1,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_d67934f3fe344ceb7e29d8ae3194013c,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_2_functionExec2(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_2_functionExec2,
+        const_str_plain_functionExec2,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_472f6472b729bfbce6bbbd8b00c24d04,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_3_functionExecNonesTuple(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_3_functionExecNonesTuple,
+        const_str_plain_functionExecNonesTuple,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_e26d2d618dc98f60c4cee33ec95bb6a6,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_4_functionExecNonesSyntax(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_4_functionExecNonesSyntax,
+        const_str_plain_functionExecNonesSyntax,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_af258049efa2050aa4d2842fd8645d14,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_5_functionExecNonesTuple2(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_5_functionExecNonesTuple2,
+        const_str_plain_functionExecNonesTuple2,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_304cc3492cfb936d1b66ffa5445800a3,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_6_functionExecNonesSyntax2(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_6_functionExecNonesSyntax2,
+        const_str_plain_functionExecNonesSyntax2,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_f9139bcd9ae1e170c2a3f294b75c9b9e,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_7_functionGlobalsExecShadow(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_7_functionGlobalsExecShadow,
+        const_str_plain_functionGlobalsExecShadow,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_fe1cd83b8ee2bf9eaa7aa341f6a6c8f6,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_7_functionGlobalsExecShadow$$$function_1_print_global_y(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_7_functionGlobalsExecShadow$$$function_1_print_global_y,
+        const_str_plain_print_global_y,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_b19b9b217d5b765d94c1924f515b24fb,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_8_functionWithClosureProvidedByExec(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_8_functionWithClosureProvidedByExec,
+        const_str_plain_functionWithClosureProvidedByExec,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_00d60fde43d27ec513f170a102d005e8,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_8_functionWithClosureProvidedByExec$$$function_1_func(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_8_functionWithClosureProvidedByExec$$$function_1_func,
+        const_str_plain_func,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_dd3383cadf1471c5f27335a46f766b01,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_9_functionWithExecAffectingClosure(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_9_functionWithExecAffectingClosure,
+        const_str_plain_functionWithExecAffectingClosure,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_87f0811e96640ed92d76bddb83b77fbf,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        0
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+static PyObject *MAKE_FUNCTION___main__$$$function_9_functionWithExecAffectingClosure$$$function_1_closureMaker(  )
+{
+    struct Nuitka_FunctionObject *result = Nuitka_Function_New(
+        impl___main__$$$function_9_functionWithExecAffectingClosure$$$function_1_closureMaker,
+        const_str_plain_closureMaker,
+#if PYTHON_VERSION >= 300
+        NULL,
+#endif
+        codeobj_8a366b625ec3cbfcb967585db5acde80,
+        NULL,
+#if PYTHON_VERSION >= 300
+        NULL,
+        NULL,
+#endif
+        module___main__,
+        NULL,
+        1
+    );
+
+    return (PyObject *)result;
+}
+
+
+
+#if PYTHON_VERSION >= 300
+static struct PyModuleDef mdef___main__ =
+{
+    PyModuleDef_HEAD_INIT,
+    "__main__",
+    NULL,                /* m_doc */
+    -1,                  /* m_size */
+    NULL,                /* m_methods */
+    NULL,                /* m_reload */
+    NULL,                /* m_traverse */
+    NULL,                /* m_clear */
+    NULL,                /* m_free */
+  };
+#endif
+
+extern PyObject *const_str_plain___compiled__;
+
+extern PyObject *const_str_plain___package__;
+
+#if PYTHON_VERSION >= 300
+extern PyObject *const_str_dot;
+extern PyObject *const_str_plain___loader__;
+#endif
+
+#if PYTHON_VERSION >= 340
+extern PyObject *const_str_plain___spec__;
+extern PyObject *const_str_plain__initializing;
+extern PyObject *const_str_plain_submodule_search_locations;
+#endif
+
+extern void _initCompiledCellType();
+extern void _initCompiledGeneratorType();
+extern void _initCompiledFunctionType();
+extern void _initCompiledMethodType();
+extern void _initCompiledFrameType();
+#if PYTHON_VERSION >= 350
+extern void _initCompiledCoroutineTypes();
+#endif
+#if PYTHON_VERSION >= 360
+extern void _initCompiledAsyncgenTypes();
+#endif
+extern void _initFreeLists();
+
+extern PyTypeObject Nuitka_Loader_Type;
+
+// The exported interface to CPython. On import of the module, this function
+// gets called. It has to have an exact function name, in cases it's a shared
+// library export. This is hidden behind the MOD_INIT_DECL.
+
+MOD_INIT_DECL( __main__ )
+{
+#if defined(_NUITKA_EXE) || PYTHON_VERSION >= 300
+    static bool _init_done = false;
+
+    // Modules might be imported repeatedly, which is to be ignored.
+    if ( _init_done )
+    {
+        return MOD_RETURN_VALUE( module___main__ );
+    }
+    else
+    {
+        _init_done = true;
+    }
+#endif
+
+#ifdef _NUITKA_MODULE
+    // In case of a stand alone extension module, need to call initialization
+    // the init here because that's the first and only time we are going to get
+    // called here.
+
+    // May have to activate constants blob.
+#if defined(_NUITKA_CONSTANTS_FROM_RESOURCE)
+    loadConstantsResource();
+#endif
+
+    // Initialize the constant values used.
+    _initBuiltinModule();
+    createGlobalConstants();
+
+    /* Initialize the compiled types of Nuitka. */
+    _initCompiledCellType();
+    _initCompiledGeneratorType();
+    _initCompiledFunctionType();
+    _initCompiledMethodType();
+    _initCompiledFrameType();
+#if PYTHON_VERSION >= 350
+    _initCompiledCoroutineTypes();
+#endif
+#if PYTHON_VERSION >= 360
+    _initCompiledAsyncgenTypes();
+#endif
+
+    _initFreeLists();
+
+#if PYTHON_VERSION < 300
+    _initSlotCompare();
+#endif
+#if PYTHON_VERSION >= 270
+    _initSlotIternext();
+#endif
+
+    patchBuiltinModule();
+    patchTypeComparison();
+
+    // Enable meta path based loader if not already done.
+#ifdef _NUITKA_TRACE
+    puts("__main__: Calling setupMetaPathBasedLoader().");
+#endif
+    setupMetaPathBasedLoader();
+
+#if PYTHON_VERSION >= 300
+    patchInspectModule();
+#endif
+
+#endif
+
+    /* The constants only used by this module are created now. */
+#ifdef _NUITKA_TRACE
+    puts("__main__: Calling createModuleConstants().");
+#endif
+    createModuleConstants();
+
+    /* The code objects used by this module are created now. */
+#ifdef _NUITKA_TRACE
+    puts("__main__: Calling createModuleCodeObjects().");
+#endif
+    createModuleCodeObjects();
+
+    // puts( "in init__main__" );
+
+    // Create the module object first. There are no methods initially, all are
+    // added dynamically in actual code only.  Also no "__doc__" is initially
+    // set at this time, as it could not contain NUL characters this way, they
+    // are instead set in early module code.  No "self" for modules, we have no
+    // use for it.
+#if PYTHON_VERSION < 300
+    module___main__ = Py_InitModule4(
+        "__main__",       // Module Name
+        NULL,                    // No methods initially, all are added
+                                 // dynamically in actual module code only.
+        NULL,                    // No "__doc__" is initially set, as it could
+                                 // not contain NUL this way, added early in
+                                 // actual code.
+        NULL,                    // No self for modules, we don't use it.
+        PYTHON_API_VERSION
+    );
+#else
+
+    module___main__ = PyModule_Create( &mdef___main__ );
+#endif
+
+    moduledict___main__ = MODULE_DICT( module___main__ );
+
+    // Set __compiled__ to what it we know.
+    UPDATE_STRING_DICT1(
+        moduledict___main__,
+        (Nuitka_StringObject *)const_str_plain___compiled__,
+        Nuitka_dunder_compiled_value
+    );
+
+    // Update "__package__" value to what it ought to be.
+    {
+#if 0
+        PyObject *module_name = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain___name__ );
+
+        UPDATE_STRING_DICT1(
+            moduledict___main__,
+            (Nuitka_StringObject *)const_str_plain___package__,
+            module_name
+        );
+#else
+
+#if PYTHON_VERSION < 300
+        PyObject *module_name = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain___name__ );
+        char const *module_name_cstr = PyString_AS_STRING( module_name );
+
+        char const *last_dot = strrchr( module_name_cstr, '.' );
+
+        if ( last_dot != NULL )
+        {
+            UPDATE_STRING_DICT1(
+                moduledict___main__,
+                (Nuitka_StringObject *)const_str_plain___package__,
+                PyString_FromStringAndSize( module_name_cstr, last_dot - module_name_cstr )
+            );
+        }
+#else
+        PyObject *module_name = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain___name__ );
+        Py_ssize_t dot_index = PyUnicode_Find( module_name, const_str_dot, 0, PyUnicode_GetLength( module_name ), -1 );
+
+        if ( dot_index != -1 )
+        {
+            UPDATE_STRING_DICT1(
+                moduledict___main__,
+                (Nuitka_StringObject *)const_str_plain___package__,
+                PyUnicode_Substring( module_name, 0, dot_index )
+            );
+        }
+#endif
+#endif
+    }
+
+    CHECK_OBJECT( module___main__ );
+
+// Seems to work for Python2.7 out of the box, but for Python3, the module
+// doesn't automatically enter "sys.modules", so do it manually.
+#if PYTHON_VERSION >= 300
+    {
+        int r = PyObject_SetItem( PyImport_GetModuleDict(), const_str_plain___main__, module___main__ );
+
+        assert( r != -1 );
+    }
+#endif
+
+    // For deep importing of a module we need to have "__builtins__", so we set
+    // it ourselves in the same way than CPython does. Note: This must be done
+    // before the frame object is allocated, or else it may fail.
+
+    if ( GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain___builtins__ ) == NULL )
+    {
+        PyObject *value = (PyObject *)builtin_module;
+
+        // Check if main module, not a dict then but the module itself.
+#if !defined(_NUITKA_EXE) || !1
+        value = PyModule_GetDict( value );
+#endif
+
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain___builtins__, value );
+    }
+
+#if PYTHON_VERSION >= 300
+    UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain___loader__, (PyObject *)&Nuitka_Loader_Type );
+#endif
+
+#if PYTHON_VERSION >= 340
+// Set the "__spec__" value
+
+#if 1
+    // Main modules just get "None" as spec.
+    UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain___spec__, Py_None );
+#else
+    // Other modules get a "ModuleSpec" from the standard mechanism.
+    {
+        PyObject *bootstrap_module = PyImport_ImportModule("importlib._bootstrap");
+        CHECK_OBJECT( bootstrap_module );
+        PyObject *module_spec_class = PyObject_GetAttrString( bootstrap_module, "ModuleSpec" );
+        Py_DECREF( bootstrap_module );
+
+        PyObject *args[] = {
+            GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain___name__ ),
+            (PyObject *)&Nuitka_Loader_Type
+        };
+
+        PyObject *spec_value = CALL_FUNCTION_WITH_ARGS2(
+            module_spec_class,
+            args
+        );
+        Py_DECREF( module_spec_class );
+
+        // We can assume this to never fail, or else we are in trouble anyway.
+        CHECK_OBJECT( spec_value );
+
+// For packages set the submodule search locations as well, even if to empty
+// list, so investigating code will consider it a package.
+#if 0
+        SET_ATTRIBUTE( spec_value, const_str_plain_submodule_search_locations, PyList_New(0) );
+#endif
+
+// Mark the execution in the "__spec__" value.
+        SET_ATTRIBUTE( spec_value, const_str_plain__initializing, Py_True );
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain___spec__, spec_value );
+    }
+#endif
+#endif
+
+    // Temp variables if any
+    PyObject *tmp_classExecfile$execfile_call_1__globals = NULL;
+    PyObject *tmp_classExecfile$execfile_call_1__locals = NULL;
+    PyObject *tmp_class_creation_1__class = NULL;
+    PyObject *tmp_class_creation_1__class_dict = NULL;
+    PyObject *tmp_class_creation_1__metaclass = NULL;
+    PyObject *tmp_eval_call_1__globals = NULL;
+    PyObject *tmp_eval_call_1__locals = NULL;
+    PyObject *tmp_eval_call_1__source = NULL;
+    PyObject *tmp_eval_call_2__globals = NULL;
+    PyObject *tmp_eval_call_2__locals = NULL;
+    PyObject *tmp_eval_call_2__source = NULL;
+    PyObject *tmp_exec_1__globals = NULL;
+    PyObject *tmp_exec_1__locals = NULL;
+    PyObject *tmp_exec_2__globals = NULL;
+    PyObject *tmp_exec_2__locals = NULL;
+    PyObject *tmp_exec_3__globals = NULL;
+    PyObject *tmp_exec_3__locals = NULL;
+    PyObject *tmp_execfile_call_1__globals = NULL;
+    PyObject *tmp_execfile_call_1__locals = NULL;
+    PyObject *tmp_execfile_call_2__globals = NULL;
+    PyObject *tmp_execfile_call_2__locals = NULL;
+    PyObject *tmp_execfile_call_3__globals = NULL;
+    PyObject *tmp_execfile_call_3__locals = NULL;
+    struct Nuitka_FrameObject *frame_68f38697c98d703901c499a665bbbaa6;
+    NUITKA_MAY_BE_UNUSED char const *type_description_1 = NULL;
+    PyObject *exception_type = NULL;
+    PyObject *exception_value = NULL;
+    PyTracebackObject *exception_tb = NULL;
+    NUITKA_MAY_BE_UNUSED int exception_lineno = 0;
+    PyObject *tmp_print_value;
+    bool tmp_result;
+    PyObject *exception_keeper_type_1;
+    PyObject *exception_keeper_value_1;
+    PyTracebackObject *exception_keeper_tb_1;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_1;
+    PyObject *exception_keeper_type_2;
+    PyObject *exception_keeper_value_2;
+    PyTracebackObject *exception_keeper_tb_2;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_2;
+    PyObject *exception_keeper_type_3;
+    PyObject *exception_keeper_value_3;
+    PyTracebackObject *exception_keeper_tb_3;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_3;
+    PyObject *exception_keeper_type_4;
+    PyObject *exception_keeper_value_4;
+    PyTracebackObject *exception_keeper_tb_4;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_4;
+    PyObject *exception_keeper_type_5;
+    PyObject *exception_keeper_value_5;
+    PyTracebackObject *exception_keeper_tb_5;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_5;
+    PyObject *exception_keeper_type_6;
+    PyObject *exception_keeper_value_6;
+    PyTracebackObject *exception_keeper_tb_6;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_6;
+    PyObject *locals___main___107 = NULL;
+    PyObject *tmp_dictset_value;
+    int tmp_res;
+    struct Nuitka_FrameObject *frame_0f7f4469dcc16a50cb530f8481e5a772_2;
+    NUITKA_MAY_BE_UNUSED char const *type_description_2 = NULL;
+    PyObject *exception_keeper_type_7;
+    PyObject *exception_keeper_value_7;
+    PyTracebackObject *exception_keeper_tb_7;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_7;
+    static struct Nuitka_FrameObject *cache_frame_0f7f4469dcc16a50cb530f8481e5a772_2 = NULL;
+    PyObject *exception_keeper_type_8;
+    PyObject *exception_keeper_value_8;
+    PyTracebackObject *exception_keeper_tb_8;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_8;
+    PyObject *exception_keeper_type_9;
+    PyObject *exception_keeper_value_9;
+    PyTracebackObject *exception_keeper_tb_9;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_9;
+    PyObject *exception_keeper_type_10;
+    PyObject *exception_keeper_value_10;
+    PyTracebackObject *exception_keeper_tb_10;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_10;
+    PyObject *exception_keeper_type_11;
+    PyObject *exception_keeper_value_11;
+    PyTracebackObject *exception_keeper_tb_11;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_11;
+    PyObject *exception_keeper_type_12;
+    PyObject *exception_keeper_value_12;
+    PyTracebackObject *exception_keeper_tb_12;
+    NUITKA_MAY_BE_UNUSED int exception_keeper_lineno_12;
+
+    // Module code.
+    // Frame without reuse.
+    frame_68f38697c98d703901c499a665bbbaa6 = MAKE_MODULE_FRAME( codeobj_68f38697c98d703901c499a665bbbaa6, module___main__ );
+
+    // Push the new frame as the currently active one, and we should be exclusively
+    // owning it.
+    pushFrameStack( frame_68f38697c98d703901c499a665bbbaa6 );
+    assert( Py_REFCNT( frame_68f38697c98d703901c499a665bbbaa6 ) == 2 );
+
+    // Framed code:
+    {
+        PyObject *tmp_name_name_1;
+        PyObject *tmp_level_name_1;
+        PyObject *tmp_imported_value_1;
+        tmp_name_name_1 = const_str_plain_site;
+        tmp_level_name_1 = const_int_0;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 1;
+        tmp_imported_value_1 = IMPORT_MODULE_KW( tmp_name_name_1, NULL, NULL, NULL, tmp_level_name_1 );
+        if ( tmp_imported_value_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 1;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_imported_value_1 );
+    }
+    {
+        PyObject *tmp_assign_source_1;
+        tmp_assign_source_1 = Py_None;
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain___doc__, tmp_assign_source_1 );
+    }
+    {
+        PyObject *tmp_assign_source_2;
+        tmp_assign_source_2 = const_str_digest_8784c77ba7bd531819aae6c5a91834a4;
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain___file__, tmp_assign_source_2 );
+    }
+    {
+        PyObject *tmp_assign_source_3;
+        PyObject *tmp_name_name_2;
+        PyObject *tmp_globals_name_1;
+        PyObject *tmp_locals_name_1;
+        PyObject *tmp_fromlist_name_1;
+        tmp_name_name_2 = const_str_plain_tempfile;
+        tmp_globals_name_1 = (PyObject *)moduledict___main__;
+        tmp_locals_name_1 = Py_None;
+        tmp_fromlist_name_1 = Py_None;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 19;
+        tmp_assign_source_3 = IMPORT_MODULE4( tmp_name_name_2, tmp_globals_name_1, tmp_locals_name_1, tmp_fromlist_name_1 );
+        if ( tmp_assign_source_3 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 19;
+
+            goto frame_exception_exit_1;
+        }
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tempfile, tmp_assign_source_3 );
+    }
+    {
+        PyObject *tmp_assign_source_4;
+        PyObject *tmp_name_name_3;
+        PyObject *tmp_globals_name_2;
+        PyObject *tmp_locals_name_2;
+        PyObject *tmp_fromlist_name_2;
+        tmp_name_name_3 = const_str_plain_sys;
+        tmp_globals_name_2 = (PyObject *)moduledict___main__;
+        tmp_locals_name_2 = Py_None;
+        tmp_fromlist_name_2 = Py_None;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 19;
+        tmp_assign_source_4 = IMPORT_MODULE4( tmp_name_name_3, tmp_globals_name_2, tmp_locals_name_2, tmp_fromlist_name_2 );
+        assert( !(tmp_assign_source_4 == NULL) );
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_sys, tmp_assign_source_4 );
+    }
+    {
+        PyObject *tmp_assign_source_5;
+        PyObject *tmp_name_name_4;
+        PyObject *tmp_globals_name_3;
+        PyObject *tmp_locals_name_3;
+        PyObject *tmp_fromlist_name_3;
+        tmp_name_name_4 = const_str_plain_os;
+        tmp_globals_name_3 = (PyObject *)moduledict___main__;
+        tmp_locals_name_3 = Py_None;
+        tmp_fromlist_name_3 = Py_None;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 19;
+        tmp_assign_source_5 = IMPORT_MODULE4( tmp_name_name_4, tmp_globals_name_3, tmp_locals_name_3, tmp_fromlist_name_3 );
+        if ( tmp_assign_source_5 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 19;
+
+            goto frame_exception_exit_1;
+        }
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_os, tmp_assign_source_5 );
+    }
+    tmp_print_value = const_str_digest_8a9b3ade60b73fed3f891de8e6c7f61b;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 21;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_6;
+        tmp_assign_source_6 = (PyObject *)moduledict___main__;
+        assert( tmp_eval_call_1__locals == NULL );
+        Py_INCREF( tmp_assign_source_6 );
+        tmp_eval_call_1__locals = tmp_assign_source_6;
+    }
+    {
+        PyObject *tmp_assign_source_7;
+        tmp_assign_source_7 = (PyObject *)moduledict___main__;
+        assert( tmp_eval_call_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_7 );
+        tmp_eval_call_1__globals = tmp_assign_source_7;
+    }
+    {
+        PyObject *tmp_assign_source_8;
+        tmp_assign_source_8 = const_str_digest_db79741939c6a7248bf2a0c07da13397;
+        assert( tmp_eval_call_1__source == NULL );
+        Py_INCREF( tmp_assign_source_8 );
+        tmp_eval_call_1__source = tmp_assign_source_8;
+    }
+    // Tried code:
+    {
+        PyObject *tmp_assign_source_9;
+        PyObject *tmp_called_instance_1;
+        tmp_called_instance_1 = const_str_digest_db79741939c6a7248bf2a0c07da13397;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 21;
+        tmp_assign_source_9 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_1, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+        if ( tmp_assign_source_9 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 21;
+
+            goto try_except_handler_1;
+        }
+        {
+            PyObject *old = tmp_eval_call_1__source;
+            assert( old != NULL );
+            tmp_eval_call_1__source = tmp_assign_source_9;
+            Py_DECREF( old );
+        }
+
+    }
+    {
+        PyObject *tmp_eval_source_1;
+        PyObject *tmp_eval_globals_1;
+        PyObject *tmp_eval_locals_1;
+        PyObject *tmp_eval_compiled_1;
+        CHECK_OBJECT( tmp_eval_call_1__source );
+        tmp_eval_source_1 = tmp_eval_call_1__source;
+        CHECK_OBJECT( tmp_eval_call_1__globals );
+        tmp_eval_globals_1 = tmp_eval_call_1__globals;
+        CHECK_OBJECT( tmp_eval_call_1__locals );
+        tmp_eval_locals_1 = tmp_eval_call_1__locals;
+        tmp_eval_compiled_1 = COMPILE_CODE( tmp_eval_source_1, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+        if ( tmp_eval_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 21;
+
+            goto try_except_handler_1;
+        }
+        tmp_print_value = EVAL_CODE( tmp_eval_compiled_1, tmp_eval_globals_1, tmp_eval_locals_1 );
+        Py_DECREF( tmp_eval_compiled_1 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 21;
+
+            goto try_except_handler_1;
+        }
+        goto try_return_handler_1;
+    }
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__ );
+    return MOD_RETURN_VALUE( NULL );
+    // Return handler code:
+    try_return_handler_1:;
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+    Py_DECREF( tmp_eval_call_1__globals );
+    tmp_eval_call_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+    Py_DECREF( tmp_eval_call_1__locals );
+    tmp_eval_call_1__locals = NULL;
+
+    Py_XDECREF( tmp_eval_call_1__source );
+    tmp_eval_call_1__source = NULL;
+
+    goto outline_result_1;
+    // Exception handler code:
+    try_except_handler_1:;
+    exception_keeper_type_1 = exception_type;
+    exception_keeper_value_1 = exception_value;
+    exception_keeper_tb_1 = exception_tb;
+    exception_keeper_lineno_1 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__globals );
+    Py_DECREF( tmp_eval_call_1__globals );
+    tmp_eval_call_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_1__locals );
+    Py_DECREF( tmp_eval_call_1__locals );
+    tmp_eval_call_1__locals = NULL;
+
+    Py_XDECREF( tmp_eval_call_1__source );
+    tmp_eval_call_1__source = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_1;
+    exception_value = exception_keeper_value_1;
+    exception_tb = exception_keeper_tb_1;
+    exception_lineno = exception_keeper_lineno_1;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__ );
+    return MOD_RETURN_VALUE( NULL );
+    outline_result_1:;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    Py_DECREF( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 21;
+
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 21;
+
+        goto frame_exception_exit_1;
+    }
+    tmp_print_value = const_str_digest_d0fc61e455af63ca5afa211bdd917659;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 22;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_10;
+        tmp_assign_source_10 = (PyObject *)moduledict___main__;
+        assert( tmp_eval_call_2__locals == NULL );
+        Py_INCREF( tmp_assign_source_10 );
+        tmp_eval_call_2__locals = tmp_assign_source_10;
+    }
+    {
+        PyObject *tmp_assign_source_11;
+        tmp_assign_source_11 = (PyObject *)moduledict___main__;
+        assert( tmp_eval_call_2__globals == NULL );
+        Py_INCREF( tmp_assign_source_11 );
+        tmp_eval_call_2__globals = tmp_assign_source_11;
+    }
+    {
+        PyObject *tmp_assign_source_12;
+        tmp_assign_source_12 = const_str_digest_82ce1947d3a8dc3eea8410b612114549;
+        assert( tmp_eval_call_2__source == NULL );
+        Py_INCREF( tmp_assign_source_12 );
+        tmp_eval_call_2__source = tmp_assign_source_12;
+    }
+    // Tried code:
+    {
+        PyObject *tmp_assign_source_13;
+        PyObject *tmp_called_instance_2;
+        tmp_called_instance_2 = const_str_digest_82ce1947d3a8dc3eea8410b612114549;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 22;
+        tmp_assign_source_13 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_2, const_str_plain_strip, &PyTuple_GET_ITEM( const_tuple_str_digest_ac02ab0238280e341b2aff0eed15b128_tuple, 0 ) );
+
+        if ( tmp_assign_source_13 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 22;
+
+            goto try_except_handler_2;
+        }
+        {
+            PyObject *old = tmp_eval_call_2__source;
+            assert( old != NULL );
+            tmp_eval_call_2__source = tmp_assign_source_13;
+            Py_DECREF( old );
+        }
+
+    }
+    {
+        PyObject *tmp_eval_source_2;
+        PyObject *tmp_eval_globals_2;
+        PyObject *tmp_eval_locals_2;
+        PyObject *tmp_eval_compiled_2;
+        CHECK_OBJECT( tmp_eval_call_2__source );
+        tmp_eval_source_2 = tmp_eval_call_2__source;
+        CHECK_OBJECT( tmp_eval_call_2__globals );
+        tmp_eval_globals_2 = tmp_eval_call_2__globals;
+        CHECK_OBJECT( tmp_eval_call_2__locals );
+        tmp_eval_locals_2 = tmp_eval_call_2__locals;
+        tmp_eval_compiled_2 = COMPILE_CODE( tmp_eval_source_2, const_str_angle_string, const_str_plain_eval, NULL, NULL );
+        if ( tmp_eval_compiled_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 22;
+
+            goto try_except_handler_2;
+        }
+        tmp_print_value = EVAL_CODE( tmp_eval_compiled_2, tmp_eval_globals_2, tmp_eval_locals_2 );
+        Py_DECREF( tmp_eval_compiled_2 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 22;
+
+            goto try_except_handler_2;
+        }
+        goto try_return_handler_2;
+    }
+    // tried codes exits in all cases
+    NUITKA_CANNOT_GET_HERE( __main__ );
+    return MOD_RETURN_VALUE( NULL );
+    // Return handler code:
+    try_return_handler_2:;
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_2__globals );
+    Py_DECREF( tmp_eval_call_2__globals );
+    tmp_eval_call_2__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_2__locals );
+    Py_DECREF( tmp_eval_call_2__locals );
+    tmp_eval_call_2__locals = NULL;
+
+    Py_XDECREF( tmp_eval_call_2__source );
+    tmp_eval_call_2__source = NULL;
+
+    goto outline_result_2;
+    // Exception handler code:
+    try_except_handler_2:;
+    exception_keeper_type_2 = exception_type;
+    exception_keeper_value_2 = exception_value;
+    exception_keeper_tb_2 = exception_tb;
+    exception_keeper_lineno_2 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_2__globals );
+    Py_DECREF( tmp_eval_call_2__globals );
+    tmp_eval_call_2__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_eval_call_2__locals );
+    Py_DECREF( tmp_eval_call_2__locals );
+    tmp_eval_call_2__locals = NULL;
+
+    Py_XDECREF( tmp_eval_call_2__source );
+    tmp_eval_call_2__source = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_2;
+    exception_value = exception_keeper_value_2;
+    exception_tb = exception_keeper_tb_2;
+    exception_lineno = exception_keeper_lineno_2;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    // Return statement must have exited already.
+    NUITKA_CANNOT_GET_HERE( __main__ );
+    return MOD_RETURN_VALUE( NULL );
+    outline_result_2:;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    Py_DECREF( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 22;
+
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 22;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_14;
+        tmp_assign_source_14 = MAKE_FUNCTION___main__$$$function_13_functionEval1(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEval1, tmp_assign_source_14 );
+    }
+    tmp_print_value = const_str_digest_970ab3a0dd5be16ecd8310f2681b379c;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 27;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_1;
+        PyObject *tmp_mvar_value_1;
+        tmp_mvar_value_1 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEval1 );
+
+        if (unlikely( tmp_mvar_value_1 == NULL ))
+        {
+            tmp_mvar_value_1 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionEval1 );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_1 );
+        tmp_called_name_1 = tmp_mvar_value_1;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 27;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_1, impl___main__$$$function_13_functionEval1, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 27;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 27;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 27;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_15;
+        tmp_assign_source_15 = MAKE_FUNCTION___main__$$$function_14_functionEval2(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEval2, tmp_assign_source_15 );
+    }
+    tmp_print_value = const_str_digest_2a9252df6c82849cccf77f84dd96b233;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 38;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_2;
+        PyObject *tmp_mvar_value_2;
+        tmp_mvar_value_2 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEval2 );
+
+        if (unlikely( tmp_mvar_value_2 == NULL ))
+        {
+            tmp_mvar_value_2 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionEval2 );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_2 );
+        tmp_called_name_2 = tmp_mvar_value_2;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 38;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_2, impl___main__$$$function_14_functionEval2, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 38;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 38;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 38;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_16;
+        tmp_assign_source_16 = MAKE_FUNCTION___main__$$$function_15_functionEval3(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEval3, tmp_assign_source_16 );
+    }
+    tmp_print_value = const_str_digest_dec5e302898faac76ce954c36c0c633a;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 48;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_3;
+        PyObject *tmp_mvar_value_3;
+        tmp_mvar_value_3 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEval3 );
+
+        if (unlikely( tmp_mvar_value_3 == NULL ))
+        {
+            tmp_mvar_value_3 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionEval3 );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_3 );
+        tmp_called_name_3 = tmp_mvar_value_3;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 48;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_3, impl___main__$$$function_15_functionEval3, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 48;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 48;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 48;
+
+        goto frame_exception_exit_1;
+    }
+    tmp_print_value = const_str_digest_e8e47c167be7dfc6fd7f993359547b0f;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 50;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_17;
+        tmp_assign_source_17 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__globals == NULL );
+        Py_INCREF( tmp_assign_source_17 );
+        tmp_exec_1__globals = tmp_assign_source_17;
+    }
+    {
+        PyObject *tmp_assign_source_18;
+        tmp_assign_source_18 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_1__locals == NULL );
+        Py_INCREF( tmp_assign_source_18 );
+        tmp_exec_1__locals = tmp_assign_source_18;
+    }
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_1;
+        PyObject *tmp_exec_globals_1;
+        PyObject *tmp_exec_locals_1;
+        PyObject *tmp_exec_filename_1;
+        PyObject *tmp_exec_compiled_1;
+        PyObject *tmp_exec_result_1;
+        tmp_exec_source_1 = const_str_digest_6c6fbf32885e4c30e49c8654849ac269;
+        CHECK_OBJECT( tmp_exec_1__globals );
+        tmp_exec_globals_1 = tmp_exec_1__globals;
+        CHECK_OBJECT( tmp_exec_1__locals );
+        tmp_exec_locals_1 = tmp_exec_1__locals;
+        tmp_exec_filename_1 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_1 );
+        Py_INCREF( tmp_exec_source_1 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_1, &tmp_exec_filename_1 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_1 );
+            Py_DECREF( tmp_exec_source_1 );
+
+            exception_lineno = 51;
+
+            goto try_except_handler_3;
+        }
+        tmp_exec_compiled_1 = COMPILE_CODE( tmp_exec_source_1, tmp_exec_filename_1, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_1 );
+        Py_DECREF( tmp_exec_filename_1 );
+        if ( tmp_exec_compiled_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 51;
+
+            goto try_except_handler_3;
+        }
+        tmp_exec_result_1 = EVAL_CODE( tmp_exec_compiled_1, tmp_exec_globals_1, tmp_exec_locals_1 );
+        Py_DECREF( tmp_exec_compiled_1 );
+        if ( tmp_exec_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 51;
+
+            goto try_except_handler_3;
+        }
+        Py_DECREF( tmp_exec_result_1 );
+    }
+    goto try_end_1;
+    // Exception handler code:
+    try_except_handler_3:;
+    exception_keeper_type_3 = exception_type;
+    exception_keeper_value_3 = exception_value;
+    exception_keeper_tb_3 = exception_tb;
+    exception_keeper_lineno_3 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_3;
+    exception_value = exception_keeper_value_3;
+    exception_tb = exception_keeper_tb_3;
+    exception_lineno = exception_keeper_lineno_3;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_1:;
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__globals );
+    Py_DECREF( tmp_exec_1__globals );
+    tmp_exec_1__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_1__locals );
+    Py_DECREF( tmp_exec_1__locals );
+    tmp_exec_1__locals = NULL;
+
+    tmp_print_value = const_str_digest_88a4ea53be43a6b3910a00cacc390988;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 52;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_4;
+        tmp_mvar_value_4 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_d );
+
+        if (unlikely( tmp_mvar_value_4 == NULL ))
+        {
+            tmp_mvar_value_4 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_d );
+        }
+
+        if ( tmp_mvar_value_4 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "d" );
+            exception_tb = NULL;
+
+            exception_lineno = 52;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_4;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 52;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 52;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_19;
+        tmp_assign_source_19 = MAKE_FUNCTION___main__$$$function_1_functionExec1(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExec1, tmp_assign_source_19 );
+    }
+    {
+        PyObject *tmp_assign_source_20;
+        tmp_assign_source_20 = MAKE_FUNCTION___main__$$$function_2_functionExec2(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExec2, tmp_assign_source_20 );
+    }
+    tmp_print_value = const_str_digest_7e0a7d659dbe48de213ffa2b3183b4c7;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 70;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_4;
+        PyObject *tmp_mvar_value_5;
+        tmp_mvar_value_5 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExec1 );
+
+        if (unlikely( tmp_mvar_value_5 == NULL ))
+        {
+            tmp_mvar_value_5 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionExec1 );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_5 );
+        tmp_called_name_4 = tmp_mvar_value_5;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 70;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_4, impl___main__$$$function_1_functionExec1, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 70;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 70;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    {
+        PyObject *tmp_called_name_5;
+        PyObject *tmp_mvar_value_6;
+        tmp_mvar_value_6 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExec2 );
+
+        if (unlikely( tmp_mvar_value_6 == NULL ))
+        {
+            tmp_mvar_value_6 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionExec2 );
+        }
+
+        if ( tmp_mvar_value_6 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "functionExec2" );
+            exception_tb = NULL;
+
+            exception_lineno = 70;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_called_name_5 = tmp_mvar_value_6;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 70;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_5, impl___main__$$$function_2_functionExec2, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 70;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 70;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 70;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_21;
+        PyObject *tmp_left_name_1;
+        PyObject *tmp_called_instance_3;
+        PyObject *tmp_mvar_value_7;
+        PyObject *tmp_right_name_1;
+        tmp_mvar_value_7 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tempfile );
+
+        if (unlikely( tmp_mvar_value_7 == NULL ))
+        {
+            tmp_mvar_value_7 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tempfile );
+        }
+
+        if ( tmp_mvar_value_7 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "tempfile" );
+            exception_tb = NULL;
+
+            exception_lineno = 72;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_called_instance_3 = tmp_mvar_value_7;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 72;
+        tmp_left_name_1 = CALL_METHOD_NO_ARGS( tmp_called_instance_3, const_str_plain_gettempdir );
+        if ( tmp_left_name_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 72;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_right_name_1 = const_str_digest_248f360acf257acb903ae3f061fe6af1;
+        tmp_assign_source_21 = BINARY_OPERATION_ADD_OBJECT_STR( tmp_left_name_1, tmp_right_name_1 );
+        Py_DECREF( tmp_left_name_1 );
+        if ( tmp_assign_source_21 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 72;
+
+            goto frame_exception_exit_1;
+        }
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename, tmp_assign_source_21 );
+    }
+    {
+        PyObject *tmp_assign_source_22;
+        PyObject *tmp_open_filename_1;
+        PyObject *tmp_mvar_value_8;
+        PyObject *tmp_open_mode_1;
+        tmp_mvar_value_8 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+
+        if (unlikely( tmp_mvar_value_8 == NULL ))
+        {
+            tmp_mvar_value_8 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_8 );
+        tmp_open_filename_1 = tmp_mvar_value_8;
+        tmp_open_mode_1 = const_str_plain_w;
+        tmp_assign_source_22 = BUILTIN_OPEN( tmp_open_filename_1, tmp_open_mode_1, NULL );
+        if ( tmp_assign_source_22 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 74;
+
+            goto frame_exception_exit_1;
+        }
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_f, tmp_assign_source_22 );
+    }
+    {
+        PyObject *tmp_called_instance_4;
+        PyObject *tmp_mvar_value_9;
+        PyObject *tmp_call_result_1;
+        tmp_mvar_value_9 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_f );
+
+        if (unlikely( tmp_mvar_value_9 == NULL ))
+        {
+            tmp_mvar_value_9 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_f );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_9 );
+        tmp_called_instance_4 = tmp_mvar_value_9;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 75;
+        tmp_call_result_1 = CALL_METHOD_WITH_ARGS1( tmp_called_instance_4, const_str_plain_write, &PyTuple_GET_ITEM( const_tuple_str_digest_c416a96f64347d56a3ea7dd95e587796_tuple, 0 ) );
+
+        if ( tmp_call_result_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 75;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_1 );
+    }
+    {
+        PyObject *tmp_called_instance_5;
+        PyObject *tmp_mvar_value_10;
+        PyObject *tmp_call_result_2;
+        tmp_mvar_value_10 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_f );
+
+        if (unlikely( tmp_mvar_value_10 == NULL ))
+        {
+            tmp_mvar_value_10 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_f );
+        }
+
+        if ( tmp_mvar_value_10 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "f" );
+            exception_tb = NULL;
+
+            exception_lineno = 76;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_called_instance_5 = tmp_mvar_value_10;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 76;
+        tmp_call_result_2 = CALL_METHOD_NO_ARGS( tmp_called_instance_5, const_str_plain_close );
+        if ( tmp_call_result_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 76;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_2 );
+    }
+    {
+        PyObject *tmp_outline_return_value_1;
+        {
+            PyObject *tmp_assign_source_23;
+            tmp_assign_source_23 = (PyObject *)moduledict___main__;
+            assert( tmp_execfile_call_1__locals == NULL );
+            Py_INCREF( tmp_assign_source_23 );
+            tmp_execfile_call_1__locals = tmp_assign_source_23;
+        }
+        {
+            PyObject *tmp_assign_source_24;
+            tmp_assign_source_24 = (PyObject *)moduledict___main__;
+            assert( tmp_execfile_call_1__globals == NULL );
+            Py_INCREF( tmp_assign_source_24 );
+            tmp_execfile_call_1__globals = tmp_assign_source_24;
+        }
+        // Tried code:
+        {
+            PyObject *tmp_eval_source_3;
+            PyObject *tmp_eval_globals_3;
+            PyObject *tmp_eval_locals_3;
+            PyObject *tmp_called_instance_6;
+            PyObject *tmp_open_filename_2;
+            PyObject *tmp_mvar_value_11;
+            PyObject *tmp_open_mode_2;
+            PyObject *tmp_eval_compiled_3;
+            tmp_mvar_value_11 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+
+            if (unlikely( tmp_mvar_value_11 == NULL ))
+            {
+                tmp_mvar_value_11 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+            }
+
+            if ( tmp_mvar_value_11 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "name '%s' is not defined", "tmp_filename" );
+                exception_tb = NULL;
+
+                exception_lineno = 78;
+
+                goto try_except_handler_4;
+            }
+
+            tmp_open_filename_2 = tmp_mvar_value_11;
+            tmp_open_mode_2 = const_str_plain_rU;
+            tmp_called_instance_6 = BUILTIN_OPEN( tmp_open_filename_2, tmp_open_mode_2, NULL );
+            if ( tmp_called_instance_6 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 78;
+
+                goto try_except_handler_4;
+            }
+            frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 78;
+            tmp_eval_source_3 = CALL_METHOD_NO_ARGS( tmp_called_instance_6, const_str_plain_read );
+            Py_DECREF( tmp_called_instance_6 );
+            if ( tmp_eval_source_3 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 78;
+
+                goto try_except_handler_4;
+            }
+            CHECK_OBJECT( tmp_execfile_call_1__globals );
+            tmp_eval_globals_3 = tmp_execfile_call_1__globals;
+            CHECK_OBJECT( tmp_execfile_call_1__locals );
+            tmp_eval_locals_3 = tmp_execfile_call_1__locals;
+            tmp_eval_compiled_3 = COMPILE_CODE( tmp_eval_source_3, const_str_angle_execfile, const_str_plain_exec, NULL, NULL );
+            Py_DECREF( tmp_eval_source_3 );
+            if ( tmp_eval_compiled_3 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 78;
+
+                goto try_except_handler_4;
+            }
+            tmp_outline_return_value_1 = EVAL_CODE( tmp_eval_compiled_3, tmp_eval_globals_3, tmp_eval_locals_3 );
+            Py_DECREF( tmp_eval_compiled_3 );
+            if ( tmp_outline_return_value_1 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 78;
+
+                goto try_except_handler_4;
+            }
+            goto try_return_handler_4;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        // Return handler code:
+        try_return_handler_4:;
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__globals );
+        Py_DECREF( tmp_execfile_call_1__globals );
+        tmp_execfile_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__locals );
+        Py_DECREF( tmp_execfile_call_1__locals );
+        tmp_execfile_call_1__locals = NULL;
+
+        goto outline_result_3;
+        // Exception handler code:
+        try_except_handler_4:;
+        exception_keeper_type_4 = exception_type;
+        exception_keeper_value_4 = exception_value;
+        exception_keeper_tb_4 = exception_tb;
+        exception_keeper_lineno_4 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__globals );
+        Py_DECREF( tmp_execfile_call_1__globals );
+        tmp_execfile_call_1__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_1__locals );
+        Py_DECREF( tmp_execfile_call_1__locals );
+        tmp_execfile_call_1__locals = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_4;
+        exception_value = exception_keeper_value_4;
+        exception_tb = exception_keeper_tb_4;
+        exception_lineno = exception_keeper_lineno_4;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        outline_result_3:;
+        Py_DECREF( tmp_outline_return_value_1 );
+    }
+    tmp_print_value = const_str_digest_0be97f8e6e49e9a9f5457ccd63ea1adf;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 80;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_12;
+        tmp_mvar_value_12 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_e );
+
+        if (unlikely( tmp_mvar_value_12 == NULL ))
+        {
+            tmp_mvar_value_12 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_e );
+        }
+
+        if ( tmp_mvar_value_12 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "e" );
+            exception_tb = NULL;
+
+            exception_lineno = 80;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_12;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 80;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    {
+        PyObject *tmp_mvar_value_13;
+        tmp_mvar_value_13 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_f );
+
+        if (unlikely( tmp_mvar_value_13 == NULL ))
+        {
+            tmp_mvar_value_13 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_f );
+        }
+
+        if ( tmp_mvar_value_13 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "f" );
+            exception_tb = NULL;
+
+            exception_lineno = 80;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_13;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 80;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 80;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_25;
+        tmp_assign_source_25 = PyDict_Copy( const_dict_d7a83763264779d47b24cb7ebf0196f6 );
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_global_vars, tmp_assign_source_25 );
+    }
+    {
+        PyObject *tmp_assign_source_26;
+        PyObject *tmp_dict_seq_1;
+        PyObject *tmp_mvar_value_14;
+        tmp_mvar_value_14 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_global_vars );
+
+        if (unlikely( tmp_mvar_value_14 == NULL ))
+        {
+            tmp_mvar_value_14 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_global_vars );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_14 );
+        tmp_dict_seq_1 = tmp_mvar_value_14;
+        tmp_assign_source_26 = TO_DICT( tmp_dict_seq_1, NULL );
+        if ( tmp_assign_source_26 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 83;
+
+            goto frame_exception_exit_1;
+        }
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_local_vars, tmp_assign_source_26 );
+    }
+    {
+        PyObject *tmp_outline_return_value_2;
+        {
+            PyObject *tmp_assign_source_27;
+            PyObject *tmp_mvar_value_15;
+            tmp_mvar_value_15 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_global_vars );
+
+            if (unlikely( tmp_mvar_value_15 == NULL ))
+            {
+                tmp_mvar_value_15 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_global_vars );
+            }
+
+            CHECK_OBJECT( tmp_mvar_value_15 );
+            tmp_assign_source_27 = tmp_mvar_value_15;
+            assert( tmp_execfile_call_2__globals == NULL );
+            Py_INCREF( tmp_assign_source_27 );
+            tmp_execfile_call_2__globals = tmp_assign_source_27;
+        }
+        {
+            PyObject *tmp_assign_source_28;
+            nuitka_bool tmp_condition_result_1;
+            PyObject *tmp_compexpr_left_1;
+            PyObject *tmp_compexpr_right_1;
+            CHECK_OBJECT( tmp_execfile_call_2__globals );
+            tmp_compexpr_left_1 = tmp_execfile_call_2__globals;
+            tmp_compexpr_right_1 = Py_None;
+            tmp_condition_result_1 = ( tmp_compexpr_left_1 == tmp_compexpr_right_1 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_1 == NUITKA_BOOL_TRUE )
+            {
+                goto condexpr_true_1;
+            }
+            else
+            {
+                goto condexpr_false_1;
+            }
+            condexpr_true_1:;
+            tmp_assign_source_28 = (PyObject *)moduledict___main__;
+            goto condexpr_end_1;
+            condexpr_false_1:;
+            CHECK_OBJECT( tmp_execfile_call_2__globals );
+            tmp_assign_source_28 = tmp_execfile_call_2__globals;
+            condexpr_end_1:;
+            assert( tmp_execfile_call_2__locals == NULL );
+            Py_INCREF( tmp_assign_source_28 );
+            tmp_execfile_call_2__locals = tmp_assign_source_28;
+        }
+        {
+            nuitka_bool tmp_condition_result_2;
+            PyObject *tmp_compexpr_left_2;
+            PyObject *tmp_compexpr_right_2;
+            CHECK_OBJECT( tmp_execfile_call_2__globals );
+            tmp_compexpr_left_2 = tmp_execfile_call_2__globals;
+            tmp_compexpr_right_2 = Py_None;
+            tmp_condition_result_2 = ( tmp_compexpr_left_2 == tmp_compexpr_right_2 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_2 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_1;
+            }
+            else
+            {
+                goto branch_no_1;
+            }
+            branch_yes_1:;
+            {
+                PyObject *tmp_assign_source_29;
+                tmp_assign_source_29 = (PyObject *)moduledict___main__;
+                {
+                    PyObject *old = tmp_execfile_call_2__globals;
+                    assert( old != NULL );
+                    tmp_execfile_call_2__globals = tmp_assign_source_29;
+                    Py_INCREF( tmp_execfile_call_2__globals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_1:;
+        }
+        // Tried code:
+        {
+            PyObject *tmp_eval_source_4;
+            PyObject *tmp_eval_globals_4;
+            PyObject *tmp_eval_locals_4;
+            PyObject *tmp_called_instance_7;
+            PyObject *tmp_open_filename_3;
+            PyObject *tmp_mvar_value_16;
+            PyObject *tmp_open_mode_3;
+            PyObject *tmp_eval_compiled_4;
+            tmp_mvar_value_16 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+
+            if (unlikely( tmp_mvar_value_16 == NULL ))
+            {
+                tmp_mvar_value_16 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+            }
+
+            if ( tmp_mvar_value_16 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "name '%s' is not defined", "tmp_filename" );
+                exception_tb = NULL;
+
+                exception_lineno = 85;
+
+                goto try_except_handler_5;
+            }
+
+            tmp_open_filename_3 = tmp_mvar_value_16;
+            tmp_open_mode_3 = const_str_plain_rU;
+            tmp_called_instance_7 = BUILTIN_OPEN( tmp_open_filename_3, tmp_open_mode_3, NULL );
+            if ( tmp_called_instance_7 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 85;
+
+                goto try_except_handler_5;
+            }
+            frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 85;
+            tmp_eval_source_4 = CALL_METHOD_NO_ARGS( tmp_called_instance_7, const_str_plain_read );
+            Py_DECREF( tmp_called_instance_7 );
+            if ( tmp_eval_source_4 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 85;
+
+                goto try_except_handler_5;
+            }
+            CHECK_OBJECT( tmp_execfile_call_2__globals );
+            tmp_eval_globals_4 = tmp_execfile_call_2__globals;
+            CHECK_OBJECT( tmp_execfile_call_2__locals );
+            tmp_eval_locals_4 = tmp_execfile_call_2__locals;
+            tmp_eval_compiled_4 = COMPILE_CODE( tmp_eval_source_4, const_str_angle_execfile, const_str_plain_exec, NULL, NULL );
+            Py_DECREF( tmp_eval_source_4 );
+            if ( tmp_eval_compiled_4 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 85;
+
+                goto try_except_handler_5;
+            }
+            tmp_outline_return_value_2 = EVAL_CODE( tmp_eval_compiled_4, tmp_eval_globals_4, tmp_eval_locals_4 );
+            Py_DECREF( tmp_eval_compiled_4 );
+            if ( tmp_outline_return_value_2 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 85;
+
+                goto try_except_handler_5;
+            }
+            goto try_return_handler_5;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        // Return handler code:
+        try_return_handler_5:;
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_2__globals );
+        Py_DECREF( tmp_execfile_call_2__globals );
+        tmp_execfile_call_2__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_2__locals );
+        Py_DECREF( tmp_execfile_call_2__locals );
+        tmp_execfile_call_2__locals = NULL;
+
+        goto outline_result_4;
+        // Exception handler code:
+        try_except_handler_5:;
+        exception_keeper_type_5 = exception_type;
+        exception_keeper_value_5 = exception_value;
+        exception_keeper_tb_5 = exception_tb;
+        exception_keeper_lineno_5 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_2__globals );
+        Py_DECREF( tmp_execfile_call_2__globals );
+        tmp_execfile_call_2__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_2__locals );
+        Py_DECREF( tmp_execfile_call_2__locals );
+        tmp_execfile_call_2__locals = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_5;
+        exception_value = exception_keeper_value_5;
+        exception_tb = exception_keeper_tb_5;
+        exception_lineno = exception_keeper_lineno_5;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        outline_result_4:;
+        Py_DECREF( tmp_outline_return_value_2 );
+    }
+    tmp_print_value = const_str_digest_ae4c4a545acbb0ad86ab60319f4015fe;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 87;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_instance_8;
+        PyObject *tmp_mvar_value_17;
+        tmp_mvar_value_17 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_global_vars );
+
+        if (unlikely( tmp_mvar_value_17 == NULL ))
+        {
+            tmp_mvar_value_17 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_global_vars );
+        }
+
+        if ( tmp_mvar_value_17 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "global_vars" );
+            exception_tb = NULL;
+
+            exception_lineno = 87;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_called_instance_8 = tmp_mvar_value_17;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 87;
+        tmp_print_value = CALL_METHOD_NO_ARGS( tmp_called_instance_8, const_str_plain_keys );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 87;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 87;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 87;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_outline_return_value_3;
+        // Tried code:
+        {
+            PyObject *tmp_assign_source_30;
+            PyObject *tmp_mvar_value_18;
+            tmp_mvar_value_18 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_global_vars );
+
+            if (unlikely( tmp_mvar_value_18 == NULL ))
+            {
+                tmp_mvar_value_18 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_global_vars );
+            }
+
+            if ( tmp_mvar_value_18 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "name '%s' is not defined", "global_vars" );
+                exception_tb = NULL;
+
+                exception_lineno = 89;
+
+                goto try_except_handler_6;
+            }
+
+            tmp_assign_source_30 = tmp_mvar_value_18;
+            assert( tmp_execfile_call_3__globals == NULL );
+            Py_INCREF( tmp_assign_source_30 );
+            tmp_execfile_call_3__globals = tmp_assign_source_30;
+        }
+        {
+            PyObject *tmp_assign_source_31;
+            PyObject *tmp_mvar_value_19;
+            tmp_mvar_value_19 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_local_vars );
+
+            if (unlikely( tmp_mvar_value_19 == NULL ))
+            {
+                tmp_mvar_value_19 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_local_vars );
+            }
+
+            if ( tmp_mvar_value_19 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "name '%s' is not defined", "local_vars" );
+                exception_tb = NULL;
+
+                exception_lineno = 89;
+
+                goto try_except_handler_6;
+            }
+
+            tmp_assign_source_31 = tmp_mvar_value_19;
+            assert( tmp_execfile_call_3__locals == NULL );
+            Py_INCREF( tmp_assign_source_31 );
+            tmp_execfile_call_3__locals = tmp_assign_source_31;
+        }
+        {
+            nuitka_bool tmp_condition_result_3;
+            PyObject *tmp_compexpr_left_3;
+            PyObject *tmp_compexpr_right_3;
+            CHECK_OBJECT( tmp_execfile_call_3__locals );
+            tmp_compexpr_left_3 = tmp_execfile_call_3__locals;
+            tmp_compexpr_right_3 = Py_None;
+            tmp_condition_result_3 = ( tmp_compexpr_left_3 == tmp_compexpr_right_3 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_3 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_2;
+            }
+            else
+            {
+                goto branch_no_2;
+            }
+            branch_yes_2:;
+            {
+                PyObject *tmp_assign_source_32;
+                nuitka_bool tmp_condition_result_4;
+                PyObject *tmp_compexpr_left_4;
+                PyObject *tmp_compexpr_right_4;
+                CHECK_OBJECT( tmp_execfile_call_3__globals );
+                tmp_compexpr_left_4 = tmp_execfile_call_3__globals;
+                tmp_compexpr_right_4 = Py_None;
+                tmp_condition_result_4 = ( tmp_compexpr_left_4 == tmp_compexpr_right_4 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+                if ( tmp_condition_result_4 == NUITKA_BOOL_TRUE )
+                {
+                    goto condexpr_true_2;
+                }
+                else
+                {
+                    goto condexpr_false_2;
+                }
+                condexpr_true_2:;
+                tmp_assign_source_32 = (PyObject *)moduledict___main__;
+                goto condexpr_end_2;
+                condexpr_false_2:;
+                CHECK_OBJECT( tmp_execfile_call_3__globals );
+                tmp_assign_source_32 = tmp_execfile_call_3__globals;
+                condexpr_end_2:;
+                {
+                    PyObject *old = tmp_execfile_call_3__locals;
+                    assert( old != NULL );
+                    tmp_execfile_call_3__locals = tmp_assign_source_32;
+                    Py_INCREF( tmp_execfile_call_3__locals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_2:;
+        }
+        {
+            nuitka_bool tmp_condition_result_5;
+            PyObject *tmp_compexpr_left_5;
+            PyObject *tmp_compexpr_right_5;
+            CHECK_OBJECT( tmp_execfile_call_3__globals );
+            tmp_compexpr_left_5 = tmp_execfile_call_3__globals;
+            tmp_compexpr_right_5 = Py_None;
+            tmp_condition_result_5 = ( tmp_compexpr_left_5 == tmp_compexpr_right_5 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+            if ( tmp_condition_result_5 == NUITKA_BOOL_TRUE )
+            {
+                goto branch_yes_3;
+            }
+            else
+            {
+                goto branch_no_3;
+            }
+            branch_yes_3:;
+            {
+                PyObject *tmp_assign_source_33;
+                tmp_assign_source_33 = (PyObject *)moduledict___main__;
+                {
+                    PyObject *old = tmp_execfile_call_3__globals;
+                    assert( old != NULL );
+                    tmp_execfile_call_3__globals = tmp_assign_source_33;
+                    Py_INCREF( tmp_execfile_call_3__globals );
+                    Py_DECREF( old );
+                }
+
+            }
+            branch_no_3:;
+        }
+        {
+            PyObject *tmp_eval_source_5;
+            PyObject *tmp_eval_globals_5;
+            PyObject *tmp_eval_locals_5;
+            PyObject *tmp_called_instance_9;
+            PyObject *tmp_open_filename_4;
+            PyObject *tmp_mvar_value_20;
+            PyObject *tmp_open_mode_4;
+            PyObject *tmp_eval_compiled_5;
+            tmp_mvar_value_20 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+
+            if (unlikely( tmp_mvar_value_20 == NULL ))
+            {
+                tmp_mvar_value_20 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+            }
+
+            if ( tmp_mvar_value_20 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "name '%s' is not defined", "tmp_filename" );
+                exception_tb = NULL;
+
+                exception_lineno = 89;
+
+                goto try_except_handler_6;
+            }
+
+            tmp_open_filename_4 = tmp_mvar_value_20;
+            tmp_open_mode_4 = const_str_plain_rU;
+            tmp_called_instance_9 = BUILTIN_OPEN( tmp_open_filename_4, tmp_open_mode_4, NULL );
+            if ( tmp_called_instance_9 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 89;
+
+                goto try_except_handler_6;
+            }
+            frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 89;
+            tmp_eval_source_5 = CALL_METHOD_NO_ARGS( tmp_called_instance_9, const_str_plain_read );
+            Py_DECREF( tmp_called_instance_9 );
+            if ( tmp_eval_source_5 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 89;
+
+                goto try_except_handler_6;
+            }
+            CHECK_OBJECT( tmp_execfile_call_3__globals );
+            tmp_eval_globals_5 = tmp_execfile_call_3__globals;
+            CHECK_OBJECT( tmp_execfile_call_3__locals );
+            tmp_eval_locals_5 = tmp_execfile_call_3__locals;
+            tmp_eval_compiled_5 = COMPILE_CODE( tmp_eval_source_5, const_str_angle_execfile, const_str_plain_exec, NULL, NULL );
+            Py_DECREF( tmp_eval_source_5 );
+            if ( tmp_eval_compiled_5 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 89;
+
+                goto try_except_handler_6;
+            }
+            tmp_outline_return_value_3 = EVAL_CODE( tmp_eval_compiled_5, tmp_eval_globals_5, tmp_eval_locals_5 );
+            Py_DECREF( tmp_eval_compiled_5 );
+            if ( tmp_outline_return_value_3 == NULL )
+            {
+                assert( ERROR_OCCURRED() );
+
+                FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                exception_lineno = 89;
+
+                goto try_except_handler_6;
+            }
+            goto try_return_handler_6;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        // Return handler code:
+        try_return_handler_6:;
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_3__globals );
+        Py_DECREF( tmp_execfile_call_3__globals );
+        tmp_execfile_call_3__globals = NULL;
+
+        CHECK_OBJECT( (PyObject *)tmp_execfile_call_3__locals );
+        Py_DECREF( tmp_execfile_call_3__locals );
+        tmp_execfile_call_3__locals = NULL;
+
+        goto outline_result_5;
+        // Exception handler code:
+        try_except_handler_6:;
+        exception_keeper_type_6 = exception_type;
+        exception_keeper_value_6 = exception_value;
+        exception_keeper_tb_6 = exception_tb;
+        exception_keeper_lineno_6 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        Py_XDECREF( tmp_execfile_call_3__globals );
+        tmp_execfile_call_3__globals = NULL;
+
+        Py_XDECREF( tmp_execfile_call_3__locals );
+        tmp_execfile_call_3__locals = NULL;
+
+        // Re-raise.
+        exception_type = exception_keeper_type_6;
+        exception_value = exception_keeper_value_6;
+        exception_tb = exception_keeper_tb_6;
+        exception_lineno = exception_keeper_lineno_6;
+
+        goto frame_exception_exit_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        outline_result_5:;
+        Py_DECREF( tmp_outline_return_value_3 );
+    }
+    tmp_print_value = const_str_digest_fc25bd7cdf8db85f3ea4a0bfcaa8985f;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 91;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_21;
+        tmp_mvar_value_21 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_local_vars );
+
+        if (unlikely( tmp_mvar_value_21 == NULL ))
+        {
+            tmp_mvar_value_21 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_local_vars );
+        }
+
+        if ( tmp_mvar_value_21 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "local_vars" );
+            exception_tb = NULL;
+
+            exception_lineno = 91;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_21;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 91;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 91;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_34;
+        tmp_assign_source_34 = MAKE_FUNCTION___main__$$$function_16_functionExecfile(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecfile, tmp_assign_source_34 );
+    }
+    {
+        PyObject *tmp_called_name_6;
+        PyObject *tmp_mvar_value_22;
+        PyObject *tmp_call_result_3;
+        tmp_mvar_value_22 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecfile );
+
+        if (unlikely( tmp_mvar_value_22 == NULL ))
+        {
+            tmp_mvar_value_22 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionExecfile );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_22 );
+        tmp_called_name_6 = tmp_mvar_value_22;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 105;
+        tmp_call_result_3 = CALL_FUNCTION_C_CODE( tmp_called_name_6, impl___main__$$$function_16_functionExecfile, NULL, 0 );
+        if ( tmp_call_result_3 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 105;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_3 );
+    }
+    // Tried code:
+    {
+        PyObject *tmp_assign_source_35;
+        {
+            PyObject *tmp_set_locals_1;
+            tmp_set_locals_1 = PyDict_New();
+            locals___main___107 = tmp_set_locals_1;
+        }
+        tmp_dictset_value = const_str_plain___main__;
+        tmp_res = PyDict_SetItem( locals___main___107, const_str_plain___module__, tmp_dictset_value );
+        assert( !(tmp_res != 0) );
+        tmp_dictset_value = const_int_0;
+        tmp_res = PyDict_SetItem( locals___main___107, const_str_plain_e, tmp_dictset_value );
+        assert( !(tmp_res != 0) );
+        tmp_dictset_value = const_int_0;
+        tmp_res = PyDict_SetItem( locals___main___107, const_str_plain_f, tmp_dictset_value );
+        assert( !(tmp_res != 0) );
+        // Tried code:
+        MAKE_OR_REUSE_FRAME( cache_frame_0f7f4469dcc16a50cb530f8481e5a772_2, codeobj_0f7f4469dcc16a50cb530f8481e5a772, module___main__, 0 );
+        frame_0f7f4469dcc16a50cb530f8481e5a772_2 = cache_frame_0f7f4469dcc16a50cb530f8481e5a772_2;
+
+        // Push the new frame as the currently active one.
+        pushFrameStack( frame_0f7f4469dcc16a50cb530f8481e5a772_2 );
+
+        // Mark the frame object as in use, ref count 1 will be up for reuse.
+        assert( Py_REFCNT( frame_0f7f4469dcc16a50cb530f8481e5a772_2 ) == 2 ); // Frame stack
+
+        // Framed code:
+        tmp_print_value = const_str_digest_ef7aa81fa65c218307ec6cc37701dc66;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 111;
+
+            goto frame_exception_exit_2;
+        }
+        {
+            PyObject *tmp_outline_return_value_4;
+            {
+                PyObject *tmp_assign_source_36;
+                tmp_assign_source_36 = locals___main___107;
+                assert( tmp_classExecfile$execfile_call_1__locals == NULL );
+                Py_INCREF( tmp_assign_source_36 );
+                tmp_classExecfile$execfile_call_1__locals = tmp_assign_source_36;
+            }
+            {
+                PyObject *tmp_assign_source_37;
+                tmp_assign_source_37 = (PyObject *)moduledict___main__;
+                assert( tmp_classExecfile$execfile_call_1__globals == NULL );
+                Py_INCREF( tmp_assign_source_37 );
+                tmp_classExecfile$execfile_call_1__globals = tmp_assign_source_37;
+            }
+            // Tried code:
+            {
+                PyObject *tmp_eval_source_6;
+                PyObject *tmp_eval_globals_6;
+                PyObject *tmp_eval_locals_6;
+                PyObject *tmp_called_instance_10;
+                PyObject *tmp_open_filename_5;
+                PyObject *tmp_mvar_value_23;
+                PyObject *tmp_open_mode_5;
+                PyObject *tmp_eval_compiled_6;
+                tmp_mvar_value_23 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+
+                if (unlikely( tmp_mvar_value_23 == NULL ))
+                {
+                    tmp_mvar_value_23 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+                }
+
+                if ( tmp_mvar_value_23 == NULL )
+                {
+
+                    exception_type = PyExc_NameError;
+                    Py_INCREF( exception_type );
+                    exception_value = PyString_FromFormat( "name '%s' is not defined", "tmp_filename" );
+                    exception_tb = NULL;
+
+                    exception_lineno = 114;
+
+                    goto try_except_handler_9;
+                }
+
+                tmp_open_filename_5 = tmp_mvar_value_23;
+                tmp_open_mode_5 = const_str_plain_rU;
+                tmp_called_instance_10 = BUILTIN_OPEN( tmp_open_filename_5, tmp_open_mode_5, NULL );
+                if ( tmp_called_instance_10 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 114;
+
+                    goto try_except_handler_9;
+                }
+                frame_0f7f4469dcc16a50cb530f8481e5a772_2->m_frame.f_lineno = 114;
+                tmp_eval_source_6 = CALL_METHOD_NO_ARGS( tmp_called_instance_10, const_str_plain_read );
+                Py_DECREF( tmp_called_instance_10 );
+                if ( tmp_eval_source_6 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 114;
+
+                    goto try_except_handler_9;
+                }
+                CHECK_OBJECT( tmp_classExecfile$execfile_call_1__globals );
+                tmp_eval_globals_6 = tmp_classExecfile$execfile_call_1__globals;
+                CHECK_OBJECT( tmp_classExecfile$execfile_call_1__locals );
+                tmp_eval_locals_6 = tmp_classExecfile$execfile_call_1__locals;
+                tmp_eval_compiled_6 = COMPILE_CODE( tmp_eval_source_6, const_str_angle_execfile, const_str_plain_exec, NULL, NULL );
+                Py_DECREF( tmp_eval_source_6 );
+                if ( tmp_eval_compiled_6 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 114;
+
+                    goto try_except_handler_9;
+                }
+                tmp_outline_return_value_4 = EVAL_CODE( tmp_eval_compiled_6, tmp_eval_globals_6, tmp_eval_locals_6 );
+                Py_DECREF( tmp_eval_compiled_6 );
+                if ( tmp_outline_return_value_4 == NULL )
+                {
+                    assert( ERROR_OCCURRED() );
+
+                    FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+                    exception_lineno = 114;
+
+                    goto try_except_handler_9;
+                }
+                goto try_return_handler_9;
+            }
+            // tried codes exits in all cases
+            NUITKA_CANNOT_GET_HERE( __main__ );
+            return MOD_RETURN_VALUE( NULL );
+            // Return handler code:
+            try_return_handler_9:;
+            CHECK_OBJECT( (PyObject *)tmp_classExecfile$execfile_call_1__globals );
+            Py_DECREF( tmp_classExecfile$execfile_call_1__globals );
+            tmp_classExecfile$execfile_call_1__globals = NULL;
+
+            CHECK_OBJECT( (PyObject *)tmp_classExecfile$execfile_call_1__locals );
+            Py_DECREF( tmp_classExecfile$execfile_call_1__locals );
+            tmp_classExecfile$execfile_call_1__locals = NULL;
+
+            goto outline_result_7;
+            // Exception handler code:
+            try_except_handler_9:;
+            exception_keeper_type_7 = exception_type;
+            exception_keeper_value_7 = exception_value;
+            exception_keeper_tb_7 = exception_tb;
+            exception_keeper_lineno_7 = exception_lineno;
+            exception_type = NULL;
+            exception_value = NULL;
+            exception_tb = NULL;
+            exception_lineno = 0;
+
+            CHECK_OBJECT( (PyObject *)tmp_classExecfile$execfile_call_1__globals );
+            Py_DECREF( tmp_classExecfile$execfile_call_1__globals );
+            tmp_classExecfile$execfile_call_1__globals = NULL;
+
+            CHECK_OBJECT( (PyObject *)tmp_classExecfile$execfile_call_1__locals );
+            Py_DECREF( tmp_classExecfile$execfile_call_1__locals );
+            tmp_classExecfile$execfile_call_1__locals = NULL;
+
+            // Re-raise.
+            exception_type = exception_keeper_type_7;
+            exception_value = exception_keeper_value_7;
+            exception_tb = exception_keeper_tb_7;
+            exception_lineno = exception_keeper_lineno_7;
+
+            goto frame_exception_exit_2;
+            // End of try:
+            // Return statement must have exited already.
+            NUITKA_CANNOT_GET_HERE( __main__ );
+            return MOD_RETURN_VALUE( NULL );
+            outline_result_7:;
+            Py_DECREF( tmp_outline_return_value_4 );
+        }
+        tmp_print_value = const_str_digest_06b716c854966bbcdbe2a7410c2e122e;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+        tmp_print_value = PyDict_GetItem( locals___main___107, const_str_plain_e );
+
+        if ( tmp_print_value == NULL && CHECK_AND_CLEAR_KEY_ERROR_OCCURRED() )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "e" );
+            exception_tb = NULL;
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+        tmp_print_value = PyDict_GetItem( locals___main___107, const_str_plain_f );
+
+        if ( tmp_print_value == NULL && CHECK_AND_CLEAR_KEY_ERROR_OCCURRED() )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "f" );
+            exception_tb = NULL;
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+        if ( PRINT_NEW_LINE() == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 115;
+
+            goto frame_exception_exit_2;
+        }
+
+#if 0
+        RESTORE_FRAME_EXCEPTION( frame_0f7f4469dcc16a50cb530f8481e5a772_2 );
+#endif
+
+        // Put the previous frame back on top.
+        popFrameStack();
+
+        goto frame_no_exception_1;
+
+        frame_exception_exit_2:;
+
+#if 0
+        RESTORE_FRAME_EXCEPTION( frame_0f7f4469dcc16a50cb530f8481e5a772_2 );
+#endif
+
+        if ( exception_tb == NULL )
+        {
+            exception_tb = MAKE_TRACEBACK( frame_0f7f4469dcc16a50cb530f8481e5a772_2, exception_lineno );
+        }
+        else if ( exception_tb->tb_frame != &frame_0f7f4469dcc16a50cb530f8481e5a772_2->m_frame )
+        {
+            exception_tb = ADD_TRACEBACK( exception_tb, frame_0f7f4469dcc16a50cb530f8481e5a772_2, exception_lineno );
+        }
+
+        // Attachs locals to frame if any.
+        Nuitka_Frame_AttachLocals(
+            (struct Nuitka_FrameObject *)frame_0f7f4469dcc16a50cb530f8481e5a772_2,
+            type_description_2
+        );
+
+
+        // Release cached frame.
+        if ( frame_0f7f4469dcc16a50cb530f8481e5a772_2 == cache_frame_0f7f4469dcc16a50cb530f8481e5a772_2 )
+        {
+            Py_DECREF( frame_0f7f4469dcc16a50cb530f8481e5a772_2 );
+        }
+        cache_frame_0f7f4469dcc16a50cb530f8481e5a772_2 = NULL;
+
+        assertFrameObject( frame_0f7f4469dcc16a50cb530f8481e5a772_2 );
+
+        // Put the previous frame back on top.
+        popFrameStack();
+
+        // Return the error.
+        goto nested_frame_exit_1;
+
+        frame_no_exception_1:;
+        goto skip_nested_handling_1;
+        nested_frame_exit_1:;
+
+        goto try_except_handler_8;
+        skip_nested_handling_1:;
+        tmp_assign_source_35 = locals___main___107;
+        Py_INCREF( tmp_assign_source_35 );
+        goto try_return_handler_8;
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        // Return handler code:
+        try_return_handler_8:;
+        Py_DECREF( locals___main___107 );
+        locals___main___107 = NULL;
+        goto outline_result_6;
+        // Exception handler code:
+        try_except_handler_8:;
+        exception_keeper_type_8 = exception_type;
+        exception_keeper_value_8 = exception_value;
+        exception_keeper_tb_8 = exception_tb;
+        exception_keeper_lineno_8 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        Py_DECREF( locals___main___107 );
+        locals___main___107 = NULL;
+        // Re-raise.
+        exception_type = exception_keeper_type_8;
+        exception_value = exception_keeper_value_8;
+        exception_tb = exception_keeper_tb_8;
+        exception_lineno = exception_keeper_lineno_8;
+
+        goto outline_exception_1;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        outline_exception_1:;
+        exception_lineno = 107;
+        goto try_except_handler_7;
+        outline_result_6:;
+        assert( tmp_class_creation_1__class_dict == NULL );
+        tmp_class_creation_1__class_dict = tmp_assign_source_35;
+    }
+    {
+        PyObject *tmp_assign_source_38;
+        nuitka_bool tmp_condition_result_6;
+        PyObject *tmp_key_name_1;
+        PyObject *tmp_dict_name_1;
+        PyObject *tmp_dict_name_2;
+        PyObject *tmp_key_name_2;
+        tmp_key_name_1 = const_str_plain___metaclass__;
+        CHECK_OBJECT( tmp_class_creation_1__class_dict );
+        tmp_dict_name_1 = tmp_class_creation_1__class_dict;
+        tmp_res = PyDict_Contains( tmp_dict_name_1, tmp_key_name_1 );
+        if ( tmp_res == -1 )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 107;
+
+            goto try_except_handler_7;
+        }
+        tmp_condition_result_6 = ( tmp_res != 0 ) ? NUITKA_BOOL_TRUE : NUITKA_BOOL_FALSE;
+        if ( tmp_condition_result_6 == NUITKA_BOOL_TRUE )
+        {
+            goto condexpr_true_3;
+        }
+        else
+        {
+            goto condexpr_false_3;
+        }
+        condexpr_true_3:;
+        CHECK_OBJECT( tmp_class_creation_1__class_dict );
+        tmp_dict_name_2 = tmp_class_creation_1__class_dict;
+        tmp_key_name_2 = const_str_plain___metaclass__;
+        tmp_assign_source_38 = DICT_GET_ITEM( tmp_dict_name_2, tmp_key_name_2 );
+        if ( tmp_assign_source_38 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 107;
+
+            goto try_except_handler_7;
+        }
+        goto condexpr_end_3;
+        condexpr_false_3:;
+        // Tried code:
+        {
+            PyObject *tmp_mvar_value_24;
+            tmp_mvar_value_24 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain___metaclass__ );
+
+            if (unlikely( tmp_mvar_value_24 == NULL ))
+            {
+                tmp_mvar_value_24 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain___metaclass__ );
+            }
+
+            if ( tmp_mvar_value_24 == NULL )
+            {
+
+                exception_type = PyExc_NameError;
+                Py_INCREF( exception_type );
+                exception_value = PyString_FromFormat( "name '%s' is not defined", "__metaclass__" );
+                exception_tb = NULL;
+
+                exception_lineno = 107;
+
+                goto try_except_handler_10;
+            }
+
+            tmp_assign_source_38 = tmp_mvar_value_24;
+            Py_INCREF( tmp_assign_source_38 );
+            goto outline_result_8;
+        }
+        // tried codes exits in all cases
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        // Exception handler code:
+        try_except_handler_10:;
+        exception_keeper_type_9 = exception_type;
+        exception_keeper_value_9 = exception_value;
+        exception_keeper_tb_9 = exception_tb;
+        exception_keeper_lineno_9 = exception_lineno;
+        exception_type = NULL;
+        exception_value = NULL;
+        exception_tb = NULL;
+        exception_lineno = 0;
+
+        Py_DECREF( exception_keeper_type_9 );
+        Py_XDECREF( exception_keeper_value_9 );
+        Py_XDECREF( exception_keeper_tb_9 );
+        tmp_assign_source_38 = (PyObject *)&PyClass_Type;
+        Py_INCREF( tmp_assign_source_38 );
+        goto outline_result_8;
+        // End of try:
+        // Return statement must have exited already.
+        NUITKA_CANNOT_GET_HERE( __main__ );
+        return MOD_RETURN_VALUE( NULL );
+        outline_result_8:;
+        condexpr_end_3:;
+        assert( tmp_class_creation_1__metaclass == NULL );
+        tmp_class_creation_1__metaclass = tmp_assign_source_38;
+    }
+    {
+        PyObject *tmp_assign_source_39;
+        PyObject *tmp_called_name_7;
+        PyObject *tmp_args_element_name_1;
+        PyObject *tmp_args_element_name_2;
+        PyObject *tmp_args_element_name_3;
+        CHECK_OBJECT( tmp_class_creation_1__metaclass );
+        tmp_called_name_7 = tmp_class_creation_1__metaclass;
+        tmp_args_element_name_1 = const_str_plain_classExecfile;
+        tmp_args_element_name_2 = const_tuple_empty;
+        CHECK_OBJECT( tmp_class_creation_1__class_dict );
+        tmp_args_element_name_3 = tmp_class_creation_1__class_dict;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 107;
+        {
+            PyObject *call_args[] = { tmp_args_element_name_1, tmp_args_element_name_2, tmp_args_element_name_3 };
+            tmp_assign_source_39 = CALL_FUNCTION_WITH_ARGS3( tmp_called_name_7, call_args );
+        }
+
+        if ( tmp_assign_source_39 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 107;
+
+            goto try_except_handler_7;
+        }
+        assert( tmp_class_creation_1__class == NULL );
+        tmp_class_creation_1__class = tmp_assign_source_39;
+    }
+    goto try_end_2;
+    // Exception handler code:
+    try_except_handler_7:;
+    exception_keeper_type_10 = exception_type;
+    exception_keeper_value_10 = exception_value;
+    exception_keeper_tb_10 = exception_tb;
+    exception_keeper_lineno_10 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    Py_XDECREF( tmp_class_creation_1__class_dict );
+    tmp_class_creation_1__class_dict = NULL;
+
+    Py_XDECREF( tmp_class_creation_1__metaclass );
+    tmp_class_creation_1__metaclass = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_10;
+    exception_value = exception_keeper_value_10;
+    exception_tb = exception_keeper_tb_10;
+    exception_lineno = exception_keeper_lineno_10;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_2:;
+    {
+        PyObject *tmp_assign_source_40;
+        CHECK_OBJECT( tmp_class_creation_1__class );
+        tmp_assign_source_40 = tmp_class_creation_1__class;
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain_classExecfile, tmp_assign_source_40 );
+    }
+    CHECK_OBJECT( (PyObject *)tmp_class_creation_1__class );
+    Py_DECREF( tmp_class_creation_1__class );
+    tmp_class_creation_1__class = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_class_creation_1__class_dict );
+    Py_DECREF( tmp_class_creation_1__class_dict );
+    tmp_class_creation_1__class_dict = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_class_creation_1__metaclass );
+    Py_DECREF( tmp_class_creation_1__metaclass );
+    tmp_class_creation_1__metaclass = NULL;
+
+    {
+        PyObject *tmp_assign_source_41;
+        tmp_assign_source_41 = const_int_pos_7;
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain_f, tmp_assign_source_41 );
+    }
+    {
+        PyObject *tmp_assign_source_42;
+        tmp_assign_source_42 = MAKE_FUNCTION___main__$$$function_3_functionExecNonesTuple(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesTuple, tmp_assign_source_42 );
+    }
+    {
+        PyObject *tmp_assign_source_43;
+        tmp_assign_source_43 = MAKE_FUNCTION___main__$$$function_4_functionExecNonesSyntax(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesSyntax, tmp_assign_source_43 );
+    }
+    {
+        PyObject *tmp_called_name_8;
+        PyObject *tmp_mvar_value_25;
+        PyObject *tmp_call_result_4;
+        tmp_mvar_value_25 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesTuple );
+
+        if (unlikely( tmp_mvar_value_25 == NULL ))
+        {
+            tmp_mvar_value_25 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionExecNonesTuple );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_25 );
+        tmp_called_name_8 = tmp_mvar_value_25;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 131;
+        tmp_call_result_4 = CALL_FUNCTION_C_CODE( tmp_called_name_8, impl___main__$$$function_3_functionExecNonesTuple, NULL, 0 );
+        if ( tmp_call_result_4 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 131;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_4 );
+    }
+    {
+        PyObject *tmp_called_name_9;
+        PyObject *tmp_mvar_value_26;
+        PyObject *tmp_call_result_5;
+        tmp_mvar_value_26 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesSyntax );
+
+        if (unlikely( tmp_mvar_value_26 == NULL ))
+        {
+            tmp_mvar_value_26 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionExecNonesSyntax );
+        }
+
+        if ( tmp_mvar_value_26 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "functionExecNonesSyntax" );
+            exception_tb = NULL;
+
+            exception_lineno = 132;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_called_name_9 = tmp_mvar_value_26;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 132;
+        tmp_call_result_5 = CALL_FUNCTION_C_CODE( tmp_called_name_9, impl___main__$$$function_4_functionExecNonesSyntax, NULL, 0 );
+        if ( tmp_call_result_5 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 132;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_5 );
+    }
+    tmp_print_value = const_str_digest_85535d85183d9a6f37630a8c0602e20c;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 134;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_mvar_value_27;
+        tmp_mvar_value_27 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_f );
+
+        if (unlikely( tmp_mvar_value_27 == NULL ))
+        {
+            tmp_mvar_value_27 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_f );
+        }
+
+        if ( tmp_mvar_value_27 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "f" );
+            exception_tb = NULL;
+
+            exception_lineno = 134;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_print_value = tmp_mvar_value_27;
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 134;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 134;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_44;
+        tmp_assign_source_44 = MAKE_FUNCTION___main__$$$function_17_functionEvalNones2(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEvalNones2, tmp_assign_source_44 );
+    }
+    {
+        PyObject *tmp_called_name_10;
+        PyObject *tmp_mvar_value_28;
+        PyObject *tmp_call_result_6;
+        tmp_mvar_value_28 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionEvalNones2 );
+
+        if (unlikely( tmp_mvar_value_28 == NULL ))
+        {
+            tmp_mvar_value_28 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionEvalNones2 );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_28 );
+        tmp_called_name_10 = tmp_mvar_value_28;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 148;
+        tmp_call_result_6 = CALL_FUNCTION_C_CODE( tmp_called_name_10, impl___main__$$$function_17_functionEvalNones2, NULL, 0 );
+        if ( tmp_call_result_6 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 148;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_6 );
+    }
+    {
+        PyObject *tmp_assign_source_45;
+        tmp_assign_source_45 = MAKE_FUNCTION___main__$$$function_5_functionExecNonesTuple2(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesTuple2, tmp_assign_source_45 );
+    }
+    {
+        PyObject *tmp_assign_source_46;
+        tmp_assign_source_46 = MAKE_FUNCTION___main__$$$function_6_functionExecNonesSyntax2(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesSyntax2, tmp_assign_source_46 );
+    }
+    {
+        PyObject *tmp_called_name_11;
+        PyObject *tmp_mvar_value_29;
+        PyObject *tmp_call_result_7;
+        tmp_mvar_value_29 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesTuple2 );
+
+        if (unlikely( tmp_mvar_value_29 == NULL ))
+        {
+            tmp_mvar_value_29 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionExecNonesTuple2 );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_29 );
+        tmp_called_name_11 = tmp_mvar_value_29;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 173;
+        tmp_call_result_7 = CALL_FUNCTION_C_CODE( tmp_called_name_11, impl___main__$$$function_5_functionExecNonesTuple2, NULL, 0 );
+        if ( tmp_call_result_7 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 173;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_7 );
+    }
+    {
+        PyObject *tmp_called_name_12;
+        PyObject *tmp_mvar_value_30;
+        PyObject *tmp_call_result_8;
+        tmp_mvar_value_30 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionExecNonesSyntax2 );
+
+        if (unlikely( tmp_mvar_value_30 == NULL ))
+        {
+            tmp_mvar_value_30 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionExecNonesSyntax2 );
+        }
+
+        if ( tmp_mvar_value_30 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "functionExecNonesSyntax2" );
+            exception_tb = NULL;
+
+            exception_lineno = 174;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_called_name_12 = tmp_mvar_value_30;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 174;
+        tmp_call_result_8 = CALL_FUNCTION_C_CODE( tmp_called_name_12, impl___main__$$$function_6_functionExecNonesSyntax2, NULL, 0 );
+        if ( tmp_call_result_8 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 174;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_8 );
+    }
+    tmp_print_value = const_str_digest_acea28d3c2899a6da4ce30c30a7d19b6;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 176;
+
+        goto frame_exception_exit_1;
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 176;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_47;
+        tmp_assign_source_47 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_2__globals == NULL );
+        Py_INCREF( tmp_assign_source_47 );
+        tmp_exec_2__globals = tmp_assign_source_47;
+    }
+    {
+        PyObject *tmp_assign_source_48;
+        tmp_assign_source_48 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_2__locals == NULL );
+        Py_INCREF( tmp_assign_source_48 );
+        tmp_exec_2__locals = tmp_assign_source_48;
+    }
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_2;
+        PyObject *tmp_exec_globals_2;
+        PyObject *tmp_exec_locals_2;
+        PyObject *tmp_exec_filename_2;
+        PyObject *tmp_exec_compiled_2;
+        PyObject *tmp_exec_result_2;
+        tmp_exec_source_2 = const_str_digest_7bfacfe8f3a4cd5d5fd933a434c95998;
+        CHECK_OBJECT( tmp_exec_2__globals );
+        tmp_exec_globals_2 = tmp_exec_2__globals;
+        CHECK_OBJECT( tmp_exec_2__locals );
+        tmp_exec_locals_2 = tmp_exec_2__locals;
+        tmp_exec_filename_2 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_2 );
+        Py_INCREF( tmp_exec_source_2 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_2, &tmp_exec_filename_2 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_2 );
+            Py_DECREF( tmp_exec_source_2 );
+
+            exception_lineno = 178;
+
+            goto try_except_handler_11;
+        }
+        tmp_exec_compiled_2 = COMPILE_CODE( tmp_exec_source_2, tmp_exec_filename_2, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_2 );
+        Py_DECREF( tmp_exec_filename_2 );
+        if ( tmp_exec_compiled_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 178;
+
+            goto try_except_handler_11;
+        }
+        tmp_exec_result_2 = EVAL_CODE( tmp_exec_compiled_2, tmp_exec_globals_2, tmp_exec_locals_2 );
+        Py_DECREF( tmp_exec_compiled_2 );
+        if ( tmp_exec_result_2 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 178;
+
+            goto try_except_handler_11;
+        }
+        Py_DECREF( tmp_exec_result_2 );
+    }
+    goto try_end_3;
+    // Exception handler code:
+    try_except_handler_11:;
+    exception_keeper_type_11 = exception_type;
+    exception_keeper_value_11 = exception_value;
+    exception_keeper_tb_11 = exception_tb;
+    exception_keeper_lineno_11 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__globals );
+    Py_DECREF( tmp_exec_2__globals );
+    tmp_exec_2__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__locals );
+    Py_DECREF( tmp_exec_2__locals );
+    tmp_exec_2__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_11;
+    exception_value = exception_keeper_value_11;
+    exception_tb = exception_keeper_tb_11;
+    exception_lineno = exception_keeper_lineno_11;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_3:;
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__globals );
+    Py_DECREF( tmp_exec_2__globals );
+    tmp_exec_2__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_2__locals );
+    Py_DECREF( tmp_exec_2__locals );
+    tmp_exec_2__locals = NULL;
+
+    {
+        PyObject *tmp_assign_source_49;
+        tmp_assign_source_49 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_3__globals == NULL );
+        Py_INCREF( tmp_assign_source_49 );
+        tmp_exec_3__globals = tmp_assign_source_49;
+    }
+    {
+        PyObject *tmp_assign_source_50;
+        tmp_assign_source_50 = (PyObject *)moduledict___main__;
+        assert( tmp_exec_3__locals == NULL );
+        Py_INCREF( tmp_assign_source_50 );
+        tmp_exec_3__locals = tmp_assign_source_50;
+    }
+    // Tried code:
+    {
+        PyObject *tmp_exec_source_3;
+        PyObject *tmp_exec_globals_3;
+        PyObject *tmp_exec_locals_3;
+        PyObject *tmp_exec_filename_3;
+        PyObject *tmp_exec_compiled_3;
+        PyObject *tmp_exec_result_3;
+        tmp_exec_source_3 = const_str_digest_f0b555a714023c2b8122ef7241eb357d;
+        CHECK_OBJECT( tmp_exec_3__globals );
+        tmp_exec_globals_3 = tmp_exec_3__globals;
+        CHECK_OBJECT( tmp_exec_3__locals );
+        tmp_exec_locals_3 = tmp_exec_3__locals;
+        tmp_exec_filename_3 = const_str_angle_string;
+        Py_INCREF( tmp_exec_filename_3 );
+        Py_INCREF( tmp_exec_source_3 );
+        tmp_result = EXEC_FILE_ARG_HANDLING( &tmp_exec_source_3, &tmp_exec_filename_3 );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+            Py_DECREF( tmp_exec_filename_3 );
+            Py_DECREF( tmp_exec_source_3 );
+
+            exception_lineno = 184;
+
+            goto try_except_handler_12;
+        }
+        tmp_exec_compiled_3 = COMPILE_CODE( tmp_exec_source_3, tmp_exec_filename_3, const_str_plain_exec, NULL, NULL );
+        Py_DECREF( tmp_exec_source_3 );
+        Py_DECREF( tmp_exec_filename_3 );
+        if ( tmp_exec_compiled_3 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 184;
+
+            goto try_except_handler_12;
+        }
+        tmp_exec_result_3 = EVAL_CODE( tmp_exec_compiled_3, tmp_exec_globals_3, tmp_exec_locals_3 );
+        Py_DECREF( tmp_exec_compiled_3 );
+        if ( tmp_exec_result_3 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 184;
+
+            goto try_except_handler_12;
+        }
+        Py_DECREF( tmp_exec_result_3 );
+    }
+    goto try_end_4;
+    // Exception handler code:
+    try_except_handler_12:;
+    exception_keeper_type_12 = exception_type;
+    exception_keeper_value_12 = exception_value;
+    exception_keeper_tb_12 = exception_tb;
+    exception_keeper_lineno_12 = exception_lineno;
+    exception_type = NULL;
+    exception_value = NULL;
+    exception_tb = NULL;
+    exception_lineno = 0;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__globals );
+    Py_DECREF( tmp_exec_3__globals );
+    tmp_exec_3__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__locals );
+    Py_DECREF( tmp_exec_3__locals );
+    tmp_exec_3__locals = NULL;
+
+    // Re-raise.
+    exception_type = exception_keeper_type_12;
+    exception_value = exception_keeper_value_12;
+    exception_tb = exception_keeper_tb_12;
+    exception_lineno = exception_keeper_lineno_12;
+
+    goto frame_exception_exit_1;
+    // End of try:
+    try_end_4:;
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__globals );
+    Py_DECREF( tmp_exec_3__globals );
+    tmp_exec_3__globals = NULL;
+
+    CHECK_OBJECT( (PyObject *)tmp_exec_3__locals );
+    Py_DECREF( tmp_exec_3__locals );
+    tmp_exec_3__locals = NULL;
+
+    {
+        PyObject *tmp_assign_source_51;
+        tmp_assign_source_51 = const_int_pos_1;
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain_x, tmp_assign_source_51 );
+    }
+    {
+        PyObject *tmp_assign_source_52;
+        tmp_assign_source_52 = const_int_pos_1;
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain_y, tmp_assign_source_52 );
+    }
+    {
+        PyObject *tmp_assign_source_53;
+        tmp_assign_source_53 = MAKE_FUNCTION___main__$$$function_7_functionGlobalsExecShadow(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionGlobalsExecShadow, tmp_assign_source_53 );
+    }
+    {
+        PyObject *tmp_called_name_13;
+        PyObject *tmp_mvar_value_31;
+        PyObject *tmp_call_result_9;
+        tmp_mvar_value_31 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionGlobalsExecShadow );
+
+        if (unlikely( tmp_mvar_value_31 == NULL ))
+        {
+            tmp_mvar_value_31 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionGlobalsExecShadow );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_31 );
+        tmp_called_name_13 = tmp_mvar_value_31;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 246;
+        tmp_call_result_9 = CALL_FUNCTION_C_CODE( tmp_called_name_13, impl___main__$$$function_7_functionGlobalsExecShadow, NULL, 0 );
+        if ( tmp_call_result_9 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 246;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_9 );
+    }
+    {
+        PyObject *tmp_assign_source_54;
+        tmp_assign_source_54 = MAKE_FUNCTION___main__$$$function_8_functionWithClosureProvidedByExec(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionWithClosureProvidedByExec, tmp_assign_source_54 );
+    }
+    {
+        PyObject *tmp_called_name_14;
+        PyObject *tmp_mvar_value_32;
+        PyObject *tmp_call_result_10;
+        tmp_mvar_value_32 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionWithClosureProvidedByExec );
+
+        if (unlikely( tmp_mvar_value_32 == NULL ))
+        {
+            tmp_mvar_value_32 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionWithClosureProvidedByExec );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_32 );
+        tmp_called_name_14 = tmp_mvar_value_32;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 259;
+        tmp_call_result_10 = CALL_FUNCTION_C_CODE( tmp_called_name_14, impl___main__$$$function_8_functionWithClosureProvidedByExec, NULL, 0 );
+        if ( tmp_call_result_10 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 259;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_10 );
+    }
+    {
+        PyObject *tmp_assign_source_55;
+        tmp_assign_source_55 = const_int_pos_2;
+        UPDATE_STRING_DICT0( moduledict___main__, (Nuitka_StringObject *)const_str_plain_x, tmp_assign_source_55 );
+    }
+    {
+        PyObject *tmp_assign_source_56;
+        tmp_assign_source_56 = MAKE_FUNCTION___main__$$$function_9_functionWithExecAffectingClosure(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionWithExecAffectingClosure, tmp_assign_source_56 );
+    }
+    tmp_print_value = const_str_digest_4cf7ee3772e58919b7d820508e63144e;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 276;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_15;
+        PyObject *tmp_mvar_value_33;
+        tmp_mvar_value_33 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_functionWithExecAffectingClosure );
+
+        if (unlikely( tmp_mvar_value_33 == NULL ))
+        {
+            tmp_mvar_value_33 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_functionWithExecAffectingClosure );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_33 );
+        tmp_called_name_15 = tmp_mvar_value_33;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 276;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_15, impl___main__$$$function_9_functionWithExecAffectingClosure, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 276;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 276;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 276;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_57;
+        tmp_assign_source_57 = MAKE_FUNCTION___main__$$$function_10_generatorFunctionWithExec(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_generatorFunctionWithExec, tmp_assign_source_57 );
+    }
+    tmp_print_value = const_str_digest_c017e7bf746e544289a8119779dc1659;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 286;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_tuple_arg_1;
+        PyObject *tmp_called_name_16;
+        PyObject *tmp_mvar_value_34;
+        tmp_mvar_value_34 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_generatorFunctionWithExec );
+
+        if (unlikely( tmp_mvar_value_34 == NULL ))
+        {
+            tmp_mvar_value_34 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_generatorFunctionWithExec );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_34 );
+        tmp_called_name_16 = tmp_mvar_value_34;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 286;
+        tmp_tuple_arg_1 = CALL_FUNCTION_C_CODE( tmp_called_name_16, impl___main__$$$function_10_generatorFunctionWithExec, NULL, 0 );
+        if ( tmp_tuple_arg_1 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 286;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_print_value = PySequence_Tuple( tmp_tuple_arg_1 );
+        Py_DECREF( tmp_tuple_arg_1 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 286;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 286;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 286;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_58;
+        tmp_assign_source_58 = MAKE_FUNCTION___main__$$$function_18_evalInContractions(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_evalInContractions, tmp_assign_source_58 );
+    }
+    tmp_print_value = const_str_digest_08feb529f1c748683d0f13dbc46a6346;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 295;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_17;
+        PyObject *tmp_mvar_value_35;
+        tmp_mvar_value_35 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_evalInContractions );
+
+        if (unlikely( tmp_mvar_value_35 == NULL ))
+        {
+            tmp_mvar_value_35 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_evalInContractions );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_35 );
+        tmp_called_name_17 = tmp_mvar_value_35;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 295;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_17, impl___main__$$$function_18_evalInContractions, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 295;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 295;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 295;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_assign_source_59;
+        tmp_assign_source_59 = MAKE_FUNCTION___main__$$$function_11_execDefinesFunctionToLocalsExplicity(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_execDefinesFunctionToLocalsExplicity, tmp_assign_source_59 );
+    }
+    tmp_print_value = const_str_digest_07e08e7eef02f483d242b0eaf118d0dc;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 310;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_18;
+        PyObject *tmp_mvar_value_36;
+        tmp_mvar_value_36 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_execDefinesFunctionToLocalsExplicity );
+
+        if (unlikely( tmp_mvar_value_36 == NULL ))
+        {
+            tmp_mvar_value_36 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_execDefinesFunctionToLocalsExplicity );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_36 );
+        tmp_called_name_18 = tmp_mvar_value_36;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 310;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_18, impl___main__$$$function_11_execDefinesFunctionToLocalsExplicity, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 310;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 310;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 310;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_19;
+        PyObject *tmp_source_name_1;
+        PyObject *tmp_mvar_value_37;
+        PyObject *tmp_call_result_11;
+        PyObject *tmp_args_element_name_4;
+        PyObject *tmp_mvar_value_38;
+        tmp_mvar_value_37 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_os );
+
+        if (unlikely( tmp_mvar_value_37 == NULL ))
+        {
+            tmp_mvar_value_37 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_os );
+        }
+
+        if ( tmp_mvar_value_37 == NULL )
+        {
+
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "os" );
+            exception_tb = NULL;
+
+            exception_lineno = 312;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_source_name_1 = tmp_mvar_value_37;
+        {
+            static struct Nuitka_AttributeLookupCache cache;
+            tmp_called_name_19 = LOOKUP_ATTRIBUTE_CACHED( tmp_source_name_1, const_str_plain_unlink, &cache );
+        }
+        if ( tmp_called_name_19 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 312;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_mvar_value_38 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+
+        if (unlikely( tmp_mvar_value_38 == NULL ))
+        {
+            tmp_mvar_value_38 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_tmp_filename );
+        }
+
+        if ( tmp_mvar_value_38 == NULL )
+        {
+            Py_DECREF( tmp_called_name_19 );
+            exception_type = PyExc_NameError;
+            Py_INCREF( exception_type );
+            exception_value = PyString_FromFormat( "name '%s' is not defined", "tmp_filename" );
+            exception_tb = NULL;
+
+            exception_lineno = 312;
+
+            goto frame_exception_exit_1;
+        }
+
+        tmp_args_element_name_4 = tmp_mvar_value_38;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 312;
+        {
+            PyObject *call_args[] = { tmp_args_element_name_4 };
+            tmp_call_result_11 = CALL_FUNCTION_WITH_ARGS1( tmp_called_name_19, call_args );
+        }
+
+        Py_DECREF( tmp_called_name_19 );
+        if ( tmp_call_result_11 == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 312;
+
+            goto frame_exception_exit_1;
+        }
+        Py_DECREF( tmp_call_result_11 );
+    }
+    {
+        PyObject *tmp_assign_source_60;
+        tmp_assign_source_60 = MAKE_FUNCTION___main__$$$function_12_execWithShortTuple(  );
+
+
+
+        UPDATE_STRING_DICT1( moduledict___main__, (Nuitka_StringObject *)const_str_plain_execWithShortTuple, tmp_assign_source_60 );
+    }
+    tmp_print_value = const_str_digest_18ea4f2e481b8a61def37aa874174772;
+    tmp_result = PRINT_ITEM( tmp_print_value );
+    if ( tmp_result == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 321;
+
+        goto frame_exception_exit_1;
+    }
+    {
+        PyObject *tmp_called_name_20;
+        PyObject *tmp_mvar_value_39;
+        tmp_mvar_value_39 = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain_execWithShortTuple );
+
+        if (unlikely( tmp_mvar_value_39 == NULL ))
+        {
+            tmp_mvar_value_39 = GET_STRING_DICT_VALUE( dict_builtin, (Nuitka_StringObject *)const_str_plain_execWithShortTuple );
+        }
+
+        CHECK_OBJECT( tmp_mvar_value_39 );
+        tmp_called_name_20 = tmp_mvar_value_39;
+        frame_68f38697c98d703901c499a665bbbaa6->m_frame.f_lineno = 321;
+        tmp_print_value = CALL_FUNCTION_C_CODE( tmp_called_name_20, impl___main__$$$function_12_execWithShortTuple, NULL, 0 );
+        if ( tmp_print_value == NULL )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 321;
+
+            goto frame_exception_exit_1;
+        }
+        tmp_result = PRINT_ITEM( tmp_print_value );
+        Py_DECREF( tmp_print_value );
+        if ( tmp_result == false )
+        {
+            assert( ERROR_OCCURRED() );
+
+            FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+            exception_lineno = 321;
+
+            goto frame_exception_exit_1;
+        }
+    }
+    if ( PRINT_NEW_LINE() == false )
+    {
+        assert( ERROR_OCCURRED() );
+
+        FETCH_ERROR_OCCURRED( &exception_type, &exception_value, &exception_tb );
+
+
+        exception_lineno = 321;
+
+        goto frame_exception_exit_1;
+    }
+
+    // Restore frame exception if necessary.
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_68f38697c98d703901c499a665bbbaa6 );
+#endif
+    popFrameStack();
+
+    assertFrameObject( frame_68f38697c98d703901c499a665bbbaa6 );
+
+    goto frame_no_exception_2;
+
+    frame_exception_exit_1:;
+#if 0
+    RESTORE_FRAME_EXCEPTION( frame_68f38697c98d703901c499a665bbbaa6 );
+#endif
+
+    if ( exception_tb == NULL )
+    {
+        exception_tb = MAKE_TRACEBACK( frame_68f38697c98d703901c499a665bbbaa6, exception_lineno );
+    }
+    else if ( exception_tb->tb_frame != &frame_68f38697c98d703901c499a665bbbaa6->m_frame )
+    {
+        exception_tb = ADD_TRACEBACK( exception_tb, frame_68f38697c98d703901c499a665bbbaa6, exception_lineno );
+    }
+
+    // Put the previous frame back on top.
+    popFrameStack();
+
+    // Return the error.
+    goto module_exception_exit;
+
+    frame_no_exception_2:;
+
+#if _NUITKA_EXPERIMENTAL_PKGUTIL_ITERMODULES
+#if 0 && 1
+    {
+        PyObject *path_value = GET_STRING_DICT_VALUE( moduledict___main__, (Nuitka_StringObject *)const_str_plain___path__ );
+
+        if (path_value && PyList_CheckExact(path_value) && PyList_Size(path_value) > 0)
+        {
+            PyObject *path_element = PyList_GetItem( path_value, 0 );
+
+            PyObject *path_importer_cache = PySys_GetObject((char *)"path_importer_cache");
+            CHECK_OBJECT( path_importer_cache );
+
+            int res = PyDict_SetItem( path_importer_cache, path_element, (PyObject *)&Nuitka_Loader_Type );
+            assert( res == 0 );
+        }
+    }
+#endif
+#endif
+
+    return MOD_RETURN_VALUE( module___main__ );
+    module_exception_exit:
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+    return MOD_RETURN_VALUE( NULL );
+}
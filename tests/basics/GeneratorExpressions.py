@@ -228,3 +228,76 @@ def strangeLambdaGeneratorExpression():
     print(list(x))
 
 strangeLambdaGeneratorExpression()
+
+
+def consumerRaisingStopIteration():
+    # The built-ins consuming generator expressions may raise StopIteration
+    # themselves, that must not end the iteration.
+
+    class AddRaising(object):
+        def __radd__(self, other):
+            raise StopIteration("from __radd__")
+
+    try:
+        print("Sum with raising add", sum(AddRaising() for x in [1, 2]))
+    except StopIteration as e:
+        print("Sum with raising add gave", repr(e))
+
+    class HashRaising(object):
+        def __hash__(self):
+            raise StopIteration("from __hash__")
+
+    try:
+        print("Set with raising hash", set(HashRaising() for x in [1, 2]))
+    except StopIteration as e:
+        print("Set with raising hash gave", repr(e))
+
+    def raiseValueError(x):
+        raise ValueError(x)
+
+    try:
+        print("Sum with raising value", sum(raiseValueError(x) for x in [1, 2]))
+    except ValueError as e:
+        print("Sum with raising value gave", repr(e))
+
+    def raiseStopIteration(x):
+        raise StopIteration(x)
+
+    # This ends the iteration before Python3.7, and is a RuntimeError after.
+    try:
+        print("Sum with body StopIteration", sum(raiseStopIteration(x) for x in [1, 2]))
+    except RuntimeError as e:
+        print("Sum with body StopIteration gave", repr(e))
+
+    print("Sum after consumer exceptions", sum(x for x in [1, 2]))
+
+consumerRaisingStopIteration()
+
+
+def truthTestRaising():
+    # The truth test of "any" and "all" is done by the consumer, not the
+    # generator expression, exceptions from it must not end the iteration.
+
+    class BoolRaising(object):
+        def __init__(self, exception):
+            self.exception = exception
+
+        def __bool__(self):
+            raise self.exception
+
+        __nonzero__ = __bool__
+
+    for exception in (StopIteration("from __bool__"), ValueError("from __bool__")):
+        try:
+            print("Any with raising bool", any(BoolRaising(exception) for x in [1]))
+        except (StopIteration, ValueError) as e:
+            print("Any with raising bool gave", repr(e))
+
+        try:
+            print("All with raising bool", all(BoolRaising(exception) for x in [1]))
+        except (StopIteration, ValueError) as e:
+            print("All with raising bool gave", repr(e))
+
+    print("Any and all after truth test exceptions", any(x for x in [0, 1]), all(x for x in [0, 1]))
+
+truthTestRaising()
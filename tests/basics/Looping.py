@@ -148,3 +148,70 @@ def loopingFunction(a = 1*2):
         print("Executed else branch of while loop without break")
 
 loopingFunction()
+
+def rangeLoopLimits():
+    # Loops over ranges count with C values where possible, the values must
+    # not overflow near the limits.
+    for x in range(9223372036854775806, 9223372036854775809):
+        print("Range loop near upper limit", x)
+
+    for x in range(-9223372036854775807, -9223372036854775810, -1):
+        print("Range loop near lower limit", x)
+
+    for x in range(9223372036854775800, 9223372036854775810, 4):
+        print("Range loop with step near upper limit", x)
+
+    import sys
+    high = sys.maxsize + 2
+
+    for x in range(sys.maxsize - 1, high):
+        print("Range loop near maxsize", x - sys.maxsize)
+
+rangeLoopLimits()
+
+def floatLoopValues():
+    # Local float values updated in loops may be C values, they must still
+    # become objects where they escape.
+    a = 0.0
+    for x in range(5):
+        a = a + 1.5
+        a = a * 1.25
+        a = a - 0.5
+    print("Float accumulated in loop", a)
+
+    b = 0.5
+    count = 0
+    while b < 6:
+        b = b + 0.75
+        if b > 3.0:
+            count += 1
+    print("Float compared in loop", b, count)
+
+    c = 2.5
+    for x in range(3):
+        c = c + 1.0
+        print("Float escaping in loop", c, type(c))
+
+    def closureUser():
+        return d * 2
+
+    d = 1.0
+    for x in range(3):
+        d = d + 1.0
+    print("Float used by closure", closureUser())
+
+    e = 1e308
+    for x in range(3):
+        e = e * 10.0
+    print("Float overflowing to infinity", e, e - e != e - e)
+
+    f = 1.0
+    for x in range(2):
+        f = f + 1.0
+    del f
+    try:
+        f
+    except (NameError, UnboundLocalError) as e:
+        print("Float deleted", type(e).__name__)
+
+floatLoopValues()
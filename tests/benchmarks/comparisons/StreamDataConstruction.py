@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Compare building the constants blob naively with "StreamData".
+
+This collects marshaled code objects and string constants of the standard
+library, like a standalone compilation embeds them, and adds them to a blob
+with the naive approach of searching and concatenating bytes, and with the
+"StreamData" class of Nuitka.
+
+Optionally give the number of modules to use, e.g.
+"python StreamDataConstruction.py 1000", the naive approach gets very slow
+for larger amounts.
+"""
+
+from __future__ import print_function
+
+import marshal
+import os
+import sys
+import time
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")
+    ),
+)
+
+# isort:start
+
+from nuitka.codegen.BlobCodes import StreamData
+
+
+def _getCodeStrings(code):
+    for value in code.co_names + code.co_varnames:
+        yield value.encode("utf8")
+
+    for value in code.co_consts:
+        if type(value) is str:
+            yield value.encode("utf8") if str is not bytes else value
+        elif type(value) is bytes:
+            yield value
+        elif hasattr(value, "co_code"):
+            for sub_value in _getCodeStrings(value):
+                yield sub_value
+
+
+def collectValues(limit):
+    stdlib_dir = os.path.dirname(os.__file__)
+
+    values = []
+    count = 0
+
+    for dirpath, dirnames, filenames in os.walk(stdlib_dir):
+        dirnames.sort()
+
+        if "site-packages" in dirnames:
+            dirnames.remove("site-packages")
+
+        for filename in sorted(filenames):
+            if not filename.endswith(".py"):
+                continue
+
+            with open(os.path.join(dirpath, filename), "rb") as source_file:
+                source_code = source_file.read()
+
+            try:
+                code = compile(source_code, filename, "exec", dont_inherit=True)
+            except (SyntaxError, ValueError, TypeError):
+                continue
+
+            values.extend(_getCodeStrings(code))
+            values.append(marshal.dumps(code))
+
+            count += 1
+
+            if count == limit:
+                return count, values
+
+    return count, values
+
+
+def buildNaive(values):
+    stream_data = bytes()
+
+    for value in values:
+        offset = stream_data.find(value)
+        if offset == -1:
+            stream_data += value
+
+    return stream_data
+
+
+def buildStreamData(values):
+    stream_data = StreamData()
+
+    for value in values:
+        stream_data.getStreamDataOffset(value)
+
+    return stream_data.getBytes()
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    module_count, values = collectValues(limit)
+
+    print(
+        "Using %d values of %d modules, %d bytes."
+        % (len(values), module_count, sum(len(value) for value in values))
+    )
+
+    for name, builder in (("Naive", buildNaive), ("StreamData", buildStreamData)):
+        start = time.time()
+        blob = builder(values)
+        end = time.time()
+
+        print("%s took %.3fs for %d bytes." % (name, end - start, len(blob)))
+
+
+if __name__ == "__main__":
+    main()
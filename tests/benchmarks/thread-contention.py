@@ -0,0 +1,86 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+# Show the cost of threads contending for the GIL with loops, and how long a
+# thread that only sleeps has to wait to run again, compare with CPython.
+
+from __future__ import print_function
+
+import threading
+import time
+
+total_work = 4000000
+thread_counts = (1, 2, 4)
+
+
+def count(n):
+    i = 0
+    while i < n:
+        i += 1
+
+    return i
+
+
+def runWorkers(thread_count):
+    threads = [
+        threading.Thread(target=count, args=(total_work // thread_count,))
+        for _i in range(thread_count)
+    ]
+
+    start = time.time()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return time.time() - start
+
+
+def sleeper(delays, stop):
+    while not stop:
+        start = time.time()
+        time.sleep(0.001)
+        delays.append(time.time() - start - 0.001)
+
+
+def runWithSleeper(thread_count):
+    delays = []
+    stop = []
+
+    thread = threading.Thread(target=sleeper, args=(delays, stop))
+    thread.start()
+
+    runWorkers(thread_count)
+
+    stop.append(True)
+    thread.join()
+
+    return max(delays), sum(delays) / len(delays)
+
+
+for thread_count in thread_counts:
+    print("%d threads: %.3fs total" % (thread_count, runWorkers(thread_count)))
+
+for thread_count in thread_counts:
+    print(
+        "%d threads with sleeper: %.4fs max, %.4fs average wakeup delay"
+        % ((thread_count,) + runWithSleeper(thread_count))
+    )
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Check the ELF file parsing against "readelf" and "ldd".
+
+The extension modules of the running Python, and the Python binary itself,
+are what standalone mode scans on Linux, so these are used as test cases.
+"""
+
+import os
+import re
+import sys
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..",
+            ".."
+        )
+    )
+)
+
+from nuitka.tools.testing.Common import (  # isort:skip
+    check_output,
+    createSearchMode,
+    isExecutableCommand,
+    my_print,
+    reportSkip,
+    setup
+)
+from nuitka.utils.ElfFiles import (  # isort:skip
+    getElfDependencies,
+    getElfFileInfo
+)
+
+_readelf_needed_re = re.compile(r"\(NEEDED\)\s+Shared library: \[(.*)\]")
+_readelf_rpath_re = re.compile(r"\(RPATH\)\s+Library rpath: \[(.*)\]")
+_readelf_runpath_re = re.compile(r"\(RUNPATH\)\s+Library runpath: \[(.*)\]")
+# The dynamic loader is listed without name, but "libc" needs it too.
+_ldd_found_re = re.compile(r"^\s*(?:\S+ => )?(/\S+) \(0x[0-9a-f]+\)$")
+
+
+def _getCommandOutput(command):
+    # Untranslated output is needed for parsing.
+    env = dict(os.environ)
+    env["LC_ALL"] = "C"
+
+    output = check_output(command, env=env)
+
+    if str is not bytes:
+        output = output.decode("utf-8")
+
+    return output
+
+
+def _getSearchValue(regex, output):
+    match = regex.search(output)
+
+    return match.group(1) if match else None
+
+
+def checkElfFileInfo(filename):
+    output = _getCommandOutput(["readelf", "-d", filename])
+
+    elf_info = getElfFileInfo(filename)
+    assert elf_info is not None, filename
+
+    needed = tuple(_readelf_needed_re.findall(output))
+    assert elf_info.needed == needed, (filename, elf_info.needed, needed)
+
+    rpath = _getSearchValue(_readelf_rpath_re, output)
+    assert elf_info.rpath == rpath, (filename, elf_info.rpath, rpath)
+
+    runpath = _getSearchValue(_readelf_runpath_re, output)
+    assert elf_info.runpath == runpath, (filename, elf_info.runpath, runpath)
+
+
+def checkElfDependencies(filename):
+    output = _getCommandOutput(["ldd", filename])
+
+    expected = set()
+    for line in output.splitlines():
+        match = _ldd_found_re.match(line)
+
+        if match:
+            expected.add(os.path.realpath(match.group(1)))
+
+    dependencies = getElfDependencies(filename)
+    assert dependencies is not None, filename
+
+    # The paths found may differ by symbolic links, e.g. "/lib" to "/usr/lib"
+    # for merged file system layouts.
+    found = set(os.path.realpath(dependency) for dependency in dependencies)
+
+    assert found == expected, (filename, found ^ expected)
+
+
+def getTestFilenames():
+    result = [os.path.realpath(sys.executable)]
+
+    # Extension modules live next to one another, find them from one that is
+    # commonly not built into the interpreter.
+    import _ctypes  # pylint: disable=I0021,import-error
+
+    extension_dir = os.path.dirname(getattr(_ctypes, "__file__", ""))
+
+    if extension_dir:
+        for filename in sorted(os.listdir(extension_dir)):
+            if filename.endswith(".so"):
+                result.append(os.path.join(extension_dir, filename))
+
+    return result
+
+
+def main():
+    setup()
+
+    if not sys.platform.startswith("linux"):
+        my_print("Skipped, ELF files are only handled on Linux.")
+        return
+
+    for command in ("readelf", "ldd"):
+        if not isExecutableCommand(command):
+            my_print("Skipped, no '%s' command available." % command)
+            return
+
+    search_mode = createSearchMode()
+
+    # Non-ELF files must be rejected.
+    assert getElfFileInfo(os.path.abspath(__file__)) is None
+    assert getElfDependencies(os.path.abspath(__file__)) is None
+
+    for filename in getTestFilenames():
+        dirname, basename = os.path.split(filename)
+
+        active = search_mode.consider(dirname=dirname, filename=basename)
+
+        if not active:
+            reportSkip("not active", dirname, basename)
+            continue
+
+        my_print("Consider", filename)
+
+        checkElfFileInfo(filename)
+        checkElfDependencies(filename)
+
+        if search_mode.abortIfExecuted():
+            break
+
+    search_mode.finish()
+
+
+if __name__ == "__main__":
+    main()
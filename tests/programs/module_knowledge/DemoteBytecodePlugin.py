@@ -0,0 +1,30 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" User plugin to demote a module of the test program to bytecode. """
+
+from nuitka.plugins.PluginBase import UserPluginBase
+
+
+class DemoteBytecodePlugin(UserPluginBase):
+    plugin_name = __file__
+
+    def decideCompilation(self, module_name, source_ref):
+        if module_name == "bytecode_module":
+            return "bytecode"
+
+        return None
@@ -0,0 +1,52 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Imports of constants and functions from other compiled modules.
+
+Run with "--experimental=module_constants" and a plugin demoting the module
+"bytecode_module" to bytecode.
+"""
+
+from __future__ import print_function
+
+from constants_module import LIMIT, NAME, VALUES, compute
+import patched_module
+from patched_module import useGreet, useGreetLate
+import cyclic_a
+from bytecode_module import FACTOR, triple
+
+print("Constants:", LIMIT, NAME, VALUES)
+print("Direct call:", compute(1, 2), compute(b=3, a=4))
+
+try:
+    compute(1)
+except TypeError:
+    print("Wrong argument count gives TypeError")
+
+print("Before patching:", useGreet(), useGreetLate())
+
+
+def greetPatched():
+    return "patched"
+
+
+patched_module.greet = greetPatched
+print("After patching:", useGreet(), useGreetLate())
+
+print("Cyclic:", cyclic_a.LIMIT, cyclic_a.describe())
+
+print("Bytecode module:", FACTOR, triple(5))
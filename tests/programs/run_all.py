@@ -122,6 +122,16 @@ for filename in sorted(os.listdir('.')):
                   os.path.abspath(filename)
               )
 
+        extra_flags.append("ignore_warnings")
+    elif filename == "module_knowledge":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --experimental=module_constants --user-plugin=%s" % (
+              os.path.abspath(
+                  os.path.join(filename, "DemoteBytecodePlugin.py")
+              )
+          )
+
+        extra_flags.append("ignore_infos")
         extra_flags.append("ignore_warnings")
     elif filename == "multiprocessing_using":
         if os.name == "nt":